@@ -1,9335 +1,392 @@
-import xml.etree.ElementTree as ET
+import copy
+import os
+import xml_backend as ET # ElementTree-compatible factory, stdlib ElementTree or lxml
 import rng
+import arxml_templates
+
+# Default AUTOSAR/SharedElements/SwComponentTypes package skeleton, stored as data
+TEMPLATE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Pkg_struct_template.arxml')
+
+# Folder anchors used by the generators, resolved by AUTOSAR package path.
+# A trailing ELEMENTS or AR-PACKAGES selects that container of the package.
+FOLDER_PATHS = {
+    'autosar_folder': '/AUTOSAR',
+    'autosar_subfolders': '/AUTOSAR/AR-PACKAGES',
+    'AUTOSAR_GenDef_folder': '/AUTOSAR/AUTOSAR_GenDef',
+    'AUTOSAR_GenDef_subfolders': '/AUTOSAR/AUTOSAR_GenDef/AR-PACKAGES',
+    'BaseTypes_folder': '/AUTOSAR/AUTOSAR_GenDef/BaseTypes',
+    'BaseTypes_folder_elements': '/AUTOSAR/AUTOSAR_GenDef/BaseTypes/ELEMENTS',
+    'AUTOSAR_PhysicalUnits_folder': '/AUTOSAR/AUTOSAR_PhysicalUnits',
+    'AUTOSAR_PhysicalUnits_subfolder': '/AUTOSAR/AUTOSAR_PhysicalUnits/AR-PACKAGES',
+    'PhysicalDimensions_folder': '/AUTOSAR/AUTOSAR_PhysicalUnits/PhysicalDimensions',
+    'PhysicalDimensions_folder_elements': '/AUTOSAR/AUTOSAR_PhysicalUnits/PhysicalDimensions/ELEMENTS',
+    'Units_folder': '/AUTOSAR/AUTOSAR_PhysicalUnits/Units',
+    'Units_folder_elements': '/AUTOSAR/AUTOSAR_PhysicalUnits/Units/ELEMENTS',
+    'AUTOSAR_Platform_folder': '/AUTOSAR/AUTOSAR_Platform',
+    'AUTOSAR_Platform_subfolder': '/AUTOSAR/AUTOSAR_Platform/AR-PACKAGES',
+    'BaseTypes_pltform_folder': '/AUTOSAR/AUTOSAR_Platform/BaseTypes',
+    'BaseTypes_pltform_folder_elements': '/AUTOSAR/AUTOSAR_Platform/BaseTypes/ELEMENTS',
+    'CompuMethods_folder': '/AUTOSAR/AUTOSAR_Platform/CompuMethods',
+    'CompuMethods_folder_elements': '/AUTOSAR/AUTOSAR_Platform/CompuMethods/ELEMENTS',
+    'DataConstrs_folder': '/AUTOSAR/AUTOSAR_Platform/DataConstrs',
+    'DataConstrs_folder_elements': '/AUTOSAR/AUTOSAR_Platform/DataConstrs/ELEMENTS',
+    'ImplementationDataTypes_platform_folder': '/AUTOSAR/AUTOSAR_Platform/ImplementationDataTypes',
+    'ImplementationDataTypes_platform_folder_elements': '/AUTOSAR/AUTOSAR_Platform/ImplementationDataTypes/ELEMENTS',
+    'AUTOSAR_Std_folder': '/AUTOSAR/AUTOSAR_Std',
+    'AUTOSAR_Std_subfolders': '/AUTOSAR/AUTOSAR_Std/AR-PACKAGES',
+    'BswModuleEntrys_folder': '/AUTOSAR/AUTOSAR_Std/BswModuleEntrys',
+    'BswModuleEntrys_folder_elements': '/AUTOSAR/AUTOSAR_Std/BswModuleEntrys/ELEMENTS',
+    'CompuMethods_std_folder': '/AUTOSAR/AUTOSAR_Std/CompuMethods',
+    'CompuMethods_std_folder_elements': '/AUTOSAR/AUTOSAR_Std/CompuMethods/ELEMENTS',
+    'DataConstrs_std_folder': '/AUTOSAR/AUTOSAR_Std/DataConstrs',
+    'DataConstrs_std_folder_elements': '/AUTOSAR/AUTOSAR_Std/DataConstrs/ELEMENTS',
+    'ImplementationDataTypes_std_folder': '/AUTOSAR/AUTOSAR_Std/ImplementationDataTypes',
+    'ImplementationDataTypes_std_folder_elements': '/AUTOSAR/AUTOSAR_Std/ImplementationDataTypes/ELEMENTS',
+    'Communication_folder': '/Communication',
+    'Communication_subfolders': '/Communication/AR-PACKAGES',
+    'CommunicationClusters_folder': '/Communication/CommunicationClusters',
+    'Frames_folder': '/Communication/Frames',
+    'ISignals_folder': '/Communication/ISignals',
+    'Pdus_folder': '/Communication/Pdus',
+    'SystemSignals_folder': '/Communication/SystemSignals',
+    'EcuInstances_folder': '/EcuInstances',
+    'RootSWComposition_folder': '/RootSWComposition',
+    'SharedElements_folder': '/SharedElements',
+    'SharedElements_subfolders': '/SharedElements/AR-PACKAGES',
+    'ApplicationDataTypes_folder': '/SharedElements/ApplicationDataTypes',
+    'ApplicationDataTypes_subfolders': '/SharedElements/ApplicationDataTypes/AR-PACKAGES',
+    'Array_folder': '/SharedElements/ApplicationDataTypes/Array',
+    'Array_folder_elements': '/SharedElements/ApplicationDataTypes/Array/ELEMENTS',
+    'Primitive_folder': '/SharedElements/ApplicationDataTypes/Primitive',
+    'Primitive_folder_elements': '/SharedElements/ApplicationDataTypes/Primitive/ELEMENTS',
+    'Record_folder': '/SharedElements/ApplicationDataTypes/Record',
+    'Record_folder_elements': '/SharedElements/ApplicationDataTypes/Record/ELEMENTS',
+    'CompuMethods_shared_folder': '/SharedElements/CompuMethods',
+    'CompuMethods_shared_folder_elements': '/SharedElements/CompuMethods/ELEMENTS',
+    'ConstantSpecifications_folder': '/SharedElements/ConstantSpecifications',
+    'ConstantSpecifications_folder_elements': '/SharedElements/ConstantSpecifications/ELEMENTS',
+    'ConstantTypeMappingSets_folder': '/SharedElements/ConstantTypeMappingSets',
+    'ConstantTypeMappingSets_folder_elements': '/SharedElements/ConstantTypeMappingSets/ELEMENTS',
+    'DataConstr_folder': '/SharedElements/DataConstr',
+    'DataConstr_folder_elements': '/SharedElements/DataConstr/ELEMENTS',
+    'DataTypemappingSets_folder': '/SharedElements/DataTypemappingSets',
+    'DataTypemappingSets_folder_elements': '/SharedElements/DataTypemappingSets/ELEMENTS',
+    'ImplementationDataTypes_folder': '/SharedElements/ImplementationDataTypes',
+    'ImplementationDataTypes_folder_elements': '/SharedElements/ImplementationDataTypes/ELEMENTS',
+    'PortInterfaces_folder': '/SharedElements/PortInterfaces',
+    'PortInterfaces_subfolders': '/SharedElements/PortInterfaces/AR-PACKAGES',
+    'ClientServer_folder': '/SharedElements/PortInterfaces/ClientServer',
+    'ClientServer_folder_elements': '/SharedElements/PortInterfaces/ClientServer/ELEMENTS',
+    'ModeSwitch_folder': '/SharedElements/PortInterfaces/ModeSwitch',
+    'ModeSwitch_folder_elements': '/SharedElements/PortInterfaces/ModeSwitch/ELEMENTS',
+    'NvData_folder': '/SharedElements/PortInterfaces/NvData',
+    'NvData_folder_elements': '/SharedElements/PortInterfaces/NvData/ELEMENTS',
+    'Parameter_folder': '/SharedElements/PortInterfaces/Parameter',
+    'Parameter_folder_elements': '/SharedElements/PortInterfaces/Parameter/ELEMENTS',
+    'SenderReceiver_folder': '/SharedElements/PortInterfaces/SenderReceiver',
+    'SenderReceiver_folder_elements': '/SharedElements/PortInterfaces/SenderReceiver/ELEMENTS',
+    'Trigger_folder': '/SharedElements/PortInterfaces/Trigger',
+    'Trigger_folder_elements': '/SharedElements/PortInterfaces/Trigger/ELEMENTS',
+    'SWCImpl_folder': '/SharedElements/SWCImpl',
+    'SwAddrMethods_folder': '/SharedElements/SwAddrMethods',
+    'SwComponentTypes_folder': '/SwComponentTypes',
+    'SwComponentTypes_subfolders': '/SwComponentTypes/AR-PACKAGES',
+    'ApplSWC_folder': '/SwComponentTypes/ApplSWC',
+    'ApplSWC_folder_elements': '/SwComponentTypes/ApplSWC/ELEMENTS',
+    'CddSWC_folder': '/SwComponentTypes/CddSWC',
+    'CddSWC_folder_elements': '/SwComponentTypes/CddSWC/ELEMENTS',
+    'CompSWC_folder': '/SwComponentTypes/CompSWC',
+    'CompSWC_folder_elements': '/SwComponentTypes/CompSWC/ELEMENTS',
+    'EcuAbSWC_folder': '/SwComponentTypes/EcuAbSWC',
+    'EcuAbSWC_folder_elements': '/SwComponentTypes/EcuAbSWC/ELEMENTS',
+    'NvDataSWC_folder': '/SwComponentTypes/NvDataSWC',
+    'NvDataSWC_folder_elements': '/SwComponentTypes/NvDataSWC/ELEMENTS',
+    'PrmSWC_folder': '/SwComponentTypes/PrmSWC',
+    'PrmSWC_folder_elements': '/SwComponentTypes/PrmSWC/ELEMENTS',
+    'SnsrActSWC_folder': '/SwComponentTypes/SnsrActSWC',
+    'SnsrActSWC_folder_elements': '/SwComponentTypes/SnsrActSWC/ELEMENTS',
+    'SrvcPrxySWC_folder': '/SwComponentTypes/SrvcPrxySWC',
+    'SrvcPrxySWC_folder_elements': '/SwComponentTypes/SrvcPrxySWC/ELEMENTS',
+    'SrvcSWC_folder': '/SwComponentTypes/SrvcSWC',
+    'SrvcSWC_folder_elements': '/SwComponentTypes/SrvcSWC/ELEMENTS',
+    'Systems_folder': '/Systems',
+    'Systems_folder_elements': '/Systems/ELEMENTS',
+}
+
+CONTAINER_TAGS = ('ELEMENTS', 'AR-PACKAGES')
+
+# Packages whose content never depends on the workbook (base types, units, platform types)
+CONSTANT_PATHS = ('/AUTOSAR',)
+
+# Write packages that never received any element (Communication, EcuInstances, unused SWC folders, ...)
+KEEP_EMPTY_PACKAGES = False
+
+# Parsed skeleton per XML backend
+_templates = {}
+
+def load_template():
+    """
+    Parses the package skeleton template once and returns the cached AR-PACKAGES element.
+    """
+    template = _templates.get(ET.backend_name)
+    if template is None:
+        template = ET.parse(TEMPLATE_FILE)
+        # Drop the pretty-printing whitespace so the skeleton matches a freshly built tree
+        for elem in template.iter():
+            if elem.text is not None and not elem.text.strip() and len(elem):
+                elem.text = None
+            elem.tail = None
+        _templates[ET.backend_name] = template
+    return template
+
+def find_package(packages, short_name):
+    """
+    Returns the AR-PACKAGE with the given SHORT-NAME below an AR-PACKAGES element, or None.
+    """
+    if packages is None:
+        return None
+    for package in packages:
+        if package.findtext('SHORT-NAME') == short_name:
+            return package
+    return None
+
+def path_steps(path):
+    """
+    Splits a package path into (tag, short_name) steps below the root AR-PACKAGES.
+    """
+    parts = [part for part in path.split('/') if part]
+    container = parts.pop() if parts and parts[-1] in CONTAINER_TAGS else None
+    steps = []
+    for index, short_name in enumerate(parts):
+        if index:
+            steps.append(('AR-PACKAGES', None))
+        steps.append(('AR-PACKAGE', short_name))
+    if container and parts:
+        steps.append((container, None))
+    return steps
+
+def find_step(parent, tag, short_name):
+    if parent is None:
+        return None
+    if tag == 'AR-PACKAGE':
+        return find_package(parent, short_name)
+    return parent.find(tag)
+
+def assign_uuids(elem):
+    for child in elem.iter():
+        if child.get('UUID') == '':
+            child.set('UUID', rng.generate_uuid())
+
+def local_tag(elem):
+    return elem.tag.rsplit('}', 1)[-1]
+
+def reference_bases(package, bases):
+    """
+    Returns the reference bases visible inside package, {SHORT-LABEL: package path}.
+    """
+    own = package.find('REFERENCE-BASES')
+    if own is None:
+        return bases
+    bases = dict(bases)
+    for base in own:
+        bases[base.findtext('SHORT-LABEL')] = base.findtext('PACKAGE-REF')
+    return bases
+
+def reference_targets(elem, bases=None):
+    """
+    Yields the absolute target path of every *-REF/*-TREF element below elem.
+    """
+    for child in elem.iter():
+        tag = local_tag(child)
+        if tag == arxml_templates.FRAGMENT_TAG:
+            for target, dest in arxml_templates.references(child.text):
+                yield target
+        elif (tag.endswith('-REF') or tag.endswith('-TREF')) and child.text:
+            target = child.text.strip()
+            base = child.get('BASE')
+            if base and bases and base in bases and not target.startswith('/'):
+                target = f"{bases[base]}/{target}"
+            yield target
+
+def index_elements(package, path, bases, index):
+    """
+    Adds {element path: (element, ELEMENTS container, reference bases)} for all elements below package.
+    """
+    bases = reference_bases(package, bases)
+    elements = package.find('ELEMENTS')
+    if elements is not None:
+        for element in elements:
+            index[f"{path}/{element.findtext('SHORT-NAME')}"] = (element, elements, bases)
+    for sub_package in package.iterfind('AR-PACKAGES/AR-PACKAGE'):
+        index_elements(sub_package, f"{path}/{sub_package.findtext('SHORT-NAME')}", bases, index)
+
+def remove_empty(packages, path='', keep_paths=(), keep_packages=()):
+    """
+    Removes the packages below an AR-PACKAGES element that contain no elements.
+    Packages in keep_paths are kept as they are, packages in keep_packages are kept
+    even if they end up empty.
+    """
+    for package in list(packages):
+        package_path = f"{path}/{package.findtext('SHORT-NAME')}"
+        if package_path in keep_paths:
+            continue
+        for container in [child for child in package if child.tag in CONTAINER_TAGS]:
+            if container.tag == 'AR-PACKAGES':
+                remove_empty(container, package_path, keep_paths, keep_packages)
+            if not len(container):
+                package.remove(container)
+        if not any(child.tag in CONTAINER_TAGS for child in package) and package_path not in keep_packages:
+            packages.remove(package)
+
+def copy_from_template(template_elem, deep=False):
+    """
+    Copies a template node. Packages are copied without their ELEMENTS/AR-PACKAGES
+    containers unless deep is set, so sub-packages are only created when needed.
+    """
+    if deep or template_elem.tag == 'ELEMENTS':
+        elem = copy.deepcopy(template_elem)
+    elif template_elem.tag == 'AR-PACKAGES':
+        elem = ET.Element(template_elem.tag)
+    else:
+        elem = ET.Element(template_elem.tag, dict(template_elem.attrib))
+        for child in template_elem:
+            if child.tag not in CONTAINER_TAGS:
+                elem.append(copy.deepcopy(child))
+    assign_uuids(elem)
+    return elem
 
 class ARXMLStructure:
-    def __init__(self):
-        self.variables = {}
+    def __init__(self, keep_empty_packages=KEEP_EMPTY_PACKAGES):
+        self.root = None
+        self.root_folders = None
+        self.keep_empty_packages = keep_empty_packages
+        self.shaken = False
     def create_default_pkg_struct(self,root):
         """
-        Creates an ARXML file with the specified structure.
+        Creates the default package structure below root from the cached skeleton template.
+
+        Only the constant platform packages are created here, every other folder is
+        added on the first get_variable() that needs it.
         """
         self.root = root
-        self.variables['root'] = root
-        
-        self.root_folders = ET.SubElement(self.root, 'AR-PACKAGES')
-        self.variables['root_folders'] = self.root_folders
-
-        self.autosar_folder = ET.SubElement(self.root_folders, 'AR-PACKAGE')
-        self.variables['autosar_folder'] = self.autosar_folder
-        self.autosar_folder.attrib ={'UUID':rng.generate_uuid()} #5983c226-f5b2-4ba1-958d-32fe5f2fde51'}
-        self.autosar_folder_short_name = ET.SubElement(self.autosar_folder, 'SHORT-NAME')
-        self.variables['autosar_folder_short_name'] = self.autosar_folder_short_name
-        self.autosar_folder_short_name.text = 'AUTOSAR'
-
-        self.autosar_subfolders = ET.SubElement(self.autosar_folder, 'AR-PACKAGES')
-        self.variables['autosar_subfolders'] = self.autosar_subfolders
-
-        self.AUTOSAR_GenDef_folder = ET.SubElement(self.autosar_subfolders, 'AR-PACKAGE')
-        self.variables['AUTOSAR_GenDef_folder'] = self.AUTOSAR_GenDef_folder
-        self.AUTOSAR_GenDef_folder_short_name = ET.SubElement(self.AUTOSAR_GenDef_folder, 'SHORT-NAME')
-        self.variables['AUTOSAR_GenDef_folder_short_name'] = self.AUTOSAR_GenDef_folder_short_name
-        self.AUTOSAR_GenDef_folder_short_name.text = 'AUTOSAR_GenDef'
-
-        self.AUTOSAR_GenDef_subfolders = ET.SubElement(self.AUTOSAR_GenDef_folder, 'AR-PACKAGES')
-        self.variables['AUTOSAR_GenDef_subfolders'] = self.AUTOSAR_GenDef_subfolders
-
-        self.BaseTypes_folder = ET.SubElement(self.AUTOSAR_GenDef_subfolders, 'AR-PACKAGE')
-        self.variables['BaseTypes_folder'] = self.BaseTypes_folder
-        self.BaseTypes_folder_short_name = ET.SubElement(self.BaseTypes_folder, 'SHORT-NAME')
-        self.variables['BaseTypes_folder_short_name'] = self.BaseTypes_folder_short_name
-        self.BaseTypes_folder_short_name.text = 'BaseTypes'
-        self.BaseTypes_folder_category = ET.SubElement(self.BaseTypes_folder, 'CATEGORY')
-        self.variables['BaseTypes_folder_category'] = self.BaseTypes_folder_category
-        self.BaseTypes_folder_category.text = 'STANDARD'
-        self.BaseTypes_folder_elements = ET.SubElement(self.BaseTypes_folder, 'ELEMENTS')
-        self.variables['BaseTypes_folder_elements'] = self.BaseTypes_folder_elements
-        self.Void_basetype = ET.SubElement(self.BaseTypes_folder_elements, 'SW-BASE-TYPE')
-        self.variables['Void_basetype'] = self.Void_basetype
-        self.Void_basetype_short_name = ET.SubElement(self.Void_basetype, 'SHORT-NAME')
-        self.variables['Void_basetype_short_name'] = self.Void_basetype_short_name
-        self.Void_basetype_short_name.text = 'void'
-        self.Void_basetype_long_name = ET.SubElement(self.Void_basetype, 'LONG-NAME')
-        self.variables['Void_basetype_long_name'] = self.Void_basetype_long_name
-        self.Void_basetype_l_4 = ET.SubElement(self.Void_basetype_long_name, 'L-4')
-        self.variables['Void_basetype_l_4'] = self.Void_basetype_l_4
-        self.Void_basetype_l_4.text = 'void'
-        self.Void_basetype_l_4.attrib = {'L': 'EN'}
-        self.Void_basetype_category = ET.SubElement(self.Void_basetype, 'CATEGORY')
-        self.variables['Void_basetype_category'] = self.Void_basetype_category
-        self.Void_basetype_category.text = 'VOID'
-        self.Void_basetype_base_type_encoding = ET.SubElement(self.Void_basetype, 'BASE-TYPE-ENCODING')
-        self.variables['Void_basetype_base_type_encoding'] = self.Void_basetype_base_type_encoding
-        self.Void_basetype_base_type_encoding.text = 'VOID'
-        self.Void_basetype_native_declaration = ET.SubElement(self.Void_basetype, 'NATIVE-DECLARATION')
-        self.variables['Void_basetype_native_declaration'] = self.Void_basetype_native_declaration
-        self.Void_basetype_native_declaration.text = 'void'
-
-        self.AUTOSAR_PhysicalUnits_folder = ET.SubElement(self.autosar_subfolders, 'AR-PACKAGE')
-        self.variables['AUTOSAR_PhysicalUnits_folder'] = self.AUTOSAR_PhysicalUnits_folder
-        self.AUTOSAR_PhysicalUnits_folder_short_name = ET.SubElement(self.AUTOSAR_PhysicalUnits_folder, 'SHORT-NAME')
-        self.variables['AUTOSAR_PhysicalUnits_folder_short_name'] = self.AUTOSAR_PhysicalUnits_folder_short_name
-        self.AUTOSAR_PhysicalUnits_folder_short_name.text = 'AUTOSAR_PhysicalUnits'
-        self.AUTOSAR_PhysicalUnits_folder_long_name = ET.SubElement(self.AUTOSAR_PhysicalUnits_folder, 'LONG-NAME')
-        self.variables['AUTOSAR_PhysicalUnits_folder_long_name'] = self.AUTOSAR_PhysicalUnits_folder_long_name
-        self.AUTOSAR_PhysicalUnits_folder_l_4 = ET.SubElement(self.AUTOSAR_PhysicalUnits_folder_long_name, 'L-4')
-        self.variables['AUTOSAR_PhysicalUnits_folder_l_4'] = self.AUTOSAR_PhysicalUnits_folder_l_4
-        self.AUTOSAR_PhysicalUnits_folder_l_4.text = 'AUTOSAR'
-        self.AUTOSAR_PhysicalUnits_folder_l_4.attrib = {'L': 'EN'}
-
-        self.AUTOSAR_PhysicalUnits_subfolder = ET.SubElement(self.AUTOSAR_PhysicalUnits_folder, 'AR-PACKAGES')
-        self.variables['AUTOSAR_PhysicalUnits_subfolder'] = self.AUTOSAR_PhysicalUnits_subfolder
-
-        self.PhysicalDimensions_folder = ET.SubElement(self.AUTOSAR_PhysicalUnits_subfolder, 'AR-PACKAGE')
-        self.variables['PhysicalDimensions_folder'] = self.PhysicalDimensions_folder
-        self.PhysicalDimensions_folder_short_name = ET.SubElement(self.PhysicalDimensions_folder, 'SHORT-NAME')
-        self.variables['PhysicalDimensions_folder_short_name'] = self.PhysicalDimensions_folder_short_name
-        self.PhysicalDimensions_folder_short_name.text = 'PhysicalDimensions'
-        self.PhysicalDimensions_folder_category = ET.SubElement(self.PhysicalDimensions_folder, 'CATEGORY')
-        self.variables['PhysicalDimensions_folder_category'] = self.PhysicalDimensions_folder_category
-        self.PhysicalDimensions_folder_category.text = 'STANDARD'
-
-        self.PhysicalDimensions_folder_elements = ET.SubElement(self.PhysicalDimensions_folder, 'ELEMENTS')
-        self.variables['PhysicalDimensions_folder_elements'] = self.PhysicalDimensions_folder_elements
-        
-        self.physical_dimension_Amnt1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Amnt1'] = self.physical_dimension_Amnt1
-        self.physical_dimension_Amnt1_short_name = ET.SubElement(self.physical_dimension_Amnt1, 'SHORT-NAME')
-        self.variables['physical_dimension_Amnt1_short_name'] = self.physical_dimension_Amnt1_short_name
-        self.physical_dimension_Amnt1_short_name.text = 'Amnt1'
-        self.physical_dimension_Amnt1_long_name = ET.SubElement(self.physical_dimension_Amnt1, 'LONG-NAME')
-        self.variables['physical_dimension_Amnt1_long_name'] = self.physical_dimension_Amnt1_long_name
-        self.physical_dimension_Amnt1_l_4 = ET.SubElement(self.physical_dimension_Amnt1_long_name, 'L-4')
-        self.variables['physical_dimension_Amnt1_l_4'] = self.physical_dimension_Amnt1_l_4
-        self.physical_dimension_Amnt1_l_4.text = 'Quantity of substance'
-        self.physical_dimension_Amnt1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Amnt1_length_exp = ET.SubElement(self.physical_dimension_Amnt1, 'LENGTH-EXP')
-        self.variables['physical_dimension_Amnt1_length_exp'] = self.physical_dimension_Amnt1_length_exp
-        self.physical_dimension_Amnt1_length_exp.text = '0'
-        self.physical_dimension_Amnt1_mass_exp = ET.SubElement(self.physical_dimension_Amnt1, 'MASS-EXP')
-        self.variables['physical_dimension_Amnt1_mass_exp'] = self.physical_dimension_Amnt1_mass_exp
-        self.physical_dimension_Amnt1_mass_exp.text = '0'
-        self.physical_dimension_Amnt1_time_exp = ET.SubElement(self.physical_dimension_Amnt1, 'TIME-EXP')
-        self.variables['physical_dimension_Amnt1_time_exp'] = self.physical_dimension_Amnt1_time_exp
-        self.physical_dimension_Amnt1_time_exp.text = '0'
-        self.physical_dimension_Amnt1_current_exp = ET.SubElement(self.physical_dimension_Amnt1, 'CURRENT-EXP')
-        self.variables['physical_dimension_Amnt1_current_exp'] = self.physical_dimension_Amnt1_current_exp
-        self.physical_dimension_Amnt1_current_exp.text = '0'
-        self.physical_dimension_Amnt1_temperature_exp = ET.SubElement(self.physical_dimension_Amnt1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Amnt1_temperature_exp'] = self.physical_dimension_Amnt1_temperature_exp
-        self.physical_dimension_Amnt1_temperature_exp.text = '0'
-        self.physical_dimension_Amnt1_molar_amount_exp = ET.SubElement(self.physical_dimension_Amnt1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Amnt1_molar_amount_exp'] = self.physical_dimension_Amnt1_molar_amount_exp
-        self.physical_dimension_Amnt1_molar_amount_exp.text = '1'
-        self.physical_dimension_Amnt1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Amnt1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Amnt1_luminous_intensity_exp'] = self.physical_dimension_Amnt1_luminous_intensity_exp
-        self.physical_dimension_Amnt1_luminous_intensity_exp.text = '0'
-
-        self.physical_dimension_I1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_I1'] = self.physical_dimension_I1
-        self.physical_dimension_I1_short_name = ET.SubElement(self.physical_dimension_I1, 'SHORT-NAME')
-        self.variables['physical_dimension_I1_short_name'] = self.physical_dimension_I1_short_name
-        self.physical_dimension_I1_short_name.text = 'I1'
-        self.physical_dimension_I1_long_name = ET.SubElement(self.physical_dimension_I1, 'LONG-NAME')
-        self.variables['physical_dimension_I1_long_name'] = self.physical_dimension_I1_long_name
-        self.physical_dimension_I1_l_4 = ET.SubElement(self.physical_dimension_I1_long_name, 'L-4')
-        self.variables['physical_dimension_I1_l_4'] = self.physical_dimension_I1_l_4
-        self.physical_dimension_I1_l_4.text = 'Electric Current'
-        self.physical_dimension_I1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_I1_length_exp = ET.SubElement(self.physical_dimension_I1, 'LENGTH-EXP')
-        self.variables['physical_dimension_I1_length_exp'] = self.physical_dimension_I1_length_exp
-        self.physical_dimension_I1_length_exp.text = '0'
-        self.physical_dimension_I1_mass_exp = ET.SubElement(self.physical_dimension_I1, 'MASS-EXP')
-        self.variables['physical_dimension_I1_mass_exp'] = self.physical_dimension_I1_mass_exp
-        self.physical_dimension_I1_mass_exp.text = '0'
-        self.physical_dimension_I1_time_exp = ET.SubElement(self.physical_dimension_I1, 'TIME-EXP')
-        self.variables['physical_dimension_I1_time_exp'] = self.physical_dimension_I1_time_exp
-        self.physical_dimension_I1_time_exp.text = '0'
-        self.physical_dimension_I1_current_exp = ET.SubElement(self.physical_dimension_I1, 'CURRENT-EXP')
-        self.variables['physical_dimension_I1_current_exp'] = self.physical_dimension_I1_current_exp
-        self.physical_dimension_I1_current_exp.text = '1'
-        self.physical_dimension_I1_temperature_exp = ET.SubElement(self.physical_dimension_I1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_I1_temperature_exp'] = self.physical_dimension_I1_temperature_exp
-        self.physical_dimension_I1_temperature_exp.text = '0'
-        self.physical_dimension_I1_molar_amount_exp = ET.SubElement(self.physical_dimension_I1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_I1_molar_amount_exp'] = self.physical_dimension_I1_molar_amount_exp
-        self.physical_dimension_I1_molar_amount_exp.text = '0'
-        self.physical_dimension_I1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_I1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_I1_luminous_intensity_exp'] = self.physical_dimension_I1_luminous_intensity_exp
-        self.physical_dimension_I1_luminous_intensity_exp.text = '0'
-
-        self.physical_dimension_Illmn1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Illmn1'] = self.physical_dimension_Illmn1
-        self.physical_dimension_Illmn1_short_name = ET.SubElement(self.physical_dimension_Illmn1, 'SHORT-NAME')
-        self.variables['physical_dimension_Illmn1_short_name'] = self.physical_dimension_Illmn1_short_name
-        self.physical_dimension_Illmn1_short_name.text = 'Illmn1'
-        self.physical_dimension_Illmn1_long_name = ET.SubElement(self.physical_dimension_Illmn1, 'LONG-NAME')
-        self.variables['physical_dimension_Illmn1_long_name'] = self.physical_dimension_Illmn1_long_name
-        self.physical_dimension_Illmn1_l_4 = ET.SubElement(self.physical_dimension_Illmn1_long_name, 'L-4')
-        self.variables['physical_dimension_Illmn1_l_4'] = self.physical_dimension_Illmn1_l_4
-        self.physical_dimension_Illmn1_l_4.text = 'Luminous intensity'
-        self.physical_dimension_Illmn1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Illmn1_length_exp = ET.SubElement(self.physical_dimension_Illmn1, 'LENGTH-EXP')
-        self.variables['physical_dimension_Illmn1_length_exp'] = self.physical_dimension_Illmn1_length_exp
-        self.physical_dimension_Illmn1_length_exp.text = '0'
-        self.physical_dimension_Illmn1_mass_exp = ET.SubElement(self.physical_dimension_Illmn1, 'MASS-EXP')
-        self.variables['physical_dimension_Illmn1_mass_exp'] = self.physical_dimension_Illmn1_mass_exp
-        self.physical_dimension_Illmn1_mass_exp.text = '0'
-        self.physical_dimension_Illmn1_time_exp = ET.SubElement(self.physical_dimension_Illmn1, 'TIME-EXP')
-        self.variables['physical_dimension_Illmn1_time_exp'] = self.physical_dimension_Illmn1_time_exp
-        self.physical_dimension_Illmn1_time_exp.text = '0'
-        self.physical_dimension_Illmn1_current_exp = ET.SubElement(self.physical_dimension_Illmn1, 'CURRENT-EXP')
-        self.variables['physical_dimension_Illmn1_current_exp'] = self.physical_dimension_Illmn1_current_exp
-        self.physical_dimension_Illmn1_current_exp.text = '0'
-        self.physical_dimension_Illmn1_temperature_exp = ET.SubElement(self.physical_dimension_Illmn1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Illmn1_temperature_exp'] = self.physical_dimension_Illmn1_temperature_exp
-        self.physical_dimension_Illmn1_temperature_exp.text = '0'
-        self.physical_dimension_Illmn1_molar_amount_exp = ET.SubElement(self.physical_dimension_Illmn1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Illmn1_molar_amount_exp'] = self.physical_dimension_Illmn1_molar_amount_exp
-        self.physical_dimension_Illmn1_molar_amount_exp.text = '0'
-        self.physical_dimension_Illmn1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Illmn1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Illmn1_luminous_intensity_exp'] = self.physical_dimension_Illmn1_luminous_intensity_exp
-        self.physical_dimension_Illmn1_luminous_intensity_exp.text = '1'
-
-        self.physical_dimension_Len1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len1'] = self.physical_dimension_Len1
-        self.physical_dimension_Len1_short_name = ET.SubElement(self.physical_dimension_Len1, 'SHORT-NAME')
-        self.variables['physical_dimension_Len1_short_name'] = self.physical_dimension_Len1_short_name
-        self.physical_dimension_Len1_short_name.text = 'Len1'
-        self.physical_dimension_Len1_long_name = ET.SubElement(self.physical_dimension_Len1, 'LONG-NAME')
-        self.variables['physical_dimension_Len1_long_name'] = self.physical_dimension_Len1_long_name
-        self.physical_dimension_Len1_l_4 = ET.SubElement(self.physical_dimension_Len1_long_name, 'L-4')
-        self.variables['physical_dimension_Len1_l_4'] = self.physical_dimension_Len1_l_4
-        self.physical_dimension_Len1_l_4.text = 'Length'
-        self.physical_dimension_Len1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len1_length_exp = ET.SubElement(self.physical_dimension_Len1, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len1_length_exp'] = self.physical_dimension_Len1_length_exp
-        self.physical_dimension_Len1_length_exp.text = '1'
-        self.physical_dimension_Len1_mass_exp = ET.SubElement(self.physical_dimension_Len1, 'MASS-EXP')
-        self.variables['physical_dimension_Len1_mass_exp'] = self.physical_dimension_Len1_mass_exp
-        self.physical_dimension_Len1_mass_exp.text = '0'
-        self.physical_dimension_Len1_time_exp = ET.SubElement(self.physical_dimension_Len1, 'TIME-EXP')
-        self.variables['physical_dimension_Len1_time_exp'] = self.physical_dimension_Len1_time_exp
-        self.physical_dimension_Len1_time_exp.text = '0'
-        self.physical_dimension_Len1_current_exp = ET.SubElement(self.physical_dimension_Len1, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len1_current_exp'] = self.physical_dimension_Len1_current_exp
-        self.physical_dimension_Len1_current_exp.text = '0'
-        self.physical_dimension_Len1_temperature_exp = ET.SubElement(self.physical_dimension_Len1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len1_temperature_exp'] = self.physical_dimension_Len1_temperature_exp
-        self.physical_dimension_Len1_temperature_exp.text = '0'
-        self.physical_dimension_Len1_molar_amount_exp = ET.SubElement(self.physical_dimension_Len1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len1_molar_amount_exp'] = self.physical_dimension_Len1_molar_amount_exp
-        self.physical_dimension_Len1_molar_amount_exp.text = '0'
-        self.physical_dimension_Len1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len1_luminous_intensity_exp'] = self.physical_dimension_Len1_luminous_intensity_exp
-        self.physical_dimension_Len1_luminous_intensity_exp.text = '0'
-
-        self.physical_dimension_Len1M1TiNeg2 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len1M1TiNeg2'] = self.physical_dimension_Len1M1TiNeg2
-        self.physical_dimension_Len1M1TiNeg2_short_name = ET.SubElement(self.physical_dimension_Len1M1TiNeg2, 'SHORT-NAME')
-        self.variables['physical_dimension_Len1M1TiNeg2_short_name'] = self.physical_dimension_Len1M1TiNeg2_short_name
-        self.physical_dimension_Len1M1TiNeg2_short_name.text = 'Len1M1TiNeg2'
-        self.physical_dimension_Len1M1TiNeg2_long_name = ET.SubElement(self.physical_dimension_Len1M1TiNeg2, 'LONG-NAME')
-        self.variables['physical_dimension_Len1M1TiNeg2_long_name'] = self.physical_dimension_Len1M1TiNeg2_long_name
-        self.physical_dimension_Len1M1TiNeg2_l_4 = ET.SubElement(self.physical_dimension_Len1M1TiNeg2_long_name, 'L-4')
-        self.variables['physical_dimension_Len1M1TiNeg2_l_4'] = self.physical_dimension_Len1M1TiNeg2_l_4
-        self.physical_dimension_Len1M1TiNeg2_l_4.text = 'Force'
-        self.physical_dimension_Len1M1TiNeg2_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len1M1TiNeg2_length_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg2, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg2_length_exp'] = self.physical_dimension_Len1M1TiNeg2_length_exp
-        self.physical_dimension_Len1M1TiNeg2_length_exp.text = '1'
-        self.physical_dimension_Len1M1TiNeg2_mass_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg2, 'MASS-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg2_mass_exp'] = self.physical_dimension_Len1M1TiNeg2_mass_exp
-        self.physical_dimension_Len1M1TiNeg2_mass_exp.text = '1'
-        self.physical_dimension_Len1M1TiNeg2_time_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg2, 'TIME-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg2_time_exp'] = self.physical_dimension_Len1M1TiNeg2_time_exp
-        self.physical_dimension_Len1M1TiNeg2_time_exp.text = '-2'
-        self.physical_dimension_Len1M1TiNeg2_current_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg2, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg2_current_exp'] = self.physical_dimension_Len1M1TiNeg2_current_exp
-        self.physical_dimension_Len1M1TiNeg2_current_exp.text = '0'
-        self.physical_dimension_Len1M1TiNeg2_temperature_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg2, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg2_temperature_exp'] = self.physical_dimension_Len1M1TiNeg2_temperature_exp
-        self.physical_dimension_Len1M1TiNeg2_temperature_exp.text = '0'
-        self.physical_dimension_Len1M1TiNeg2_molar_amount_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg2, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg2_molar_amount_exp'] = self.physical_dimension_Len1M1TiNeg2_molar_amount_exp
-        self.physical_dimension_Len1M1TiNeg2_molar_amount_exp.text = '0'
-        self.physical_dimension_Len1M1TiNeg2_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg2, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg2_luminous_intensity_exp'] = self.physical_dimension_Len1M1TiNeg2_luminous_intensity_exp
-        self.physical_dimension_Len1M1TiNeg2_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Len1M1TiNeg2INeg2 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len1M1TiNeg2INeg2'] = self.physical_dimension_Len1M1TiNeg2INeg2
-        self.physical_dimension_Len1M1TiNeg2INeg2_short_name = ET.SubElement(self.physical_dimension_Len1M1TiNeg2INeg2, 'SHORT-NAME')
-        self.variables['physical_dimension_Len1M1TiNeg2INeg2_short_name'] = self.physical_dimension_Len1M1TiNeg2INeg2_short_name
-        self.physical_dimension_Len1M1TiNeg2INeg2_short_name.text = 'Len1M1TiNeg2INeg2'
-        self.physical_dimension_Len1M1TiNeg2INeg2_long_name = ET.SubElement(self.physical_dimension_Len1M1TiNeg2INeg2, 'LONG-NAME')
-        self.variables['physical_dimension_Len1M1TiNeg2INeg2_long_name'] = self.physical_dimension_Len1M1TiNeg2INeg2_long_name
-        self.physical_dimension_Len1M1TiNeg2INeg2_l_4 = ET.SubElement(self.physical_dimension_Len1M1TiNeg2INeg2_long_name, 'L-4')
-        self.variables['physical_dimension_Len1M1TiNeg2INeg2_l_4'] = self.physical_dimension_Len1M1TiNeg2INeg2_l_4
-        self.physical_dimension_Len1M1TiNeg2INeg2_l_4.text = 'Permeability'
-        self.physical_dimension_Len1M1TiNeg2INeg2_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len1M1TiNeg2INeg2_length_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg2INeg2, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg2INeg2_length_exp'] = self.physical_dimension_Len1M1TiNeg2INeg2_length_exp
-        self.physical_dimension_Len1M1TiNeg2INeg2_length_exp.text = '1'
-        self.physical_dimension_Len1M1TiNeg2INeg2_mass_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg2INeg2, 'MASS-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg2INeg2_mass_exp'] = self.physical_dimension_Len1M1TiNeg2INeg2_mass_exp
-        self.physical_dimension_Len1M1TiNeg2INeg2_mass_exp.text = '1'
-        self.physical_dimension_Len1M1TiNeg2INeg2_time_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg2INeg2, 'TIME-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg2INeg2_time_exp'] = self.physical_dimension_Len1M1TiNeg2INeg2_time_exp
-        self.physical_dimension_Len1M1TiNeg2INeg2_time_exp.text = '-2'
-        self.physical_dimension_Len1M1TiNeg2INeg2_current_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg2INeg2, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg2INeg2_current_exp'] = self.physical_dimension_Len1M1TiNeg2INeg2_current_exp
-        self.physical_dimension_Len1M1TiNeg2INeg2_current_exp.text = '-2'
-        self.physical_dimension_Len1M1TiNeg2INeg2_temperature_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg2INeg2, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg2INeg2_temperature_exp'] = self.physical_dimension_Len1M1TiNeg2INeg2_temperature_exp
-        self.physical_dimension_Len1M1TiNeg2INeg2_temperature_exp.text = '0'
-        self.physical_dimension_Len1M1TiNeg2INeg2_molar_amount_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg2INeg2, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg2INeg2_molar_amount_exp'] = self.physical_dimension_Len1M1TiNeg2INeg2_molar_amount_exp
-        self.physical_dimension_Len1M1TiNeg2INeg2_molar_amount_exp.text = '0'
-        self.physical_dimension_Len1M1TiNeg2INeg2_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg2INeg2, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg2INeg2_luminous_intensity_exp'] = self.physical_dimension_Len1M1TiNeg2INeg2_luminous_intensity_exp
-        self.physical_dimension_Len1M1TiNeg2INeg2_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Len1M1TiNeg2_1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len1M1TiNeg2_1'] = self.physical_dimension_Len1M1TiNeg2_1
-        self.physical_dimension_Len1M1TiNeg2_1_short_name = ET.SubElement(self.physical_dimension_Len1M1TiNeg2_1, 'SHORT-NAME')
-        self.variables['physical_dimension_Len1M1TiNeg2_1_short_name'] = self.physical_dimension_Len1M1TiNeg2_1_short_name
-        self.physical_dimension_Len1M1TiNeg2_1_short_name.text = 'Len1M1TiNeg2_1'
-        self.physical_dimension_Len1M1TiNeg2_1_long_name = ET.SubElement(self.physical_dimension_Len1M1TiNeg2_1, 'LONG-NAME')
-        self.variables['physical_dimension_Len1M1TiNeg2_1_long_name'] = self.physical_dimension_Len1M1TiNeg2_1_long_name
-        self.physical_dimension_Len1M1TiNeg2_1_l_4 = ET.SubElement(self.physical_dimension_Len1M1TiNeg2_1_long_name, 'L-4')
-        self.variables['physical_dimension_Len1M1TiNeg2_1_l_4'] = self.physical_dimension_Len1M1TiNeg2_1_l_4
-        self.physical_dimension_Len1M1TiNeg2_1_l_4.text = 'Electrical Energy Consumption'
-        self.physical_dimension_Len1M1TiNeg2_1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len1M1TiNeg2_1_length_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg2_1, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg2_1_length_exp'] = self.physical_dimension_Len1M1TiNeg2_1_length_exp
-        self.physical_dimension_Len1M1TiNeg2_1_length_exp.text = '1'
-        self.physical_dimension_Len1M1TiNeg2_1_mass_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg2_1, 'MASS-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg2_1_mass_exp'] = self.physical_dimension_Len1M1TiNeg2_1_mass_exp
-        self.physical_dimension_Len1M1TiNeg2_1_mass_exp.text = '1'
-        self.physical_dimension_Len1M1TiNeg2_1_time_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg2_1, 'TIME-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg2_1_time_exp'] = self.physical_dimension_Len1M1TiNeg2_1_time_exp
-        self.physical_dimension_Len1M1TiNeg2_1_time_exp.text = '-2'
-        self.physical_dimension_Len1M1TiNeg2_1_current_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg2_1, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg2_1_current_exp'] = self.physical_dimension_Len1M1TiNeg2_1_current_exp
-        self.physical_dimension_Len1M1TiNeg2_1_current_exp.text = '0'
-        self.physical_dimension_Len1M1TiNeg2_1_temperature_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg2_1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg2_1_temperature_exp'] = self.physical_dimension_Len1M1TiNeg2_1_temperature_exp
-        self.physical_dimension_Len1M1TiNeg2_1_temperature_exp.text = '0'
-        self.physical_dimension_Len1M1TiNeg2_1_molar_amount_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg2_1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg2_1_molar_amount_exp'] = self.physical_dimension_Len1M1TiNeg2_1_molar_amount_exp
-        self.physical_dimension_Len1M1TiNeg2_1_molar_amount_exp.text = '0'
-        self.physical_dimension_Len1M1TiNeg2_1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg2_1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg2_1_luminous_intensity_exp'] = self.physical_dimension_Len1M1TiNeg2_1_luminous_intensity_exp
-        self.physical_dimension_Len1M1TiNeg2_1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Len1M1TiNeg3INeg1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len1M1TiNeg3INeg1'] = self.physical_dimension_Len1M1TiNeg3INeg1
-        self.physical_dimension_Len1M1TiNeg3INeg1_short_name = ET.SubElement(self.physical_dimension_Len1M1TiNeg3INeg1, 'SHORT-NAME')
-        self.variables['physical_dimension_Len1M1TiNeg3INeg1_short_name'] = self.physical_dimension_Len1M1TiNeg3INeg1_short_name
-        self.physical_dimension_Len1M1TiNeg3INeg1_short_name.text = 'Len1M1TiNeg3INeg1'
-        self.physical_dimension_Len1M1TiNeg3INeg1_long_name = ET.SubElement(self.physical_dimension_Len1M1TiNeg3INeg1, 'LONG-NAME')
-        self.variables['physical_dimension_Len1M1TiNeg3INeg1_long_name'] = self.physical_dimension_Len1M1TiNeg3INeg1_long_name
-        self.physical_dimension_Len1M1TiNeg3INeg1_l_4 = ET.SubElement(self.physical_dimension_Len1M1TiNeg3INeg1_long_name, 'L-4')
-        self.variables['physical_dimension_Len1M1TiNeg3INeg1_l_4'] = self.physical_dimension_Len1M1TiNeg3INeg1_l_4
-        self.physical_dimension_Len1M1TiNeg3INeg1_l_4.text = 'Electric Field Strength / Electric intensity'
-        self.physical_dimension_Len1M1TiNeg3INeg1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len1M1TiNeg3INeg1_length_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg3INeg1, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg3INeg1_length_exp'] = self.physical_dimension_Len1M1TiNeg3INeg1_length_exp
-        self.physical_dimension_Len1M1TiNeg3INeg1_length_exp.text = '1'
-        self.physical_dimension_Len1M1TiNeg3INeg1_mass_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg3INeg1, 'MASS-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg3INeg1_mass_exp'] = self.physical_dimension_Len1M1TiNeg3INeg1_mass_exp
-        self.physical_dimension_Len1M1TiNeg3INeg1_mass_exp.text = '1'
-        self.physical_dimension_Len1M1TiNeg3INeg1_time_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg3INeg1, 'TIME-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg3INeg1_time_exp'] = self.physical_dimension_Len1M1TiNeg3INeg1_time_exp
-        self.physical_dimension_Len1M1TiNeg3INeg1_time_exp.text = '-3'
-        self.physical_dimension_Len1M1TiNeg3INeg1_current_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg3INeg1, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg3INeg1_current_exp'] = self.physical_dimension_Len1M1TiNeg3INeg1_current_exp
-        self.physical_dimension_Len1M1TiNeg3INeg1_current_exp.text = '-1'
-        self.physical_dimension_Len1M1TiNeg3INeg1_temperature_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg3INeg1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg3INeg1_temperature_exp'] = self.physical_dimension_Len1M1TiNeg3INeg1_temperature_exp
-        self.physical_dimension_Len1M1TiNeg3INeg1_temperature_exp.text = '0'
-        self.physical_dimension_Len1M1TiNeg3INeg1_molar_amount_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg3INeg1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg3INeg1_molar_amount_exp'] = self.physical_dimension_Len1M1TiNeg3INeg1_molar_amount_exp
-        self.physical_dimension_Len1M1TiNeg3INeg1_molar_amount_exp.text = '0'
-        self.physical_dimension_Len1M1TiNeg3INeg1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg3INeg1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg3INeg1_luminous_intensity_exp'] = self.physical_dimension_Len1M1TiNeg3INeg1_luminous_intensity_exp
-        self.physical_dimension_Len1M1TiNeg3INeg1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Len1M1TiNeg3TNeg1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len1M1TiNeg3TNeg1'] = self.physical_dimension_Len1M1TiNeg3TNeg1
-        self.physical_dimension_Len1M1TiNeg3TNeg1_short_name = ET.SubElement(self.physical_dimension_Len1M1TiNeg3TNeg1, 'SHORT-NAME')
-        self.variables['physical_dimension_Len1M1TiNeg3TNeg1_short_name'] = self.physical_dimension_Len1M1TiNeg3TNeg1_short_name
-        self.physical_dimension_Len1M1TiNeg3TNeg1_short_name.text = 'Len1M1TiNeg3TNeg1'
-        self.physical_dimension_Len1M1TiNeg3TNeg1_long_name = ET.SubElement(self.physical_dimension_Len1M1TiNeg3TNeg1, 'LONG-NAME')
-        self.variables['physical_dimension_Len1M1TiNeg3TNeg1_long_name'] = self.physical_dimension_Len1M1TiNeg3TNeg1_long_name
-        self.physical_dimension_Len1M1TiNeg3TNeg1_l_4 = ET.SubElement(self.physical_dimension_Len1M1TiNeg3TNeg1_long_name, 'L-4')
-        self.variables['physical_dimension_Len1M1TiNeg3TNeg1_l_4'] = self.physical_dimension_Len1M1TiNeg3TNeg1_l_4
-        self.physical_dimension_Len1M1TiNeg3TNeg1_l_4.text = 'Thermal Conductivity'
-        self.physical_dimension_Len1M1TiNeg3TNeg1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len1M1TiNeg3TNeg1_length_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg3TNeg1, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg3TNeg1_length_exp'] = self.physical_dimension_Len1M1TiNeg3TNeg1_length_exp
-        self.physical_dimension_Len1M1TiNeg3TNeg1_length_exp.text = '1'
-        self.physical_dimension_Len1M1TiNeg3TNeg1_mass_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg3TNeg1, 'MASS-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg3TNeg1_mass_exp'] = self.physical_dimension_Len1M1TiNeg3TNeg1_mass_exp
-        self.physical_dimension_Len1M1TiNeg3TNeg1_mass_exp.text = '1'
-        self.physical_dimension_Len1M1TiNeg3TNeg1_time_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg3TNeg1, 'TIME-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg3TNeg1_time_exp'] = self.physical_dimension_Len1M1TiNeg3TNeg1_time_exp
-        self.physical_dimension_Len1M1TiNeg3TNeg1_time_exp.text = '-3'
-        self.physical_dimension_Len1M1TiNeg3TNeg1_current_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg3TNeg1, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg3TNeg1_current_exp'] = self.physical_dimension_Len1M1TiNeg3TNeg1_current_exp
-        self.physical_dimension_Len1M1TiNeg3TNeg1_current_exp.text = '0'
-        self.physical_dimension_Len1M1TiNeg3TNeg1_temperature_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg3TNeg1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg3TNeg1_temperature_exp'] = self.physical_dimension_Len1M1TiNeg3TNeg1_temperature_exp
-        self.physical_dimension_Len1M1TiNeg3TNeg1_temperature_exp.text = '-1'
-        self.physical_dimension_Len1M1TiNeg3TNeg1_molar_amount_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg3TNeg1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg3TNeg1_molar_amount_exp'] = self.physical_dimension_Len1M1TiNeg3TNeg1_molar_amount_exp
-        self.physical_dimension_Len1M1TiNeg3TNeg1_molar_amount_exp.text = '0'
-        self.physical_dimension_Len1M1TiNeg3TNeg1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len1M1TiNeg3TNeg1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len1M1TiNeg3TNeg1_luminous_intensity_exp'] = self.physical_dimension_Len1M1TiNeg3TNeg1_luminous_intensity_exp
-        self.physical_dimension_Len1M1TiNeg3TNeg1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Len1TiNeg1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len1TiNeg1'] = self.physical_dimension_Len1TiNeg1
-        self.physical_dimension_Len1TiNeg1_short_name = ET.SubElement(self.physical_dimension_Len1TiNeg1, 'SHORT-NAME')
-        self.variables['physical_dimension_Len1TiNeg1_short_name'] = self.physical_dimension_Len1TiNeg1_short_name
-        self.physical_dimension_Len1TiNeg1_short_name.text = 'Len1TiNeg1'
-        self.physical_dimension_Len1TiNeg1_long_name = ET.SubElement(self.physical_dimension_Len1TiNeg1, 'LONG-NAME')
-        self.variables['physical_dimension_Len1TiNeg1_long_name'] = self.physical_dimension_Len1TiNeg1_long_name
-        self.physical_dimension_Len1TiNeg1_l_4 = ET.SubElement(self.physical_dimension_Len1TiNeg1_long_name, 'L-4')
-        self.variables['physical_dimension_Len1TiNeg1_l_4'] = self.physical_dimension_Len1TiNeg1_l_4
-        self.physical_dimension_Len1TiNeg1_l_4.text = 'Velocity'
-        self.physical_dimension_Len1TiNeg1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len1TiNeg1_length_exp = ET.SubElement(self.physical_dimension_Len1TiNeg1, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len1TiNeg1_length_exp'] = self.physical_dimension_Len1TiNeg1_length_exp
-        self.physical_dimension_Len1TiNeg1_length_exp.text = '1'
-        self.physical_dimension_Len1TiNeg1_mass_exp = ET.SubElement(self.physical_dimension_Len1TiNeg1, 'MASS-EXP')
-        self.variables['physical_dimension_Len1TiNeg1_mass_exp'] = self.physical_dimension_Len1TiNeg1_mass_exp
-        self.physical_dimension_Len1TiNeg1_mass_exp.text = '0'
-        self.physical_dimension_Len1TiNeg1_time_exp = ET.SubElement(self.physical_dimension_Len1TiNeg1, 'TIME-EXP')
-        self.variables['physical_dimension_Len1TiNeg1_time_exp'] = self.physical_dimension_Len1TiNeg1_time_exp
-        self.physical_dimension_Len1TiNeg1_time_exp.text = '-1'
-        self.physical_dimension_Len1TiNeg1_current_exp = ET.SubElement(self.physical_dimension_Len1TiNeg1, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len1TiNeg1_current_exp'] = self.physical_dimension_Len1TiNeg1_current_exp
-        self.physical_dimension_Len1TiNeg1_current_exp.text = '0'
-        self.physical_dimension_Len1TiNeg1_temperature_exp = ET.SubElement(self.physical_dimension_Len1TiNeg1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len1TiNeg1_temperature_exp'] = self.physical_dimension_Len1TiNeg1_temperature_exp
-        self.physical_dimension_Len1TiNeg1_temperature_exp.text = '0'
-        self.physical_dimension_Len1TiNeg1_molar_amount_exp = ET.SubElement(self.physical_dimension_Len1TiNeg1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len1TiNeg1_molar_amount_exp'] = self.physical_dimension_Len1TiNeg1_molar_amount_exp
-        self.physical_dimension_Len1TiNeg1_molar_amount_exp.text = '0'
-        self.physical_dimension_Len1TiNeg1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len1TiNeg1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len1TiNeg1_luminous_intensity_exp'] = self.physical_dimension_Len1TiNeg1_luminous_intensity_exp
-        self.physical_dimension_Len1TiNeg1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Len1TiNeg2 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len1TiNeg2'] = self.physical_dimension_Len1TiNeg2
-        self.physical_dimension_Len1TiNeg2_short_name = ET.SubElement(self.physical_dimension_Len1TiNeg2, 'SHORT-NAME')
-        self.variables['physical_dimension_Len1TiNeg2_short_name'] = self.physical_dimension_Len1TiNeg2_short_name
-        self.physical_dimension_Len1TiNeg2_short_name.text = 'Len1TiNeg2'
-        self.physical_dimension_Len1TiNeg2_long_name = ET.SubElement(self.physical_dimension_Len1TiNeg2, 'LONG-NAME')
-        self.variables['physical_dimension_Len1TiNeg2_long_name'] = self.physical_dimension_Len1TiNeg2_long_name
-        self.physical_dimension_Len1TiNeg2_l_4 = ET.SubElement(self.physical_dimension_Len1TiNeg2_long_name, 'L-4')
-        self.variables['physical_dimension_Len1TiNeg2_l_4'] = self.physical_dimension_Len1TiNeg2_l_4
-        self.physical_dimension_Len1TiNeg2_l_4.text = 'Acceleration'
-        self.physical_dimension_Len1TiNeg2_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len1TiNeg2_length_exp = ET.SubElement(self.physical_dimension_Len1TiNeg2, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len1TiNeg2_length_exp'] = self.physical_dimension_Len1TiNeg2_length_exp
-        self.physical_dimension_Len1TiNeg2_length_exp.text = '1'
-        self.physical_dimension_Len1TiNeg2_mass_exp = ET.SubElement(self.physical_dimension_Len1TiNeg2, 'MASS-EXP')
-        self.variables['physical_dimension_Len1TiNeg2_mass_exp'] = self.physical_dimension_Len1TiNeg2_mass_exp
-        self.physical_dimension_Len1TiNeg2_mass_exp.text = '0'
-        self.physical_dimension_Len1TiNeg2_time_exp = ET.SubElement(self.physical_dimension_Len1TiNeg2, 'TIME-EXP')
-        self.variables['physical_dimension_Len1TiNeg2_time_exp'] = self.physical_dimension_Len1TiNeg2_time_exp
-        self.physical_dimension_Len1TiNeg2_time_exp.text = '-2'
-        self.physical_dimension_Len1TiNeg2_current_exp = ET.SubElement(self.physical_dimension_Len1TiNeg2, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len1TiNeg2_current_exp'] = self.physical_dimension_Len1TiNeg2_current_exp
-        self.physical_dimension_Len1TiNeg2_current_exp.text = '0'
-        self.physical_dimension_Len1TiNeg2_temperature_exp = ET.SubElement(self.physical_dimension_Len1TiNeg2, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len1TiNeg2_temperature_exp'] = self.physical_dimension_Len1TiNeg2_temperature_exp
-        self.physical_dimension_Len1TiNeg2_temperature_exp.text = '0'
-        self.physical_dimension_Len1TiNeg2_molar_amount_exp = ET.SubElement(self.physical_dimension_Len1TiNeg2, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len1TiNeg2_molar_amount_exp'] = self.physical_dimension_Len1TiNeg2_molar_amount_exp
-        self.physical_dimension_Len1TiNeg2_molar_amount_exp.text = '0'
-        self.physical_dimension_Len1TiNeg2_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len1TiNeg2, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len1TiNeg2_luminous_intensity_exp'] = self.physical_dimension_Len1TiNeg2_luminous_intensity_exp
-        self.physical_dimension_Len1TiNeg2_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Len1TiNeg3 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len1TiNeg3'] = self.physical_dimension_Len1TiNeg3
-        self.physical_dimension_Len1TiNeg3_short_name = ET.SubElement(self.physical_dimension_Len1TiNeg3, 'SHORT-NAME')
-        self.variables['physical_dimension_Len1TiNeg3_short_name'] = self.physical_dimension_Len1TiNeg3_short_name
-        self.physical_dimension_Len1TiNeg3_short_name.text = 'Len1TiNeg3'
-        self.physical_dimension_Len1TiNeg3_long_name = ET.SubElement(self.physical_dimension_Len1TiNeg3, 'LONG-NAME')
-        self.variables['physical_dimension_Len1TiNeg3_long_name'] = self.physical_dimension_Len1TiNeg3_long_name
-        self.physical_dimension_Len1TiNeg3_l_4 = ET.SubElement(self.physical_dimension_Len1TiNeg3_long_name, 'L-4')
-        self.variables['physical_dimension_Len1TiNeg3_l_4'] = self.physical_dimension_Len1TiNeg3_l_4
-        self.physical_dimension_Len1TiNeg3_l_4.text = 'Acceleration Time Gradient'
-        self.physical_dimension_Len1TiNeg3_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len1TiNeg3_length_exp = ET.SubElement(self.physical_dimension_Len1TiNeg3, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len1TiNeg3_length_exp'] = self.physical_dimension_Len1TiNeg3_length_exp
-        self.physical_dimension_Len1TiNeg3_length_exp.text = '1'
-        self.physical_dimension_Len1TiNeg3_mass_exp = ET.SubElement(self.physical_dimension_Len1TiNeg3, 'MASS-EXP')
-        self.variables['physical_dimension_Len1TiNeg3_mass_exp'] = self.physical_dimension_Len1TiNeg3_mass_exp
-        self.physical_dimension_Len1TiNeg3_mass_exp.text = '0'
-        self.physical_dimension_Len1TiNeg3_time_exp = ET.SubElement(self.physical_dimension_Len1TiNeg3, 'TIME-EXP')
-        self.variables['physical_dimension_Len1TiNeg3_time_exp'] = self.physical_dimension_Len1TiNeg3_time_exp
-        self.physical_dimension_Len1TiNeg3_time_exp.text = '-3'
-        self.physical_dimension_Len1TiNeg3_current_exp = ET.SubElement(self.physical_dimension_Len1TiNeg3, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len1TiNeg3_current_exp'] = self.physical_dimension_Len1TiNeg3_current_exp
-        self.physical_dimension_Len1TiNeg3_current_exp.text = '0'
-        self.physical_dimension_Len1TiNeg3_temperature_exp = ET.SubElement(self.physical_dimension_Len1TiNeg3, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len1TiNeg3_temperature_exp'] = self.physical_dimension_Len1TiNeg3_temperature_exp
-        self.physical_dimension_Len1TiNeg3_temperature_exp.text = '0'
-        self.physical_dimension_Len1TiNeg3_molar_amount_exp = ET.SubElement(self.physical_dimension_Len1TiNeg3, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len1TiNeg3_molar_amount_exp'] = self.physical_dimension_Len1TiNeg3_molar_amount_exp
-        self.physical_dimension_Len1TiNeg3_molar_amount_exp.text = '0'
-        self.physical_dimension_Len1TiNeg3_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len1TiNeg3, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len1TiNeg3_luminous_intensity_exp'] = self.physical_dimension_Len1TiNeg3_luminous_intensity_exp
-        self.physical_dimension_Len1TiNeg3_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Len2 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len2'] = self.physical_dimension_Len2
-        self.physical_dimension_Len2_short_name = ET.SubElement(self.physical_dimension_Len2, 'SHORT-NAME')
-        self.variables['physical_dimension_Len2_short_name'] = self.physical_dimension_Len2_short_name
-        self.physical_dimension_Len2_short_name.text = 'Len2'
-        self.physical_dimension_Len2_long_name = ET.SubElement(self.physical_dimension_Len2, 'LONG-NAME')
-        self.variables['physical_dimension_Len2_long_name'] = self.physical_dimension_Len2_long_name
-        self.physical_dimension_Len2_l_4 = ET.SubElement(self.physical_dimension_Len2_long_name, 'L-4')
-        self.variables['physical_dimension_Len2_l_4'] = self.physical_dimension_Len2_l_4
-        self.physical_dimension_Len2_l_4.text = 'Area'
-        self.physical_dimension_Len2_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len2_length_exp = ET.SubElement(self.physical_dimension_Len2, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len2_length_exp'] = self.physical_dimension_Len2_length_exp
-        self.physical_dimension_Len2_length_exp.text = '2'
-        self.physical_dimension_Len2_mass_exp = ET.SubElement(self.physical_dimension_Len2, 'MASS-EXP')
-        self.variables['physical_dimension_Len2_mass_exp'] = self.physical_dimension_Len2_mass_exp
-        self.physical_dimension_Len2_mass_exp.text = '0'
-        self.physical_dimension_Len2_time_exp = ET.SubElement(self.physical_dimension_Len2, 'TIME-EXP')
-        self.variables['physical_dimension_Len2_time_exp'] = self.physical_dimension_Len2_time_exp
-        self.physical_dimension_Len2_time_exp.text = '0'
-        self.physical_dimension_Len2_current_exp = ET.SubElement(self.physical_dimension_Len2, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len2_current_exp'] = self.physical_dimension_Len2_current_exp
-        self.physical_dimension_Len2_current_exp.text = '0'
-        self.physical_dimension_Len2_temperature_exp = ET.SubElement(self.physical_dimension_Len2, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len2_temperature_exp'] = self.physical_dimension_Len2_temperature_exp
-        self.physical_dimension_Len2_temperature_exp.text = '0'
-        self.physical_dimension_Len2_molar_amount_exp = ET.SubElement(self.physical_dimension_Len2, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len2_molar_amount_exp'] = self.physical_dimension_Len2_molar_amount_exp
-        self.physical_dimension_Len2_molar_amount_exp.text = '0'
-        self.physical_dimension_Len2_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len2, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len2_luminous_intensity_exp'] = self.physical_dimension_Len2_luminous_intensity_exp
-        self.physical_dimension_Len2_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Len2M1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len2M1'] = self.physical_dimension_Len2M1
-        self.physical_dimension_Len2M1_short_name = ET.SubElement(self.physical_dimension_Len2M1, 'SHORT-NAME')
-        self.variables['physical_dimension_Len2M1_short_name'] = self.physical_dimension_Len2M1_short_name
-        self.physical_dimension_Len2M1_short_name.text = 'Len2M1'
-        self.physical_dimension_Len2M1_long_name = ET.SubElement(self.physical_dimension_Len2M1, 'LONG-NAME')
-        self.variables['physical_dimension_Len2M1_long_name'] = self.physical_dimension_Len2M1_long_name
-        self.physical_dimension_Len2M1_l_4 = ET.SubElement(self.physical_dimension_Len2M1_long_name, 'L-4')
-        self.variables['physical_dimension_Len2M1_l_4'] = self.physical_dimension_Len2M1_l_4
-        self.physical_dimension_Len2M1_l_4.text = 'Moment of Inertia'
-        self.physical_dimension_Len2M1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len2M1_length_exp = ET.SubElement(self.physical_dimension_Len2M1, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len2M1_length_exp'] = self.physical_dimension_Len2M1_length_exp
-        self.physical_dimension_Len2M1_length_exp.text = '2'
-        self.physical_dimension_Len2M1_mass_exp = ET.SubElement(self.physical_dimension_Len2M1, 'MASS-EXP')
-        self.variables['physical_dimension_Len2M1_mass_exp'] = self.physical_dimension_Len2M1_mass_exp
-        self.physical_dimension_Len2M1_mass_exp.text = '1'
-        self.physical_dimension_Len2M1_time_exp = ET.SubElement(self.physical_dimension_Len2M1, 'TIME-EXP')
-        self.variables['physical_dimension_Len2M1_time_exp'] = self.physical_dimension_Len2M1_time_exp
-        self.physical_dimension_Len2M1_time_exp.text = '0'
-        self.physical_dimension_Len2M1_current_exp = ET.SubElement(self.physical_dimension_Len2M1, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len2M1_current_exp'] = self.physical_dimension_Len2M1_current_exp
-        self.physical_dimension_Len2M1_current_exp.text = '0'
-        self.physical_dimension_Len2M1_temperature_exp = ET.SubElement(self.physical_dimension_Len2M1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len2M1_temperature_exp'] = self.physical_dimension_Len2M1_temperature_exp
-        self.physical_dimension_Len2M1_temperature_exp.text = '0'
-        self.physical_dimension_Len2M1_molar_amount_exp = ET.SubElement(self.physical_dimension_Len2M1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len2M1_molar_amount_exp'] = self.physical_dimension_Len2M1_molar_amount_exp
-        self.physical_dimension_Len2M1_molar_amount_exp.text = '0'
-        self.physical_dimension_Len2M1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len2M1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len2M1_luminous_intensity_exp'] = self.physical_dimension_Len2M1_luminous_intensity_exp
-        self.physical_dimension_Len2M1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Len2M1TiNeg1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len2M1TiNeg1'] = self.physical_dimension_Len2M1TiNeg1
-        self.physical_dimension_Len2M1TiNeg1_short_name = ET.SubElement(self.physical_dimension_Len2M1TiNeg1, 'SHORT-NAME')
-        self.variables['physical_dimension_Len2M1TiNeg1_short_name'] = self.physical_dimension_Len2M1TiNeg1_short_name
-        self.physical_dimension_Len2M1TiNeg1_short_name.text = 'Len2M1TiNeg1'
-        self.physical_dimension_Len2M1TiNeg1_long_name = ET.SubElement(self.physical_dimension_Len2M1TiNeg1, 'LONG-NAME')
-        self.variables['physical_dimension_Len2M1TiNeg1_long_name'] = self.physical_dimension_Len2M1TiNeg1_long_name
-        self.physical_dimension_Len2M1TiNeg1_l_4 = ET.SubElement(self.physical_dimension_Len2M1TiNeg1_long_name, 'L-4')
-        self.variables['physical_dimension_Len2M1TiNeg1_l_4'] = self.physical_dimension_Len2M1TiNeg1_l_4
-        self.physical_dimension_Len2M1TiNeg1_l_4.text = 'Angular Momentum'
-        self.physical_dimension_Len2M1TiNeg1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len2M1TiNeg1_length_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg1, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg1_length_exp'] = self.physical_dimension_Len2M1TiNeg1_length_exp
-        self.physical_dimension_Len2M1TiNeg1_length_exp.text = '2'
-        self.physical_dimension_Len2M1TiNeg1_mass_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg1, 'MASS-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg1_mass_exp'] = self.physical_dimension_Len2M1TiNeg1_mass_exp
-        self.physical_dimension_Len2M1TiNeg1_mass_exp.text = '1'
-        self.physical_dimension_Len2M1TiNeg1_time_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg1, 'TIME-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg1_time_exp'] = self.physical_dimension_Len2M1TiNeg1_time_exp
-        self.physical_dimension_Len2M1TiNeg1_time_exp.text = '-1'
-        self.physical_dimension_Len2M1TiNeg1_current_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg1, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg1_current_exp'] = self.physical_dimension_Len2M1TiNeg1_current_exp
-        self.physical_dimension_Len2M1TiNeg1_current_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg1_temperature_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg1_temperature_exp'] = self.physical_dimension_Len2M1TiNeg1_temperature_exp
-        self.physical_dimension_Len2M1TiNeg1_temperature_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg1_molar_amount_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg1_molar_amount_exp'] = self.physical_dimension_Len2M1TiNeg1_molar_amount_exp
-        self.physical_dimension_Len2M1TiNeg1_molar_amount_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg1_luminous_intensity_exp'] = self.physical_dimension_Len2M1TiNeg1_luminous_intensity_exp
-        self.physical_dimension_Len2M1TiNeg1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Len2M1TiNeg2 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len2M1TiNeg2'] = self.physical_dimension_Len2M1TiNeg2
-        self.physical_dimension_Len2M1TiNeg2_short_name = ET.SubElement(self.physical_dimension_Len2M1TiNeg2, 'SHORT-NAME')
-        self.variables['physical_dimension_Len2M1TiNeg2_short_name'] = self.physical_dimension_Len2M1TiNeg2_short_name
-        self.physical_dimension_Len2M1TiNeg2_short_name.text = 'Len2M1TiNeg2'
-        self.physical_dimension_Len2M1TiNeg2_long_name = ET.SubElement(self.physical_dimension_Len2M1TiNeg2, 'LONG-NAME')
-        self.variables['physical_dimension_Len2M1TiNeg2_long_name'] = self.physical_dimension_Len2M1TiNeg2_long_name
-        self.physical_dimension_Len2M1TiNeg2_l_4 = ET.SubElement(self.physical_dimension_Len2M1TiNeg2_long_name, 'L-4')
-        self.variables['physical_dimension_Len2M1TiNeg2_l_4'] = self.physical_dimension_Len2M1TiNeg2_l_4
-        self.physical_dimension_Len2M1TiNeg2_l_4.text = 'Torque'
-        self.physical_dimension_Len2M1TiNeg2_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len2M1TiNeg2_length_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2_length_exp'] = self.physical_dimension_Len2M1TiNeg2_length_exp
-        self.physical_dimension_Len2M1TiNeg2_length_exp.text = '2'
-        self.physical_dimension_Len2M1TiNeg2_mass_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2, 'MASS-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2_mass_exp'] = self.physical_dimension_Len2M1TiNeg2_mass_exp
-        self.physical_dimension_Len2M1TiNeg2_mass_exp.text = '1'
-        self.physical_dimension_Len2M1TiNeg2_time_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2, 'TIME-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2_time_exp'] = self.physical_dimension_Len2M1TiNeg2_time_exp
-        self.physical_dimension_Len2M1TiNeg2_time_exp.text = '-2'
-        self.physical_dimension_Len2M1TiNeg2_current_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2_current_exp'] = self.physical_dimension_Len2M1TiNeg2_current_exp
-        self.physical_dimension_Len2M1TiNeg2_current_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg2_temperature_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2_temperature_exp'] = self.physical_dimension_Len2M1TiNeg2_temperature_exp
-        self.physical_dimension_Len2M1TiNeg2_temperature_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg2_molar_amount_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2_molar_amount_exp'] = self.physical_dimension_Len2M1TiNeg2_molar_amount_exp
-        self.physical_dimension_Len2M1TiNeg2_molar_amount_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg2_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2_luminous_intensity_exp'] = self.physical_dimension_Len2M1TiNeg2_luminous_intensity_exp
-        self.physical_dimension_Len2M1TiNeg2_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Len2M1TiNeg2AmntNeg1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len2M1TiNeg2AmntNeg1'] = self.physical_dimension_Len2M1TiNeg2AmntNeg1
-        self.physical_dimension_Len2M1TiNeg2AmntNeg1_short_name = ET.SubElement(self.physical_dimension_Len2M1TiNeg2AmntNeg1, 'SHORT-NAME')
-        self.variables['physical_dimension_Len2M1TiNeg2AmntNeg1_short_name'] = self.physical_dimension_Len2M1TiNeg2AmntNeg1_short_name
-        self.physical_dimension_Len2M1TiNeg2AmntNeg1_short_name.text = 'Len2M1TiNeg2AmntNeg1'
-        self.physical_dimension_Len2M1TiNeg2AmntNeg1_long_name = ET.SubElement(self.physical_dimension_Len2M1TiNeg2AmntNeg1, 'LONG-NAME')
-        self.variables['physical_dimension_Len2M1TiNeg2AmntNeg1_long_name'] = self.physical_dimension_Len2M1TiNeg2AmntNeg1_long_name
-        self.physical_dimension_Len2M1TiNeg2AmntNeg1_l_4 = ET.SubElement(self.physical_dimension_Len2M1TiNeg2AmntNeg1_long_name, 'L-4')
-        self.variables['physical_dimension_Len2M1TiNeg2AmntNeg1_l_4'] = self.physical_dimension_Len2M1TiNeg2AmntNeg1_l_4
-        self.physical_dimension_Len2M1TiNeg2AmntNeg1_l_4.text = 'Molar Energy'
-        self.physical_dimension_Len2M1TiNeg2AmntNeg1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len2M1TiNeg2AmntNeg1_length_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2AmntNeg1, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2AmntNeg1_length_exp'] = self.physical_dimension_Len2M1TiNeg2AmntNeg1_length_exp
-        self.physical_dimension_Len2M1TiNeg2AmntNeg1_length_exp.text = '2'
-        self.physical_dimension_Len2M1TiNeg2AmntNeg1_mass_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2AmntNeg1, 'MASS-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2AmntNeg1_mass_exp'] = self.physical_dimension_Len2M1TiNeg2AmntNeg1_mass_exp
-        self.physical_dimension_Len2M1TiNeg2AmntNeg1_mass_exp.text = '1'
-        self.physical_dimension_Len2M1TiNeg2AmntNeg1_time_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2AmntNeg1, 'TIME-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2AmntNeg1_time_exp'] = self.physical_dimension_Len2M1TiNeg2AmntNeg1_time_exp
-        self.physical_dimension_Len2M1TiNeg2AmntNeg1_time_exp.text = '-2'
-        self.physical_dimension_Len2M1TiNeg2AmntNeg1_current_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2AmntNeg1, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2AmntNeg1_current_exp'] = self.physical_dimension_Len2M1TiNeg2AmntNeg1_current_exp
-        self.physical_dimension_Len2M1TiNeg2AmntNeg1_current_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg2AmntNeg1_temperature_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2AmntNeg1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2AmntNeg1_temperature_exp'] = self.physical_dimension_Len2M1TiNeg2AmntNeg1_temperature_exp
-        self.physical_dimension_Len2M1TiNeg2AmntNeg1_temperature_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg2AmntNeg1_molar_amount_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2AmntNeg1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2AmntNeg1_molar_amount_exp'] = self.physical_dimension_Len2M1TiNeg2AmntNeg1_molar_amount_exp
-        self.physical_dimension_Len2M1TiNeg2AmntNeg1_molar_amount_exp.text = '-1'
-        self.physical_dimension_Len2M1TiNeg2AmntNeg1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2AmntNeg1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2AmntNeg1_luminous_intensity_exp'] = self.physical_dimension_Len2M1TiNeg2AmntNeg1_luminous_intensity_exp
-        
-        self.physical_dimension_Len2M1TiNeg2AmntNeg1_luminous_intensity_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg2INeg1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len2M1TiNeg2INeg1'] = self.physical_dimension_Len2M1TiNeg2INeg1
-        self.physical_dimension_Len2M1TiNeg2INeg1_short_name = ET.SubElement(self.physical_dimension_Len2M1TiNeg2INeg1, 'SHORT-NAME')
-        self.variables['physical_dimension_Len2M1TiNeg2INeg1_short_name'] = self.physical_dimension_Len2M1TiNeg2INeg1_short_name
-        self.physical_dimension_Len2M1TiNeg2INeg1_short_name.text = 'Len2M1TiNeg2INeg1'
-        self.physical_dimension_Len2M1TiNeg2INeg1_long_name = ET.SubElement(self.physical_dimension_Len2M1TiNeg2INeg1, 'LONG-NAME')
-        self.variables['physical_dimension_Len2M1TiNeg2INeg1_long_name'] = self.physical_dimension_Len2M1TiNeg2INeg1_long_name
-        self.physical_dimension_Len2M1TiNeg2INeg1_l_4 = ET.SubElement(self.physical_dimension_Len2M1TiNeg2INeg1_long_name, 'L-4')
-        self.variables['physical_dimension_Len2M1TiNeg2INeg1_l_4'] = self.physical_dimension_Len2M1TiNeg2INeg1_l_4
-        self.physical_dimension_Len2M1TiNeg2INeg1_l_4.text = 'Magnetic Flux'
-        self.physical_dimension_Len2M1TiNeg2INeg1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len2M1TiNeg2INeg1_length_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2INeg1, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2INeg1_length_exp'] = self.physical_dimension_Len2M1TiNeg2INeg1_length_exp
-        self.physical_dimension_Len2M1TiNeg2INeg1_length_exp.text = '2'
-        self.physical_dimension_Len2M1TiNeg2INeg1_mass_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2INeg1, 'MASS-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2INeg1_mass_exp'] = self.physical_dimension_Len2M1TiNeg2INeg1_mass_exp
-        self.physical_dimension_Len2M1TiNeg2INeg1_mass_exp.text = '1'
-        self.physical_dimension_Len2M1TiNeg2INeg1_time_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2INeg1, 'TIME-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2INeg1_time_exp'] = self.physical_dimension_Len2M1TiNeg2INeg1_time_exp
-        self.physical_dimension_Len2M1TiNeg2INeg1_time_exp.text = '-2'
-        self.physical_dimension_Len2M1TiNeg2INeg1_current_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2INeg1, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2INeg1_current_exp'] = self.physical_dimension_Len2M1TiNeg2INeg1_current_exp
-        self.physical_dimension_Len2M1TiNeg2INeg1_current_exp.text = '-1'
-        self.physical_dimension_Len2M1TiNeg2INeg1_temperature_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2INeg1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2INeg1_temperature_exp'] = self.physical_dimension_Len2M1TiNeg2INeg1_temperature_exp
-        self.physical_dimension_Len2M1TiNeg2INeg1_temperature_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg2INeg1_molar_amount_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2INeg1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2INeg1_molar_amount_exp'] = self.physical_dimension_Len2M1TiNeg2INeg1_molar_amount_exp
-        self.physical_dimension_Len2M1TiNeg2INeg1_molar_amount_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg2INeg1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2INeg1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2INeg1_luminous_intensity_exp'] = self.physical_dimension_Len2M1TiNeg2INeg1_luminous_intensity_exp
-        self.physical_dimension_Len2M1TiNeg2INeg1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Len2M1TiNeg2INeg2 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len2M1TiNeg2INeg2'] = self.physical_dimension_Len2M1TiNeg2INeg2
-        self.physical_dimension_Len2M1TiNeg2INeg2_short_name = ET.SubElement(self.physical_dimension_Len2M1TiNeg2INeg2, 'SHORT-NAME')
-        self.variables['physical_dimension_Len2M1TiNeg2INeg2_short_name'] = self.physical_dimension_Len2M1TiNeg2INeg2_short_name
-        self.physical_dimension_Len2M1TiNeg2INeg2_short_name.text = 'Len2M1TiNeg2INeg2'
-        self.physical_dimension_Len2M1TiNeg2INeg2_long_name = ET.SubElement(self.physical_dimension_Len2M1TiNeg2INeg2, 'LONG-NAME')
-        self.variables['physical_dimension_Len2M1TiNeg2INeg2_long_name'] = self.physical_dimension_Len2M1TiNeg2INeg2_long_name
-        self.physical_dimension_Len2M1TiNeg2INeg2_l_4 = ET.SubElement(self.physical_dimension_Len2M1TiNeg2INeg2_long_name, 'L-4')
-        self.variables['physical_dimension_Len2M1TiNeg2INeg2_l_4'] = self.physical_dimension_Len2M1TiNeg2INeg2_l_4
-        self.physical_dimension_Len2M1TiNeg2INeg2_l_4.text = 'Inductance'
-        self.physical_dimension_Len2M1TiNeg2INeg2_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len2M1TiNeg2INeg2_length_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2INeg2, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2INeg2_length_exp'] = self.physical_dimension_Len2M1TiNeg2INeg2_length_exp
-        self.physical_dimension_Len2M1TiNeg2INeg2_length_exp.text = '2'
-        self.physical_dimension_Len2M1TiNeg2INeg2_mass_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2INeg2, 'MASS-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2INeg2_mass_exp'] = self.physical_dimension_Len2M1TiNeg2INeg2_mass_exp
-        self.physical_dimension_Len2M1TiNeg2INeg2_mass_exp.text = '1'
-        self.physical_dimension_Len2M1TiNeg2INeg2_time_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2INeg2, 'TIME-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2INeg2_time_exp'] = self.physical_dimension_Len2M1TiNeg2INeg2_time_exp
-        self.physical_dimension_Len2M1TiNeg2INeg2_time_exp.text = '-2'
-        self.physical_dimension_Len2M1TiNeg2INeg2_current_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2INeg2, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2INeg2_current_exp'] = self.physical_dimension_Len2M1TiNeg2INeg2_current_exp
-        self.physical_dimension_Len2M1TiNeg2INeg2_current_exp.text = '-2'
-        self.physical_dimension_Len2M1TiNeg2INeg2_temperature_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2INeg2, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2INeg2_temperature_exp'] = self.physical_dimension_Len2M1TiNeg2INeg2_temperature_exp
-        self.physical_dimension_Len2M1TiNeg2INeg2_temperature_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg2INeg2_molar_amount_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2INeg2, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2INeg2_molar_amount_exp'] = self.physical_dimension_Len2M1TiNeg2INeg2_molar_amount_exp
-        self.physical_dimension_Len2M1TiNeg2INeg2_molar_amount_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg2INeg2_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2INeg2, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2INeg2_luminous_intensity_exp'] = self.physical_dimension_Len2M1TiNeg2INeg2_luminous_intensity_exp
-        self.physical_dimension_Len2M1TiNeg2INeg2_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Len2M1TiNeg2TNeg1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len2M1TiNeg2TNeg1'] = self.physical_dimension_Len2M1TiNeg2TNeg1
-        self.physical_dimension_Len2M1TiNeg2TNeg1_short_name = ET.SubElement(self.physical_dimension_Len2M1TiNeg2TNeg1, 'SHORT-NAME')
-        self.variables['physical_dimension_Len2M1TiNeg2TNeg1_short_name'] = self.physical_dimension_Len2M1TiNeg2TNeg1_short_name
-        self.physical_dimension_Len2M1TiNeg2TNeg1_short_name.text = 'Len2M1TiNeg2TNeg1'
-        self.physical_dimension_Len2M1TiNeg2TNeg1_long_name = ET.SubElement(self.physical_dimension_Len2M1TiNeg2TNeg1, 'LONG-NAME')
-        self.variables['physical_dimension_Len2M1TiNeg2TNeg1_long_name'] = self.physical_dimension_Len2M1TiNeg2TNeg1_long_name
-        self.physical_dimension_Len2M1TiNeg2TNeg1_l_4 = ET.SubElement(self.physical_dimension_Len2M1TiNeg2TNeg1_long_name, 'L-4')
-        self.variables['physical_dimension_Len2M1TiNeg2TNeg1_l_4'] = self.physical_dimension_Len2M1TiNeg2TNeg1_l_4
-        self.physical_dimension_Len2M1TiNeg2TNeg1_l_4.text = 'Heat Capacity'
-        self.physical_dimension_Len2M1TiNeg2TNeg1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len2M1TiNeg2TNeg1_length_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2TNeg1, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2TNeg1_length_exp'] = self.physical_dimension_Len2M1TiNeg2TNeg1_length_exp
-        self.physical_dimension_Len2M1TiNeg2TNeg1_length_exp.text = '2'
-        self.physical_dimension_Len2M1TiNeg2TNeg1_mass_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2TNeg1, 'MASS-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2TNeg1_mass_exp'] = self.physical_dimension_Len2M1TiNeg2TNeg1_mass_exp
-        self.physical_dimension_Len2M1TiNeg2TNeg1_mass_exp.text = '1'
-        self.physical_dimension_Len2M1TiNeg2TNeg1_time_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2TNeg1, 'TIME-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2TNeg1_time_exp'] = self.physical_dimension_Len2M1TiNeg2TNeg1_time_exp
-        self.physical_dimension_Len2M1TiNeg2TNeg1_time_exp.text = '-2'
-        self.physical_dimension_Len2M1TiNeg2TNeg1_current_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2TNeg1, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2TNeg1_current_exp'] = self.physical_dimension_Len2M1TiNeg2TNeg1_current_exp
-        self.physical_dimension_Len2M1TiNeg2TNeg1_current_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg2TNeg1_temperature_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2TNeg1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2TNeg1_temperature_exp'] = self.physical_dimension_Len2M1TiNeg2TNeg1_temperature_exp
-        self.physical_dimension_Len2M1TiNeg2TNeg1_temperature_exp.text = '-1'
-        self.physical_dimension_Len2M1TiNeg2TNeg1_molar_amount_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2TNeg1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2TNeg1_molar_amount_exp'] = self.physical_dimension_Len2M1TiNeg2TNeg1_molar_amount_exp
-        self.physical_dimension_Len2M1TiNeg2TNeg1_molar_amount_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg2TNeg1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2TNeg1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2TNeg1_luminous_intensity_exp'] = self.physical_dimension_Len2M1TiNeg2TNeg1_luminous_intensity_exp
-        self.physical_dimension_Len2M1TiNeg2TNeg1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1'] = self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1
-        self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_short_name = ET.SubElement(self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1, 'SHORT-NAME')
-        self.variables['physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_short_name'] = self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_short_name
-        self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_short_name.text = 'Len2M1TiNeg2TNeg1AmntNeg1'
-        self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_long_name = ET.SubElement(self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1, 'LONG-NAME')
-        self.variables['physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_long_name'] = self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_long_name
-        self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_l_4 = ET.SubElement(self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_long_name, 'L-4')
-        self.variables['physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_l_4'] = self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_l_4
-        self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_l_4.text = 'Molar Heat Capacity'
-        self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_length_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_length_exp'] = self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_length_exp
-        self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_length_exp.text = '2'
-        self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_mass_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1, 'MASS-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_mass_exp'] = self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_mass_exp
-        self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_mass_exp.text = '1'
-        self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_time_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1, 'TIME-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_time_exp'] = self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_time_exp
-        self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_time_exp.text = '-2'
-        self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_current_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_current_exp'] = self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_current_exp
-        self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_current_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_temperature_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_temperature_exp'] = self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_temperature_exp
-        self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_temperature_exp.text = '-1'
-        self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_molar_amount_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_molar_amount_exp'] = self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_molar_amount_exp
-        self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_molar_amount_exp.text = '-1'
-        self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_luminous_intensity_exp'] = self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_luminous_intensity_exp
-        self.physical_dimension_Len2M1TiNeg2TNeg1AmntNeg1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Len2M1TiNeg2_1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len2M1TiNeg2_1'] = self.physical_dimension_Len2M1TiNeg2_1
-        self.physical_dimension_Len2M1TiNeg2_1_short_name = ET.SubElement(self.physical_dimension_Len2M1TiNeg2_1, 'SHORT-NAME')
-        self.variables['physical_dimension_Len2M1TiNeg2_1_short_name'] = self.physical_dimension_Len2M1TiNeg2_1_short_name
-        self.physical_dimension_Len2M1TiNeg2_1_short_name.text = 'Len2M1TiNeg2_1'
-        self.physical_dimension_Len2M1TiNeg2_1_long_name = ET.SubElement(self.physical_dimension_Len2M1TiNeg2_1, 'LONG-NAME')
-        self.variables['physical_dimension_Len2M1TiNeg2_1_long_name'] = self.physical_dimension_Len2M1TiNeg2_1_long_name
-        self.physical_dimension_Len2M1TiNeg2_1_l_4 = ET.SubElement(self.physical_dimension_Len2M1TiNeg2_1_long_name, 'L-4')
-        self.variables['physical_dimension_Len2M1TiNeg2_1_l_4'] = self.physical_dimension_Len2M1TiNeg2_1_l_4
-        self.physical_dimension_Len2M1TiNeg2_1_l_4.text = 'Energy'
-        self.physical_dimension_Len2M1TiNeg2_1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len2M1TiNeg2_1_length_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2_1, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2_1_length_exp'] = self.physical_dimension_Len2M1TiNeg2_1_length_exp
-        self.physical_dimension_Len2M1TiNeg2_1_length_exp.text = '2'
-        self.physical_dimension_Len2M1TiNeg2_1_mass_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2_1, 'MASS-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2_1_mass_exp'] = self.physical_dimension_Len2M1TiNeg2_1_mass_exp
-        self.physical_dimension_Len2M1TiNeg2_1_mass_exp.text = '1'
-        self.physical_dimension_Len2M1TiNeg2_1_time_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2_1, 'TIME-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2_1_time_exp'] = self.physical_dimension_Len2M1TiNeg2_1_time_exp
-        self.physical_dimension_Len2M1TiNeg2_1_time_exp.text = '-2'
-        self.physical_dimension_Len2M1TiNeg2_1_current_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2_1, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2_1_current_exp'] = self.physical_dimension_Len2M1TiNeg2_1_current_exp
-        self.physical_dimension_Len2M1TiNeg2_1_current_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg2_1_temperature_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2_1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2_1_temperature_exp'] = self.physical_dimension_Len2M1TiNeg2_1_temperature_exp
-        self.physical_dimension_Len2M1TiNeg2_1_temperature_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg2_1_molar_amount_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2_1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2_1_molar_amount_exp'] = self.physical_dimension_Len2M1TiNeg2_1_molar_amount_exp
-        self.physical_dimension_Len2M1TiNeg2_1_molar_amount_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg2_1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg2_1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg2_1_luminous_intensity_exp'] = self.physical_dimension_Len2M1TiNeg2_1_luminous_intensity_exp
-        self.physical_dimension_Len2M1TiNeg2_1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Len2M1TiNeg3 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len2M1TiNeg3'] = self.physical_dimension_Len2M1TiNeg3
-        self.physical_dimension_Len2M1TiNeg3_short_name = ET.SubElement(self.physical_dimension_Len2M1TiNeg3, 'SHORT-NAME')
-        self.variables['physical_dimension_Len2M1TiNeg3_short_name'] = self.physical_dimension_Len2M1TiNeg3_short_name
-        self.physical_dimension_Len2M1TiNeg3_short_name.text = 'Len2M1TiNeg3'
-        self.physical_dimension_Len2M1TiNeg3_long_name = ET.SubElement(self.physical_dimension_Len2M1TiNeg3, 'LONG-NAME')
-        self.variables['physical_dimension_Len2M1TiNeg3_long_name'] = self.physical_dimension_Len2M1TiNeg3_long_name
-        self.physical_dimension_Len2M1TiNeg3_l_4 = ET.SubElement(self.physical_dimension_Len2M1TiNeg3_long_name, 'L-4')
-        self.variables['physical_dimension_Len2M1TiNeg3_l_4'] = self.physical_dimension_Len2M1TiNeg3_l_4
-        self.physical_dimension_Len2M1TiNeg3_l_4.text = 'Torque Time Gradient'
-        self.physical_dimension_Len2M1TiNeg3_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len2M1TiNeg3_length_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg3, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg3_length_exp'] = self.physical_dimension_Len2M1TiNeg3_length_exp
-        self.physical_dimension_Len2M1TiNeg3_length_exp.text = '2'
-        self.physical_dimension_Len2M1TiNeg3_mass_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg3, 'MASS-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg3_mass_exp'] = self.physical_dimension_Len2M1TiNeg3_mass_exp
-        self.physical_dimension_Len2M1TiNeg3_mass_exp.text = '1'
-        self.physical_dimension_Len2M1TiNeg3_time_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg3, 'TIME-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg3_time_exp'] = self.physical_dimension_Len2M1TiNeg3_time_exp
-        self.physical_dimension_Len2M1TiNeg3_time_exp.text = '-3'
-        self.physical_dimension_Len2M1TiNeg3_current_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg3, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg3_current_exp'] = self.physical_dimension_Len2M1TiNeg3_current_exp
-        self.physical_dimension_Len2M1TiNeg3_current_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg3_temperature_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg3, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg3_temperature_exp'] = self.physical_dimension_Len2M1TiNeg3_temperature_exp
-        self.physical_dimension_Len2M1TiNeg3_temperature_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg3_molar_amount_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg3, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg3_molar_amount_exp'] = self.physical_dimension_Len2M1TiNeg3_molar_amount_exp
-        self.physical_dimension_Len2M1TiNeg3_molar_amount_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg3_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg3, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg3_luminous_intensity_exp'] = self.physical_dimension_Len2M1TiNeg3_luminous_intensity_exp
-        self.physical_dimension_Len2M1TiNeg3_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Len2M1TiNeg3INeg1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len2M1TiNeg3INeg1'] = self.physical_dimension_Len2M1TiNeg3INeg1
-        self.physical_dimension_Len2M1TiNeg3INeg1_short_name = ET.SubElement(self.physical_dimension_Len2M1TiNeg3INeg1, 'SHORT-NAME')
-        self.variables['physical_dimension_Len2M1TiNeg3INeg1_short_name'] = self.physical_dimension_Len2M1TiNeg3INeg1_short_name
-        self.physical_dimension_Len2M1TiNeg3INeg1_short_name.text = 'Len2M1TiNeg3INeg1'
-        self.physical_dimension_Len2M1TiNeg3INeg1_long_name = ET.SubElement(self.physical_dimension_Len2M1TiNeg3INeg1, 'LONG-NAME')
-        self.variables['physical_dimension_Len2M1TiNeg3INeg1_long_name'] = self.physical_dimension_Len2M1TiNeg3INeg1_long_name
-        self.physical_dimension_Len2M1TiNeg3INeg1_l_4 = ET.SubElement(self.physical_dimension_Len2M1TiNeg3INeg1_long_name, 'L-4')
-        self.variables['physical_dimension_Len2M1TiNeg3INeg1_l_4'] = self.physical_dimension_Len2M1TiNeg3INeg1_l_4
-        self.physical_dimension_Len2M1TiNeg3INeg1_l_4.text = 'Voltage'
-        self.physical_dimension_Len2M1TiNeg3INeg1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len2M1TiNeg3INeg1_length_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg3INeg1, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg3INeg1_length_exp'] = self.physical_dimension_Len2M1TiNeg3INeg1_length_exp
-        self.physical_dimension_Len2M1TiNeg3INeg1_length_exp.text = '2'
-        self.physical_dimension_Len2M1TiNeg3INeg1_mass_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg3INeg1, 'MASS-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg3INeg1_mass_exp'] = self.physical_dimension_Len2M1TiNeg3INeg1_mass_exp
-        self.physical_dimension_Len2M1TiNeg3INeg1_mass_exp.text = '1'
-        self.physical_dimension_Len2M1TiNeg3INeg1_time_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg3INeg1, 'TIME-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg3INeg1_time_exp'] = self.physical_dimension_Len2M1TiNeg3INeg1_time_exp
-        self.physical_dimension_Len2M1TiNeg3INeg1_time_exp.text = '-3'
-        self.physical_dimension_Len2M1TiNeg3INeg1_current_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg3INeg1, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg3INeg1_current_exp'] = self.physical_dimension_Len2M1TiNeg3INeg1_current_exp
-        self.physical_dimension_Len2M1TiNeg3INeg1_current_exp.text = '-1'
-        self.physical_dimension_Len2M1TiNeg3INeg1_temperature_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg3INeg1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg3INeg1_temperature_exp'] = self.physical_dimension_Len2M1TiNeg3INeg1_temperature_exp
-        self.physical_dimension_Len2M1TiNeg3INeg1_temperature_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg3INeg1_molar_amount_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg3INeg1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg3INeg1_molar_amount_exp'] = self.physical_dimension_Len2M1TiNeg3INeg1_molar_amount_exp
-        self.physical_dimension_Len2M1TiNeg3INeg1_molar_amount_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg3INeg1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg3INeg1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg3INeg1_luminous_intensity_exp'] = self.physical_dimension_Len2M1TiNeg3INeg1_luminous_intensity_exp
-        self.physical_dimension_Len2M1TiNeg3INeg1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Len2M1TiNeg3INeg2 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len2M1TiNeg3INeg2'] = self.physical_dimension_Len2M1TiNeg3INeg2
-        self.physical_dimension_Len2M1TiNeg3INeg2_short_name = ET.SubElement(self.physical_dimension_Len2M1TiNeg3INeg2, 'SHORT-NAME')
-        self.variables['physical_dimension_Len2M1TiNeg3INeg2_short_name'] = self.physical_dimension_Len2M1TiNeg3INeg2_short_name
-        self.physical_dimension_Len2M1TiNeg3INeg2_short_name.text = 'Len2M1TiNeg3INeg2'
-        self.physical_dimension_Len2M1TiNeg3INeg2_long_name = ET.SubElement(self.physical_dimension_Len2M1TiNeg3INeg2, 'LONG-NAME')
-        self.variables['physical_dimension_Len2M1TiNeg3INeg2_long_name'] = self.physical_dimension_Len2M1TiNeg3INeg2_long_name
-        self.physical_dimension_Len2M1TiNeg3INeg2_l_4 = ET.SubElement(self.physical_dimension_Len2M1TiNeg3INeg2_long_name, 'L-4')
-        self.variables['physical_dimension_Len2M1TiNeg3INeg2_l_4'] = self.physical_dimension_Len2M1TiNeg3INeg2_l_4
-        self.physical_dimension_Len2M1TiNeg3INeg2_l_4.text = 'Electric Resistance'
-        self.physical_dimension_Len2M1TiNeg3INeg2_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len2M1TiNeg3INeg2_length_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg3INeg2, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg3INeg2_length_exp'] = self.physical_dimension_Len2M1TiNeg3INeg2_length_exp
-        self.physical_dimension_Len2M1TiNeg3INeg2_length_exp.text = '2'
-        self.physical_dimension_Len2M1TiNeg3INeg2_mass_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg3INeg2, 'MASS-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg3INeg2_mass_exp'] = self.physical_dimension_Len2M1TiNeg3INeg2_mass_exp
-        self.physical_dimension_Len2M1TiNeg3INeg2_mass_exp.text = '1'
-        self.physical_dimension_Len2M1TiNeg3INeg2_time_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg3INeg2, 'TIME-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg3INeg2_time_exp'] = self.physical_dimension_Len2M1TiNeg3INeg2_time_exp
-        self.physical_dimension_Len2M1TiNeg3INeg2_time_exp.text = '-3'
-        self.physical_dimension_Len2M1TiNeg3INeg2_current_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg3INeg2, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg3INeg2_current_exp'] = self.physical_dimension_Len2M1TiNeg3INeg2_current_exp
-        self.physical_dimension_Len2M1TiNeg3INeg2_current_exp.text = '-2'
-        self.physical_dimension_Len2M1TiNeg3INeg2_temperature_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg3INeg2, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg3INeg2_temperature_exp'] = self.physical_dimension_Len2M1TiNeg3INeg2_temperature_exp
-        self.physical_dimension_Len2M1TiNeg3INeg2_temperature_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg3INeg2_molar_amount_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg3INeg2, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg3INeg2_molar_amount_exp'] = self.physical_dimension_Len2M1TiNeg3INeg2_molar_amount_exp
-        self.physical_dimension_Len2M1TiNeg3INeg2_molar_amount_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg3INeg2_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg3INeg2, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg3INeg2_luminous_intensity_exp'] = self.physical_dimension_Len2M1TiNeg3INeg2_luminous_intensity_exp
-        self.physical_dimension_Len2M1TiNeg3INeg2_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Len2M1TiNeg3_1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len2M1TiNeg3_1'] = self.physical_dimension_Len2M1TiNeg3_1
-        self.physical_dimension_Len2M1TiNeg3_1_short_name = ET.SubElement(self.physical_dimension_Len2M1TiNeg3_1, 'SHORT-NAME')
-        self.variables['physical_dimension_Len2M1TiNeg3_1_short_name'] = self.physical_dimension_Len2M1TiNeg3_1_short_name
-        self.physical_dimension_Len2M1TiNeg3_1_short_name.text = 'Len2M1TiNeg3_1'
-        self.physical_dimension_Len2M1TiNeg3_1_long_name = ET.SubElement(self.physical_dimension_Len2M1TiNeg3_1, 'LONG-NAME')
-        self.variables['physical_dimension_Len2M1TiNeg3_1_long_name'] = self.physical_dimension_Len2M1TiNeg3_1_long_name
-        self.physical_dimension_Len2M1TiNeg3_1_l_4 = ET.SubElement(self.physical_dimension_Len2M1TiNeg3_1_long_name, 'L-4')
-        self.variables['physical_dimension_Len2M1TiNeg3_1_l_4'] = self.physical_dimension_Len2M1TiNeg3_1_l_4
-        self.physical_dimension_Len2M1TiNeg3_1_l_4.text = 'Power'
-        self.physical_dimension_Len2M1TiNeg3_1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len2M1TiNeg3_1_length_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg3_1, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg3_1_length_exp'] = self.physical_dimension_Len2M1TiNeg3_1_length_exp
-        self.physical_dimension_Len2M1TiNeg3_1_length_exp.text = '2'
-        self.physical_dimension_Len2M1TiNeg3_1_mass_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg3_1, 'MASS-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg3_1_mass_exp'] = self.physical_dimension_Len2M1TiNeg3_1_mass_exp
-        self.physical_dimension_Len2M1TiNeg3_1_mass_exp.text = '1'
-        self.physical_dimension_Len2M1TiNeg3_1_time_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg3_1, 'TIME-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg3_1_time_exp'] = self.physical_dimension_Len2M1TiNeg3_1_time_exp
-        self.physical_dimension_Len2M1TiNeg3_1_time_exp.text = '-3'
-        self.physical_dimension_Len2M1TiNeg3_1_current_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg3_1, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg3_1_current_exp'] = self.physical_dimension_Len2M1TiNeg3_1_current_exp
-        self.physical_dimension_Len2M1TiNeg3_1_current_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg3_1_temperature_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg3_1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg3_1_temperature_exp'] = self.physical_dimension_Len2M1TiNeg3_1_temperature_exp
-        self.physical_dimension_Len2M1TiNeg3_1_temperature_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg3_1_molar_amount_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg3_1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg3_1_molar_amount_exp'] = self.physical_dimension_Len2M1TiNeg3_1_molar_amount_exp
-        self.physical_dimension_Len2M1TiNeg3_1_molar_amount_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg3_1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg3_1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg3_1_luminous_intensity_exp'] = self.physical_dimension_Len2M1TiNeg3_1_luminous_intensity_exp
-        self.physical_dimension_Len2M1TiNeg3_1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Len2M1TiNeg4 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len2M1TiNeg4'] = self.physical_dimension_Len2M1TiNeg4
-        self.physical_dimension_Len2M1TiNeg4_short_name = ET.SubElement(self.physical_dimension_Len2M1TiNeg4, 'SHORT-NAME')
-        self.variables['physical_dimension_Len2M1TiNeg4_short_name'] = self.physical_dimension_Len2M1TiNeg4_short_name
-        self.physical_dimension_Len2M1TiNeg4_short_name.text = 'Len2M1TiNeg4'
-        self.physical_dimension_Len2M1TiNeg4_long_name = ET.SubElement(self.physical_dimension_Len2M1TiNeg4, 'LONG-NAME')
-        self.variables['physical_dimension_Len2M1TiNeg4_long_name'] = self.physical_dimension_Len2M1TiNeg4_long_name
-        self.physical_dimension_Len2M1TiNeg4_l_4 = ET.SubElement(self.physical_dimension_Len2M1TiNeg4_long_name, 'L-4')
-        self.variables['physical_dimension_Len2M1TiNeg4_l_4'] = self.physical_dimension_Len2M1TiNeg4_l_4
-        self.physical_dimension_Len2M1TiNeg4_l_4.text = 'Power Time Gradient'
-        self.physical_dimension_Len2M1TiNeg4_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len2M1TiNeg4_length_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg4, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg4_length_exp'] = self.physical_dimension_Len2M1TiNeg4_length_exp
-        self.physical_dimension_Len2M1TiNeg4_length_exp.text = '2'
-        self.physical_dimension_Len2M1TiNeg4_mass_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg4, 'MASS-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg4_mass_exp'] = self.physical_dimension_Len2M1TiNeg4_mass_exp
-        self.physical_dimension_Len2M1TiNeg4_mass_exp.text = '1'
-        self.physical_dimension_Len2M1TiNeg4_time_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg4, 'TIME-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg4_time_exp'] = self.physical_dimension_Len2M1TiNeg4_time_exp
-        self.physical_dimension_Len2M1TiNeg4_time_exp.text = '-4'
-        self.physical_dimension_Len2M1TiNeg4_current_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg4, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg4_current_exp'] = self.physical_dimension_Len2M1TiNeg4_current_exp
-        self.physical_dimension_Len2M1TiNeg4_current_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg4_temperature_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg4, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg4_temperature_exp'] = self.physical_dimension_Len2M1TiNeg4_temperature_exp
-        self.physical_dimension_Len2M1TiNeg4_temperature_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg4_molar_amount_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg4, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg4_molar_amount_exp'] = self.physical_dimension_Len2M1TiNeg4_molar_amount_exp
-        self.physical_dimension_Len2M1TiNeg4_molar_amount_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg4_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg4, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg4_luminous_intensity_exp'] = self.physical_dimension_Len2M1TiNeg4_luminous_intensity_exp
-        self.physical_dimension_Len2M1TiNeg4_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Len2M1TiNeg4INeg1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len2M1TiNeg4INeg1'] = self.physical_dimension_Len2M1TiNeg4INeg1
-        self.physical_dimension_Len2M1TiNeg4INeg1_short_name = ET.SubElement(self.physical_dimension_Len2M1TiNeg4INeg1, 'SHORT-NAME')
-        self.variables['physical_dimension_Len2M1TiNeg4INeg1_short_name'] = self.physical_dimension_Len2M1TiNeg4INeg1_short_name
-        self.physical_dimension_Len2M1TiNeg4INeg1_short_name.text = 'Len2M1TiNeg4INeg1'
-        self.physical_dimension_Len2M1TiNeg4INeg1_long_name = ET.SubElement(self.physical_dimension_Len2M1TiNeg4INeg1, 'LONG-NAME')
-        self.variables['physical_dimension_Len2M1TiNeg4INeg1_long_name'] = self.physical_dimension_Len2M1TiNeg4INeg1_long_name
-        self.physical_dimension_Len2M1TiNeg4INeg1_l_4 = ET.SubElement(self.physical_dimension_Len2M1TiNeg4INeg1_long_name, 'L-4')
-        self.variables['physical_dimension_Len2M1TiNeg4INeg1_l_4'] = self.physical_dimension_Len2M1TiNeg4INeg1_l_4
-        self.physical_dimension_Len2M1TiNeg4INeg1_l_4.text = 'Voltage Time Gradient'
-        self.physical_dimension_Len2M1TiNeg4INeg1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len2M1TiNeg4INeg1_length_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg4INeg1, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg4INeg1_length_exp'] = self.physical_dimension_Len2M1TiNeg4INeg1_length_exp
-        self.physical_dimension_Len2M1TiNeg4INeg1_length_exp.text = '2'
-        self.physical_dimension_Len2M1TiNeg4INeg1_mass_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg4INeg1, 'MASS-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg4INeg1_mass_exp'] = self.physical_dimension_Len2M1TiNeg4INeg1_mass_exp
-        self.physical_dimension_Len2M1TiNeg4INeg1_mass_exp.text = '1'
-        self.physical_dimension_Len2M1TiNeg4INeg1_time_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg4INeg1, 'TIME-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg4INeg1_time_exp'] = self.physical_dimension_Len2M1TiNeg4INeg1_time_exp
-        self.physical_dimension_Len2M1TiNeg4INeg1_time_exp.text = '-4'
-        self.physical_dimension_Len2M1TiNeg4INeg1_current_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg4INeg1, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg4INeg1_current_exp'] = self.physical_dimension_Len2M1TiNeg4INeg1_current_exp
-        self.physical_dimension_Len2M1TiNeg4INeg1_current_exp.text = '-1'
-        self.physical_dimension_Len2M1TiNeg4INeg1_temperature_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg4INeg1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg4INeg1_temperature_exp'] = self.physical_dimension_Len2M1TiNeg4INeg1_temperature_exp
-        self.physical_dimension_Len2M1TiNeg4INeg1_temperature_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg4INeg1_molar_amount_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg4INeg1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg4INeg1_molar_amount_exp'] = self.physical_dimension_Len2M1TiNeg4INeg1_molar_amount_exp
-        self.physical_dimension_Len2M1TiNeg4INeg1_molar_amount_exp.text = '0'
-        self.physical_dimension_Len2M1TiNeg4INeg1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len2M1TiNeg4INeg1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len2M1TiNeg4INeg1_luminous_intensity_exp'] = self.physical_dimension_Len2M1TiNeg4INeg1_luminous_intensity_exp
-        self.physical_dimension_Len2M1TiNeg4INeg1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Len2Ti1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len2Ti1'] = self.physical_dimension_Len2Ti1
-        self.physical_dimension_Len2Ti1_short_name = ET.SubElement(self.physical_dimension_Len2Ti1, 'SHORT-NAME')
-        self.variables['physical_dimension_Len2Ti1_short_name'] = self.physical_dimension_Len2Ti1_short_name
-        self.physical_dimension_Len2Ti1_short_name.text = 'Len2Ti1'
-        self.physical_dimension_Len2Ti1_long_name = ET.SubElement(self.physical_dimension_Len2Ti1, 'LONG-NAME')
-        self.variables['physical_dimension_Len2Ti1_long_name'] = self.physical_dimension_Len2Ti1_long_name
-        self.physical_dimension_Len2Ti1_l_4 = ET.SubElement(self.physical_dimension_Len2Ti1_long_name, 'L-4')
-        self.variables['physical_dimension_Len2Ti1_l_4'] = self.physical_dimension_Len2Ti1_l_4
-        self.physical_dimension_Len2Ti1_l_4.text = 'Kinematic Viscosity'
-        self.physical_dimension_Len2Ti1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len2Ti1_length_exp = ET.SubElement(self.physical_dimension_Len2Ti1, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len2Ti1_length_exp'] = self.physical_dimension_Len2Ti1_length_exp
-        self.physical_dimension_Len2Ti1_length_exp.text = '2'
-        self.physical_dimension_Len2Ti1_mass_exp = ET.SubElement(self.physical_dimension_Len2Ti1, 'MASS-EXP')
-        self.variables['physical_dimension_Len2Ti1_mass_exp'] = self.physical_dimension_Len2Ti1_mass_exp
-        self.physical_dimension_Len2Ti1_mass_exp.text = '0'
-        self.physical_dimension_Len2Ti1_time_exp = ET.SubElement(self.physical_dimension_Len2Ti1, 'TIME-EXP')
-        self.variables['physical_dimension_Len2Ti1_time_exp'] = self.physical_dimension_Len2Ti1_time_exp
-        self.physical_dimension_Len2Ti1_time_exp.text = '-1'
-        self.physical_dimension_Len2Ti1_current_exp = ET.SubElement(self.physical_dimension_Len2Ti1, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len2Ti1_current_exp'] = self.physical_dimension_Len2Ti1_current_exp
-        self.physical_dimension_Len2Ti1_current_exp.text = '0'
-        self.physical_dimension_Len2Ti1_temperature_exp = ET.SubElement(self.physical_dimension_Len2Ti1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len2Ti1_temperature_exp'] = self.physical_dimension_Len2Ti1_temperature_exp
-        self.physical_dimension_Len2Ti1_temperature_exp.text = '0'
-        self.physical_dimension_Len2Ti1_molar_amount_exp = ET.SubElement(self.physical_dimension_Len2Ti1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len2Ti1_molar_amount_exp'] = self.physical_dimension_Len2Ti1_molar_amount_exp
-        self.physical_dimension_Len2Ti1_molar_amount_exp.text = '0'
-        self.physical_dimension_Len2Ti1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len2Ti1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len2Ti1_luminous_intensity_exp'] = self.physical_dimension_Len2Ti1_luminous_intensity_exp
-        self.physical_dimension_Len2Ti1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Len2TiNeg2 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len2TiNeg2'] = self.physical_dimension_Len2TiNeg2
-        self.physical_dimension_Len2TiNeg2_short_name = ET.SubElement(self.physical_dimension_Len2TiNeg2, 'SHORT-NAME')
-        self.variables['physical_dimension_Len2TiNeg2_short_name'] = self.physical_dimension_Len2TiNeg2_short_name
-        self.physical_dimension_Len2TiNeg2_short_name.text = 'Len2TiNeg2'
-        self.physical_dimension_Len2TiNeg2_long_name = ET.SubElement(self.physical_dimension_Len2TiNeg2, 'LONG-NAME')
-        self.variables['physical_dimension_Len2TiNeg2_long_name'] = self.physical_dimension_Len2TiNeg2_long_name
-        self.physical_dimension_Len2TiNeg2_l_4 = ET.SubElement(self.physical_dimension_Len2TiNeg2_long_name, 'L-4')
-        self.variables['physical_dimension_Len2TiNeg2_l_4'] = self.physical_dimension_Len2TiNeg2_l_4
-        self.physical_dimension_Len2TiNeg2_l_4.text = 'Specific Heat'
-        self.physical_dimension_Len2TiNeg2_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len2TiNeg2_length_exp = ET.SubElement(self.physical_dimension_Len2TiNeg2, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len2TiNeg2_length_exp'] = self.physical_dimension_Len2TiNeg2_length_exp
-        self.physical_dimension_Len2TiNeg2_length_exp.text = '2'
-        self.physical_dimension_Len2TiNeg2_mass_exp = ET.SubElement(self.physical_dimension_Len2TiNeg2, 'MASS-EXP')
-        self.variables['physical_dimension_Len2TiNeg2_mass_exp'] = self.physical_dimension_Len2TiNeg2_mass_exp
-        self.physical_dimension_Len2TiNeg2_mass_exp.text = '0'
-        self.physical_dimension_Len2TiNeg2_time_exp = ET.SubElement(self.physical_dimension_Len2TiNeg2, 'TIME-EXP')
-        self.variables['physical_dimension_Len2TiNeg2_time_exp'] = self.physical_dimension_Len2TiNeg2_time_exp
-        self.physical_dimension_Len2TiNeg2_time_exp.text = '-2'
-        self.physical_dimension_Len2TiNeg2_current_exp = ET.SubElement(self.physical_dimension_Len2TiNeg2, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len2TiNeg2_current_exp'] = self.physical_dimension_Len2TiNeg2_current_exp
-        self.physical_dimension_Len2TiNeg2_current_exp.text = '0'
-        self.physical_dimension_Len2TiNeg2_temperature_exp = ET.SubElement(self.physical_dimension_Len2TiNeg2, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len2TiNeg2_temperature_exp'] = self.physical_dimension_Len2TiNeg2_temperature_exp
-        self.physical_dimension_Len2TiNeg2_temperature_exp.text = '0'
-        self.physical_dimension_Len2TiNeg2_molar_amount_exp = ET.SubElement(self.physical_dimension_Len2TiNeg2, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len2TiNeg2_molar_amount_exp'] = self.physical_dimension_Len2TiNeg2_molar_amount_exp
-        self.physical_dimension_Len2TiNeg2_molar_amount_exp.text = '0'
-        self.physical_dimension_Len2TiNeg2_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len2TiNeg2, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len2TiNeg2_luminous_intensity_exp'] = self.physical_dimension_Len2TiNeg2_luminous_intensity_exp
-        self.physical_dimension_Len2TiNeg2_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Len2TiNeg2TNeg1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len2TiNeg2TNeg1'] = self.physical_dimension_Len2TiNeg2TNeg1
-        self.physical_dimension_Len2TiNeg2TNeg1_short_name = ET.SubElement(self.physical_dimension_Len2TiNeg2TNeg1, 'SHORT-NAME')
-        self.variables['physical_dimension_Len2TiNeg2TNeg1_short_name'] = self.physical_dimension_Len2TiNeg2TNeg1_short_name
-        self.physical_dimension_Len2TiNeg2TNeg1_short_name.text = 'Len2TiNeg2TNeg1'
-        self.physical_dimension_Len2TiNeg2TNeg1_long_name = ET.SubElement(self.physical_dimension_Len2TiNeg2TNeg1, 'LONG-NAME')
-        self.variables['physical_dimension_Len2TiNeg2TNeg1_long_name'] = self.physical_dimension_Len2TiNeg2TNeg1_long_name
-        self.physical_dimension_Len2TiNeg2TNeg1_l_4 = ET.SubElement(self.physical_dimension_Len2TiNeg2TNeg1_long_name, 'L-4')
-        self.variables['physical_dimension_Len2TiNeg2TNeg1_l_4'] = self.physical_dimension_Len2TiNeg2TNeg1_l_4
-        self.physical_dimension_Len2TiNeg2TNeg1_l_4.text = 'Specific Heat Capacity'
-        self.physical_dimension_Len2TiNeg2TNeg1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len2TiNeg2TNeg1_length_exp = ET.SubElement(self.physical_dimension_Len2TiNeg2TNeg1, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len2TiNeg2TNeg1_length_exp'] = self.physical_dimension_Len2TiNeg2TNeg1_length_exp
-        self.physical_dimension_Len2TiNeg2TNeg1_length_exp.text = '2'
-        self.physical_dimension_Len2TiNeg2TNeg1_mass_exp = ET.SubElement(self.physical_dimension_Len2TiNeg2TNeg1, 'MASS-EXP')
-        self.variables['physical_dimension_Len2TiNeg2TNeg1_mass_exp'] = self.physical_dimension_Len2TiNeg2TNeg1_mass_exp
-        self.physical_dimension_Len2TiNeg2TNeg1_mass_exp.text = '0'
-        self.physical_dimension_Len2TiNeg2TNeg1_time_exp = ET.SubElement(self.physical_dimension_Len2TiNeg2TNeg1, 'TIME-EXP')
-        self.variables['physical_dimension_Len2TiNeg2TNeg1_time_exp'] = self.physical_dimension_Len2TiNeg2TNeg1_time_exp
-        self.physical_dimension_Len2TiNeg2TNeg1_time_exp.text = '-2'
-        self.physical_dimension_Len2TiNeg2TNeg1_current_exp = ET.SubElement(self.physical_dimension_Len2TiNeg2TNeg1, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len2TiNeg2TNeg1_current_exp'] = self.physical_dimension_Len2TiNeg2TNeg1_current_exp
-        self.physical_dimension_Len2TiNeg2TNeg1_current_exp.text = '0'
-        self.physical_dimension_Len2TiNeg2TNeg1_temperature_exp = ET.SubElement(self.physical_dimension_Len2TiNeg2TNeg1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len2TiNeg2TNeg1_temperature_exp'] = self.physical_dimension_Len2TiNeg2TNeg1_temperature_exp
-        self.physical_dimension_Len2TiNeg2TNeg1_temperature_exp.text = '-1'
-        self.physical_dimension_Len2TiNeg2TNeg1_molar_amount_exp = ET.SubElement(self.physical_dimension_Len2TiNeg2TNeg1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len2TiNeg2TNeg1_molar_amount_exp'] = self.physical_dimension_Len2TiNeg2TNeg1_molar_amount_exp
-        self.physical_dimension_Len2TiNeg2TNeg1_molar_amount_exp.text = '0'
-        self.physical_dimension_Len2TiNeg2TNeg1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len2TiNeg2TNeg1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len2TiNeg2TNeg1_luminous_intensity_exp'] = self.physical_dimension_Len2TiNeg2TNeg1_luminous_intensity_exp
-        self.physical_dimension_Len2TiNeg2TNeg1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Len2_1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len2_1'] = self.physical_dimension_Len2_1
-        self.physical_dimension_Len2_1_short_name = ET.SubElement(self.physical_dimension_Len2_1, 'SHORT-NAME')
-        self.variables['physical_dimension_Len2_1_short_name'] = self.physical_dimension_Len2_1_short_name
-        self.physical_dimension_Len2_1_short_name.text = 'Len2_1'
-        self.physical_dimension_Len2_1_long_name = ET.SubElement(self.physical_dimension_Len2_1, 'LONG-NAME')
-        self.variables['physical_dimension_Len2_1_long_name'] = self.physical_dimension_Len2_1_long_name
-        self.physical_dimension_Len2_1_l_4 = ET.SubElement(self.physical_dimension_Len2_1_long_name, 'L-4')
-        self.variables['physical_dimension_Len2_1_l_4'] = self.physical_dimension_Len2_1_l_4
-        self.physical_dimension_Len2_1_l_4.text = 'Volume Per Distance / Fuel Consumption'
-        self.physical_dimension_Len2_1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len2_1_length_exp = ET.SubElement(self.physical_dimension_Len2_1, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len2_1_length_exp'] = self.physical_dimension_Len2_1_length_exp
-        self.physical_dimension_Len2_1_length_exp.text = '2'
-        self.physical_dimension_Len2_1_mass_exp = ET.SubElement(self.physical_dimension_Len2_1, 'MASS-EXP')
-        self.variables['physical_dimension_Len2_1_mass_exp'] = self.physical_dimension_Len2_1_mass_exp
-        self.physical_dimension_Len2_1_mass_exp.text = '0'
-        self.physical_dimension_Len2_1_time_exp = ET.SubElement(self.physical_dimension_Len2_1, 'TIME-EXP')
-        self.variables['physical_dimension_Len2_1_time_exp'] = self.physical_dimension_Len2_1_time_exp
-        self.physical_dimension_Len2_1_time_exp.text = '0'
-        self.physical_dimension_Len2_1_current_exp = ET.SubElement(self.physical_dimension_Len2_1, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len2_1_current_exp'] = self.physical_dimension_Len2_1_current_exp
-        self.physical_dimension_Len2_1_current_exp.text = '0'
-        self.physical_dimension_Len2_1_temperature_exp = ET.SubElement(self.physical_dimension_Len2_1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len2_1_temperature_exp'] = self.physical_dimension_Len2_1_temperature_exp
-        self.physical_dimension_Len2_1_temperature_exp.text = '0'
-        self.physical_dimension_Len2_1_molar_amount_exp = ET.SubElement(self.physical_dimension_Len2_1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len2_1_molar_amount_exp'] = self.physical_dimension_Len2_1_molar_amount_exp
-        self.physical_dimension_Len2_1_molar_amount_exp.text = '0'
-        self.physical_dimension_Len2_1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len2_1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len2_1_luminous_intensity_exp'] = self.physical_dimension_Len2_1_luminous_intensity_exp
-        self.physical_dimension_Len2_1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Len3 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len3'] = self.physical_dimension_Len3
-        self.physical_dimension_Len3_short_name = ET.SubElement(self.physical_dimension_Len3, 'SHORT-NAME')
-        self.variables['physical_dimension_Len3_short_name'] = self.physical_dimension_Len3_short_name
-        self.physical_dimension_Len3_short_name.text = 'Len3'
-        self.physical_dimension_Len3_long_name = ET.SubElement(self.physical_dimension_Len3, 'LONG-NAME')
-        self.variables['physical_dimension_Len3_long_name'] = self.physical_dimension_Len3_long_name
-        self.physical_dimension_Len3_l_4 = ET.SubElement(self.physical_dimension_Len3_long_name, 'L-4')
-        self.variables['physical_dimension_Len3_l_4'] = self.physical_dimension_Len3_l_4
-        self.physical_dimension_Len3_l_4.text = 'Volume'
-        self.physical_dimension_Len3_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len3_length_exp = ET.SubElement(self.physical_dimension_Len3, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len3_length_exp'] = self.physical_dimension_Len3_length_exp
-        self.physical_dimension_Len3_length_exp.text = '3'
-        self.physical_dimension_Len3_mass_exp = ET.SubElement(self.physical_dimension_Len3, 'MASS-EXP')
-        self.variables['physical_dimension_Len3_mass_exp'] = self.physical_dimension_Len3_mass_exp
-        self.physical_dimension_Len3_mass_exp.text = '0'
-        self.physical_dimension_Len3_time_exp = ET.SubElement(self.physical_dimension_Len3, 'TIME-EXP')
-        self.variables['physical_dimension_Len3_time_exp'] = self.physical_dimension_Len3_time_exp
-        self.physical_dimension_Len3_time_exp.text = '0'
-        self.physical_dimension_Len3_current_exp = ET.SubElement(self.physical_dimension_Len3, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len3_current_exp'] = self.physical_dimension_Len3_current_exp
-        self.physical_dimension_Len3_current_exp.text = '0'
-        self.physical_dimension_Len3_temperature_exp = ET.SubElement(self.physical_dimension_Len3, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len3_temperature_exp'] = self.physical_dimension_Len3_temperature_exp
-        self.physical_dimension_Len3_temperature_exp.text = '0'
-        self.physical_dimension_Len3_molar_amount_exp = ET.SubElement(self.physical_dimension_Len3, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len3_molar_amount_exp'] = self.physical_dimension_Len3_molar_amount_exp
-        self.physical_dimension_Len3_molar_amount_exp.text = '0'
-        self.physical_dimension_Len3_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len3, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len3_luminous_intensity_exp'] = self.physical_dimension_Len3_luminous_intensity_exp
-        self.physical_dimension_Len3_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Len3MNeg1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len3MNeg1'] = self.physical_dimension_Len3MNeg1
-        self.physical_dimension_Len3MNeg1_short_name = ET.SubElement(self.physical_dimension_Len3MNeg1, 'SHORT-NAME')
-        self.variables['physical_dimension_Len3MNeg1_short_name'] = self.physical_dimension_Len3MNeg1_short_name
-        self.physical_dimension_Len3MNeg1_short_name.text = 'Len3MNeg1'
-        self.physical_dimension_Len3MNeg1_long_name = ET.SubElement(self.physical_dimension_Len3MNeg1, 'LONG-NAME')
-        self.variables['physical_dimension_Len3MNeg1_long_name'] = self.physical_dimension_Len3MNeg1_long_name
-        self.physical_dimension_Len3MNeg1_l_4 = ET.SubElement(self.physical_dimension_Len3MNeg1_long_name, 'L-4')
-        self.variables['physical_dimension_Len3MNeg1_l_4'] = self.physical_dimension_Len3MNeg1_l_4
-        self.physical_dimension_Len3MNeg1_l_4.text = 'Specific Volume'
-        self.physical_dimension_Len3MNeg1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len3MNeg1_length_exp = ET.SubElement(self.physical_dimension_Len3MNeg1, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len3MNeg1_length_exp'] = self.physical_dimension_Len3MNeg1_length_exp
-        self.physical_dimension_Len3MNeg1_length_exp.text = '3'
-        self.physical_dimension_Len3MNeg1_mass_exp = ET.SubElement(self.physical_dimension_Len3MNeg1, 'MASS-EXP')
-        self.variables['physical_dimension_Len3MNeg1_mass_exp'] = self.physical_dimension_Len3MNeg1_mass_exp
-        self.physical_dimension_Len3MNeg1_mass_exp.text = '-1'
-        self.physical_dimension_Len3MNeg1_time_exp = ET.SubElement(self.physical_dimension_Len3MNeg1, 'TIME-EXP')
-        self.variables['physical_dimension_Len3MNeg1_time_exp'] = self.physical_dimension_Len3MNeg1_time_exp
-        self.physical_dimension_Len3MNeg1_time_exp.text = '0'
-        self.physical_dimension_Len3MNeg1_current_exp = ET.SubElement(self.physical_dimension_Len3MNeg1, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len3MNeg1_current_exp'] = self.physical_dimension_Len3MNeg1_current_exp
-        self.physical_dimension_Len3MNeg1_current_exp.text = '0'
-        self.physical_dimension_Len3MNeg1_temperature_exp = ET.SubElement(self.physical_dimension_Len3MNeg1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len3MNeg1_temperature_exp'] = self.physical_dimension_Len3MNeg1_temperature_exp
-        self.physical_dimension_Len3MNeg1_temperature_exp.text = '0'
-        self.physical_dimension_Len3MNeg1_molar_amount_exp = ET.SubElement(self.physical_dimension_Len3MNeg1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len3MNeg1_molar_amount_exp'] = self.physical_dimension_Len3MNeg1_molar_amount_exp
-        self.physical_dimension_Len3MNeg1_molar_amount_exp.text = '0'
-        self.physical_dimension_Len3MNeg1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len3MNeg1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len3MNeg1_luminous_intensity_exp'] = self.physical_dimension_Len3MNeg1_luminous_intensity_exp
-        self.physical_dimension_Len3MNeg1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Len3TiNeg1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len3TiNeg1'] = self.physical_dimension_Len3TiNeg1
-        self.physical_dimension_Len3TiNeg1_short_name = ET.SubElement(self.physical_dimension_Len3TiNeg1, 'SHORT-NAME')
-        self.variables['physical_dimension_Len3TiNeg1_short_name'] = self.physical_dimension_Len3TiNeg1_short_name
-        self.physical_dimension_Len3TiNeg1_short_name.text = 'Len3TiNeg1'
-        self.physical_dimension_Len3TiNeg1_long_name = ET.SubElement(self.physical_dimension_Len3TiNeg1, 'LONG-NAME')
-        self.variables['physical_dimension_Len3TiNeg1_long_name'] = self.physical_dimension_Len3TiNeg1_long_name
-        self.physical_dimension_Len3TiNeg1_l_4 = ET.SubElement(self.physical_dimension_Len3TiNeg1_long_name, 'L-4')
-        self.variables['physical_dimension_Len3TiNeg1_l_4'] = self.physical_dimension_Len3TiNeg1_l_4
-        self.physical_dimension_Len3TiNeg1_l_4.text = 'Volumetric Flow'
-        self.physical_dimension_Len3TiNeg1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len3TiNeg1_length_exp = ET.SubElement(self.physical_dimension_Len3TiNeg1, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len3TiNeg1_length_exp'] = self.physical_dimension_Len3TiNeg1_length_exp
-        self.physical_dimension_Len3TiNeg1_length_exp.text = '3'
-        self.physical_dimension_Len3TiNeg1_mass_exp = ET.SubElement(self.physical_dimension_Len3TiNeg1, 'MASS-EXP')
-        self.variables['physical_dimension_Len3TiNeg1_mass_exp'] = self.physical_dimension_Len3TiNeg1_mass_exp
-        self.physical_dimension_Len3TiNeg1_mass_exp.text = '0'
-        self.physical_dimension_Len3TiNeg1_time_exp = ET.SubElement(self.physical_dimension_Len3TiNeg1, 'TIME-EXP')
-        self.variables['physical_dimension_Len3TiNeg1_time_exp'] = self.physical_dimension_Len3TiNeg1_time_exp
-        self.physical_dimension_Len3TiNeg1_time_exp.text = '-1'
-        self.physical_dimension_Len3TiNeg1_current_exp = ET.SubElement(self.physical_dimension_Len3TiNeg1, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len3TiNeg1_current_exp'] = self.physical_dimension_Len3TiNeg1_current_exp
-        self.physical_dimension_Len3TiNeg1_current_exp.text = '0'
-        self.physical_dimension_Len3TiNeg1_temperature_exp = ET.SubElement(self.physical_dimension_Len3TiNeg1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len3TiNeg1_temperature_exp'] = self.physical_dimension_Len3TiNeg1_temperature_exp
-        self.physical_dimension_Len3TiNeg1_temperature_exp.text = '0'
-        self.physical_dimension_Len3TiNeg1_molar_amount_exp = ET.SubElement(self.physical_dimension_Len3TiNeg1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len3TiNeg1_molar_amount_exp'] = self.physical_dimension_Len3TiNeg1_molar_amount_exp
-        self.physical_dimension_Len3TiNeg1_molar_amount_exp.text = '0'
-        self.physical_dimension_Len3TiNeg1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len3TiNeg1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len3TiNeg1_luminous_intensity_exp'] = self.physical_dimension_Len3TiNeg1_luminous_intensity_exp
-        self.physical_dimension_Len3TiNeg1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Len3TiNeg2 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Len3TiNeg2'] = self.physical_dimension_Len3TiNeg2
-        self.physical_dimension_Len3TiNeg2_short_name = ET.SubElement(self.physical_dimension_Len3TiNeg2, 'SHORT-NAME')
-        self.variables['physical_dimension_Len3TiNeg2_short_name'] = self.physical_dimension_Len3TiNeg2_short_name
-        self.physical_dimension_Len3TiNeg2_short_name.text = 'Len3TiNeg2'
-        self.physical_dimension_Len3TiNeg2_long_name = ET.SubElement(self.physical_dimension_Len3TiNeg2, 'LONG-NAME')
-        self.variables['physical_dimension_Len3TiNeg2_long_name'] = self.physical_dimension_Len3TiNeg2_long_name
-        self.physical_dimension_Len3TiNeg2_l_4 = ET.SubElement(self.physical_dimension_Len3TiNeg2_long_name, 'L-4')
-        self.variables['physical_dimension_Len3TiNeg2_l_4'] = self.physical_dimension_Len3TiNeg2_l_4
-        self.physical_dimension_Len3TiNeg2_l_4.text = 'Volumetric Flow Gradient'
-        self.physical_dimension_Len3TiNeg2_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Len3TiNeg2_length_exp = ET.SubElement(self.physical_dimension_Len3TiNeg2, 'LENGTH-EXP')
-        self.variables['physical_dimension_Len3TiNeg2_length_exp'] = self.physical_dimension_Len3TiNeg2_length_exp
-        self.physical_dimension_Len3TiNeg2_length_exp.text = '3'
-        self.physical_dimension_Len3TiNeg2_mass_exp = ET.SubElement(self.physical_dimension_Len3TiNeg2, 'MASS-EXP')
-        self.variables['physical_dimension_Len3TiNeg2_mass_exp'] = self.physical_dimension_Len3TiNeg2_mass_exp
-        self.physical_dimension_Len3TiNeg2_mass_exp.text = '0'
-        self.physical_dimension_Len3TiNeg2_time_exp = ET.SubElement(self.physical_dimension_Len3TiNeg2, 'TIME-EXP')
-        self.variables['physical_dimension_Len3TiNeg2_time_exp'] = self.physical_dimension_Len3TiNeg2_time_exp
-        self.physical_dimension_Len3TiNeg2_time_exp.text = '-2'
-        self.physical_dimension_Len3TiNeg2_current_exp = ET.SubElement(self.physical_dimension_Len3TiNeg2, 'CURRENT-EXP')
-        self.variables['physical_dimension_Len3TiNeg2_current_exp'] = self.physical_dimension_Len3TiNeg2_current_exp
-        self.physical_dimension_Len3TiNeg2_current_exp.text = '0'
-        self.physical_dimension_Len3TiNeg2_temperature_exp = ET.SubElement(self.physical_dimension_Len3TiNeg2, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Len3TiNeg2_temperature_exp'] = self.physical_dimension_Len3TiNeg2_temperature_exp
-        self.physical_dimension_Len3TiNeg2_temperature_exp.text = '0'
-        self.physical_dimension_Len3TiNeg2_molar_amount_exp = ET.SubElement(self.physical_dimension_Len3TiNeg2, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Len3TiNeg2_molar_amount_exp'] = self.physical_dimension_Len3TiNeg2_molar_amount_exp
-        self.physical_dimension_Len3TiNeg2_molar_amount_exp.text = '0'
-        self.physical_dimension_Len3TiNeg2_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Len3TiNeg2, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Len3TiNeg2_luminous_intensity_exp'] = self.physical_dimension_Len3TiNeg2_luminous_intensity_exp
-        self.physical_dimension_Len3TiNeg2_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_LenNeg1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_LenNeg1'] = self.physical_dimension_LenNeg1
-        self.physical_dimension_LenNeg1_short_name = ET.SubElement(self.physical_dimension_LenNeg1, 'SHORT-NAME')
-        self.variables['physical_dimension_LenNeg1_short_name'] = self.physical_dimension_LenNeg1_short_name
-        self.physical_dimension_LenNeg1_short_name.text = 'LenNeg1'
-        self.physical_dimension_LenNeg1_long_name = ET.SubElement(self.physical_dimension_LenNeg1, 'LONG-NAME')
-        self.variables['physical_dimension_LenNeg1_long_name'] = self.physical_dimension_LenNeg1_long_name
-        self.physical_dimension_LenNeg1_l_4 = ET.SubElement(self.physical_dimension_LenNeg1_long_name, 'L-4')
-        self.variables['physical_dimension_LenNeg1_l_4'] = self.physical_dimension_LenNeg1_l_4
-        self.physical_dimension_LenNeg1_l_4.text = 'Inverse Length'
-        self.physical_dimension_LenNeg1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_LenNeg1_length_exp = ET.SubElement(self.physical_dimension_LenNeg1, 'LENGTH-EXP')
-        self.variables['physical_dimension_LenNeg1_length_exp'] = self.physical_dimension_LenNeg1_length_exp
-        self.physical_dimension_LenNeg1_length_exp.text = '-1'
-        self.physical_dimension_LenNeg1_mass_exp = ET.SubElement(self.physical_dimension_LenNeg1, 'MASS-EXP')
-        self.variables['physical_dimension_LenNeg1_mass_exp'] = self.physical_dimension_LenNeg1_mass_exp
-        self.physical_dimension_LenNeg1_mass_exp.text = '0'
-        self.physical_dimension_LenNeg1_time_exp = ET.SubElement(self.physical_dimension_LenNeg1, 'TIME-EXP')
-        self.variables['physical_dimension_LenNeg1_time_exp'] = self.physical_dimension_LenNeg1_time_exp
-        self.physical_dimension_LenNeg1_time_exp.text = '0'
-        self.physical_dimension_LenNeg1_current_exp = ET.SubElement(self.physical_dimension_LenNeg1, 'CURRENT-EXP')
-        self.variables['physical_dimension_LenNeg1_current_exp'] = self.physical_dimension_LenNeg1_current_exp
-        self.physical_dimension_LenNeg1_current_exp.text = '0'
-        self.physical_dimension_LenNeg1_temperature_exp = ET.SubElement(self.physical_dimension_LenNeg1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_LenNeg1_temperature_exp'] = self.physical_dimension_LenNeg1_temperature_exp
-        self.physical_dimension_LenNeg1_temperature_exp.text = '0'
-        self.physical_dimension_LenNeg1_molar_amount_exp = ET.SubElement(self.physical_dimension_LenNeg1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_LenNeg1_molar_amount_exp'] = self.physical_dimension_LenNeg1_molar_amount_exp
-        self.physical_dimension_LenNeg1_molar_amount_exp.text = '0'
-        self.physical_dimension_LenNeg1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_LenNeg1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_LenNeg1_luminous_intensity_exp'] = self.physical_dimension_LenNeg1_luminous_intensity_exp
-        self.physical_dimension_LenNeg1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_LenNeg1M1TiNeg1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_LenNeg1M1TiNeg1'] = self.physical_dimension_LenNeg1M1TiNeg1
-        self.physical_dimension_LenNeg1M1TiNeg1_short_name = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg1, 'SHORT-NAME')
-        self.variables['physical_dimension_LenNeg1M1TiNeg1_short_name'] = self.physical_dimension_LenNeg1M1TiNeg1_short_name
-        self.physical_dimension_LenNeg1M1TiNeg1_short_name.text = 'LenNeg1M1TiNeg1'
-        self.physical_dimension_LenNeg1M1TiNeg1_long_name = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg1, 'LONG-NAME')
-        self.variables['physical_dimension_LenNeg1M1TiNeg1_long_name'] = self.physical_dimension_LenNeg1M1TiNeg1_long_name
-        self.physical_dimension_LenNeg1M1TiNeg1_l_4 = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg1_long_name, 'L-4')
-        self.variables['physical_dimension_LenNeg1M1TiNeg1_l_4'] = self.physical_dimension_LenNeg1M1TiNeg1_l_4
-        self.physical_dimension_LenNeg1M1TiNeg1_l_4.text = 'Dynamic Viscosity'
-        self.physical_dimension_LenNeg1M1TiNeg1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_LenNeg1M1TiNeg1_length_exp = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg1, 'LENGTH-EXP')
-        self.variables['physical_dimension_LenNeg1M1TiNeg1_length_exp'] = self.physical_dimension_LenNeg1M1TiNeg1_length_exp
-        self.physical_dimension_LenNeg1M1TiNeg1_length_exp.text = '-1'
-        self.physical_dimension_LenNeg1M1TiNeg1_mass_exp = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg1, 'MASS-EXP')
-        self.variables['physical_dimension_LenNeg1M1TiNeg1_mass_exp'] = self.physical_dimension_LenNeg1M1TiNeg1_mass_exp
-        self.physical_dimension_LenNeg1M1TiNeg1_mass_exp.text = '1'
-        self.physical_dimension_LenNeg1M1TiNeg1_time_exp = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg1, 'TIME-EXP')
-        self.variables['physical_dimension_LenNeg1M1TiNeg1_time_exp'] = self.physical_dimension_LenNeg1M1TiNeg1_time_exp
-        self.physical_dimension_LenNeg1M1TiNeg1_time_exp.text = '-1'
-        self.physical_dimension_LenNeg1M1TiNeg1_current_exp = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg1, 'CURRENT-EXP')
-        self.variables['physical_dimension_LenNeg1M1TiNeg1_current_exp'] = self.physical_dimension_LenNeg1M1TiNeg1_current_exp
-        self.physical_dimension_LenNeg1M1TiNeg1_current_exp.text = '0'
-        self.physical_dimension_LenNeg1M1TiNeg1_temperature_exp = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_LenNeg1M1TiNeg1_temperature_exp'] = self.physical_dimension_LenNeg1M1TiNeg1_temperature_exp
-        self.physical_dimension_LenNeg1M1TiNeg1_temperature_exp.text = '0'
-        self.physical_dimension_LenNeg1M1TiNeg1_molar_amount_exp = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_LenNeg1M1TiNeg1_molar_amount_exp'] = self.physical_dimension_LenNeg1M1TiNeg1_molar_amount_exp
-        self.physical_dimension_LenNeg1M1TiNeg1_molar_amount_exp.text = '0'
-        self.physical_dimension_LenNeg1M1TiNeg1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_LenNeg1M1TiNeg1_luminous_intensity_exp'] = self.physical_dimension_LenNeg1M1TiNeg1_luminous_intensity_exp
-        self.physical_dimension_LenNeg1M1TiNeg1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_LenNeg1M1TiNeg2 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_LenNeg1M1TiNeg2'] = self.physical_dimension_LenNeg1M1TiNeg2
-        self.physical_dimension_LenNeg1M1TiNeg2_short_name = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg2, 'SHORT-NAME')
-        self.variables['physical_dimension_LenNeg1M1TiNeg2_short_name'] = self.physical_dimension_LenNeg1M1TiNeg2_short_name
-        self.physical_dimension_LenNeg1M1TiNeg2_short_name.text = 'LenNeg1M1TiNeg2'
-        self.physical_dimension_LenNeg1M1TiNeg2_long_name = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg2, 'LONG-NAME')
-        self.variables['physical_dimension_LenNeg1M1TiNeg2_long_name'] = self.physical_dimension_LenNeg1M1TiNeg2_long_name
-        self.physical_dimension_LenNeg1M1TiNeg2_l_4 = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg2_long_name, 'L-4')
-        self.variables['physical_dimension_LenNeg1M1TiNeg2_l_4'] = self.physical_dimension_LenNeg1M1TiNeg2_l_4
-        self.physical_dimension_LenNeg1M1TiNeg2_l_4.text = 'Pressure'
-        self.physical_dimension_LenNeg1M1TiNeg2_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_LenNeg1M1TiNeg2_length_exp = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg2, 'LENGTH-EXP')
-        self.variables['physical_dimension_LenNeg1M1TiNeg2_length_exp'] = self.physical_dimension_LenNeg1M1TiNeg2_length_exp
-        self.physical_dimension_LenNeg1M1TiNeg2_length_exp.text = '-1'
-        self.physical_dimension_LenNeg1M1TiNeg2_mass_exp = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg2, 'MASS-EXP')
-        self.variables['physical_dimension_LenNeg1M1TiNeg2_mass_exp'] = self.physical_dimension_LenNeg1M1TiNeg2_mass_exp
-        self.physical_dimension_LenNeg1M1TiNeg2_mass_exp.text = '1'
-        self.physical_dimension_LenNeg1M1TiNeg2_time_exp = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg2, 'TIME-EXP')
-        self.variables['physical_dimension_LenNeg1M1TiNeg2_time_exp'] = self.physical_dimension_LenNeg1M1TiNeg2_time_exp
-        self.physical_dimension_LenNeg1M1TiNeg2_time_exp.text = '-2'
-        self.physical_dimension_LenNeg1M1TiNeg2_current_exp = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg2, 'CURRENT-EXP')
-        self.variables['physical_dimension_LenNeg1M1TiNeg2_current_exp'] = self.physical_dimension_LenNeg1M1TiNeg2_current_exp
-        self.physical_dimension_LenNeg1M1TiNeg2_current_exp.text = '0'
-        self.physical_dimension_LenNeg1M1TiNeg2_temperature_exp = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg2, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_LenNeg1M1TiNeg2_temperature_exp'] = self.physical_dimension_LenNeg1M1TiNeg2_temperature_exp
-        self.physical_dimension_LenNeg1M1TiNeg2_temperature_exp.text = '0'
-        self.physical_dimension_LenNeg1M1TiNeg2_molar_amount_exp = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg2, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_LenNeg1M1TiNeg2_molar_amount_exp'] = self.physical_dimension_LenNeg1M1TiNeg2_molar_amount_exp
-        self.physical_dimension_LenNeg1M1TiNeg2_molar_amount_exp.text = '0'
-        self.physical_dimension_LenNeg1M1TiNeg2_luminous_intensity_exp = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg2, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_LenNeg1M1TiNeg2_luminous_intensity_exp'] = self.physical_dimension_LenNeg1M1TiNeg2_luminous_intensity_exp
-        self.physical_dimension_LenNeg1M1TiNeg2_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_LenNeg1M1TiNeg2_1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_LenNeg1M1TiNeg2_1'] = self.physical_dimension_LenNeg1M1TiNeg2_1
-        self.physical_dimension_LenNeg1M1TiNeg2_1_short_name = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg2_1, 'SHORT-NAME')
-        self.variables['physical_dimension_LenNeg1M1TiNeg2_1_short_name'] = self.physical_dimension_LenNeg1M1TiNeg2_1_short_name
-        self.physical_dimension_LenNeg1M1TiNeg2_1_short_name.text = 'LenNeg1M1TiNeg2_1'
-        self.physical_dimension_LenNeg1M1TiNeg2_1_long_name = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg2_1, 'LONG-NAME')
-        self.variables['physical_dimension_LenNeg1M1TiNeg2_1_long_name'] = self.physical_dimension_LenNeg1M1TiNeg2_1_long_name
-        self.physical_dimension_LenNeg1M1TiNeg2_1_l_4 = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg2_1_long_name, 'L-4')
-        self.variables['physical_dimension_LenNeg1M1TiNeg2_1_l_4'] = self.physical_dimension_LenNeg1M1TiNeg2_1_l_4
-        self.physical_dimension_LenNeg1M1TiNeg2_1_l_4.text = 'Pressure by Angle'
-        self.physical_dimension_LenNeg1M1TiNeg2_1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_LenNeg1M1TiNeg2_1_length_exp = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg2_1, 'LENGTH-EXP')
-        self.variables['physical_dimension_LenNeg1M1TiNeg2_1_length_exp'] = self.physical_dimension_LenNeg1M1TiNeg2_1_length_exp
-        self.physical_dimension_LenNeg1M1TiNeg2_1_length_exp.text = '-1'
-        self.physical_dimension_LenNeg1M1TiNeg2_1_mass_exp = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg2_1, 'MASS-EXP')
-        self.variables['physical_dimension_LenNeg1M1TiNeg2_1_mass_exp'] = self.physical_dimension_LenNeg1M1TiNeg2_1_mass_exp
-        self.physical_dimension_LenNeg1M1TiNeg2_1_mass_exp.text = '1'
-        self.physical_dimension_LenNeg1M1TiNeg2_1_time_exp = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg2_1, 'TIME-EXP')
-        self.variables['physical_dimension_LenNeg1M1TiNeg2_1_time_exp'] = self.physical_dimension_LenNeg1M1TiNeg2_1_time_exp
-        self.physical_dimension_LenNeg1M1TiNeg2_1_time_exp.text = '-2'
-        self.physical_dimension_LenNeg1M1TiNeg2_1_current_exp = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg2_1, 'CURRENT-EXP')
-        self.variables['physical_dimension_LenNeg1M1TiNeg2_1_current_exp'] = self.physical_dimension_LenNeg1M1TiNeg2_1_current_exp
-        self.physical_dimension_LenNeg1M1TiNeg2_1_current_exp.text = '0'
-        self.physical_dimension_LenNeg1M1TiNeg2_1_temperature_exp = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg2_1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_LenNeg1M1TiNeg2_1_temperature_exp'] = self.physical_dimension_LenNeg1M1TiNeg2_1_temperature_exp
-        self.physical_dimension_LenNeg1M1TiNeg2_1_temperature_exp.text = '0'
-        self.physical_dimension_LenNeg1M1TiNeg2_1_molar_amount_exp = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg2_1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_LenNeg1M1TiNeg2_1_molar_amount_exp'] = self.physical_dimension_LenNeg1M1TiNeg2_1_molar_amount_exp
-        self.physical_dimension_LenNeg1M1TiNeg2_1_molar_amount_exp.text = '0'
-        self.physical_dimension_LenNeg1M1TiNeg2_1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg2_1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_LenNeg1M1TiNeg2_1_luminous_intensity_exp'] = self.physical_dimension_LenNeg1M1TiNeg2_1_luminous_intensity_exp
-        self.physical_dimension_LenNeg1M1TiNeg2_1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_LenNeg1M1TiNeg3 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_LenNeg1M1TiNeg3'] = self.physical_dimension_LenNeg1M1TiNeg3
-        self.physical_dimension_LenNeg1M1TiNeg3_short_name = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg3, 'SHORT-NAME')
-        self.variables['physical_dimension_LenNeg1M1TiNeg3_short_name'] = self.physical_dimension_LenNeg1M1TiNeg3_short_name
-        self.physical_dimension_LenNeg1M1TiNeg3_short_name.text = 'LenNeg1M1TiNeg3'
-        self.physical_dimension_LenNeg1M1TiNeg3_long_name = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg3, 'LONG-NAME')
-        self.variables['physical_dimension_LenNeg1M1TiNeg3_long_name'] = self.physical_dimension_LenNeg1M1TiNeg3_long_name
-        self.physical_dimension_LenNeg1M1TiNeg3_l_4 = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg3_long_name, 'L-4')
-        self.variables['physical_dimension_LenNeg1M1TiNeg3_l_4'] = self.physical_dimension_LenNeg1M1TiNeg3_l_4
-        self.physical_dimension_LenNeg1M1TiNeg3_l_4.text = 'Pressure Gradient'
-        self.physical_dimension_LenNeg1M1TiNeg3_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_LenNeg1M1TiNeg3_length_exp = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg3, 'LENGTH-EXP')
-        self.variables['physical_dimension_LenNeg1M1TiNeg3_length_exp'] = self.physical_dimension_LenNeg1M1TiNeg3_length_exp
-        self.physical_dimension_LenNeg1M1TiNeg3_length_exp.text = '-1'
-        self.physical_dimension_LenNeg1M1TiNeg3_mass_exp = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg3, 'MASS-EXP')
-        self.variables['physical_dimension_LenNeg1M1TiNeg3_mass_exp'] = self.physical_dimension_LenNeg1M1TiNeg3_mass_exp
-        self.physical_dimension_LenNeg1M1TiNeg3_mass_exp.text = '1'
-        self.physical_dimension_LenNeg1M1TiNeg3_time_exp = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg3, 'TIME-EXP')
-        self.variables['physical_dimension_LenNeg1M1TiNeg3_time_exp'] = self.physical_dimension_LenNeg1M1TiNeg3_time_exp
-        self.physical_dimension_LenNeg1M1TiNeg3_time_exp.text = '-3'
-        self.physical_dimension_LenNeg1M1TiNeg3_current_exp = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg3, 'CURRENT-EXP')
-        self.variables['physical_dimension_LenNeg1M1TiNeg3_current_exp'] = self.physical_dimension_LenNeg1M1TiNeg3_current_exp
-        self.physical_dimension_LenNeg1M1TiNeg3_current_exp.text = '0'
-        self.physical_dimension_LenNeg1M1TiNeg3_temperature_exp = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg3, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_LenNeg1M1TiNeg3_temperature_exp'] = self.physical_dimension_LenNeg1M1TiNeg3_temperature_exp
-        self.physical_dimension_LenNeg1M1TiNeg3_temperature_exp.text = '0'
-        self.physical_dimension_LenNeg1M1TiNeg3_molar_amount_exp = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg3, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_LenNeg1M1TiNeg3_molar_amount_exp'] = self.physical_dimension_LenNeg1M1TiNeg3_molar_amount_exp
-        self.physical_dimension_LenNeg1M1TiNeg3_molar_amount_exp.text = '0'
-        self.physical_dimension_LenNeg1M1TiNeg3_luminous_intensity_exp = ET.SubElement(self.physical_dimension_LenNeg1M1TiNeg3, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_LenNeg1M1TiNeg3_luminous_intensity_exp'] = self.physical_dimension_LenNeg1M1TiNeg3_luminous_intensity_exp
-        self.physical_dimension_LenNeg1M1TiNeg3_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_LenNeg2Illmn1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_LenNeg2Illmn1'] = self.physical_dimension_LenNeg2Illmn1
-        self.physical_dimension_LenNeg2Illmn1_short_name = ET.SubElement(self.physical_dimension_LenNeg2Illmn1, 'SHORT-NAME')
-        self.variables['physical_dimension_LenNeg2Illmn1_short_name'] = self.physical_dimension_LenNeg2Illmn1_short_name
-        self.physical_dimension_LenNeg2Illmn1_short_name.text = 'LenNeg2Illmn1'
-        self.physical_dimension_LenNeg2Illmn1_long_name = ET.SubElement(self.physical_dimension_LenNeg2Illmn1, 'LONG-NAME')
-        self.variables['physical_dimension_LenNeg2Illmn1_long_name'] = self.physical_dimension_LenNeg2Illmn1_long_name
-        self.physical_dimension_LenNeg2Illmn1_l_4 = ET.SubElement(self.physical_dimension_LenNeg2Illmn1_long_name, 'L-4')
-        self.variables['physical_dimension_LenNeg2Illmn1_l_4'] = self.physical_dimension_LenNeg2Illmn1_l_4
-        self.physical_dimension_LenNeg2Illmn1_l_4.text = 'Illuminance'
-        self.physical_dimension_LenNeg2Illmn1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_LenNeg2Illmn1_length_exp = ET.SubElement(self.physical_dimension_LenNeg2Illmn1, 'LENGTH-EXP')
-        self.variables['physical_dimension_LenNeg2Illmn1_length_exp'] = self.physical_dimension_LenNeg2Illmn1_length_exp
-        self.physical_dimension_LenNeg2Illmn1_length_exp.text = '-2'
-        self.physical_dimension_LenNeg2Illmn1_mass_exp = ET.SubElement(self.physical_dimension_LenNeg2Illmn1, 'MASS-EXP')
-        self.variables['physical_dimension_LenNeg2Illmn1_mass_exp'] = self.physical_dimension_LenNeg2Illmn1_mass_exp
-        self.physical_dimension_LenNeg2Illmn1_mass_exp.text = '0'
-        self.physical_dimension_LenNeg2Illmn1_time_exp = ET.SubElement(self.physical_dimension_LenNeg2Illmn1, 'TIME-EXP')
-        self.variables['physical_dimension_LenNeg2Illmn1_time_exp'] = self.physical_dimension_LenNeg2Illmn1_time_exp
-        self.physical_dimension_LenNeg2Illmn1_time_exp.text = '0'
-        self.physical_dimension_LenNeg2Illmn1_current_exp = ET.SubElement(self.physical_dimension_LenNeg2Illmn1, 'CURRENT-EXP')
-        self.variables['physical_dimension_LenNeg2Illmn1_current_exp'] = self.physical_dimension_LenNeg2Illmn1_current_exp
-        self.physical_dimension_LenNeg2Illmn1_current_exp.text = '0'
-        self.physical_dimension_LenNeg2Illmn1_temperature_exp = ET.SubElement(self.physical_dimension_LenNeg2Illmn1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_LenNeg2Illmn1_temperature_exp'] = self.physical_dimension_LenNeg2Illmn1_temperature_exp
-        self.physical_dimension_LenNeg2Illmn1_temperature_exp.text = '0'
-        self.physical_dimension_LenNeg2Illmn1_molar_amount_exp = ET.SubElement(self.physical_dimension_LenNeg2Illmn1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_LenNeg2Illmn1_molar_amount_exp'] = self.physical_dimension_LenNeg2Illmn1_molar_amount_exp
-        self.physical_dimension_LenNeg2Illmn1_molar_amount_exp.text = '0'
-        self.physical_dimension_LenNeg2Illmn1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_LenNeg2Illmn1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_LenNeg2Illmn1_luminous_intensity_exp'] = self.physical_dimension_LenNeg2Illmn1_luminous_intensity_exp
-        self.physical_dimension_LenNeg2Illmn1_luminous_intensity_exp.text = '1'
-        
-        self.physical_dimension_LenNeg2MNeg1Ti3I2 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_LenNeg2MNeg1Ti3I2'] = self.physical_dimension_LenNeg2MNeg1Ti3I2
-        self.physical_dimension_LenNeg2MNeg1Ti3I2_short_name = ET.SubElement(self.physical_dimension_LenNeg2MNeg1Ti3I2, 'SHORT-NAME')
-        self.variables['physical_dimension_LenNeg2MNeg1Ti3I2_short_name'] = self.physical_dimension_LenNeg2MNeg1Ti3I2_short_name
-        self.physical_dimension_LenNeg2MNeg1Ti3I2_short_name.text = 'LenNeg2MNeg1Ti3I2'
-        self.physical_dimension_LenNeg2MNeg1Ti3I2_long_name = ET.SubElement(self.physical_dimension_LenNeg2MNeg1Ti3I2, 'LONG-NAME')
-        self.variables['physical_dimension_LenNeg2MNeg1Ti3I2_long_name'] = self.physical_dimension_LenNeg2MNeg1Ti3I2_long_name
-        self.physical_dimension_LenNeg2MNeg1Ti3I2_l_4 = ET.SubElement(self.physical_dimension_LenNeg2MNeg1Ti3I2_long_name, 'L-4')
-        self.variables['physical_dimension_LenNeg2MNeg1Ti3I2_l_4'] = self.physical_dimension_LenNeg2MNeg1Ti3I2_l_4
-        self.physical_dimension_LenNeg2MNeg1Ti3I2_l_4.text = 'Electrical Conductance'
-        self.physical_dimension_LenNeg2MNeg1Ti3I2_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_LenNeg2MNeg1Ti3I2_length_exp = ET.SubElement(self.physical_dimension_LenNeg2MNeg1Ti3I2, 'LENGTH-EXP')
-        self.variables['physical_dimension_LenNeg2MNeg1Ti3I2_length_exp'] = self.physical_dimension_LenNeg2MNeg1Ti3I2_length_exp
-        self.physical_dimension_LenNeg2MNeg1Ti3I2_length_exp.text = '-2'
-        self.physical_dimension_LenNeg2MNeg1Ti3I2_mass_exp = ET.SubElement(self.physical_dimension_LenNeg2MNeg1Ti3I2, 'MASS-EXP')
-        self.variables['physical_dimension_LenNeg2MNeg1Ti3I2_mass_exp'] = self.physical_dimension_LenNeg2MNeg1Ti3I2_mass_exp
-        self.physical_dimension_LenNeg2MNeg1Ti3I2_mass_exp.text = '-1'
-        self.physical_dimension_LenNeg2MNeg1Ti3I2_time_exp = ET.SubElement(self.physical_dimension_LenNeg2MNeg1Ti3I2, 'TIME-EXP')
-        self.variables['physical_dimension_LenNeg2MNeg1Ti3I2_time_exp'] = self.physical_dimension_LenNeg2MNeg1Ti3I2_time_exp
-        self.physical_dimension_LenNeg2MNeg1Ti3I2_time_exp.text = '3'
-        self.physical_dimension_LenNeg2MNeg1Ti3I2_current_exp = ET.SubElement(self.physical_dimension_LenNeg2MNeg1Ti3I2, 'CURRENT-EXP')
-        self.variables['physical_dimension_LenNeg2MNeg1Ti3I2_current_exp'] = self.physical_dimension_LenNeg2MNeg1Ti3I2_current_exp
-        self.physical_dimension_LenNeg2MNeg1Ti3I2_current_exp.text = '2'
-        self.physical_dimension_LenNeg2MNeg1Ti3I2_temperature_exp = ET.SubElement(self.physical_dimension_LenNeg2MNeg1Ti3I2, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_LenNeg2MNeg1Ti3I2_temperature_exp'] = self.physical_dimension_LenNeg2MNeg1Ti3I2_temperature_exp
-        self.physical_dimension_LenNeg2MNeg1Ti3I2_temperature_exp.text = '0'
-        self.physical_dimension_LenNeg2MNeg1Ti3I2_molar_amount_exp = ET.SubElement(self.physical_dimension_LenNeg2MNeg1Ti3I2, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_LenNeg2MNeg1Ti3I2_molar_amount_exp'] = self.physical_dimension_LenNeg2MNeg1Ti3I2_molar_amount_exp
-        self.physical_dimension_LenNeg2MNeg1Ti3I2_molar_amount_exp.text = '0'
-        self.physical_dimension_LenNeg2MNeg1Ti3I2_luminous_intensity_exp = ET.SubElement(self.physical_dimension_LenNeg2MNeg1Ti3I2, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_LenNeg2MNeg1Ti3I2_luminous_intensity_exp'] = self.physical_dimension_LenNeg2MNeg1Ti3I2_luminous_intensity_exp
-        self.physical_dimension_LenNeg2MNeg1Ti3I2_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_LenNeg2MNeg1Ti4I2 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_LenNeg2MNeg1Ti4I2'] = self.physical_dimension_LenNeg2MNeg1Ti4I2
-        self.physical_dimension_LenNeg2MNeg1Ti4I2_short_name = ET.SubElement(self.physical_dimension_LenNeg2MNeg1Ti4I2, 'SHORT-NAME')
-        self.variables['physical_dimension_LenNeg2MNeg1Ti4I2_short_name'] = self.physical_dimension_LenNeg2MNeg1Ti4I2_short_name
-        self.physical_dimension_LenNeg2MNeg1Ti4I2_short_name.text = 'LenNeg2MNeg1Ti4I2'
-        self.physical_dimension_LenNeg2MNeg1Ti4I2_long_name = ET.SubElement(self.physical_dimension_LenNeg2MNeg1Ti4I2, 'LONG-NAME')
-        self.variables['physical_dimension_LenNeg2MNeg1Ti4I2_long_name'] = self.physical_dimension_LenNeg2MNeg1Ti4I2_long_name
-        self.physical_dimension_LenNeg2MNeg1Ti4I2_l_4 = ET.SubElement(self.physical_dimension_LenNeg2MNeg1Ti4I2_long_name, 'L-4')
-        self.variables['physical_dimension_LenNeg2MNeg1Ti4I2_l_4'] = self.physical_dimension_LenNeg2MNeg1Ti4I2_l_4
-        self.physical_dimension_LenNeg2MNeg1Ti4I2_l_4.text = 'Capacitance'
-        self.physical_dimension_LenNeg2MNeg1Ti4I2_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_LenNeg2MNeg1Ti4I2_length_exp = ET.SubElement(self.physical_dimension_LenNeg2MNeg1Ti4I2, 'LENGTH-EXP')
-        self.variables['physical_dimension_LenNeg2MNeg1Ti4I2_length_exp'] = self.physical_dimension_LenNeg2MNeg1Ti4I2_length_exp
-        self.physical_dimension_LenNeg2MNeg1Ti4I2_length_exp.text = '-2'
-        self.physical_dimension_LenNeg2MNeg1Ti4I2_mass_exp = ET.SubElement(self.physical_dimension_LenNeg2MNeg1Ti4I2, 'MASS-EXP')
-        self.variables['physical_dimension_LenNeg2MNeg1Ti4I2_mass_exp'] = self.physical_dimension_LenNeg2MNeg1Ti4I2_mass_exp
-        self.physical_dimension_LenNeg2MNeg1Ti4I2_mass_exp.text = '-1'
-        self.physical_dimension_LenNeg2MNeg1Ti4I2_time_exp = ET.SubElement(self.physical_dimension_LenNeg2MNeg1Ti4I2, 'TIME-EXP')
-        self.variables['physical_dimension_LenNeg2MNeg1Ti4I2_time_exp'] = self.physical_dimension_LenNeg2MNeg1Ti4I2_time_exp
-        self.physical_dimension_LenNeg2MNeg1Ti4I2_time_exp.text = '4'
-        self.physical_dimension_LenNeg2MNeg1Ti4I2_current_exp = ET.SubElement(self.physical_dimension_LenNeg2MNeg1Ti4I2, 'CURRENT-EXP')
-        self.variables['physical_dimension_LenNeg2MNeg1Ti4I2_current_exp'] = self.physical_dimension_LenNeg2MNeg1Ti4I2_current_exp
-        self.physical_dimension_LenNeg2MNeg1Ti4I2_current_exp.text = '2'
-        self.physical_dimension_LenNeg2MNeg1Ti4I2_temperature_exp = ET.SubElement(self.physical_dimension_LenNeg2MNeg1Ti4I2, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_LenNeg2MNeg1Ti4I2_temperature_exp'] = self.physical_dimension_LenNeg2MNeg1Ti4I2_temperature_exp
-        self.physical_dimension_LenNeg2MNeg1Ti4I2_temperature_exp.text = '0'
-        self.physical_dimension_LenNeg2MNeg1Ti4I2_molar_amount_exp = ET.SubElement(self.physical_dimension_LenNeg2MNeg1Ti4I2, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_LenNeg2MNeg1Ti4I2_molar_amount_exp'] = self.physical_dimension_LenNeg2MNeg1Ti4I2_molar_amount_exp
-        self.physical_dimension_LenNeg2MNeg1Ti4I2_molar_amount_exp.text = '0'
-        self.physical_dimension_LenNeg2MNeg1Ti4I2_luminous_intensity_exp = ET.SubElement(self.physical_dimension_LenNeg2MNeg1Ti4I2, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_LenNeg2MNeg1Ti4I2_luminous_intensity_exp'] = self.physical_dimension_LenNeg2MNeg1Ti4I2_luminous_intensity_exp
-        self.physical_dimension_LenNeg2MNeg1Ti4I2_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_LenNeg3Amnt1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_LenNeg3Amnt1'] = self.physical_dimension_LenNeg3Amnt1
-        self.physical_dimension_LenNeg3Amnt1_short_name = ET.SubElement(self.physical_dimension_LenNeg3Amnt1, 'SHORT-NAME')
-        self.variables['physical_dimension_LenNeg3Amnt1_short_name'] = self.physical_dimension_LenNeg3Amnt1_short_name
-        self.physical_dimension_LenNeg3Amnt1_short_name.text = 'LenNeg3Amnt1'
-        self.physical_dimension_LenNeg3Amnt1_long_name = ET.SubElement(self.physical_dimension_LenNeg3Amnt1, 'LONG-NAME')
-        self.variables['physical_dimension_LenNeg3Amnt1_long_name'] = self.physical_dimension_LenNeg3Amnt1_long_name
-        self.physical_dimension_LenNeg3Amnt1_l_4 = ET.SubElement(self.physical_dimension_LenNeg3Amnt1_long_name, 'L-4')
-        self.variables['physical_dimension_LenNeg3Amnt1_l_4'] = self.physical_dimension_LenNeg3Amnt1_l_4
-        self.physical_dimension_LenNeg3Amnt1_l_4.text = 'Concentration'
-        self.physical_dimension_LenNeg3Amnt1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_LenNeg3Amnt1_length_exp = ET.SubElement(self.physical_dimension_LenNeg3Amnt1, 'LENGTH-EXP')
-        self.variables['physical_dimension_LenNeg3Amnt1_length_exp'] = self.physical_dimension_LenNeg3Amnt1_length_exp
-        self.physical_dimension_LenNeg3Amnt1_length_exp.text = '-3'
-        self.physical_dimension_LenNeg3Amnt1_mass_exp = ET.SubElement(self.physical_dimension_LenNeg3Amnt1, 'MASS-EXP')
-        self.variables['physical_dimension_LenNeg3Amnt1_mass_exp'] = self.physical_dimension_LenNeg3Amnt1_mass_exp
-        self.physical_dimension_LenNeg3Amnt1_mass_exp.text = '0'
-        self.physical_dimension_LenNeg3Amnt1_time_exp = ET.SubElement(self.physical_dimension_LenNeg3Amnt1, 'TIME-EXP')
-        self.variables['physical_dimension_LenNeg3Amnt1_time_exp'] = self.physical_dimension_LenNeg3Amnt1_time_exp
-        self.physical_dimension_LenNeg3Amnt1_time_exp.text = '0'
-        self.physical_dimension_LenNeg3Amnt1_current_exp = ET.SubElement(self.physical_dimension_LenNeg3Amnt1, 'CURRENT-EXP')
-        self.variables['physical_dimension_LenNeg3Amnt1_current_exp'] = self.physical_dimension_LenNeg3Amnt1_current_exp
-        self.physical_dimension_LenNeg3Amnt1_current_exp.text = '0'
-        self.physical_dimension_LenNeg3Amnt1_temperature_exp = ET.SubElement(self.physical_dimension_LenNeg3Amnt1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_LenNeg3Amnt1_temperature_exp'] = self.physical_dimension_LenNeg3Amnt1_temperature_exp
-        self.physical_dimension_LenNeg3Amnt1_temperature_exp.text = '0'
-        self.physical_dimension_LenNeg3Amnt1_molar_amount_exp = ET.SubElement(self.physical_dimension_LenNeg3Amnt1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_LenNeg3Amnt1_molar_amount_exp'] = self.physical_dimension_LenNeg3Amnt1_molar_amount_exp
-        self.physical_dimension_LenNeg3Amnt1_molar_amount_exp.text = '1'
-        self.physical_dimension_LenNeg3Amnt1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_LenNeg3Amnt1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_LenNeg3Amnt1_luminous_intensity_exp'] = self.physical_dimension_LenNeg3Amnt1_luminous_intensity_exp
-        self.physical_dimension_LenNeg3Amnt1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_LenNeg3M1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_LenNeg3M1'] = self.physical_dimension_LenNeg3M1
-        self.physical_dimension_LenNeg3M1_short_name = ET.SubElement(self.physical_dimension_LenNeg3M1, 'SHORT-NAME')
-        self.variables['physical_dimension_LenNeg3M1_short_name'] = self.physical_dimension_LenNeg3M1_short_name
-        self.physical_dimension_LenNeg3M1_short_name.text = 'LenNeg3M1'
-        self.physical_dimension_LenNeg3M1_long_name = ET.SubElement(self.physical_dimension_LenNeg3M1, 'LONG-NAME')
-        self.variables['physical_dimension_LenNeg3M1_long_name'] = self.physical_dimension_LenNeg3M1_long_name
-        self.physical_dimension_LenNeg3M1_l_4 = ET.SubElement(self.physical_dimension_LenNeg3M1_long_name, 'L-4')
-        self.variables['physical_dimension_LenNeg3M1_l_4'] = self.physical_dimension_LenNeg3M1_l_4
-        self.physical_dimension_LenNeg3M1_l_4.text = 'Mass Density'
-        self.physical_dimension_LenNeg3M1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_LenNeg3M1_length_exp = ET.SubElement(self.physical_dimension_LenNeg3M1, 'LENGTH-EXP')
-        self.variables['physical_dimension_LenNeg3M1_length_exp'] = self.physical_dimension_LenNeg3M1_length_exp
-        self.physical_dimension_LenNeg3M1_length_exp.text = '-3'
-        self.physical_dimension_LenNeg3M1_mass_exp = ET.SubElement(self.physical_dimension_LenNeg3M1, 'MASS-EXP')
-        self.variables['physical_dimension_LenNeg3M1_mass_exp'] = self.physical_dimension_LenNeg3M1_mass_exp
-        self.physical_dimension_LenNeg3M1_mass_exp.text = '1'
-        self.physical_dimension_LenNeg3M1_time_exp = ET.SubElement(self.physical_dimension_LenNeg3M1, 'TIME-EXP')
-        self.variables['physical_dimension_LenNeg3M1_time_exp'] = self.physical_dimension_LenNeg3M1_time_exp
-        self.physical_dimension_LenNeg3M1_time_exp.text = '0'
-        self.physical_dimension_LenNeg3M1_current_exp = ET.SubElement(self.physical_dimension_LenNeg3M1, 'CURRENT-EXP')
-        self.variables['physical_dimension_LenNeg3M1_current_exp'] = self.physical_dimension_LenNeg3M1_current_exp
-        self.physical_dimension_LenNeg3M1_current_exp.text = '0'
-        self.physical_dimension_LenNeg3M1_temperature_exp = ET.SubElement(self.physical_dimension_LenNeg3M1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_LenNeg3M1_temperature_exp'] = self.physical_dimension_LenNeg3M1_temperature_exp
-        self.physical_dimension_LenNeg3M1_temperature_exp.text = '0'
-        self.physical_dimension_LenNeg3M1_molar_amount_exp = ET.SubElement(self.physical_dimension_LenNeg3M1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_LenNeg3M1_molar_amount_exp'] = self.physical_dimension_LenNeg3M1_molar_amount_exp
-        self.physical_dimension_LenNeg3M1_molar_amount_exp.text = '0'
-        self.physical_dimension_LenNeg3M1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_LenNeg3M1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_LenNeg3M1_luminous_intensity_exp'] = self.physical_dimension_LenNeg3M1_luminous_intensity_exp
-        self.physical_dimension_LenNeg3M1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_LenNeg3MNeg1Ti2I2 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_LenNeg3MNeg1Ti2I2'] = self.physical_dimension_LenNeg3MNeg1Ti2I2
-        self.physical_dimension_LenNeg3MNeg1Ti2I2_short_name = ET.SubElement(self.physical_dimension_LenNeg3MNeg1Ti2I2, 'SHORT-NAME')
-        self.variables['physical_dimension_LenNeg3MNeg1Ti2I2_short_name'] = self.physical_dimension_LenNeg3MNeg1Ti2I2_short_name
-        self.physical_dimension_LenNeg3MNeg1Ti2I2_short_name.text = 'LenNeg3MNeg1Ti2I2'
-        self.physical_dimension_LenNeg3MNeg1Ti2I2_long_name = ET.SubElement(self.physical_dimension_LenNeg3MNeg1Ti2I2, 'LONG-NAME')
-        self.variables['physical_dimension_LenNeg3MNeg1Ti2I2_long_name'] = self.physical_dimension_LenNeg3MNeg1Ti2I2_long_name
-        self.physical_dimension_LenNeg3MNeg1Ti2I2_l_4 = ET.SubElement(self.physical_dimension_LenNeg3MNeg1Ti2I2_long_name, 'L-4')
-        self.variables['physical_dimension_LenNeg3MNeg1Ti2I2_l_4'] = self.physical_dimension_LenNeg3MNeg1Ti2I2_l_4
-        self.physical_dimension_LenNeg3MNeg1Ti2I2_l_4.text = 'Electrical Conductivity Gradient'
-        self.physical_dimension_LenNeg3MNeg1Ti2I2_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_LenNeg3MNeg1Ti2I2_length_exp = ET.SubElement(self.physical_dimension_LenNeg3MNeg1Ti2I2, 'LENGTH-EXP')
-        self.variables['physical_dimension_LenNeg3MNeg1Ti2I2_length_exp'] = self.physical_dimension_LenNeg3MNeg1Ti2I2_length_exp
-        self.physical_dimension_LenNeg3MNeg1Ti2I2_length_exp.text = '-3'
-        self.physical_dimension_LenNeg3MNeg1Ti2I2_mass_exp = ET.SubElement(self.physical_dimension_LenNeg3MNeg1Ti2I2, 'MASS-EXP')
-        self.variables['physical_dimension_LenNeg3MNeg1Ti2I2_mass_exp'] = self.physical_dimension_LenNeg3MNeg1Ti2I2_mass_exp
-        self.physical_dimension_LenNeg3MNeg1Ti2I2_mass_exp.text = '-1'
-        self.physical_dimension_LenNeg3MNeg1Ti2I2_time_exp = ET.SubElement(self.physical_dimension_LenNeg3MNeg1Ti2I2, 'TIME-EXP')
-        self.variables['physical_dimension_LenNeg3MNeg1Ti2I2_time_exp'] = self.physical_dimension_LenNeg3MNeg1Ti2I2_time_exp
-        self.physical_dimension_LenNeg3MNeg1Ti2I2_time_exp.text = '2'
-        self.physical_dimension_LenNeg3MNeg1Ti2I2_current_exp = ET.SubElement(self.physical_dimension_LenNeg3MNeg1Ti2I2, 'CURRENT-EXP')
-        self.variables['physical_dimension_LenNeg3MNeg1Ti2I2_current_exp'] = self.physical_dimension_LenNeg3MNeg1Ti2I2_current_exp
-        self.physical_dimension_LenNeg3MNeg1Ti2I2_current_exp.text = '2'
-        self.physical_dimension_LenNeg3MNeg1Ti2I2_temperature_exp = ET.SubElement(self.physical_dimension_LenNeg3MNeg1Ti2I2, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_LenNeg3MNeg1Ti2I2_temperature_exp'] = self.physical_dimension_LenNeg3MNeg1Ti2I2_temperature_exp
-        self.physical_dimension_LenNeg3MNeg1Ti2I2_temperature_exp.text = '0'
-        self.physical_dimension_LenNeg3MNeg1Ti2I2_molar_amount_exp = ET.SubElement(self.physical_dimension_LenNeg3MNeg1Ti2I2, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_LenNeg3MNeg1Ti2I2_molar_amount_exp'] = self.physical_dimension_LenNeg3MNeg1Ti2I2_molar_amount_exp
-        self.physical_dimension_LenNeg3MNeg1Ti2I2_molar_amount_exp.text = '0'
-        self.physical_dimension_LenNeg3MNeg1Ti2I2_luminous_intensity_exp = ET.SubElement(self.physical_dimension_LenNeg3MNeg1Ti2I2, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_LenNeg3MNeg1Ti2I2_luminous_intensity_exp'] = self.physical_dimension_LenNeg3MNeg1Ti2I2_luminous_intensity_exp
-        self.physical_dimension_LenNeg3MNeg1Ti2I2_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_LenNeg3MNeg1Ti3I2 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_LenNeg3MNeg1Ti3I2'] = self.physical_dimension_LenNeg3MNeg1Ti3I2
-        self.physical_dimension_LenNeg3MNeg1Ti3I2_short_name = ET.SubElement(self.physical_dimension_LenNeg3MNeg1Ti3I2, 'SHORT-NAME')
-        self.variables['physical_dimension_LenNeg3MNeg1Ti3I2_short_name'] = self.physical_dimension_LenNeg3MNeg1Ti3I2_short_name
-        self.physical_dimension_LenNeg3MNeg1Ti3I2_short_name.text = 'LenNeg3MNeg1Ti3I2'
-        self.physical_dimension_LenNeg3MNeg1Ti3I2_long_name = ET.SubElement(self.physical_dimension_LenNeg3MNeg1Ti3I2, 'LONG-NAME')
-        self.variables['physical_dimension_LenNeg3MNeg1Ti3I2_long_name'] = self.physical_dimension_LenNeg3MNeg1Ti3I2_long_name
-        self.physical_dimension_LenNeg3MNeg1Ti3I2_l_4 = ET.SubElement(self.physical_dimension_LenNeg3MNeg1Ti3I2_long_name, 'L-4')
-        self.variables['physical_dimension_LenNeg3MNeg1Ti3I2_l_4'] = self.physical_dimension_LenNeg3MNeg1Ti3I2_l_4
-        self.physical_dimension_LenNeg3MNeg1Ti3I2_l_4.text = 'Electrical Conductivity'
-        self.physical_dimension_LenNeg3MNeg1Ti3I2_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_LenNeg3MNeg1Ti3I2_length_exp = ET.SubElement(self.physical_dimension_LenNeg3MNeg1Ti3I2, 'LENGTH-EXP')
-        self.variables['physical_dimension_LenNeg3MNeg1Ti3I2_length_exp'] = self.physical_dimension_LenNeg3MNeg1Ti3I2_length_exp
-        self.physical_dimension_LenNeg3MNeg1Ti3I2_length_exp.text = '-3'
-        self.physical_dimension_LenNeg3MNeg1Ti3I2_mass_exp = ET.SubElement(self.physical_dimension_LenNeg3MNeg1Ti3I2, 'MASS-EXP')
-        self.variables['physical_dimension_LenNeg3MNeg1Ti3I2_mass_exp'] = self.physical_dimension_LenNeg3MNeg1Ti3I2_mass_exp
-        self.physical_dimension_LenNeg3MNeg1Ti3I2_mass_exp.text = '-1'
-        self.physical_dimension_LenNeg3MNeg1Ti3I2_time_exp = ET.SubElement(self.physical_dimension_LenNeg3MNeg1Ti3I2, 'TIME-EXP')
-        self.variables['physical_dimension_LenNeg3MNeg1Ti3I2_time_exp'] = self.physical_dimension_LenNeg3MNeg1Ti3I2_time_exp
-        self.physical_dimension_LenNeg3MNeg1Ti3I2_time_exp.text = '3'
-        self.physical_dimension_LenNeg3MNeg1Ti3I2_current_exp = ET.SubElement(self.physical_dimension_LenNeg3MNeg1Ti3I2, 'CURRENT-EXP')
-        self.variables['physical_dimension_LenNeg3MNeg1Ti3I2_current_exp'] = self.physical_dimension_LenNeg3MNeg1Ti3I2_current_exp
-        self.physical_dimension_LenNeg3MNeg1Ti3I2_current_exp.text = '2'
-        self.physical_dimension_LenNeg3MNeg1Ti3I2_temperature_exp = ET.SubElement(self.physical_dimension_LenNeg3MNeg1Ti3I2, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_LenNeg3MNeg1Ti3I2_temperature_exp'] = self.physical_dimension_LenNeg3MNeg1Ti3I2_temperature_exp
-        self.physical_dimension_LenNeg3MNeg1Ti3I2_temperature_exp.text = '0'
-        self.physical_dimension_LenNeg3MNeg1Ti3I2_molar_amount_exp = ET.SubElement(self.physical_dimension_LenNeg3MNeg1Ti3I2, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_LenNeg3MNeg1Ti3I2_molar_amount_exp'] = self.physical_dimension_LenNeg3MNeg1Ti3I2_molar_amount_exp
-        self.physical_dimension_LenNeg3MNeg1Ti3I2_molar_amount_exp.text = '0'
-        self.physical_dimension_LenNeg3MNeg1Ti3I2_luminous_intensity_exp = ET.SubElement(self.physical_dimension_LenNeg3MNeg1Ti3I2, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_LenNeg3MNeg1Ti3I2_luminous_intensity_exp'] = self.physical_dimension_LenNeg3MNeg1Ti3I2_luminous_intensity_exp
-        self.physical_dimension_LenNeg3MNeg1Ti3I2_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_LenNeg3Ti1I1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_LenNeg3Ti1I1'] = self.physical_dimension_LenNeg3Ti1I1
-        self.physical_dimension_LenNeg3Ti1I1_short_name = ET.SubElement(self.physical_dimension_LenNeg3Ti1I1, 'SHORT-NAME')
-        self.variables['physical_dimension_LenNeg3Ti1I1_short_name'] = self.physical_dimension_LenNeg3Ti1I1_short_name
-        self.physical_dimension_LenNeg3Ti1I1_short_name.text = 'LenNeg3Ti1I1'
-        self.physical_dimension_LenNeg3Ti1I1_long_name = ET.SubElement(self.physical_dimension_LenNeg3Ti1I1, 'LONG-NAME')
-        self.variables['physical_dimension_LenNeg3Ti1I1_long_name'] = self.physical_dimension_LenNeg3Ti1I1_long_name
-        self.physical_dimension_LenNeg3Ti1I1_l_4 = ET.SubElement(self.physical_dimension_LenNeg3Ti1I1_long_name, 'L-4')
-        self.variables['physical_dimension_LenNeg3Ti1I1_l_4'] = self.physical_dimension_LenNeg3Ti1I1_l_4
-        self.physical_dimension_LenNeg3Ti1I1_l_4.text = 'Electric Charge Density'
-        self.physical_dimension_LenNeg3Ti1I1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_LenNeg3Ti1I1_length_exp = ET.SubElement(self.physical_dimension_LenNeg3Ti1I1, 'LENGTH-EXP')
-        self.variables['physical_dimension_LenNeg3Ti1I1_length_exp'] = self.physical_dimension_LenNeg3Ti1I1_length_exp
-        self.physical_dimension_LenNeg3Ti1I1_length_exp.text = '-3'
-        self.physical_dimension_LenNeg3Ti1I1_mass_exp = ET.SubElement(self.physical_dimension_LenNeg3Ti1I1, 'MASS-EXP')
-        self.variables['physical_dimension_LenNeg3Ti1I1_mass_exp'] = self.physical_dimension_LenNeg3Ti1I1_mass_exp
-        self.physical_dimension_LenNeg3Ti1I1_mass_exp.text = '0'
-        self.physical_dimension_LenNeg3Ti1I1_time_exp = ET.SubElement(self.physical_dimension_LenNeg3Ti1I1, 'TIME-EXP')
-        self.variables['physical_dimension_LenNeg3Ti1I1_time_exp'] = self.physical_dimension_LenNeg3Ti1I1_time_exp
-        self.physical_dimension_LenNeg3Ti1I1_time_exp.text = '1'
-        self.physical_dimension_LenNeg3Ti1I1_current_exp = ET.SubElement(self.physical_dimension_LenNeg3Ti1I1, 'CURRENT-EXP')
-        self.variables['physical_dimension_LenNeg3Ti1I1_current_exp'] = self.physical_dimension_LenNeg3Ti1I1_current_exp
-        self.physical_dimension_LenNeg3Ti1I1_current_exp.text = '1'
-        self.physical_dimension_LenNeg3Ti1I1_temperature_exp = ET.SubElement(self.physical_dimension_LenNeg3Ti1I1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_LenNeg3Ti1I1_temperature_exp'] = self.physical_dimension_LenNeg3Ti1I1_temperature_exp
-        self.physical_dimension_LenNeg3Ti1I1_temperature_exp.text = '0'
-        self.physical_dimension_LenNeg3Ti1I1_molar_amount_exp = ET.SubElement(self.physical_dimension_LenNeg3Ti1I1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_LenNeg3Ti1I1_molar_amount_exp'] = self.physical_dimension_LenNeg3Ti1I1_molar_amount_exp
-        self.physical_dimension_LenNeg3Ti1I1_molar_amount_exp.text = '0'
-        self.physical_dimension_LenNeg3Ti1I1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_LenNeg3Ti1I1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_LenNeg3Ti1I1_luminous_intensity_exp'] = self.physical_dimension_LenNeg3Ti1I1_luminous_intensity_exp
-        self.physical_dimension_LenNeg3Ti1I1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_LenNeg3Ti1I1_1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_LenNeg3Ti1I1_1'] = self.physical_dimension_LenNeg3Ti1I1_1
-        self.physical_dimension_LenNeg3Ti1I1_1_short_name = ET.SubElement(self.physical_dimension_LenNeg3Ti1I1_1, 'SHORT-NAME')
-        self.variables['physical_dimension_LenNeg3Ti1I1_1_short_name'] = self.physical_dimension_LenNeg3Ti1I1_1_short_name
-        self.physical_dimension_LenNeg3Ti1I1_1_short_name.text = 'LenNeg3Ti1I1_1'
-        self.physical_dimension_LenNeg3Ti1I1_1_long_name = ET.SubElement(self.physical_dimension_LenNeg3Ti1I1_1, 'LONG-NAME')
-        self.variables['physical_dimension_LenNeg3Ti1I1_1_long_name'] = self.physical_dimension_LenNeg3Ti1I1_1_long_name
-        self.physical_dimension_LenNeg3Ti1I1_1_l_4 = ET.SubElement(self.physical_dimension_LenNeg3Ti1I1_1_long_name, 'L-4')
-        self.variables['physical_dimension_LenNeg3Ti1I1_1_l_4'] = self.physical_dimension_LenNeg3Ti1I1_1_l_4
-        self.physical_dimension_LenNeg3Ti1I1_1_l_4.text = 'Pressure per Voltage'
-        self.physical_dimension_LenNeg3Ti1I1_1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_LenNeg3Ti1I1_1_length_exp = ET.SubElement(self.physical_dimension_LenNeg3Ti1I1_1, 'LENGTH-EXP')
-        self.variables['physical_dimension_LenNeg3Ti1I1_1_length_exp'] = self.physical_dimension_LenNeg3Ti1I1_1_length_exp
-        self.physical_dimension_LenNeg3Ti1I1_1_length_exp.text = '-3'
-        self.physical_dimension_LenNeg3Ti1I1_1_mass_exp = ET.SubElement(self.physical_dimension_LenNeg3Ti1I1_1, 'MASS-EXP')
-        self.variables['physical_dimension_LenNeg3Ti1I1_1_mass_exp'] = self.physical_dimension_LenNeg3Ti1I1_1_mass_exp
-        self.physical_dimension_LenNeg3Ti1I1_1_mass_exp.text = '0'
-        self.physical_dimension_LenNeg3Ti1I1_1_time_exp = ET.SubElement(self.physical_dimension_LenNeg3Ti1I1_1, 'TIME-EXP')
-        self.variables['physical_dimension_LenNeg3Ti1I1_1_time_exp'] = self.physical_dimension_LenNeg3Ti1I1_1_time_exp
-        self.physical_dimension_LenNeg3Ti1I1_1_time_exp.text = '1'
-        self.physical_dimension_LenNeg3Ti1I1_1_current_exp = ET.SubElement(self.physical_dimension_LenNeg3Ti1I1_1, 'CURRENT-EXP')
-        self.variables['physical_dimension_LenNeg3Ti1I1_1_current_exp'] = self.physical_dimension_LenNeg3Ti1I1_1_current_exp
-        self.physical_dimension_LenNeg3Ti1I1_1_current_exp.text = '1'
-        self.physical_dimension_LenNeg3Ti1I1_1_temperature_exp = ET.SubElement(self.physical_dimension_LenNeg3Ti1I1_1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_LenNeg3Ti1I1_1_temperature_exp'] = self.physical_dimension_LenNeg3Ti1I1_1_temperature_exp
-        self.physical_dimension_LenNeg3Ti1I1_1_temperature_exp.text = '0'
-        self.physical_dimension_LenNeg3Ti1I1_1_molar_amount_exp = ET.SubElement(self.physical_dimension_LenNeg3Ti1I1_1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_LenNeg3Ti1I1_1_molar_amount_exp'] = self.physical_dimension_LenNeg3Ti1I1_1_molar_amount_exp
-        self.physical_dimension_LenNeg3Ti1I1_1_molar_amount_exp.text = '0'
-        self.physical_dimension_LenNeg3Ti1I1_1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_LenNeg3Ti1I1_1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_LenNeg3Ti1I1_1_luminous_intensity_exp'] = self.physical_dimension_LenNeg3Ti1I1_1_luminous_intensity_exp
-        self.physical_dimension_LenNeg3Ti1I1_1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_LenNeg3TiNeg1Amnt1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_LenNeg3TiNeg1Amnt1'] = self.physical_dimension_LenNeg3TiNeg1Amnt1
-        self.physical_dimension_LenNeg3TiNeg1Amnt1_short_name = ET.SubElement(self.physical_dimension_LenNeg3TiNeg1Amnt1, 'SHORT-NAME')
-        self.variables['physical_dimension_LenNeg3TiNeg1Amnt1_short_name'] = self.physical_dimension_LenNeg3TiNeg1Amnt1_short_name
-        self.physical_dimension_LenNeg3TiNeg1Amnt1_short_name.text = 'LenNeg3TiNeg1Amnt1'
-        self.physical_dimension_LenNeg3TiNeg1Amnt1_long_name = ET.SubElement(self.physical_dimension_LenNeg3TiNeg1Amnt1, 'LONG-NAME')
-        self.variables['physical_dimension_LenNeg3TiNeg1Amnt1_long_name'] = self.physical_dimension_LenNeg3TiNeg1Amnt1_long_name
-        self.physical_dimension_LenNeg3TiNeg1Amnt1_l_4 = ET.SubElement(self.physical_dimension_LenNeg3TiNeg1Amnt1_long_name, 'L-4')
-        self.variables['physical_dimension_LenNeg3TiNeg1Amnt1_l_4'] = self.physical_dimension_LenNeg3TiNeg1Amnt1_l_4
-        self.physical_dimension_LenNeg3TiNeg1Amnt1_l_4.text = 'Reaction Rate'
-        self.physical_dimension_LenNeg3TiNeg1Amnt1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_LenNeg3TiNeg1Amnt1_length_exp = ET.SubElement(self.physical_dimension_LenNeg3TiNeg1Amnt1, 'LENGTH-EXP')
-        self.variables['physical_dimension_LenNeg3TiNeg1Amnt1_length_exp'] = self.physical_dimension_LenNeg3TiNeg1Amnt1_length_exp
-        self.physical_dimension_LenNeg3TiNeg1Amnt1_length_exp.text = '-3'
-        self.physical_dimension_LenNeg3TiNeg1Amnt1_mass_exp = ET.SubElement(self.physical_dimension_LenNeg3TiNeg1Amnt1, 'MASS-EXP')
-        self.variables['physical_dimension_LenNeg3TiNeg1Amnt1_mass_exp'] = self.physical_dimension_LenNeg3TiNeg1Amnt1_mass_exp
-        self.physical_dimension_LenNeg3TiNeg1Amnt1_mass_exp.text = '0'
-        self.physical_dimension_LenNeg3TiNeg1Amnt1_time_exp = ET.SubElement(self.physical_dimension_LenNeg3TiNeg1Amnt1, 'TIME-EXP')
-        self.variables['physical_dimension_LenNeg3TiNeg1Amnt1_time_exp'] = self.physical_dimension_LenNeg3TiNeg1Amnt1_time_exp
-        self.physical_dimension_LenNeg3TiNeg1Amnt1_time_exp.text = '-1'
-        self.physical_dimension_LenNeg3TiNeg1Amnt1_current_exp = ET.SubElement(self.physical_dimension_LenNeg3TiNeg1Amnt1, 'CURRENT-EXP')
-        self.variables['physical_dimension_LenNeg3TiNeg1Amnt1_current_exp'] = self.physical_dimension_LenNeg3TiNeg1Amnt1_current_exp
-        self.physical_dimension_LenNeg3TiNeg1Amnt1_current_exp.text = '0'
-        self.physical_dimension_LenNeg3TiNeg1Amnt1_temperature_exp = ET.SubElement(self.physical_dimension_LenNeg3TiNeg1Amnt1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_LenNeg3TiNeg1Amnt1_temperature_exp'] = self.physical_dimension_LenNeg3TiNeg1Amnt1_temperature_exp
-        self.physical_dimension_LenNeg3TiNeg1Amnt1_temperature_exp.text = '0'
-        self.physical_dimension_LenNeg3TiNeg1Amnt1_molar_amount_exp = ET.SubElement(self.physical_dimension_LenNeg3TiNeg1Amnt1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_LenNeg3TiNeg1Amnt1_molar_amount_exp'] = self.physical_dimension_LenNeg3TiNeg1Amnt1_molar_amount_exp
-        self.physical_dimension_LenNeg3TiNeg1Amnt1_molar_amount_exp.text = '1'
-        self.physical_dimension_LenNeg3TiNeg1Amnt1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_LenNeg3TiNeg1Amnt1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_LenNeg3TiNeg1Amnt1_luminous_intensity_exp'] = self.physical_dimension_LenNeg3TiNeg1Amnt1_luminous_intensity_exp
-        self.physical_dimension_LenNeg3TiNeg1Amnt1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_LenNeg4M1TiNeg1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_LenNeg4M1TiNeg1'] = self.physical_dimension_LenNeg4M1TiNeg1
-        self.physical_dimension_LenNeg4M1TiNeg1_short_name = ET.SubElement(self.physical_dimension_LenNeg4M1TiNeg1, 'SHORT-NAME')
-        self.variables['physical_dimension_LenNeg4M1TiNeg1_short_name'] = self.physical_dimension_LenNeg4M1TiNeg1_short_name
-        self.physical_dimension_LenNeg4M1TiNeg1_short_name.text = 'LenNeg4M1TiNeg1'
-        self.physical_dimension_LenNeg4M1TiNeg1_long_name = ET.SubElement(self.physical_dimension_LenNeg4M1TiNeg1, 'LONG-NAME')
-        self.variables['physical_dimension_LenNeg4M1TiNeg1_long_name'] = self.physical_dimension_LenNeg4M1TiNeg1_long_name
-        self.physical_dimension_LenNeg4M1TiNeg1_l_4 = ET.SubElement(self.physical_dimension_LenNeg4M1TiNeg1_long_name, 'L-4')
-        self.variables['physical_dimension_LenNeg4M1TiNeg1_l_4'] = self.physical_dimension_LenNeg4M1TiNeg1_l_4
-        self.physical_dimension_LenNeg4M1TiNeg1_l_4.text = 'Pressure per Volumetric Flow / Flow Resistance'
-        self.physical_dimension_LenNeg4M1TiNeg1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_LenNeg4M1TiNeg1_length_exp = ET.SubElement(self.physical_dimension_LenNeg4M1TiNeg1, 'LENGTH-EXP')
-        self.variables['physical_dimension_LenNeg4M1TiNeg1_length_exp'] = self.physical_dimension_LenNeg4M1TiNeg1_length_exp
-        self.physical_dimension_LenNeg4M1TiNeg1_length_exp.text = '-4'
-        self.physical_dimension_LenNeg4M1TiNeg1_mass_exp = ET.SubElement(self.physical_dimension_LenNeg4M1TiNeg1, 'MASS-EXP')
-        self.variables['physical_dimension_LenNeg4M1TiNeg1_mass_exp'] = self.physical_dimension_LenNeg4M1TiNeg1_mass_exp
-        self.physical_dimension_LenNeg4M1TiNeg1_mass_exp.text = '1'
-        self.physical_dimension_LenNeg4M1TiNeg1_time_exp = ET.SubElement(self.physical_dimension_LenNeg4M1TiNeg1, 'TIME-EXP')
-        self.variables['physical_dimension_LenNeg4M1TiNeg1_time_exp'] = self.physical_dimension_LenNeg4M1TiNeg1_time_exp
-        self.physical_dimension_LenNeg4M1TiNeg1_time_exp.text = '-1'
-        self.physical_dimension_LenNeg4M1TiNeg1_current_exp = ET.SubElement(self.physical_dimension_LenNeg4M1TiNeg1, 'CURRENT-EXP')
-        self.variables['physical_dimension_LenNeg4M1TiNeg1_current_exp'] = self.physical_dimension_LenNeg4M1TiNeg1_current_exp
-        self.physical_dimension_LenNeg4M1TiNeg1_current_exp.text = '0'
-        self.physical_dimension_LenNeg4M1TiNeg1_temperature_exp = ET.SubElement(self.physical_dimension_LenNeg4M1TiNeg1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_LenNeg4M1TiNeg1_temperature_exp'] = self.physical_dimension_LenNeg4M1TiNeg1_temperature_exp
-        self.physical_dimension_LenNeg4M1TiNeg1_temperature_exp.text = '0'
-        self.physical_dimension_LenNeg4M1TiNeg1_molar_amount_exp = ET.SubElement(self.physical_dimension_LenNeg4M1TiNeg1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_LenNeg4M1TiNeg1_molar_amount_exp'] = self.physical_dimension_LenNeg4M1TiNeg1_molar_amount_exp
-        self.physical_dimension_LenNeg4M1TiNeg1_molar_amount_exp.text = '0'
-        self.physical_dimension_LenNeg4M1TiNeg1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_LenNeg4M1TiNeg1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_LenNeg4M1TiNeg1_luminous_intensity_exp'] = self.physical_dimension_LenNeg4M1TiNeg1_luminous_intensity_exp
-        self.physical_dimension_LenNeg4M1TiNeg1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_M1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_M1'] = self.physical_dimension_M1
-        self.physical_dimension_M1_short_name = ET.SubElement(self.physical_dimension_M1, 'SHORT-NAME')
-        self.variables['physical_dimension_M1_short_name'] = self.physical_dimension_M1_short_name
-        self.physical_dimension_M1_short_name.text = 'M1'
-        self.physical_dimension_M1_long_name = ET.SubElement(self.physical_dimension_M1, 'LONG-NAME')
-        self.variables['physical_dimension_M1_long_name'] = self.physical_dimension_M1_long_name
-        self.physical_dimension_M1_l_4 = ET.SubElement(self.physical_dimension_M1_long_name, 'L-4')
-        self.variables['physical_dimension_M1_l_4'] = self.physical_dimension_M1_l_4
-        self.physical_dimension_M1_l_4.text = 'Mass'
-        self.physical_dimension_M1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_M1_length_exp = ET.SubElement(self.physical_dimension_M1, 'LENGTH-EXP')
-        self.variables['physical_dimension_M1_length_exp'] = self.physical_dimension_M1_length_exp
-        self.physical_dimension_M1_length_exp.text = '0'
-        self.physical_dimension_M1_mass_exp = ET.SubElement(self.physical_dimension_M1, 'MASS-EXP')
-        self.variables['physical_dimension_M1_mass_exp'] = self.physical_dimension_M1_mass_exp
-        self.physical_dimension_M1_mass_exp.text = '1'
-        self.physical_dimension_M1_time_exp = ET.SubElement(self.physical_dimension_M1, 'TIME-EXP')
-        self.variables['physical_dimension_M1_time_exp'] = self.physical_dimension_M1_time_exp
-        self.physical_dimension_M1_time_exp.text = '0'
-        self.physical_dimension_M1_current_exp = ET.SubElement(self.physical_dimension_M1, 'CURRENT-EXP')
-        self.variables['physical_dimension_M1_current_exp'] = self.physical_dimension_M1_current_exp
-        self.physical_dimension_M1_current_exp.text = '0'
-        self.physical_dimension_M1_temperature_exp = ET.SubElement(self.physical_dimension_M1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_M1_temperature_exp'] = self.physical_dimension_M1_temperature_exp
-        self.physical_dimension_M1_temperature_exp.text = '0'
-        self.physical_dimension_M1_molar_amount_exp = ET.SubElement(self.physical_dimension_M1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_M1_molar_amount_exp'] = self.physical_dimension_M1_molar_amount_exp
-        self.physical_dimension_M1_molar_amount_exp.text = '0'
-        self.physical_dimension_M1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_M1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_M1_luminous_intensity_exp'] = self.physical_dimension_M1_luminous_intensity_exp
-        self.physical_dimension_M1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_M1AmntNeg1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_M1AmntNeg1'] = self.physical_dimension_M1AmntNeg1
-        self.physical_dimension_M1AmntNeg1_short_name = ET.SubElement(self.physical_dimension_M1AmntNeg1, 'SHORT-NAME')
-        self.variables['physical_dimension_M1AmntNeg1_short_name'] = self.physical_dimension_M1AmntNeg1_short_name
-        self.physical_dimension_M1AmntNeg1_short_name.text = 'M1AmntNeg1'
-        self.physical_dimension_M1AmntNeg1_long_name = ET.SubElement(self.physical_dimension_M1AmntNeg1, 'LONG-NAME')
-        self.variables['physical_dimension_M1AmntNeg1_long_name'] = self.physical_dimension_M1AmntNeg1_long_name
-        self.physical_dimension_M1AmntNeg1_l_4 = ET.SubElement(self.physical_dimension_M1AmntNeg1_long_name, 'L-4')
-        self.variables['physical_dimension_M1AmntNeg1_l_4'] = self.physical_dimension_M1AmntNeg1_l_4
-        self.physical_dimension_M1AmntNeg1_l_4.text = 'Molar Mass'
-        self.physical_dimension_M1AmntNeg1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_M1AmntNeg1_length_exp = ET.SubElement(self.physical_dimension_M1AmntNeg1, 'LENGTH-EXP')
-        self.variables['physical_dimension_M1AmntNeg1_length_exp'] = self.physical_dimension_M1AmntNeg1_length_exp
-        self.physical_dimension_M1AmntNeg1_length_exp.text = '0'
-        self.physical_dimension_M1AmntNeg1_mass_exp = ET.SubElement(self.physical_dimension_M1AmntNeg1, 'MASS-EXP')
-        self.variables['physical_dimension_M1AmntNeg1_mass_exp'] = self.physical_dimension_M1AmntNeg1_mass_exp
-        self.physical_dimension_M1AmntNeg1_mass_exp.text = '1'
-        self.physical_dimension_M1AmntNeg1_time_exp = ET.SubElement(self.physical_dimension_M1AmntNeg1, 'TIME-EXP')
-        self.variables['physical_dimension_M1AmntNeg1_time_exp'] = self.physical_dimension_M1AmntNeg1_time_exp
-        self.physical_dimension_M1AmntNeg1_time_exp.text = '0'
-        self.physical_dimension_M1AmntNeg1_current_exp = ET.SubElement(self.physical_dimension_M1AmntNeg1, 'CURRENT-EXP')
-        self.variables['physical_dimension_M1AmntNeg1_current_exp'] = self.physical_dimension_M1AmntNeg1_current_exp
-        self.physical_dimension_M1AmntNeg1_current_exp.text = '0'
-        self.physical_dimension_M1AmntNeg1_temperature_exp = ET.SubElement(self.physical_dimension_M1AmntNeg1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_M1AmntNeg1_temperature_exp'] = self.physical_dimension_M1AmntNeg1_temperature_exp
-        self.physical_dimension_M1AmntNeg1_temperature_exp.text = '0'
-        self.physical_dimension_M1AmntNeg1_molar_amount_exp = ET.SubElement(self.physical_dimension_M1AmntNeg1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_M1AmntNeg1_molar_amount_exp'] = self.physical_dimension_M1AmntNeg1_molar_amount_exp
-        self.physical_dimension_M1AmntNeg1_molar_amount_exp.text = '-1'
-        self.physical_dimension_M1AmntNeg1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_M1AmntNeg1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_M1AmntNeg1_luminous_intensity_exp'] = self.physical_dimension_M1AmntNeg1_luminous_intensity_exp
-        self.physical_dimension_M1AmntNeg1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_M1TiNeg1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_M1TiNeg1'] = self.physical_dimension_M1TiNeg1
-        self.physical_dimension_M1TiNeg1_short_name = ET.SubElement(self.physical_dimension_M1TiNeg1, 'SHORT-NAME')
-        self.variables['physical_dimension_M1TiNeg1_short_name'] = self.physical_dimension_M1TiNeg1_short_name
-        self.physical_dimension_M1TiNeg1_short_name.text = 'M1TiNeg1'
-        self.physical_dimension_M1TiNeg1_long_name = ET.SubElement(self.physical_dimension_M1TiNeg1, 'LONG-NAME')
-        self.variables['physical_dimension_M1TiNeg1_long_name'] = self.physical_dimension_M1TiNeg1_long_name
-        self.physical_dimension_M1TiNeg1_l_4 = ET.SubElement(self.physical_dimension_M1TiNeg1_long_name, 'L-4')
-        self.variables['physical_dimension_M1TiNeg1_l_4'] = self.physical_dimension_M1TiNeg1_l_4
-        self.physical_dimension_M1TiNeg1_l_4.text = 'Mass Flow'
-        self.physical_dimension_M1TiNeg1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_M1TiNeg1_length_exp = ET.SubElement(self.physical_dimension_M1TiNeg1, 'LENGTH-EXP')
-        self.variables['physical_dimension_M1TiNeg1_length_exp'] = self.physical_dimension_M1TiNeg1_length_exp
-        self.physical_dimension_M1TiNeg1_length_exp.text = '0'
-        self.physical_dimension_M1TiNeg1_mass_exp = ET.SubElement(self.physical_dimension_M1TiNeg1, 'MASS-EXP')
-        self.variables['physical_dimension_M1TiNeg1_mass_exp'] = self.physical_dimension_M1TiNeg1_mass_exp
-        self.physical_dimension_M1TiNeg1_mass_exp.text = '1'
-        self.physical_dimension_M1TiNeg1_time_exp = ET.SubElement(self.physical_dimension_M1TiNeg1, 'TIME-EXP')
-        self.variables['physical_dimension_M1TiNeg1_time_exp'] = self.physical_dimension_M1TiNeg1_time_exp
-        self.physical_dimension_M1TiNeg1_time_exp.text = '-1'
-        self.physical_dimension_M1TiNeg1_current_exp = ET.SubElement(self.physical_dimension_M1TiNeg1, 'CURRENT-EXP')
-        self.variables['physical_dimension_M1TiNeg1_current_exp'] = self.physical_dimension_M1TiNeg1_current_exp
-        self.physical_dimension_M1TiNeg1_current_exp.text = '0'
-        self.physical_dimension_M1TiNeg1_temperature_exp = ET.SubElement(self.physical_dimension_M1TiNeg1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_M1TiNeg1_temperature_exp'] = self.physical_dimension_M1TiNeg1_temperature_exp
-        self.physical_dimension_M1TiNeg1_temperature_exp.text = '0'
-        self.physical_dimension_M1TiNeg1_molar_amount_exp = ET.SubElement(self.physical_dimension_M1TiNeg1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_M1TiNeg1_molar_amount_exp'] = self.physical_dimension_M1TiNeg1_molar_amount_exp
-        self.physical_dimension_M1TiNeg1_molar_amount_exp.text = '0'
-        self.physical_dimension_M1TiNeg1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_M1TiNeg1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_M1TiNeg1_luminous_intensity_exp'] = self.physical_dimension_M1TiNeg1_luminous_intensity_exp
-        self.physical_dimension_M1TiNeg1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_M1TiNeg1_1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_M1TiNeg1_1'] = self.physical_dimension_M1TiNeg1_1
-        self.physical_dimension_M1TiNeg1_1_short_name = ET.SubElement(self.physical_dimension_M1TiNeg1_1, 'SHORT-NAME')
-        self.variables['physical_dimension_M1TiNeg1_1_short_name'] = self.physical_dimension_M1TiNeg1_1_short_name
-        self.physical_dimension_M1TiNeg1_1_short_name.text = 'M1TiNeg1_1'
-        self.physical_dimension_M1TiNeg1_1_long_name = ET.SubElement(self.physical_dimension_M1TiNeg1_1, 'LONG-NAME')
-        self.variables['physical_dimension_M1TiNeg1_1_long_name'] = self.physical_dimension_M1TiNeg1_1_long_name
-        self.physical_dimension_M1TiNeg1_1_l_4 = ET.SubElement(self.physical_dimension_M1TiNeg1_1_long_name, 'L-4')
-        self.variables['physical_dimension_M1TiNeg1_1_l_4'] = self.physical_dimension_M1TiNeg1_1_l_4
-        self.physical_dimension_M1TiNeg1_1_l_4.text = 'Translational Dumping'
-        self.physical_dimension_M1TiNeg1_1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_M1TiNeg1_1_length_exp = ET.SubElement(self.physical_dimension_M1TiNeg1_1, 'LENGTH-EXP')
-        self.variables['physical_dimension_M1TiNeg1_1_length_exp'] = self.physical_dimension_M1TiNeg1_1_length_exp
-        self.physical_dimension_M1TiNeg1_1_length_exp.text = '0'
-        self.physical_dimension_M1TiNeg1_1_mass_exp = ET.SubElement(self.physical_dimension_M1TiNeg1_1, 'MASS-EXP')
-        self.variables['physical_dimension_M1TiNeg1_1_mass_exp'] = self.physical_dimension_M1TiNeg1_1_mass_exp
-        self.physical_dimension_M1TiNeg1_1_mass_exp.text = '1'
-        self.physical_dimension_M1TiNeg1_1_time_exp = ET.SubElement(self.physical_dimension_M1TiNeg1_1, 'TIME-EXP')
-        self.variables['physical_dimension_M1TiNeg1_1_time_exp'] = self.physical_dimension_M1TiNeg1_1_time_exp
-        self.physical_dimension_M1TiNeg1_1_time_exp.text = '-1'
-        self.physical_dimension_M1TiNeg1_1_current_exp = ET.SubElement(self.physical_dimension_M1TiNeg1_1, 'CURRENT-EXP')
-        self.variables['physical_dimension_M1TiNeg1_1_current_exp'] = self.physical_dimension_M1TiNeg1_1_current_exp
-        self.physical_dimension_M1TiNeg1_1_current_exp.text = '0'
-        self.physical_dimension_M1TiNeg1_1_temperature_exp = ET.SubElement(self.physical_dimension_M1TiNeg1_1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_M1TiNeg1_1_temperature_exp'] = self.physical_dimension_M1TiNeg1_1_temperature_exp
-        self.physical_dimension_M1TiNeg1_1_temperature_exp.text = '0'
-        self.physical_dimension_M1TiNeg1_1_molar_amount_exp = ET.SubElement(self.physical_dimension_M1TiNeg1_1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_M1TiNeg1_1_molar_amount_exp'] = self.physical_dimension_M1TiNeg1_1_molar_amount_exp
-        self.physical_dimension_M1TiNeg1_1_molar_amount_exp.text = '0'
-        self.physical_dimension_M1TiNeg1_1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_M1TiNeg1_1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_M1TiNeg1_1_luminous_intensity_exp'] = self.physical_dimension_M1TiNeg1_1_luminous_intensity_exp
-        self.physical_dimension_M1TiNeg1_1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_M1TiNeg2 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_M1TiNeg2'] = self.physical_dimension_M1TiNeg2
-        self.physical_dimension_M1TiNeg2_short_name = ET.SubElement(self.physical_dimension_M1TiNeg2, 'SHORT-NAME')
-        self.variables['physical_dimension_M1TiNeg2_short_name'] = self.physical_dimension_M1TiNeg2_short_name
-        self.physical_dimension_M1TiNeg2_short_name.text = 'M1TiNeg2'
-        self.physical_dimension_M1TiNeg2_long_name = ET.SubElement(self.physical_dimension_M1TiNeg2, 'LONG-NAME')
-        self.variables['physical_dimension_M1TiNeg2_long_name'] = self.physical_dimension_M1TiNeg2_long_name
-        self.physical_dimension_M1TiNeg2_l_4 = ET.SubElement(self.physical_dimension_M1TiNeg2_long_name, 'L-4')
-        self.variables['physical_dimension_M1TiNeg2_l_4'] = self.physical_dimension_M1TiNeg2_l_4
-        self.physical_dimension_M1TiNeg2_l_4.text = 'Surface Tension'
-        self.physical_dimension_M1TiNeg2_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_M1TiNeg2_length_exp = ET.SubElement(self.physical_dimension_M1TiNeg2, 'LENGTH-EXP')
-        self.variables['physical_dimension_M1TiNeg2_length_exp'] = self.physical_dimension_M1TiNeg2_length_exp
-        self.physical_dimension_M1TiNeg2_length_exp.text = '0'
-        self.physical_dimension_M1TiNeg2_mass_exp = ET.SubElement(self.physical_dimension_M1TiNeg2, 'MASS-EXP')
-        self.variables['physical_dimension_M1TiNeg2_mass_exp'] = self.physical_dimension_M1TiNeg2_mass_exp
-        self.physical_dimension_M1TiNeg2_mass_exp.text = '1'
-        self.physical_dimension_M1TiNeg2_time_exp = ET.SubElement(self.physical_dimension_M1TiNeg2, 'TIME-EXP')
-        self.variables['physical_dimension_M1TiNeg2_time_exp'] = self.physical_dimension_M1TiNeg2_time_exp
-        self.physical_dimension_M1TiNeg2_time_exp.text = '-2'
-        self.physical_dimension_M1TiNeg2_current_exp = ET.SubElement(self.physical_dimension_M1TiNeg2, 'CURRENT-EXP')
-        self.variables['physical_dimension_M1TiNeg2_current_exp'] = self.physical_dimension_M1TiNeg2_current_exp
-        self.physical_dimension_M1TiNeg2_current_exp.text = '0'
-        self.physical_dimension_M1TiNeg2_temperature_exp = ET.SubElement(self.physical_dimension_M1TiNeg2, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_M1TiNeg2_temperature_exp'] = self.physical_dimension_M1TiNeg2_temperature_exp
-        self.physical_dimension_M1TiNeg2_temperature_exp.text = '0'
-        self.physical_dimension_M1TiNeg2_molar_amount_exp = ET.SubElement(self.physical_dimension_M1TiNeg2, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_M1TiNeg2_molar_amount_exp'] = self.physical_dimension_M1TiNeg2_molar_amount_exp
-        self.physical_dimension_M1TiNeg2_molar_amount_exp.text = '0'
-        self.physical_dimension_M1TiNeg2_luminous_intensity_exp = ET.SubElement(self.physical_dimension_M1TiNeg2, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_M1TiNeg2_luminous_intensity_exp'] = self.physical_dimension_M1TiNeg2_luminous_intensity_exp
-        self.physical_dimension_M1TiNeg2_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_M1TiNeg2INeg1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_M1TiNeg2INeg1'] = self.physical_dimension_M1TiNeg2INeg1
-        self.physical_dimension_M1TiNeg2INeg1_short_name = ET.SubElement(self.physical_dimension_M1TiNeg2INeg1, 'SHORT-NAME')
-        self.variables['physical_dimension_M1TiNeg2INeg1_short_name'] = self.physical_dimension_M1TiNeg2INeg1_short_name
-        self.physical_dimension_M1TiNeg2INeg1_short_name.text = 'M1TiNeg2INeg1'
-        self.physical_dimension_M1TiNeg2INeg1_long_name = ET.SubElement(self.physical_dimension_M1TiNeg2INeg1, 'LONG-NAME')
-        self.variables['physical_dimension_M1TiNeg2INeg1_long_name'] = self.physical_dimension_M1TiNeg2INeg1_long_name
-        self.physical_dimension_M1TiNeg2INeg1_l_4 = ET.SubElement(self.physical_dimension_M1TiNeg2INeg1_long_name, 'L-4')
-        self.variables['physical_dimension_M1TiNeg2INeg1_l_4'] = self.physical_dimension_M1TiNeg2INeg1_l_4
-        self.physical_dimension_M1TiNeg2INeg1_l_4.text = 'Magnetic Flux Density, Magnetic Induction'
-        self.physical_dimension_M1TiNeg2INeg1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_M1TiNeg2INeg1_length_exp = ET.SubElement(self.physical_dimension_M1TiNeg2INeg1, 'LENGTH-EXP')
-        self.variables['physical_dimension_M1TiNeg2INeg1_length_exp'] = self.physical_dimension_M1TiNeg2INeg1_length_exp
-        self.physical_dimension_M1TiNeg2INeg1_length_exp.text = '0'
-        self.physical_dimension_M1TiNeg2INeg1_mass_exp = ET.SubElement(self.physical_dimension_M1TiNeg2INeg1, 'MASS-EXP')
-        self.variables['physical_dimension_M1TiNeg2INeg1_mass_exp'] = self.physical_dimension_M1TiNeg2INeg1_mass_exp
-        self.physical_dimension_M1TiNeg2INeg1_mass_exp.text = '1'
-        self.physical_dimension_M1TiNeg2INeg1_time_exp = ET.SubElement(self.physical_dimension_M1TiNeg2INeg1, 'TIME-EXP')
-        self.variables['physical_dimension_M1TiNeg2INeg1_time_exp'] = self.physical_dimension_M1TiNeg2INeg1_time_exp
-        self.physical_dimension_M1TiNeg2INeg1_time_exp.text = '-2'
-        self.physical_dimension_M1TiNeg2INeg1_current_exp = ET.SubElement(self.physical_dimension_M1TiNeg2INeg1, 'CURRENT-EXP')
-        self.variables['physical_dimension_M1TiNeg2INeg1_current_exp'] = self.physical_dimension_M1TiNeg2INeg1_current_exp
-        self.physical_dimension_M1TiNeg2INeg1_current_exp.text = '-1'
-        self.physical_dimension_M1TiNeg2INeg1_temperature_exp = ET.SubElement(self.physical_dimension_M1TiNeg2INeg1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_M1TiNeg2INeg1_temperature_exp'] = self.physical_dimension_M1TiNeg2INeg1_temperature_exp
-        self.physical_dimension_M1TiNeg2INeg1_temperature_exp.text = '0'
-        self.physical_dimension_M1TiNeg2INeg1_molar_amount_exp = ET.SubElement(self.physical_dimension_M1TiNeg2INeg1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_M1TiNeg2INeg1_molar_amount_exp'] = self.physical_dimension_M1TiNeg2INeg1_molar_amount_exp
-        self.physical_dimension_M1TiNeg2INeg1_molar_amount_exp.text = '0'
-        self.physical_dimension_M1TiNeg2INeg1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_M1TiNeg2INeg1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_M1TiNeg2INeg1_luminous_intensity_exp'] = self.physical_dimension_M1TiNeg2INeg1_luminous_intensity_exp
-        self.physical_dimension_M1TiNeg2INeg1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_M1TiNeg3TNeg1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_M1TiNeg3TNeg1'] = self.physical_dimension_M1TiNeg3TNeg1
-        self.physical_dimension_M1TiNeg3TNeg1_short_name = ET.SubElement(self.physical_dimension_M1TiNeg3TNeg1, 'SHORT-NAME')
-        self.variables['physical_dimension_M1TiNeg3TNeg1_short_name'] = self.physical_dimension_M1TiNeg3TNeg1_short_name
-        self.physical_dimension_M1TiNeg3TNeg1_short_name.text = 'M1TiNeg3TNeg1'
-        self.physical_dimension_M1TiNeg3TNeg1_long_name = ET.SubElement(self.physical_dimension_M1TiNeg3TNeg1, 'LONG-NAME')
-        self.variables['physical_dimension_M1TiNeg3TNeg1_long_name'] = self.physical_dimension_M1TiNeg3TNeg1_long_name
-        self.physical_dimension_M1TiNeg3TNeg1_l_4 = ET.SubElement(self.physical_dimension_M1TiNeg3TNeg1_long_name, 'L-4')
-        self.variables['physical_dimension_M1TiNeg3TNeg1_l_4'] = self.physical_dimension_M1TiNeg3TNeg1_l_4
-        self.physical_dimension_M1TiNeg3TNeg1_l_4.text = 'Heat Transfer Coefficient'
-        self.physical_dimension_M1TiNeg3TNeg1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_M1TiNeg3TNeg1_length_exp = ET.SubElement(self.physical_dimension_M1TiNeg3TNeg1, 'LENGTH-EXP')
-        self.variables['physical_dimension_M1TiNeg3TNeg1_length_exp'] = self.physical_dimension_M1TiNeg3TNeg1_length_exp
-        self.physical_dimension_M1TiNeg3TNeg1_length_exp.text = '0'
-        self.physical_dimension_M1TiNeg3TNeg1_mass_exp = ET.SubElement(self.physical_dimension_M1TiNeg3TNeg1, 'MASS-EXP')
-        self.variables['physical_dimension_M1TiNeg3TNeg1_mass_exp'] = self.physical_dimension_M1TiNeg3TNeg1_mass_exp
-        self.physical_dimension_M1TiNeg3TNeg1_mass_exp.text = '1'
-        self.physical_dimension_M1TiNeg3TNeg1_time_exp = ET.SubElement(self.physical_dimension_M1TiNeg3TNeg1, 'TIME-EXP')
-        self.variables['physical_dimension_M1TiNeg3TNeg1_time_exp'] = self.physical_dimension_M1TiNeg3TNeg1_time_exp
-        self.physical_dimension_M1TiNeg3TNeg1_time_exp.text = '-3'
-        self.physical_dimension_M1TiNeg3TNeg1_current_exp = ET.SubElement(self.physical_dimension_M1TiNeg3TNeg1, 'CURRENT-EXP')
-        self.variables['physical_dimension_M1TiNeg3TNeg1_current_exp'] = self.physical_dimension_M1TiNeg3TNeg1_current_exp
-        self.physical_dimension_M1TiNeg3TNeg1_current_exp.text = '0'
-        self.physical_dimension_M1TiNeg3TNeg1_temperature_exp = ET.SubElement(self.physical_dimension_M1TiNeg3TNeg1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_M1TiNeg3TNeg1_temperature_exp'] = self.physical_dimension_M1TiNeg3TNeg1_temperature_exp
-        self.physical_dimension_M1TiNeg3TNeg1_temperature_exp.text = '-1'
-        self.physical_dimension_M1TiNeg3TNeg1_molar_amount_exp = ET.SubElement(self.physical_dimension_M1TiNeg3TNeg1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_M1TiNeg3TNeg1_molar_amount_exp'] = self.physical_dimension_M1TiNeg3TNeg1_molar_amount_exp
-        self.physical_dimension_M1TiNeg3TNeg1_molar_amount_exp.text = '0'
-        self.physical_dimension_M1TiNeg3TNeg1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_M1TiNeg3TNeg1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_M1TiNeg3TNeg1_luminous_intensity_exp'] = self.physical_dimension_M1TiNeg3TNeg1_luminous_intensity_exp
-        self.physical_dimension_M1TiNeg3TNeg1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_NoDimension = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_NoDimension'] = self.physical_dimension_NoDimension
-        self.physical_dimension_NoDimension_short_name = ET.SubElement(self.physical_dimension_NoDimension, 'SHORT-NAME')
-        self.variables['physical_dimension_NoDimension_short_name'] = self.physical_dimension_NoDimension_short_name
-        self.physical_dimension_NoDimension_short_name.text = 'NoDimension'
-        self.physical_dimension_NoDimension_long_name = ET.SubElement(self.physical_dimension_NoDimension, 'LONG-NAME')
-        self.variables['physical_dimension_NoDimension_long_name'] = self.physical_dimension_NoDimension_long_name
-        self.physical_dimension_NoDimension_l_4 = ET.SubElement(self.physical_dimension_NoDimension_long_name, 'L-4')
-        self.variables['physical_dimension_NoDimension_l_4'] = self.physical_dimension_NoDimension_l_4
-        self.physical_dimension_NoDimension_l_4.text = 'Dimensionless'
-        self.physical_dimension_NoDimension_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_NoDimension_length_exp = ET.SubElement(self.physical_dimension_NoDimension, 'LENGTH-EXP')
-        self.variables['physical_dimension_NoDimension_length_exp'] = self.physical_dimension_NoDimension_length_exp
-        self.physical_dimension_NoDimension_length_exp.text = '0'
-        self.physical_dimension_NoDimension_mass_exp = ET.SubElement(self.physical_dimension_NoDimension, 'MASS-EXP')
-        self.variables['physical_dimension_NoDimension_mass_exp'] = self.physical_dimension_NoDimension_mass_exp
-        self.physical_dimension_NoDimension_mass_exp.text = '0'
-        self.physical_dimension_NoDimension_time_exp = ET.SubElement(self.physical_dimension_NoDimension, 'TIME-EXP')
-        self.variables['physical_dimension_NoDimension_time_exp'] = self.physical_dimension_NoDimension_time_exp
-        self.physical_dimension_NoDimension_time_exp.text = '0'
-        self.physical_dimension_NoDimension_current_exp = ET.SubElement(self.physical_dimension_NoDimension, 'CURRENT-EXP')
-        self.variables['physical_dimension_NoDimension_current_exp'] = self.physical_dimension_NoDimension_current_exp
-        self.physical_dimension_NoDimension_current_exp.text = '0'
-        self.physical_dimension_NoDimension_temperature_exp = ET.SubElement(self.physical_dimension_NoDimension, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_NoDimension_temperature_exp'] = self.physical_dimension_NoDimension_temperature_exp
-        self.physical_dimension_NoDimension_temperature_exp.text = '0'
-        self.physical_dimension_NoDimension_molar_amount_exp = ET.SubElement(self.physical_dimension_NoDimension, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_NoDimension_molar_amount_exp'] = self.physical_dimension_NoDimension_molar_amount_exp
-        self.physical_dimension_NoDimension_molar_amount_exp.text = '0'
-        self.physical_dimension_NoDimension_luminous_intensity_exp = ET.SubElement(self.physical_dimension_NoDimension, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_NoDimension_luminous_intensity_exp'] = self.physical_dimension_NoDimension_luminous_intensity_exp
-        self.physical_dimension_NoDimension_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_NoDimension_1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_NoDimension_1'] = self.physical_dimension_NoDimension_1
-        self.physical_dimension_NoDimension_1_short_name = ET.SubElement(self.physical_dimension_NoDimension_1, 'SHORT-NAME')
-        self.variables['physical_dimension_NoDimension_1_short_name'] = self.physical_dimension_NoDimension_1_short_name
-        self.physical_dimension_NoDimension_1_short_name.text = 'NoDimension_1'
-        self.physical_dimension_NoDimension_1_long_name = ET.SubElement(self.physical_dimension_NoDimension_1, 'LONG-NAME')
-        self.variables['physical_dimension_NoDimension_1_long_name'] = self.physical_dimension_NoDimension_1_long_name
-        self.physical_dimension_NoDimension_1_l_4 = ET.SubElement(self.physical_dimension_NoDimension_1_long_name, 'L-4')
-        self.variables['physical_dimension_NoDimension_1_l_4'] = self.physical_dimension_NoDimension_1_l_4
-        self.physical_dimension_NoDimension_1_l_4.text = 'Ratio'
-        self.physical_dimension_NoDimension_1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_NoDimension_1_length_exp = ET.SubElement(self.physical_dimension_NoDimension_1, 'LENGTH-EXP')
-        self.variables['physical_dimension_NoDimension_1_length_exp'] = self.physical_dimension_NoDimension_1_length_exp
-        self.physical_dimension_NoDimension_1_length_exp.text = '0'
-        self.physical_dimension_NoDimension_1_mass_exp = ET.SubElement(self.physical_dimension_NoDimension_1, 'MASS-EXP')
-        self.variables['physical_dimension_NoDimension_1_mass_exp'] = self.physical_dimension_NoDimension_1_mass_exp
-        self.physical_dimension_NoDimension_1_mass_exp.text = '0'
-        self.physical_dimension_NoDimension_1_time_exp = ET.SubElement(self.physical_dimension_NoDimension_1, 'TIME-EXP')
-        self.variables['physical_dimension_NoDimension_1_time_exp'] = self.physical_dimension_NoDimension_1_time_exp
-        self.physical_dimension_NoDimension_1_time_exp.text = '0'
-        self.physical_dimension_NoDimension_1_current_exp = ET.SubElement(self.physical_dimension_NoDimension_1, 'CURRENT-EXP')
-        self.variables['physical_dimension_NoDimension_1_current_exp'] = self.physical_dimension_NoDimension_1_current_exp
-        self.physical_dimension_NoDimension_1_current_exp.text = '0'
-        self.physical_dimension_NoDimension_1_temperature_exp = ET.SubElement(self.physical_dimension_NoDimension_1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_NoDimension_1_temperature_exp'] = self.physical_dimension_NoDimension_1_temperature_exp
-        self.physical_dimension_NoDimension_1_temperature_exp.text = '0'
-        self.physical_dimension_NoDimension_1_molar_amount_exp = ET.SubElement(self.physical_dimension_NoDimension_1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_NoDimension_1_molar_amount_exp'] = self.physical_dimension_NoDimension_1_molar_amount_exp
-        self.physical_dimension_NoDimension_1_molar_amount_exp.text = '0'
-        self.physical_dimension_NoDimension_1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_NoDimension_1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_NoDimension_1_luminous_intensity_exp'] = self.physical_dimension_NoDimension_1_luminous_intensity_exp
-        self.physical_dimension_NoDimension_1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_NoDimension_2 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_NoDimension_2'] = self.physical_dimension_NoDimension_2
-        self.physical_dimension_NoDimension_2_short_name = ET.SubElement(self.physical_dimension_NoDimension_2, 'SHORT-NAME')
-        self.variables['physical_dimension_NoDimension_2_short_name'] = self.physical_dimension_NoDimension_2_short_name
-        self.physical_dimension_NoDimension_2_short_name.text = 'NoDimension_2'
-        self.physical_dimension_NoDimension_2_long_name = ET.SubElement(self.physical_dimension_NoDimension_2, 'LONG-NAME')
-        self.variables['physical_dimension_NoDimension_2_long_name'] = self.physical_dimension_NoDimension_2_long_name
-        self.physical_dimension_NoDimension_2_l_4 = ET.SubElement(self.physical_dimension_NoDimension_2_long_name, 'L-4')
-        self.variables['physical_dimension_NoDimension_2_l_4'] = self.physical_dimension_NoDimension_2_l_4
-        self.physical_dimension_NoDimension_2_l_4.text = 'Angle'
-        self.physical_dimension_NoDimension_2_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_NoDimension_2_length_exp = ET.SubElement(self.physical_dimension_NoDimension_2, 'LENGTH-EXP')
-        self.variables['physical_dimension_NoDimension_2_length_exp'] = self.physical_dimension_NoDimension_2_length_exp
-        self.physical_dimension_NoDimension_2_length_exp.text = '0'
-        self.physical_dimension_NoDimension_2_mass_exp = ET.SubElement(self.physical_dimension_NoDimension_2, 'MASS-EXP')
-        self.variables['physical_dimension_NoDimension_2_mass_exp'] = self.physical_dimension_NoDimension_2_mass_exp
-        self.physical_dimension_NoDimension_2_mass_exp.text = '0'
-        self.physical_dimension_NoDimension_2_time_exp = ET.SubElement(self.physical_dimension_NoDimension_2, 'TIME-EXP')
-        self.variables['physical_dimension_NoDimension_2_time_exp'] = self.physical_dimension_NoDimension_2_time_exp
-        self.physical_dimension_NoDimension_2_time_exp.text = '0'
-        self.physical_dimension_NoDimension_2_current_exp = ET.SubElement(self.physical_dimension_NoDimension_2, 'CURRENT-EXP')
-        self.variables['physical_dimension_NoDimension_2_current_exp'] = self.physical_dimension_NoDimension_2_current_exp
-        self.physical_dimension_NoDimension_2_current_exp.text = '0'
-        self.physical_dimension_NoDimension_2_temperature_exp = ET.SubElement(self.physical_dimension_NoDimension_2, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_NoDimension_2_temperature_exp'] = self.physical_dimension_NoDimension_2_temperature_exp
-        self.physical_dimension_NoDimension_2_temperature_exp.text = '0'
-        self.physical_dimension_NoDimension_2_molar_amount_exp = ET.SubElement(self.physical_dimension_NoDimension_2, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_NoDimension_2_molar_amount_exp'] = self.physical_dimension_NoDimension_2_molar_amount_exp
-        self.physical_dimension_NoDimension_2_molar_amount_exp.text = '0'
-        self.physical_dimension_NoDimension_2_luminous_intensity_exp = ET.SubElement(self.physical_dimension_NoDimension_2, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_NoDimension_2_luminous_intensity_exp'] = self.physical_dimension_NoDimension_2_luminous_intensity_exp
-        self.physical_dimension_NoDimension_2_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_NoDimension_5 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_NoDimension_5'] = self.physical_dimension_NoDimension_5
-        self.physical_dimension_NoDimension_5_short_name = ET.SubElement(self.physical_dimension_NoDimension_5, 'SHORT-NAME')
-        self.variables['physical_dimension_NoDimension_5_short_name'] = self.physical_dimension_NoDimension_5_short_name
-        self.physical_dimension_NoDimension_5_short_name.text = 'NoDimension_5'
-        self.physical_dimension_NoDimension_5_long_name = ET.SubElement(self.physical_dimension_NoDimension_5, 'LONG-NAME')
-        self.variables['physical_dimension_NoDimension_5_long_name'] = self.physical_dimension_NoDimension_5_long_name
-        self.physical_dimension_NoDimension_5_l_4 = ET.SubElement(self.physical_dimension_NoDimension_5_long_name, 'L-4')
-        self.variables['physical_dimension_NoDimension_5_l_4'] = self.physical_dimension_NoDimension_5_l_4
-        self.physical_dimension_NoDimension_5_l_4.text = 'Logarithmic Ratio'
-        self.physical_dimension_NoDimension_5_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_NoDimension_5_length_exp = ET.SubElement(self.physical_dimension_NoDimension_5, 'LENGTH-EXP')
-        self.variables['physical_dimension_NoDimension_5_length_exp'] = self.physical_dimension_NoDimension_5_length_exp
-        self.physical_dimension_NoDimension_5_length_exp.text = '0'
-        self.physical_dimension_NoDimension_5_mass_exp = ET.SubElement(self.physical_dimension_NoDimension_5, 'MASS-EXP')
-        self.variables['physical_dimension_NoDimension_5_mass_exp'] = self.physical_dimension_NoDimension_5_mass_exp
-        self.physical_dimension_NoDimension_5_mass_exp.text = '0'
-        self.physical_dimension_NoDimension_5_time_exp = ET.SubElement(self.physical_dimension_NoDimension_5, 'TIME-EXP')
-        self.variables['physical_dimension_NoDimension_5_time_exp'] = self.physical_dimension_NoDimension_5_time_exp
-        self.physical_dimension_NoDimension_5_time_exp.text = '0'
-        self.physical_dimension_NoDimension_5_current_exp = ET.SubElement(self.physical_dimension_NoDimension_5, 'CURRENT-EXP')
-        self.variables['physical_dimension_NoDimension_5_current_exp'] = self.physical_dimension_NoDimension_5_current_exp
-        self.physical_dimension_NoDimension_5_current_exp.text = '0'
-        self.physical_dimension_NoDimension_5_temperature_exp = ET.SubElement(self.physical_dimension_NoDimension_5, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_NoDimension_5_temperature_exp'] = self.physical_dimension_NoDimension_5_temperature_exp
-        self.physical_dimension_NoDimension_5_temperature_exp.text = '0'
-        self.physical_dimension_NoDimension_5_molar_amount_exp = ET.SubElement(self.physical_dimension_NoDimension_5, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_NoDimension_5_molar_amount_exp'] = self.physical_dimension_NoDimension_5_molar_amount_exp
-        self.physical_dimension_NoDimension_5_molar_amount_exp.text = '0'
-        self.physical_dimension_NoDimension_5_luminous_intensity_exp = ET.SubElement(self.physical_dimension_NoDimension_5, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_NoDimension_5_luminous_intensity_exp'] = self.physical_dimension_NoDimension_5_luminous_intensity_exp
-        self.physical_dimension_NoDimension_5_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_NoDimension_6 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_NoDimension_6'] = self.physical_dimension_NoDimension_6
-        self.physical_dimension_NoDimension_6_short_name = ET.SubElement(self.physical_dimension_NoDimension_6, 'SHORT-NAME')
-        self.variables['physical_dimension_NoDimension_6_short_name'] = self.physical_dimension_NoDimension_6_short_name
-        self.physical_dimension_NoDimension_6_short_name.text = 'NoDimension_6'
-        self.physical_dimension_NoDimension_6_long_name = ET.SubElement(self.physical_dimension_NoDimension_6, 'LONG-NAME')
-        self.variables['physical_dimension_NoDimension_6_long_name'] = self.physical_dimension_NoDimension_6_long_name
-        self.physical_dimension_NoDimension_6_l_4 = ET.SubElement(self.physical_dimension_NoDimension_6_long_name, 'L-4')
-        self.variables['physical_dimension_NoDimension_6_l_4'] = self.physical_dimension_NoDimension_6_l_4
-        self.physical_dimension_NoDimension_6_l_4.text = 'Amount of Data'
-        self.physical_dimension_NoDimension_6_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_NoDimension_6_length_exp = ET.SubElement(self.physical_dimension_NoDimension_6, 'LENGTH-EXP')
-        self.variables['physical_dimension_NoDimension_6_length_exp'] = self.physical_dimension_NoDimension_6_length_exp
-        self.physical_dimension_NoDimension_6_length_exp.text = '0'
-        self.physical_dimension_NoDimension_6_mass_exp = ET.SubElement(self.physical_dimension_NoDimension_6, 'MASS-EXP')
-        self.variables['physical_dimension_NoDimension_6_mass_exp'] = self.physical_dimension_NoDimension_6_mass_exp
-        self.physical_dimension_NoDimension_6_mass_exp.text = '0'
-        self.physical_dimension_NoDimension_6_time_exp = ET.SubElement(self.physical_dimension_NoDimension_6, 'TIME-EXP')
-        self.variables['physical_dimension_NoDimension_6_time_exp'] = self.physical_dimension_NoDimension_6_time_exp
-        self.physical_dimension_NoDimension_6_time_exp.text = '0'
-        self.physical_dimension_NoDimension_6_current_exp = ET.SubElement(self.physical_dimension_NoDimension_6, 'CURRENT-EXP')
-        self.variables['physical_dimension_NoDimension_6_current_exp'] = self.physical_dimension_NoDimension_6_current_exp
-        self.physical_dimension_NoDimension_6_current_exp.text = '0'
-        self.physical_dimension_NoDimension_6_temperature_exp = ET.SubElement(self.physical_dimension_NoDimension_6, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_NoDimension_6_temperature_exp'] = self.physical_dimension_NoDimension_6_temperature_exp
-        self.physical_dimension_NoDimension_6_temperature_exp.text = '0'
-        self.physical_dimension_NoDimension_6_molar_amount_exp = ET.SubElement(self.physical_dimension_NoDimension_6, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_NoDimension_6_molar_amount_exp'] = self.physical_dimension_NoDimension_6_molar_amount_exp
-        self.physical_dimension_NoDimension_6_molar_amount_exp.text = '0'
-        self.physical_dimension_NoDimension_6_luminous_intensity_exp = ET.SubElement(self.physical_dimension_NoDimension_6, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_NoDimension_6_luminous_intensity_exp'] = self.physical_dimension_NoDimension_6_luminous_intensity_exp
-        self.physical_dimension_NoDimension_6_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_T1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_T1'] = self.physical_dimension_T1
-        self.physical_dimension_T1_short_name = ET.SubElement(self.physical_dimension_T1, 'SHORT-NAME')
-        self.variables['physical_dimension_T1_short_name'] = self.physical_dimension_T1_short_name
-        self.physical_dimension_T1_short_name.text = 'T1'
-        self.physical_dimension_T1_long_name = ET.SubElement(self.physical_dimension_T1, 'LONG-NAME')
-        self.variables['physical_dimension_T1_long_name'] = self.physical_dimension_T1_long_name
-        self.physical_dimension_T1_l_4 = ET.SubElement(self.physical_dimension_T1_long_name, 'L-4')
-        self.variables['physical_dimension_T1_l_4'] = self.physical_dimension_T1_l_4
-        self.physical_dimension_T1_l_4.text = 'Absolute Temperature'
-        self.physical_dimension_T1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_T1_length_exp = ET.SubElement(self.physical_dimension_T1, 'LENGTH-EXP')
-        self.variables['physical_dimension_T1_length_exp'] = self.physical_dimension_T1_length_exp
-        self.physical_dimension_T1_length_exp.text = '0'
-        self.physical_dimension_T1_mass_exp = ET.SubElement(self.physical_dimension_T1, 'MASS-EXP')
-        self.variables['physical_dimension_T1_mass_exp'] = self.physical_dimension_T1_mass_exp
-        self.physical_dimension_T1_mass_exp.text = '0'
-        self.physical_dimension_T1_time_exp = ET.SubElement(self.physical_dimension_T1, 'TIME-EXP')
-        self.variables['physical_dimension_T1_time_exp'] = self.physical_dimension_T1_time_exp
-        self.physical_dimension_T1_time_exp.text = '0'
-        self.physical_dimension_T1_current_exp = ET.SubElement(self.physical_dimension_T1, 'CURRENT-EXP')
-        self.variables['physical_dimension_T1_current_exp'] = self.physical_dimension_T1_current_exp
-        self.physical_dimension_T1_current_exp.text = '0'
-        self.physical_dimension_T1_temperature_exp = ET.SubElement(self.physical_dimension_T1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_T1_temperature_exp'] = self.physical_dimension_T1_temperature_exp
-        self.physical_dimension_T1_temperature_exp.text = '1'
-        self.physical_dimension_T1_molar_amount_exp = ET.SubElement(self.physical_dimension_T1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_T1_molar_amount_exp'] = self.physical_dimension_T1_molar_amount_exp
-        self.physical_dimension_T1_molar_amount_exp.text = '0'
-        self.physical_dimension_T1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_T1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_T1_luminous_intensity_exp'] = self.physical_dimension_T1_luminous_intensity_exp
-        self.physical_dimension_T1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_T1I1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_T1I1'] = self.physical_dimension_T1I1
-        self.physical_dimension_T1I1_short_name = ET.SubElement(self.physical_dimension_T1I1, 'SHORT-NAME')
-        self.variables['physical_dimension_T1I1_short_name'] = self.physical_dimension_T1I1_short_name
-        self.physical_dimension_T1I1_short_name.text = 'T1I1'
-        self.physical_dimension_T1I1_long_name = ET.SubElement(self.physical_dimension_T1I1, 'LONG-NAME')
-        self.variables['physical_dimension_T1I1_long_name'] = self.physical_dimension_T1I1_long_name
-        self.physical_dimension_T1I1_l_4 = ET.SubElement(self.physical_dimension_T1I1_long_name, 'L-4')
-        self.variables['physical_dimension_T1I1_l_4'] = self.physical_dimension_T1I1_l_4
-        self.physical_dimension_T1I1_l_4.text = 'Electric Charge'
-        self.physical_dimension_T1I1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_T1I1_length_exp = ET.SubElement(self.physical_dimension_T1I1, 'LENGTH-EXP')
-        self.variables['physical_dimension_T1I1_length_exp'] = self.physical_dimension_T1I1_length_exp
-        self.physical_dimension_T1I1_length_exp.text = '0'
-        self.physical_dimension_T1I1_mass_exp = ET.SubElement(self.physical_dimension_T1I1, 'MASS-EXP')
-        self.variables['physical_dimension_T1I1_mass_exp'] = self.physical_dimension_T1I1_mass_exp
-        self.physical_dimension_T1I1_mass_exp.text = '0'
-        self.physical_dimension_T1I1_time_exp = ET.SubElement(self.physical_dimension_T1I1, 'TIME-EXP')
-        self.variables['physical_dimension_T1I1_time_exp'] = self.physical_dimension_T1I1_time_exp
-        self.physical_dimension_T1I1_time_exp.text = '1'
-        self.physical_dimension_T1I1_current_exp = ET.SubElement(self.physical_dimension_T1I1, 'CURRENT-EXP')
-        self.variables['physical_dimension_T1I1_current_exp'] = self.physical_dimension_T1I1_current_exp
-        self.physical_dimension_T1I1_current_exp.text = '1'
-        self.physical_dimension_T1I1_temperature_exp = ET.SubElement(self.physical_dimension_T1I1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_T1I1_temperature_exp'] = self.physical_dimension_T1I1_temperature_exp
-        self.physical_dimension_T1I1_temperature_exp.text = '0'
-        self.physical_dimension_T1I1_molar_amount_exp = ET.SubElement(self.physical_dimension_T1I1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_T1I1_molar_amount_exp'] = self.physical_dimension_T1I1_molar_amount_exp
-        self.physical_dimension_T1I1_molar_amount_exp.text = '0'
-        self.physical_dimension_T1I1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_T1I1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_T1I1_luminous_intensity_exp'] = self.physical_dimension_T1I1_luminous_intensity_exp
-        self.physical_dimension_T1I1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_T1_1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_T1_1'] = self.physical_dimension_T1_1
-        self.physical_dimension_T1_1_short_name = ET.SubElement(self.physical_dimension_T1_1, 'SHORT-NAME')
-        self.variables['physical_dimension_T1_1_short_name'] = self.physical_dimension_T1_1_short_name
-        self.physical_dimension_T1_1_short_name.text = 'T1_1'
-        self.physical_dimension_T1_1_long_name = ET.SubElement(self.physical_dimension_T1_1, 'LONG-NAME')
-        self.variables['physical_dimension_T1_1_long_name'] = self.physical_dimension_T1_1_long_name
-        self.physical_dimension_T1_1_l_4 = ET.SubElement(self.physical_dimension_T1_1_long_name, 'L-4')
-        self.variables['physical_dimension_T1_1_l_4'] = self.physical_dimension_T1_1_l_4
-        self.physical_dimension_T1_1_l_4.text = 'Relative Temperature, Temperature Difference'
-        self.physical_dimension_T1_1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_T1_1_length_exp = ET.SubElement(self.physical_dimension_T1_1, 'LENGTH-EXP')
-        self.variables['physical_dimension_T1_1_length_exp'] = self.physical_dimension_T1_1_length_exp
-        self.physical_dimension_T1_1_length_exp.text = '0'
-        self.physical_dimension_T1_1_mass_exp = ET.SubElement(self.physical_dimension_T1_1, 'MASS-EXP')
-        self.variables['physical_dimension_T1_1_mass_exp'] = self.physical_dimension_T1_1_mass_exp
-        self.physical_dimension_T1_1_mass_exp.text = '0'
-        self.physical_dimension_T1_1_time_exp = ET.SubElement(self.physical_dimension_T1_1, 'TIME-EXP')
-        self.variables['physical_dimension_T1_1_time_exp'] = self.physical_dimension_T1_1_time_exp
-        self.physical_dimension_T1_1_time_exp.text = '0'
-        self.physical_dimension_T1_1_current_exp = ET.SubElement(self.physical_dimension_T1_1, 'CURRENT-EXP')
-        self.variables['physical_dimension_T1_1_current_exp'] = self.physical_dimension_T1_1_current_exp
-        self.physical_dimension_T1_1_current_exp.text = '0'
-        self.physical_dimension_T1_1_temperature_exp = ET.SubElement(self.physical_dimension_T1_1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_T1_1_temperature_exp'] = self.physical_dimension_T1_1_temperature_exp
-        self.physical_dimension_T1_1_temperature_exp.text = '1'
-        self.physical_dimension_T1_1_molar_amount_exp = ET.SubElement(self.physical_dimension_T1_1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_T1_1_molar_amount_exp'] = self.physical_dimension_T1_1_molar_amount_exp
-        self.physical_dimension_T1_1_molar_amount_exp.text = '0'
-        self.physical_dimension_T1_1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_T1_1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_T1_1_luminous_intensity_exp'] = self.physical_dimension_T1_1_luminous_intensity_exp
-        self.physical_dimension_T1_1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_Ti1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_Ti1'] = self.physical_dimension_Ti1
-        self.physical_dimension_Ti1_short_name = ET.SubElement(self.physical_dimension_Ti1, 'SHORT-NAME')
-        self.variables['physical_dimension_Ti1_short_name'] = self.physical_dimension_Ti1_short_name
-        self.physical_dimension_Ti1_short_name.text = 'Ti1'
-        self.physical_dimension_Ti1_long_name = ET.SubElement(self.physical_dimension_Ti1, 'LONG-NAME')
-        self.variables['physical_dimension_Ti1_long_name'] = self.physical_dimension_Ti1_long_name
-        self.physical_dimension_Ti1_l_4 = ET.SubElement(self.physical_dimension_Ti1_long_name, 'L-4')
-        self.variables['physical_dimension_Ti1_l_4'] = self.physical_dimension_Ti1_l_4
-        self.physical_dimension_Ti1_l_4.text = 'Time'
-        self.physical_dimension_Ti1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_Ti1_length_exp = ET.SubElement(self.physical_dimension_Ti1, 'LENGTH-EXP')
-        self.variables['physical_dimension_Ti1_length_exp'] = self.physical_dimension_Ti1_length_exp
-        self.physical_dimension_Ti1_length_exp.text = '0'
-        self.physical_dimension_Ti1_mass_exp = ET.SubElement(self.physical_dimension_Ti1, 'MASS-EXP')
-        self.variables['physical_dimension_Ti1_mass_exp'] = self.physical_dimension_Ti1_mass_exp
-        self.physical_dimension_Ti1_mass_exp.text = '0'
-        self.physical_dimension_Ti1_time_exp = ET.SubElement(self.physical_dimension_Ti1, 'TIME-EXP')
-        self.variables['physical_dimension_Ti1_time_exp'] = self.physical_dimension_Ti1_time_exp
-        self.physical_dimension_Ti1_time_exp.text = '1'
-        self.physical_dimension_Ti1_current_exp = ET.SubElement(self.physical_dimension_Ti1, 'CURRENT-EXP')
-        self.variables['physical_dimension_Ti1_current_exp'] = self.physical_dimension_Ti1_current_exp
-        self.physical_dimension_Ti1_current_exp.text = '0'
-        self.physical_dimension_Ti1_temperature_exp = ET.SubElement(self.physical_dimension_Ti1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_Ti1_temperature_exp'] = self.physical_dimension_Ti1_temperature_exp
-        self.physical_dimension_Ti1_temperature_exp.text = '0'
-        self.physical_dimension_Ti1_molar_amount_exp = ET.SubElement(self.physical_dimension_Ti1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_Ti1_molar_amount_exp'] = self.physical_dimension_Ti1_molar_amount_exp
-        self.physical_dimension_Ti1_molar_amount_exp.text = '0'
-        self.physical_dimension_Ti1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_Ti1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_Ti1_luminous_intensity_exp'] = self.physical_dimension_Ti1_luminous_intensity_exp
-        self.physical_dimension_Ti1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_TiNeg1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_TiNeg1'] = self.physical_dimension_TiNeg1
-        self.physical_dimension_TiNeg1_short_name = ET.SubElement(self.physical_dimension_TiNeg1, 'SHORT-NAME')
-        self.variables['physical_dimension_TiNeg1_short_name'] = self.physical_dimension_TiNeg1_short_name
-        self.physical_dimension_TiNeg1_short_name.text = 'TiNeg1'
-        self.physical_dimension_TiNeg1_long_name = ET.SubElement(self.physical_dimension_TiNeg1, 'LONG-NAME')
-        self.variables['physical_dimension_TiNeg1_long_name'] = self.physical_dimension_TiNeg1_long_name
-        self.physical_dimension_TiNeg1_l_4 = ET.SubElement(self.physical_dimension_TiNeg1_long_name, 'L-4')
-        self.variables['physical_dimension_TiNeg1_l_4'] = self.physical_dimension_TiNeg1_l_4
-        self.physical_dimension_TiNeg1_l_4.text = 'Frequency'
-        self.physical_dimension_TiNeg1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_TiNeg1_length_exp = ET.SubElement(self.physical_dimension_TiNeg1, 'LENGTH-EXP')
-        self.variables['physical_dimension_TiNeg1_length_exp'] = self.physical_dimension_TiNeg1_length_exp
-        self.physical_dimension_TiNeg1_length_exp.text = '0'
-        self.physical_dimension_TiNeg1_mass_exp = ET.SubElement(self.physical_dimension_TiNeg1, 'MASS-EXP')
-        self.variables['physical_dimension_TiNeg1_mass_exp'] = self.physical_dimension_TiNeg1_mass_exp
-        self.physical_dimension_TiNeg1_mass_exp.text = '0'
-        self.physical_dimension_TiNeg1_time_exp = ET.SubElement(self.physical_dimension_TiNeg1, 'TIME-EXP')
-        self.variables['physical_dimension_TiNeg1_time_exp'] = self.physical_dimension_TiNeg1_time_exp
-        self.physical_dimension_TiNeg1_time_exp.text = '-1'
-        self.physical_dimension_TiNeg1_current_exp = ET.SubElement(self.physical_dimension_TiNeg1, 'CURRENT-EXP')
-        self.variables['physical_dimension_TiNeg1_current_exp'] = self.physical_dimension_TiNeg1_current_exp
-        self.physical_dimension_TiNeg1_current_exp.text = '0'
-        self.physical_dimension_TiNeg1_temperature_exp = ET.SubElement(self.physical_dimension_TiNeg1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_TiNeg1_temperature_exp'] = self.physical_dimension_TiNeg1_temperature_exp
-        self.physical_dimension_TiNeg1_temperature_exp.text = '0'
-        self.physical_dimension_TiNeg1_molar_amount_exp = ET.SubElement(self.physical_dimension_TiNeg1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_TiNeg1_molar_amount_exp'] = self.physical_dimension_TiNeg1_molar_amount_exp
-        self.physical_dimension_TiNeg1_molar_amount_exp.text = '0'
-        self.physical_dimension_TiNeg1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_TiNeg1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_TiNeg1_luminous_intensity_exp'] = self.physical_dimension_TiNeg1_luminous_intensity_exp
-        self.physical_dimension_TiNeg1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_TiNeg1Amnt1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_TiNeg1Amnt1'] = self.physical_dimension_TiNeg1Amnt1
-        self.physical_dimension_TiNeg1Amnt1_short_name = ET.SubElement(self.physical_dimension_TiNeg1Amnt1, 'SHORT-NAME')
-        self.variables['physical_dimension_TiNeg1Amnt1_short_name'] = self.physical_dimension_TiNeg1Amnt1_short_name
-        self.physical_dimension_TiNeg1Amnt1_short_name.text = 'TiNeg1Amnt1'
-        self.physical_dimension_TiNeg1Amnt1_long_name = ET.SubElement(self.physical_dimension_TiNeg1Amnt1, 'LONG-NAME')
-        self.variables['physical_dimension_TiNeg1Amnt1_long_name'] = self.physical_dimension_TiNeg1Amnt1_long_name
-        self.physical_dimension_TiNeg1Amnt1_l_4 = ET.SubElement(self.physical_dimension_TiNeg1Amnt1_long_name, 'L-4')
-        self.variables['physical_dimension_TiNeg1Amnt1_l_4'] = self.physical_dimension_TiNeg1Amnt1_l_4
-        self.physical_dimension_TiNeg1Amnt1_l_4.text = 'Catalytic Activity'
-        self.physical_dimension_TiNeg1Amnt1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_TiNeg1Amnt1_length_exp = ET.SubElement(self.physical_dimension_TiNeg1Amnt1, 'LENGTH-EXP')
-        self.variables['physical_dimension_TiNeg1Amnt1_length_exp'] = self.physical_dimension_TiNeg1Amnt1_length_exp
-        self.physical_dimension_TiNeg1Amnt1_length_exp.text = '0'
-        self.physical_dimension_TiNeg1Amnt1_mass_exp = ET.SubElement(self.physical_dimension_TiNeg1Amnt1, 'MASS-EXP')
-        self.variables['physical_dimension_TiNeg1Amnt1_mass_exp'] = self.physical_dimension_TiNeg1Amnt1_mass_exp
-        self.physical_dimension_TiNeg1Amnt1_mass_exp.text = '0'
-        self.physical_dimension_TiNeg1Amnt1_time_exp = ET.SubElement(self.physical_dimension_TiNeg1Amnt1, 'TIME-EXP')
-        self.variables['physical_dimension_TiNeg1Amnt1_time_exp'] = self.physical_dimension_TiNeg1Amnt1_time_exp
-        self.physical_dimension_TiNeg1Amnt1_time_exp.text = '-1'
-        self.physical_dimension_TiNeg1Amnt1_current_exp = ET.SubElement(self.physical_dimension_TiNeg1Amnt1, 'CURRENT-EXP')
-        self.variables['physical_dimension_TiNeg1Amnt1_current_exp'] = self.physical_dimension_TiNeg1Amnt1_current_exp
-        self.physical_dimension_TiNeg1Amnt1_current_exp.text = '0'
-        self.physical_dimension_TiNeg1Amnt1_temperature_exp = ET.SubElement(self.physical_dimension_TiNeg1Amnt1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_TiNeg1Amnt1_temperature_exp'] = self.physical_dimension_TiNeg1Amnt1_temperature_exp
-        self.physical_dimension_TiNeg1Amnt1_temperature_exp.text = '0'
-        self.physical_dimension_TiNeg1Amnt1_molar_amount_exp = ET.SubElement(self.physical_dimension_TiNeg1Amnt1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_TiNeg1Amnt1_molar_amount_exp'] = self.physical_dimension_TiNeg1Amnt1_molar_amount_exp
-        self.physical_dimension_TiNeg1Amnt1_molar_amount_exp.text = '1'
-        self.physical_dimension_TiNeg1Amnt1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_TiNeg1Amnt1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_TiNeg1Amnt1_luminous_intensity_exp'] = self.physical_dimension_TiNeg1Amnt1_luminous_intensity_exp
-        self.physical_dimension_TiNeg1Amnt1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_TiNeg1I1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_TiNeg1I1'] = self.physical_dimension_TiNeg1I1
-        self.physical_dimension_TiNeg1I1_short_name = ET.SubElement(self.physical_dimension_TiNeg1I1, 'SHORT-NAME')
-        self.variables['physical_dimension_TiNeg1I1_short_name'] = self.physical_dimension_TiNeg1I1_short_name
-        self.physical_dimension_TiNeg1I1_short_name.text = 'TiNeg1I1'
-        self.physical_dimension_TiNeg1I1_long_name = ET.SubElement(self.physical_dimension_TiNeg1I1, 'LONG-NAME')
-        self.variables['physical_dimension_TiNeg1I1_long_name'] = self.physical_dimension_TiNeg1I1_long_name
-        self.physical_dimension_TiNeg1I1_l_4 = ET.SubElement(self.physical_dimension_TiNeg1I1_long_name, 'L-4')
-        self.variables['physical_dimension_TiNeg1I1_l_4'] = self.physical_dimension_TiNeg1I1_l_4
-        self.physical_dimension_TiNeg1I1_l_4.text = 'Electric Current Gradient'
-        self.physical_dimension_TiNeg1I1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_TiNeg1I1_length_exp = ET.SubElement(self.physical_dimension_TiNeg1I1, 'LENGTH-EXP')
-        self.variables['physical_dimension_TiNeg1I1_length_exp'] = self.physical_dimension_TiNeg1I1_length_exp
-        self.physical_dimension_TiNeg1I1_length_exp.text = '0'
-        self.physical_dimension_TiNeg1I1_mass_exp = ET.SubElement(self.physical_dimension_TiNeg1I1, 'MASS-EXP')
-        self.variables['physical_dimension_TiNeg1I1_mass_exp'] = self.physical_dimension_TiNeg1I1_mass_exp
-        self.physical_dimension_TiNeg1I1_mass_exp.text = '0'
-        self.physical_dimension_TiNeg1I1_time_exp = ET.SubElement(self.physical_dimension_TiNeg1I1, 'TIME-EXP')
-        self.variables['physical_dimension_TiNeg1I1_time_exp'] = self.physical_dimension_TiNeg1I1_time_exp
-        self.physical_dimension_TiNeg1I1_time_exp.text = '-1'
-        self.physical_dimension_TiNeg1I1_current_exp = ET.SubElement(self.physical_dimension_TiNeg1I1, 'CURRENT-EXP')
-        self.variables['physical_dimension_TiNeg1I1_current_exp'] = self.physical_dimension_TiNeg1I1_current_exp
-        self.physical_dimension_TiNeg1I1_current_exp.text = '1'
-        self.physical_dimension_TiNeg1I1_temperature_exp = ET.SubElement(self.physical_dimension_TiNeg1I1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_TiNeg1I1_temperature_exp'] = self.physical_dimension_TiNeg1I1_temperature_exp
-        self.physical_dimension_TiNeg1I1_temperature_exp.text = '0'
-        self.physical_dimension_TiNeg1I1_molar_amount_exp = ET.SubElement(self.physical_dimension_TiNeg1I1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_TiNeg1I1_molar_amount_exp'] = self.physical_dimension_TiNeg1I1_molar_amount_exp
-        self.physical_dimension_TiNeg1I1_molar_amount_exp.text = '0'
-        self.physical_dimension_TiNeg1I1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_TiNeg1I1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_TiNeg1I1_luminous_intensity_exp'] = self.physical_dimension_TiNeg1I1_luminous_intensity_exp
-        self.physical_dimension_TiNeg1I1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_TiNeg1T1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_TiNeg1T1'] = self.physical_dimension_TiNeg1T1
-        self.physical_dimension_TiNeg1T1_short_name = ET.SubElement(self.physical_dimension_TiNeg1T1, 'SHORT-NAME')
-        self.variables['physical_dimension_TiNeg1T1_short_name'] = self.physical_dimension_TiNeg1T1_short_name
-        self.physical_dimension_TiNeg1T1_short_name.text = 'TiNeg1T1'
-        self.physical_dimension_TiNeg1T1_long_name = ET.SubElement(self.physical_dimension_TiNeg1T1, 'LONG-NAME')
-        self.variables['physical_dimension_TiNeg1T1_long_name'] = self.physical_dimension_TiNeg1T1_long_name
-        self.physical_dimension_TiNeg1T1_l_4 = ET.SubElement(self.physical_dimension_TiNeg1T1_long_name, 'L-4')
-        self.variables['physical_dimension_TiNeg1T1_l_4'] = self.physical_dimension_TiNeg1T1_l_4
-        self.physical_dimension_TiNeg1T1_l_4.text = 'Temperature Gradient'
-        self.physical_dimension_TiNeg1T1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_TiNeg1T1_length_exp = ET.SubElement(self.physical_dimension_TiNeg1T1, 'LENGTH-EXP')
-        self.variables['physical_dimension_TiNeg1T1_length_exp'] = self.physical_dimension_TiNeg1T1_length_exp
-        self.physical_dimension_TiNeg1T1_length_exp.text = '0'
-        self.physical_dimension_TiNeg1T1_mass_exp = ET.SubElement(self.physical_dimension_TiNeg1T1, 'MASS-EXP')
-        self.variables['physical_dimension_TiNeg1T1_mass_exp'] = self.physical_dimension_TiNeg1T1_mass_exp
-        self.physical_dimension_TiNeg1T1_mass_exp.text = '0'
-        self.physical_dimension_TiNeg1T1_time_exp = ET.SubElement(self.physical_dimension_TiNeg1T1, 'TIME-EXP')
-        self.variables['physical_dimension_TiNeg1T1_time_exp'] = self.physical_dimension_TiNeg1T1_time_exp
-        self.physical_dimension_TiNeg1T1_time_exp.text = '-1'
-        self.physical_dimension_TiNeg1T1_current_exp = ET.SubElement(self.physical_dimension_TiNeg1T1, 'CURRENT-EXP')
-        self.variables['physical_dimension_TiNeg1T1_current_exp'] = self.physical_dimension_TiNeg1T1_current_exp
-        self.physical_dimension_TiNeg1T1_current_exp.text = '0'
-        self.physical_dimension_TiNeg1T1_temperature_exp = ET.SubElement(self.physical_dimension_TiNeg1T1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_TiNeg1T1_temperature_exp'] = self.physical_dimension_TiNeg1T1_temperature_exp
-        self.physical_dimension_TiNeg1T1_temperature_exp.text = '1'
-        self.physical_dimension_TiNeg1T1_molar_amount_exp = ET.SubElement(self.physical_dimension_TiNeg1T1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_TiNeg1T1_molar_amount_exp'] = self.physical_dimension_TiNeg1T1_molar_amount_exp
-        self.physical_dimension_TiNeg1T1_molar_amount_exp.text = '0'
-        self.physical_dimension_TiNeg1T1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_TiNeg1T1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_TiNeg1T1_luminous_intensity_exp'] = self.physical_dimension_TiNeg1T1_luminous_intensity_exp
-        self.physical_dimension_TiNeg1T1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_TiNeg1_1 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_TiNeg1_1'] = self.physical_dimension_TiNeg1_1
-        self.physical_dimension_TiNeg1_1_short_name = ET.SubElement(self.physical_dimension_TiNeg1_1, 'SHORT-NAME')
-        self.variables['physical_dimension_TiNeg1_1_short_name'] = self.physical_dimension_TiNeg1_1_short_name
-        self.physical_dimension_TiNeg1_1_short_name.text = 'TiNeg1_1'
-        self.physical_dimension_TiNeg1_1_long_name = ET.SubElement(self.physical_dimension_TiNeg1_1, 'LONG-NAME')
-        self.variables['physical_dimension_TiNeg1_1_long_name'] = self.physical_dimension_TiNeg1_1_long_name
-        self.physical_dimension_TiNeg1_1_l_4 = ET.SubElement(self.physical_dimension_TiNeg1_1_long_name, 'L-4')
-        self.variables['physical_dimension_TiNeg1_1_l_4'] = self.physical_dimension_TiNeg1_1_l_4
-        self.physical_dimension_TiNeg1_1_l_4.text = 'Ratio Gradient'
-        self.physical_dimension_TiNeg1_1_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_TiNeg1_1_length_exp = ET.SubElement(self.physical_dimension_TiNeg1_1, 'LENGTH-EXP')
-        self.variables['physical_dimension_TiNeg1_1_length_exp'] = self.physical_dimension_TiNeg1_1_length_exp
-        self.physical_dimension_TiNeg1_1_length_exp.text = '0'
-        self.physical_dimension_TiNeg1_1_mass_exp = ET.SubElement(self.physical_dimension_TiNeg1_1, 'MASS-EXP')
-        self.variables['physical_dimension_TiNeg1_1_mass_exp'] = self.physical_dimension_TiNeg1_1_mass_exp
-        self.physical_dimension_TiNeg1_1_mass_exp.text = '0'
-        self.physical_dimension_TiNeg1_1_time_exp = ET.SubElement(self.physical_dimension_TiNeg1_1, 'TIME-EXP')
-        self.variables['physical_dimension_TiNeg1_1_time_exp'] = self.physical_dimension_TiNeg1_1_time_exp
-        self.physical_dimension_TiNeg1_1_time_exp.text = '-1'
-        self.physical_dimension_TiNeg1_1_current_exp = ET.SubElement(self.physical_dimension_TiNeg1_1, 'CURRENT-EXP')
-        self.variables['physical_dimension_TiNeg1_1_current_exp'] = self.physical_dimension_TiNeg1_1_current_exp
-        self.physical_dimension_TiNeg1_1_current_exp.text = '0'
-        self.physical_dimension_TiNeg1_1_temperature_exp = ET.SubElement(self.physical_dimension_TiNeg1_1, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_TiNeg1_1_temperature_exp'] = self.physical_dimension_TiNeg1_1_temperature_exp
-        self.physical_dimension_TiNeg1_1_temperature_exp.text = '0'
-        self.physical_dimension_TiNeg1_1_molar_amount_exp = ET.SubElement(self.physical_dimension_TiNeg1_1, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_TiNeg1_1_molar_amount_exp'] = self.physical_dimension_TiNeg1_1_molar_amount_exp
-        self.physical_dimension_TiNeg1_1_molar_amount_exp.text = '0'
-        self.physical_dimension_TiNeg1_1_luminous_intensity_exp = ET.SubElement(self.physical_dimension_TiNeg1_1, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_TiNeg1_1_luminous_intensity_exp'] = self.physical_dimension_TiNeg1_1_luminous_intensity_exp
-        self.physical_dimension_TiNeg1_1_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_TiNeg1_2 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_TiNeg1_2'] = self.physical_dimension_TiNeg1_2
-        self.physical_dimension_TiNeg1_2_short_name = ET.SubElement(self.physical_dimension_TiNeg1_2, 'SHORT-NAME')
-        self.variables['physical_dimension_TiNeg1_2_short_name'] = self.physical_dimension_TiNeg1_2_short_name
-        self.physical_dimension_TiNeg1_2_short_name.text = 'TiNeg1_2'
-        self.physical_dimension_TiNeg1_2_long_name = ET.SubElement(self.physical_dimension_TiNeg1_2, 'LONG-NAME')
-        self.variables['physical_dimension_TiNeg1_2_long_name'] = self.physical_dimension_TiNeg1_2_long_name
-        self.physical_dimension_TiNeg1_2_l_4 = ET.SubElement(self.physical_dimension_TiNeg1_2_long_name, 'L-4')
-        self.variables['physical_dimension_TiNeg1_2_l_4'] = self.physical_dimension_TiNeg1_2_l_4
-        self.physical_dimension_TiNeg1_2_l_4.text = 'Rotational Speed'
-        self.physical_dimension_TiNeg1_2_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_TiNeg1_2_length_exp = ET.SubElement(self.physical_dimension_TiNeg1_2, 'LENGTH-EXP')
-        self.variables['physical_dimension_TiNeg1_2_length_exp'] = self.physical_dimension_TiNeg1_2_length_exp
-        self.physical_dimension_TiNeg1_2_length_exp.text = '0'
-        self.physical_dimension_TiNeg1_2_mass_exp = ET.SubElement(self.physical_dimension_TiNeg1_2, 'MASS-EXP')
-        self.variables['physical_dimension_TiNeg1_2_mass_exp'] = self.physical_dimension_TiNeg1_2_mass_exp
-        self.physical_dimension_TiNeg1_2_mass_exp.text = '0'
-        self.physical_dimension_TiNeg1_2_time_exp = ET.SubElement(self.physical_dimension_TiNeg1_2, 'TIME-EXP')
-        self.variables['physical_dimension_TiNeg1_2_time_exp'] = self.physical_dimension_TiNeg1_2_time_exp
-        self.physical_dimension_TiNeg1_2_time_exp.text = '-1'
-        self.physical_dimension_TiNeg1_2_current_exp = ET.SubElement(self.physical_dimension_TiNeg1_2, 'CURRENT-EXP')
-        self.variables['physical_dimension_TiNeg1_2_current_exp'] = self.physical_dimension_TiNeg1_2_current_exp
-        self.physical_dimension_TiNeg1_2_current_exp.text = '0'
-        self.physical_dimension_TiNeg1_2_temperature_exp = ET.SubElement(self.physical_dimension_TiNeg1_2, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_TiNeg1_2_temperature_exp'] = self.physical_dimension_TiNeg1_2_temperature_exp
-        self.physical_dimension_TiNeg1_2_temperature_exp.text = '0'
-        self.physical_dimension_TiNeg1_2_molar_amount_exp = ET.SubElement(self.physical_dimension_TiNeg1_2, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_TiNeg1_2_molar_amount_exp'] = self.physical_dimension_TiNeg1_2_molar_amount_exp
-        self.physical_dimension_TiNeg1_2_molar_amount_exp.text = '0'
-        self.physical_dimension_TiNeg1_2_luminous_intensity_exp = ET.SubElement(self.physical_dimension_TiNeg1_2, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_TiNeg1_2_luminous_intensity_exp'] = self.physical_dimension_TiNeg1_2_luminous_intensity_exp
-        self.physical_dimension_TiNeg1_2_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_TiNeg1_3 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_TiNeg1_3'] = self.physical_dimension_TiNeg1_3
-        self.physical_dimension_TiNeg1_3_short_name = ET.SubElement(self.physical_dimension_TiNeg1_3, 'SHORT-NAME')
-        self.variables['physical_dimension_TiNeg1_3_short_name'] = self.physical_dimension_TiNeg1_3_short_name
-        self.physical_dimension_TiNeg1_3_short_name.text = 'TiNeg1_3'
-        self.physical_dimension_TiNeg1_3_long_name = ET.SubElement(self.physical_dimension_TiNeg1_3, 'LONG-NAME')
-        self.variables['physical_dimension_TiNeg1_3_long_name'] = self.physical_dimension_TiNeg1_3_long_name
-        self.physical_dimension_TiNeg1_3_l_4 = ET.SubElement(self.physical_dimension_TiNeg1_3_long_name, 'L-4')
-        self.variables['physical_dimension_TiNeg1_3_l_4'] = self.physical_dimension_TiNeg1_3_l_4
-        self.physical_dimension_TiNeg1_3_l_4.text = 'Transfer Rate'
-        self.physical_dimension_TiNeg1_3_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_TiNeg1_3_length_exp = ET.SubElement(self.physical_dimension_TiNeg1_3, 'LENGTH-EXP')
-        self.variables['physical_dimension_TiNeg1_3_length_exp'] = self.physical_dimension_TiNeg1_3_length_exp
-        self.physical_dimension_TiNeg1_3_length_exp.text = '0'
-        self.physical_dimension_TiNeg1_3_mass_exp = ET.SubElement(self.physical_dimension_TiNeg1_3, 'MASS-EXP')
-        self.variables['physical_dimension_TiNeg1_3_mass_exp'] = self.physical_dimension_TiNeg1_3_mass_exp
-        self.physical_dimension_TiNeg1_3_mass_exp.text = '0'
-        self.physical_dimension_TiNeg1_3_time_exp = ET.SubElement(self.physical_dimension_TiNeg1_3, 'TIME-EXP')
-        self.variables['physical_dimension_TiNeg1_3_time_exp'] = self.physical_dimension_TiNeg1_3_time_exp
-        self.physical_dimension_TiNeg1_3_time_exp.text = '-1'
-        self.physical_dimension_TiNeg1_3_current_exp = ET.SubElement(self.physical_dimension_TiNeg1_3, 'CURRENT-EXP')
-        self.variables['physical_dimension_TiNeg1_3_current_exp'] = self.physical_dimension_TiNeg1_3_current_exp
-        self.physical_dimension_TiNeg1_3_current_exp.text = '0'
-        self.physical_dimension_TiNeg1_3_temperature_exp = ET.SubElement(self.physical_dimension_TiNeg1_3, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_TiNeg1_3_temperature_exp'] = self.physical_dimension_TiNeg1_3_temperature_exp
-        self.physical_dimension_TiNeg1_3_temperature_exp.text = '0'
-        self.physical_dimension_TiNeg1_3_molar_amount_exp = ET.SubElement(self.physical_dimension_TiNeg1_3, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_TiNeg1_3_molar_amount_exp'] = self.physical_dimension_TiNeg1_3_molar_amount_exp
-        self.physical_dimension_TiNeg1_3_molar_amount_exp.text = '0'
-        self.physical_dimension_TiNeg1_3_luminous_intensity_exp = ET.SubElement(self.physical_dimension_TiNeg1_3, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_TiNeg1_3_luminous_intensity_exp'] = self.physical_dimension_TiNeg1_3_luminous_intensity_exp
-        self.physical_dimension_TiNeg1_3_luminous_intensity_exp.text = '0'
-        
-        self.physical_dimension_TiNeg2 = ET.SubElement(self.PhysicalDimensions_folder_elements, 'PHYSICAL-DIMENSION')
-        self.variables['physical_dimension_TiNeg2'] = self.physical_dimension_TiNeg2
-        self.physical_dimension_TiNeg2_short_name = ET.SubElement(self.physical_dimension_TiNeg2, 'SHORT-NAME')
-        self.variables['physical_dimension_TiNeg2_short_name'] = self.physical_dimension_TiNeg2_short_name
-        self.physical_dimension_TiNeg2_short_name.text = 'TiNeg2'
-        self.physical_dimension_TiNeg2_long_name = ET.SubElement(self.physical_dimension_TiNeg2, 'LONG-NAME')
-        self.variables['physical_dimension_TiNeg2_long_name'] = self.physical_dimension_TiNeg2_long_name
-        self.physical_dimension_TiNeg2_l_4 = ET.SubElement(self.physical_dimension_TiNeg2_long_name, 'L-4')
-        self.variables['physical_dimension_TiNeg2_l_4'] = self.physical_dimension_TiNeg2_l_4
-        self.physical_dimension_TiNeg2_l_4.text = 'Rotational Speed Gradient'
-        self.physical_dimension_TiNeg2_l_4.attrib = {'L': 'EN'}
-        self.physical_dimension_TiNeg2_length_exp = ET.SubElement(self.physical_dimension_TiNeg2, 'LENGTH-EXP')
-        self.variables['physical_dimension_TiNeg2_length_exp'] = self.physical_dimension_TiNeg2_length_exp
-        self.physical_dimension_TiNeg2_length_exp.text = '0'
-        self.physical_dimension_TiNeg2_mass_exp = ET.SubElement(self.physical_dimension_TiNeg2, 'MASS-EXP')
-        self.variables['physical_dimension_TiNeg2_mass_exp'] = self.physical_dimension_TiNeg2_mass_exp
-        self.physical_dimension_TiNeg2_mass_exp.text = '0'
-        self.physical_dimension_TiNeg2_time_exp = ET.SubElement(self.physical_dimension_TiNeg2, 'TIME-EXP')
-        self.variables['physical_dimension_TiNeg2_time_exp'] = self.physical_dimension_TiNeg2_time_exp
-        self.physical_dimension_TiNeg2_time_exp.text = '-2'
-        self.physical_dimension_TiNeg2_current_exp = ET.SubElement(self.physical_dimension_TiNeg2, 'CURRENT-EXP')
-        self.variables['physical_dimension_TiNeg2_current_exp'] = self.physical_dimension_TiNeg2_current_exp
-        self.physical_dimension_TiNeg2_current_exp.text = '0'
-        self.physical_dimension_TiNeg2_temperature_exp = ET.SubElement(self.physical_dimension_TiNeg2, 'TEMPERATURE-EXP')
-        self.variables['physical_dimension_TiNeg2_temperature_exp'] = self.physical_dimension_TiNeg2_temperature_exp
-        self.physical_dimension_TiNeg2_temperature_exp.text = '0'
-        self.physical_dimension_TiNeg2_molar_amount_exp = ET.SubElement(self.physical_dimension_TiNeg2, 'MOLAR-AMOUNT-EXP')
-        self.variables['physical_dimension_TiNeg2_molar_amount_exp'] = self.physical_dimension_TiNeg2_molar_amount_exp
-        self.physical_dimension_TiNeg2_molar_amount_exp.text = '0'
-        self.physical_dimension_TiNeg2_luminous_intensity_exp = ET.SubElement(self.physical_dimension_TiNeg2, 'LUMINOUS-INTENSITY-EXP')
-        self.variables['physical_dimension_TiNeg2_luminous_intensity_exp'] = self.physical_dimension_TiNeg2_luminous_intensity_exp
-        self.physical_dimension_TiNeg2_luminous_intensity_exp.text = '0'
-        
-        self.Units_folder = ET.SubElement(self.AUTOSAR_PhysicalUnits_subfolder, 'AR-PACKAGE')
-        self.variables['Units_folder'] = self.Units_folder
-        self.Units_folder_short_name = ET.SubElement(self.Units_folder, 'SHORT-NAME')
-        self.variables['Units_folder_short_name'] = self.Units_folder_short_name
-        self.Units_folder_short_name.text = 'Units'
-        self.Units_folder_category4 = ET.SubElement(self.Units_folder, 'CATEGORY')
-        self.variables['Units_folder_category4'] = self.Units_folder_category4
-        self.Units_folder_category4.text = 'STANDARD'
-        self.Units_folder_reference_bases = ET.SubElement(self.Units_folder, 'REFERENCE-BASES')
-        self.variables['Units_folder_reference_bases'] = self.Units_folder_reference_bases
-        self.Units_folder_reference_base = ET.SubElement(self.Units_folder_reference_bases, 'REFERENCE-BASE')
-        self.variables['Units_folder_reference_base'] = self.Units_folder_reference_base
-        self.Units_folder_reference_base_short_label = ET.SubElement(self.Units_folder_reference_base, 'SHORT-LABEL')
-        self.variables['Units_folder_reference_base_short_label'] = self.Units_folder_reference_base_short_label
-        self.Units_folder_reference_base_short_label.text = 'PhysicalDimensions'
-        self.Units_folder_reference_base_is_default = ET.SubElement(self.Units_folder_reference_base, 'IS-DEFAULT')
-        self.variables['Units_folder_reference_base_is_default'] = self.Units_folder_reference_base_is_default
-        self.Units_folder_reference_base_is_default.text = 'false'
-        self.Units_folder_reference_base_package_ref = ET.SubElement(self.Units_folder_reference_base, 'PACKAGE-REF')
-        self.variables['Units_folder_reference_base_package_ref'] = self.Units_folder_reference_base_package_ref
-        self.Units_folder_reference_base_package_ref.text = '/AUTOSAR/AUTOSAR_PhysicalUnits/PhysicalDimensions'
-        self.Units_folder_reference_base_package_ref.attrib = {'DEST': 'AR-PACKAGE'}
-
-        self.Units_folder_elements = ET.SubElement(self.Units_folder, 'ELEMENTS')
-        self.variables['Units_folder_elements'] = self.Units_folder_elements
-
-        self.unit_Ampr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Ampr'] = self.unit_Ampr
-        self.unit_Ampr_short_name = ET.SubElement(self.unit_Ampr, 'SHORT-NAME')
-        self.variables['unit_Ampr_short_name'] = self.unit_Ampr_short_name
-        self.unit_Ampr_short_name.text = 'Ampr'
-        self.unit_Ampr_long_name = ET.SubElement(self.unit_Ampr, 'LONG-NAME')
-        self.variables['unit_Ampr_long_name'] = self.unit_Ampr_long_name
-        self.unit_Ampr_l_4 = ET.SubElement(self.unit_Ampr_long_name, 'L-4')
-        self.variables['unit_Ampr_l_4'] = self.unit_Ampr_l_4
-        self.unit_Ampr_l_4.text = 'Ampere'
-        self.unit_Ampr_l_4.attrib = {'L': 'EN'}
-        self.unit_Ampr_display_name = ET.SubElement(self.unit_Ampr, 'DISPLAY-NAME')
-        self.variables['unit_Ampr_display_name'] = self.unit_Ampr_display_name
-        self.unit_Ampr_display_name.text = 'A'
-        self.unit_Ampr_factor_si_to_unit = ET.SubElement(self.unit_Ampr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Ampr_factor_si_to_unit'] = self.unit_Ampr_factor_si_to_unit
-        self.unit_Ampr_factor_si_to_unit.text = '1'
-        self.unit_Ampr_offset_si_to_unit = ET.SubElement(self.unit_Ampr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Ampr_offset_si_to_unit'] = self.unit_Ampr_offset_si_to_unit
-        self.unit_Ampr_offset_si_to_unit.text = '0'
-        self.unit_Ampr_physical_dimension_ref = ET.SubElement(self.unit_Ampr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Ampr_physical_dimension_ref'] = self.unit_Ampr_physical_dimension_ref
-        self.unit_Ampr_physical_dimension_ref.text = 'I1'
-        self.unit_Ampr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_AmprPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_AmprPerSec'] = self.unit_AmprPerSec
-        self.unit_AmprPerSec_short_name = ET.SubElement(self.unit_AmprPerSec, 'SHORT-NAME')
-        self.variables['unit_AmprPerSec_short_name'] = self.unit_AmprPerSec_short_name
-        self.unit_AmprPerSec_short_name.text = 'AmprPerSec'
-        self.unit_AmprPerSec_long_name = ET.SubElement(self.unit_AmprPerSec, 'LONG-NAME')
-        self.variables['unit_AmprPerSec_long_name'] = self.unit_AmprPerSec_long_name
-        self.unit_AmprPerSec_l_4 = ET.SubElement(self.unit_AmprPerSec_long_name, 'L-4')
-        self.variables['unit_AmprPerSec_l_4'] = self.unit_AmprPerSec_l_4
-        self.unit_AmprPerSec_l_4.text = 'Ampere Per Second'
-        self.unit_AmprPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_AmprPerSec_display_name = ET.SubElement(self.unit_AmprPerSec, 'DISPLAY-NAME')
-        self.variables['unit_AmprPerSec_display_name'] = self.unit_AmprPerSec_display_name
-        self.unit_AmprPerSec_display_name.text = 'A/s'
-        self.unit_AmprPerSec_factor_si_to_unit = ET.SubElement(self.unit_AmprPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_AmprPerSec_factor_si_to_unit'] = self.unit_AmprPerSec_factor_si_to_unit
-        self.unit_AmprPerSec_factor_si_to_unit.text = '1'
-        self.unit_AmprPerSec_offset_si_to_unit = ET.SubElement(self.unit_AmprPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_AmprPerSec_offset_si_to_unit'] = self.unit_AmprPerSec_offset_si_to_unit
-        self.unit_AmprPerSec_offset_si_to_unit.text = '0'
-        self.unit_AmprPerSec_physical_dimension_ref = ET.SubElement(self.unit_AmprPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_AmprPerSec_physical_dimension_ref'] = self.unit_AmprPerSec_physical_dimension_ref
-        self.unit_AmprPerSec_physical_dimension_ref.text = 'TiNeg1I1'
-        self.unit_AmprPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_AmprSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_AmprSec'] = self.unit_AmprSec
-        self.unit_AmprSec_short_name = ET.SubElement(self.unit_AmprSec, 'SHORT-NAME')
-        self.variables['unit_AmprSec_short_name'] = self.unit_AmprSec_short_name
-        self.unit_AmprSec_short_name.text = 'AmprSec'
-        self.unit_AmprSec_long_name = ET.SubElement(self.unit_AmprSec, 'LONG-NAME')
-        self.variables['unit_AmprSec_long_name'] = self.unit_AmprSec_long_name
-        self.unit_AmprSec_l_4 = ET.SubElement(self.unit_AmprSec_long_name, 'L-4')
-        self.variables['unit_AmprSec_l_4'] = self.unit_AmprSec_l_4
-        self.unit_AmprSec_l_4.text = 'Amperesecond'
-        self.unit_AmprSec_l_4.attrib = {'L': 'EN'}
-        self.unit_AmprSec_display_name = ET.SubElement(self.unit_AmprSec, 'DISPLAY-NAME')
-        self.variables['unit_AmprSec_display_name'] = self.unit_AmprSec_display_name
-        self.unit_AmprSec_display_name.text = 'As'
-        self.unit_AmprSec_factor_si_to_unit = ET.SubElement(self.unit_AmprSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_AmprSec_factor_si_to_unit'] = self.unit_AmprSec_factor_si_to_unit
-        self.unit_AmprSec_factor_si_to_unit.text = '1'
-        self.unit_AmprSec_offset_si_to_unit = ET.SubElement(self.unit_AmprSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_AmprSec_offset_si_to_unit'] = self.unit_AmprSec_offset_si_to_unit
-        self.unit_AmprSec_offset_si_to_unit.text = '0'
-        self.unit_AmprSec_physical_dimension_ref = ET.SubElement(self.unit_AmprSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_AmprSec_physical_dimension_ref'] = self.unit_AmprSec_physical_dimension_ref
-        self.unit_AmprSec_physical_dimension_ref.text = 'T1I1'
-        self.unit_AmprSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Bar = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Bar'] = self.unit_Bar
-        self.unit_Bar_short_name = ET.SubElement(self.unit_Bar, 'SHORT-NAME')
-        self.variables['unit_Bar_short_name'] = self.unit_Bar_short_name
-        self.unit_Bar_short_name.text = 'Bar'
-        self.unit_Bar_long_name = ET.SubElement(self.unit_Bar, 'LONG-NAME')
-        self.variables['unit_Bar_long_name'] = self.unit_Bar_long_name
-        self.unit_Bar_l_4 = ET.SubElement(self.unit_Bar_long_name, 'L-4')
-        self.variables['unit_Bar_l_4'] = self.unit_Bar_l_4
-        self.unit_Bar_l_4.text = 'Bar'
-        self.unit_Bar_l_4.attrib = {'L': 'EN'}
-        self.unit_Bar_display_name = ET.SubElement(self.unit_Bar, 'DISPLAY-NAME')
-        self.variables['unit_Bar_display_name'] = self.unit_Bar_display_name
-        self.unit_Bar_display_name.text = 'bar'
-        self.unit_Bar_factor_si_to_unit = ET.SubElement(self.unit_Bar, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Bar_factor_si_to_unit'] = self.unit_Bar_factor_si_to_unit
-        self.unit_Bar_factor_si_to_unit.text = '1E-05'
-        self.unit_Bar_offset_si_to_unit = ET.SubElement(self.unit_Bar, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Bar_offset_si_to_unit'] = self.unit_Bar_offset_si_to_unit
-        self.unit_Bar_offset_si_to_unit.text = '0'
-        self.unit_Bar_physical_dimension_ref = ET.SubElement(self.unit_Bar, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Bar_physical_dimension_ref'] = self.unit_Bar_physical_dimension_ref
-        self.unit_Bar_physical_dimension_ref.text = 'LenNeg1M1TiNeg2'
-        self.unit_Bar_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_BarPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_BarPerSec'] = self.unit_BarPerSec
-        self.unit_BarPerSec_short_name = ET.SubElement(self.unit_BarPerSec, 'SHORT-NAME')
-        self.variables['unit_BarPerSec_short_name'] = self.unit_BarPerSec_short_name
-        self.unit_BarPerSec_short_name.text = 'BarPerSec'
-        self.unit_BarPerSec_long_name = ET.SubElement(self.unit_BarPerSec, 'LONG-NAME')
-        self.variables['unit_BarPerSec_long_name'] = self.unit_BarPerSec_long_name
-        self.unit_BarPerSec_l_4 = ET.SubElement(self.unit_BarPerSec_long_name, 'L-4')
-        self.variables['unit_BarPerSec_l_4'] = self.unit_BarPerSec_l_4
-        self.unit_BarPerSec_l_4.text = 'Bar Per Second'
-        self.unit_BarPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_BarPerSec_display_name = ET.SubElement(self.unit_BarPerSec, 'DISPLAY-NAME')
-        self.variables['unit_BarPerSec_display_name'] = self.unit_BarPerSec_display_name
-        self.unit_BarPerSec_display_name.text = 'bar/s'
-        self.unit_BarPerSec_factor_si_to_unit = ET.SubElement(self.unit_BarPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_BarPerSec_factor_si_to_unit'] = self.unit_BarPerSec_factor_si_to_unit
-        self.unit_BarPerSec_factor_si_to_unit.text = '1E-05'
-        self.unit_BarPerSec_offset_si_to_unit = ET.SubElement(self.unit_BarPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_BarPerSec_offset_si_to_unit'] = self.unit_BarPerSec_offset_si_to_unit
-        self.unit_BarPerSec_offset_si_to_unit.text = '0'
-        self.unit_BarPerSec_physical_dimension_ref = ET.SubElement(self.unit_BarPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_BarPerSec_physical_dimension_ref'] = self.unit_BarPerSec_physical_dimension_ref
-        self.unit_BarPerSec_physical_dimension_ref.text = 'LenNeg1M1TiNeg3'
-        self.unit_BarPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Bel = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Bel'] = self.unit_Bel
-        self.unit_Bel_short_name = ET.SubElement(self.unit_Bel, 'SHORT-NAME')
-        self.variables['unit_Bel_short_name'] = self.unit_Bel_short_name
-        self.unit_Bel_short_name.text = 'Bel'
-        self.unit_Bel_long_name = ET.SubElement(self.unit_Bel, 'LONG-NAME')
-        self.variables['unit_Bel_long_name'] = self.unit_Bel_long_name
-        self.unit_Bel_l_4 = ET.SubElement(self.unit_Bel_long_name, 'L-4')
-        self.variables['unit_Bel_l_4'] = self.unit_Bel_l_4
-        self.unit_Bel_l_4.text = 'Bel'
-        self.unit_Bel_l_4.attrib = {'L': 'EN'}
-        self.unit_Bel_display_name = ET.SubElement(self.unit_Bel, 'DISPLAY-NAME')
-        self.variables['unit_Bel_display_name'] = self.unit_Bel_display_name
-        self.unit_Bel_display_name.text = 'B'
-        self.unit_Bel_factor_si_to_unit = ET.SubElement(self.unit_Bel, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Bel_factor_si_to_unit'] = self.unit_Bel_factor_si_to_unit
-        self.unit_Bel_factor_si_to_unit.text = '1'
-        self.unit_Bel_offset_si_to_unit = ET.SubElement(self.unit_Bel, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Bel_offset_si_to_unit'] = self.unit_Bel_offset_si_to_unit
-        self.unit_Bel_offset_si_to_unit.text = '0'
-        self.unit_Bel_physical_dimension_ref = ET.SubElement(self.unit_Bel, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Bel_physical_dimension_ref'] = self.unit_Bel_physical_dimension_ref
-        self.unit_Bel_physical_dimension_ref.text = 'NoDimension_5'
-        self.unit_Bel_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Bit = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Bit'] = self.unit_Bit
-        self.unit_Bit_short_name = ET.SubElement(self.unit_Bit, 'SHORT-NAME')
-        self.variables['unit_Bit_short_name'] = self.unit_Bit_short_name
-        self.unit_Bit_short_name.text = 'Bit'
-        self.unit_Bit_long_name = ET.SubElement(self.unit_Bit, 'LONG-NAME')
-        self.variables['unit_Bit_long_name'] = self.unit_Bit_long_name
-        self.unit_Bit_l_4 = ET.SubElement(self.unit_Bit_long_name, 'L-4')
-        self.variables['unit_Bit_l_4'] = self.unit_Bit_l_4
-        self.unit_Bit_l_4.text = 'Bit'
-        self.unit_Bit_l_4.attrib = {'L': 'EN'}
-        self.unit_Bit_display_name = ET.SubElement(self.unit_Bit, 'DISPLAY-NAME')
-        self.variables['unit_Bit_display_name'] = self.unit_Bit_display_name
-        self.unit_Bit_display_name.text = 'bit'
-        self.unit_Bit_factor_si_to_unit = ET.SubElement(self.unit_Bit, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Bit_factor_si_to_unit'] = self.unit_Bit_factor_si_to_unit
-        self.unit_Bit_factor_si_to_unit.text = '1'
-        self.unit_Bit_offset_si_to_unit = ET.SubElement(self.unit_Bit, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Bit_offset_si_to_unit'] = self.unit_Bit_offset_si_to_unit
-        self.unit_Bit_offset_si_to_unit.text = '0'
-        self.unit_Bit_physical_dimension_ref = ET.SubElement(self.unit_Bit, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Bit_physical_dimension_ref'] = self.unit_Bit_physical_dimension_ref
-        self.unit_Bit_physical_dimension_ref.text = 'NoDimension_6'
-        self.unit_Bit_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_BitPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_BitPerSec'] = self.unit_BitPerSec
-        self.unit_BitPerSec_short_name = ET.SubElement(self.unit_BitPerSec, 'SHORT-NAME')
-        self.variables['unit_BitPerSec_short_name'] = self.unit_BitPerSec_short_name
-        self.unit_BitPerSec_short_name.text = 'BitPerSec'
-        self.unit_BitPerSec_long_name = ET.SubElement(self.unit_BitPerSec, 'LONG-NAME')
-        self.variables['unit_BitPerSec_long_name'] = self.unit_BitPerSec_long_name
-        self.unit_BitPerSec_l_4 = ET.SubElement(self.unit_BitPerSec_long_name, 'L-4')
-        self.variables['unit_BitPerSec_l_4'] = self.unit_BitPerSec_l_4
-        self.unit_BitPerSec_l_4.text = 'Bit Per Second'
-        self.unit_BitPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_BitPerSec_display_name = ET.SubElement(self.unit_BitPerSec, 'DISPLAY-NAME')
-        self.variables['unit_BitPerSec_display_name'] = self.unit_BitPerSec_display_name
-        self.unit_BitPerSec_display_name.text = 'bit/s'
-        self.unit_BitPerSec_factor_si_to_unit = ET.SubElement(self.unit_BitPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_BitPerSec_factor_si_to_unit'] = self.unit_BitPerSec_factor_si_to_unit
-        self.unit_BitPerSec_factor_si_to_unit.text = '1'
-        self.unit_BitPerSec_offset_si_to_unit = ET.SubElement(self.unit_BitPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_BitPerSec_offset_si_to_unit'] = self.unit_BitPerSec_offset_si_to_unit
-        self.unit_BitPerSec_offset_si_to_unit.text = '0'
-        self.unit_BitPerSec_physical_dimension_ref = ET.SubElement(self.unit_BitPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_BitPerSec_physical_dimension_ref'] = self.unit_BitPerSec_physical_dimension_ref
-        self.unit_BitPerSec_physical_dimension_ref.text = 'TiNeg1_3'
-        self.unit_BitPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_BytPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_BytPerSec'] = self.unit_BytPerSec
-        self.unit_BytPerSec_short_name = ET.SubElement(self.unit_BytPerSec, 'SHORT-NAME')
-        self.variables['unit_BytPerSec_short_name'] = self.unit_BytPerSec_short_name
-        self.unit_BytPerSec_short_name.text = 'BytPerSec'
-        self.unit_BytPerSec_long_name = ET.SubElement(self.unit_BytPerSec, 'LONG-NAME')
-        self.variables['unit_BytPerSec_long_name'] = self.unit_BytPerSec_long_name
-        self.unit_BytPerSec_l_4 = ET.SubElement(self.unit_BytPerSec_long_name, 'L-4')
-        self.variables['unit_BytPerSec_l_4'] = self.unit_BytPerSec_l_4
-        self.unit_BytPerSec_l_4.text = 'Byte Per Second'
-        self.unit_BytPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_BytPerSec_display_name = ET.SubElement(self.unit_BytPerSec, 'DISPLAY-NAME')
-        self.variables['unit_BytPerSec_display_name'] = self.unit_BytPerSec_display_name
-        self.unit_BytPerSec_display_name.text = 'Byte/s'
-        self.unit_BytPerSec_factor_si_to_unit = ET.SubElement(self.unit_BytPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_BytPerSec_factor_si_to_unit'] = self.unit_BytPerSec_factor_si_to_unit
-        self.unit_BytPerSec_factor_si_to_unit.text = '0.125'
-        self.unit_BytPerSec_offset_si_to_unit = ET.SubElement(self.unit_BytPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_BytPerSec_offset_si_to_unit'] = self.unit_BytPerSec_offset_si_to_unit
-        self.unit_BytPerSec_offset_si_to_unit.text = '0'
-        self.unit_BytPerSec_physical_dimension_ref = ET.SubElement(self.unit_BytPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_BytPerSec_physical_dimension_ref'] = self.unit_BytPerSec_physical_dimension_ref
-        self.unit_BytPerSec_physical_dimension_ref.text = 'TiNeg1_3'
-        self.unit_BytPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Byte = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Byte'] = self.unit_Byte
-        self.unit_Byte_short_name = ET.SubElement(self.unit_Byte, 'SHORT-NAME')
-        self.variables['unit_Byte_short_name'] = self.unit_Byte_short_name
-        self.unit_Byte_short_name.text = 'Byte'
-        self.unit_Byte_long_name = ET.SubElement(self.unit_Byte, 'LONG-NAME')
-        self.variables['unit_Byte_long_name'] = self.unit_Byte_long_name
-        self.unit_Byte_l_4 = ET.SubElement(self.unit_Byte_long_name, 'L-4')
-        self.variables['unit_Byte_l_4'] = self.unit_Byte_l_4
-        self.unit_Byte_l_4.text = 'Byte'
-        self.unit_Byte_l_4.attrib = {'L': 'EN'}
-        self.unit_Byte_display_name = ET.SubElement(self.unit_Byte, 'DISPLAY-NAME')
-        self.variables['unit_Byte_display_name'] = self.unit_Byte_display_name
-        self.unit_Byte_display_name.text = 'Byte'
-        self.unit_Byte_factor_si_to_unit = ET.SubElement(self.unit_Byte, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Byte_factor_si_to_unit'] = self.unit_Byte_factor_si_to_unit
-        self.unit_Byte_factor_si_to_unit.text = '0.125'
-        self.unit_Byte_offset_si_to_unit = ET.SubElement(self.unit_Byte, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Byte_offset_si_to_unit'] = self.unit_Byte_offset_si_to_unit
-        self.unit_Byte_offset_si_to_unit.text = '0'
-        self.unit_Byte_physical_dimension_ref = ET.SubElement(self.unit_Byte, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Byte_physical_dimension_ref'] = self.unit_Byte_physical_dimension_ref
-        self.unit_Byte_physical_dimension_ref.text = 'NoDimension_6'
-        self.unit_Byte_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Cd = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Cd'] = self.unit_Cd
-        self.unit_Cd_short_name = ET.SubElement(self.unit_Cd, 'SHORT-NAME')
-        self.variables['unit_Cd_short_name'] = self.unit_Cd_short_name
-        self.unit_Cd_short_name.text = 'Cd'
-        self.unit_Cd_long_name = ET.SubElement(self.unit_Cd, 'LONG-NAME')
-        self.variables['unit_Cd_long_name'] = self.unit_Cd_long_name
-        self.unit_Cd_l_4 = ET.SubElement(self.unit_Cd_long_name, 'L-4')
-        self.variables['unit_Cd_l_4'] = self.unit_Cd_l_4
-        self.unit_Cd_l_4.text = 'Candela'
-        self.unit_Cd_l_4.attrib = {'L': 'EN'}
-        self.unit_Cd_display_name = ET.SubElement(self.unit_Cd, 'DISPLAY-NAME')
-        self.variables['unit_Cd_display_name'] = self.unit_Cd_display_name
-        self.unit_Cd_display_name.text = 'cd'
-        self.unit_Cd_factor_si_to_unit = ET.SubElement(self.unit_Cd, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Cd_factor_si_to_unit'] = self.unit_Cd_factor_si_to_unit
-        self.unit_Cd_factor_si_to_unit.text = '1'
-        self.unit_Cd_offset_si_to_unit = ET.SubElement(self.unit_Cd, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Cd_offset_si_to_unit'] = self.unit_Cd_offset_si_to_unit
-        self.unit_Cd_offset_si_to_unit.text = '0'
-        self.unit_Cd_physical_dimension_ref = ET.SubElement(self.unit_Cd, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Cd_physical_dimension_ref'] = self.unit_Cd_physical_dimension_ref
-        self.unit_Cd_physical_dimension_ref.text = 'Illmn1'
-        self.unit_Cd_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_CentiMtr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_CentiMtr'] = self.unit_CentiMtr
-        self.unit_CentiMtr_short_name = ET.SubElement(self.unit_CentiMtr, 'SHORT-NAME')
-        self.variables['unit_CentiMtr_short_name'] = self.unit_CentiMtr_short_name
-        self.unit_CentiMtr_short_name.text = 'CentiMtr'
-        self.unit_CentiMtr_long_name = ET.SubElement(self.unit_CentiMtr, 'LONG-NAME')
-        self.variables['unit_CentiMtr_long_name'] = self.unit_CentiMtr_long_name
-        self.unit_CentiMtr_l_4 = ET.SubElement(self.unit_CentiMtr_long_name, 'L-4')
-        self.variables['unit_CentiMtr_l_4'] = self.unit_CentiMtr_l_4
-        self.unit_CentiMtr_l_4.text = 'Centimeter'
-        self.unit_CentiMtr_l_4.attrib = {'L': 'EN'}
-        self.unit_CentiMtr_display_name = ET.SubElement(self.unit_CentiMtr, 'DISPLAY-NAME')
-        self.variables['unit_CentiMtr_display_name'] = self.unit_CentiMtr_display_name
-        self.unit_CentiMtr_display_name.text = 'cm'
-        self.unit_CentiMtr_factor_si_to_unit = ET.SubElement(self.unit_CentiMtr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_CentiMtr_factor_si_to_unit'] = self.unit_CentiMtr_factor_si_to_unit
-        self.unit_CentiMtr_factor_si_to_unit.text = '100'
-        self.unit_CentiMtr_offset_si_to_unit = ET.SubElement(self.unit_CentiMtr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_CentiMtr_offset_si_to_unit'] = self.unit_CentiMtr_offset_si_to_unit
-        self.unit_CentiMtr_offset_si_to_unit.text = '0'
-        self.unit_CentiMtr_physical_dimension_ref = ET.SubElement(self.unit_CentiMtr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_CentiMtr_physical_dimension_ref'] = self.unit_CentiMtr_physical_dimension_ref
-        self.unit_CentiMtr_physical_dimension_ref.text = 'Len1'
-        self.unit_CentiMtr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_CentiMtrSqd = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_CentiMtrSqd'] = self.unit_CentiMtrSqd
-        self.unit_CentiMtrSqd_short_name = ET.SubElement(self.unit_CentiMtrSqd, 'SHORT-NAME')
-        self.variables['unit_CentiMtrSqd_short_name'] = self.unit_CentiMtrSqd_short_name
-        self.unit_CentiMtrSqd_short_name.text = 'CentiMtrSqd'
-        self.unit_CentiMtrSqd_long_name = ET.SubElement(self.unit_CentiMtrSqd, 'LONG-NAME')
-        self.variables['unit_CentiMtrSqd_long_name'] = self.unit_CentiMtrSqd_long_name
-        self.unit_CentiMtrSqd_l_4 = ET.SubElement(self.unit_CentiMtrSqd_long_name, 'L-4')
-        self.variables['unit_CentiMtrSqd_l_4'] = self.unit_CentiMtrSqd_l_4
-        self.unit_CentiMtrSqd_l_4.text = 'Square Centimeter'
-        self.unit_CentiMtrSqd_l_4.attrib = {'L': 'EN'}
-        self.unit_CentiMtrSqd_display_name = ET.SubElement(self.unit_CentiMtrSqd, 'DISPLAY-NAME')
-        self.variables['unit_CentiMtrSqd_display_name'] = self.unit_CentiMtrSqd_display_name
-        self.unit_CentiMtrSqd_display_name.text = 'cm^2'
-        self.unit_CentiMtrSqd_factor_si_to_unit = ET.SubElement(self.unit_CentiMtrSqd, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_CentiMtrSqd_factor_si_to_unit'] = self.unit_CentiMtrSqd_factor_si_to_unit
-        self.unit_CentiMtrSqd_factor_si_to_unit.text = '10000'
-        self.unit_CentiMtrSqd_offset_si_to_unit = ET.SubElement(self.unit_CentiMtrSqd, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_CentiMtrSqd_offset_si_to_unit'] = self.unit_CentiMtrSqd_offset_si_to_unit
-        self.unit_CentiMtrSqd_offset_si_to_unit.text = '0'
-        self.unit_CentiMtrSqd_physical_dimension_ref = ET.SubElement(self.unit_CentiMtrSqd, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_CentiMtrSqd_physical_dimension_ref'] = self.unit_CentiMtrSqd_physical_dimension_ref
-        self.unit_CentiMtrSqd_physical_dimension_ref.text = 'Len2'
-        self.unit_CentiMtrSqd_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Coulomb = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Coulomb'] = self.unit_Coulomb
-        self.unit_Coulomb_short_name = ET.SubElement(self.unit_Coulomb, 'SHORT-NAME')
-        self.variables['unit_Coulomb_short_name'] = self.unit_Coulomb_short_name
-        self.unit_Coulomb_short_name.text = 'Coulomb'
-        self.unit_Coulomb_long_name = ET.SubElement(self.unit_Coulomb, 'LONG-NAME')
-        self.variables['unit_Coulomb_long_name'] = self.unit_Coulomb_long_name
-        self.unit_Coulomb_l_4 = ET.SubElement(self.unit_Coulomb_long_name, 'L-4')
-        self.variables['unit_Coulomb_l_4'] = self.unit_Coulomb_l_4
-        self.unit_Coulomb_l_4.text = 'Coulomb'
-        self.unit_Coulomb_l_4.attrib = {'L': 'EN'}
-        self.unit_Coulomb_display_name = ET.SubElement(self.unit_Coulomb, 'DISPLAY-NAME')
-        self.variables['unit_Coulomb_display_name'] = self.unit_Coulomb_display_name
-        self.unit_Coulomb_display_name.text = 'C'
-        self.unit_Coulomb_factor_si_to_unit = ET.SubElement(self.unit_Coulomb, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Coulomb_factor_si_to_unit'] = self.unit_Coulomb_factor_si_to_unit
-        self.unit_Coulomb_factor_si_to_unit.text = '1'
-        self.unit_Coulomb_offset_si_to_unit = ET.SubElement(self.unit_Coulomb, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Coulomb_offset_si_to_unit'] = self.unit_Coulomb_offset_si_to_unit
-        self.unit_Coulomb_offset_si_to_unit.text = '0'
-        self.unit_Coulomb_physical_dimension_ref = ET.SubElement(self.unit_Coulomb, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Coulomb_physical_dimension_ref'] = self.unit_Coulomb_physical_dimension_ref
-        self.unit_Coulomb_physical_dimension_ref.text = 'T1I1'
-        self.unit_Coulomb_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Day = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Day'] = self.unit_Day
-        self.unit_Day_short_name = ET.SubElement(self.unit_Day, 'SHORT-NAME')
-        self.variables['unit_Day_short_name'] = self.unit_Day_short_name
-        self.unit_Day_short_name.text = 'Day'
-        self.unit_Day_long_name = ET.SubElement(self.unit_Day, 'LONG-NAME')
-        self.variables['unit_Day_long_name'] = self.unit_Day_long_name
-        self.unit_Day_l_4 = ET.SubElement(self.unit_Day_long_name, 'L-4')
-        self.variables['unit_Day_l_4'] = self.unit_Day_l_4
-        self.unit_Day_l_4.text = 'Day'
-        self.unit_Day_l_4.attrib = {'L': 'EN'}
-        self.unit_Day_display_name = ET.SubElement(self.unit_Day, 'DISPLAY-NAME')
-        self.variables['unit_Day_display_name'] = self.unit_Day_display_name
-        self.unit_Day_display_name.text = 'd'
-        self.unit_Day_factor_si_to_unit = ET.SubElement(self.unit_Day, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Day_factor_si_to_unit'] = self.unit_Day_factor_si_to_unit
-        self.unit_Day_factor_si_to_unit.text = '1.15740740740741E-05'
-        self.unit_Day_offset_si_to_unit = ET.SubElement(self.unit_Day, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Day_offset_si_to_unit'] = self.unit_Day_offset_si_to_unit
-        self.unit_Day_offset_si_to_unit.text = '0'
-        self.unit_Day_physical_dimension_ref = ET.SubElement(self.unit_Day, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Day_physical_dimension_ref'] = self.unit_Day_physical_dimension_ref
-        self.unit_Day_physical_dimension_ref.text = 'Ti1'
-        self.unit_Day_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_DeciBel = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_DeciBel'] = self.unit_DeciBel
-        self.unit_DeciBel_short_name = ET.SubElement(self.unit_DeciBel, 'SHORT-NAME')
-        self.variables['unit_DeciBel_short_name'] = self.unit_DeciBel_short_name
-        self.unit_DeciBel_short_name.text = 'DeciBel'
-        self.unit_DeciBel_long_name = ET.SubElement(self.unit_DeciBel, 'LONG-NAME')
-        self.variables['unit_DeciBel_long_name'] = self.unit_DeciBel_long_name
-        self.unit_DeciBel_l_4 = ET.SubElement(self.unit_DeciBel_long_name, 'L-4')
-        self.variables['unit_DeciBel_l_4'] = self.unit_DeciBel_l_4
-        self.unit_DeciBel_l_4.text = 'Decibel'
-        self.unit_DeciBel_l_4.attrib = {'L': 'EN'}
-        self.unit_DeciBel_display_name = ET.SubElement(self.unit_DeciBel, 'DISPLAY-NAME')
-        self.variables['unit_DeciBel_display_name'] = self.unit_DeciBel_display_name
-        self.unit_DeciBel_display_name.text = 'dB'
-        self.unit_DeciBel_factor_si_to_unit = ET.SubElement(self.unit_DeciBel, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_DeciBel_factor_si_to_unit'] = self.unit_DeciBel_factor_si_to_unit
-        self.unit_DeciBel_factor_si_to_unit.text = '10'
-        self.unit_DeciBel_offset_si_to_unit = ET.SubElement(self.unit_DeciBel, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_DeciBel_offset_si_to_unit'] = self.unit_DeciBel_offset_si_to_unit
-        self.unit_DeciBel_offset_si_to_unit.text = '0'
-        self.unit_DeciBel_physical_dimension_ref = ET.SubElement(self.unit_DeciBel, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_DeciBel_physical_dimension_ref'] = self.unit_DeciBel_physical_dimension_ref
-        self.unit_DeciBel_physical_dimension_ref.text = 'NoDimension_5'
-        self.unit_DeciBel_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Deg = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Deg'] = self.unit_Deg
-        self.unit_Deg_short_name = ET.SubElement(self.unit_Deg, 'SHORT-NAME')
-        self.variables['unit_Deg_short_name'] = self.unit_Deg_short_name
-        self.unit_Deg_short_name.text = 'Deg'
-        self.unit_Deg_long_name = ET.SubElement(self.unit_Deg, 'LONG-NAME')
-        self.variables['unit_Deg_long_name'] = self.unit_Deg_long_name
-        self.unit_Deg_l_4 = ET.SubElement(self.unit_Deg_long_name, 'L-4')
-        self.variables['unit_Deg_l_4'] = self.unit_Deg_l_4
-        self.unit_Deg_l_4.text = 'Degree'
-        self.unit_Deg_l_4.attrib = {'L': 'EN'}
-        self.unit_Deg_display_name = ET.SubElement(self.unit_Deg, 'DISPLAY-NAME')
-        self.variables['unit_Deg_display_name'] = self.unit_Deg_display_name
-        self.unit_Deg_display_name.text = '°'
-        self.unit_Deg_factor_si_to_unit = ET.SubElement(self.unit_Deg, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Deg_factor_si_to_unit'] = self.unit_Deg_factor_si_to_unit
-        self.unit_Deg_factor_si_to_unit.text = '360'
-        self.unit_Deg_offset_si_to_unit = ET.SubElement(self.unit_Deg, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Deg_offset_si_to_unit'] = self.unit_Deg_offset_si_to_unit
-        self.unit_Deg_offset_si_to_unit.text = '0'
-        self.unit_Deg_physical_dimension_ref = ET.SubElement(self.unit_Deg, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Deg_physical_dimension_ref'] = self.unit_Deg_physical_dimension_ref
-        self.unit_Deg_physical_dimension_ref.text = 'NoDimension_2'
-        self.unit_Deg_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_DegCgrd = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_DegCgrd'] = self.unit_DegCgrd
-        self.unit_DegCgrd_short_name = ET.SubElement(self.unit_DegCgrd, 'SHORT-NAME')
-        self.variables['unit_DegCgrd_short_name'] = self.unit_DegCgrd_short_name
-        self.unit_DegCgrd_short_name.text = 'DegCgrd'
-        self.unit_DegCgrd_long_name = ET.SubElement(self.unit_DegCgrd, 'LONG-NAME')
-        self.variables['unit_DegCgrd_long_name'] = self.unit_DegCgrd_long_name
-        self.unit_DegCgrd_l_4 = ET.SubElement(self.unit_DegCgrd_long_name, 'L-4')
-        self.variables['unit_DegCgrd_l_4'] = self.unit_DegCgrd_l_4
-        self.unit_DegCgrd_l_4.text = 'Degree Celsius (Absolute Temperature)'
-        self.unit_DegCgrd_l_4.attrib = {'L': 'EN'}
-        self.unit_DegCgrd_display_name = ET.SubElement(self.unit_DegCgrd, 'DISPLAY-NAME')
-        self.variables['unit_DegCgrd_display_name'] = self.unit_DegCgrd_display_name
-        self.unit_DegCgrd_display_name.text = '°C'
-        self.unit_DegCgrd_factor_si_to_unit = ET.SubElement(self.unit_DegCgrd, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_DegCgrd_factor_si_to_unit'] = self.unit_DegCgrd_factor_si_to_unit
-        self.unit_DegCgrd_factor_si_to_unit.text = '1'
-        self.unit_DegCgrd_offset_si_to_unit = ET.SubElement(self.unit_DegCgrd, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_DegCgrd_offset_si_to_unit'] = self.unit_DegCgrd_offset_si_to_unit
-        self.unit_DegCgrd_offset_si_to_unit.text = '-273.15'
-        self.unit_DegCgrd_physical_dimension_ref = ET.SubElement(self.unit_DegCgrd, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_DegCgrd_physical_dimension_ref'] = self.unit_DegCgrd_physical_dimension_ref
-        self.unit_DegCgrd_physical_dimension_ref.text = 'T1'
-        self.unit_DegCgrd_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_DegPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_DegPerSec'] = self.unit_DegPerSec
-        self.unit_DegPerSec_short_name = ET.SubElement(self.unit_DegPerSec, 'SHORT-NAME')
-        self.variables['unit_DegPerSec_short_name'] = self.unit_DegPerSec_short_name
-        self.unit_DegPerSec_short_name.text = 'DegPerSec'
-        self.unit_DegPerSec_long_name = ET.SubElement(self.unit_DegPerSec, 'LONG-NAME')
-        self.variables['unit_DegPerSec_long_name'] = self.unit_DegPerSec_long_name
-        self.unit_DegPerSec_l_4 = ET.SubElement(self.unit_DegPerSec_long_name, 'L-4')
-        self.variables['unit_DegPerSec_l_4'] = self.unit_DegPerSec_l_4
-        self.unit_DegPerSec_l_4.text = 'Degree Per Sec'
-        self.unit_DegPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_DegPerSec_display_name = ET.SubElement(self.unit_DegPerSec, 'DISPLAY-NAME')
-        self.variables['unit_DegPerSec_display_name'] = self.unit_DegPerSec_display_name
-        self.unit_DegPerSec_display_name.text = '°/s'
-        self.unit_DegPerSec_factor_si_to_unit = ET.SubElement(self.unit_DegPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_DegPerSec_factor_si_to_unit'] = self.unit_DegPerSec_factor_si_to_unit
-        self.unit_DegPerSec_factor_si_to_unit.text = '360'
-        self.unit_DegPerSec_offset_si_to_unit = ET.SubElement(self.unit_DegPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_DegPerSec_offset_si_to_unit'] = self.unit_DegPerSec_offset_si_to_unit
-        self.unit_DegPerSec_offset_si_to_unit.text = '0'
-        self.unit_DegPerSec_physical_dimension_ref = ET.SubElement(self.unit_DegPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_DegPerSec_physical_dimension_ref'] = self.unit_DegPerSec_physical_dimension_ref
-        self.unit_DegPerSec_physical_dimension_ref.text = 'TiNeg1_2'
-        self.unit_DegPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Frd = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Frd'] = self.unit_Frd
-        self.unit_Frd_short_name = ET.SubElement(self.unit_Frd, 'SHORT-NAME')
-        self.variables['unit_Frd_short_name'] = self.unit_Frd_short_name
-        self.unit_Frd_short_name.text = 'Frd'
-        self.unit_Frd_long_name = ET.SubElement(self.unit_Frd, 'LONG-NAME')
-        self.variables['unit_Frd_long_name'] = self.unit_Frd_long_name
-        self.unit_Frd_l_4 = ET.SubElement(self.unit_Frd_long_name, 'L-4')
-        self.variables['unit_Frd_l_4'] = self.unit_Frd_l_4
-        self.unit_Frd_l_4.text = 'Farad'
-        self.unit_Frd_l_4.attrib = {'L': 'EN'}
-        self.unit_Frd_display_name = ET.SubElement(self.unit_Frd, 'DISPLAY-NAME')
-        self.variables['unit_Frd_display_name'] = self.unit_Frd_display_name
-        self.unit_Frd_display_name.text = 'F'
-        self.unit_Frd_factor_si_to_unit = ET.SubElement(self.unit_Frd, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Frd_factor_si_to_unit'] = self.unit_Frd_factor_si_to_unit
-        self.unit_Frd_factor_si_to_unit.text = '1'
-        self.unit_Frd_offset_si_to_unit = ET.SubElement(self.unit_Frd, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Frd_offset_si_to_unit'] = self.unit_Frd_offset_si_to_unit
-        self.unit_Frd_offset_si_to_unit.text = '0'
-        self.unit_Frd_physical_dimension_ref = ET.SubElement(self.unit_Frd, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Frd_physical_dimension_ref'] = self.unit_Frd_physical_dimension_ref
-        self.unit_Frd_physical_dimension_ref.text = 'LenNeg2MNeg1Ti4I2'
-        self.unit_Frd_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Gr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Gr'] = self.unit_Gr
-        self.unit_Gr_short_name = ET.SubElement(self.unit_Gr, 'SHORT-NAME')
-        self.variables['unit_Gr_short_name'] = self.unit_Gr_short_name
-        self.unit_Gr_short_name.text = 'Gr'
-        self.unit_Gr_long_name = ET.SubElement(self.unit_Gr, 'LONG-NAME')
-        self.variables['unit_Gr_long_name'] = self.unit_Gr_long_name
-        self.unit_Gr_l_4 = ET.SubElement(self.unit_Gr_long_name, 'L-4')
-        self.variables['unit_Gr_l_4'] = self.unit_Gr_l_4
-        self.unit_Gr_l_4.text = 'Gram'
-        self.unit_Gr_l_4.attrib = {'L': 'EN'}
-        self.unit_Gr_display_name = ET.SubElement(self.unit_Gr, 'DISPLAY-NAME')
-        self.variables['unit_Gr_display_name'] = self.unit_Gr_display_name
-        self.unit_Gr_display_name.text = 'g'
-        self.unit_Gr_factor_si_to_unit = ET.SubElement(self.unit_Gr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Gr_factor_si_to_unit'] = self.unit_Gr_factor_si_to_unit
-        self.unit_Gr_factor_si_to_unit.text = '1000'
-        self.unit_Gr_offset_si_to_unit = ET.SubElement(self.unit_Gr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Gr_offset_si_to_unit'] = self.unit_Gr_offset_si_to_unit
-        self.unit_Gr_offset_si_to_unit.text = '0'
-        self.unit_Gr_physical_dimension_ref = ET.SubElement(self.unit_Gr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Gr_physical_dimension_ref'] = self.unit_Gr_physical_dimension_ref
-        self.unit_Gr_physical_dimension_ref.text = 'M1'
-        self.unit_Gr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_GrPerLtr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_GrPerLtr'] = self.unit_GrPerLtr
-        self.unit_GrPerLtr_short_name = ET.SubElement(self.unit_GrPerLtr, 'SHORT-NAME')
-        self.variables['unit_GrPerLtr_short_name'] = self.unit_GrPerLtr_short_name
-        self.unit_GrPerLtr_short_name.text = 'GrPerLtr'
-        self.unit_GrPerLtr_long_name = ET.SubElement(self.unit_GrPerLtr, 'LONG-NAME')
-        self.variables['unit_GrPerLtr_long_name'] = self.unit_GrPerLtr_long_name
-        self.unit_GrPerLtr_l_4 = ET.SubElement(self.unit_GrPerLtr_long_name, 'L-4')
-        self.variables['unit_GrPerLtr_l_4'] = self.unit_GrPerLtr_l_4
-        self.unit_GrPerLtr_l_4.text = 'Gram Per Liter'
-        self.unit_GrPerLtr_l_4.attrib = {'L': 'EN'}
-        self.unit_GrPerLtr_display_name = ET.SubElement(self.unit_GrPerLtr, 'DISPLAY-NAME')
-        self.variables['unit_GrPerLtr_display_name'] = self.unit_GrPerLtr_display_name
-        self.unit_GrPerLtr_display_name.text = 'g/l'
-        self.unit_GrPerLtr_factor_si_to_unit = ET.SubElement(self.unit_GrPerLtr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_GrPerLtr_factor_si_to_unit'] = self.unit_GrPerLtr_factor_si_to_unit
-        self.unit_GrPerLtr_factor_si_to_unit.text = '1'
-        self.unit_GrPerLtr_offset_si_to_unit = ET.SubElement(self.unit_GrPerLtr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_GrPerLtr_offset_si_to_unit'] = self.unit_GrPerLtr_offset_si_to_unit
-        self.unit_GrPerLtr_offset_si_to_unit.text = '0'
-        self.unit_GrPerLtr_physical_dimension_ref = ET.SubElement(self.unit_GrPerLtr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_GrPerLtr_physical_dimension_ref'] = self.unit_GrPerLtr_physical_dimension_ref
-        self.unit_GrPerLtr_physical_dimension_ref.text = 'LenNeg3M1'
-        self.unit_GrPerLtr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_GrPerMol = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_GrPerMol'] = self.unit_GrPerMol
-        self.unit_GrPerMol_short_name = ET.SubElement(self.unit_GrPerMol, 'SHORT-NAME')
-        self.variables['unit_GrPerMol_short_name'] = self.unit_GrPerMol_short_name
-        self.unit_GrPerMol_short_name.text = 'GrPerMol'
-        self.unit_GrPerMol_long_name = ET.SubElement(self.unit_GrPerMol, 'LONG-NAME')
-        self.variables['unit_GrPerMol_long_name'] = self.unit_GrPerMol_long_name
-        self.unit_GrPerMol_l_4 = ET.SubElement(self.unit_GrPerMol_long_name, 'L-4')
-        self.variables['unit_GrPerMol_l_4'] = self.unit_GrPerMol_l_4
-        self.unit_GrPerMol_l_4.text = 'Gram Per Mole'
-        self.unit_GrPerMol_l_4.attrib = {'L': 'EN'}
-        self.unit_GrPerMol_display_name = ET.SubElement(self.unit_GrPerMol, 'DISPLAY-NAME')
-        self.variables['unit_GrPerMol_display_name'] = self.unit_GrPerMol_display_name
-        self.unit_GrPerMol_display_name.text = 'g/mol'
-        self.unit_GrPerMol_factor_si_to_unit = ET.SubElement(self.unit_GrPerMol, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_GrPerMol_factor_si_to_unit'] = self.unit_GrPerMol_factor_si_to_unit
-        self.unit_GrPerMol_factor_si_to_unit.text = '1000'
-        self.unit_GrPerMol_offset_si_to_unit = ET.SubElement(self.unit_GrPerMol, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_GrPerMol_offset_si_to_unit'] = self.unit_GrPerMol_offset_si_to_unit
-        self.unit_GrPerMol_offset_si_to_unit.text = '0'
-        self.unit_GrPerMol_physical_dimension_ref = ET.SubElement(self.unit_GrPerMol, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_GrPerMol_physical_dimension_ref'] = self.unit_GrPerMol_physical_dimension_ref
-        self.unit_GrPerMol_physical_dimension_ref.text = 'M1AmntNeg1'
-        self.unit_GrPerMol_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_GrPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_GrPerSec'] = self.unit_GrPerSec
-        self.unit_GrPerSec_short_name = ET.SubElement(self.unit_GrPerSec, 'SHORT-NAME')
-        self.variables['unit_GrPerSec_short_name'] = self.unit_GrPerSec_short_name
-        self.unit_GrPerSec_short_name.text = 'GrPerSec'
-        self.unit_GrPerSec_long_name = ET.SubElement(self.unit_GrPerSec, 'LONG-NAME')
-        self.variables['unit_GrPerSec_long_name'] = self.unit_GrPerSec_long_name
-        self.unit_GrPerSec_l_4 = ET.SubElement(self.unit_GrPerSec_long_name, 'L-4')
-        self.variables['unit_GrPerSec_l_4'] = self.unit_GrPerSec_l_4
-        self.unit_GrPerSec_l_4.text = 'Gram Per Second'
-        self.unit_GrPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_GrPerSec_display_name = ET.SubElement(self.unit_GrPerSec, 'DISPLAY-NAME')
-        self.variables['unit_GrPerSec_display_name'] = self.unit_GrPerSec_display_name
-        self.unit_GrPerSec_display_name.text = 'g/s'
-        self.unit_GrPerSec_factor_si_to_unit = ET.SubElement(self.unit_GrPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_GrPerSec_factor_si_to_unit'] = self.unit_GrPerSec_factor_si_to_unit
-        self.unit_GrPerSec_factor_si_to_unit.text = '1000'
-        self.unit_GrPerSec_offset_si_to_unit = ET.SubElement(self.unit_GrPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_GrPerSec_offset_si_to_unit'] = self.unit_GrPerSec_offset_si_to_unit
-        self.unit_GrPerSec_offset_si_to_unit.text = '0'
-        self.unit_GrPerSec_physical_dimension_ref = ET.SubElement(self.unit_GrPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_GrPerSec_physical_dimension_ref'] = self.unit_GrPerSec_physical_dimension_ref
-        self.unit_GrPerSec_physical_dimension_ref.text = 'M1TiNeg1'
-        self.unit_GrPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_HectoPa = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_HectoPa'] = self.unit_HectoPa
-        self.unit_HectoPa_short_name = ET.SubElement(self.unit_HectoPa, 'SHORT-NAME')
-        self.variables['unit_HectoPa_short_name'] = self.unit_HectoPa_short_name
-        self.unit_HectoPa_short_name.text = 'HectoPa'
-        self.unit_HectoPa_long_name = ET.SubElement(self.unit_HectoPa, 'LONG-NAME')
-        self.variables['unit_HectoPa_long_name'] = self.unit_HectoPa_long_name
-        self.unit_HectoPa_l_4 = ET.SubElement(self.unit_HectoPa_long_name, 'L-4')
-        self.variables['unit_HectoPa_l_4'] = self.unit_HectoPa_l_4
-        self.unit_HectoPa_l_4.text = 'Hectopascal'
-        self.unit_HectoPa_l_4.attrib = {'L': 'EN'}
-        self.unit_HectoPa_display_name = ET.SubElement(self.unit_HectoPa, 'DISPLAY-NAME')
-        self.variables['unit_HectoPa_display_name'] = self.unit_HectoPa_display_name
-        self.unit_HectoPa_display_name.text = 'hPa'
-        self.unit_HectoPa_factor_si_to_unit = ET.SubElement(self.unit_HectoPa, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_HectoPa_factor_si_to_unit'] = self.unit_HectoPa_factor_si_to_unit
-        self.unit_HectoPa_factor_si_to_unit.text = '0.01'
-        self.unit_HectoPa_offset_si_to_unit = ET.SubElement(self.unit_HectoPa, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_HectoPa_offset_si_to_unit'] = self.unit_HectoPa_offset_si_to_unit
-        self.unit_HectoPa_offset_si_to_unit.text = '0'
-        self.unit_HectoPa_physical_dimension_ref = ET.SubElement(self.unit_HectoPa, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_HectoPa_physical_dimension_ref'] = self.unit_HectoPa_physical_dimension_ref
-        self.unit_HectoPa_physical_dimension_ref.text = 'LenNeg1M1TiNeg2'
-        self.unit_HectoPa_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_HectoPaPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_HectoPaPerSec'] = self.unit_HectoPaPerSec
-        self.unit_HectoPaPerSec_short_name = ET.SubElement(self.unit_HectoPaPerSec, 'SHORT-NAME')
-        self.variables['unit_HectoPaPerSec_short_name'] = self.unit_HectoPaPerSec_short_name
-        self.unit_HectoPaPerSec_short_name.text = 'HectoPaPerSec'
-        self.unit_HectoPaPerSec_long_name = ET.SubElement(self.unit_HectoPaPerSec, 'LONG-NAME')
-        self.variables['unit_HectoPaPerSec_long_name'] = self.unit_HectoPaPerSec_long_name
-        self.unit_HectoPaPerSec_l_4 = ET.SubElement(self.unit_HectoPaPerSec_long_name, 'L-4')
-        self.variables['unit_HectoPaPerSec_l_4'] = self.unit_HectoPaPerSec_l_4
-        self.unit_HectoPaPerSec_l_4.text = 'Hectopascal Per Second'
-        self.unit_HectoPaPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_HectoPaPerSec_display_name = ET.SubElement(self.unit_HectoPaPerSec, 'DISPLAY-NAME')
-        self.variables['unit_HectoPaPerSec_display_name'] = self.unit_HectoPaPerSec_display_name
-        self.unit_HectoPaPerSec_display_name.text = 'hPa/s'
-        self.unit_HectoPaPerSec_factor_si_to_unit = ET.SubElement(self.unit_HectoPaPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_HectoPaPerSec_factor_si_to_unit'] = self.unit_HectoPaPerSec_factor_si_to_unit
-        self.unit_HectoPaPerSec_factor_si_to_unit.text = '0.01'
-        self.unit_HectoPaPerSec_offset_si_to_unit = ET.SubElement(self.unit_HectoPaPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_HectoPaPerSec_offset_si_to_unit'] = self.unit_HectoPaPerSec_offset_si_to_unit
-        self.unit_HectoPaPerSec_offset_si_to_unit.text = '0'
-        self.unit_HectoPaPerSec_physical_dimension_ref = ET.SubElement(self.unit_HectoPaPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_HectoPaPerSec_physical_dimension_ref'] = self.unit_HectoPaPerSec_physical_dimension_ref
-        self.unit_HectoPaPerSec_physical_dimension_ref.text = 'LenNeg1M1TiNeg3'
-        self.unit_HectoPaPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_HectoPaPerVolt = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_HectoPaPerVolt'] = self.unit_HectoPaPerVolt
-        self.unit_HectoPaPerVolt_short_name = ET.SubElement(self.unit_HectoPaPerVolt, 'SHORT-NAME')
-        self.variables['unit_HectoPaPerVolt_short_name'] = self.unit_HectoPaPerVolt_short_name
-        self.unit_HectoPaPerVolt_short_name.text = 'HectoPaPerVolt'
-        self.unit_HectoPaPerVolt_long_name = ET.SubElement(self.unit_HectoPaPerVolt, 'LONG-NAME')
-        self.variables['unit_HectoPaPerVolt_long_name'] = self.unit_HectoPaPerVolt_long_name
-        self.unit_HectoPaPerVolt_l_4 = ET.SubElement(self.unit_HectoPaPerVolt_long_name, 'L-4')
-        self.variables['unit_HectoPaPerVolt_l_4'] = self.unit_HectoPaPerVolt_l_4
-        self.unit_HectoPaPerVolt_l_4.text = 'Hectopascal Per Volt'
-        self.unit_HectoPaPerVolt_l_4.attrib = {'L': 'EN'}
-        self.unit_HectoPaPerVolt_display_name = ET.SubElement(self.unit_HectoPaPerVolt, 'DISPLAY-NAME')
-        self.variables['unit_HectoPaPerVolt_display_name'] = self.unit_HectoPaPerVolt_display_name
-        self.unit_HectoPaPerVolt_display_name.text = 'hPa/V'
-        self.unit_HectoPaPerVolt_factor_si_to_unit = ET.SubElement(self.unit_HectoPaPerVolt, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_HectoPaPerVolt_factor_si_to_unit'] = self.unit_HectoPaPerVolt_factor_si_to_unit
-        self.unit_HectoPaPerVolt_factor_si_to_unit.text = '0.01'
-        self.unit_HectoPaPerVolt_offset_si_to_unit = ET.SubElement(self.unit_HectoPaPerVolt, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_HectoPaPerVolt_offset_si_to_unit'] = self.unit_HectoPaPerVolt_offset_si_to_unit
-        self.unit_HectoPaPerVolt_offset_si_to_unit.text = '0'
-        self.unit_HectoPaPerVolt_physical_dimension_ref = ET.SubElement(self.unit_HectoPaPerVolt, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_HectoPaPerVolt_physical_dimension_ref'] = self.unit_HectoPaPerVolt_physical_dimension_ref
-        self.unit_HectoPaPerVolt_physical_dimension_ref.text = 'LenNeg3Ti1I1_1'
-        self.unit_HectoPaPerVolt_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_HectoPaSecPerMtrCubd = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_HectoPaSecPerMtrCubd'] = self.unit_HectoPaSecPerMtrCubd
-        self.unit_HectoPaSecPerMtrCubd_short_name = ET.SubElement(self.unit_HectoPaSecPerMtrCubd, 'SHORT-NAME')
-        self.variables['unit_HectoPaSecPerMtrCubd_short_name'] = self.unit_HectoPaSecPerMtrCubd_short_name
-        self.unit_HectoPaSecPerMtrCubd_short_name.text = 'HectoPaSecPerMtrCubd'
-        self.unit_HectoPaSecPerMtrCubd_long_name = ET.SubElement(self.unit_HectoPaSecPerMtrCubd, 'LONG-NAME')
-        self.variables['unit_HectoPaSecPerMtrCubd_long_name'] = self.unit_HectoPaSecPerMtrCubd_long_name
-        self.unit_HectoPaSecPerMtrCubd_l_4 = ET.SubElement(self.unit_HectoPaSecPerMtrCubd_long_name, 'L-4')
-        self.variables['unit_HectoPaSecPerMtrCubd_l_4'] = self.unit_HectoPaSecPerMtrCubd_l_4
-        self.unit_HectoPaSecPerMtrCubd_l_4.text = 'Hectopascal Per Cubic Meter Per Second'
-        self.unit_HectoPaSecPerMtrCubd_l_4.attrib = {'L': 'EN'}
-        self.unit_HectoPaSecPerMtrCubd_display_name = ET.SubElement(self.unit_HectoPaSecPerMtrCubd, 'DISPLAY-NAME')
-        self.variables['unit_HectoPaSecPerMtrCubd_display_name'] = self.unit_HectoPaSecPerMtrCubd_display_name
-        self.unit_HectoPaSecPerMtrCubd_display_name.text = 'hPa/((m^3)/s)'
-        self.unit_HectoPaSecPerMtrCubd_factor_si_to_unit = ET.SubElement(self.unit_HectoPaSecPerMtrCubd, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_HectoPaSecPerMtrCubd_factor_si_to_unit'] = self.unit_HectoPaSecPerMtrCubd_factor_si_to_unit
-        self.unit_HectoPaSecPerMtrCubd_factor_si_to_unit.text = '0.01'
-        self.unit_HectoPaSecPerMtrCubd_offset_si_to_unit = ET.SubElement(self.unit_HectoPaSecPerMtrCubd, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_HectoPaSecPerMtrCubd_offset_si_to_unit'] = self.unit_HectoPaSecPerMtrCubd_offset_si_to_unit
-        self.unit_HectoPaSecPerMtrCubd_offset_si_to_unit.text = '0'
-        self.unit_HectoPaSecPerMtrCubd_physical_dimension_ref = ET.SubElement(self.unit_HectoPaSecPerMtrCubd, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_HectoPaSecPerMtrCubd_physical_dimension_ref'] = self.unit_HectoPaSecPerMtrCubd_physical_dimension_ref
-        self.unit_HectoPaSecPerMtrCubd_physical_dimension_ref.text = 'LenNeg4M1TiNeg1'
-        self.unit_HectoPaSecPerMtrCubd_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Henry = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Henry'] = self.unit_Henry
-        self.unit_Henry_short_name = ET.SubElement(self.unit_Henry, 'SHORT-NAME')
-        self.variables['unit_Henry_short_name'] = self.unit_Henry_short_name
-        self.unit_Henry_short_name.text = 'Henry'
-        self.unit_Henry_long_name = ET.SubElement(self.unit_Henry, 'LONG-NAME')
-        self.variables['unit_Henry_long_name'] = self.unit_Henry_long_name
-        self.unit_Henry_l_4 = ET.SubElement(self.unit_Henry_long_name, 'L-4')
-        self.variables['unit_Henry_l_4'] = self.unit_Henry_l_4
-        self.unit_Henry_l_4.text = 'Henry'
-        self.unit_Henry_l_4.attrib = {'L': 'EN'}
-        self.unit_Henry_display_name = ET.SubElement(self.unit_Henry, 'DISPLAY-NAME')
-        self.variables['unit_Henry_display_name'] = self.unit_Henry_display_name
-        self.unit_Henry_display_name.text = 'H'
-        self.unit_Henry_factor_si_to_unit = ET.SubElement(self.unit_Henry, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Henry_factor_si_to_unit'] = self.unit_Henry_factor_si_to_unit
-        self.unit_Henry_factor_si_to_unit.text = '1'
-        self.unit_Henry_offset_si_to_unit = ET.SubElement(self.unit_Henry, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Henry_offset_si_to_unit'] = self.unit_Henry_offset_si_to_unit
-        self.unit_Henry_offset_si_to_unit.text = '0'
-        self.unit_Henry_physical_dimension_ref = ET.SubElement(self.unit_Henry, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Henry_physical_dimension_ref'] = self.unit_Henry_physical_dimension_ref
-        self.unit_Henry_physical_dimension_ref.text = 'Len2M1TiNeg2INeg2'
-        self.unit_Henry_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_HenryPerMtr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_HenryPerMtr'] = self.unit_HenryPerMtr
-        self.unit_HenryPerMtr_short_name = ET.SubElement(self.unit_HenryPerMtr, 'SHORT-NAME')
-        self.variables['unit_HenryPerMtr_short_name'] = self.unit_HenryPerMtr_short_name
-        self.unit_HenryPerMtr_short_name.text = 'HenryPerMtr'
-        self.unit_HenryPerMtr_long_name = ET.SubElement(self.unit_HenryPerMtr, 'LONG-NAME')
-        self.variables['unit_HenryPerMtr_long_name'] = self.unit_HenryPerMtr_long_name
-        self.unit_HenryPerMtr_l_4 = ET.SubElement(self.unit_HenryPerMtr_long_name, 'L-4')
-        self.variables['unit_HenryPerMtr_l_4'] = self.unit_HenryPerMtr_l_4
-        self.unit_HenryPerMtr_l_4.text = 'Henry Per Meter'
-        self.unit_HenryPerMtr_l_4.attrib = {'L': 'EN'}
-        self.unit_HenryPerMtr_display_name = ET.SubElement(self.unit_HenryPerMtr, 'DISPLAY-NAME')
-        self.variables['unit_HenryPerMtr_display_name'] = self.unit_HenryPerMtr_display_name
-        self.unit_HenryPerMtr_display_name.text = 'H/m'
-        self.unit_HenryPerMtr_factor_si_to_unit = ET.SubElement(self.unit_HenryPerMtr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_HenryPerMtr_factor_si_to_unit'] = self.unit_HenryPerMtr_factor_si_to_unit
-        self.unit_HenryPerMtr_factor_si_to_unit.text = '1'
-        self.unit_HenryPerMtr_offset_si_to_unit = ET.SubElement(self.unit_HenryPerMtr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_HenryPerMtr_offset_si_to_unit'] = self.unit_HenryPerMtr_offset_si_to_unit
-        self.unit_HenryPerMtr_offset_si_to_unit.text = '0'
-        self.unit_HenryPerMtr_physical_dimension_ref = ET.SubElement(self.unit_HenryPerMtr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_HenryPerMtr_physical_dimension_ref'] = self.unit_HenryPerMtr_physical_dimension_ref
-        self.unit_HenryPerMtr_physical_dimension_ref.text = 'Len1M1TiNeg2INeg2'
-        self.unit_HenryPerMtr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Hr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Hr'] = self.unit_Hr
-        self.unit_Hr_short_name = ET.SubElement(self.unit_Hr, 'SHORT-NAME')
-        self.variables['unit_Hr_short_name'] = self.unit_Hr_short_name
-        self.unit_Hr_short_name.text = 'Hr'
-        self.unit_Hr_long_name = ET.SubElement(self.unit_Hr, 'LONG-NAME')
-        self.variables['unit_Hr_long_name'] = self.unit_Hr_long_name
-        self.unit_Hr_l_4 = ET.SubElement(self.unit_Hr_long_name, 'L-4')
-        self.variables['unit_Hr_l_4'] = self.unit_Hr_l_4
-        self.unit_Hr_l_4.text = 'Hour'
-        self.unit_Hr_l_4.attrib = {'L': 'EN'}
-        self.unit_Hr_display_name = ET.SubElement(self.unit_Hr, 'DISPLAY-NAME')
-        self.variables['unit_Hr_display_name'] = self.unit_Hr_display_name
-        self.unit_Hr_display_name.text = 'h'
-        self.unit_Hr_factor_si_to_unit = ET.SubElement(self.unit_Hr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Hr_factor_si_to_unit'] = self.unit_Hr_factor_si_to_unit
-        self.unit_Hr_factor_si_to_unit.text = '0.000277777777777778'
-        self.unit_Hr_offset_si_to_unit = ET.SubElement(self.unit_Hr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Hr_offset_si_to_unit'] = self.unit_Hr_offset_si_to_unit
-        self.unit_Hr_offset_si_to_unit.text = '0'
-        self.unit_Hr_physical_dimension_ref = ET.SubElement(self.unit_Hr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Hr_physical_dimension_ref'] = self.unit_Hr_physical_dimension_ref
-        self.unit_Hr_physical_dimension_ref.text = 'Ti1'
-        self.unit_Hr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Hz = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Hz'] = self.unit_Hz
-        self.unit_Hz_short_name = ET.SubElement(self.unit_Hz, 'SHORT-NAME')
-        self.variables['unit_Hz_short_name'] = self.unit_Hz_short_name
-        self.unit_Hz_short_name.text = 'Hz'
-        self.unit_Hz_long_name = ET.SubElement(self.unit_Hz, 'LONG-NAME')
-        self.variables['unit_Hz_long_name'] = self.unit_Hz_long_name
-        self.unit_Hz_l_4 = ET.SubElement(self.unit_Hz_long_name, 'L-4')
-        self.variables['unit_Hz_l_4'] = self.unit_Hz_l_4
-        self.unit_Hz_l_4.text = 'Hertz'
-        self.unit_Hz_l_4.attrib = {'L': 'EN'}
-        self.unit_Hz_display_name = ET.SubElement(self.unit_Hz, 'DISPLAY-NAME')
-        self.variables['unit_Hz_display_name'] = self.unit_Hz_display_name
-        self.unit_Hz_display_name.text = 'Hz'
-        self.unit_Hz_factor_si_to_unit = ET.SubElement(self.unit_Hz, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Hz_factor_si_to_unit'] = self.unit_Hz_factor_si_to_unit
-        self.unit_Hz_factor_si_to_unit.text = '1'
-        self.unit_Hz_offset_si_to_unit = ET.SubElement(self.unit_Hz, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Hz_offset_si_to_unit'] = self.unit_Hz_offset_si_to_unit
-        self.unit_Hz_offset_si_to_unit.text = '0'
-        self.unit_Hz_physical_dimension_ref = ET.SubElement(self.unit_Hz, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Hz_physical_dimension_ref'] = self.unit_Hz_physical_dimension_ref
-        self.unit_Hz_physical_dimension_ref.text = 'TiNeg1'
-        self.unit_Hz_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Jou = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Jou'] = self.unit_Jou
-        self.unit_Jou_short_name = ET.SubElement(self.unit_Jou, 'SHORT-NAME')
-        self.variables['unit_Jou_short_name'] = self.unit_Jou_short_name
-        self.unit_Jou_short_name.text = 'Jou'
-        self.unit_Jou_long_name = ET.SubElement(self.unit_Jou, 'LONG-NAME')
-        self.variables['unit_Jou_long_name'] = self.unit_Jou_long_name
-        self.unit_Jou_l_4 = ET.SubElement(self.unit_Jou_long_name, 'L-4')
-        self.variables['unit_Jou_l_4'] = self.unit_Jou_l_4
-        self.unit_Jou_l_4.text = 'Joule'
-        self.unit_Jou_l_4.attrib = {'L': 'EN'}
-        self.unit_Jou_display_name = ET.SubElement(self.unit_Jou, 'DISPLAY-NAME')
-        self.variables['unit_Jou_display_name'] = self.unit_Jou_display_name
-        self.unit_Jou_display_name.text = 'J'
-        self.unit_Jou_factor_si_to_unit = ET.SubElement(self.unit_Jou, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Jou_factor_si_to_unit'] = self.unit_Jou_factor_si_to_unit
-        self.unit_Jou_factor_si_to_unit.text = '1'
-        self.unit_Jou_offset_si_to_unit = ET.SubElement(self.unit_Jou, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Jou_offset_si_to_unit'] = self.unit_Jou_offset_si_to_unit
-        self.unit_Jou_offset_si_to_unit.text = '0'
-        self.unit_Jou_physical_dimension_ref = ET.SubElement(self.unit_Jou, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Jou_physical_dimension_ref'] = self.unit_Jou_physical_dimension_ref
-        self.unit_Jou_physical_dimension_ref.text = 'Len2M1TiNeg2_1'
-        self.unit_Jou_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_JouPerKelvin = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_JouPerKelvin'] = self.unit_JouPerKelvin
-        self.unit_JouPerKelvin_short_name = ET.SubElement(self.unit_JouPerKelvin, 'SHORT-NAME')
-        self.variables['unit_JouPerKelvin_short_name'] = self.unit_JouPerKelvin_short_name
-        self.unit_JouPerKelvin_short_name.text = 'JouPerKelvin'
-        self.unit_JouPerKelvin_long_name = ET.SubElement(self.unit_JouPerKelvin, 'LONG-NAME')
-        self.variables['unit_JouPerKelvin_long_name'] = self.unit_JouPerKelvin_long_name
-        self.unit_JouPerKelvin_l_4 = ET.SubElement(self.unit_JouPerKelvin_long_name, 'L-4')
-        self.variables['unit_JouPerKelvin_l_4'] = self.unit_JouPerKelvin_l_4
-        self.unit_JouPerKelvin_l_4.text = 'Joule Per Kelvin'
-        self.unit_JouPerKelvin_l_4.attrib = {'L': 'EN'}
-        self.unit_JouPerKelvin_display_name = ET.SubElement(self.unit_JouPerKelvin, 'DISPLAY-NAME')
-        self.variables['unit_JouPerKelvin_display_name'] = self.unit_JouPerKelvin_display_name
-        self.unit_JouPerKelvin_display_name.text = 'J/K'
-        self.unit_JouPerKelvin_factor_si_to_unit = ET.SubElement(self.unit_JouPerKelvin, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_JouPerKelvin_factor_si_to_unit'] = self.unit_JouPerKelvin_factor_si_to_unit
-        self.unit_JouPerKelvin_factor_si_to_unit.text = '1'
-        self.unit_JouPerKelvin_offset_si_to_unit = ET.SubElement(self.unit_JouPerKelvin, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_JouPerKelvin_offset_si_to_unit'] = self.unit_JouPerKelvin_offset_si_to_unit
-        self.unit_JouPerKelvin_offset_si_to_unit.text = '0'
-        self.unit_JouPerKelvin_physical_dimension_ref = ET.SubElement(self.unit_JouPerKelvin, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_JouPerKelvin_physical_dimension_ref'] = self.unit_JouPerKelvin_physical_dimension_ref
-        self.unit_JouPerKelvin_physical_dimension_ref.text = 'Len2M1TiNeg2TNeg1'
-        self.unit_JouPerKelvin_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_JouPerKiloGr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_JouPerKiloGr'] = self.unit_JouPerKiloGr
-        self.unit_JouPerKiloGr_short_name = ET.SubElement(self.unit_JouPerKiloGr, 'SHORT-NAME')
-        self.variables['unit_JouPerKiloGr_short_name'] = self.unit_JouPerKiloGr_short_name
-        self.unit_JouPerKiloGr_short_name.text = 'JouPerKiloGr'
-        self.unit_JouPerKiloGr_long_name = ET.SubElement(self.unit_JouPerKiloGr, 'LONG-NAME')
-        self.variables['unit_JouPerKiloGr_long_name'] = self.unit_JouPerKiloGr_long_name
-        self.unit_JouPerKiloGr_l_4 = ET.SubElement(self.unit_JouPerKiloGr_long_name, 'L-4')
-        self.variables['unit_JouPerKiloGr_l_4'] = self.unit_JouPerKiloGr_l_4
-        self.unit_JouPerKiloGr_l_4.text = 'Joule Per Kilogram'
-        self.unit_JouPerKiloGr_l_4.attrib = {'L': 'EN'}
-        self.unit_JouPerKiloGr_display_name = ET.SubElement(self.unit_JouPerKiloGr, 'DISPLAY-NAME')
-        self.variables['unit_JouPerKiloGr_display_name'] = self.unit_JouPerKiloGr_display_name
-        self.unit_JouPerKiloGr_display_name.text = 'J/kg'
-        self.unit_JouPerKiloGr_factor_si_to_unit = ET.SubElement(self.unit_JouPerKiloGr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_JouPerKiloGr_factor_si_to_unit'] = self.unit_JouPerKiloGr_factor_si_to_unit
-        self.unit_JouPerKiloGr_factor_si_to_unit.text = '1'
-        self.unit_JouPerKiloGr_offset_si_to_unit = ET.SubElement(self.unit_JouPerKiloGr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_JouPerKiloGr_offset_si_to_unit'] = self.unit_JouPerKiloGr_offset_si_to_unit
-        self.unit_JouPerKiloGr_offset_si_to_unit.text = '0'
-        self.unit_JouPerKiloGr_physical_dimension_ref = ET.SubElement(self.unit_JouPerKiloGr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_JouPerKiloGr_physical_dimension_ref'] = self.unit_JouPerKiloGr_physical_dimension_ref
-        self.unit_JouPerKiloGr_physical_dimension_ref.text = 'Len2TiNeg2'
-        self.unit_JouPerKiloGr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_JouPerKiloGrPerKelvin = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_JouPerKiloGrPerKelvin'] = self.unit_JouPerKiloGrPerKelvin
-        self.unit_JouPerKiloGrPerKelvin_short_name = ET.SubElement(self.unit_JouPerKiloGrPerKelvin, 'SHORT-NAME')
-        self.variables['unit_JouPerKiloGrPerKelvin_short_name'] = self.unit_JouPerKiloGrPerKelvin_short_name
-        self.unit_JouPerKiloGrPerKelvin_short_name.text = 'JouPerKiloGrPerKelvin'
-        self.unit_JouPerKiloGrPerKelvin_long_name = ET.SubElement(self.unit_JouPerKiloGrPerKelvin, 'LONG-NAME')
-        self.variables['unit_JouPerKiloGrPerKelvin_long_name'] = self.unit_JouPerKiloGrPerKelvin_long_name
-        self.unit_JouPerKiloGrPerKelvin_l_4 = ET.SubElement(self.unit_JouPerKiloGrPerKelvin_long_name, 'L-4')
-        self.variables['unit_JouPerKiloGrPerKelvin_l_4'] = self.unit_JouPerKiloGrPerKelvin_l_4
-        self.unit_JouPerKiloGrPerKelvin_l_4.text = 'Joule Per Kilogram Per Kelvin'
-        self.unit_JouPerKiloGrPerKelvin_l_4.attrib = {'L': 'EN'}
-        self.unit_JouPerKiloGrPerKelvin_display_name = ET.SubElement(self.unit_JouPerKiloGrPerKelvin, 'DISPLAY-NAME')
-        self.variables['unit_JouPerKiloGrPerKelvin_display_name'] = self.unit_JouPerKiloGrPerKelvin_display_name
-        self.unit_JouPerKiloGrPerKelvin_display_name.text = 'J/(kg*K)'
-        self.unit_JouPerKiloGrPerKelvin_factor_si_to_unit = ET.SubElement(self.unit_JouPerKiloGrPerKelvin, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_JouPerKiloGrPerKelvin_factor_si_to_unit'] = self.unit_JouPerKiloGrPerKelvin_factor_si_to_unit
-        self.unit_JouPerKiloGrPerKelvin_factor_si_to_unit.text = '1'
-        self.unit_JouPerKiloGrPerKelvin_offset_si_to_unit = ET.SubElement(self.unit_JouPerKiloGrPerKelvin, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_JouPerKiloGrPerKelvin_offset_si_to_unit'] = self.unit_JouPerKiloGrPerKelvin_offset_si_to_unit
-        self.unit_JouPerKiloGrPerKelvin_offset_si_to_unit.text = '0'
-        self.unit_JouPerKiloGrPerKelvin_physical_dimension_ref = ET.SubElement(self.unit_JouPerKiloGrPerKelvin, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_JouPerKiloGrPerKelvin_physical_dimension_ref'] = self.unit_JouPerKiloGrPerKelvin_physical_dimension_ref
-        self.unit_JouPerKiloGrPerKelvin_physical_dimension_ref.text = 'Len2TiNeg2TNeg1'
-        self.unit_JouPerKiloGrPerKelvin_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_JouPerMol = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_JouPerMol'] = self.unit_JouPerMol
-        self.unit_JouPerMol_short_name = ET.SubElement(self.unit_JouPerMol, 'SHORT-NAME')
-        self.variables['unit_JouPerMol_short_name'] = self.unit_JouPerMol_short_name
-        self.unit_JouPerMol_short_name.text = 'JouPerMol'
-        self.unit_JouPerMol_long_name = ET.SubElement(self.unit_JouPerMol, 'LONG-NAME')
-        self.variables['unit_JouPerMol_long_name'] = self.unit_JouPerMol_long_name
-        self.unit_JouPerMol_l_4 = ET.SubElement(self.unit_JouPerMol_long_name, 'L-4')
-        self.variables['unit_JouPerMol_l_4'] = self.unit_JouPerMol_l_4
-        self.unit_JouPerMol_l_4.text = 'Joule Per Mole'
-        self.unit_JouPerMol_l_4.attrib = {'L': 'EN'}
-        self.unit_JouPerMol_display_name = ET.SubElement(self.unit_JouPerMol, 'DISPLAY-NAME')
-        self.variables['unit_JouPerMol_display_name'] = self.unit_JouPerMol_display_name
-        self.unit_JouPerMol_display_name.text = 'J/mol'
-        self.unit_JouPerMol_factor_si_to_unit = ET.SubElement(self.unit_JouPerMol, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_JouPerMol_factor_si_to_unit'] = self.unit_JouPerMol_factor_si_to_unit
-        self.unit_JouPerMol_factor_si_to_unit.text = '1'
-        self.unit_JouPerMol_offset_si_to_unit = ET.SubElement(self.unit_JouPerMol, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_JouPerMol_offset_si_to_unit'] = self.unit_JouPerMol_offset_si_to_unit
-        self.unit_JouPerMol_offset_si_to_unit.text = '0'
-        self.unit_JouPerMol_physical_dimension_ref = ET.SubElement(self.unit_JouPerMol, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_JouPerMol_physical_dimension_ref'] = self.unit_JouPerMol_physical_dimension_ref
-        self.unit_JouPerMol_physical_dimension_ref.text = 'Len2M1TiNeg2AmntNeg1'
-        self.unit_JouPerMol_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_JouPerMolPerKelvin = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_JouPerMolPerKelvin'] = self.unit_JouPerMolPerKelvin
-        self.unit_JouPerMolPerKelvin_short_name = ET.SubElement(self.unit_JouPerMolPerKelvin, 'SHORT-NAME')
-        self.variables['unit_JouPerMolPerKelvin_short_name'] = self.unit_JouPerMolPerKelvin_short_name
-        self.unit_JouPerMolPerKelvin_short_name.text = 'JouPerMolPerKelvin'
-        self.unit_JouPerMolPerKelvin_long_name = ET.SubElement(self.unit_JouPerMolPerKelvin, 'LONG-NAME')
-        self.variables['unit_JouPerMolPerKelvin_long_name'] = self.unit_JouPerMolPerKelvin_long_name
-        self.unit_JouPerMolPerKelvin_l_4 = ET.SubElement(self.unit_JouPerMolPerKelvin_long_name, 'L-4')
-        self.variables['unit_JouPerMolPerKelvin_l_4'] = self.unit_JouPerMolPerKelvin_l_4
-        self.unit_JouPerMolPerKelvin_l_4.text = 'Joule Per Mole Per Kelvin'
-        self.unit_JouPerMolPerKelvin_l_4.attrib = {'L': 'EN'}
-        self.unit_JouPerMolPerKelvin_display_name = ET.SubElement(self.unit_JouPerMolPerKelvin, 'DISPLAY-NAME')
-        self.variables['unit_JouPerMolPerKelvin_display_name'] = self.unit_JouPerMolPerKelvin_display_name
-        self.unit_JouPerMolPerKelvin_display_name.text = 'J/(mol*K)'
-        self.unit_JouPerMolPerKelvin_factor_si_to_unit = ET.SubElement(self.unit_JouPerMolPerKelvin, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_JouPerMolPerKelvin_factor_si_to_unit'] = self.unit_JouPerMolPerKelvin_factor_si_to_unit
-        self.unit_JouPerMolPerKelvin_factor_si_to_unit.text = '1'
-        self.unit_JouPerMolPerKelvin_offset_si_to_unit = ET.SubElement(self.unit_JouPerMolPerKelvin, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_JouPerMolPerKelvin_offset_si_to_unit'] = self.unit_JouPerMolPerKelvin_offset_si_to_unit
-        self.unit_JouPerMolPerKelvin_offset_si_to_unit.text = '0'
-        self.unit_JouPerMolPerKelvin_physical_dimension_ref = ET.SubElement(self.unit_JouPerMolPerKelvin, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_JouPerMolPerKelvin_physical_dimension_ref'] = self.unit_JouPerMolPerKelvin_physical_dimension_ref
-        self.unit_JouPerMolPerKelvin_physical_dimension_ref.text = 'Len2M1TiNeg2TNeg1AmntNeg1'
-        self.unit_JouPerMolPerKelvin_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Kat = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Kat'] = self.unit_Kat
-        self.unit_Kat_short_name = ET.SubElement(self.unit_Kat, 'SHORT-NAME')
-        self.variables['unit_Kat_short_name'] = self.unit_Kat_short_name
-        self.unit_Kat_short_name.text = 'Kat'
-        self.unit_Kat_long_name = ET.SubElement(self.unit_Kat, 'LONG-NAME')
-        self.variables['unit_Kat_long_name'] = self.unit_Kat_long_name
-        self.unit_Kat_l_4 = ET.SubElement(self.unit_Kat_long_name, 'L-4')
-        self.variables['unit_Kat_l_4'] = self.unit_Kat_l_4
-        self.unit_Kat_l_4.text = 'Katal'
-        self.unit_Kat_l_4.attrib = {'L': 'EN'}
-        self.unit_Kat_display_name = ET.SubElement(self.unit_Kat, 'DISPLAY-NAME')
-        self.variables['unit_Kat_display_name'] = self.unit_Kat_display_name
-        self.unit_Kat_display_name.text = 'kat'
-        self.unit_Kat_factor_si_to_unit = ET.SubElement(self.unit_Kat, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Kat_factor_si_to_unit'] = self.unit_Kat_factor_si_to_unit
-        self.unit_Kat_factor_si_to_unit.text = '1'
-        self.unit_Kat_offset_si_to_unit = ET.SubElement(self.unit_Kat, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Kat_offset_si_to_unit'] = self.unit_Kat_offset_si_to_unit
-        self.unit_Kat_offset_si_to_unit.text = '0'
-        self.unit_Kat_physical_dimension_ref = ET.SubElement(self.unit_Kat, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Kat_physical_dimension_ref'] = self.unit_Kat_physical_dimension_ref
-        self.unit_Kat_physical_dimension_ref.text = 'TiNeg1Amnt1'
-        self.unit_Kat_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_KelvinAbslt = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_KelvinAbslt'] = self.unit_KelvinAbslt
-        self.unit_KelvinAbslt_short_name = ET.SubElement(self.unit_KelvinAbslt, 'SHORT-NAME')
-        self.variables['unit_KelvinAbslt_short_name'] = self.unit_KelvinAbslt_short_name
-        self.unit_KelvinAbslt_short_name.text = 'KelvinAbslt'
-        self.unit_KelvinAbslt_long_name = ET.SubElement(self.unit_KelvinAbslt, 'LONG-NAME')
-        self.variables['unit_KelvinAbslt_long_name'] = self.unit_KelvinAbslt_long_name
-        self.unit_KelvinAbslt_l_4 = ET.SubElement(self.unit_KelvinAbslt_long_name, 'L-4')
-        self.variables['unit_KelvinAbslt_l_4'] = self.unit_KelvinAbslt_l_4
-        self.unit_KelvinAbslt_l_4.text = 'Kelvin (Absolute Temperature)'
-        self.unit_KelvinAbslt_l_4.attrib = {'L': 'EN'}
-        self.unit_KelvinAbslt_display_name = ET.SubElement(self.unit_KelvinAbslt, 'DISPLAY-NAME')
-        self.variables['unit_KelvinAbslt_display_name'] = self.unit_KelvinAbslt_display_name
-        self.unit_KelvinAbslt_display_name.text = 'K'
-        self.unit_KelvinAbslt_factor_si_to_unit = ET.SubElement(self.unit_KelvinAbslt, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_KelvinAbslt_factor_si_to_unit'] = self.unit_KelvinAbslt_factor_si_to_unit
-        self.unit_KelvinAbslt_factor_si_to_unit.text = '1'
-        self.unit_KelvinAbslt_offset_si_to_unit = ET.SubElement(self.unit_KelvinAbslt, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_KelvinAbslt_offset_si_to_unit'] = self.unit_KelvinAbslt_offset_si_to_unit
-        self.unit_KelvinAbslt_offset_si_to_unit.text = '0'
-        self.unit_KelvinAbslt_physical_dimension_ref = ET.SubElement(self.unit_KelvinAbslt, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_KelvinAbslt_physical_dimension_ref'] = self.unit_KelvinAbslt_physical_dimension_ref
-        self.unit_KelvinAbslt_physical_dimension_ref.text = 'T1'
-        self.unit_KelvinAbslt_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_KelvinPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_KelvinPerSec'] = self.unit_KelvinPerSec
-        self.unit_KelvinPerSec_short_name = ET.SubElement(self.unit_KelvinPerSec, 'SHORT-NAME')
-        self.variables['unit_KelvinPerSec_short_name'] = self.unit_KelvinPerSec_short_name
-        self.unit_KelvinPerSec_short_name.text = 'KelvinPerSec'
-        self.unit_KelvinPerSec_long_name = ET.SubElement(self.unit_KelvinPerSec, 'LONG-NAME')
-        self.variables['unit_KelvinPerSec_long_name'] = self.unit_KelvinPerSec_long_name
-        self.unit_KelvinPerSec_l_4 = ET.SubElement(self.unit_KelvinPerSec_long_name, 'L-4')
-        self.variables['unit_KelvinPerSec_l_4'] = self.unit_KelvinPerSec_l_4
-        self.unit_KelvinPerSec_l_4.text = 'Kelvin Per Second'
-        self.unit_KelvinPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_KelvinPerSec_display_name = ET.SubElement(self.unit_KelvinPerSec, 'DISPLAY-NAME')
-        self.variables['unit_KelvinPerSec_display_name'] = self.unit_KelvinPerSec_display_name
-        self.unit_KelvinPerSec_display_name.text = 'K/s'
-        self.unit_KelvinPerSec_factor_si_to_unit = ET.SubElement(self.unit_KelvinPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_KelvinPerSec_factor_si_to_unit'] = self.unit_KelvinPerSec_factor_si_to_unit
-        self.unit_KelvinPerSec_factor_si_to_unit.text = '1'
-        self.unit_KelvinPerSec_offset_si_to_unit = ET.SubElement(self.unit_KelvinPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_KelvinPerSec_offset_si_to_unit'] = self.unit_KelvinPerSec_offset_si_to_unit
-        self.unit_KelvinPerSec_offset_si_to_unit.text = '0'
-        self.unit_KelvinPerSec_physical_dimension_ref = ET.SubElement(self.unit_KelvinPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_KelvinPerSec_physical_dimension_ref'] = self.unit_KelvinPerSec_physical_dimension_ref
-        self.unit_KelvinPerSec_physical_dimension_ref.text = 'TiNeg1T1'
-        self.unit_KelvinPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_KelvinRel = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_KelvinRel'] = self.unit_KelvinRel
-        self.unit_KelvinRel_short_name = ET.SubElement(self.unit_KelvinRel, 'SHORT-NAME')
-        self.variables['unit_KelvinRel_short_name'] = self.unit_KelvinRel_short_name
-        self.unit_KelvinRel_short_name.text = 'KelvinRel'
-        self.unit_KelvinRel_long_name = ET.SubElement(self.unit_KelvinRel, 'LONG-NAME')
-        self.variables['unit_KelvinRel_long_name'] = self.unit_KelvinRel_long_name
-        self.unit_KelvinRel_l_4 = ET.SubElement(self.unit_KelvinRel_long_name, 'L-4')
-        self.variables['unit_KelvinRel_l_4'] = self.unit_KelvinRel_l_4
-        self.unit_KelvinRel_l_4.text = 'Kelvin (Relative Temperature, Temperature Difference)'
-        self.unit_KelvinRel_l_4.attrib = {'L': 'EN'}
-        self.unit_KelvinRel_display_name = ET.SubElement(self.unit_KelvinRel, 'DISPLAY-NAME')
-        self.variables['unit_KelvinRel_display_name'] = self.unit_KelvinRel_display_name
-        self.unit_KelvinRel_display_name.text = 'K'
-        self.unit_KelvinRel_factor_si_to_unit = ET.SubElement(self.unit_KelvinRel, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_KelvinRel_factor_si_to_unit'] = self.unit_KelvinRel_factor_si_to_unit
-        self.unit_KelvinRel_factor_si_to_unit.text = '1'
-        self.unit_KelvinRel_offset_si_to_unit = ET.SubElement(self.unit_KelvinRel, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_KelvinRel_offset_si_to_unit'] = self.unit_KelvinRel_offset_si_to_unit
-        self.unit_KelvinRel_offset_si_to_unit.text = '0'
-        self.unit_KelvinRel_physical_dimension_ref = ET.SubElement(self.unit_KelvinRel, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_KelvinRel_physical_dimension_ref'] = self.unit_KelvinRel_physical_dimension_ref
-        self.unit_KelvinRel_physical_dimension_ref.text = 'T1_1'
-        self.unit_KelvinRel_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_KiloBitPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_KiloBitPerSec'] = self.unit_KiloBitPerSec
-        self.unit_KiloBitPerSec_short_name = ET.SubElement(self.unit_KiloBitPerSec, 'SHORT-NAME')
-        self.variables['unit_KiloBitPerSec_short_name'] = self.unit_KiloBitPerSec_short_name
-        self.unit_KiloBitPerSec_short_name.text = 'KiloBitPerSec'
-        self.unit_KiloBitPerSec_long_name = ET.SubElement(self.unit_KiloBitPerSec, 'LONG-NAME')
-        self.variables['unit_KiloBitPerSec_long_name'] = self.unit_KiloBitPerSec_long_name
-        self.unit_KiloBitPerSec_l_4 = ET.SubElement(self.unit_KiloBitPerSec_long_name, 'L-4')
-        self.variables['unit_KiloBitPerSec_l_4'] = self.unit_KiloBitPerSec_l_4
-        self.unit_KiloBitPerSec_l_4.text = 'Kilobit Per Second'
-        self.unit_KiloBitPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_KiloBitPerSec_display_name = ET.SubElement(self.unit_KiloBitPerSec, 'DISPLAY-NAME')
-        self.variables['unit_KiloBitPerSec_display_name'] = self.unit_KiloBitPerSec_display_name
-        self.unit_KiloBitPerSec_display_name.text = 'kbit/s'
-        self.unit_KiloBitPerSec_factor_si_to_unit = ET.SubElement(self.unit_KiloBitPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_KiloBitPerSec_factor_si_to_unit'] = self.unit_KiloBitPerSec_factor_si_to_unit
-        self.unit_KiloBitPerSec_factor_si_to_unit.text = '0.001'
-        self.unit_KiloBitPerSec_offset_si_to_unit = ET.SubElement(self.unit_KiloBitPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_KiloBitPerSec_offset_si_to_unit'] = self.unit_KiloBitPerSec_offset_si_to_unit
-        self.unit_KiloBitPerSec_offset_si_to_unit.text = '0'
-        self.unit_KiloBitPerSec_physical_dimension_ref = ET.SubElement(self.unit_KiloBitPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_KiloBitPerSec_physical_dimension_ref'] = self.unit_KiloBitPerSec_physical_dimension_ref
-        self.unit_KiloBitPerSec_physical_dimension_ref.text = 'TiNeg1_3'
-        self.unit_KiloBitPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_KiloGr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_KiloGr'] = self.unit_KiloGr
-        self.unit_KiloGr_short_name = ET.SubElement(self.unit_KiloGr, 'SHORT-NAME')
-        self.variables['unit_KiloGr_short_name'] = self.unit_KiloGr_short_name
-        self.unit_KiloGr_short_name.text = 'KiloGr'
-        self.unit_KiloGr_long_name = ET.SubElement(self.unit_KiloGr, 'LONG-NAME')
-        self.variables['unit_KiloGr_long_name'] = self.unit_KiloGr_long_name
-        self.unit_KiloGr_l_4 = ET.SubElement(self.unit_KiloGr_long_name, 'L-4')
-        self.variables['unit_KiloGr_l_4'] = self.unit_KiloGr_l_4
-        self.unit_KiloGr_l_4.text = 'Kilogram'
-        self.unit_KiloGr_l_4.attrib = {'L': 'EN'}
-        self.unit_KiloGr_display_name = ET.SubElement(self.unit_KiloGr, 'DISPLAY-NAME')
-        self.variables['unit_KiloGr_display_name'] = self.unit_KiloGr_display_name
-        self.unit_KiloGr_display_name.text = 'kg'
-        self.unit_KiloGr_factor_si_to_unit = ET.SubElement(self.unit_KiloGr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_KiloGr_factor_si_to_unit'] = self.unit_KiloGr_factor_si_to_unit
-        self.unit_KiloGr_factor_si_to_unit.text = '1'
-        self.unit_KiloGr_offset_si_to_unit = ET.SubElement(self.unit_KiloGr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_KiloGr_offset_si_to_unit'] = self.unit_KiloGr_offset_si_to_unit
-        self.unit_KiloGr_offset_si_to_unit.text = '0'
-        self.unit_KiloGr_physical_dimension_ref = ET.SubElement(self.unit_KiloGr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_KiloGr_physical_dimension_ref'] = self.unit_KiloGr_physical_dimension_ref
-        self.unit_KiloGr_physical_dimension_ref.text = 'M1'
-        self.unit_KiloGr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_KiloGrPerHr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_KiloGrPerHr'] = self.unit_KiloGrPerHr
-        self.unit_KiloGrPerHr_short_name = ET.SubElement(self.unit_KiloGrPerHr, 'SHORT-NAME')
-        self.variables['unit_KiloGrPerHr_short_name'] = self.unit_KiloGrPerHr_short_name
-        self.unit_KiloGrPerHr_short_name.text = 'KiloGrPerHr'
-        self.unit_KiloGrPerHr_long_name = ET.SubElement(self.unit_KiloGrPerHr, 'LONG-NAME')
-        self.variables['unit_KiloGrPerHr_long_name'] = self.unit_KiloGrPerHr_long_name
-        self.unit_KiloGrPerHr_l_4 = ET.SubElement(self.unit_KiloGrPerHr_long_name, 'L-4')
-        self.variables['unit_KiloGrPerHr_l_4'] = self.unit_KiloGrPerHr_l_4
-        self.unit_KiloGrPerHr_l_4.text = 'Kilogram Per Hour'
-        self.unit_KiloGrPerHr_l_4.attrib = {'L': 'EN'}
-        self.unit_KiloGrPerHr_display_name = ET.SubElement(self.unit_KiloGrPerHr, 'DISPLAY-NAME')
-        self.variables['unit_KiloGrPerHr_display_name'] = self.unit_KiloGrPerHr_display_name
-        self.unit_KiloGrPerHr_display_name.text = 'kg/h'
-        self.unit_KiloGrPerHr_factor_si_to_unit = ET.SubElement(self.unit_KiloGrPerHr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_KiloGrPerHr_factor_si_to_unit'] = self.unit_KiloGrPerHr_factor_si_to_unit
-        self.unit_KiloGrPerHr_factor_si_to_unit.text = '3600'
-        self.unit_KiloGrPerHr_offset_si_to_unit = ET.SubElement(self.unit_KiloGrPerHr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_KiloGrPerHr_offset_si_to_unit'] = self.unit_KiloGrPerHr_offset_si_to_unit
-        self.unit_KiloGrPerHr_offset_si_to_unit.text = '0'
-        self.unit_KiloGrPerHr_physical_dimension_ref = ET.SubElement(self.unit_KiloGrPerHr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_KiloGrPerHr_physical_dimension_ref'] = self.unit_KiloGrPerHr_physical_dimension_ref
-        self.unit_KiloGrPerHr_physical_dimension_ref.text = 'M1TiNeg1'
-        self.unit_KiloGrPerHr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_KiloGrPerMtrCubd = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_KiloGrPerMtrCubd'] = self.unit_KiloGrPerMtrCubd
-        self.unit_KiloGrPerMtrCubd_short_name = ET.SubElement(self.unit_KiloGrPerMtrCubd, 'SHORT-NAME')
-        self.variables['unit_KiloGrPerMtrCubd_short_name'] = self.unit_KiloGrPerMtrCubd_short_name
-        self.unit_KiloGrPerMtrCubd_short_name.text = 'KiloGrPerMtrCubd'
-        self.unit_KiloGrPerMtrCubd_long_name = ET.SubElement(self.unit_KiloGrPerMtrCubd, 'LONG-NAME')
-        self.variables['unit_KiloGrPerMtrCubd_long_name'] = self.unit_KiloGrPerMtrCubd_long_name
-        self.unit_KiloGrPerMtrCubd_l_4 = ET.SubElement(self.unit_KiloGrPerMtrCubd_long_name, 'L-4')
-        self.variables['unit_KiloGrPerMtrCubd_l_4'] = self.unit_KiloGrPerMtrCubd_l_4
-        self.unit_KiloGrPerMtrCubd_l_4.text = 'Kilogram Per Cubic Meter'
-        self.unit_KiloGrPerMtrCubd_l_4.attrib = {'L': 'EN'}
-        self.unit_KiloGrPerMtrCubd_display_name = ET.SubElement(self.unit_KiloGrPerMtrCubd, 'DISPLAY-NAME')
-        self.variables['unit_KiloGrPerMtrCubd_display_name'] = self.unit_KiloGrPerMtrCubd_display_name
-        self.unit_KiloGrPerMtrCubd_display_name.text = 'kg/(m^3)'
-        self.unit_KiloGrPerMtrCubd_factor_si_to_unit = ET.SubElement(self.unit_KiloGrPerMtrCubd, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_KiloGrPerMtrCubd_factor_si_to_unit'] = self.unit_KiloGrPerMtrCubd_factor_si_to_unit
-        self.unit_KiloGrPerMtrCubd_factor_si_to_unit.text = '1'
-        self.unit_KiloGrPerMtrCubd_offset_si_to_unit = ET.SubElement(self.unit_KiloGrPerMtrCubd, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_KiloGrPerMtrCubd_offset_si_to_unit'] = self.unit_KiloGrPerMtrCubd_offset_si_to_unit
-        self.unit_KiloGrPerMtrCubd_offset_si_to_unit.text = '0'
-        self.unit_KiloGrPerMtrCubd_physical_dimension_ref = ET.SubElement(self.unit_KiloGrPerMtrCubd, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_KiloGrPerMtrCubd_physical_dimension_ref'] = self.unit_KiloGrPerMtrCubd_physical_dimension_ref
-        self.unit_KiloGrPerMtrCubd_physical_dimension_ref.text = 'LenNeg3M1'
-        self.unit_KiloGrPerMtrCubd_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_KiloGrPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_KiloGrPerSec'] = self.unit_KiloGrPerSec
-        self.unit_KiloGrPerSec_short_name = ET.SubElement(self.unit_KiloGrPerSec, 'SHORT-NAME')
-        self.variables['unit_KiloGrPerSec_short_name'] = self.unit_KiloGrPerSec_short_name
-        self.unit_KiloGrPerSec_short_name.text = 'KiloGrPerSec'
-        self.unit_KiloGrPerSec_long_name = ET.SubElement(self.unit_KiloGrPerSec, 'LONG-NAME')
-        self.variables['unit_KiloGrPerSec_long_name'] = self.unit_KiloGrPerSec_long_name
-        self.unit_KiloGrPerSec_l_4 = ET.SubElement(self.unit_KiloGrPerSec_long_name, 'L-4')
-        self.variables['unit_KiloGrPerSec_l_4'] = self.unit_KiloGrPerSec_l_4
-        self.unit_KiloGrPerSec_l_4.text = 'Kilogram Per Second'
-        self.unit_KiloGrPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_KiloGrPerSec_display_name = ET.SubElement(self.unit_KiloGrPerSec, 'DISPLAY-NAME')
-        self.variables['unit_KiloGrPerSec_display_name'] = self.unit_KiloGrPerSec_display_name
-        self.unit_KiloGrPerSec_display_name.text = 'kg/s'
-        self.unit_KiloGrPerSec_factor_si_to_unit = ET.SubElement(self.unit_KiloGrPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_KiloGrPerSec_factor_si_to_unit'] = self.unit_KiloGrPerSec_factor_si_to_unit
-        self.unit_KiloGrPerSec_factor_si_to_unit.text = '1'
-        self.unit_KiloGrPerSec_offset_si_to_unit = ET.SubElement(self.unit_KiloGrPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_KiloGrPerSec_offset_si_to_unit'] = self.unit_KiloGrPerSec_offset_si_to_unit
-        self.unit_KiloGrPerSec_offset_si_to_unit.text = '0'
-        self.unit_KiloGrPerSec_physical_dimension_ref = ET.SubElement(self.unit_KiloGrPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_KiloGrPerSec_physical_dimension_ref'] = self.unit_KiloGrPerSec_physical_dimension_ref
-        self.unit_KiloGrPerSec_physical_dimension_ref.text = 'M1TiNeg1'
-        self.unit_KiloGrPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_KiloGrSqrMtr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_KiloGrSqrMtr'] = self.unit_KiloGrSqrMtr
-        self.unit_KiloGrSqrMtr_short_name = ET.SubElement(self.unit_KiloGrSqrMtr, 'SHORT-NAME')
-        self.variables['unit_KiloGrSqrMtr_short_name'] = self.unit_KiloGrSqrMtr_short_name
-        self.unit_KiloGrSqrMtr_short_name.text = 'KiloGrSqrMtr'
-        self.unit_KiloGrSqrMtr_long_name = ET.SubElement(self.unit_KiloGrSqrMtr, 'LONG-NAME')
-        self.variables['unit_KiloGrSqrMtr_long_name'] = self.unit_KiloGrSqrMtr_long_name
-        self.unit_KiloGrSqrMtr_l_4 = ET.SubElement(self.unit_KiloGrSqrMtr_long_name, 'L-4')
-        self.variables['unit_KiloGrSqrMtr_l_4'] = self.unit_KiloGrSqrMtr_l_4
-        self.unit_KiloGrSqrMtr_l_4.text = 'Kilogram Square Meter'
-        self.unit_KiloGrSqrMtr_l_4.attrib = {'L': 'EN'}
-        self.unit_KiloGrSqrMtr_display_name = ET.SubElement(self.unit_KiloGrSqrMtr, 'DISPLAY-NAME')
-        self.variables['unit_KiloGrSqrMtr_display_name'] = self.unit_KiloGrSqrMtr_display_name
-        self.unit_KiloGrSqrMtr_display_name.text = 'kg*(m^2)'
-        self.unit_KiloGrSqrMtr_factor_si_to_unit = ET.SubElement(self.unit_KiloGrSqrMtr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_KiloGrSqrMtr_factor_si_to_unit'] = self.unit_KiloGrSqrMtr_factor_si_to_unit
-        self.unit_KiloGrSqrMtr_factor_si_to_unit.text = '1'
-        self.unit_KiloGrSqrMtr_offset_si_to_unit = ET.SubElement(self.unit_KiloGrSqrMtr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_KiloGrSqrMtr_offset_si_to_unit'] = self.unit_KiloGrSqrMtr_offset_si_to_unit
-        self.unit_KiloGrSqrMtr_offset_si_to_unit.text = '0'
-        self.unit_KiloGrSqrMtr_physical_dimension_ref = ET.SubElement(self.unit_KiloGrSqrMtr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_KiloGrSqrMtr_physical_dimension_ref'] = self.unit_KiloGrSqrMtr_physical_dimension_ref
-        self.unit_KiloGrSqrMtr_physical_dimension_ref.text = 'Len2M1'
-        self.unit_KiloGrSqrMtr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_KiloHz = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_KiloHz'] = self.unit_KiloHz
-        self.unit_KiloHz_short_name = ET.SubElement(self.unit_KiloHz, 'SHORT-NAME')
-        self.variables['unit_KiloHz_short_name'] = self.unit_KiloHz_short_name
-        self.unit_KiloHz_short_name.text = 'KiloHz'
-        self.unit_KiloHz_long_name = ET.SubElement(self.unit_KiloHz, 'LONG-NAME')
-        self.variables['unit_KiloHz_long_name'] = self.unit_KiloHz_long_name
-        self.unit_KiloHz_l_4 = ET.SubElement(self.unit_KiloHz_long_name, 'L-4')
-        self.variables['unit_KiloHz_l_4'] = self.unit_KiloHz_l_4
-        self.unit_KiloHz_l_4.text = 'Kilohertz'
-        self.unit_KiloHz_l_4.attrib = {'L': 'EN'}
-        self.unit_KiloHz_display_name = ET.SubElement(self.unit_KiloHz, 'DISPLAY-NAME')
-        self.variables['unit_KiloHz_display_name'] = self.unit_KiloHz_display_name
-        self.unit_KiloHz_display_name.text = 'kHz'
-        self.unit_KiloHz_factor_si_to_unit = ET.SubElement(self.unit_KiloHz, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_KiloHz_factor_si_to_unit'] = self.unit_KiloHz_factor_si_to_unit
-        self.unit_KiloHz_factor_si_to_unit.text = '0.001'
-        self.unit_KiloHz_offset_si_to_unit = ET.SubElement(self.unit_KiloHz, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_KiloHz_offset_si_to_unit'] = self.unit_KiloHz_offset_si_to_unit
-        self.unit_KiloHz_offset_si_to_unit.text = '0'
-        self.unit_KiloHz_physical_dimension_ref = ET.SubElement(self.unit_KiloHz, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_KiloHz_physical_dimension_ref'] = self.unit_KiloHz_physical_dimension_ref
-        self.unit_KiloHz_physical_dimension_ref.text = 'TiNeg1'
-        self.unit_KiloHz_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_KiloJou = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_KiloJou'] = self.unit_KiloJou
-        self.unit_KiloJou_short_name = ET.SubElement(self.unit_KiloJou, 'SHORT-NAME')
-        self.variables['unit_KiloJou_short_name'] = self.unit_KiloJou_short_name
-        self.unit_KiloJou_short_name.text = 'KiloJou'
-        self.unit_KiloJou_long_name = ET.SubElement(self.unit_KiloJou, 'LONG-NAME')
-        self.variables['unit_KiloJou_long_name'] = self.unit_KiloJou_long_name
-        self.unit_KiloJou_l_4 = ET.SubElement(self.unit_KiloJou_long_name, 'L-4')
-        self.variables['unit_KiloJou_l_4'] = self.unit_KiloJou_l_4
-        self.unit_KiloJou_l_4.text = 'Kilojoule'
-        self.unit_KiloJou_l_4.attrib = {'L': 'EN'}
-        self.unit_KiloJou_display_name = ET.SubElement(self.unit_KiloJou, 'DISPLAY-NAME')
-        self.variables['unit_KiloJou_display_name'] = self.unit_KiloJou_display_name
-        self.unit_KiloJou_display_name.text = 'kJ'
-        self.unit_KiloJou_factor_si_to_unit = ET.SubElement(self.unit_KiloJou, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_KiloJou_factor_si_to_unit'] = self.unit_KiloJou_factor_si_to_unit
-        self.unit_KiloJou_factor_si_to_unit.text = '0.001'
-        self.unit_KiloJou_offset_si_to_unit = ET.SubElement(self.unit_KiloJou, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_KiloJou_offset_si_to_unit'] = self.unit_KiloJou_offset_si_to_unit
-        self.unit_KiloJou_offset_si_to_unit.text = '0'
-        self.unit_KiloJou_physical_dimension_ref = ET.SubElement(self.unit_KiloJou, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_KiloJou_physical_dimension_ref'] = self.unit_KiloJou_physical_dimension_ref
-        self.unit_KiloJou_physical_dimension_ref.text = 'Len2M1TiNeg2_1'
-        self.unit_KiloJou_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_KiloMtr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_KiloMtr'] = self.unit_KiloMtr
-        self.unit_KiloMtr_short_name = ET.SubElement(self.unit_KiloMtr, 'SHORT-NAME')
-        self.variables['unit_KiloMtr_short_name'] = self.unit_KiloMtr_short_name
-        self.unit_KiloMtr_short_name.text = 'KiloMtr'
-        self.unit_KiloMtr_long_name = ET.SubElement(self.unit_KiloMtr, 'LONG-NAME')
-        self.variables['unit_KiloMtr_long_name'] = self.unit_KiloMtr_long_name
-        self.unit_KiloMtr_l_4 = ET.SubElement(self.unit_KiloMtr_long_name, 'L-4')
-        self.variables['unit_KiloMtr_l_4'] = self.unit_KiloMtr_l_4
-        self.unit_KiloMtr_l_4.text = 'Kilometer'
-        self.unit_KiloMtr_l_4.attrib = {'L': 'EN'}
-        self.unit_KiloMtr_display_name = ET.SubElement(self.unit_KiloMtr, 'DISPLAY-NAME')
-        self.variables['unit_KiloMtr_display_name'] = self.unit_KiloMtr_display_name
-        self.unit_KiloMtr_display_name.text = 'km'
-        self.unit_KiloMtr_factor_si_to_unit = ET.SubElement(self.unit_KiloMtr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_KiloMtr_factor_si_to_unit'] = self.unit_KiloMtr_factor_si_to_unit
-        self.unit_KiloMtr_factor_si_to_unit.text = '0.001'
-        self.unit_KiloMtr_offset_si_to_unit = ET.SubElement(self.unit_KiloMtr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_KiloMtr_offset_si_to_unit'] = self.unit_KiloMtr_offset_si_to_unit
-        self.unit_KiloMtr_offset_si_to_unit.text = '0'
-        self.unit_KiloMtr_physical_dimension_ref = ET.SubElement(self.unit_KiloMtr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_KiloMtr_physical_dimension_ref'] = self.unit_KiloMtr_physical_dimension_ref
-        self.unit_KiloMtr_physical_dimension_ref.text = 'Len1'
-        self.unit_KiloMtr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_KiloMtrPerHr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_KiloMtrPerHr'] = self.unit_KiloMtrPerHr
-        self.unit_KiloMtrPerHr_short_name = ET.SubElement(self.unit_KiloMtrPerHr, 'SHORT-NAME')
-        self.variables['unit_KiloMtrPerHr_short_name'] = self.unit_KiloMtrPerHr_short_name
-        self.unit_KiloMtrPerHr_short_name.text = 'KiloMtrPerHr'
-        self.unit_KiloMtrPerHr_long_name = ET.SubElement(self.unit_KiloMtrPerHr, 'LONG-NAME')
-        self.variables['unit_KiloMtrPerHr_long_name'] = self.unit_KiloMtrPerHr_long_name
-        self.unit_KiloMtrPerHr_l_4 = ET.SubElement(self.unit_KiloMtrPerHr_long_name, 'L-4')
-        self.variables['unit_KiloMtrPerHr_l_4'] = self.unit_KiloMtrPerHr_l_4
-        self.unit_KiloMtrPerHr_l_4.text = 'Kilometer Per Hour'
-        self.unit_KiloMtrPerHr_l_4.attrib = {'L': 'EN'}
-        self.unit_KiloMtrPerHr_display_name = ET.SubElement(self.unit_KiloMtrPerHr, 'DISPLAY-NAME')
-        self.variables['unit_KiloMtrPerHr_display_name'] = self.unit_KiloMtrPerHr_display_name
-        self.unit_KiloMtrPerHr_display_name.text = 'km/h'
-        self.unit_KiloMtrPerHr_factor_si_to_unit = ET.SubElement(self.unit_KiloMtrPerHr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_KiloMtrPerHr_factor_si_to_unit'] = self.unit_KiloMtrPerHr_factor_si_to_unit
-        self.unit_KiloMtrPerHr_factor_si_to_unit.text = '3.6'
-        self.unit_KiloMtrPerHr_offset_si_to_unit = ET.SubElement(self.unit_KiloMtrPerHr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_KiloMtrPerHr_offset_si_to_unit'] = self.unit_KiloMtrPerHr_offset_si_to_unit
-        self.unit_KiloMtrPerHr_offset_si_to_unit.text = '0'
-        self.unit_KiloMtrPerHr_physical_dimension_ref = ET.SubElement(self.unit_KiloMtrPerHr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_KiloMtrPerHr_physical_dimension_ref'] = self.unit_KiloMtrPerHr_physical_dimension_ref
-        self.unit_KiloMtrPerHr_physical_dimension_ref.text = 'Len1TiNeg1'
-        self.unit_KiloMtrPerHr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_KiloMtrPerHrPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_KiloMtrPerHrPerSec'] = self.unit_KiloMtrPerHrPerSec
-        self.unit_KiloMtrPerHrPerSec_short_name = ET.SubElement(self.unit_KiloMtrPerHrPerSec, 'SHORT-NAME')
-        self.variables['unit_KiloMtrPerHrPerSec_short_name'] = self.unit_KiloMtrPerHrPerSec_short_name
-        self.unit_KiloMtrPerHrPerSec_short_name.text = 'KiloMtrPerHrPerSec'
-        self.unit_KiloMtrPerHrPerSec_long_name = ET.SubElement(self.unit_KiloMtrPerHrPerSec, 'LONG-NAME')
-        self.variables['unit_KiloMtrPerHrPerSec_long_name'] = self.unit_KiloMtrPerHrPerSec_long_name
-        self.unit_KiloMtrPerHrPerSec_l_4 = ET.SubElement(self.unit_KiloMtrPerHrPerSec_long_name, 'L-4')
-        self.variables['unit_KiloMtrPerHrPerSec_l_4'] = self.unit_KiloMtrPerHrPerSec_l_4
-        self.unit_KiloMtrPerHrPerSec_l_4.text = 'Kilometer Per Hour Per Second'
-        self.unit_KiloMtrPerHrPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_KiloMtrPerHrPerSec_display_name = ET.SubElement(self.unit_KiloMtrPerHrPerSec, 'DISPLAY-NAME')
-        self.variables['unit_KiloMtrPerHrPerSec_display_name'] = self.unit_KiloMtrPerHrPerSec_display_name
-        self.unit_KiloMtrPerHrPerSec_display_name.text = '(km/h)/s'
-        self.unit_KiloMtrPerHrPerSec_factor_si_to_unit = ET.SubElement(self.unit_KiloMtrPerHrPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_KiloMtrPerHrPerSec_factor_si_to_unit'] = self.unit_KiloMtrPerHrPerSec_factor_si_to_unit
-        self.unit_KiloMtrPerHrPerSec_factor_si_to_unit.text = '3.6'
-        self.unit_KiloMtrPerHrPerSec_offset_si_to_unit = ET.SubElement(self.unit_KiloMtrPerHrPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_KiloMtrPerHrPerSec_offset_si_to_unit'] = self.unit_KiloMtrPerHrPerSec_offset_si_to_unit
-        self.unit_KiloMtrPerHrPerSec_offset_si_to_unit.text = '0'
-        self.unit_KiloMtrPerHrPerSec_physical_dimension_ref = ET.SubElement(self.unit_KiloMtrPerHrPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_KiloMtrPerHrPerSec_physical_dimension_ref'] = self.unit_KiloMtrPerHrPerSec_physical_dimension_ref
-        self.unit_KiloMtrPerHrPerSec_physical_dimension_ref.text = 'Len1TiNeg2'
-        self.unit_KiloMtrPerHrPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_KiloNwt = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_KiloNwt'] = self.unit_KiloNwt
-        self.unit_KiloNwt_short_name = ET.SubElement(self.unit_KiloNwt, 'SHORT-NAME')
-        self.variables['unit_KiloNwt_short_name'] = self.unit_KiloNwt_short_name
-        self.unit_KiloNwt_short_name.text = 'KiloNwt'
-        self.unit_KiloNwt_long_name = ET.SubElement(self.unit_KiloNwt, 'LONG-NAME')
-        self.variables['unit_KiloNwt_long_name'] = self.unit_KiloNwt_long_name
-        self.unit_KiloNwt_l_4 = ET.SubElement(self.unit_KiloNwt_long_name, 'L-4')
-        self.variables['unit_KiloNwt_l_4'] = self.unit_KiloNwt_l_4
-        self.unit_KiloNwt_l_4.text = 'Kilonewton'
-        self.unit_KiloNwt_l_4.attrib = {'L': 'EN'}
-        self.unit_KiloNwt_display_name = ET.SubElement(self.unit_KiloNwt, 'DISPLAY-NAME')
-        self.variables['unit_KiloNwt_display_name'] = self.unit_KiloNwt_display_name
-        self.unit_KiloNwt_display_name.text = 'kN'
-        self.unit_KiloNwt_factor_si_to_unit = ET.SubElement(self.unit_KiloNwt, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_KiloNwt_factor_si_to_unit'] = self.unit_KiloNwt_factor_si_to_unit
-        self.unit_KiloNwt_factor_si_to_unit.text = '0.001'
-        self.unit_KiloNwt_offset_si_to_unit = ET.SubElement(self.unit_KiloNwt, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_KiloNwt_offset_si_to_unit'] = self.unit_KiloNwt_offset_si_to_unit
-        self.unit_KiloNwt_offset_si_to_unit.text = '0'
-        self.unit_KiloNwt_physical_dimension_ref = ET.SubElement(self.unit_KiloNwt, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_KiloNwt_physical_dimension_ref'] = self.unit_KiloNwt_physical_dimension_ref
-        self.unit_KiloNwt_physical_dimension_ref.text = 'Len1M1TiNeg2'
-        self.unit_KiloNwt_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_KiloNwtMtrPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_KiloNwtMtrPerSec'] = self.unit_KiloNwtMtrPerSec
-        self.unit_KiloNwtMtrPerSec_short_name = ET.SubElement(self.unit_KiloNwtMtrPerSec, 'SHORT-NAME')
-        self.variables['unit_KiloNwtMtrPerSec_short_name'] = self.unit_KiloNwtMtrPerSec_short_name
-        self.unit_KiloNwtMtrPerSec_short_name.text = 'KiloNwtMtrPerSec'
-        self.unit_KiloNwtMtrPerSec_long_name = ET.SubElement(self.unit_KiloNwtMtrPerSec, 'LONG-NAME')
-        self.variables['unit_KiloNwtMtrPerSec_long_name'] = self.unit_KiloNwtMtrPerSec_long_name
-        self.unit_KiloNwtMtrPerSec_l_4 = ET.SubElement(self.unit_KiloNwtMtrPerSec_long_name, 'L-4')
-        self.variables['unit_KiloNwtMtrPerSec_l_4'] = self.unit_KiloNwtMtrPerSec_l_4
-        self.unit_KiloNwtMtrPerSec_l_4.text = 'Kilonewtonmeter Per Second'
-        self.unit_KiloNwtMtrPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_KiloNwtMtrPerSec_display_name = ET.SubElement(self.unit_KiloNwtMtrPerSec, 'DISPLAY-NAME')
-        self.variables['unit_KiloNwtMtrPerSec_display_name'] = self.unit_KiloNwtMtrPerSec_display_name
-        self.unit_KiloNwtMtrPerSec_display_name.text = '(kN*m)/s'
-        self.unit_KiloNwtMtrPerSec_factor_si_to_unit = ET.SubElement(self.unit_KiloNwtMtrPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_KiloNwtMtrPerSec_factor_si_to_unit'] = self.unit_KiloNwtMtrPerSec_factor_si_to_unit
-        self.unit_KiloNwtMtrPerSec_factor_si_to_unit.text = '0.001'
-        self.unit_KiloNwtMtrPerSec_offset_si_to_unit = ET.SubElement(self.unit_KiloNwtMtrPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_KiloNwtMtrPerSec_offset_si_to_unit'] = self.unit_KiloNwtMtrPerSec_offset_si_to_unit
-        self.unit_KiloNwtMtrPerSec_offset_si_to_unit.text = '0'
-        self.unit_KiloNwtMtrPerSec_physical_dimension_ref = ET.SubElement(self.unit_KiloNwtMtrPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_KiloNwtMtrPerSec_physical_dimension_ref'] = self.unit_KiloNwtMtrPerSec_physical_dimension_ref
-        self.unit_KiloNwtMtrPerSec_physical_dimension_ref.text = 'Len2M1TiNeg3'
-        self.unit_KiloNwtMtrPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_KiloOhm = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_KiloOhm'] = self.unit_KiloOhm
-        self.unit_KiloOhm_short_name = ET.SubElement(self.unit_KiloOhm, 'SHORT-NAME')
-        self.variables['unit_KiloOhm_short_name'] = self.unit_KiloOhm_short_name
-        self.unit_KiloOhm_short_name.text = 'KiloOhm'
-        self.unit_KiloOhm_long_name = ET.SubElement(self.unit_KiloOhm, 'LONG-NAME')
-        self.variables['unit_KiloOhm_long_name'] = self.unit_KiloOhm_long_name
-        self.unit_KiloOhm_l_4 = ET.SubElement(self.unit_KiloOhm_long_name, 'L-4')
-        self.variables['unit_KiloOhm_l_4'] = self.unit_KiloOhm_l_4
-        self.unit_KiloOhm_l_4.text = 'Kiloohm'
-        self.unit_KiloOhm_l_4.attrib = {'L': 'EN'}
-        self.unit_KiloOhm_display_name = ET.SubElement(self.unit_KiloOhm, 'DISPLAY-NAME')
-        self.variables['unit_KiloOhm_display_name'] = self.unit_KiloOhm_display_name
-        self.unit_KiloOhm_display_name.text = 'kΩ'
-        self.unit_KiloOhm_factor_si_to_unit = ET.SubElement(self.unit_KiloOhm, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_KiloOhm_factor_si_to_unit'] = self.unit_KiloOhm_factor_si_to_unit
-        self.unit_KiloOhm_factor_si_to_unit.text = '0.001'
-        self.unit_KiloOhm_offset_si_to_unit = ET.SubElement(self.unit_KiloOhm, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_KiloOhm_offset_si_to_unit'] = self.unit_KiloOhm_offset_si_to_unit
-        self.unit_KiloOhm_offset_si_to_unit.text = '0'
-        self.unit_KiloOhm_physical_dimension_ref = ET.SubElement(self.unit_KiloOhm, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_KiloOhm_physical_dimension_ref'] = self.unit_KiloOhm_physical_dimension_ref
-        self.unit_KiloOhm_physical_dimension_ref.text = 'Len2M1TiNeg3INeg2'
-        self.unit_KiloOhm_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_KiloVolt = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_KiloVolt'] = self.unit_KiloVolt
-        self.unit_KiloVolt_short_name = ET.SubElement(self.unit_KiloVolt, 'SHORT-NAME')
-        self.variables['unit_KiloVolt_short_name'] = self.unit_KiloVolt_short_name
-        self.unit_KiloVolt_short_name.text = 'KiloVolt'
-        self.unit_KiloVolt_long_name = ET.SubElement(self.unit_KiloVolt, 'LONG-NAME')
-        self.variables['unit_KiloVolt_long_name'] = self.unit_KiloVolt_long_name
-        self.unit_KiloVolt_l_4 = ET.SubElement(self.unit_KiloVolt_long_name, 'L-4')
-        self.variables['unit_KiloVolt_l_4'] = self.unit_KiloVolt_l_4
-        self.unit_KiloVolt_l_4.text = 'Kilovolt'
-        self.unit_KiloVolt_l_4.attrib = {'L': 'EN'}
-        self.unit_KiloVolt_display_name = ET.SubElement(self.unit_KiloVolt, 'DISPLAY-NAME')
-        self.variables['unit_KiloVolt_display_name'] = self.unit_KiloVolt_display_name
-        self.unit_KiloVolt_display_name.text = 'kV'
-        self.unit_KiloVolt_factor_si_to_unit = ET.SubElement(self.unit_KiloVolt, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_KiloVolt_factor_si_to_unit'] = self.unit_KiloVolt_factor_si_to_unit
-        self.unit_KiloVolt_factor_si_to_unit.text = '0.001'
-        self.unit_KiloVolt_offset_si_to_unit = ET.SubElement(self.unit_KiloVolt, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_KiloVolt_offset_si_to_unit'] = self.unit_KiloVolt_offset_si_to_unit
-        self.unit_KiloVolt_offset_si_to_unit.text = '0'
-        self.unit_KiloVolt_physical_dimension_ref = ET.SubElement(self.unit_KiloVolt, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_KiloVolt_physical_dimension_ref'] = self.unit_KiloVolt_physical_dimension_ref
-        self.unit_KiloVolt_physical_dimension_ref.text = 'Len2M1TiNeg3INeg1'
-        self.unit_KiloVolt_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_KiloWatt = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_KiloWatt'] = self.unit_KiloWatt
-        self.unit_KiloWatt_short_name = ET.SubElement(self.unit_KiloWatt, 'SHORT-NAME')
-        self.variables['unit_KiloWatt_short_name'] = self.unit_KiloWatt_short_name
-        self.unit_KiloWatt_short_name.text = 'KiloWatt'
-        self.unit_KiloWatt_long_name = ET.SubElement(self.unit_KiloWatt, 'LONG-NAME')
-        self.variables['unit_KiloWatt_long_name'] = self.unit_KiloWatt_long_name
-        self.unit_KiloWatt_l_4 = ET.SubElement(self.unit_KiloWatt_long_name, 'L-4')
-        self.variables['unit_KiloWatt_l_4'] = self.unit_KiloWatt_l_4
-        self.unit_KiloWatt_l_4.text = 'Kilowatt'
-        self.unit_KiloWatt_l_4.attrib = {'L': 'EN'}
-        self.unit_KiloWatt_display_name = ET.SubElement(self.unit_KiloWatt, 'DISPLAY-NAME')
-        self.variables['unit_KiloWatt_display_name'] = self.unit_KiloWatt_display_name
-        self.unit_KiloWatt_display_name.text = 'kW'
-        self.unit_KiloWatt_factor_si_to_unit = ET.SubElement(self.unit_KiloWatt, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_KiloWatt_factor_si_to_unit'] = self.unit_KiloWatt_factor_si_to_unit
-        self.unit_KiloWatt_factor_si_to_unit.text = '0.001'
-        self.unit_KiloWatt_offset_si_to_unit = ET.SubElement(self.unit_KiloWatt, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_KiloWatt_offset_si_to_unit'] = self.unit_KiloWatt_offset_si_to_unit
-        self.unit_KiloWatt_offset_si_to_unit.text = '0'
-        self.unit_KiloWatt_physical_dimension_ref = ET.SubElement(self.unit_KiloWatt, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_KiloWatt_physical_dimension_ref'] = self.unit_KiloWatt_physical_dimension_ref
-        self.unit_KiloWatt_physical_dimension_ref.text = 'Len2M1TiNeg3_1'
-        self.unit_KiloWatt_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_KiloWattHr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_KiloWattHr'] = self.unit_KiloWattHr
-        self.unit_KiloWattHr_short_name = ET.SubElement(self.unit_KiloWattHr, 'SHORT-NAME')
-        self.variables['unit_KiloWattHr_short_name'] = self.unit_KiloWattHr_short_name
-        self.unit_KiloWattHr_short_name.text = 'KiloWattHr'
-        self.unit_KiloWattHr_long_name = ET.SubElement(self.unit_KiloWattHr, 'LONG-NAME')
-        self.variables['unit_KiloWattHr_long_name'] = self.unit_KiloWattHr_long_name
-        self.unit_KiloWattHr_l_4 = ET.SubElement(self.unit_KiloWattHr_long_name, 'L-4')
-        self.variables['unit_KiloWattHr_l_4'] = self.unit_KiloWattHr_l_4
-        self.unit_KiloWattHr_l_4.text = 'Kilowatthour'
-        self.unit_KiloWattHr_l_4.attrib = {'L': 'EN'}
-        self.unit_KiloWattHr_display_name = ET.SubElement(self.unit_KiloWattHr, 'DISPLAY-NAME')
-        self.variables['unit_KiloWattHr_display_name'] = self.unit_KiloWattHr_display_name
-        self.unit_KiloWattHr_display_name.text = 'kWh'
-        self.unit_KiloWattHr_factor_si_to_unit = ET.SubElement(self.unit_KiloWattHr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_KiloWattHr_factor_si_to_unit'] = self.unit_KiloWattHr_factor_si_to_unit
-        self.unit_KiloWattHr_factor_si_to_unit.text = '2.77777777777778E-07'
-        self.unit_KiloWattHr_offset_si_to_unit = ET.SubElement(self.unit_KiloWattHr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_KiloWattHr_offset_si_to_unit'] = self.unit_KiloWattHr_offset_si_to_unit
-        self.unit_KiloWattHr_offset_si_to_unit.text = '0'
-        self.unit_KiloWattHr_physical_dimension_ref = ET.SubElement(self.unit_KiloWattHr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_KiloWattHr_physical_dimension_ref'] = self.unit_KiloWattHr_physical_dimension_ref
-        self.unit_KiloWattHr_physical_dimension_ref.text = 'Len2M1TiNeg2_1'
-        self.unit_KiloWattHr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_KiloWattHrPer100KiloMtr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_KiloWattHrPer100KiloMtr'] = self.unit_KiloWattHrPer100KiloMtr
-        self.unit_KiloWattHrPer100KiloMtr_short_name = ET.SubElement(self.unit_KiloWattHrPer100KiloMtr, 'SHORT-NAME')
-        self.variables['unit_KiloWattHrPer100KiloMtr_short_name'] = self.unit_KiloWattHrPer100KiloMtr_short_name
-        self.unit_KiloWattHrPer100KiloMtr_short_name.text = 'KiloWattHrPer100KiloMtr'
-        self.unit_KiloWattHrPer100KiloMtr_long_name = ET.SubElement(self.unit_KiloWattHrPer100KiloMtr, 'LONG-NAME')
-        self.variables['unit_KiloWattHrPer100KiloMtr_long_name'] = self.unit_KiloWattHrPer100KiloMtr_long_name
-        self.unit_KiloWattHrPer100KiloMtr_l_4 = ET.SubElement(self.unit_KiloWattHrPer100KiloMtr_long_name, 'L-4')
-        self.variables['unit_KiloWattHrPer100KiloMtr_l_4'] = self.unit_KiloWattHrPer100KiloMtr_l_4
-        self.unit_KiloWattHrPer100KiloMtr_l_4.text = 'Kilowatthour Per 100 Kilometer'
-        self.unit_KiloWattHrPer100KiloMtr_l_4.attrib = {'L': 'EN'}
-        self.unit_KiloWattHrPer100KiloMtr_display_name = ET.SubElement(self.unit_KiloWattHrPer100KiloMtr, 'DISPLAY-NAME')
-        self.variables['unit_KiloWattHrPer100KiloMtr_display_name'] = self.unit_KiloWattHrPer100KiloMtr_display_name
-        self.unit_KiloWattHrPer100KiloMtr_display_name.text = 'kWh/(100*km)'
-        self.unit_KiloWattHrPer100KiloMtr_factor_si_to_unit = ET.SubElement(self.unit_KiloWattHrPer100KiloMtr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_KiloWattHrPer100KiloMtr_factor_si_to_unit'] = self.unit_KiloWattHrPer100KiloMtr_factor_si_to_unit
-        self.unit_KiloWattHrPer100KiloMtr_factor_si_to_unit.text = '0.0277777777777778'
-        self.unit_KiloWattHrPer100KiloMtr_offset_si_to_unit = ET.SubElement(self.unit_KiloWattHrPer100KiloMtr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_KiloWattHrPer100KiloMtr_offset_si_to_unit'] = self.unit_KiloWattHrPer100KiloMtr_offset_si_to_unit
-        self.unit_KiloWattHrPer100KiloMtr_offset_si_to_unit.text = '0'
-        self.unit_KiloWattHrPer100KiloMtr_physical_dimension_ref = ET.SubElement(self.unit_KiloWattHrPer100KiloMtr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_KiloWattHrPer100KiloMtr_physical_dimension_ref'] = self.unit_KiloWattHrPer100KiloMtr_physical_dimension_ref
-        self.unit_KiloWattHrPer100KiloMtr_physical_dimension_ref.text = 'Len1M1TiNeg2_1'
-        self.unit_KiloWattHrPer100KiloMtr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Ltr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Ltr'] = self.unit_Ltr
-        self.unit_Ltr_short_name = ET.SubElement(self.unit_Ltr, 'SHORT-NAME')
-        self.variables['unit_Ltr_short_name'] = self.unit_Ltr_short_name
-        self.unit_Ltr_short_name.text = 'Ltr'
-        self.unit_Ltr_long_name = ET.SubElement(self.unit_Ltr, 'LONG-NAME')
-        self.variables['unit_Ltr_long_name'] = self.unit_Ltr_long_name
-        self.unit_Ltr_l_4 = ET.SubElement(self.unit_Ltr_long_name, 'L-4')
-        self.variables['unit_Ltr_l_4'] = self.unit_Ltr_l_4
-        self.unit_Ltr_l_4.text = 'Liter'
-        self.unit_Ltr_l_4.attrib = {'L': 'EN'}
-        self.unit_Ltr_display_name = ET.SubElement(self.unit_Ltr, 'DISPLAY-NAME')
-        self.variables['unit_Ltr_display_name'] = self.unit_Ltr_display_name
-        self.unit_Ltr_display_name.text = 'l'
-        self.unit_Ltr_factor_si_to_unit = ET.SubElement(self.unit_Ltr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Ltr_factor_si_to_unit'] = self.unit_Ltr_factor_si_to_unit
-        self.unit_Ltr_factor_si_to_unit.text = '1000'
-        self.unit_Ltr_offset_si_to_unit = ET.SubElement(self.unit_Ltr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Ltr_offset_si_to_unit'] = self.unit_Ltr_offset_si_to_unit
-        self.unit_Ltr_offset_si_to_unit.text = '0'
-        self.unit_Ltr_physical_dimension_ref = ET.SubElement(self.unit_Ltr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Ltr_physical_dimension_ref'] = self.unit_Ltr_physical_dimension_ref
-        self.unit_Ltr_physical_dimension_ref.text = 'Len3'
-        self.unit_Ltr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_LtrPer100KiloMtr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_LtrPer100KiloMtr'] = self.unit_LtrPer100KiloMtr
-        self.unit_LtrPer100KiloMtr_short_name = ET.SubElement(self.unit_LtrPer100KiloMtr, 'SHORT-NAME')
-        self.variables['unit_LtrPer100KiloMtr_short_name'] = self.unit_LtrPer100KiloMtr_short_name
-        self.unit_LtrPer100KiloMtr_short_name.text = 'LtrPer100KiloMtr'
-        self.unit_LtrPer100KiloMtr_long_name = ET.SubElement(self.unit_LtrPer100KiloMtr, 'LONG-NAME')
-        self.variables['unit_LtrPer100KiloMtr_long_name'] = self.unit_LtrPer100KiloMtr_long_name
-        self.unit_LtrPer100KiloMtr_l_4 = ET.SubElement(self.unit_LtrPer100KiloMtr_long_name, 'L-4')
-        self.variables['unit_LtrPer100KiloMtr_l_4'] = self.unit_LtrPer100KiloMtr_l_4
-        self.unit_LtrPer100KiloMtr_l_4.text = 'Liter Per 100 Kilometer'
-        self.unit_LtrPer100KiloMtr_l_4.attrib = {'L': 'EN'}
-        self.unit_LtrPer100KiloMtr_display_name = ET.SubElement(self.unit_LtrPer100KiloMtr, 'DISPLAY-NAME')
-        self.variables['unit_LtrPer100KiloMtr_display_name'] = self.unit_LtrPer100KiloMtr_display_name
-        self.unit_LtrPer100KiloMtr_display_name.text = 'l/(100km)'
-        self.unit_LtrPer100KiloMtr_factor_si_to_unit = ET.SubElement(self.unit_LtrPer100KiloMtr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_LtrPer100KiloMtr_factor_si_to_unit'] = self.unit_LtrPer100KiloMtr_factor_si_to_unit
-        self.unit_LtrPer100KiloMtr_factor_si_to_unit.text = '100000000'
-        self.unit_LtrPer100KiloMtr_offset_si_to_unit = ET.SubElement(self.unit_LtrPer100KiloMtr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_LtrPer100KiloMtr_offset_si_to_unit'] = self.unit_LtrPer100KiloMtr_offset_si_to_unit
-        self.unit_LtrPer100KiloMtr_offset_si_to_unit.text = '0'
-        self.unit_LtrPer100KiloMtr_physical_dimension_ref = ET.SubElement(self.unit_LtrPer100KiloMtr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_LtrPer100KiloMtr_physical_dimension_ref'] = self.unit_LtrPer100KiloMtr_physical_dimension_ref
-        self.unit_LtrPer100KiloMtr_physical_dimension_ref.text = 'Len2_1'
-        self.unit_LtrPer100KiloMtr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_LtrPerHr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_LtrPerHr'] = self.unit_LtrPerHr
-        self.unit_LtrPerHr_short_name = ET.SubElement(self.unit_LtrPerHr, 'SHORT-NAME')
-        self.variables['unit_LtrPerHr_short_name'] = self.unit_LtrPerHr_short_name
-        self.unit_LtrPerHr_short_name.text = 'LtrPerHr'
-        self.unit_LtrPerHr_long_name = ET.SubElement(self.unit_LtrPerHr, 'LONG-NAME')
-        self.variables['unit_LtrPerHr_long_name'] = self.unit_LtrPerHr_long_name
-        self.unit_LtrPerHr_l_4 = ET.SubElement(self.unit_LtrPerHr_long_name, 'L-4')
-        self.variables['unit_LtrPerHr_l_4'] = self.unit_LtrPerHr_l_4
-        self.unit_LtrPerHr_l_4.text = 'Liter Per Hour'
-        self.unit_LtrPerHr_l_4.attrib = {'L': 'EN'}
-        self.unit_LtrPerHr_display_name = ET.SubElement(self.unit_LtrPerHr, 'DISPLAY-NAME')
-        self.variables['unit_LtrPerHr_display_name'] = self.unit_LtrPerHr_display_name
-        self.unit_LtrPerHr_display_name.text = 'l/h'
-        self.unit_LtrPerHr_factor_si_to_unit = ET.SubElement(self.unit_LtrPerHr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_LtrPerHr_factor_si_to_unit'] = self.unit_LtrPerHr_factor_si_to_unit
-        self.unit_LtrPerHr_factor_si_to_unit.text = '3600000'
-        self.unit_LtrPerHr_offset_si_to_unit = ET.SubElement(self.unit_LtrPerHr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_LtrPerHr_offset_si_to_unit'] = self.unit_LtrPerHr_offset_si_to_unit
-        self.unit_LtrPerHr_offset_si_to_unit.text = '0'
-        self.unit_LtrPerHr_physical_dimension_ref = ET.SubElement(self.unit_LtrPerHr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_LtrPerHr_physical_dimension_ref'] = self.unit_LtrPerHr_physical_dimension_ref
-        self.unit_LtrPerHr_physical_dimension_ref.text = 'Len3TiNeg1'
-        self.unit_LtrPerHr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_LtrPerKiloMtr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_LtrPerKiloMtr'] = self.unit_LtrPerKiloMtr
-        self.unit_LtrPerKiloMtr_short_name = ET.SubElement(self.unit_LtrPerKiloMtr, 'SHORT-NAME')
-        self.variables['unit_LtrPerKiloMtr_short_name'] = self.unit_LtrPerKiloMtr_short_name
-        self.unit_LtrPerKiloMtr_short_name.text = 'LtrPerKiloMtr'
-        self.unit_LtrPerKiloMtr_long_name = ET.SubElement(self.unit_LtrPerKiloMtr, 'LONG-NAME')
-        self.variables['unit_LtrPerKiloMtr_long_name'] = self.unit_LtrPerKiloMtr_long_name
-        self.unit_LtrPerKiloMtr_l_4 = ET.SubElement(self.unit_LtrPerKiloMtr_long_name, 'L-4')
-        self.variables['unit_LtrPerKiloMtr_l_4'] = self.unit_LtrPerKiloMtr_l_4
-        self.unit_LtrPerKiloMtr_l_4.text = 'Liter Per Kilometer'
-        self.unit_LtrPerKiloMtr_l_4.attrib = {'L': 'EN'}
-        self.unit_LtrPerKiloMtr_display_name = ET.SubElement(self.unit_LtrPerKiloMtr, 'DISPLAY-NAME')
-        self.variables['unit_LtrPerKiloMtr_display_name'] = self.unit_LtrPerKiloMtr_display_name
-        self.unit_LtrPerKiloMtr_display_name.text = 'l/km'
-        self.unit_LtrPerKiloMtr_factor_si_to_unit = ET.SubElement(self.unit_LtrPerKiloMtr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_LtrPerKiloMtr_factor_si_to_unit'] = self.unit_LtrPerKiloMtr_factor_si_to_unit
-        self.unit_LtrPerKiloMtr_factor_si_to_unit.text = '1000000'
-        self.unit_LtrPerKiloMtr_offset_si_to_unit = ET.SubElement(self.unit_LtrPerKiloMtr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_LtrPerKiloMtr_offset_si_to_unit'] = self.unit_LtrPerKiloMtr_offset_si_to_unit
-        self.unit_LtrPerKiloMtr_offset_si_to_unit.text = '0'
-        self.unit_LtrPerKiloMtr_physical_dimension_ref = ET.SubElement(self.unit_LtrPerKiloMtr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_LtrPerKiloMtr_physical_dimension_ref'] = self.unit_LtrPerKiloMtr_physical_dimension_ref
-        self.unit_LtrPerKiloMtr_physical_dimension_ref.text = 'Len2_1'
-        self.unit_LtrPerKiloMtr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MegaBitPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MegaBitPerSec'] = self.unit_MegaBitPerSec
-        self.unit_MegaBitPerSec_short_name = ET.SubElement(self.unit_MegaBitPerSec, 'SHORT-NAME')
-        self.variables['unit_MegaBitPerSec_short_name'] = self.unit_MegaBitPerSec_short_name
-        self.unit_MegaBitPerSec_short_name.text = 'MegaBitPerSec'
-        self.unit_MegaBitPerSec_long_name = ET.SubElement(self.unit_MegaBitPerSec, 'LONG-NAME')
-        self.variables['unit_MegaBitPerSec_long_name'] = self.unit_MegaBitPerSec_long_name
-        self.unit_MegaBitPerSec_l_4 = ET.SubElement(self.unit_MegaBitPerSec_long_name, 'L-4')
-        self.variables['unit_MegaBitPerSec_l_4'] = self.unit_MegaBitPerSec_l_4
-        self.unit_MegaBitPerSec_l_4.text = 'Megabit Per Second'
-        self.unit_MegaBitPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_MegaBitPerSec_display_name = ET.SubElement(self.unit_MegaBitPerSec, 'DISPLAY-NAME')
-        self.variables['unit_MegaBitPerSec_display_name'] = self.unit_MegaBitPerSec_display_name
-        self.unit_MegaBitPerSec_display_name.text = 'Mbit/s'
-        self.unit_MegaBitPerSec_factor_si_to_unit = ET.SubElement(self.unit_MegaBitPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MegaBitPerSec_factor_si_to_unit'] = self.unit_MegaBitPerSec_factor_si_to_unit
-        self.unit_MegaBitPerSec_factor_si_to_unit.text = '1E-06'
-        self.unit_MegaBitPerSec_offset_si_to_unit = ET.SubElement(self.unit_MegaBitPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MegaBitPerSec_offset_si_to_unit'] = self.unit_MegaBitPerSec_offset_si_to_unit
-        self.unit_MegaBitPerSec_offset_si_to_unit.text = '0'
-        self.unit_MegaBitPerSec_physical_dimension_ref = ET.SubElement(self.unit_MegaBitPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MegaBitPerSec_physical_dimension_ref'] = self.unit_MegaBitPerSec_physical_dimension_ref
-        self.unit_MegaBitPerSec_physical_dimension_ref.text = 'TiNeg1_3'
-        self.unit_MegaBitPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MegaHz = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MegaHz'] = self.unit_MegaHz
-        self.unit_MegaHz_short_name = ET.SubElement(self.unit_MegaHz, 'SHORT-NAME')
-        self.variables['unit_MegaHz_short_name'] = self.unit_MegaHz_short_name
-        self.unit_MegaHz_short_name.text = 'MegaHz'
-        self.unit_MegaHz_long_name = ET.SubElement(self.unit_MegaHz, 'LONG-NAME')
-        self.variables['unit_MegaHz_long_name'] = self.unit_MegaHz_long_name
-        self.unit_MegaHz_l_4 = ET.SubElement(self.unit_MegaHz_long_name, 'L-4')
-        self.variables['unit_MegaHz_l_4'] = self.unit_MegaHz_l_4
-        self.unit_MegaHz_l_4.text = 'Megahertz'
-        self.unit_MegaHz_l_4.attrib = {'L': 'EN'}
-        self.unit_MegaHz_display_name = ET.SubElement(self.unit_MegaHz, 'DISPLAY-NAME')
-        self.variables['unit_MegaHz_display_name'] = self.unit_MegaHz_display_name
-        self.unit_MegaHz_display_name.text = 'MHz'
-        self.unit_MegaHz_factor_si_to_unit = ET.SubElement(self.unit_MegaHz, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MegaHz_factor_si_to_unit'] = self.unit_MegaHz_factor_si_to_unit
-        self.unit_MegaHz_factor_si_to_unit.text = '1E-06'
-        self.unit_MegaHz_offset_si_to_unit = ET.SubElement(self.unit_MegaHz, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MegaHz_offset_si_to_unit'] = self.unit_MegaHz_offset_si_to_unit
-        self.unit_MegaHz_offset_si_to_unit.text = '0'
-        self.unit_MegaHz_physical_dimension_ref = ET.SubElement(self.unit_MegaHz, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MegaHz_physical_dimension_ref'] = self.unit_MegaHz_physical_dimension_ref
-        self.unit_MegaHz_physical_dimension_ref.text = 'TiNeg1'
-        self.unit_MegaHz_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MegaJou = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MegaJou'] = self.unit_MegaJou
-        self.unit_MegaJou_short_name = ET.SubElement(self.unit_MegaJou, 'SHORT-NAME')
-        self.variables['unit_MegaJou_short_name'] = self.unit_MegaJou_short_name
-        self.unit_MegaJou_short_name.text = 'MegaJou'
-        self.unit_MegaJou_long_name = ET.SubElement(self.unit_MegaJou, 'LONG-NAME')
-        self.variables['unit_MegaJou_long_name'] = self.unit_MegaJou_long_name
-        self.unit_MegaJou_l_4 = ET.SubElement(self.unit_MegaJou_long_name, 'L-4')
-        self.variables['unit_MegaJou_l_4'] = self.unit_MegaJou_l_4
-        self.unit_MegaJou_l_4.text = 'Megajoule'
-        self.unit_MegaJou_l_4.attrib = {'L': 'EN'}
-        self.unit_MegaJou_display_name = ET.SubElement(self.unit_MegaJou, 'DISPLAY-NAME')
-        self.variables['unit_MegaJou_display_name'] = self.unit_MegaJou_display_name
-        self.unit_MegaJou_display_name.text = 'MJ'
-        self.unit_MegaJou_factor_si_to_unit = ET.SubElement(self.unit_MegaJou, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MegaJou_factor_si_to_unit'] = self.unit_MegaJou_factor_si_to_unit
-        self.unit_MegaJou_factor_si_to_unit.text = '1E-06'
-        self.unit_MegaJou_offset_si_to_unit = ET.SubElement(self.unit_MegaJou, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MegaJou_offset_si_to_unit'] = self.unit_MegaJou_offset_si_to_unit
-        self.unit_MegaJou_offset_si_to_unit.text = '0'
-        self.unit_MegaJou_physical_dimension_ref = ET.SubElement(self.unit_MegaJou, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MegaJou_physical_dimension_ref'] = self.unit_MegaJou_physical_dimension_ref
-        self.unit_MegaJou_physical_dimension_ref.text = 'Len2M1TiNeg2_1'
-        self.unit_MegaJou_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MegaOhm = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MegaOhm'] = self.unit_MegaOhm
-        self.unit_MegaOhm_short_name = ET.SubElement(self.unit_MegaOhm, 'SHORT-NAME')
-        self.variables['unit_MegaOhm_short_name'] = self.unit_MegaOhm_short_name
-        self.unit_MegaOhm_short_name.text = 'MegaOhm'
-        self.unit_MegaOhm_long_name = ET.SubElement(self.unit_MegaOhm, 'LONG-NAME')
-        self.variables['unit_MegaOhm_long_name'] = self.unit_MegaOhm_long_name
-        self.unit_MegaOhm_l_4 = ET.SubElement(self.unit_MegaOhm_long_name, 'L-4')
-        self.variables['unit_MegaOhm_l_4'] = self.unit_MegaOhm_l_4
-        self.unit_MegaOhm_l_4.text = 'Megaohm'
-        self.unit_MegaOhm_l_4.attrib = {'L': 'EN'}
-        self.unit_MegaOhm_display_name = ET.SubElement(self.unit_MegaOhm, 'DISPLAY-NAME')
-        self.variables['unit_MegaOhm_display_name'] = self.unit_MegaOhm_display_name
-        self.unit_MegaOhm_display_name.text = 'MΩ'
-        self.unit_MegaOhm_factor_si_to_unit = ET.SubElement(self.unit_MegaOhm, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MegaOhm_factor_si_to_unit'] = self.unit_MegaOhm_factor_si_to_unit
-        self.unit_MegaOhm_factor_si_to_unit.text = '1E-06'
-        self.unit_MegaOhm_offset_si_to_unit = ET.SubElement(self.unit_MegaOhm, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MegaOhm_offset_si_to_unit'] = self.unit_MegaOhm_offset_si_to_unit
-        self.unit_MegaOhm_offset_si_to_unit.text = '0'
-        self.unit_MegaOhm_physical_dimension_ref = ET.SubElement(self.unit_MegaOhm, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MegaOhm_physical_dimension_ref'] = self.unit_MegaOhm_physical_dimension_ref
-        self.unit_MegaOhm_physical_dimension_ref.text = 'Len2M1TiNeg3INeg2'
-        self.unit_MegaOhm_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MegaPa = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MegaPa'] = self.unit_MegaPa
-        self.unit_MegaPa_short_name = ET.SubElement(self.unit_MegaPa, 'SHORT-NAME')
-        self.variables['unit_MegaPa_short_name'] = self.unit_MegaPa_short_name
-        self.unit_MegaPa_short_name.text = 'MegaPa'
-        self.unit_MegaPa_long_name = ET.SubElement(self.unit_MegaPa, 'LONG-NAME')
-        self.variables['unit_MegaPa_long_name'] = self.unit_MegaPa_long_name
-        self.unit_MegaPa_l_4 = ET.SubElement(self.unit_MegaPa_long_name, 'L-4')
-        self.variables['unit_MegaPa_l_4'] = self.unit_MegaPa_l_4
-        self.unit_MegaPa_l_4.text = 'Megapascal'
-        self.unit_MegaPa_l_4.attrib = {'L': 'EN'}
-        self.unit_MegaPa_display_name = ET.SubElement(self.unit_MegaPa, 'DISPLAY-NAME')
-        self.variables['unit_MegaPa_display_name'] = self.unit_MegaPa_display_name
-        self.unit_MegaPa_display_name.text = 'MPa'
-        self.unit_MegaPa_factor_si_to_unit = ET.SubElement(self.unit_MegaPa, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MegaPa_factor_si_to_unit'] = self.unit_MegaPa_factor_si_to_unit
-        self.unit_MegaPa_factor_si_to_unit.text = '1E-06'
-        self.unit_MegaPa_offset_si_to_unit = ET.SubElement(self.unit_MegaPa, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MegaPa_offset_si_to_unit'] = self.unit_MegaPa_offset_si_to_unit
-        self.unit_MegaPa_offset_si_to_unit.text = '0'
-        self.unit_MegaPa_physical_dimension_ref = ET.SubElement(self.unit_MegaPa, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MegaPa_physical_dimension_ref'] = self.unit_MegaPa_physical_dimension_ref
-        self.unit_MegaPa_physical_dimension_ref.text = 'LenNeg1M1TiNeg2'
-        self.unit_MegaPa_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MegaWatt = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MegaWatt'] = self.unit_MegaWatt
-        self.unit_MegaWatt_short_name = ET.SubElement(self.unit_MegaWatt, 'SHORT-NAME')
-        self.variables['unit_MegaWatt_short_name'] = self.unit_MegaWatt_short_name
-        self.unit_MegaWatt_short_name.text = 'MegaWatt'
-        self.unit_MegaWatt_long_name = ET.SubElement(self.unit_MegaWatt, 'LONG-NAME')
-        self.variables['unit_MegaWatt_long_name'] = self.unit_MegaWatt_long_name
-        self.unit_MegaWatt_l_4 = ET.SubElement(self.unit_MegaWatt_long_name, 'L-4')
-        self.variables['unit_MegaWatt_l_4'] = self.unit_MegaWatt_l_4
-        self.unit_MegaWatt_l_4.text = 'Megawatt'
-        self.unit_MegaWatt_l_4.attrib = {'L': 'EN'}
-        self.unit_MegaWatt_display_name = ET.SubElement(self.unit_MegaWatt, 'DISPLAY-NAME')
-        self.variables['unit_MegaWatt_display_name'] = self.unit_MegaWatt_display_name
-        self.unit_MegaWatt_display_name.text = 'MW'
-        self.unit_MegaWatt_factor_si_to_unit = ET.SubElement(self.unit_MegaWatt, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MegaWatt_factor_si_to_unit'] = self.unit_MegaWatt_factor_si_to_unit
-        self.unit_MegaWatt_factor_si_to_unit.text = '1E-06'
-        self.unit_MegaWatt_offset_si_to_unit = ET.SubElement(self.unit_MegaWatt, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MegaWatt_offset_si_to_unit'] = self.unit_MegaWatt_offset_si_to_unit
-        self.unit_MegaWatt_offset_si_to_unit.text = '0'
-        self.unit_MegaWatt_physical_dimension_ref = ET.SubElement(self.unit_MegaWatt, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MegaWatt_physical_dimension_ref'] = self.unit_MegaWatt_physical_dimension_ref
-        self.unit_MegaWatt_physical_dimension_ref.text = 'Len2M1TiNeg3_1'
-        self.unit_MegaWatt_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MicroAmpr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MicroAmpr'] = self.unit_MicroAmpr
-        self.unit_MicroAmpr_short_name = ET.SubElement(self.unit_MicroAmpr, 'SHORT-NAME')
-        self.variables['unit_MicroAmpr_short_name'] = self.unit_MicroAmpr_short_name
-        self.unit_MicroAmpr_short_name.text = 'MicroAmpr'
-        self.unit_MicroAmpr_long_name = ET.SubElement(self.unit_MicroAmpr, 'LONG-NAME')
-        self.variables['unit_MicroAmpr_long_name'] = self.unit_MicroAmpr_long_name
-        self.unit_MicroAmpr_l_4 = ET.SubElement(self.unit_MicroAmpr_long_name, 'L-4')
-        self.variables['unit_MicroAmpr_l_4'] = self.unit_MicroAmpr_l_4
-        self.unit_MicroAmpr_l_4.text = 'Microampere'
-        self.unit_MicroAmpr_l_4.attrib = {'L': 'EN'}
-        self.unit_MicroAmpr_display_name = ET.SubElement(self.unit_MicroAmpr, 'DISPLAY-NAME')
-        self.variables['unit_MicroAmpr_display_name'] = self.unit_MicroAmpr_display_name
-        self.unit_MicroAmpr_display_name.text = 'µA'
-        self.unit_MicroAmpr_factor_si_to_unit = ET.SubElement(self.unit_MicroAmpr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MicroAmpr_factor_si_to_unit'] = self.unit_MicroAmpr_factor_si_to_unit
-        self.unit_MicroAmpr_factor_si_to_unit.text = '1000000'
-        self.unit_MicroAmpr_offset_si_to_unit = ET.SubElement(self.unit_MicroAmpr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MicroAmpr_offset_si_to_unit'] = self.unit_MicroAmpr_offset_si_to_unit
-        self.unit_MicroAmpr_offset_si_to_unit.text = '0'
-        self.unit_MicroAmpr_physical_dimension_ref = ET.SubElement(self.unit_MicroAmpr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MicroAmpr_physical_dimension_ref'] = self.unit_MicroAmpr_physical_dimension_ref
-        self.unit_MicroAmpr_physical_dimension_ref.text = 'I1'
-        self.unit_MicroAmpr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MicroFrd = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MicroFrd'] = self.unit_MicroFrd
-        self.unit_MicroFrd_short_name = ET.SubElement(self.unit_MicroFrd, 'SHORT-NAME')
-        self.variables['unit_MicroFrd_short_name'] = self.unit_MicroFrd_short_name
-        self.unit_MicroFrd_short_name.text = 'MicroFrd'
-        self.unit_MicroFrd_long_name = ET.SubElement(self.unit_MicroFrd, 'LONG-NAME')
-        self.variables['unit_MicroFrd_long_name'] = self.unit_MicroFrd_long_name
-        self.unit_MicroFrd_l_4 = ET.SubElement(self.unit_MicroFrd_long_name, 'L-4')
-        self.variables['unit_MicroFrd_l_4'] = self.unit_MicroFrd_l_4
-        self.unit_MicroFrd_l_4.text = 'Microfarad'
-        self.unit_MicroFrd_l_4.attrib = {'L': 'EN'}
-        self.unit_MicroFrd_display_name = ET.SubElement(self.unit_MicroFrd, 'DISPLAY-NAME')
-        self.variables['unit_MicroFrd_display_name'] = self.unit_MicroFrd_display_name
-        self.unit_MicroFrd_display_name.text = 'µF'
-        self.unit_MicroFrd_factor_si_to_unit = ET.SubElement(self.unit_MicroFrd, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MicroFrd_factor_si_to_unit'] = self.unit_MicroFrd_factor_si_to_unit
-        self.unit_MicroFrd_factor_si_to_unit.text = '1000000'
-        self.unit_MicroFrd_offset_si_to_unit = ET.SubElement(self.unit_MicroFrd, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MicroFrd_offset_si_to_unit'] = self.unit_MicroFrd_offset_si_to_unit
-        self.unit_MicroFrd_offset_si_to_unit.text = '0'
-        self.unit_MicroFrd_physical_dimension_ref = ET.SubElement(self.unit_MicroFrd, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MicroFrd_physical_dimension_ref'] = self.unit_MicroFrd_physical_dimension_ref
-        self.unit_MicroFrd_physical_dimension_ref.text = 'LenNeg2MNeg1Ti4I2'
-        self.unit_MicroFrd_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MicroGr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MicroGr'] = self.unit_MicroGr
-        self.unit_MicroGr_short_name = ET.SubElement(self.unit_MicroGr, 'SHORT-NAME')
-        self.variables['unit_MicroGr_short_name'] = self.unit_MicroGr_short_name
-        self.unit_MicroGr_short_name.text = 'MicroGr'
-        self.unit_MicroGr_long_name = ET.SubElement(self.unit_MicroGr, 'LONG-NAME')
-        self.variables['unit_MicroGr_long_name'] = self.unit_MicroGr_long_name
-        self.unit_MicroGr_l_4 = ET.SubElement(self.unit_MicroGr_long_name, 'L-4')
-        self.variables['unit_MicroGr_l_4'] = self.unit_MicroGr_l_4
-        self.unit_MicroGr_l_4.text = 'Microgram'
-        self.unit_MicroGr_l_4.attrib = {'L': 'EN'}
-        self.unit_MicroGr_display_name = ET.SubElement(self.unit_MicroGr, 'DISPLAY-NAME')
-        self.variables['unit_MicroGr_display_name'] = self.unit_MicroGr_display_name
-        self.unit_MicroGr_display_name.text = 'µg'
-        self.unit_MicroGr_factor_si_to_unit = ET.SubElement(self.unit_MicroGr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MicroGr_factor_si_to_unit'] = self.unit_MicroGr_factor_si_to_unit
-        self.unit_MicroGr_factor_si_to_unit.text = '1000000000'
-        self.unit_MicroGr_offset_si_to_unit = ET.SubElement(self.unit_MicroGr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MicroGr_offset_si_to_unit'] = self.unit_MicroGr_offset_si_to_unit
-        self.unit_MicroGr_offset_si_to_unit.text = '0'
-        self.unit_MicroGr_physical_dimension_ref = ET.SubElement(self.unit_MicroGr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MicroGr_physical_dimension_ref'] = self.unit_MicroGr_physical_dimension_ref
-        self.unit_MicroGr_physical_dimension_ref.text = 'M1'
-        self.unit_MicroGr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MicroJou = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MicroJou'] = self.unit_MicroJou
-        self.unit_MicroJou_short_name = ET.SubElement(self.unit_MicroJou, 'SHORT-NAME')
-        self.variables['unit_MicroJou_short_name'] = self.unit_MicroJou_short_name
-        self.unit_MicroJou_short_name.text = 'MicroJou'
-        self.unit_MicroJou_long_name = ET.SubElement(self.unit_MicroJou, 'LONG-NAME')
-        self.variables['unit_MicroJou_long_name'] = self.unit_MicroJou_long_name
-        self.unit_MicroJou_l_4 = ET.SubElement(self.unit_MicroJou_long_name, 'L-4')
-        self.variables['unit_MicroJou_l_4'] = self.unit_MicroJou_l_4
-        self.unit_MicroJou_l_4.text = 'Microjoule'
-        self.unit_MicroJou_l_4.attrib = {'L': 'EN'}
-        self.unit_MicroJou_display_name = ET.SubElement(self.unit_MicroJou, 'DISPLAY-NAME')
-        self.variables['unit_MicroJou_display_name'] = self.unit_MicroJou_display_name
-        self.unit_MicroJou_display_name.text = 'µJ'
-        self.unit_MicroJou_factor_si_to_unit = ET.SubElement(self.unit_MicroJou, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MicroJou_factor_si_to_unit'] = self.unit_MicroJou_factor_si_to_unit
-        self.unit_MicroJou_factor_si_to_unit.text = '1000000'
-        self.unit_MicroJou_offset_si_to_unit = ET.SubElement(self.unit_MicroJou, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MicroJou_offset_si_to_unit'] = self.unit_MicroJou_offset_si_to_unit
-        self.unit_MicroJou_offset_si_to_unit.text = '0'
-        self.unit_MicroJou_physical_dimension_ref = ET.SubElement(self.unit_MicroJou, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MicroJou_physical_dimension_ref'] = self.unit_MicroJou_physical_dimension_ref
-        self.unit_MicroJou_physical_dimension_ref.text = 'Len2M1TiNeg2_1'
-        self.unit_MicroJou_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MicroLtr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MicroLtr'] = self.unit_MicroLtr
-        self.unit_MicroLtr_short_name = ET.SubElement(self.unit_MicroLtr, 'SHORT-NAME')
-        self.variables['unit_MicroLtr_short_name'] = self.unit_MicroLtr_short_name
-        self.unit_MicroLtr_short_name.text = 'MicroLtr'
-        self.unit_MicroLtr_long_name = ET.SubElement(self.unit_MicroLtr, 'LONG-NAME')
-        self.variables['unit_MicroLtr_long_name'] = self.unit_MicroLtr_long_name
-        self.unit_MicroLtr_l_4 = ET.SubElement(self.unit_MicroLtr_long_name, 'L-4')
-        self.variables['unit_MicroLtr_l_4'] = self.unit_MicroLtr_l_4
-        self.unit_MicroLtr_l_4.text = 'Microliter'
-        self.unit_MicroLtr_l_4.attrib = {'L': 'EN'}
-        self.unit_MicroLtr_display_name = ET.SubElement(self.unit_MicroLtr, 'DISPLAY-NAME')
-        self.variables['unit_MicroLtr_display_name'] = self.unit_MicroLtr_display_name
-        self.unit_MicroLtr_display_name.text = 'µl'
-        self.unit_MicroLtr_factor_si_to_unit = ET.SubElement(self.unit_MicroLtr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MicroLtr_factor_si_to_unit'] = self.unit_MicroLtr_factor_si_to_unit
-        self.unit_MicroLtr_factor_si_to_unit.text = '1000000000'
-        self.unit_MicroLtr_offset_si_to_unit = ET.SubElement(self.unit_MicroLtr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MicroLtr_offset_si_to_unit'] = self.unit_MicroLtr_offset_si_to_unit
-        self.unit_MicroLtr_offset_si_to_unit.text = '0'
-        self.unit_MicroLtr_physical_dimension_ref = ET.SubElement(self.unit_MicroLtr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MicroLtr_physical_dimension_ref'] = self.unit_MicroLtr_physical_dimension_ref
-        self.unit_MicroLtr_physical_dimension_ref.text = 'Len3'
-        self.unit_MicroLtr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MicroLtrPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MicroLtrPerSec'] = self.unit_MicroLtrPerSec
-        self.unit_MicroLtrPerSec_short_name = ET.SubElement(self.unit_MicroLtrPerSec, 'SHORT-NAME')
-        self.variables['unit_MicroLtrPerSec_short_name'] = self.unit_MicroLtrPerSec_short_name
-        self.unit_MicroLtrPerSec_short_name.text = 'MicroLtrPerSec'
-        self.unit_MicroLtrPerSec_long_name = ET.SubElement(self.unit_MicroLtrPerSec, 'LONG-NAME')
-        self.variables['unit_MicroLtrPerSec_long_name'] = self.unit_MicroLtrPerSec_long_name
-        self.unit_MicroLtrPerSec_l_4 = ET.SubElement(self.unit_MicroLtrPerSec_long_name, 'L-4')
-        self.variables['unit_MicroLtrPerSec_l_4'] = self.unit_MicroLtrPerSec_l_4
-        self.unit_MicroLtrPerSec_l_4.text = 'Microliter Per Second'
-        self.unit_MicroLtrPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_MicroLtrPerSec_display_name = ET.SubElement(self.unit_MicroLtrPerSec, 'DISPLAY-NAME')
-        self.variables['unit_MicroLtrPerSec_display_name'] = self.unit_MicroLtrPerSec_display_name
-        self.unit_MicroLtrPerSec_display_name.text = 'µl/s'
-        self.unit_MicroLtrPerSec_factor_si_to_unit = ET.SubElement(self.unit_MicroLtrPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MicroLtrPerSec_factor_si_to_unit'] = self.unit_MicroLtrPerSec_factor_si_to_unit
-        self.unit_MicroLtrPerSec_factor_si_to_unit.text = '1000000000'
-        self.unit_MicroLtrPerSec_offset_si_to_unit = ET.SubElement(self.unit_MicroLtrPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MicroLtrPerSec_offset_si_to_unit'] = self.unit_MicroLtrPerSec_offset_si_to_unit
-        self.unit_MicroLtrPerSec_offset_si_to_unit.text = '0'
-        self.unit_MicroLtrPerSec_physical_dimension_ref = ET.SubElement(self.unit_MicroLtrPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MicroLtrPerSec_physical_dimension_ref'] = self.unit_MicroLtrPerSec_physical_dimension_ref
-        self.unit_MicroLtrPerSec_physical_dimension_ref.text = 'Len3TiNeg1'
-        self.unit_MicroLtrPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MicroMtr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MicroMtr'] = self.unit_MicroMtr
-        self.unit_MicroMtr_short_name = ET.SubElement(self.unit_MicroMtr, 'SHORT-NAME')
-        self.variables['unit_MicroMtr_short_name'] = self.unit_MicroMtr_short_name
-        self.unit_MicroMtr_short_name.text = 'MicroMtr'
-        self.unit_MicroMtr_long_name = ET.SubElement(self.unit_MicroMtr, 'LONG-NAME')
-        self.variables['unit_MicroMtr_long_name'] = self.unit_MicroMtr_long_name
-        self.unit_MicroMtr_l_4 = ET.SubElement(self.unit_MicroMtr_long_name, 'L-4')
-        self.variables['unit_MicroMtr_l_4'] = self.unit_MicroMtr_l_4
-        self.unit_MicroMtr_l_4.text = 'Micrometer'
-        self.unit_MicroMtr_l_4.attrib = {'L': 'EN'}
-        self.unit_MicroMtr_display_name = ET.SubElement(self.unit_MicroMtr, 'DISPLAY-NAME')
-        self.variables['unit_MicroMtr_display_name'] = self.unit_MicroMtr_display_name
-        self.unit_MicroMtr_display_name.text = 'µm'
-        self.unit_MicroMtr_factor_si_to_unit = ET.SubElement(self.unit_MicroMtr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MicroMtr_factor_si_to_unit'] = self.unit_MicroMtr_factor_si_to_unit
-        self.unit_MicroMtr_factor_si_to_unit.text = '1000000'
-        self.unit_MicroMtr_offset_si_to_unit = ET.SubElement(self.unit_MicroMtr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MicroMtr_offset_si_to_unit'] = self.unit_MicroMtr_offset_si_to_unit
-        self.unit_MicroMtr_offset_si_to_unit.text = '0'
-        self.unit_MicroMtr_physical_dimension_ref = ET.SubElement(self.unit_MicroMtr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MicroMtr_physical_dimension_ref'] = self.unit_MicroMtr_physical_dimension_ref
-        self.unit_MicroMtr_physical_dimension_ref.text = 'Len1'
-        self.unit_MicroMtr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MicroSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MicroSec'] = self.unit_MicroSec
-        self.unit_MicroSec_short_name = ET.SubElement(self.unit_MicroSec, 'SHORT-NAME')
-        self.variables['unit_MicroSec_short_name'] = self.unit_MicroSec_short_name
-        self.unit_MicroSec_short_name.text = 'MicroSec'
-        self.unit_MicroSec_long_name = ET.SubElement(self.unit_MicroSec, 'LONG-NAME')
-        self.variables['unit_MicroSec_long_name'] = self.unit_MicroSec_long_name
-        self.unit_MicroSec_l_4 = ET.SubElement(self.unit_MicroSec_long_name, 'L-4')
-        self.variables['unit_MicroSec_l_4'] = self.unit_MicroSec_l_4
-        self.unit_MicroSec_l_4.text = 'Microsecond'
-        self.unit_MicroSec_l_4.attrib = {'L': 'EN'}
-        self.unit_MicroSec_display_name = ET.SubElement(self.unit_MicroSec, 'DISPLAY-NAME')
-        self.variables['unit_MicroSec_display_name'] = self.unit_MicroSec_display_name
-        self.unit_MicroSec_display_name.text = 'µs'
-        self.unit_MicroSec_factor_si_to_unit = ET.SubElement(self.unit_MicroSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MicroSec_factor_si_to_unit'] = self.unit_MicroSec_factor_si_to_unit
-        self.unit_MicroSec_factor_si_to_unit.text = '1000000'
-        self.unit_MicroSec_offset_si_to_unit = ET.SubElement(self.unit_MicroSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MicroSec_offset_si_to_unit'] = self.unit_MicroSec_offset_si_to_unit
-        self.unit_MicroSec_offset_si_to_unit.text = '0'
-        self.unit_MicroSec_physical_dimension_ref = ET.SubElement(self.unit_MicroSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MicroSec_physical_dimension_ref'] = self.unit_MicroSec_physical_dimension_ref
-        self.unit_MicroSec_physical_dimension_ref.text = 'Ti1'
-        self.unit_MicroSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MicroTesla = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MicroTesla'] = self.unit_MicroTesla
-        self.unit_MicroTesla_short_name = ET.SubElement(self.unit_MicroTesla, 'SHORT-NAME')
-        self.variables['unit_MicroTesla_short_name'] = self.unit_MicroTesla_short_name
-        self.unit_MicroTesla_short_name.text = 'MicroTesla'
-        self.unit_MicroTesla_long_name = ET.SubElement(self.unit_MicroTesla, 'LONG-NAME')
-        self.variables['unit_MicroTesla_long_name'] = self.unit_MicroTesla_long_name
-        self.unit_MicroTesla_l_4 = ET.SubElement(self.unit_MicroTesla_long_name, 'L-4')
-        self.variables['unit_MicroTesla_l_4'] = self.unit_MicroTesla_l_4
-        self.unit_MicroTesla_l_4.text = 'Microtesla'
-        self.unit_MicroTesla_l_4.attrib = {'L': 'EN'}
-        self.unit_MicroTesla_display_name = ET.SubElement(self.unit_MicroTesla, 'DISPLAY-NAME')
-        self.variables['unit_MicroTesla_display_name'] = self.unit_MicroTesla_display_name
-        self.unit_MicroTesla_display_name.text = 'µT'
-        self.unit_MicroTesla_factor_si_to_unit = ET.SubElement(self.unit_MicroTesla, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MicroTesla_factor_si_to_unit'] = self.unit_MicroTesla_factor_si_to_unit
-        self.unit_MicroTesla_factor_si_to_unit.text = '1000000'
-        self.unit_MicroTesla_offset_si_to_unit = ET.SubElement(self.unit_MicroTesla, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MicroTesla_offset_si_to_unit'] = self.unit_MicroTesla_offset_si_to_unit
-        self.unit_MicroTesla_offset_si_to_unit.text = '0'
-        self.unit_MicroTesla_physical_dimension_ref = ET.SubElement(self.unit_MicroTesla, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MicroTesla_physical_dimension_ref'] = self.unit_MicroTesla_physical_dimension_ref
-        self.unit_MicroTesla_physical_dimension_ref.text = 'M1TiNeg2INeg1'
-        self.unit_MicroTesla_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MilliAmpr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MilliAmpr'] = self.unit_MilliAmpr
-        self.unit_MilliAmpr_short_name = ET.SubElement(self.unit_MilliAmpr, 'SHORT-NAME')
-        self.variables['unit_MilliAmpr_short_name'] = self.unit_MilliAmpr_short_name
-        self.unit_MilliAmpr_short_name.text = 'MilliAmpr'
-        self.unit_MilliAmpr_long_name = ET.SubElement(self.unit_MilliAmpr, 'LONG-NAME')
-        self.variables['unit_MilliAmpr_long_name'] = self.unit_MilliAmpr_long_name
-        self.unit_MilliAmpr_l_4 = ET.SubElement(self.unit_MilliAmpr_long_name, 'L-4')
-        self.variables['unit_MilliAmpr_l_4'] = self.unit_MilliAmpr_l_4
-        self.unit_MilliAmpr_l_4.text = 'Milliampere'
-        self.unit_MilliAmpr_l_4.attrib = {'L': 'EN'}
-        self.unit_MilliAmpr_display_name = ET.SubElement(self.unit_MilliAmpr, 'DISPLAY-NAME')
-        self.variables['unit_MilliAmpr_display_name'] = self.unit_MilliAmpr_display_name
-        self.unit_MilliAmpr_display_name.text = 'mA/s'
-        self.unit_MilliAmpr_factor_si_to_unit = ET.SubElement(self.unit_MilliAmpr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MilliAmpr_factor_si_to_unit'] = self.unit_MilliAmpr_factor_si_to_unit
-        self.unit_MilliAmpr_factor_si_to_unit.text = '1000'
-        self.unit_MilliAmpr_offset_si_to_unit = ET.SubElement(self.unit_MilliAmpr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MilliAmpr_offset_si_to_unit'] = self.unit_MilliAmpr_offset_si_to_unit
-        self.unit_MilliAmpr_offset_si_to_unit.text = '0'
-        self.unit_MilliAmpr_physical_dimension_ref = ET.SubElement(self.unit_MilliAmpr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MilliAmpr_physical_dimension_ref'] = self.unit_MilliAmpr_physical_dimension_ref
-        self.unit_MilliAmpr_physical_dimension_ref.text = 'I1'
-        self.unit_MilliAmpr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MilliAmprPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MilliAmprPerSec'] = self.unit_MilliAmprPerSec
-        self.unit_MilliAmprPerSec_short_name = ET.SubElement(self.unit_MilliAmprPerSec, 'SHORT-NAME')
-        self.variables['unit_MilliAmprPerSec_short_name'] = self.unit_MilliAmprPerSec_short_name
-        self.unit_MilliAmprPerSec_short_name.text = 'MilliAmprPerSec'
-        self.unit_MilliAmprPerSec_long_name = ET.SubElement(self.unit_MilliAmprPerSec, 'LONG-NAME')
-        self.variables['unit_MilliAmprPerSec_long_name'] = self.unit_MilliAmprPerSec_long_name
-        self.unit_MilliAmprPerSec_l_4 = ET.SubElement(self.unit_MilliAmprPerSec_long_name, 'L-4')
-        self.variables['unit_MilliAmprPerSec_l_4'] = self.unit_MilliAmprPerSec_l_4
-        self.unit_MilliAmprPerSec_l_4.text = 'Milliampere Per Second'
-        self.unit_MilliAmprPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_MilliAmprPerSec_display_name = ET.SubElement(self.unit_MilliAmprPerSec, 'DISPLAY-NAME')
-        self.variables['unit_MilliAmprPerSec_display_name'] = self.unit_MilliAmprPerSec_display_name
-        self.unit_MilliAmprPerSec_display_name.text = 'mA/s'
-        self.unit_MilliAmprPerSec_factor_si_to_unit = ET.SubElement(self.unit_MilliAmprPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MilliAmprPerSec_factor_si_to_unit'] = self.unit_MilliAmprPerSec_factor_si_to_unit
-        self.unit_MilliAmprPerSec_factor_si_to_unit.text = '1000'
-        self.unit_MilliAmprPerSec_offset_si_to_unit = ET.SubElement(self.unit_MilliAmprPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MilliAmprPerSec_offset_si_to_unit'] = self.unit_MilliAmprPerSec_offset_si_to_unit
-        self.unit_MilliAmprPerSec_offset_si_to_unit.text = '0'
-        self.unit_MilliAmprPerSec_physical_dimension_ref = ET.SubElement(self.unit_MilliAmprPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MilliAmprPerSec_physical_dimension_ref'] = self.unit_MilliAmprPerSec_physical_dimension_ref
-        self.unit_MilliAmprPerSec_physical_dimension_ref.text = 'TiNeg1I1'
-        self.unit_MilliAmprPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MilliBar = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MilliBar'] = self.unit_MilliBar
-        self.unit_MilliBar_short_name = ET.SubElement(self.unit_MilliBar, 'SHORT-NAME')
-        self.variables['unit_MilliBar_short_name'] = self.unit_MilliBar_short_name
-        self.unit_MilliBar_short_name.text = 'MilliBar'
-        self.unit_MilliBar_long_name = ET.SubElement(self.unit_MilliBar, 'LONG-NAME')
-        self.variables['unit_MilliBar_long_name'] = self.unit_MilliBar_long_name
-        self.unit_MilliBar_l_4 = ET.SubElement(self.unit_MilliBar_long_name, 'L-4')
-        self.variables['unit_MilliBar_l_4'] = self.unit_MilliBar_l_4
-        self.unit_MilliBar_l_4.text = 'Millibar'
-        self.unit_MilliBar_l_4.attrib = {'L': 'EN'}
-        self.unit_MilliBar_display_name = ET.SubElement(self.unit_MilliBar, 'DISPLAY-NAME')
-        self.variables['unit_MilliBar_display_name'] = self.unit_MilliBar_display_name
-        self.unit_MilliBar_display_name.text = 'mbar'
-        self.unit_MilliBar_factor_si_to_unit = ET.SubElement(self.unit_MilliBar, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MilliBar_factor_si_to_unit'] = self.unit_MilliBar_factor_si_to_unit
-        self.unit_MilliBar_factor_si_to_unit.text = '0.01'
-        self.unit_MilliBar_offset_si_to_unit = ET.SubElement(self.unit_MilliBar, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MilliBar_offset_si_to_unit'] = self.unit_MilliBar_offset_si_to_unit
-        self.unit_MilliBar_offset_si_to_unit.text = '0'
-        self.unit_MilliBar_physical_dimension_ref = ET.SubElement(self.unit_MilliBar, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MilliBar_physical_dimension_ref'] = self.unit_MilliBar_physical_dimension_ref
-        self.unit_MilliBar_physical_dimension_ref.text = 'LenNeg1M1TiNeg2'
-        self.unit_MilliBar_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MilliFrd = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MilliFrd'] = self.unit_MilliFrd
-        self.unit_MilliFrd_short_name = ET.SubElement(self.unit_MilliFrd, 'SHORT-NAME')
-        self.variables['unit_MilliFrd_short_name'] = self.unit_MilliFrd_short_name
-        self.unit_MilliFrd_short_name.text = 'MilliFrd'
-        self.unit_MilliFrd_long_name = ET.SubElement(self.unit_MilliFrd, 'LONG-NAME')
-        self.variables['unit_MilliFrd_long_name'] = self.unit_MilliFrd_long_name
-        self.unit_MilliFrd_l_4 = ET.SubElement(self.unit_MilliFrd_long_name, 'L-4')
-        self.variables['unit_MilliFrd_l_4'] = self.unit_MilliFrd_l_4
-        self.unit_MilliFrd_l_4.text = 'Millifarad'
-        self.unit_MilliFrd_l_4.attrib = {'L': 'EN'}
-        self.unit_MilliFrd_display_name = ET.SubElement(self.unit_MilliFrd, 'DISPLAY-NAME')
-        self.variables['unit_MilliFrd_display_name'] = self.unit_MilliFrd_display_name
-        self.unit_MilliFrd_display_name.text = 'mF'
-        self.unit_MilliFrd_factor_si_to_unit = ET.SubElement(self.unit_MilliFrd, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MilliFrd_factor_si_to_unit'] = self.unit_MilliFrd_factor_si_to_unit
-        self.unit_MilliFrd_factor_si_to_unit.text = '1000'
-        self.unit_MilliFrd_offset_si_to_unit = ET.SubElement(self.unit_MilliFrd, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MilliFrd_offset_si_to_unit'] = self.unit_MilliFrd_offset_si_to_unit
-        self.unit_MilliFrd_offset_si_to_unit.text = '0'
-        self.unit_MilliFrd_physical_dimension_ref = ET.SubElement(self.unit_MilliFrd, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MilliFrd_physical_dimension_ref'] = self.unit_MilliFrd_physical_dimension_ref
-        self.unit_MilliFrd_physical_dimension_ref.text = 'LenNeg2MNeg1Ti4I2'
-        self.unit_MilliFrd_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MilliGr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MilliGr'] = self.unit_MilliGr
-        self.unit_MilliGr_short_name = ET.SubElement(self.unit_MilliGr, 'SHORT-NAME')
-        self.variables['unit_MilliGr_short_name'] = self.unit_MilliGr_short_name
-        self.unit_MilliGr_short_name.text = 'MilliGr'
-        self.unit_MilliGr_long_name = ET.SubElement(self.unit_MilliGr, 'LONG-NAME')
-        self.variables['unit_MilliGr_long_name'] = self.unit_MilliGr_long_name
-        self.unit_MilliGr_l_4 = ET.SubElement(self.unit_MilliGr_long_name, 'L-4')
-        self.variables['unit_MilliGr_l_4'] = self.unit_MilliGr_l_4
-        self.unit_MilliGr_l_4.text = 'Milligram'
-        self.unit_MilliGr_l_4.attrib = {'L': 'EN'}
-        self.unit_MilliGr_display_name = ET.SubElement(self.unit_MilliGr, 'DISPLAY-NAME')
-        self.variables['unit_MilliGr_display_name'] = self.unit_MilliGr_display_name
-        self.unit_MilliGr_display_name.text = 'mg'
-        self.unit_MilliGr_factor_si_to_unit = ET.SubElement(self.unit_MilliGr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MilliGr_factor_si_to_unit'] = self.unit_MilliGr_factor_si_to_unit
-        self.unit_MilliGr_factor_si_to_unit.text = '1000000'
-        self.unit_MilliGr_offset_si_to_unit = ET.SubElement(self.unit_MilliGr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MilliGr_offset_si_to_unit'] = self.unit_MilliGr_offset_si_to_unit
-        self.unit_MilliGr_offset_si_to_unit.text = '0'
-        self.unit_MilliGr_physical_dimension_ref = ET.SubElement(self.unit_MilliGr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MilliGr_physical_dimension_ref'] = self.unit_MilliGr_physical_dimension_ref
-        self.unit_MilliGr_physical_dimension_ref.text = 'M1'
-        self.unit_MilliGr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MilliGrPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MilliGrPerSec'] = self.unit_MilliGrPerSec
-        self.unit_MilliGrPerSec_short_name = ET.SubElement(self.unit_MilliGrPerSec, 'SHORT-NAME')
-        self.variables['unit_MilliGrPerSec_short_name'] = self.unit_MilliGrPerSec_short_name
-        self.unit_MilliGrPerSec_short_name.text = 'MilliGrPerSec'
-        self.unit_MilliGrPerSec_long_name = ET.SubElement(self.unit_MilliGrPerSec, 'LONG-NAME')
-        self.variables['unit_MilliGrPerSec_long_name'] = self.unit_MilliGrPerSec_long_name
-        self.unit_MilliGrPerSec_l_4 = ET.SubElement(self.unit_MilliGrPerSec_long_name, 'L-4')
-        self.variables['unit_MilliGrPerSec_l_4'] = self.unit_MilliGrPerSec_l_4
-        self.unit_MilliGrPerSec_l_4.text = 'Milligram Per Second'
-        self.unit_MilliGrPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_MilliGrPerSec_display_name = ET.SubElement(self.unit_MilliGrPerSec, 'DISPLAY-NAME')
-        self.variables['unit_MilliGrPerSec_display_name'] = self.unit_MilliGrPerSec_display_name
-        self.unit_MilliGrPerSec_display_name.text = 'mg/s'
-        self.unit_MilliGrPerSec_factor_si_to_unit = ET.SubElement(self.unit_MilliGrPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MilliGrPerSec_factor_si_to_unit'] = self.unit_MilliGrPerSec_factor_si_to_unit
-        self.unit_MilliGrPerSec_factor_si_to_unit.text = '1000000'
-        self.unit_MilliGrPerSec_offset_si_to_unit = ET.SubElement(self.unit_MilliGrPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MilliGrPerSec_offset_si_to_unit'] = self.unit_MilliGrPerSec_offset_si_to_unit
-        self.unit_MilliGrPerSec_offset_si_to_unit.text = '0'
-        self.unit_MilliGrPerSec_physical_dimension_ref = ET.SubElement(self.unit_MilliGrPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MilliGrPerSec_physical_dimension_ref'] = self.unit_MilliGrPerSec_physical_dimension_ref
-        self.unit_MilliGrPerSec_physical_dimension_ref.text = 'M1TiNeg1'
-        self.unit_MilliGrPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MilliJou = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MilliJou'] = self.unit_MilliJou
-        self.unit_MilliJou_short_name = ET.SubElement(self.unit_MilliJou, 'SHORT-NAME')
-        self.variables['unit_MilliJou_short_name'] = self.unit_MilliJou_short_name
-        self.unit_MilliJou_short_name.text = 'MilliJou'
-        self.unit_MilliJou_long_name = ET.SubElement(self.unit_MilliJou, 'LONG-NAME')
-        self.variables['unit_MilliJou_long_name'] = self.unit_MilliJou_long_name
-        self.unit_MilliJou_l_4 = ET.SubElement(self.unit_MilliJou_long_name, 'L-4')
-        self.variables['unit_MilliJou_l_4'] = self.unit_MilliJou_l_4
-        self.unit_MilliJou_l_4.text = 'Millijoule'
-        self.unit_MilliJou_l_4.attrib = {'L': 'EN'}
-        self.unit_MilliJou_display_name = ET.SubElement(self.unit_MilliJou, 'DISPLAY-NAME')
-        self.variables['unit_MilliJou_display_name'] = self.unit_MilliJou_display_name
-        self.unit_MilliJou_display_name.text = 'mJ'
-        self.unit_MilliJou_factor_si_to_unit = ET.SubElement(self.unit_MilliJou, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MilliJou_factor_si_to_unit'] = self.unit_MilliJou_factor_si_to_unit
-        self.unit_MilliJou_factor_si_to_unit.text = '1000'
-        self.unit_MilliJou_offset_si_to_unit = ET.SubElement(self.unit_MilliJou, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MilliJou_offset_si_to_unit'] = self.unit_MilliJou_offset_si_to_unit
-        self.unit_MilliJou_offset_si_to_unit.text = '0'
-        self.unit_MilliJou_physical_dimension_ref = ET.SubElement(self.unit_MilliJou, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MilliJou_physical_dimension_ref'] = self.unit_MilliJou_physical_dimension_ref
-        self.unit_MilliJou_physical_dimension_ref.text = 'Len2M1TiNeg2_1'
-        self.unit_MilliJou_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MilliLtr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MilliLtr'] = self.unit_MilliLtr
-        self.unit_MilliLtr_short_name = ET.SubElement(self.unit_MilliLtr, 'SHORT-NAME')
-        self.variables['unit_MilliLtr_short_name'] = self.unit_MilliLtr_short_name
-        self.unit_MilliLtr_short_name.text = 'MilliLtr'
-        self.unit_MilliLtr_long_name = ET.SubElement(self.unit_MilliLtr, 'LONG-NAME')
-        self.variables['unit_MilliLtr_long_name'] = self.unit_MilliLtr_long_name
-        self.unit_MilliLtr_l_4 = ET.SubElement(self.unit_MilliLtr_long_name, 'L-4')
-        self.variables['unit_MilliLtr_l_4'] = self.unit_MilliLtr_l_4
-        self.unit_MilliLtr_l_4.text = 'Milliliter'
-        self.unit_MilliLtr_l_4.attrib = {'L': 'EN'}
-        self.unit_MilliLtr_display_name = ET.SubElement(self.unit_MilliLtr, 'DISPLAY-NAME')
-        self.variables['unit_MilliLtr_display_name'] = self.unit_MilliLtr_display_name
-        self.unit_MilliLtr_display_name.text = 'ml'
-        self.unit_MilliLtr_factor_si_to_unit = ET.SubElement(self.unit_MilliLtr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MilliLtr_factor_si_to_unit'] = self.unit_MilliLtr_factor_si_to_unit
-        self.unit_MilliLtr_factor_si_to_unit.text = '1000000'
-        self.unit_MilliLtr_offset_si_to_unit = ET.SubElement(self.unit_MilliLtr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MilliLtr_offset_si_to_unit'] = self.unit_MilliLtr_offset_si_to_unit
-        self.unit_MilliLtr_offset_si_to_unit.text = '0'
-        self.unit_MilliLtr_physical_dimension_ref = ET.SubElement(self.unit_MilliLtr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MilliLtr_physical_dimension_ref'] = self.unit_MilliLtr_physical_dimension_ref
-        self.unit_MilliLtr_physical_dimension_ref.text = 'Len3'
-        self.unit_MilliLtr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MilliMtr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MilliMtr'] = self.unit_MilliMtr
-        self.unit_MilliMtr_short_name = ET.SubElement(self.unit_MilliMtr, 'SHORT-NAME')
-        self.variables['unit_MilliMtr_short_name'] = self.unit_MilliMtr_short_name
-        self.unit_MilliMtr_short_name.text = 'MilliMtr'
-        self.unit_MilliMtr_long_name = ET.SubElement(self.unit_MilliMtr, 'LONG-NAME')
-        self.variables['unit_MilliMtr_long_name'] = self.unit_MilliMtr_long_name
-        self.unit_MilliMtr_l_4 = ET.SubElement(self.unit_MilliMtr_long_name, 'L-4')
-        self.variables['unit_MilliMtr_l_4'] = self.unit_MilliMtr_l_4
-        self.unit_MilliMtr_l_4.text = 'Millimeter'
-        self.unit_MilliMtr_l_4.attrib = {'L': 'EN'}
-        self.unit_MilliMtr_display_name = ET.SubElement(self.unit_MilliMtr, 'DISPLAY-NAME')
-        self.variables['unit_MilliMtr_display_name'] = self.unit_MilliMtr_display_name
-        self.unit_MilliMtr_display_name.text = 'mm'
-        self.unit_MilliMtr_factor_si_to_unit = ET.SubElement(self.unit_MilliMtr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MilliMtr_factor_si_to_unit'] = self.unit_MilliMtr_factor_si_to_unit
-        self.unit_MilliMtr_factor_si_to_unit.text = '1000'
-        self.unit_MilliMtr_offset_si_to_unit = ET.SubElement(self.unit_MilliMtr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MilliMtr_offset_si_to_unit'] = self.unit_MilliMtr_offset_si_to_unit
-        self.unit_MilliMtr_offset_si_to_unit.text = '0'
-        self.unit_MilliMtr_physical_dimension_ref = ET.SubElement(self.unit_MilliMtr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MilliMtr_physical_dimension_ref'] = self.unit_MilliMtr_physical_dimension_ref
-        self.unit_MilliMtr_physical_dimension_ref.text = 'Len1'
-        self.unit_MilliMtr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MilliMtrCubd = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MilliMtrCubd'] = self.unit_MilliMtrCubd
-        self.unit_MilliMtrCubd_short_name = ET.SubElement(self.unit_MilliMtrCubd, 'SHORT-NAME')
-        self.variables['unit_MilliMtrCubd_short_name'] = self.unit_MilliMtrCubd_short_name
-        self.unit_MilliMtrCubd_short_name.text = 'MilliMtrCubd'
-        self.unit_MilliMtrCubd_long_name = ET.SubElement(self.unit_MilliMtrCubd, 'LONG-NAME')
-        self.variables['unit_MilliMtrCubd_long_name'] = self.unit_MilliMtrCubd_long_name
-        self.unit_MilliMtrCubd_l_4 = ET.SubElement(self.unit_MilliMtrCubd_long_name, 'L-4')
-        self.variables['unit_MilliMtrCubd_l_4'] = self.unit_MilliMtrCubd_l_4
-        self.unit_MilliMtrCubd_l_4.text = 'Cubic Millimeter'
-        self.unit_MilliMtrCubd_l_4.attrib = {'L': 'EN'}
-        self.unit_MilliMtrCubd_display_name = ET.SubElement(self.unit_MilliMtrCubd, 'DISPLAY-NAME')
-        self.variables['unit_MilliMtrCubd_display_name'] = self.unit_MilliMtrCubd_display_name
-        self.unit_MilliMtrCubd_display_name.text = 'mm^3'
-        self.unit_MilliMtrCubd_factor_si_to_unit = ET.SubElement(self.unit_MilliMtrCubd, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MilliMtrCubd_factor_si_to_unit'] = self.unit_MilliMtrCubd_factor_si_to_unit
-        self.unit_MilliMtrCubd_factor_si_to_unit.text = '1000000000'
-        self.unit_MilliMtrCubd_offset_si_to_unit = ET.SubElement(self.unit_MilliMtrCubd, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MilliMtrCubd_offset_si_to_unit'] = self.unit_MilliMtrCubd_offset_si_to_unit
-        self.unit_MilliMtrCubd_offset_si_to_unit.text = '0'
-        self.unit_MilliMtrCubd_physical_dimension_ref = ET.SubElement(self.unit_MilliMtrCubd, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MilliMtrCubd_physical_dimension_ref'] = self.unit_MilliMtrCubd_physical_dimension_ref
-        self.unit_MilliMtrCubd_physical_dimension_ref.text = 'Len3'
-        self.unit_MilliMtrCubd_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MilliMtrCubdPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MilliMtrCubdPerSec'] = self.unit_MilliMtrCubdPerSec
-        self.unit_MilliMtrCubdPerSec_short_name = ET.SubElement(self.unit_MilliMtrCubdPerSec, 'SHORT-NAME')
-        self.variables['unit_MilliMtrCubdPerSec_short_name'] = self.unit_MilliMtrCubdPerSec_short_name
-        self.unit_MilliMtrCubdPerSec_short_name.text = 'MilliMtrCubdPerSec'
-        self.unit_MilliMtrCubdPerSec_long_name = ET.SubElement(self.unit_MilliMtrCubdPerSec, 'LONG-NAME')
-        self.variables['unit_MilliMtrCubdPerSec_long_name'] = self.unit_MilliMtrCubdPerSec_long_name
-        self.unit_MilliMtrCubdPerSec_l_4 = ET.SubElement(self.unit_MilliMtrCubdPerSec_long_name, 'L-4')
-        self.variables['unit_MilliMtrCubdPerSec_l_4'] = self.unit_MilliMtrCubdPerSec_l_4
-        self.unit_MilliMtrCubdPerSec_l_4.text = 'Cubic Millimeter Per Second'
-        self.unit_MilliMtrCubdPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_MilliMtrCubdPerSec_display_name = ET.SubElement(self.unit_MilliMtrCubdPerSec, 'DISPLAY-NAME')
-        self.variables['unit_MilliMtrCubdPerSec_display_name'] = self.unit_MilliMtrCubdPerSec_display_name
-        self.unit_MilliMtrCubdPerSec_display_name.text = '(mm^3)/s'
-        self.unit_MilliMtrCubdPerSec_factor_si_to_unit = ET.SubElement(self.unit_MilliMtrCubdPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MilliMtrCubdPerSec_factor_si_to_unit'] = self.unit_MilliMtrCubdPerSec_factor_si_to_unit
-        self.unit_MilliMtrCubdPerSec_factor_si_to_unit.text = '1000000000'
-        self.unit_MilliMtrCubdPerSec_offset_si_to_unit = ET.SubElement(self.unit_MilliMtrCubdPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MilliMtrCubdPerSec_offset_si_to_unit'] = self.unit_MilliMtrCubdPerSec_offset_si_to_unit
-        self.unit_MilliMtrCubdPerSec_offset_si_to_unit.text = '0'
-        self.unit_MilliMtrCubdPerSec_physical_dimension_ref = ET.SubElement(self.unit_MilliMtrCubdPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MilliMtrCubdPerSec_physical_dimension_ref'] = self.unit_MilliMtrCubdPerSec_physical_dimension_ref
-        self.unit_MilliMtrCubdPerSec_physical_dimension_ref.text = 'Len3TiNeg1'
-        self.unit_MilliMtrCubdPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MilliOhm = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MilliOhm'] = self.unit_MilliOhm
-        self.unit_MilliOhm_short_name = ET.SubElement(self.unit_MilliOhm, 'SHORT-NAME')
-        self.variables['unit_MilliOhm_short_name'] = self.unit_MilliOhm_short_name
-        self.unit_MilliOhm_short_name.text = 'MilliOhm'
-        self.unit_MilliOhm_long_name = ET.SubElement(self.unit_MilliOhm, 'LONG-NAME')
-        self.variables['unit_MilliOhm_long_name'] = self.unit_MilliOhm_long_name
-        self.unit_MilliOhm_l_4 = ET.SubElement(self.unit_MilliOhm_long_name, 'L-4')
-        self.variables['unit_MilliOhm_l_4'] = self.unit_MilliOhm_l_4
-        self.unit_MilliOhm_l_4.text = 'Milliohm'
-        self.unit_MilliOhm_l_4.attrib = {'L': 'EN'}
-        self.unit_MilliOhm_display_name = ET.SubElement(self.unit_MilliOhm, 'DISPLAY-NAME')
-        self.variables['unit_MilliOhm_display_name'] = self.unit_MilliOhm_display_name
-        self.unit_MilliOhm_display_name.text = 'mΩ'
-        self.unit_MilliOhm_factor_si_to_unit = ET.SubElement(self.unit_MilliOhm, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MilliOhm_factor_si_to_unit'] = self.unit_MilliOhm_factor_si_to_unit
-        self.unit_MilliOhm_factor_si_to_unit.text = '1000'
-        self.unit_MilliOhm_offset_si_to_unit = ET.SubElement(self.unit_MilliOhm, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MilliOhm_offset_si_to_unit'] = self.unit_MilliOhm_offset_si_to_unit
-        self.unit_MilliOhm_offset_si_to_unit.text = '0'
-        self.unit_MilliOhm_physical_dimension_ref = ET.SubElement(self.unit_MilliOhm, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MilliOhm_physical_dimension_ref'] = self.unit_MilliOhm_physical_dimension_ref
-        self.unit_MilliOhm_physical_dimension_ref.text = 'Len2M1TiNeg3INeg2'
-        self.unit_MilliOhm_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MilliSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MilliSec'] = self.unit_MilliSec
-        self.unit_MilliSec_short_name = ET.SubElement(self.unit_MilliSec, 'SHORT-NAME')
-        self.variables['unit_MilliSec_short_name'] = self.unit_MilliSec_short_name
-        self.unit_MilliSec_short_name.text = 'MilliSec'
-        self.unit_MilliSec_long_name = ET.SubElement(self.unit_MilliSec, 'LONG-NAME')
-        self.variables['unit_MilliSec_long_name'] = self.unit_MilliSec_long_name
-        self.unit_MilliSec_l_4 = ET.SubElement(self.unit_MilliSec_long_name, 'L-4')
-        self.variables['unit_MilliSec_l_4'] = self.unit_MilliSec_l_4
-        self.unit_MilliSec_l_4.text = 'Millisecond'
-        self.unit_MilliSec_l_4.attrib = {'L': 'EN'}
-        self.unit_MilliSec_display_name = ET.SubElement(self.unit_MilliSec, 'DISPLAY-NAME')
-        self.variables['unit_MilliSec_display_name'] = self.unit_MilliSec_display_name
-        self.unit_MilliSec_display_name.text = 'ms'
-        self.unit_MilliSec_factor_si_to_unit = ET.SubElement(self.unit_MilliSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MilliSec_factor_si_to_unit'] = self.unit_MilliSec_factor_si_to_unit
-        self.unit_MilliSec_factor_si_to_unit.text = '1000'
-        self.unit_MilliSec_offset_si_to_unit = ET.SubElement(self.unit_MilliSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MilliSec_offset_si_to_unit'] = self.unit_MilliSec_offset_si_to_unit
-        self.unit_MilliSec_offset_si_to_unit.text = '0'
-        self.unit_MilliSec_physical_dimension_ref = ET.SubElement(self.unit_MilliSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MilliSec_physical_dimension_ref'] = self.unit_MilliSec_physical_dimension_ref
-        self.unit_MilliSec_physical_dimension_ref.text = 'Ti1'
-        self.unit_MilliSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MilliTesla = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MilliTesla'] = self.unit_MilliTesla
-        self.unit_MilliTesla_short_name = ET.SubElement(self.unit_MilliTesla, 'SHORT-NAME')
-        self.variables['unit_MilliTesla_short_name'] = self.unit_MilliTesla_short_name
-        self.unit_MilliTesla_short_name.text = 'MilliTesla'
-        self.unit_MilliTesla_long_name = ET.SubElement(self.unit_MilliTesla, 'LONG-NAME')
-        self.variables['unit_MilliTesla_long_name'] = self.unit_MilliTesla_long_name
-        self.unit_MilliTesla_l_4 = ET.SubElement(self.unit_MilliTesla_long_name, 'L-4')
-        self.variables['unit_MilliTesla_l_4'] = self.unit_MilliTesla_l_4
-        self.unit_MilliTesla_l_4.text = 'Millitesla'
-        self.unit_MilliTesla_l_4.attrib = {'L': 'EN'}
-        self.unit_MilliTesla_display_name = ET.SubElement(self.unit_MilliTesla, 'DISPLAY-NAME')
-        self.variables['unit_MilliTesla_display_name'] = self.unit_MilliTesla_display_name
-        self.unit_MilliTesla_display_name.text = 'mT'
-        self.unit_MilliTesla_factor_si_to_unit = ET.SubElement(self.unit_MilliTesla, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MilliTesla_factor_si_to_unit'] = self.unit_MilliTesla_factor_si_to_unit
-        self.unit_MilliTesla_factor_si_to_unit.text = '1000'
-        self.unit_MilliTesla_offset_si_to_unit = ET.SubElement(self.unit_MilliTesla, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MilliTesla_offset_si_to_unit'] = self.unit_MilliTesla_offset_si_to_unit
-        self.unit_MilliTesla_offset_si_to_unit.text = '0'
-        self.unit_MilliTesla_physical_dimension_ref = ET.SubElement(self.unit_MilliTesla, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MilliTesla_physical_dimension_ref'] = self.unit_MilliTesla_physical_dimension_ref
-        self.unit_MilliTesla_physical_dimension_ref.text = 'M1TiNeg2INeg1'
-        self.unit_MilliTesla_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MilliVolt = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MilliVolt'] = self.unit_MilliVolt
-        self.unit_MilliVolt_short_name = ET.SubElement(self.unit_MilliVolt, 'SHORT-NAME')
-        self.variables['unit_MilliVolt_short_name'] = self.unit_MilliVolt_short_name
-        self.unit_MilliVolt_short_name.text = 'MilliVolt'
-        self.unit_MilliVolt_long_name = ET.SubElement(self.unit_MilliVolt, 'LONG-NAME')
-        self.variables['unit_MilliVolt_long_name'] = self.unit_MilliVolt_long_name
-        self.unit_MilliVolt_l_4 = ET.SubElement(self.unit_MilliVolt_long_name, 'L-4')
-        self.variables['unit_MilliVolt_l_4'] = self.unit_MilliVolt_l_4
-        self.unit_MilliVolt_l_4.text = 'Millivolt'
-        self.unit_MilliVolt_l_4.attrib = {'L': 'EN'}
-        self.unit_MilliVolt_display_name = ET.SubElement(self.unit_MilliVolt, 'DISPLAY-NAME')
-        self.variables['unit_MilliVolt_display_name'] = self.unit_MilliVolt_display_name
-        self.unit_MilliVolt_display_name.text = 'mV'
-        self.unit_MilliVolt_factor_si_to_unit = ET.SubElement(self.unit_MilliVolt, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MilliVolt_factor_si_to_unit'] = self.unit_MilliVolt_factor_si_to_unit
-        self.unit_MilliVolt_factor_si_to_unit.text = '1000'
-        self.unit_MilliVolt_offset_si_to_unit = ET.SubElement(self.unit_MilliVolt, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MilliVolt_offset_si_to_unit'] = self.unit_MilliVolt_offset_si_to_unit
-        self.unit_MilliVolt_offset_si_to_unit.text = '0'
-        self.unit_MilliVolt_physical_dimension_ref = ET.SubElement(self.unit_MilliVolt, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MilliVolt_physical_dimension_ref'] = self.unit_MilliVolt_physical_dimension_ref
-        self.unit_MilliVolt_physical_dimension_ref.text = 'Len2M1TiNeg3INeg1'
-        self.unit_MilliVolt_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MilliVoltPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MilliVoltPerSec'] = self.unit_MilliVoltPerSec
-        self.unit_MilliVoltPerSec_short_name = ET.SubElement(self.unit_MilliVoltPerSec, 'SHORT-NAME')
-        self.variables['unit_MilliVoltPerSec_short_name'] = self.unit_MilliVoltPerSec_short_name
-        self.unit_MilliVoltPerSec_short_name.text = 'MilliVoltPerSec'
-        self.unit_MilliVoltPerSec_long_name = ET.SubElement(self.unit_MilliVoltPerSec, 'LONG-NAME')
-        self.variables['unit_MilliVoltPerSec_long_name'] = self.unit_MilliVoltPerSec_long_name
-        self.unit_MilliVoltPerSec_l_4 = ET.SubElement(self.unit_MilliVoltPerSec_long_name, 'L-4')
-        self.variables['unit_MilliVoltPerSec_l_4'] = self.unit_MilliVoltPerSec_l_4
-        self.unit_MilliVoltPerSec_l_4.text = 'Millivolt Per Second'
-        self.unit_MilliVoltPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_MilliVoltPerSec_display_name = ET.SubElement(self.unit_MilliVoltPerSec, 'DISPLAY-NAME')
-        self.variables['unit_MilliVoltPerSec_display_name'] = self.unit_MilliVoltPerSec_display_name
-        self.unit_MilliVoltPerSec_display_name.text = 'mV/s'
-        self.unit_MilliVoltPerSec_factor_si_to_unit = ET.SubElement(self.unit_MilliVoltPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MilliVoltPerSec_factor_si_to_unit'] = self.unit_MilliVoltPerSec_factor_si_to_unit
-        self.unit_MilliVoltPerSec_factor_si_to_unit.text = '1000'
-        self.unit_MilliVoltPerSec_offset_si_to_unit = ET.SubElement(self.unit_MilliVoltPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MilliVoltPerSec_offset_si_to_unit'] = self.unit_MilliVoltPerSec_offset_si_to_unit
-        self.unit_MilliVoltPerSec_offset_si_to_unit.text = '0'
-        self.unit_MilliVoltPerSec_physical_dimension_ref = ET.SubElement(self.unit_MilliVoltPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MilliVoltPerSec_physical_dimension_ref'] = self.unit_MilliVoltPerSec_physical_dimension_ref
-        self.unit_MilliVoltPerSec_physical_dimension_ref.text = 'Len2M1TiNeg4INeg1'
-        self.unit_MilliVoltPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MilliWatt = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MilliWatt'] = self.unit_MilliWatt
-        self.unit_MilliWatt_short_name = ET.SubElement(self.unit_MilliWatt, 'SHORT-NAME')
-        self.variables['unit_MilliWatt_short_name'] = self.unit_MilliWatt_short_name
-        self.unit_MilliWatt_short_name.text = 'MilliWatt'
-        self.unit_MilliWatt_long_name = ET.SubElement(self.unit_MilliWatt, 'LONG-NAME')
-        self.variables['unit_MilliWatt_long_name'] = self.unit_MilliWatt_long_name
-        self.unit_MilliWatt_l_4 = ET.SubElement(self.unit_MilliWatt_long_name, 'L-4')
-        self.variables['unit_MilliWatt_l_4'] = self.unit_MilliWatt_l_4
-        self.unit_MilliWatt_l_4.text = 'Milliwatt'
-        self.unit_MilliWatt_l_4.attrib = {'L': 'EN'}
-        self.unit_MilliWatt_display_name = ET.SubElement(self.unit_MilliWatt, 'DISPLAY-NAME')
-        self.variables['unit_MilliWatt_display_name'] = self.unit_MilliWatt_display_name
-        self.unit_MilliWatt_display_name.text = 'mW'
-        self.unit_MilliWatt_factor_si_to_unit = ET.SubElement(self.unit_MilliWatt, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MilliWatt_factor_si_to_unit'] = self.unit_MilliWatt_factor_si_to_unit
-        self.unit_MilliWatt_factor_si_to_unit.text = '1000'
-        self.unit_MilliWatt_offset_si_to_unit = ET.SubElement(self.unit_MilliWatt, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MilliWatt_offset_si_to_unit'] = self.unit_MilliWatt_offset_si_to_unit
-        self.unit_MilliWatt_offset_si_to_unit.text = '0'
-        self.unit_MilliWatt_physical_dimension_ref = ET.SubElement(self.unit_MilliWatt, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MilliWatt_physical_dimension_ref'] = self.unit_MilliWatt_physical_dimension_ref
-        self.unit_MilliWatt_physical_dimension_ref.text = 'Len2M1TiNeg3_1'
-        self.unit_MilliWatt_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Mins = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Mins'] = self.unit_Mins
-        self.unit_Mins_short_name = ET.SubElement(self.unit_Mins, 'SHORT-NAME')
-        self.variables['unit_Mins_short_name'] = self.unit_Mins_short_name
-        self.unit_Mins_short_name.text = 'Mins'
-        self.unit_Mins_long_name = ET.SubElement(self.unit_Mins, 'LONG-NAME')
-        self.variables['unit_Mins_long_name'] = self.unit_Mins_long_name
-        self.unit_Mins_l_4 = ET.SubElement(self.unit_Mins_long_name, 'L-4')
-        self.variables['unit_Mins_l_4'] = self.unit_Mins_l_4
-        self.unit_Mins_l_4.text = 'Minute'
-        self.unit_Mins_l_4.attrib = {'L': 'EN'}
-        self.unit_Mins_display_name = ET.SubElement(self.unit_Mins, 'DISPLAY-NAME')
-        self.variables['unit_Mins_display_name'] = self.unit_Mins_display_name
-        self.unit_Mins_display_name.text = 'min'
-        self.unit_Mins_factor_si_to_unit = ET.SubElement(self.unit_Mins, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Mins_factor_si_to_unit'] = self.unit_Mins_factor_si_to_unit
-        self.unit_Mins_factor_si_to_unit.text = '0.0166666666666667'
-        self.unit_Mins_offset_si_to_unit = ET.SubElement(self.unit_Mins, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Mins_offset_si_to_unit'] = self.unit_Mins_offset_si_to_unit
-        self.unit_Mins_offset_si_to_unit.text = '0'
-        self.unit_Mins_physical_dimension_ref = ET.SubElement(self.unit_Mins, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Mins_physical_dimension_ref'] = self.unit_Mins_physical_dimension_ref
-        self.unit_Mins_physical_dimension_ref.text = 'Ti1'
-        self.unit_Mins_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Ml = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Ml'] = self.unit_Ml
-        self.unit_Ml_short_name = ET.SubElement(self.unit_Ml, 'SHORT-NAME')
-        self.variables['unit_Ml_short_name'] = self.unit_Ml_short_name
-        self.unit_Ml_short_name.text = 'Ml'
-        self.unit_Ml_long_name = ET.SubElement(self.unit_Ml, 'LONG-NAME')
-        self.variables['unit_Ml_long_name'] = self.unit_Ml_long_name
-        self.unit_Ml_l_4 = ET.SubElement(self.unit_Ml_long_name, 'L-4')
-        self.variables['unit_Ml_l_4'] = self.unit_Ml_l_4
-        self.unit_Ml_l_4.text = 'Mile'
-        self.unit_Ml_l_4.attrib = {'L': 'EN'}
-        self.unit_Ml_display_name = ET.SubElement(self.unit_Ml, 'DISPLAY-NAME')
-        self.variables['unit_Ml_display_name'] = self.unit_Ml_display_name
-        self.unit_Ml_display_name.text = 'mile'
-        self.unit_Ml_factor_si_to_unit = ET.SubElement(self.unit_Ml, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Ml_factor_si_to_unit'] = self.unit_Ml_factor_si_to_unit
-        self.unit_Ml_factor_si_to_unit.text = '0.000621371192237333'
-        self.unit_Ml_offset_si_to_unit = ET.SubElement(self.unit_Ml, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Ml_offset_si_to_unit'] = self.unit_Ml_offset_si_to_unit
-        self.unit_Ml_offset_si_to_unit.text = '0'
-        self.unit_Ml_physical_dimension_ref = ET.SubElement(self.unit_Ml, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Ml_physical_dimension_ref'] = self.unit_Ml_physical_dimension_ref
-        self.unit_Ml_physical_dimension_ref.text = 'Len1'
-        self.unit_Ml_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MlPerHr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MlPerHr'] = self.unit_MlPerHr
-        self.unit_MlPerHr_short_name = ET.SubElement(self.unit_MlPerHr, 'SHORT-NAME')
-        self.variables['unit_MlPerHr_short_name'] = self.unit_MlPerHr_short_name
-        self.unit_MlPerHr_short_name.text = 'MlPerHr'
-        self.unit_MlPerHr_long_name = ET.SubElement(self.unit_MlPerHr, 'LONG-NAME')
-        self.variables['unit_MlPerHr_long_name'] = self.unit_MlPerHr_long_name
-        self.unit_MlPerHr_l_4 = ET.SubElement(self.unit_MlPerHr_long_name, 'L-4')
-        self.variables['unit_MlPerHr_l_4'] = self.unit_MlPerHr_l_4
-        self.unit_MlPerHr_l_4.text = 'Miles Per Hour'
-        self.unit_MlPerHr_l_4.attrib = {'L': 'EN'}
-        self.unit_MlPerHr_display_name = ET.SubElement(self.unit_MlPerHr, 'DISPLAY-NAME')
-        self.variables['unit_MlPerHr_display_name'] = self.unit_MlPerHr_display_name
-        self.unit_MlPerHr_display_name.text = 'mph'
-        self.unit_MlPerHr_factor_si_to_unit = ET.SubElement(self.unit_MlPerHr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MlPerHr_factor_si_to_unit'] = self.unit_MlPerHr_factor_si_to_unit
-        self.unit_MlPerHr_factor_si_to_unit.text = '2.2369362920544'
-        self.unit_MlPerHr_offset_si_to_unit = ET.SubElement(self.unit_MlPerHr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MlPerHr_offset_si_to_unit'] = self.unit_MlPerHr_offset_si_to_unit
-        self.unit_MlPerHr_offset_si_to_unit.text = '0'
-        self.unit_MlPerHr_physical_dimension_ref = ET.SubElement(self.unit_MlPerHr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MlPerHr_physical_dimension_ref'] = self.unit_MlPerHr_physical_dimension_ref
-        self.unit_MlPerHr_physical_dimension_ref.text = 'Len1TiNeg1'
-        self.unit_MlPerHr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Mol = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Mol'] = self.unit_Mol
-        self.unit_Mol_short_name = ET.SubElement(self.unit_Mol, 'SHORT-NAME')
-        self.variables['unit_Mol_short_name'] = self.unit_Mol_short_name
-        self.unit_Mol_short_name.text = 'Mol'
-        self.unit_Mol_long_name = ET.SubElement(self.unit_Mol, 'LONG-NAME')
-        self.variables['unit_Mol_long_name'] = self.unit_Mol_long_name
-        self.unit_Mol_l_4 = ET.SubElement(self.unit_Mol_long_name, 'L-4')
-        self.variables['unit_Mol_l_4'] = self.unit_Mol_l_4
-        self.unit_Mol_l_4.text = 'Mole'
-        self.unit_Mol_l_4.attrib = {'L': 'EN'}
-        self.unit_Mol_display_name = ET.SubElement(self.unit_Mol, 'DISPLAY-NAME')
-        self.variables['unit_Mol_display_name'] = self.unit_Mol_display_name
-        self.unit_Mol_display_name.text = 'mol'
-        self.unit_Mol_factor_si_to_unit = ET.SubElement(self.unit_Mol, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Mol_factor_si_to_unit'] = self.unit_Mol_factor_si_to_unit
-        self.unit_Mol_factor_si_to_unit.text = '1'
-        self.unit_Mol_offset_si_to_unit = ET.SubElement(self.unit_Mol, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Mol_offset_si_to_unit'] = self.unit_Mol_offset_si_to_unit
-        self.unit_Mol_offset_si_to_unit.text = '0'
-        self.unit_Mol_physical_dimension_ref = ET.SubElement(self.unit_Mol, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Mol_physical_dimension_ref'] = self.unit_Mol_physical_dimension_ref
-        self.unit_Mol_physical_dimension_ref.text = 'Amnt1'
-        self.unit_Mol_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MolPerLtr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MolPerLtr'] = self.unit_MolPerLtr
-        self.unit_MolPerLtr_short_name = ET.SubElement(self.unit_MolPerLtr, 'SHORT-NAME')
-        self.variables['unit_MolPerLtr_short_name'] = self.unit_MolPerLtr_short_name
-        self.unit_MolPerLtr_short_name.text = 'MolPerLtr'
-        self.unit_MolPerLtr_long_name = ET.SubElement(self.unit_MolPerLtr, 'LONG-NAME')
-        self.variables['unit_MolPerLtr_long_name'] = self.unit_MolPerLtr_long_name
-        self.unit_MolPerLtr_l_4 = ET.SubElement(self.unit_MolPerLtr_long_name, 'L-4')
-        self.variables['unit_MolPerLtr_l_4'] = self.unit_MolPerLtr_l_4
-        self.unit_MolPerLtr_l_4.text = 'Mole Per Liter'
-        self.unit_MolPerLtr_l_4.attrib = {'L': 'EN'}
-        self.unit_MolPerLtr_display_name = ET.SubElement(self.unit_MolPerLtr, 'DISPLAY-NAME')
-        self.variables['unit_MolPerLtr_display_name'] = self.unit_MolPerLtr_display_name
-        self.unit_MolPerLtr_display_name.text = 'mol/l'
-        self.unit_MolPerLtr_factor_si_to_unit = ET.SubElement(self.unit_MolPerLtr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MolPerLtr_factor_si_to_unit'] = self.unit_MolPerLtr_factor_si_to_unit
-        self.unit_MolPerLtr_factor_si_to_unit.text = '0.001'
-        self.unit_MolPerLtr_offset_si_to_unit = ET.SubElement(self.unit_MolPerLtr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MolPerLtr_offset_si_to_unit'] = self.unit_MolPerLtr_offset_si_to_unit
-        self.unit_MolPerLtr_offset_si_to_unit.text = '0'
-        self.unit_MolPerLtr_physical_dimension_ref = ET.SubElement(self.unit_MolPerLtr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MolPerLtr_physical_dimension_ref'] = self.unit_MolPerLtr_physical_dimension_ref
-        self.unit_MolPerLtr_physical_dimension_ref.text = 'LenNeg3Amnt1'
-        self.unit_MolPerLtr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MolPerLtrPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MolPerLtrPerSec'] = self.unit_MolPerLtrPerSec
-        self.unit_MolPerLtrPerSec_short_name = ET.SubElement(self.unit_MolPerLtrPerSec, 'SHORT-NAME')
-        self.variables['unit_MolPerLtrPerSec_short_name'] = self.unit_MolPerLtrPerSec_short_name
-        self.unit_MolPerLtrPerSec_short_name.text = 'MolPerLtrPerSec'
-        self.unit_MolPerLtrPerSec_long_name = ET.SubElement(self.unit_MolPerLtrPerSec, 'LONG-NAME')
-        self.variables['unit_MolPerLtrPerSec_long_name'] = self.unit_MolPerLtrPerSec_long_name
-        self.unit_MolPerLtrPerSec_l_4 = ET.SubElement(self.unit_MolPerLtrPerSec_long_name, 'L-4')
-        self.variables['unit_MolPerLtrPerSec_l_4'] = self.unit_MolPerLtrPerSec_l_4
-        self.unit_MolPerLtrPerSec_l_4.text = 'Mol Per Liter Per Second'
-        self.unit_MolPerLtrPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_MolPerLtrPerSec_display_name = ET.SubElement(self.unit_MolPerLtrPerSec, 'DISPLAY-NAME')
-        self.variables['unit_MolPerLtrPerSec_display_name'] = self.unit_MolPerLtrPerSec_display_name
-        self.unit_MolPerLtrPerSec_display_name.text = '(mol/l)/s'
-        self.unit_MolPerLtrPerSec_factor_si_to_unit = ET.SubElement(self.unit_MolPerLtrPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MolPerLtrPerSec_factor_si_to_unit'] = self.unit_MolPerLtrPerSec_factor_si_to_unit
-        self.unit_MolPerLtrPerSec_factor_si_to_unit.text = '0.001'
-        self.unit_MolPerLtrPerSec_offset_si_to_unit = ET.SubElement(self.unit_MolPerLtrPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MolPerLtrPerSec_offset_si_to_unit'] = self.unit_MolPerLtrPerSec_offset_si_to_unit
-        self.unit_MolPerLtrPerSec_offset_si_to_unit.text = '0'
-        self.unit_MolPerLtrPerSec_physical_dimension_ref = ET.SubElement(self.unit_MolPerLtrPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MolPerLtrPerSec_physical_dimension_ref'] = self.unit_MolPerLtrPerSec_physical_dimension_ref
-        self.unit_MolPerLtrPerSec_physical_dimension_ref.text = 'LenNeg3TiNeg1Amnt1'
-        self.unit_MolPerLtrPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MolPerMtrCubd = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MolPerMtrCubd'] = self.unit_MolPerMtrCubd
-        self.unit_MolPerMtrCubd_short_name = ET.SubElement(self.unit_MolPerMtrCubd, 'SHORT-NAME')
-        self.variables['unit_MolPerMtrCubd_short_name'] = self.unit_MolPerMtrCubd_short_name
-        self.unit_MolPerMtrCubd_short_name.text = 'MolPerMtrCubd'
-        self.unit_MolPerMtrCubd_long_name = ET.SubElement(self.unit_MolPerMtrCubd, 'LONG-NAME')
-        self.variables['unit_MolPerMtrCubd_long_name'] = self.unit_MolPerMtrCubd_long_name
-        self.unit_MolPerMtrCubd_l_4 = ET.SubElement(self.unit_MolPerMtrCubd_long_name, 'L-4')
-        self.variables['unit_MolPerMtrCubd_l_4'] = self.unit_MolPerMtrCubd_l_4
-        self.unit_MolPerMtrCubd_l_4.text = 'Mole Per Cubic Meter'
-        self.unit_MolPerMtrCubd_l_4.attrib = {'L': 'EN'}
-        self.unit_MolPerMtrCubd_display_name = ET.SubElement(self.unit_MolPerMtrCubd, 'DISPLAY-NAME')
-        self.variables['unit_MolPerMtrCubd_display_name'] = self.unit_MolPerMtrCubd_display_name
-        self.unit_MolPerMtrCubd_display_name.text = 'mol/(m^3)'
-        self.unit_MolPerMtrCubd_factor_si_to_unit = ET.SubElement(self.unit_MolPerMtrCubd, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MolPerMtrCubd_factor_si_to_unit'] = self.unit_MolPerMtrCubd_factor_si_to_unit
-        self.unit_MolPerMtrCubd_factor_si_to_unit.text = '1'
-        self.unit_MolPerMtrCubd_offset_si_to_unit = ET.SubElement(self.unit_MolPerMtrCubd, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MolPerMtrCubd_offset_si_to_unit'] = self.unit_MolPerMtrCubd_offset_si_to_unit
-        self.unit_MolPerMtrCubd_offset_si_to_unit.text = '0'
-        self.unit_MolPerMtrCubd_physical_dimension_ref = ET.SubElement(self.unit_MolPerMtrCubd, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MolPerMtrCubd_physical_dimension_ref'] = self.unit_MolPerMtrCubd_physical_dimension_ref
-        self.unit_MolPerMtrCubd_physical_dimension_ref.text = 'LenNeg3Amnt1'
-        self.unit_MolPerMtrCubd_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MolPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MolPerSec'] = self.unit_MolPerSec
-        self.unit_MolPerSec_short_name = ET.SubElement(self.unit_MolPerSec, 'SHORT-NAME')
-        self.variables['unit_MolPerSec_short_name'] = self.unit_MolPerSec_short_name
-        self.unit_MolPerSec_short_name.text = 'MolPerSec'
-        self.unit_MolPerSec_long_name = ET.SubElement(self.unit_MolPerSec, 'LONG-NAME')
-        self.variables['unit_MolPerSec_long_name'] = self.unit_MolPerSec_long_name
-        self.unit_MolPerSec_l_4 = ET.SubElement(self.unit_MolPerSec_long_name, 'L-4')
-        self.variables['unit_MolPerSec_l_4'] = self.unit_MolPerSec_l_4
-        self.unit_MolPerSec_l_4.text = 'Mole Per Second'
-        self.unit_MolPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_MolPerSec_display_name = ET.SubElement(self.unit_MolPerSec, 'DISPLAY-NAME')
-        self.variables['unit_MolPerSec_display_name'] = self.unit_MolPerSec_display_name
-        self.unit_MolPerSec_display_name.text = 'mol/s'
-        self.unit_MolPerSec_factor_si_to_unit = ET.SubElement(self.unit_MolPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MolPerSec_factor_si_to_unit'] = self.unit_MolPerSec_factor_si_to_unit
-        self.unit_MolPerSec_factor_si_to_unit.text = '1'
-        self.unit_MolPerSec_offset_si_to_unit = ET.SubElement(self.unit_MolPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MolPerSec_offset_si_to_unit'] = self.unit_MolPerSec_offset_si_to_unit
-        self.unit_MolPerSec_offset_si_to_unit.text = '0'
-        self.unit_MolPerSec_physical_dimension_ref = ET.SubElement(self.unit_MolPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MolPerSec_physical_dimension_ref'] = self.unit_MolPerSec_physical_dimension_ref
-        self.unit_MolPerSec_physical_dimension_ref.text = 'TiNeg1Amnt1'
-        self.unit_MolPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Mtr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Mtr'] = self.unit_Mtr
-        self.unit_Mtr_short_name = ET.SubElement(self.unit_Mtr, 'SHORT-NAME')
-        self.variables['unit_Mtr_short_name'] = self.unit_Mtr_short_name
-        self.unit_Mtr_short_name.text = 'Mtr'
-        self.unit_Mtr_long_name = ET.SubElement(self.unit_Mtr, 'LONG-NAME')
-        self.variables['unit_Mtr_long_name'] = self.unit_Mtr_long_name
-        self.unit_Mtr_l_4 = ET.SubElement(self.unit_Mtr_long_name, 'L-4')
-        self.variables['unit_Mtr_l_4'] = self.unit_Mtr_l_4
-        self.unit_Mtr_l_4.text = 'Meter'
-        self.unit_Mtr_l_4.attrib = {'L': 'EN'}
-        self.unit_Mtr_display_name = ET.SubElement(self.unit_Mtr, 'DISPLAY-NAME')
-        self.variables['unit_Mtr_display_name'] = self.unit_Mtr_display_name
-        self.unit_Mtr_display_name.text = 'm'
-        self.unit_Mtr_factor_si_to_unit = ET.SubElement(self.unit_Mtr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Mtr_factor_si_to_unit'] = self.unit_Mtr_factor_si_to_unit
-        self.unit_Mtr_factor_si_to_unit.text = '1'
-        self.unit_Mtr_offset_si_to_unit = ET.SubElement(self.unit_Mtr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Mtr_offset_si_to_unit'] = self.unit_Mtr_offset_si_to_unit
-        self.unit_Mtr_offset_si_to_unit.text = '0'
-        self.unit_Mtr_physical_dimension_ref = ET.SubElement(self.unit_Mtr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Mtr_physical_dimension_ref'] = self.unit_Mtr_physical_dimension_ref
-        self.unit_Mtr_physical_dimension_ref.text = 'Len1'
-        self.unit_Mtr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MtrCubd = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MtrCubd'] = self.unit_MtrCubd
-        self.unit_MtrCubd_short_name = ET.SubElement(self.unit_MtrCubd, 'SHORT-NAME')
-        self.variables['unit_MtrCubd_short_name'] = self.unit_MtrCubd_short_name
-        self.unit_MtrCubd_short_name.text = 'MtrCubd'
-        self.unit_MtrCubd_long_name = ET.SubElement(self.unit_MtrCubd, 'LONG-NAME')
-        self.variables['unit_MtrCubd_long_name'] = self.unit_MtrCubd_long_name
-        self.unit_MtrCubd_l_4 = ET.SubElement(self.unit_MtrCubd_long_name, 'L-4')
-        self.variables['unit_MtrCubd_l_4'] = self.unit_MtrCubd_l_4
-        self.unit_MtrCubd_l_4.text = 'Cubic Meter'
-        self.unit_MtrCubd_l_4.attrib = {'L': 'EN'}
-        self.unit_MtrCubd_display_name = ET.SubElement(self.unit_MtrCubd, 'DISPLAY-NAME')
-        self.variables['unit_MtrCubd_display_name'] = self.unit_MtrCubd_display_name
-        self.unit_MtrCubd_display_name.text = 'm^3'
-        self.unit_MtrCubd_factor_si_to_unit = ET.SubElement(self.unit_MtrCubd, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MtrCubd_factor_si_to_unit'] = self.unit_MtrCubd_factor_si_to_unit
-        self.unit_MtrCubd_factor_si_to_unit.text = '1'
-        self.unit_MtrCubd_offset_si_to_unit = ET.SubElement(self.unit_MtrCubd, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MtrCubd_offset_si_to_unit'] = self.unit_MtrCubd_offset_si_to_unit
-        self.unit_MtrCubd_offset_si_to_unit.text = '0'
-        self.unit_MtrCubd_physical_dimension_ref = ET.SubElement(self.unit_MtrCubd, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MtrCubd_physical_dimension_ref'] = self.unit_MtrCubd_physical_dimension_ref
-        self.unit_MtrCubd_physical_dimension_ref.text = 'Len3'
-        self.unit_MtrCubd_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MtrCubdPerHr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MtrCubdPerHr'] = self.unit_MtrCubdPerHr
-        self.unit_MtrCubdPerHr_short_name = ET.SubElement(self.unit_MtrCubdPerHr, 'SHORT-NAME')
-        self.variables['unit_MtrCubdPerHr_short_name'] = self.unit_MtrCubdPerHr_short_name
-        self.unit_MtrCubdPerHr_short_name.text = 'MtrCubdPerHr'
-        self.unit_MtrCubdPerHr_long_name = ET.SubElement(self.unit_MtrCubdPerHr, 'LONG-NAME')
-        self.variables['unit_MtrCubdPerHr_long_name'] = self.unit_MtrCubdPerHr_long_name
-        self.unit_MtrCubdPerHr_l_4 = ET.SubElement(self.unit_MtrCubdPerHr_long_name, 'L-4')
-        self.variables['unit_MtrCubdPerHr_l_4'] = self.unit_MtrCubdPerHr_l_4
-        self.unit_MtrCubdPerHr_l_4.text = 'Cubic Meter Per Hour '
-        self.unit_MtrCubdPerHr_l_4.attrib = {'L': 'EN'}
-        self.unit_MtrCubdPerHr_display_name = ET.SubElement(self.unit_MtrCubdPerHr, 'DISPLAY-NAME')
-        self.variables['unit_MtrCubdPerHr_display_name'] = self.unit_MtrCubdPerHr_display_name
-        self.unit_MtrCubdPerHr_display_name.text = '(m^3)/h'
-        self.unit_MtrCubdPerHr_factor_si_to_unit = ET.SubElement(self.unit_MtrCubdPerHr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MtrCubdPerHr_factor_si_to_unit'] = self.unit_MtrCubdPerHr_factor_si_to_unit
-        self.unit_MtrCubdPerHr_factor_si_to_unit.text = '3600'
-        self.unit_MtrCubdPerHr_offset_si_to_unit = ET.SubElement(self.unit_MtrCubdPerHr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MtrCubdPerHr_offset_si_to_unit'] = self.unit_MtrCubdPerHr_offset_si_to_unit
-        self.unit_MtrCubdPerHr_offset_si_to_unit.text = '0'
-        self.unit_MtrCubdPerHr_physical_dimension_ref = ET.SubElement(self.unit_MtrCubdPerHr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MtrCubdPerHr_physical_dimension_ref'] = self.unit_MtrCubdPerHr_physical_dimension_ref
-        self.unit_MtrCubdPerHr_physical_dimension_ref.text = 'Len3TiNeg1'
-        self.unit_MtrCubdPerHr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MtrCubdPerHrPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MtrCubdPerHrPerSec'] = self.unit_MtrCubdPerHrPerSec
-        self.unit_MtrCubdPerHrPerSec_short_name = ET.SubElement(self.unit_MtrCubdPerHrPerSec, 'SHORT-NAME')
-        self.variables['unit_MtrCubdPerHrPerSec_short_name'] = self.unit_MtrCubdPerHrPerSec_short_name
-        self.unit_MtrCubdPerHrPerSec_short_name.text = 'MtrCubdPerHrPerSec'
-        self.unit_MtrCubdPerHrPerSec_long_name = ET.SubElement(self.unit_MtrCubdPerHrPerSec, 'LONG-NAME')
-        self.variables['unit_MtrCubdPerHrPerSec_long_name'] = self.unit_MtrCubdPerHrPerSec_long_name
-        self.unit_MtrCubdPerHrPerSec_l_4 = ET.SubElement(self.unit_MtrCubdPerHrPerSec_long_name, 'L-4')
-        self.variables['unit_MtrCubdPerHrPerSec_l_4'] = self.unit_MtrCubdPerHrPerSec_l_4
-        self.unit_MtrCubdPerHrPerSec_l_4.text = 'Cubic Meter Per Hour Per Second'
-        self.unit_MtrCubdPerHrPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_MtrCubdPerHrPerSec_display_name = ET.SubElement(self.unit_MtrCubdPerHrPerSec, 'DISPLAY-NAME')
-        self.variables['unit_MtrCubdPerHrPerSec_display_name'] = self.unit_MtrCubdPerHrPerSec_display_name
-        self.unit_MtrCubdPerHrPerSec_display_name.text = '(m^3)/(h*s)'
-        self.unit_MtrCubdPerHrPerSec_factor_si_to_unit = ET.SubElement(self.unit_MtrCubdPerHrPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MtrCubdPerHrPerSec_factor_si_to_unit'] = self.unit_MtrCubdPerHrPerSec_factor_si_to_unit
-        self.unit_MtrCubdPerHrPerSec_factor_si_to_unit.text = '3600'
-        self.unit_MtrCubdPerHrPerSec_offset_si_to_unit = ET.SubElement(self.unit_MtrCubdPerHrPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MtrCubdPerHrPerSec_offset_si_to_unit'] = self.unit_MtrCubdPerHrPerSec_offset_si_to_unit
-        self.unit_MtrCubdPerHrPerSec_offset_si_to_unit.text = '0'
-        self.unit_MtrCubdPerHrPerSec_physical_dimension_ref = ET.SubElement(self.unit_MtrCubdPerHrPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MtrCubdPerHrPerSec_physical_dimension_ref'] = self.unit_MtrCubdPerHrPerSec_physical_dimension_ref
-        self.unit_MtrCubdPerHrPerSec_physical_dimension_ref.text = 'Len3TiNeg2'
-        self.unit_MtrCubdPerHrPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MtrCubdPerKiloGr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MtrCubdPerKiloGr'] = self.unit_MtrCubdPerKiloGr
-        self.unit_MtrCubdPerKiloGr_short_name = ET.SubElement(self.unit_MtrCubdPerKiloGr, 'SHORT-NAME')
-        self.variables['unit_MtrCubdPerKiloGr_short_name'] = self.unit_MtrCubdPerKiloGr_short_name
-        self.unit_MtrCubdPerKiloGr_short_name.text = 'MtrCubdPerKiloGr'
-        self.unit_MtrCubdPerKiloGr_long_name = ET.SubElement(self.unit_MtrCubdPerKiloGr, 'LONG-NAME')
-        self.variables['unit_MtrCubdPerKiloGr_long_name'] = self.unit_MtrCubdPerKiloGr_long_name
-        self.unit_MtrCubdPerKiloGr_l_4 = ET.SubElement(self.unit_MtrCubdPerKiloGr_long_name, 'L-4')
-        self.variables['unit_MtrCubdPerKiloGr_l_4'] = self.unit_MtrCubdPerKiloGr_l_4
-        self.unit_MtrCubdPerKiloGr_l_4.text = 'Cubic Meter Per Kilogram'
-        self.unit_MtrCubdPerKiloGr_l_4.attrib = {'L': 'EN'}
-        self.unit_MtrCubdPerKiloGr_display_name = ET.SubElement(self.unit_MtrCubdPerKiloGr, 'DISPLAY-NAME')
-        self.variables['unit_MtrCubdPerKiloGr_display_name'] = self.unit_MtrCubdPerKiloGr_display_name
-        self.unit_MtrCubdPerKiloGr_display_name.text = '(m^3)/kg'
-        self.unit_MtrCubdPerKiloGr_factor_si_to_unit = ET.SubElement(self.unit_MtrCubdPerKiloGr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MtrCubdPerKiloGr_factor_si_to_unit'] = self.unit_MtrCubdPerKiloGr_factor_si_to_unit
-        self.unit_MtrCubdPerKiloGr_factor_si_to_unit.text = '1'
-        self.unit_MtrCubdPerKiloGr_offset_si_to_unit = ET.SubElement(self.unit_MtrCubdPerKiloGr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MtrCubdPerKiloGr_offset_si_to_unit'] = self.unit_MtrCubdPerKiloGr_offset_si_to_unit
-        self.unit_MtrCubdPerKiloGr_offset_si_to_unit.text = '0'
-        self.unit_MtrCubdPerKiloGr_physical_dimension_ref = ET.SubElement(self.unit_MtrCubdPerKiloGr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MtrCubdPerKiloGr_physical_dimension_ref'] = self.unit_MtrCubdPerKiloGr_physical_dimension_ref
-        self.unit_MtrCubdPerKiloGr_physical_dimension_ref.text = 'Len3MNeg1'
-        self.unit_MtrCubdPerKiloGr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MtrPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MtrPerSec'] = self.unit_MtrPerSec
-        self.unit_MtrPerSec_short_name = ET.SubElement(self.unit_MtrPerSec, 'SHORT-NAME')
-        self.variables['unit_MtrPerSec_short_name'] = self.unit_MtrPerSec_short_name
-        self.unit_MtrPerSec_short_name.text = 'MtrPerSec'
-        self.unit_MtrPerSec_long_name = ET.SubElement(self.unit_MtrPerSec, 'LONG-NAME')
-        self.variables['unit_MtrPerSec_long_name'] = self.unit_MtrPerSec_long_name
-        self.unit_MtrPerSec_l_4 = ET.SubElement(self.unit_MtrPerSec_long_name, 'L-4')
-        self.variables['unit_MtrPerSec_l_4'] = self.unit_MtrPerSec_l_4
-        self.unit_MtrPerSec_l_4.text = 'Meter Per Second'
-        self.unit_MtrPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_MtrPerSec_display_name = ET.SubElement(self.unit_MtrPerSec, 'DISPLAY-NAME')
-        self.variables['unit_MtrPerSec_display_name'] = self.unit_MtrPerSec_display_name
-        self.unit_MtrPerSec_display_name.text = 'm/s'
-        self.unit_MtrPerSec_factor_si_to_unit = ET.SubElement(self.unit_MtrPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MtrPerSec_factor_si_to_unit'] = self.unit_MtrPerSec_factor_si_to_unit
-        self.unit_MtrPerSec_factor_si_to_unit.text = '1'
-        self.unit_MtrPerSec_offset_si_to_unit = ET.SubElement(self.unit_MtrPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MtrPerSec_offset_si_to_unit'] = self.unit_MtrPerSec_offset_si_to_unit
-        self.unit_MtrPerSec_offset_si_to_unit.text = '0'
-        self.unit_MtrPerSec_physical_dimension_ref = ET.SubElement(self.unit_MtrPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MtrPerSec_physical_dimension_ref'] = self.unit_MtrPerSec_physical_dimension_ref
-        self.unit_MtrPerSec_physical_dimension_ref.text = 'Len1TiNeg1'
-        self.unit_MtrPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MtrPerSecCubd = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MtrPerSecCubd'] = self.unit_MtrPerSecCubd
-        self.unit_MtrPerSecCubd_short_name = ET.SubElement(self.unit_MtrPerSecCubd, 'SHORT-NAME')
-        self.variables['unit_MtrPerSecCubd_short_name'] = self.unit_MtrPerSecCubd_short_name
-        self.unit_MtrPerSecCubd_short_name.text = 'MtrPerSecCubd'
-        self.unit_MtrPerSecCubd_long_name = ET.SubElement(self.unit_MtrPerSecCubd, 'LONG-NAME')
-        self.variables['unit_MtrPerSecCubd_long_name'] = self.unit_MtrPerSecCubd_long_name
-        self.unit_MtrPerSecCubd_l_4 = ET.SubElement(self.unit_MtrPerSecCubd_long_name, 'L-4')
-        self.variables['unit_MtrPerSecCubd_l_4'] = self.unit_MtrPerSecCubd_l_4
-        self.unit_MtrPerSecCubd_l_4.text = 'Meter Per Cubic Second'
-        self.unit_MtrPerSecCubd_l_4.attrib = {'L': 'EN'}
-        self.unit_MtrPerSecCubd_display_name = ET.SubElement(self.unit_MtrPerSecCubd, 'DISPLAY-NAME')
-        self.variables['unit_MtrPerSecCubd_display_name'] = self.unit_MtrPerSecCubd_display_name
-        self.unit_MtrPerSecCubd_display_name.text = 'm/(s^3)'
-        self.unit_MtrPerSecCubd_factor_si_to_unit = ET.SubElement(self.unit_MtrPerSecCubd, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MtrPerSecCubd_factor_si_to_unit'] = self.unit_MtrPerSecCubd_factor_si_to_unit
-        self.unit_MtrPerSecCubd_factor_si_to_unit.text = '1'
-        self.unit_MtrPerSecCubd_offset_si_to_unit = ET.SubElement(self.unit_MtrPerSecCubd, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MtrPerSecCubd_offset_si_to_unit'] = self.unit_MtrPerSecCubd_offset_si_to_unit
-        self.unit_MtrPerSecCubd_offset_si_to_unit.text = '0'
-        self.unit_MtrPerSecCubd_physical_dimension_ref = ET.SubElement(self.unit_MtrPerSecCubd, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MtrPerSecCubd_physical_dimension_ref'] = self.unit_MtrPerSecCubd_physical_dimension_ref
-        self.unit_MtrPerSecCubd_physical_dimension_ref.text = 'Len1TiNeg3'
-        self.unit_MtrPerSecCubd_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MtrPerSecSqd = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MtrPerSecSqd'] = self.unit_MtrPerSecSqd
-        self.unit_MtrPerSecSqd_short_name = ET.SubElement(self.unit_MtrPerSecSqd, 'SHORT-NAME')
-        self.variables['unit_MtrPerSecSqd_short_name'] = self.unit_MtrPerSecSqd_short_name
-        self.unit_MtrPerSecSqd_short_name.text = 'MtrPerSecSqd'
-        self.unit_MtrPerSecSqd_long_name = ET.SubElement(self.unit_MtrPerSecSqd, 'LONG-NAME')
-        self.variables['unit_MtrPerSecSqd_long_name'] = self.unit_MtrPerSecSqd_long_name
-        self.unit_MtrPerSecSqd_l_4 = ET.SubElement(self.unit_MtrPerSecSqd_long_name, 'L-4')
-        self.variables['unit_MtrPerSecSqd_l_4'] = self.unit_MtrPerSecSqd_l_4
-        self.unit_MtrPerSecSqd_l_4.text = 'Meter Per Square Second'
-        self.unit_MtrPerSecSqd_l_4.attrib = {'L': 'EN'}
-        self.unit_MtrPerSecSqd_display_name = ET.SubElement(self.unit_MtrPerSecSqd, 'DISPLAY-NAME')
-        self.variables['unit_MtrPerSecSqd_display_name'] = self.unit_MtrPerSecSqd_display_name
-        self.unit_MtrPerSecSqd_display_name.text = 'm/(s^2)'
-        self.unit_MtrPerSecSqd_factor_si_to_unit = ET.SubElement(self.unit_MtrPerSecSqd, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MtrPerSecSqd_factor_si_to_unit'] = self.unit_MtrPerSecSqd_factor_si_to_unit
-        self.unit_MtrPerSecSqd_factor_si_to_unit.text = '1'
-        self.unit_MtrPerSecSqd_offset_si_to_unit = ET.SubElement(self.unit_MtrPerSecSqd, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MtrPerSecSqd_offset_si_to_unit'] = self.unit_MtrPerSecSqd_offset_si_to_unit
-        self.unit_MtrPerSecSqd_offset_si_to_unit.text = '0'
-        self.unit_MtrPerSecSqd_physical_dimension_ref = ET.SubElement(self.unit_MtrPerSecSqd, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MtrPerSecSqd_physical_dimension_ref'] = self.unit_MtrPerSecSqd_physical_dimension_ref
-        self.unit_MtrPerSecSqd_physical_dimension_ref.text = 'Len1TiNeg2'
-        self.unit_MtrPerSecSqd_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MtrSqd = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MtrSqd'] = self.unit_MtrSqd
-        self.unit_MtrSqd_short_name = ET.SubElement(self.unit_MtrSqd, 'SHORT-NAME')
-        self.variables['unit_MtrSqd_short_name'] = self.unit_MtrSqd_short_name
-        self.unit_MtrSqd_short_name.text = 'MtrSqd'
-        self.unit_MtrSqd_long_name = ET.SubElement(self.unit_MtrSqd, 'LONG-NAME')
-        self.variables['unit_MtrSqd_long_name'] = self.unit_MtrSqd_long_name
-        self.unit_MtrSqd_l_4 = ET.SubElement(self.unit_MtrSqd_long_name, 'L-4')
-        self.variables['unit_MtrSqd_l_4'] = self.unit_MtrSqd_l_4
-        self.unit_MtrSqd_l_4.text = 'Square Meter'
-        self.unit_MtrSqd_l_4.attrib = {'L': 'EN'}
-        self.unit_MtrSqd_display_name = ET.SubElement(self.unit_MtrSqd, 'DISPLAY-NAME')
-        self.variables['unit_MtrSqd_display_name'] = self.unit_MtrSqd_display_name
-        self.unit_MtrSqd_display_name.text = 'm^2'
-        self.unit_MtrSqd_factor_si_to_unit = ET.SubElement(self.unit_MtrSqd, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MtrSqd_factor_si_to_unit'] = self.unit_MtrSqd_factor_si_to_unit
-        self.unit_MtrSqd_factor_si_to_unit.text = '1'
-        self.unit_MtrSqd_offset_si_to_unit = ET.SubElement(self.unit_MtrSqd, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MtrSqd_offset_si_to_unit'] = self.unit_MtrSqd_offset_si_to_unit
-        self.unit_MtrSqd_offset_si_to_unit.text = '0'
-        self.unit_MtrSqd_physical_dimension_ref = ET.SubElement(self.unit_MtrSqd, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MtrSqd_physical_dimension_ref'] = self.unit_MtrSqd_physical_dimension_ref
-        self.unit_MtrSqd_physical_dimension_ref.text = 'Len2'
-        self.unit_MtrSqd_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_MtrSqdPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_MtrSqdPerSec'] = self.unit_MtrSqdPerSec
-        self.unit_MtrSqdPerSec_short_name = ET.SubElement(self.unit_MtrSqdPerSec, 'SHORT-NAME')
-        self.variables['unit_MtrSqdPerSec_short_name'] = self.unit_MtrSqdPerSec_short_name
-        self.unit_MtrSqdPerSec_short_name.text = 'MtrSqdPerSec'
-        self.unit_MtrSqdPerSec_long_name = ET.SubElement(self.unit_MtrSqdPerSec, 'LONG-NAME')
-        self.variables['unit_MtrSqdPerSec_long_name'] = self.unit_MtrSqdPerSec_long_name
-        self.unit_MtrSqdPerSec_l_4 = ET.SubElement(self.unit_MtrSqdPerSec_long_name, 'L-4')
-        self.variables['unit_MtrSqdPerSec_l_4'] = self.unit_MtrSqdPerSec_l_4
-        self.unit_MtrSqdPerSec_l_4.text = 'Square Meter Per Second'
-        self.unit_MtrSqdPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_MtrSqdPerSec_display_name = ET.SubElement(self.unit_MtrSqdPerSec, 'DISPLAY-NAME')
-        self.variables['unit_MtrSqdPerSec_display_name'] = self.unit_MtrSqdPerSec_display_name
-        self.unit_MtrSqdPerSec_display_name.text = '(m^2)/s'
-        self.unit_MtrSqdPerSec_factor_si_to_unit = ET.SubElement(self.unit_MtrSqdPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_MtrSqdPerSec_factor_si_to_unit'] = self.unit_MtrSqdPerSec_factor_si_to_unit
-        self.unit_MtrSqdPerSec_factor_si_to_unit.text = '1'
-        self.unit_MtrSqdPerSec_offset_si_to_unit = ET.SubElement(self.unit_MtrSqdPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_MtrSqdPerSec_offset_si_to_unit'] = self.unit_MtrSqdPerSec_offset_si_to_unit
-        self.unit_MtrSqdPerSec_offset_si_to_unit.text = '0'
-        self.unit_MtrSqdPerSec_physical_dimension_ref = ET.SubElement(self.unit_MtrSqdPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_MtrSqdPerSec_physical_dimension_ref'] = self.unit_MtrSqdPerSec_physical_dimension_ref
-        self.unit_MtrSqdPerSec_physical_dimension_ref.text = 'Len2Ti1'
-        self.unit_MtrSqdPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_NanoFrd = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_NanoFrd'] = self.unit_NanoFrd
-        self.unit_NanoFrd_short_name = ET.SubElement(self.unit_NanoFrd, 'SHORT-NAME')
-        self.variables['unit_NanoFrd_short_name'] = self.unit_NanoFrd_short_name
-        self.unit_NanoFrd_short_name.text = 'NanoFrd'
-        self.unit_NanoFrd_long_name = ET.SubElement(self.unit_NanoFrd, 'LONG-NAME')
-        self.variables['unit_NanoFrd_long_name'] = self.unit_NanoFrd_long_name
-        self.unit_NanoFrd_l_4 = ET.SubElement(self.unit_NanoFrd_long_name, 'L-4')
-        self.variables['unit_NanoFrd_l_4'] = self.unit_NanoFrd_l_4
-        self.unit_NanoFrd_l_4.text = 'Nanofarad'
-        self.unit_NanoFrd_l_4.attrib = {'L': 'EN'}
-        self.unit_NanoFrd_display_name = ET.SubElement(self.unit_NanoFrd, 'DISPLAY-NAME')
-        self.variables['unit_NanoFrd_display_name'] = self.unit_NanoFrd_display_name
-        self.unit_NanoFrd_display_name.text = 'nF'
-        self.unit_NanoFrd_factor_si_to_unit = ET.SubElement(self.unit_NanoFrd, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_NanoFrd_factor_si_to_unit'] = self.unit_NanoFrd_factor_si_to_unit
-        self.unit_NanoFrd_factor_si_to_unit.text = '1000000000'
-        self.unit_NanoFrd_offset_si_to_unit = ET.SubElement(self.unit_NanoFrd, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_NanoFrd_offset_si_to_unit'] = self.unit_NanoFrd_offset_si_to_unit
-        self.unit_NanoFrd_offset_si_to_unit.text = '0'
-        self.unit_NanoFrd_physical_dimension_ref = ET.SubElement(self.unit_NanoFrd, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_NanoFrd_physical_dimension_ref'] = self.unit_NanoFrd_physical_dimension_ref
-        self.unit_NanoFrd_physical_dimension_ref.text = 'LenNeg2MNeg1Ti4I2'
-        self.unit_NanoFrd_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_NanoSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_NanoSec'] = self.unit_NanoSec
-        self.unit_NanoSec_short_name = ET.SubElement(self.unit_NanoSec, 'SHORT-NAME')
-        self.variables['unit_NanoSec_short_name'] = self.unit_NanoSec_short_name
-        self.unit_NanoSec_short_name.text = 'NanoSec'
-        self.unit_NanoSec_long_name = ET.SubElement(self.unit_NanoSec, 'LONG-NAME')
-        self.variables['unit_NanoSec_long_name'] = self.unit_NanoSec_long_name
-        self.unit_NanoSec_l_4 = ET.SubElement(self.unit_NanoSec_long_name, 'L-4')
-        self.variables['unit_NanoSec_l_4'] = self.unit_NanoSec_l_4
-        self.unit_NanoSec_l_4.text = 'Nanosecond'
-        self.unit_NanoSec_l_4.attrib = {'L': 'EN'}
-        self.unit_NanoSec_display_name = ET.SubElement(self.unit_NanoSec, 'DISPLAY-NAME')
-        self.variables['unit_NanoSec_display_name'] = self.unit_NanoSec_display_name
-        self.unit_NanoSec_display_name.text = 'ns'
-        self.unit_NanoSec_factor_si_to_unit = ET.SubElement(self.unit_NanoSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_NanoSec_factor_si_to_unit'] = self.unit_NanoSec_factor_si_to_unit
-        self.unit_NanoSec_factor_si_to_unit.text = '1000000000'
-        self.unit_NanoSec_offset_si_to_unit = ET.SubElement(self.unit_NanoSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_NanoSec_offset_si_to_unit'] = self.unit_NanoSec_offset_si_to_unit
-        self.unit_NanoSec_offset_si_to_unit.text = '0'
-        self.unit_NanoSec_physical_dimension_ref = ET.SubElement(self.unit_NanoSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_NanoSec_physical_dimension_ref'] = self.unit_NanoSec_physical_dimension_ref
-        self.unit_NanoSec_physical_dimension_ref.text = 'Ti1'
-        self.unit_NanoSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_NoUnit = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_NoUnit'] = self.unit_NoUnit
-        self.unit_NoUnit_short_name = ET.SubElement(self.unit_NoUnit, 'SHORT-NAME')
-        self.variables['unit_NoUnit_short_name'] = self.unit_NoUnit_short_name
-        self.unit_NoUnit_short_name.text = 'NoUnit'
-        self.unit_NoUnit_long_name = ET.SubElement(self.unit_NoUnit, 'LONG-NAME')
-        self.variables['unit_NoUnit_long_name'] = self.unit_NoUnit_long_name
-        self.unit_NoUnit_l_4 = ET.SubElement(self.unit_NoUnit_long_name, 'L-4')
-        self.variables['unit_NoUnit_l_4'] = self.unit_NoUnit_l_4
-        self.unit_NoUnit_l_4.text = 'Neither Physical nor Mathematical Unit'
-        self.unit_NoUnit_l_4.attrib = {'L': 'EN'}
-        self.unit_NoUnit_display_name = ET.SubElement(self.unit_NoUnit, 'DISPLAY-NAME')
-        self.variables['unit_NoUnit_display_name'] = self.unit_NoUnit_display_name
-        self.unit_NoUnit_display_name.text = '-'
-        self.unit_NoUnit_factor_si_to_unit = ET.SubElement(self.unit_NoUnit, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_NoUnit_factor_si_to_unit'] = self.unit_NoUnit_factor_si_to_unit
-        self.unit_NoUnit_factor_si_to_unit.text = '1'
-        self.unit_NoUnit_offset_si_to_unit = ET.SubElement(self.unit_NoUnit, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_NoUnit_offset_si_to_unit'] = self.unit_NoUnit_offset_si_to_unit
-        self.unit_NoUnit_offset_si_to_unit.text = '0'
-        self.unit_NoUnit_physical_dimension_ref = ET.SubElement(self.unit_NoUnit, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_NoUnit_physical_dimension_ref'] = self.unit_NoUnit_physical_dimension_ref
-        self.unit_NoUnit_physical_dimension_ref.text = 'NoDimension'
-        self.unit_NoUnit_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Nwt = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Nwt'] = self.unit_Nwt
-        self.unit_Nwt_short_name = ET.SubElement(self.unit_Nwt, 'SHORT-NAME')
-        self.variables['unit_Nwt_short_name'] = self.unit_Nwt_short_name
-        self.unit_Nwt_short_name.text = 'Nwt'
-        self.unit_Nwt_long_name = ET.SubElement(self.unit_Nwt, 'LONG-NAME')
-        self.variables['unit_Nwt_long_name'] = self.unit_Nwt_long_name
-        self.unit_Nwt_l_4 = ET.SubElement(self.unit_Nwt_long_name, 'L-4')
-        self.variables['unit_Nwt_l_4'] = self.unit_Nwt_l_4
-        self.unit_Nwt_l_4.text = 'Newton'
-        self.unit_Nwt_l_4.attrib = {'L': 'EN'}
-        self.unit_Nwt_display_name = ET.SubElement(self.unit_Nwt, 'DISPLAY-NAME')
-        self.variables['unit_Nwt_display_name'] = self.unit_Nwt_display_name
-        self.unit_Nwt_display_name.text = 'N'
-        self.unit_Nwt_factor_si_to_unit = ET.SubElement(self.unit_Nwt, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Nwt_factor_si_to_unit'] = self.unit_Nwt_factor_si_to_unit
-        self.unit_Nwt_factor_si_to_unit.text = '1'
-        self.unit_Nwt_offset_si_to_unit = ET.SubElement(self.unit_Nwt, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Nwt_offset_si_to_unit'] = self.unit_Nwt_offset_si_to_unit
-        self.unit_Nwt_offset_si_to_unit.text = '0'
-        self.unit_Nwt_physical_dimension_ref = ET.SubElement(self.unit_Nwt, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Nwt_physical_dimension_ref'] = self.unit_Nwt_physical_dimension_ref
-        self.unit_Nwt_physical_dimension_ref.text = 'Len1M1TiNeg2'
-        self.unit_Nwt_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_NwtMtr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_NwtMtr'] = self.unit_NwtMtr
-        self.unit_NwtMtr_short_name = ET.SubElement(self.unit_NwtMtr, 'SHORT-NAME')
-        self.variables['unit_NwtMtr_short_name'] = self.unit_NwtMtr_short_name
-        self.unit_NwtMtr_short_name.text = 'NwtMtr'
-        self.unit_NwtMtr_long_name = ET.SubElement(self.unit_NwtMtr, 'LONG-NAME')
-        self.variables['unit_NwtMtr_long_name'] = self.unit_NwtMtr_long_name
-        self.unit_NwtMtr_l_4 = ET.SubElement(self.unit_NwtMtr_long_name, 'L-4')
-        self.variables['unit_NwtMtr_l_4'] = self.unit_NwtMtr_l_4
-        self.unit_NwtMtr_l_4.text = 'Newtonmeter'
-        self.unit_NwtMtr_l_4.attrib = {'L': 'EN'}
-        self.unit_NwtMtr_display_name = ET.SubElement(self.unit_NwtMtr, 'DISPLAY-NAME')
-        self.variables['unit_NwtMtr_display_name'] = self.unit_NwtMtr_display_name
-        self.unit_NwtMtr_display_name.text = 'Nm'
-        self.unit_NwtMtr_factor_si_to_unit = ET.SubElement(self.unit_NwtMtr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_NwtMtr_factor_si_to_unit'] = self.unit_NwtMtr_factor_si_to_unit
-        self.unit_NwtMtr_factor_si_to_unit.text = '1'
-        self.unit_NwtMtr_offset_si_to_unit = ET.SubElement(self.unit_NwtMtr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_NwtMtr_offset_si_to_unit'] = self.unit_NwtMtr_offset_si_to_unit
-        self.unit_NwtMtr_offset_si_to_unit.text = '0'
-        self.unit_NwtMtr_physical_dimension_ref = ET.SubElement(self.unit_NwtMtr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_NwtMtr_physical_dimension_ref'] = self.unit_NwtMtr_physical_dimension_ref
-        self.unit_NwtMtr_physical_dimension_ref.text = 'Len2M1TiNeg2'
-        self.unit_NwtMtr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_NwtMtrPerRpm = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_NwtMtrPerRpm'] = self.unit_NwtMtrPerRpm
-        self.unit_NwtMtrPerRpm_short_name = ET.SubElement(self.unit_NwtMtrPerRpm, 'SHORT-NAME')
-        self.variables['unit_NwtMtrPerRpm_short_name'] = self.unit_NwtMtrPerRpm_short_name
-        self.unit_NwtMtrPerRpm_short_name.text = 'NwtMtrPerRpm'
-        self.unit_NwtMtrPerRpm_long_name = ET.SubElement(self.unit_NwtMtrPerRpm, 'LONG-NAME')
-        self.variables['unit_NwtMtrPerRpm_long_name'] = self.unit_NwtMtrPerRpm_long_name
-        self.unit_NwtMtrPerRpm_l_4 = ET.SubElement(self.unit_NwtMtrPerRpm_long_name, 'L-4')
-        self.variables['unit_NwtMtrPerRpm_l_4'] = self.unit_NwtMtrPerRpm_l_4
-        self.unit_NwtMtrPerRpm_l_4.text = 'Newtonmeter Per Rpm'
-        self.unit_NwtMtrPerRpm_l_4.attrib = {'L': 'EN'}
-        self.unit_NwtMtrPerRpm_display_name = ET.SubElement(self.unit_NwtMtrPerRpm, 'DISPLAY-NAME')
-        self.variables['unit_NwtMtrPerRpm_display_name'] = self.unit_NwtMtrPerRpm_display_name
-        self.unit_NwtMtrPerRpm_display_name.text = 'Nm/rpm'
-        self.unit_NwtMtrPerRpm_factor_si_to_unit = ET.SubElement(self.unit_NwtMtrPerRpm, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_NwtMtrPerRpm_factor_si_to_unit'] = self.unit_NwtMtrPerRpm_factor_si_to_unit
-        self.unit_NwtMtrPerRpm_factor_si_to_unit.text = '0.0166666666666667'
-        self.unit_NwtMtrPerRpm_offset_si_to_unit = ET.SubElement(self.unit_NwtMtrPerRpm, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_NwtMtrPerRpm_offset_si_to_unit'] = self.unit_NwtMtrPerRpm_offset_si_to_unit
-        self.unit_NwtMtrPerRpm_offset_si_to_unit.text = '0'
-        self.unit_NwtMtrPerRpm_physical_dimension_ref = ET.SubElement(self.unit_NwtMtrPerRpm, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_NwtMtrPerRpm_physical_dimension_ref'] = self.unit_NwtMtrPerRpm_physical_dimension_ref
-        self.unit_NwtMtrPerRpm_physical_dimension_ref.text = 'Len2M1TiNeg1'
-        self.unit_NwtMtrPerRpm_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_NwtMtrPerRpmPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_NwtMtrPerRpmPerSec'] = self.unit_NwtMtrPerRpmPerSec
-        self.unit_NwtMtrPerRpmPerSec_short_name = ET.SubElement(self.unit_NwtMtrPerRpmPerSec, 'SHORT-NAME')
-        self.variables['unit_NwtMtrPerRpmPerSec_short_name'] = self.unit_NwtMtrPerRpmPerSec_short_name
-        self.unit_NwtMtrPerRpmPerSec_short_name.text = 'NwtMtrPerRpmPerSec'
-        self.unit_NwtMtrPerRpmPerSec_long_name = ET.SubElement(self.unit_NwtMtrPerRpmPerSec, 'LONG-NAME')
-        self.variables['unit_NwtMtrPerRpmPerSec_long_name'] = self.unit_NwtMtrPerRpmPerSec_long_name
-        self.unit_NwtMtrPerRpmPerSec_l_4 = ET.SubElement(self.unit_NwtMtrPerRpmPerSec_long_name, 'L-4')
-        self.variables['unit_NwtMtrPerRpmPerSec_l_4'] = self.unit_NwtMtrPerRpmPerSec_l_4
-        self.unit_NwtMtrPerRpmPerSec_l_4.text = 'Newtonmeter Per Rpm Per Second'
-        self.unit_NwtMtrPerRpmPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_NwtMtrPerRpmPerSec_display_name = ET.SubElement(self.unit_NwtMtrPerRpmPerSec, 'DISPLAY-NAME')
-        self.variables['unit_NwtMtrPerRpmPerSec_display_name'] = self.unit_NwtMtrPerRpmPerSec_display_name
-        self.unit_NwtMtrPerRpmPerSec_display_name.text = 'Nm/(rpm/s)'
-        self.unit_NwtMtrPerRpmPerSec_factor_si_to_unit = ET.SubElement(self.unit_NwtMtrPerRpmPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_NwtMtrPerRpmPerSec_factor_si_to_unit'] = self.unit_NwtMtrPerRpmPerSec_factor_si_to_unit
-        self.unit_NwtMtrPerRpmPerSec_factor_si_to_unit.text = '0.0166666666666667'
-        self.unit_NwtMtrPerRpmPerSec_offset_si_to_unit = ET.SubElement(self.unit_NwtMtrPerRpmPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_NwtMtrPerRpmPerSec_offset_si_to_unit'] = self.unit_NwtMtrPerRpmPerSec_offset_si_to_unit
-        self.unit_NwtMtrPerRpmPerSec_offset_si_to_unit.text = '0'
-        self.unit_NwtMtrPerRpmPerSec_physical_dimension_ref = ET.SubElement(self.unit_NwtMtrPerRpmPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_NwtMtrPerRpmPerSec_physical_dimension_ref'] = self.unit_NwtMtrPerRpmPerSec_physical_dimension_ref
-        self.unit_NwtMtrPerRpmPerSec_physical_dimension_ref.text = 'Len2M1'
-        self.unit_NwtMtrPerRpmPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_NwtMtrPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_NwtMtrPerSec'] = self.unit_NwtMtrPerSec
-        self.unit_NwtMtrPerSec_short_name = ET.SubElement(self.unit_NwtMtrPerSec, 'SHORT-NAME')
-        self.variables['unit_NwtMtrPerSec_short_name'] = self.unit_NwtMtrPerSec_short_name
-        self.unit_NwtMtrPerSec_short_name.text = 'NwtMtrPerSec'
-        self.unit_NwtMtrPerSec_long_name = ET.SubElement(self.unit_NwtMtrPerSec, 'LONG-NAME')
-        self.variables['unit_NwtMtrPerSec_long_name'] = self.unit_NwtMtrPerSec_long_name
-        self.unit_NwtMtrPerSec_l_4 = ET.SubElement(self.unit_NwtMtrPerSec_long_name, 'L-4')
-        self.variables['unit_NwtMtrPerSec_l_4'] = self.unit_NwtMtrPerSec_l_4
-        self.unit_NwtMtrPerSec_l_4.text = 'Newtonmeter Per Second'
-        self.unit_NwtMtrPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_NwtMtrPerSec_display_name = ET.SubElement(self.unit_NwtMtrPerSec, 'DISPLAY-NAME')
-        self.variables['unit_NwtMtrPerSec_display_name'] = self.unit_NwtMtrPerSec_display_name
-        self.unit_NwtMtrPerSec_display_name.text = '(N*m)/s'
-        self.unit_NwtMtrPerSec_factor_si_to_unit = ET.SubElement(self.unit_NwtMtrPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_NwtMtrPerSec_factor_si_to_unit'] = self.unit_NwtMtrPerSec_factor_si_to_unit
-        self.unit_NwtMtrPerSec_factor_si_to_unit.text = '1'
-        self.unit_NwtMtrPerSec_offset_si_to_unit = ET.SubElement(self.unit_NwtMtrPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_NwtMtrPerSec_offset_si_to_unit'] = self.unit_NwtMtrPerSec_offset_si_to_unit
-        self.unit_NwtMtrPerSec_offset_si_to_unit.text = '0'
-        self.unit_NwtMtrPerSec_physical_dimension_ref = ET.SubElement(self.unit_NwtMtrPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_NwtMtrPerSec_physical_dimension_ref'] = self.unit_NwtMtrPerSec_physical_dimension_ref
-        self.unit_NwtMtrPerSec_physical_dimension_ref.text = 'Len2M1TiNeg3'
-        self.unit_NwtMtrPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_NwtMtrSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_NwtMtrSec'] = self.unit_NwtMtrSec
-        self.unit_NwtMtrSec_short_name = ET.SubElement(self.unit_NwtMtrSec, 'SHORT-NAME')
-        self.variables['unit_NwtMtrSec_short_name'] = self.unit_NwtMtrSec_short_name
-        self.unit_NwtMtrSec_short_name.text = 'NwtMtrSec'
-        self.unit_NwtMtrSec_long_name = ET.SubElement(self.unit_NwtMtrSec, 'LONG-NAME')
-        self.variables['unit_NwtMtrSec_long_name'] = self.unit_NwtMtrSec_long_name
-        self.unit_NwtMtrSec_l_4 = ET.SubElement(self.unit_NwtMtrSec_long_name, 'L-4')
-        self.variables['unit_NwtMtrSec_l_4'] = self.unit_NwtMtrSec_l_4
-        self.unit_NwtMtrSec_l_4.text = 'Newtonmeter Second'
-        self.unit_NwtMtrSec_l_4.attrib = {'L': 'EN'}
-        self.unit_NwtMtrSec_display_name = ET.SubElement(self.unit_NwtMtrSec, 'DISPLAY-NAME')
-        self.variables['unit_NwtMtrSec_display_name'] = self.unit_NwtMtrSec_display_name
-        self.unit_NwtMtrSec_display_name.text = 'Nm*s'
-        self.unit_NwtMtrSec_factor_si_to_unit = ET.SubElement(self.unit_NwtMtrSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_NwtMtrSec_factor_si_to_unit'] = self.unit_NwtMtrSec_factor_si_to_unit
-        self.unit_NwtMtrSec_factor_si_to_unit.text = '1'
-        self.unit_NwtMtrSec_offset_si_to_unit = ET.SubElement(self.unit_NwtMtrSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_NwtMtrSec_offset_si_to_unit'] = self.unit_NwtMtrSec_offset_si_to_unit
-        self.unit_NwtMtrSec_offset_si_to_unit.text = '0'
-        self.unit_NwtMtrSec_physical_dimension_ref = ET.SubElement(self.unit_NwtMtrSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_NwtMtrSec_physical_dimension_ref'] = self.unit_NwtMtrSec_physical_dimension_ref
-        self.unit_NwtMtrSec_physical_dimension_ref.text = 'Len2M1TiNeg1'
-        self.unit_NwtMtrSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_NwtMtrSqrSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_NwtMtrSqrSec'] = self.unit_NwtMtrSqrSec
-        self.unit_NwtMtrSqrSec_short_name = ET.SubElement(self.unit_NwtMtrSqrSec, 'SHORT-NAME')
-        self.variables['unit_NwtMtrSqrSec_short_name'] = self.unit_NwtMtrSqrSec_short_name
-        self.unit_NwtMtrSqrSec_short_name.text = 'NwtMtrSqrSec'
-        self.unit_NwtMtrSqrSec_long_name = ET.SubElement(self.unit_NwtMtrSqrSec, 'LONG-NAME')
-        self.variables['unit_NwtMtrSqrSec_long_name'] = self.unit_NwtMtrSqrSec_long_name
-        self.unit_NwtMtrSqrSec_l_4 = ET.SubElement(self.unit_NwtMtrSqrSec_long_name, 'L-4')
-        self.variables['unit_NwtMtrSqrSec_l_4'] = self.unit_NwtMtrSqrSec_l_4
-        self.unit_NwtMtrSqrSec_l_4.text = 'Newtonmeter Square Second'
-        self.unit_NwtMtrSqrSec_l_4.attrib = {'L': 'EN'}
-        self.unit_NwtMtrSqrSec_display_name = ET.SubElement(self.unit_NwtMtrSqrSec, 'DISPLAY-NAME')
-        self.variables['unit_NwtMtrSqrSec_display_name'] = self.unit_NwtMtrSqrSec_display_name
-        self.unit_NwtMtrSqrSec_display_name.text = 'Nm*(s^2)'
-        self.unit_NwtMtrSqrSec_factor_si_to_unit = ET.SubElement(self.unit_NwtMtrSqrSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_NwtMtrSqrSec_factor_si_to_unit'] = self.unit_NwtMtrSqrSec_factor_si_to_unit
-        self.unit_NwtMtrSqrSec_factor_si_to_unit.text = '1'
-        self.unit_NwtMtrSqrSec_offset_si_to_unit = ET.SubElement(self.unit_NwtMtrSqrSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_NwtMtrSqrSec_offset_si_to_unit'] = self.unit_NwtMtrSqrSec_offset_si_to_unit
-        self.unit_NwtMtrSqrSec_offset_si_to_unit.text = '0'
-        self.unit_NwtMtrSqrSec_physical_dimension_ref = ET.SubElement(self.unit_NwtMtrSqrSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_NwtMtrSqrSec_physical_dimension_ref'] = self.unit_NwtMtrSqrSec_physical_dimension_ref
-        self.unit_NwtMtrSqrSec_physical_dimension_ref.text = 'Len2M1'
-        self.unit_NwtMtrSqrSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_NwtPerMtr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_NwtPerMtr'] = self.unit_NwtPerMtr
-        self.unit_NwtPerMtr_short_name = ET.SubElement(self.unit_NwtPerMtr, 'SHORT-NAME')
-        self.variables['unit_NwtPerMtr_short_name'] = self.unit_NwtPerMtr_short_name
-        self.unit_NwtPerMtr_short_name.text = 'NwtPerMtr'
-        self.unit_NwtPerMtr_long_name = ET.SubElement(self.unit_NwtPerMtr, 'LONG-NAME')
-        self.variables['unit_NwtPerMtr_long_name'] = self.unit_NwtPerMtr_long_name
-        self.unit_NwtPerMtr_l_4 = ET.SubElement(self.unit_NwtPerMtr_long_name, 'L-4')
-        self.variables['unit_NwtPerMtr_l_4'] = self.unit_NwtPerMtr_l_4
-        self.unit_NwtPerMtr_l_4.text = 'Newton Per Meter'
-        self.unit_NwtPerMtr_l_4.attrib = {'L': 'EN'}
-        self.unit_NwtPerMtr_display_name = ET.SubElement(self.unit_NwtPerMtr, 'DISPLAY-NAME')
-        self.variables['unit_NwtPerMtr_display_name'] = self.unit_NwtPerMtr_display_name
-        self.unit_NwtPerMtr_display_name.text = 'N/m'
-        self.unit_NwtPerMtr_factor_si_to_unit = ET.SubElement(self.unit_NwtPerMtr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_NwtPerMtr_factor_si_to_unit'] = self.unit_NwtPerMtr_factor_si_to_unit
-        self.unit_NwtPerMtr_factor_si_to_unit.text = '1'
-        self.unit_NwtPerMtr_offset_si_to_unit = ET.SubElement(self.unit_NwtPerMtr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_NwtPerMtr_offset_si_to_unit'] = self.unit_NwtPerMtr_offset_si_to_unit
-        self.unit_NwtPerMtr_offset_si_to_unit.text = '0'
-        self.unit_NwtPerMtr_physical_dimension_ref = ET.SubElement(self.unit_NwtPerMtr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_NwtPerMtr_physical_dimension_ref'] = self.unit_NwtPerMtr_physical_dimension_ref
-        self.unit_NwtPerMtr_physical_dimension_ref.text = 'M1TiNeg2'
-        self.unit_NwtPerMtr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_NwtSecPerMtr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_NwtSecPerMtr'] = self.unit_NwtSecPerMtr
-        self.unit_NwtSecPerMtr_short_name = ET.SubElement(self.unit_NwtSecPerMtr, 'SHORT-NAME')
-        self.variables['unit_NwtSecPerMtr_short_name'] = self.unit_NwtSecPerMtr_short_name
-        self.unit_NwtSecPerMtr_short_name.text = 'NwtSecPerMtr'
-        self.unit_NwtSecPerMtr_long_name = ET.SubElement(self.unit_NwtSecPerMtr, 'LONG-NAME')
-        self.variables['unit_NwtSecPerMtr_long_name'] = self.unit_NwtSecPerMtr_long_name
-        self.unit_NwtSecPerMtr_l_4 = ET.SubElement(self.unit_NwtSecPerMtr_long_name, 'L-4')
-        self.variables['unit_NwtSecPerMtr_l_4'] = self.unit_NwtSecPerMtr_l_4
-        self.unit_NwtSecPerMtr_l_4.text = 'Newtonsecond Per Meter'
-        self.unit_NwtSecPerMtr_l_4.attrib = {'L': 'EN'}
-        self.unit_NwtSecPerMtr_display_name = ET.SubElement(self.unit_NwtSecPerMtr, 'DISPLAY-NAME')
-        self.variables['unit_NwtSecPerMtr_display_name'] = self.unit_NwtSecPerMtr_display_name
-        self.unit_NwtSecPerMtr_display_name.text = 'Ns/m'
-        self.unit_NwtSecPerMtr_factor_si_to_unit = ET.SubElement(self.unit_NwtSecPerMtr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_NwtSecPerMtr_factor_si_to_unit'] = self.unit_NwtSecPerMtr_factor_si_to_unit
-        self.unit_NwtSecPerMtr_factor_si_to_unit.text = '1'
-        self.unit_NwtSecPerMtr_offset_si_to_unit = ET.SubElement(self.unit_NwtSecPerMtr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_NwtSecPerMtr_offset_si_to_unit'] = self.unit_NwtSecPerMtr_offset_si_to_unit
-        self.unit_NwtSecPerMtr_offset_si_to_unit.text = '0'
-        self.unit_NwtSecPerMtr_physical_dimension_ref = ET.SubElement(self.unit_NwtSecPerMtr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_NwtSecPerMtr_physical_dimension_ref'] = self.unit_NwtSecPerMtr_physical_dimension_ref
-        self.unit_NwtSecPerMtr_physical_dimension_ref.text = 'M1TiNeg1_1'
-        self.unit_NwtSecPerMtr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Ohm = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Ohm'] = self.unit_Ohm
-        self.unit_Ohm_short_name = ET.SubElement(self.unit_Ohm, 'SHORT-NAME')
-        self.variables['unit_Ohm_short_name'] = self.unit_Ohm_short_name
-        self.unit_Ohm_short_name.text = 'Ohm'
-        self.unit_Ohm_long_name = ET.SubElement(self.unit_Ohm, 'LONG-NAME')
-        self.variables['unit_Ohm_long_name'] = self.unit_Ohm_long_name
-        self.unit_Ohm_l_4 = ET.SubElement(self.unit_Ohm_long_name, 'L-4')
-        self.variables['unit_Ohm_l_4'] = self.unit_Ohm_l_4
-        self.unit_Ohm_l_4.text = 'Ohm'
-        self.unit_Ohm_l_4.attrib = {'L': 'EN'}
-        self.unit_Ohm_display_name = ET.SubElement(self.unit_Ohm, 'DISPLAY-NAME')
-        self.variables['unit_Ohm_display_name'] = self.unit_Ohm_display_name
-        self.unit_Ohm_display_name.text = 'Ω'
-        self.unit_Ohm_factor_si_to_unit = ET.SubElement(self.unit_Ohm, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Ohm_factor_si_to_unit'] = self.unit_Ohm_factor_si_to_unit
-        self.unit_Ohm_factor_si_to_unit.text = '1'
-        self.unit_Ohm_offset_si_to_unit = ET.SubElement(self.unit_Ohm, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Ohm_offset_si_to_unit'] = self.unit_Ohm_offset_si_to_unit
-        self.unit_Ohm_offset_si_to_unit.text = '0'
-        self.unit_Ohm_physical_dimension_ref = ET.SubElement(self.unit_Ohm, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Ohm_physical_dimension_ref'] = self.unit_Ohm_physical_dimension_ref
-        self.unit_Ohm_physical_dimension_ref.text = 'Len2M1TiNeg3INeg2'
-        self.unit_Ohm_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Pa = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Pa'] = self.unit_Pa
-        self.unit_Pa_short_name = ET.SubElement(self.unit_Pa, 'SHORT-NAME')
-        self.variables['unit_Pa_short_name'] = self.unit_Pa_short_name
-        self.unit_Pa_short_name.text = 'Pa'
-        self.unit_Pa_long_name = ET.SubElement(self.unit_Pa, 'LONG-NAME')
-        self.variables['unit_Pa_long_name'] = self.unit_Pa_long_name
-        self.unit_Pa_l_4 = ET.SubElement(self.unit_Pa_long_name, 'L-4')
-        self.variables['unit_Pa_l_4'] = self.unit_Pa_l_4
-        self.unit_Pa_l_4.text = 'Pascal'
-        self.unit_Pa_l_4.attrib = {'L': 'EN'}
-        self.unit_Pa_display_name = ET.SubElement(self.unit_Pa, 'DISPLAY-NAME')
-        self.variables['unit_Pa_display_name'] = self.unit_Pa_display_name
-        self.unit_Pa_display_name.text = 'Pa'
-        self.unit_Pa_factor_si_to_unit = ET.SubElement(self.unit_Pa, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Pa_factor_si_to_unit'] = self.unit_Pa_factor_si_to_unit
-        self.unit_Pa_factor_si_to_unit.text = '1'
-        self.unit_Pa_offset_si_to_unit = ET.SubElement(self.unit_Pa, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Pa_offset_si_to_unit'] = self.unit_Pa_offset_si_to_unit
-        self.unit_Pa_offset_si_to_unit.text = '0'
-        self.unit_Pa_physical_dimension_ref = ET.SubElement(self.unit_Pa, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Pa_physical_dimension_ref'] = self.unit_Pa_physical_dimension_ref
-        self.unit_Pa_physical_dimension_ref.text = 'LenNeg1M1TiNeg2'
-        self.unit_Pa_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_PaPerMtrCubdPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_PaPerMtrCubdPerSec'] = self.unit_PaPerMtrCubdPerSec
-        self.unit_PaPerMtrCubdPerSec_short_name = ET.SubElement(self.unit_PaPerMtrCubdPerSec, 'SHORT-NAME')
-        self.variables['unit_PaPerMtrCubdPerSec_short_name'] = self.unit_PaPerMtrCubdPerSec_short_name
-        self.unit_PaPerMtrCubdPerSec_short_name.text = 'PaPerMtrCubdPerSec'
-        self.unit_PaPerMtrCubdPerSec_long_name = ET.SubElement(self.unit_PaPerMtrCubdPerSec, 'LONG-NAME')
-        self.variables['unit_PaPerMtrCubdPerSec_long_name'] = self.unit_PaPerMtrCubdPerSec_long_name
-        self.unit_PaPerMtrCubdPerSec_l_4 = ET.SubElement(self.unit_PaPerMtrCubdPerSec_long_name, 'L-4')
-        self.variables['unit_PaPerMtrCubdPerSec_l_4'] = self.unit_PaPerMtrCubdPerSec_l_4
-        self.unit_PaPerMtrCubdPerSec_l_4.text = 'Pascal Per Cubic Meter Per Second'
-        self.unit_PaPerMtrCubdPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_PaPerMtrCubdPerSec_display_name = ET.SubElement(self.unit_PaPerMtrCubdPerSec, 'DISPLAY-NAME')
-        self.variables['unit_PaPerMtrCubdPerSec_display_name'] = self.unit_PaPerMtrCubdPerSec_display_name
-        self.unit_PaPerMtrCubdPerSec_display_name.text = 'Pa/((m^3)/s)'
-        self.unit_PaPerMtrCubdPerSec_factor_si_to_unit = ET.SubElement(self.unit_PaPerMtrCubdPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_PaPerMtrCubdPerSec_factor_si_to_unit'] = self.unit_PaPerMtrCubdPerSec_factor_si_to_unit
-        self.unit_PaPerMtrCubdPerSec_factor_si_to_unit.text = '1'
-        self.unit_PaPerMtrCubdPerSec_offset_si_to_unit = ET.SubElement(self.unit_PaPerMtrCubdPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_PaPerMtrCubdPerSec_offset_si_to_unit'] = self.unit_PaPerMtrCubdPerSec_offset_si_to_unit
-        self.unit_PaPerMtrCubdPerSec_offset_si_to_unit.text = '0'
-        self.unit_PaPerMtrCubdPerSec_physical_dimension_ref = ET.SubElement(self.unit_PaPerMtrCubdPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_PaPerMtrCubdPerSec_physical_dimension_ref'] = self.unit_PaPerMtrCubdPerSec_physical_dimension_ref
-        self.unit_PaPerMtrCubdPerSec_physical_dimension_ref.text = 'LenNeg4M1TiNeg1'
-        self.unit_PaPerMtrCubdPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_PaPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_PaPerSec'] = self.unit_PaPerSec
-        self.unit_PaPerSec_short_name = ET.SubElement(self.unit_PaPerSec, 'SHORT-NAME')
-        self.variables['unit_PaPerSec_short_name'] = self.unit_PaPerSec_short_name
-        self.unit_PaPerSec_short_name.text = 'PaPerSec'
-        self.unit_PaPerSec_long_name = ET.SubElement(self.unit_PaPerSec, 'LONG-NAME')
-        self.variables['unit_PaPerSec_long_name'] = self.unit_PaPerSec_long_name
-        self.unit_PaPerSec_l_4 = ET.SubElement(self.unit_PaPerSec_long_name, 'L-4')
-        self.variables['unit_PaPerSec_l_4'] = self.unit_PaPerSec_l_4
-        self.unit_PaPerSec_l_4.text = 'Pascal Per Second'
-        self.unit_PaPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_PaPerSec_display_name = ET.SubElement(self.unit_PaPerSec, 'DISPLAY-NAME')
-        self.variables['unit_PaPerSec_display_name'] = self.unit_PaPerSec_display_name
-        self.unit_PaPerSec_display_name.text = 'Pa/s'
-        self.unit_PaPerSec_factor_si_to_unit = ET.SubElement(self.unit_PaPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_PaPerSec_factor_si_to_unit'] = self.unit_PaPerSec_factor_si_to_unit
-        self.unit_PaPerSec_factor_si_to_unit.text = '1'
-        self.unit_PaPerSec_offset_si_to_unit = ET.SubElement(self.unit_PaPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_PaPerSec_offset_si_to_unit'] = self.unit_PaPerSec_offset_si_to_unit
-        self.unit_PaPerSec_offset_si_to_unit.text = '0'
-        self.unit_PaPerSec_physical_dimension_ref = ET.SubElement(self.unit_PaPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_PaPerSec_physical_dimension_ref'] = self.unit_PaPerSec_physical_dimension_ref
-        self.unit_PaPerSec_physical_dimension_ref.text = 'LenNeg1M1TiNeg3'
-        self.unit_PaPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_PaSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_PaSec'] = self.unit_PaSec
-        self.unit_PaSec_short_name = ET.SubElement(self.unit_PaSec, 'SHORT-NAME')
-        self.variables['unit_PaSec_short_name'] = self.unit_PaSec_short_name
-        self.unit_PaSec_short_name.text = 'PaSec'
-        self.unit_PaSec_long_name = ET.SubElement(self.unit_PaSec, 'LONG-NAME')
-        self.variables['unit_PaSec_long_name'] = self.unit_PaSec_long_name
-        self.unit_PaSec_l_4 = ET.SubElement(self.unit_PaSec_long_name, 'L-4')
-        self.variables['unit_PaSec_l_4'] = self.unit_PaSec_l_4
-        self.unit_PaSec_l_4.text = 'Pascal Second'
-        self.unit_PaSec_l_4.attrib = {'L': 'EN'}
-        self.unit_PaSec_display_name = ET.SubElement(self.unit_PaSec, 'DISPLAY-NAME')
-        self.variables['unit_PaSec_display_name'] = self.unit_PaSec_display_name
-        self.unit_PaSec_display_name.text = 'Pa*s'
-        self.unit_PaSec_factor_si_to_unit = ET.SubElement(self.unit_PaSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_PaSec_factor_si_to_unit'] = self.unit_PaSec_factor_si_to_unit
-        self.unit_PaSec_factor_si_to_unit.text = '1'
-        self.unit_PaSec_offset_si_to_unit = ET.SubElement(self.unit_PaSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_PaSec_offset_si_to_unit'] = self.unit_PaSec_offset_si_to_unit
-        self.unit_PaSec_offset_si_to_unit.text = '0'
-        self.unit_PaSec_physical_dimension_ref = ET.SubElement(self.unit_PaSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_PaSec_physical_dimension_ref'] = self.unit_PaSec_physical_dimension_ref
-        self.unit_PaSec_physical_dimension_ref.text = 'LenNeg1M1TiNeg1'
-        self.unit_PaSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_PerMille = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_PerMille'] = self.unit_PerMille
-        self.unit_PerMille_short_name = ET.SubElement(self.unit_PerMille, 'SHORT-NAME')
-        self.variables['unit_PerMille_short_name'] = self.unit_PerMille_short_name
-        self.unit_PerMille_short_name.text = 'PerMille'
-        self.unit_PerMille_long_name = ET.SubElement(self.unit_PerMille, 'LONG-NAME')
-        self.variables['unit_PerMille_long_name'] = self.unit_PerMille_long_name
-        self.unit_PerMille_l_4 = ET.SubElement(self.unit_PerMille_long_name, 'L-4')
-        self.variables['unit_PerMille_l_4'] = self.unit_PerMille_l_4
-        self.unit_PerMille_l_4.text = 'Permille'
-        self.unit_PerMille_l_4.attrib = {'L': 'EN'}
-        self.unit_PerMille_display_name = ET.SubElement(self.unit_PerMille, 'DISPLAY-NAME')
-        self.variables['unit_PerMille_display_name'] = self.unit_PerMille_display_name
-        self.unit_PerMille_display_name.text = '‰'
-        self.unit_PerMille_factor_si_to_unit = ET.SubElement(self.unit_PerMille, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_PerMille_factor_si_to_unit'] = self.unit_PerMille_factor_si_to_unit
-        self.unit_PerMille_factor_si_to_unit.text = '1000'
-        self.unit_PerMille_offset_si_to_unit = ET.SubElement(self.unit_PerMille, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_PerMille_offset_si_to_unit'] = self.unit_PerMille_offset_si_to_unit
-        self.unit_PerMille_offset_si_to_unit.text = '0'
-        self.unit_PerMille_physical_dimension_ref = ET.SubElement(self.unit_PerMille, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_PerMille_physical_dimension_ref'] = self.unit_PerMille_physical_dimension_ref
-        self.unit_PerMille_physical_dimension_ref.text = 'NoDimension_1'
-        self.unit_PerMille_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_PerMin = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_PerMin'] = self.unit_PerMin
-        self.unit_PerMin_short_name = ET.SubElement(self.unit_PerMin, 'SHORT-NAME')
-        self.variables['unit_PerMin_short_name'] = self.unit_PerMin_short_name
-        self.unit_PerMin_short_name.text = 'PerMin'
-        self.unit_PerMin_long_name = ET.SubElement(self.unit_PerMin, 'LONG-NAME')
-        self.variables['unit_PerMin_long_name'] = self.unit_PerMin_long_name
-        self.unit_PerMin_l_4 = ET.SubElement(self.unit_PerMin_long_name, 'L-4')
-        self.variables['unit_PerMin_l_4'] = self.unit_PerMin_l_4
-        self.unit_PerMin_l_4.text = 'Per Minute'
-        self.unit_PerMin_l_4.attrib = {'L': 'EN'}
-        self.unit_PerMin_display_name = ET.SubElement(self.unit_PerMin, 'DISPLAY-NAME')
-        self.variables['unit_PerMin_display_name'] = self.unit_PerMin_display_name
-        self.unit_PerMin_display_name.text = '1/min'
-        self.unit_PerMin_factor_si_to_unit = ET.SubElement(self.unit_PerMin, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_PerMin_factor_si_to_unit'] = self.unit_PerMin_factor_si_to_unit
-        self.unit_PerMin_factor_si_to_unit.text = '60'
-        self.unit_PerMin_offset_si_to_unit = ET.SubElement(self.unit_PerMin, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_PerMin_offset_si_to_unit'] = self.unit_PerMin_offset_si_to_unit
-        self.unit_PerMin_offset_si_to_unit.text = '0'
-        self.unit_PerMin_physical_dimension_ref = ET.SubElement(self.unit_PerMin, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_PerMin_physical_dimension_ref'] = self.unit_PerMin_physical_dimension_ref
-        self.unit_PerMin_physical_dimension_ref.text = 'TiNeg1_2'
-        self.unit_PerMin_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_PerMtr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_PerMtr'] = self.unit_PerMtr
-        self.unit_PerMtr_short_name = ET.SubElement(self.unit_PerMtr, 'SHORT-NAME')
-        self.variables['unit_PerMtr_short_name'] = self.unit_PerMtr_short_name
-        self.unit_PerMtr_short_name.text = 'PerMtr'
-        self.unit_PerMtr_long_name = ET.SubElement(self.unit_PerMtr, 'LONG-NAME')
-        self.variables['unit_PerMtr_long_name'] = self.unit_PerMtr_long_name
-        self.unit_PerMtr_l_4 = ET.SubElement(self.unit_PerMtr_long_name, 'L-4')
-        self.variables['unit_PerMtr_l_4'] = self.unit_PerMtr_l_4
-        self.unit_PerMtr_l_4.text = 'Per Meter'
-        self.unit_PerMtr_l_4.attrib = {'L': 'EN'}
-        self.unit_PerMtr_display_name = ET.SubElement(self.unit_PerMtr, 'DISPLAY-NAME')
-        self.variables['unit_PerMtr_display_name'] = self.unit_PerMtr_display_name
-        self.unit_PerMtr_display_name.text = '1/m'
-        self.unit_PerMtr_factor_si_to_unit = ET.SubElement(self.unit_PerMtr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_PerMtr_factor_si_to_unit'] = self.unit_PerMtr_factor_si_to_unit
-        self.unit_PerMtr_factor_si_to_unit.text = '1'
-        self.unit_PerMtr_offset_si_to_unit = ET.SubElement(self.unit_PerMtr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_PerMtr_offset_si_to_unit'] = self.unit_PerMtr_offset_si_to_unit
-        self.unit_PerMtr_offset_si_to_unit.text = '0'
-        self.unit_PerMtr_physical_dimension_ref = ET.SubElement(self.unit_PerMtr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_PerMtr_physical_dimension_ref'] = self.unit_PerMtr_physical_dimension_ref
-        self.unit_PerMtr_physical_dimension_ref.text = 'LenNeg1'
-        self.unit_PerMtr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_PerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_PerSec'] = self.unit_PerSec
-        self.unit_PerSec_short_name = ET.SubElement(self.unit_PerSec, 'SHORT-NAME')
-        self.variables['unit_PerSec_short_name'] = self.unit_PerSec_short_name
-        self.unit_PerSec_short_name.text = 'PerSec'
-        self.unit_PerSec_long_name = ET.SubElement(self.unit_PerSec, 'LONG-NAME')
-        self.variables['unit_PerSec_long_name'] = self.unit_PerSec_long_name
-        self.unit_PerSec_l_4 = ET.SubElement(self.unit_PerSec_long_name, 'L-4')
-        self.variables['unit_PerSec_l_4'] = self.unit_PerSec_l_4
-        self.unit_PerSec_l_4.text = 'Per Second'
-        self.unit_PerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_PerSec_display_name = ET.SubElement(self.unit_PerSec, 'DISPLAY-NAME')
-        self.variables['unit_PerSec_display_name'] = self.unit_PerSec_display_name
-        self.unit_PerSec_display_name.text = '1/s'
-        self.unit_PerSec_factor_si_to_unit = ET.SubElement(self.unit_PerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_PerSec_factor_si_to_unit'] = self.unit_PerSec_factor_si_to_unit
-        self.unit_PerSec_factor_si_to_unit.text = '1'
-        self.unit_PerSec_offset_si_to_unit = ET.SubElement(self.unit_PerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_PerSec_offset_si_to_unit'] = self.unit_PerSec_offset_si_to_unit
-        self.unit_PerSec_offset_si_to_unit.text = '0'
-        self.unit_PerSec_physical_dimension_ref = ET.SubElement(self.unit_PerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_PerSec_physical_dimension_ref'] = self.unit_PerSec_physical_dimension_ref
-        self.unit_PerSec_physical_dimension_ref.text = 'TiNeg1_2'
-        self.unit_PerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_PerSecSqd = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_PerSecSqd'] = self.unit_PerSecSqd
-        self.unit_PerSecSqd_short_name = ET.SubElement(self.unit_PerSecSqd, 'SHORT-NAME')
-        self.variables['unit_PerSecSqd_short_name'] = self.unit_PerSecSqd_short_name
-        self.unit_PerSecSqd_short_name.text = 'PerSecSqd'
-        self.unit_PerSecSqd_long_name = ET.SubElement(self.unit_PerSecSqd, 'LONG-NAME')
-        self.variables['unit_PerSecSqd_long_name'] = self.unit_PerSecSqd_long_name
-        self.unit_PerSecSqd_l_4 = ET.SubElement(self.unit_PerSecSqd_long_name, 'L-4')
-        self.variables['unit_PerSecSqd_l_4'] = self.unit_PerSecSqd_l_4
-        self.unit_PerSecSqd_l_4.text = 'Per Square Second'
-        self.unit_PerSecSqd_l_4.attrib = {'L': 'EN'}
-        self.unit_PerSecSqd_display_name = ET.SubElement(self.unit_PerSecSqd, 'DISPLAY-NAME')
-        self.variables['unit_PerSecSqd_display_name'] = self.unit_PerSecSqd_display_name
-        self.unit_PerSecSqd_display_name.text = '1/(s^2)'
-        self.unit_PerSecSqd_factor_si_to_unit = ET.SubElement(self.unit_PerSecSqd, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_PerSecSqd_factor_si_to_unit'] = self.unit_PerSecSqd_factor_si_to_unit
-        self.unit_PerSecSqd_factor_si_to_unit.text = '1'
-        self.unit_PerSecSqd_offset_si_to_unit = ET.SubElement(self.unit_PerSecSqd, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_PerSecSqd_offset_si_to_unit'] = self.unit_PerSecSqd_offset_si_to_unit
-        self.unit_PerSecSqd_offset_si_to_unit.text = '0'
-        self.unit_PerSecSqd_physical_dimension_ref = ET.SubElement(self.unit_PerSecSqd, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_PerSecSqd_physical_dimension_ref'] = self.unit_PerSecSqd_physical_dimension_ref
-        self.unit_PerSecSqd_physical_dimension_ref.text = 'TiNeg2'
-        self.unit_PerSecSqd_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Perc = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Perc'] = self.unit_Perc
-        self.unit_Perc_short_name = ET.SubElement(self.unit_Perc, 'SHORT-NAME')
-        self.variables['unit_Perc_short_name'] = self.unit_Perc_short_name
-        self.unit_Perc_short_name.text = 'Perc'
-        self.unit_Perc_long_name = ET.SubElement(self.unit_Perc, 'LONG-NAME')
-        self.variables['unit_Perc_long_name'] = self.unit_Perc_long_name
-        self.unit_Perc_l_4 = ET.SubElement(self.unit_Perc_long_name, 'L-4')
-        self.variables['unit_Perc_l_4'] = self.unit_Perc_l_4
-        self.unit_Perc_l_4.text = 'Percent'
-        self.unit_Perc_l_4.attrib = {'L': 'EN'}
-        self.unit_Perc_display_name = ET.SubElement(self.unit_Perc, 'DISPLAY-NAME')
-        self.variables['unit_Perc_display_name'] = self.unit_Perc_display_name
-        self.unit_Perc_display_name.text = '%'
-        self.unit_Perc_factor_si_to_unit = ET.SubElement(self.unit_Perc, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Perc_factor_si_to_unit'] = self.unit_Perc_factor_si_to_unit
-        self.unit_Perc_factor_si_to_unit.text = '100'
-        self.unit_Perc_offset_si_to_unit = ET.SubElement(self.unit_Perc, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Perc_offset_si_to_unit'] = self.unit_Perc_offset_si_to_unit
-        self.unit_Perc_offset_si_to_unit.text = '0'
-        self.unit_Perc_physical_dimension_ref = ET.SubElement(self.unit_Perc, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Perc_physical_dimension_ref'] = self.unit_Perc_physical_dimension_ref
-        self.unit_Perc_physical_dimension_ref.text = 'NoDimension_1'
-        self.unit_Perc_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_PercPerMilliSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_PercPerMilliSec'] = self.unit_PercPerMilliSec
-        self.unit_PercPerMilliSec_short_name = ET.SubElement(self.unit_PercPerMilliSec, 'SHORT-NAME')
-        self.variables['unit_PercPerMilliSec_short_name'] = self.unit_PercPerMilliSec_short_name
-        self.unit_PercPerMilliSec_short_name.text = 'PercPerMilliSec'
-        self.unit_PercPerMilliSec_long_name = ET.SubElement(self.unit_PercPerMilliSec, 'LONG-NAME')
-        self.variables['unit_PercPerMilliSec_long_name'] = self.unit_PercPerMilliSec_long_name
-        self.unit_PercPerMilliSec_l_4 = ET.SubElement(self.unit_PercPerMilliSec_long_name, 'L-4')
-        self.variables['unit_PercPerMilliSec_l_4'] = self.unit_PercPerMilliSec_l_4
-        self.unit_PercPerMilliSec_l_4.text = 'Percent Per Millisecond'
-        self.unit_PercPerMilliSec_l_4.attrib = {'L': 'EN'}
-        self.unit_PercPerMilliSec_display_name = ET.SubElement(self.unit_PercPerMilliSec, 'DISPLAY-NAME')
-        self.variables['unit_PercPerMilliSec_display_name'] = self.unit_PercPerMilliSec_display_name
-        self.unit_PercPerMilliSec_display_name.text = '%/ms'
-        self.unit_PercPerMilliSec_factor_si_to_unit = ET.SubElement(self.unit_PercPerMilliSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_PercPerMilliSec_factor_si_to_unit'] = self.unit_PercPerMilliSec_factor_si_to_unit
-        self.unit_PercPerMilliSec_factor_si_to_unit.text = '0.1'
-        self.unit_PercPerMilliSec_offset_si_to_unit = ET.SubElement(self.unit_PercPerMilliSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_PercPerMilliSec_offset_si_to_unit'] = self.unit_PercPerMilliSec_offset_si_to_unit
-        self.unit_PercPerMilliSec_offset_si_to_unit.text = '0'
-        self.unit_PercPerMilliSec_physical_dimension_ref = ET.SubElement(self.unit_PercPerMilliSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_PercPerMilliSec_physical_dimension_ref'] = self.unit_PercPerMilliSec_physical_dimension_ref
-        self.unit_PercPerMilliSec_physical_dimension_ref.text = 'TiNeg1_1'
-        self.unit_PercPerMilliSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_PercPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_PercPerSec'] = self.unit_PercPerSec
-        self.unit_PercPerSec_short_name = ET.SubElement(self.unit_PercPerSec, 'SHORT-NAME')
-        self.variables['unit_PercPerSec_short_name'] = self.unit_PercPerSec_short_name
-        self.unit_PercPerSec_short_name.text = 'PercPerSec'
-        self.unit_PercPerSec_long_name = ET.SubElement(self.unit_PercPerSec, 'LONG-NAME')
-        self.variables['unit_PercPerSec_long_name'] = self.unit_PercPerSec_long_name
-        self.unit_PercPerSec_l_4 = ET.SubElement(self.unit_PercPerSec_long_name, 'L-4')
-        self.variables['unit_PercPerSec_l_4'] = self.unit_PercPerSec_l_4
-        self.unit_PercPerSec_l_4.text = 'Percent Per Second'
-        self.unit_PercPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_PercPerSec_display_name = ET.SubElement(self.unit_PercPerSec, 'DISPLAY-NAME')
-        self.variables['unit_PercPerSec_display_name'] = self.unit_PercPerSec_display_name
-        self.unit_PercPerSec_display_name.text = '%/s'
-        self.unit_PercPerSec_factor_si_to_unit = ET.SubElement(self.unit_PercPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_PercPerSec_factor_si_to_unit'] = self.unit_PercPerSec_factor_si_to_unit
-        self.unit_PercPerSec_factor_si_to_unit.text = '100'
-        self.unit_PercPerSec_offset_si_to_unit = ET.SubElement(self.unit_PercPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_PercPerSec_offset_si_to_unit'] = self.unit_PercPerSec_offset_si_to_unit
-        self.unit_PercPerSec_offset_si_to_unit.text = '0'
-        self.unit_PercPerSec_physical_dimension_ref = ET.SubElement(self.unit_PercPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_PercPerSec_physical_dimension_ref'] = self.unit_PercPerSec_physical_dimension_ref
-        self.unit_PercPerSec_physical_dimension_ref.text = 'TiNeg1_1'
-        self.unit_PercPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_PicoFrd = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_PicoFrd'] = self.unit_PicoFrd
-        self.unit_PicoFrd_short_name = ET.SubElement(self.unit_PicoFrd, 'SHORT-NAME')
-        self.variables['unit_PicoFrd_short_name'] = self.unit_PicoFrd_short_name
-        self.unit_PicoFrd_short_name.text = 'PicoFrd'
-        self.unit_PicoFrd_long_name = ET.SubElement(self.unit_PicoFrd, 'LONG-NAME')
-        self.variables['unit_PicoFrd_long_name'] = self.unit_PicoFrd_long_name
-        self.unit_PicoFrd_l_4 = ET.SubElement(self.unit_PicoFrd_long_name, 'L-4')
-        self.variables['unit_PicoFrd_l_4'] = self.unit_PicoFrd_l_4
-        self.unit_PicoFrd_l_4.text = 'Picofarad'
-        self.unit_PicoFrd_l_4.attrib = {'L': 'EN'}
-        self.unit_PicoFrd_display_name = ET.SubElement(self.unit_PicoFrd, 'DISPLAY-NAME')
-        self.variables['unit_PicoFrd_display_name'] = self.unit_PicoFrd_display_name
-        self.unit_PicoFrd_display_name.text = 'pF'
-        self.unit_PicoFrd_factor_si_to_unit = ET.SubElement(self.unit_PicoFrd, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_PicoFrd_factor_si_to_unit'] = self.unit_PicoFrd_factor_si_to_unit
-        self.unit_PicoFrd_factor_si_to_unit.text = '1000000000000'
-        self.unit_PicoFrd_offset_si_to_unit = ET.SubElement(self.unit_PicoFrd, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_PicoFrd_offset_si_to_unit'] = self.unit_PicoFrd_offset_si_to_unit
-        self.unit_PicoFrd_offset_si_to_unit.text = '0'
-        self.unit_PicoFrd_physical_dimension_ref = ET.SubElement(self.unit_PicoFrd, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_PicoFrd_physical_dimension_ref'] = self.unit_PicoFrd_physical_dimension_ref
-        self.unit_PicoFrd_physical_dimension_ref.text = 'LenNeg2MNeg1Ti4I2'
-        self.unit_PicoFrd_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_PicoSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_PicoSec'] = self.unit_PicoSec
-        self.unit_PicoSec_short_name = ET.SubElement(self.unit_PicoSec, 'SHORT-NAME')
-        self.variables['unit_PicoSec_short_name'] = self.unit_PicoSec_short_name
-        self.unit_PicoSec_short_name.text = 'PicoSec'
-        self.unit_PicoSec_long_name = ET.SubElement(self.unit_PicoSec, 'LONG-NAME')
-        self.variables['unit_PicoSec_long_name'] = self.unit_PicoSec_long_name
-        self.unit_PicoSec_l_4 = ET.SubElement(self.unit_PicoSec_long_name, 'L-4')
-        self.variables['unit_PicoSec_l_4'] = self.unit_PicoSec_l_4
-        self.unit_PicoSec_l_4.text = 'Picosecond'
-        self.unit_PicoSec_l_4.attrib = {'L': 'EN'}
-        self.unit_PicoSec_display_name = ET.SubElement(self.unit_PicoSec, 'DISPLAY-NAME')
-        self.variables['unit_PicoSec_display_name'] = self.unit_PicoSec_display_name
-        self.unit_PicoSec_display_name.text = 'ps'
-        self.unit_PicoSec_factor_si_to_unit = ET.SubElement(self.unit_PicoSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_PicoSec_factor_si_to_unit'] = self.unit_PicoSec_factor_si_to_unit
-        self.unit_PicoSec_factor_si_to_unit.text = '1000000000000'
-        self.unit_PicoSec_offset_si_to_unit = ET.SubElement(self.unit_PicoSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_PicoSec_offset_si_to_unit'] = self.unit_PicoSec_offset_si_to_unit
-        self.unit_PicoSec_offset_si_to_unit.text = '0'
-        self.unit_PicoSec_physical_dimension_ref = ET.SubElement(self.unit_PicoSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_PicoSec_physical_dimension_ref'] = self.unit_PicoSec_physical_dimension_ref
-        self.unit_PicoSec_physical_dimension_ref.text = 'Ti1'
-        self.unit_PicoSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Ppm = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Ppm'] = self.unit_Ppm
-        self.unit_Ppm_short_name = ET.SubElement(self.unit_Ppm, 'SHORT-NAME')
-        self.variables['unit_Ppm_short_name'] = self.unit_Ppm_short_name
-        self.unit_Ppm_short_name.text = 'Ppm'
-        self.unit_Ppm_long_name = ET.SubElement(self.unit_Ppm, 'LONG-NAME')
-        self.variables['unit_Ppm_long_name'] = self.unit_Ppm_long_name
-        self.unit_Ppm_l_4 = ET.SubElement(self.unit_Ppm_long_name, 'L-4')
-        self.variables['unit_Ppm_l_4'] = self.unit_Ppm_l_4
-        self.unit_Ppm_l_4.text = 'Parts Per Million'
-        self.unit_Ppm_l_4.attrib = {'L': 'EN'}
-        self.unit_Ppm_display_name = ET.SubElement(self.unit_Ppm, 'DISPLAY-NAME')
-        self.variables['unit_Ppm_display_name'] = self.unit_Ppm_display_name
-        self.unit_Ppm_display_name.text = 'ppm'
-        self.unit_Ppm_factor_si_to_unit = ET.SubElement(self.unit_Ppm, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Ppm_factor_si_to_unit'] = self.unit_Ppm_factor_si_to_unit
-        self.unit_Ppm_factor_si_to_unit.text = '1000000'
-        self.unit_Ppm_offset_si_to_unit = ET.SubElement(self.unit_Ppm, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Ppm_offset_si_to_unit'] = self.unit_Ppm_offset_si_to_unit
-        self.unit_Ppm_offset_si_to_unit.text = '0'
-        self.unit_Ppm_physical_dimension_ref = ET.SubElement(self.unit_Ppm, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Ppm_physical_dimension_ref'] = self.unit_Ppm_physical_dimension_ref
-        self.unit_Ppm_physical_dimension_ref.text = 'NoDimension_1'
-        self.unit_Ppm_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Rad = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Rad'] = self.unit_Rad
-        self.unit_Rad_short_name = ET.SubElement(self.unit_Rad, 'SHORT-NAME')
-        self.variables['unit_Rad_short_name'] = self.unit_Rad_short_name
-        self.unit_Rad_short_name.text = 'Rad'
-        self.unit_Rad_long_name = ET.SubElement(self.unit_Rad, 'LONG-NAME')
-        self.variables['unit_Rad_long_name'] = self.unit_Rad_long_name
-        self.unit_Rad_l_4 = ET.SubElement(self.unit_Rad_long_name, 'L-4')
-        self.variables['unit_Rad_l_4'] = self.unit_Rad_l_4
-        self.unit_Rad_l_4.text = 'Radian'
-        self.unit_Rad_l_4.attrib = {'L': 'EN'}
-        self.unit_Rad_display_name = ET.SubElement(self.unit_Rad, 'DISPLAY-NAME')
-        self.variables['unit_Rad_display_name'] = self.unit_Rad_display_name
-        self.unit_Rad_display_name.text = 'rad'
-        self.unit_Rad_factor_si_to_unit = ET.SubElement(self.unit_Rad, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Rad_factor_si_to_unit'] = self.unit_Rad_factor_si_to_unit
-        self.unit_Rad_factor_si_to_unit.text = '6.28318530717958'
-        self.unit_Rad_offset_si_to_unit = ET.SubElement(self.unit_Rad, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Rad_offset_si_to_unit'] = self.unit_Rad_offset_si_to_unit
-        self.unit_Rad_offset_si_to_unit.text = '0'
-        self.unit_Rad_physical_dimension_ref = ET.SubElement(self.unit_Rad, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Rad_physical_dimension_ref'] = self.unit_Rad_physical_dimension_ref
-        self.unit_Rad_physical_dimension_ref.text = 'NoDimension_2'
-        self.unit_Rad_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_RadPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_RadPerSec'] = self.unit_RadPerSec
-        self.unit_RadPerSec_short_name = ET.SubElement(self.unit_RadPerSec, 'SHORT-NAME')
-        self.variables['unit_RadPerSec_short_name'] = self.unit_RadPerSec_short_name
-        self.unit_RadPerSec_short_name.text = 'RadPerSec'
-        self.unit_RadPerSec_long_name = ET.SubElement(self.unit_RadPerSec, 'LONG-NAME')
-        self.variables['unit_RadPerSec_long_name'] = self.unit_RadPerSec_long_name
-        self.unit_RadPerSec_l_4 = ET.SubElement(self.unit_RadPerSec_long_name, 'L-4')
-        self.variables['unit_RadPerSec_l_4'] = self.unit_RadPerSec_l_4
-        self.unit_RadPerSec_l_4.text = 'Radian Per Second'
-        self.unit_RadPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_RadPerSec_display_name = ET.SubElement(self.unit_RadPerSec, 'DISPLAY-NAME')
-        self.variables['unit_RadPerSec_display_name'] = self.unit_RadPerSec_display_name
-        self.unit_RadPerSec_display_name.text = 'rad/s'
-        self.unit_RadPerSec_factor_si_to_unit = ET.SubElement(self.unit_RadPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_RadPerSec_factor_si_to_unit'] = self.unit_RadPerSec_factor_si_to_unit
-        self.unit_RadPerSec_factor_si_to_unit.text = '6.28318530717958'
-        self.unit_RadPerSec_offset_si_to_unit = ET.SubElement(self.unit_RadPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_RadPerSec_offset_si_to_unit'] = self.unit_RadPerSec_offset_si_to_unit
-        self.unit_RadPerSec_offset_si_to_unit.text = '0'
-        self.unit_RadPerSec_physical_dimension_ref = ET.SubElement(self.unit_RadPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_RadPerSec_physical_dimension_ref'] = self.unit_RadPerSec_physical_dimension_ref
-        self.unit_RadPerSec_physical_dimension_ref.text = 'TiNeg1_2'
-        self.unit_RadPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_RadPerSecSqd = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_RadPerSecSqd'] = self.unit_RadPerSecSqd
-        self.unit_RadPerSecSqd_short_name = ET.SubElement(self.unit_RadPerSecSqd, 'SHORT-NAME')
-        self.variables['unit_RadPerSecSqd_short_name'] = self.unit_RadPerSecSqd_short_name
-        self.unit_RadPerSecSqd_short_name.text = 'RadPerSecSqd'
-        self.unit_RadPerSecSqd_long_name = ET.SubElement(self.unit_RadPerSecSqd, 'LONG-NAME')
-        self.variables['unit_RadPerSecSqd_long_name'] = self.unit_RadPerSecSqd_long_name
-        self.unit_RadPerSecSqd_l_4 = ET.SubElement(self.unit_RadPerSecSqd_long_name, 'L-4')
-        self.variables['unit_RadPerSecSqd_l_4'] = self.unit_RadPerSecSqd_l_4
-        self.unit_RadPerSecSqd_l_4.text = 'Radian Per Square Second'
-        self.unit_RadPerSecSqd_l_4.attrib = {'L': 'EN'}
-        self.unit_RadPerSecSqd_display_name = ET.SubElement(self.unit_RadPerSecSqd, 'DISPLAY-NAME')
-        self.variables['unit_RadPerSecSqd_display_name'] = self.unit_RadPerSecSqd_display_name
-        self.unit_RadPerSecSqd_display_name.text = 'rad/(s^2)'
-        self.unit_RadPerSecSqd_factor_si_to_unit = ET.SubElement(self.unit_RadPerSecSqd, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_RadPerSecSqd_factor_si_to_unit'] = self.unit_RadPerSecSqd_factor_si_to_unit
-        self.unit_RadPerSecSqd_factor_si_to_unit.text = '6.28318530717958'
-        self.unit_RadPerSecSqd_offset_si_to_unit = ET.SubElement(self.unit_RadPerSecSqd, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_RadPerSecSqd_offset_si_to_unit'] = self.unit_RadPerSecSqd_offset_si_to_unit
-        self.unit_RadPerSecSqd_offset_si_to_unit.text = '0'
-        self.unit_RadPerSecSqd_physical_dimension_ref = ET.SubElement(self.unit_RadPerSecSqd, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_RadPerSecSqd_physical_dimension_ref'] = self.unit_RadPerSecSqd_physical_dimension_ref
-        self.unit_RadPerSecSqd_physical_dimension_ref.text = 'TiNeg2'
-        self.unit_RadPerSecSqd_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Rpm = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Rpm'] = self.unit_Rpm
-        self.unit_Rpm_short_name = ET.SubElement(self.unit_Rpm, 'SHORT-NAME')
-        self.variables['unit_Rpm_short_name'] = self.unit_Rpm_short_name
-        self.unit_Rpm_short_name.text = 'Rpm'
-        self.unit_Rpm_long_name = ET.SubElement(self.unit_Rpm, 'LONG-NAME')
-        self.variables['unit_Rpm_long_name'] = self.unit_Rpm_long_name
-        self.unit_Rpm_l_4 = ET.SubElement(self.unit_Rpm_long_name, 'L-4')
-        self.variables['unit_Rpm_l_4'] = self.unit_Rpm_l_4
-        self.unit_Rpm_l_4.text = 'Revolutions Per Minute'
-        self.unit_Rpm_l_4.attrib = {'L': 'EN'}
-        self.unit_Rpm_display_name = ET.SubElement(self.unit_Rpm, 'DISPLAY-NAME')
-        self.variables['unit_Rpm_display_name'] = self.unit_Rpm_display_name
-        self.unit_Rpm_display_name.text = 'rpm'
-        self.unit_Rpm_factor_si_to_unit = ET.SubElement(self.unit_Rpm, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Rpm_factor_si_to_unit'] = self.unit_Rpm_factor_si_to_unit
-        self.unit_Rpm_factor_si_to_unit.text = '60'
-        self.unit_Rpm_offset_si_to_unit = ET.SubElement(self.unit_Rpm, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Rpm_offset_si_to_unit'] = self.unit_Rpm_offset_si_to_unit
-        self.unit_Rpm_offset_si_to_unit.text = '0'
-        self.unit_Rpm_physical_dimension_ref = ET.SubElement(self.unit_Rpm, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Rpm_physical_dimension_ref'] = self.unit_Rpm_physical_dimension_ref
-        self.unit_Rpm_physical_dimension_ref.text = 'TiNeg1_2'
-        self.unit_Rpm_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_RpmPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_RpmPerSec'] = self.unit_RpmPerSec
-        self.unit_RpmPerSec_short_name = ET.SubElement(self.unit_RpmPerSec, 'SHORT-NAME')
-        self.variables['unit_RpmPerSec_short_name'] = self.unit_RpmPerSec_short_name
-        self.unit_RpmPerSec_short_name.text = 'RpmPerSec'
-        self.unit_RpmPerSec_long_name = ET.SubElement(self.unit_RpmPerSec, 'LONG-NAME')
-        self.variables['unit_RpmPerSec_long_name'] = self.unit_RpmPerSec_long_name
-        self.unit_RpmPerSec_l_4 = ET.SubElement(self.unit_RpmPerSec_long_name, 'L-4')
-        self.variables['unit_RpmPerSec_l_4'] = self.unit_RpmPerSec_l_4
-        self.unit_RpmPerSec_l_4.text = 'Revolutions Per Minute Per Second'
-        self.unit_RpmPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_RpmPerSec_display_name = ET.SubElement(self.unit_RpmPerSec, 'DISPLAY-NAME')
-        self.variables['unit_RpmPerSec_display_name'] = self.unit_RpmPerSec_display_name
-        self.unit_RpmPerSec_display_name.text = 'rpm/s'
-        self.unit_RpmPerSec_factor_si_to_unit = ET.SubElement(self.unit_RpmPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_RpmPerSec_factor_si_to_unit'] = self.unit_RpmPerSec_factor_si_to_unit
-        self.unit_RpmPerSec_factor_si_to_unit.text = '60'
-        self.unit_RpmPerSec_offset_si_to_unit = ET.SubElement(self.unit_RpmPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_RpmPerSec_offset_si_to_unit'] = self.unit_RpmPerSec_offset_si_to_unit
-        self.unit_RpmPerSec_offset_si_to_unit.text = '0'
-        self.unit_RpmPerSec_physical_dimension_ref = ET.SubElement(self.unit_RpmPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_RpmPerSec_physical_dimension_ref'] = self.unit_RpmPerSec_physical_dimension_ref
-        self.unit_RpmPerSec_physical_dimension_ref.text = 'TiNeg2'
-        self.unit_RpmPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_S = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_S'] = self.unit_S
-        self.unit_S_short_name = ET.SubElement(self.unit_S, 'SHORT-NAME')
-        self.variables['unit_S_short_name'] = self.unit_S_short_name
-        self.unit_S_short_name.text = 'S'
-        self.unit_S_long_name = ET.SubElement(self.unit_S, 'LONG-NAME')
-        self.variables['unit_S_long_name'] = self.unit_S_long_name
-        self.unit_S_l_4 = ET.SubElement(self.unit_S_long_name, 'L-4')
-        self.variables['unit_S_l_4'] = self.unit_S_l_4
-        self.unit_S_l_4.text = 'Siemens'
-        self.unit_S_l_4.attrib = {'L': 'EN'}
-        self.unit_S_display_name = ET.SubElement(self.unit_S, 'DISPLAY-NAME')
-        self.variables['unit_S_display_name'] = self.unit_S_display_name
-        self.unit_S_display_name.text = 'S'
-        self.unit_S_factor_si_to_unit = ET.SubElement(self.unit_S, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_S_factor_si_to_unit'] = self.unit_S_factor_si_to_unit
-        self.unit_S_factor_si_to_unit.text = '1'
-        self.unit_S_offset_si_to_unit = ET.SubElement(self.unit_S, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_S_offset_si_to_unit'] = self.unit_S_offset_si_to_unit
-        self.unit_S_offset_si_to_unit.text = '0'
-        self.unit_S_physical_dimension_ref = ET.SubElement(self.unit_S, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_S_physical_dimension_ref'] = self.unit_S_physical_dimension_ref
-        self.unit_S_physical_dimension_ref.text = 'LenNeg2MNeg1Ti3I2'
-        self.unit_S_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_SPerMtr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_SPerMtr'] = self.unit_SPerMtr
-        self.unit_SPerMtr_short_name = ET.SubElement(self.unit_SPerMtr, 'SHORT-NAME')
-        self.variables['unit_SPerMtr_short_name'] = self.unit_SPerMtr_short_name
-        self.unit_SPerMtr_short_name.text = 'SPerMtr'
-        self.unit_SPerMtr_long_name = ET.SubElement(self.unit_SPerMtr, 'LONG-NAME')
-        self.variables['unit_SPerMtr_long_name'] = self.unit_SPerMtr_long_name
-        self.unit_SPerMtr_l_4 = ET.SubElement(self.unit_SPerMtr_long_name, 'L-4')
-        self.variables['unit_SPerMtr_l_4'] = self.unit_SPerMtr_l_4
-        self.unit_SPerMtr_l_4.text = 'Siemens Per Meter'
-        self.unit_SPerMtr_l_4.attrib = {'L': 'EN'}
-        self.unit_SPerMtr_display_name = ET.SubElement(self.unit_SPerMtr, 'DISPLAY-NAME')
-        self.variables['unit_SPerMtr_display_name'] = self.unit_SPerMtr_display_name
-        self.unit_SPerMtr_display_name.text = 'S/m'
-        self.unit_SPerMtr_factor_si_to_unit = ET.SubElement(self.unit_SPerMtr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_SPerMtr_factor_si_to_unit'] = self.unit_SPerMtr_factor_si_to_unit
-        self.unit_SPerMtr_factor_si_to_unit.text = '1'
-        self.unit_SPerMtr_offset_si_to_unit = ET.SubElement(self.unit_SPerMtr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_SPerMtr_offset_si_to_unit'] = self.unit_SPerMtr_offset_si_to_unit
-        self.unit_SPerMtr_offset_si_to_unit.text = '0'
-        self.unit_SPerMtr_physical_dimension_ref = ET.SubElement(self.unit_SPerMtr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_SPerMtr_physical_dimension_ref'] = self.unit_SPerMtr_physical_dimension_ref
-        self.unit_SPerMtr_physical_dimension_ref.text = 'LenNeg3MNeg1Ti3I2'
-        self.unit_SPerMtr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_SPerMtrPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_SPerMtrPerSec'] = self.unit_SPerMtrPerSec
-        self.unit_SPerMtrPerSec_short_name = ET.SubElement(self.unit_SPerMtrPerSec, 'SHORT-NAME')
-        self.variables['unit_SPerMtrPerSec_short_name'] = self.unit_SPerMtrPerSec_short_name
-        self.unit_SPerMtrPerSec_short_name.text = 'SPerMtrPerSec'
-        self.unit_SPerMtrPerSec_long_name = ET.SubElement(self.unit_SPerMtrPerSec, 'LONG-NAME')
-        self.variables['unit_SPerMtrPerSec_long_name'] = self.unit_SPerMtrPerSec_long_name
-        self.unit_SPerMtrPerSec_l_4 = ET.SubElement(self.unit_SPerMtrPerSec_long_name, 'L-4')
-        self.variables['unit_SPerMtrPerSec_l_4'] = self.unit_SPerMtrPerSec_l_4
-        self.unit_SPerMtrPerSec_l_4.text = 'Siemens Per Meter Per Second'
-        self.unit_SPerMtrPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_SPerMtrPerSec_display_name = ET.SubElement(self.unit_SPerMtrPerSec, 'DISPLAY-NAME')
-        self.variables['unit_SPerMtrPerSec_display_name'] = self.unit_SPerMtrPerSec_display_name
-        self.unit_SPerMtrPerSec_display_name.text = 'S/(m*s)'
-        self.unit_SPerMtrPerSec_factor_si_to_unit = ET.SubElement(self.unit_SPerMtrPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_SPerMtrPerSec_factor_si_to_unit'] = self.unit_SPerMtrPerSec_factor_si_to_unit
-        self.unit_SPerMtrPerSec_factor_si_to_unit.text = '1'
-        self.unit_SPerMtrPerSec_offset_si_to_unit = ET.SubElement(self.unit_SPerMtrPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_SPerMtrPerSec_offset_si_to_unit'] = self.unit_SPerMtrPerSec_offset_si_to_unit
-        self.unit_SPerMtrPerSec_offset_si_to_unit.text = '0'
-        self.unit_SPerMtrPerSec_physical_dimension_ref = ET.SubElement(self.unit_SPerMtrPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_SPerMtrPerSec_physical_dimension_ref'] = self.unit_SPerMtrPerSec_physical_dimension_ref
-        self.unit_SPerMtrPerSec_physical_dimension_ref.text = 'LenNeg3MNeg1Ti2I2'
-        self.unit_SPerMtrPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Sec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Sec'] = self.unit_Sec
-        self.unit_Sec_short_name = ET.SubElement(self.unit_Sec, 'SHORT-NAME')
-        self.variables['unit_Sec_short_name'] = self.unit_Sec_short_name
-        self.unit_Sec_short_name.text = 'Sec'
-        self.unit_Sec_long_name = ET.SubElement(self.unit_Sec, 'LONG-NAME')
-        self.variables['unit_Sec_long_name'] = self.unit_Sec_long_name
-        self.unit_Sec_l_4 = ET.SubElement(self.unit_Sec_long_name, 'L-4')
-        self.variables['unit_Sec_l_4'] = self.unit_Sec_l_4
-        self.unit_Sec_l_4.text = 'Second'
-        self.unit_Sec_l_4.attrib = {'L': 'EN'}
-        self.unit_Sec_display_name = ET.SubElement(self.unit_Sec, 'DISPLAY-NAME')
-        self.variables['unit_Sec_display_name'] = self.unit_Sec_display_name
-        self.unit_Sec_display_name.text = 's'
-        self.unit_Sec_factor_si_to_unit = ET.SubElement(self.unit_Sec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Sec_factor_si_to_unit'] = self.unit_Sec_factor_si_to_unit
-        self.unit_Sec_factor_si_to_unit.text = '1'
-        self.unit_Sec_offset_si_to_unit = ET.SubElement(self.unit_Sec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Sec_offset_si_to_unit'] = self.unit_Sec_offset_si_to_unit
-        self.unit_Sec_offset_si_to_unit.text = '0'
-        self.unit_Sec_physical_dimension_ref = ET.SubElement(self.unit_Sec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Sec_physical_dimension_ref'] = self.unit_Sec_physical_dimension_ref
-        self.unit_Sec_physical_dimension_ref.text = 'Ti1'
-        self.unit_Sec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Tesla = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Tesla'] = self.unit_Tesla
-        self.unit_Tesla_short_name = ET.SubElement(self.unit_Tesla, 'SHORT-NAME')
-        self.variables['unit_Tesla_short_name'] = self.unit_Tesla_short_name
-        self.unit_Tesla_short_name.text = 'Tesla'
-        self.unit_Tesla_long_name = ET.SubElement(self.unit_Tesla, 'LONG-NAME')
-        self.variables['unit_Tesla_long_name'] = self.unit_Tesla_long_name
-        self.unit_Tesla_l_4 = ET.SubElement(self.unit_Tesla_long_name, 'L-4')
-        self.variables['unit_Tesla_l_4'] = self.unit_Tesla_l_4
-        self.unit_Tesla_l_4.text = 'Tesla'
-        self.unit_Tesla_l_4.attrib = {'L': 'EN'}
-        self.unit_Tesla_display_name = ET.SubElement(self.unit_Tesla, 'DISPLAY-NAME')
-        self.variables['unit_Tesla_display_name'] = self.unit_Tesla_display_name
-        self.unit_Tesla_display_name.text = 'T'
-        self.unit_Tesla_factor_si_to_unit = ET.SubElement(self.unit_Tesla, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Tesla_factor_si_to_unit'] = self.unit_Tesla_factor_si_to_unit
-        self.unit_Tesla_factor_si_to_unit.text = '1'
-        self.unit_Tesla_offset_si_to_unit = ET.SubElement(self.unit_Tesla, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Tesla_offset_si_to_unit'] = self.unit_Tesla_offset_si_to_unit
-        self.unit_Tesla_offset_si_to_unit.text = '0'
-        self.unit_Tesla_physical_dimension_ref = ET.SubElement(self.unit_Tesla, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Tesla_physical_dimension_ref'] = self.unit_Tesla_physical_dimension_ref
-        self.unit_Tesla_physical_dimension_ref.text = 'M1TiNeg2INeg1'
-        self.unit_Tesla_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Tonne = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Tonne'] = self.unit_Tonne
-        self.unit_Tonne_short_name = ET.SubElement(self.unit_Tonne, 'SHORT-NAME')
-        self.variables['unit_Tonne_short_name'] = self.unit_Tonne_short_name
-        self.unit_Tonne_short_name.text = 'Tonne'
-        self.unit_Tonne_long_name = ET.SubElement(self.unit_Tonne, 'LONG-NAME')
-        self.variables['unit_Tonne_long_name'] = self.unit_Tonne_long_name
-        self.unit_Tonne_l_4 = ET.SubElement(self.unit_Tonne_long_name, 'L-4')
-        self.variables['unit_Tonne_l_4'] = self.unit_Tonne_l_4
-        self.unit_Tonne_l_4.text = 'Tonne'
-        self.unit_Tonne_l_4.attrib = {'L': 'EN'}
-        self.unit_Tonne_display_name = ET.SubElement(self.unit_Tonne, 'DISPLAY-NAME')
-        self.variables['unit_Tonne_display_name'] = self.unit_Tonne_display_name
-        self.unit_Tonne_display_name.text = 't'
-        self.unit_Tonne_factor_si_to_unit = ET.SubElement(self.unit_Tonne, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Tonne_factor_si_to_unit'] = self.unit_Tonne_factor_si_to_unit
-        self.unit_Tonne_factor_si_to_unit.text = '0.001'
-        self.unit_Tonne_offset_si_to_unit = ET.SubElement(self.unit_Tonne, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Tonne_offset_si_to_unit'] = self.unit_Tonne_offset_si_to_unit
-        self.unit_Tonne_offset_si_to_unit.text = '0'
-        self.unit_Tonne_physical_dimension_ref = ET.SubElement(self.unit_Tonne, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Tonne_physical_dimension_ref'] = self.unit_Tonne_physical_dimension_ref
-        self.unit_Tonne_physical_dimension_ref.text = 'M1'
-        self.unit_Tonne_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Volt = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Volt'] = self.unit_Volt
-        self.unit_Volt_short_name = ET.SubElement(self.unit_Volt, 'SHORT-NAME')
-        self.variables['unit_Volt_short_name'] = self.unit_Volt_short_name
-        self.unit_Volt_short_name.text = 'Volt'
-        self.unit_Volt_long_name = ET.SubElement(self.unit_Volt, 'LONG-NAME')
-        self.variables['unit_Volt_long_name'] = self.unit_Volt_long_name
-        self.unit_Volt_l_4 = ET.SubElement(self.unit_Volt_long_name, 'L-4')
-        self.variables['unit_Volt_l_4'] = self.unit_Volt_l_4
-        self.unit_Volt_l_4.text = 'Volt'
-        self.unit_Volt_l_4.attrib = {'L': 'EN'}
-        self.unit_Volt_display_name = ET.SubElement(self.unit_Volt, 'DISPLAY-NAME')
-        self.variables['unit_Volt_display_name'] = self.unit_Volt_display_name
-        self.unit_Volt_display_name.text = 'V'
-        self.unit_Volt_factor_si_to_unit = ET.SubElement(self.unit_Volt, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Volt_factor_si_to_unit'] = self.unit_Volt_factor_si_to_unit
-        self.unit_Volt_factor_si_to_unit.text = '1'
-        self.unit_Volt_offset_si_to_unit = ET.SubElement(self.unit_Volt, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Volt_offset_si_to_unit'] = self.unit_Volt_offset_si_to_unit
-        self.unit_Volt_offset_si_to_unit.text = '0'
-        self.unit_Volt_physical_dimension_ref = ET.SubElement(self.unit_Volt, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Volt_physical_dimension_ref'] = self.unit_Volt_physical_dimension_ref
-        self.unit_Volt_physical_dimension_ref.text = 'Len2M1TiNeg3INeg1'
-        self.unit_Volt_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_VoltPerMilliSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_VoltPerMilliSec'] = self.unit_VoltPerMilliSec
-        self.unit_VoltPerMilliSec_short_name = ET.SubElement(self.unit_VoltPerMilliSec, 'SHORT-NAME')
-        self.variables['unit_VoltPerMilliSec_short_name'] = self.unit_VoltPerMilliSec_short_name
-        self.unit_VoltPerMilliSec_short_name.text = 'VoltPerMilliSec'
-        self.unit_VoltPerMilliSec_long_name = ET.SubElement(self.unit_VoltPerMilliSec, 'LONG-NAME')
-        self.variables['unit_VoltPerMilliSec_long_name'] = self.unit_VoltPerMilliSec_long_name
-        self.unit_VoltPerMilliSec_l_4 = ET.SubElement(self.unit_VoltPerMilliSec_long_name, 'L-4')
-        self.variables['unit_VoltPerMilliSec_l_4'] = self.unit_VoltPerMilliSec_l_4
-        self.unit_VoltPerMilliSec_l_4.text = 'Volt Per Millisecond'
-        self.unit_VoltPerMilliSec_l_4.attrib = {'L': 'EN'}
-        self.unit_VoltPerMilliSec_display_name = ET.SubElement(self.unit_VoltPerMilliSec, 'DISPLAY-NAME')
-        self.variables['unit_VoltPerMilliSec_display_name'] = self.unit_VoltPerMilliSec_display_name
-        self.unit_VoltPerMilliSec_display_name.text = 'V/ms'
-        self.unit_VoltPerMilliSec_factor_si_to_unit = ET.SubElement(self.unit_VoltPerMilliSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_VoltPerMilliSec_factor_si_to_unit'] = self.unit_VoltPerMilliSec_factor_si_to_unit
-        self.unit_VoltPerMilliSec_factor_si_to_unit.text = '0.001'
-        self.unit_VoltPerMilliSec_offset_si_to_unit = ET.SubElement(self.unit_VoltPerMilliSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_VoltPerMilliSec_offset_si_to_unit'] = self.unit_VoltPerMilliSec_offset_si_to_unit
-        self.unit_VoltPerMilliSec_offset_si_to_unit.text = '0'
-        self.unit_VoltPerMilliSec_physical_dimension_ref = ET.SubElement(self.unit_VoltPerMilliSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_VoltPerMilliSec_physical_dimension_ref'] = self.unit_VoltPerMilliSec_physical_dimension_ref
-        self.unit_VoltPerMilliSec_physical_dimension_ref.text = 'Len2M1TiNeg4INeg1'
-        self.unit_VoltPerMilliSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_VoltPerMtr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_VoltPerMtr'] = self.unit_VoltPerMtr
-        self.unit_VoltPerMtr_short_name = ET.SubElement(self.unit_VoltPerMtr, 'SHORT-NAME')
-        self.variables['unit_VoltPerMtr_short_name'] = self.unit_VoltPerMtr_short_name
-        self.unit_VoltPerMtr_short_name.text = 'VoltPerMtr'
-        self.unit_VoltPerMtr_long_name = ET.SubElement(self.unit_VoltPerMtr, 'LONG-NAME')
-        self.variables['unit_VoltPerMtr_long_name'] = self.unit_VoltPerMtr_long_name
-        self.unit_VoltPerMtr_l_4 = ET.SubElement(self.unit_VoltPerMtr_long_name, 'L-4')
-        self.variables['unit_VoltPerMtr_l_4'] = self.unit_VoltPerMtr_l_4
-        self.unit_VoltPerMtr_l_4.text = 'Volt Per Meter'
-        self.unit_VoltPerMtr_l_4.attrib = {'L': 'EN'}
-        self.unit_VoltPerMtr_display_name = ET.SubElement(self.unit_VoltPerMtr, 'DISPLAY-NAME')
-        self.variables['unit_VoltPerMtr_display_name'] = self.unit_VoltPerMtr_display_name
-        self.unit_VoltPerMtr_display_name.text = 'V/m'
-        self.unit_VoltPerMtr_factor_si_to_unit = ET.SubElement(self.unit_VoltPerMtr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_VoltPerMtr_factor_si_to_unit'] = self.unit_VoltPerMtr_factor_si_to_unit
-        self.unit_VoltPerMtr_factor_si_to_unit.text = '1'
-        self.unit_VoltPerMtr_offset_si_to_unit = ET.SubElement(self.unit_VoltPerMtr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_VoltPerMtr_offset_si_to_unit'] = self.unit_VoltPerMtr_offset_si_to_unit
-        self.unit_VoltPerMtr_offset_si_to_unit.text = '0'
-        self.unit_VoltPerMtr_physical_dimension_ref = ET.SubElement(self.unit_VoltPerMtr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_VoltPerMtr_physical_dimension_ref'] = self.unit_VoltPerMtr_physical_dimension_ref
-        self.unit_VoltPerMtr_physical_dimension_ref.text = 'Len1M1TiNeg3INeg1'
-        self.unit_VoltPerMtr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_VoltPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_VoltPerSec'] = self.unit_VoltPerSec
-        self.unit_VoltPerSec_short_name = ET.SubElement(self.unit_VoltPerSec, 'SHORT-NAME')
-        self.variables['unit_VoltPerSec_short_name'] = self.unit_VoltPerSec_short_name
-        self.unit_VoltPerSec_short_name.text = 'VoltPerSec'
-        self.unit_VoltPerSec_long_name = ET.SubElement(self.unit_VoltPerSec, 'LONG-NAME')
-        self.variables['unit_VoltPerSec_long_name'] = self.unit_VoltPerSec_long_name
-        self.unit_VoltPerSec_l_4 = ET.SubElement(self.unit_VoltPerSec_long_name, 'L-4')
-        self.variables['unit_VoltPerSec_l_4'] = self.unit_VoltPerSec_l_4
-        self.unit_VoltPerSec_l_4.text = 'Volt Per Second'
-        self.unit_VoltPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_VoltPerSec_display_name = ET.SubElement(self.unit_VoltPerSec, 'DISPLAY-NAME')
-        self.variables['unit_VoltPerSec_display_name'] = self.unit_VoltPerSec_display_name
-        self.unit_VoltPerSec_display_name.text = 'V/s'
-        self.unit_VoltPerSec_factor_si_to_unit = ET.SubElement(self.unit_VoltPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_VoltPerSec_factor_si_to_unit'] = self.unit_VoltPerSec_factor_si_to_unit
-        self.unit_VoltPerSec_factor_si_to_unit.text = '1'
-        self.unit_VoltPerSec_offset_si_to_unit = ET.SubElement(self.unit_VoltPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_VoltPerSec_offset_si_to_unit'] = self.unit_VoltPerSec_offset_si_to_unit
-        self.unit_VoltPerSec_offset_si_to_unit.text = '0'
-        self.unit_VoltPerSec_physical_dimension_ref = ET.SubElement(self.unit_VoltPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_VoltPerSec_physical_dimension_ref'] = self.unit_VoltPerSec_physical_dimension_ref
-        self.unit_VoltPerSec_physical_dimension_ref.text = 'Len2M1TiNeg4INeg1'
-        self.unit_VoltPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Watt = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Watt'] = self.unit_Watt
-        self.unit_Watt_short_name = ET.SubElement(self.unit_Watt, 'SHORT-NAME')
-        self.variables['unit_Watt_short_name'] = self.unit_Watt_short_name
-        self.unit_Watt_short_name.text = 'Watt'
-        self.unit_Watt_long_name = ET.SubElement(self.unit_Watt, 'LONG-NAME')
-        self.variables['unit_Watt_long_name'] = self.unit_Watt_long_name
-        self.unit_Watt_l_4 = ET.SubElement(self.unit_Watt_long_name, 'L-4')
-        self.variables['unit_Watt_l_4'] = self.unit_Watt_l_4
-        self.unit_Watt_l_4.text = 'Watt'
-        self.unit_Watt_l_4.attrib = {'L': 'EN'}
-        self.unit_Watt_display_name = ET.SubElement(self.unit_Watt, 'DISPLAY-NAME')
-        self.variables['unit_Watt_display_name'] = self.unit_Watt_display_name
-        self.unit_Watt_display_name.text = 'W'
-        self.unit_Watt_factor_si_to_unit = ET.SubElement(self.unit_Watt, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Watt_factor_si_to_unit'] = self.unit_Watt_factor_si_to_unit
-        self.unit_Watt_factor_si_to_unit.text = '1'
-        self.unit_Watt_offset_si_to_unit = ET.SubElement(self.unit_Watt, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Watt_offset_si_to_unit'] = self.unit_Watt_offset_si_to_unit
-        self.unit_Watt_offset_si_to_unit.text = '0'
-        self.unit_Watt_physical_dimension_ref = ET.SubElement(self.unit_Watt, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Watt_physical_dimension_ref'] = self.unit_Watt_physical_dimension_ref
-        self.unit_Watt_physical_dimension_ref.text = 'Len2M1TiNeg3_1'
-        self.unit_Watt_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_WattPerKelvinPerMtrSqd = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_WattPerKelvinPerMtrSqd'] = self.unit_WattPerKelvinPerMtrSqd
-        self.unit_WattPerKelvinPerMtrSqd_short_name = ET.SubElement(self.unit_WattPerKelvinPerMtrSqd, 'SHORT-NAME')
-        self.variables['unit_WattPerKelvinPerMtrSqd_short_name'] = self.unit_WattPerKelvinPerMtrSqd_short_name
-        self.unit_WattPerKelvinPerMtrSqd_short_name.text = 'WattPerKelvinPerMtrSqd'
-        self.unit_WattPerKelvinPerMtrSqd_long_name = ET.SubElement(self.unit_WattPerKelvinPerMtrSqd, 'LONG-NAME')
-        self.variables['unit_WattPerKelvinPerMtrSqd_long_name'] = self.unit_WattPerKelvinPerMtrSqd_long_name
-        self.unit_WattPerKelvinPerMtrSqd_l_4 = ET.SubElement(self.unit_WattPerKelvinPerMtrSqd_long_name, 'L-4')
-        self.variables['unit_WattPerKelvinPerMtrSqd_l_4'] = self.unit_WattPerKelvinPerMtrSqd_l_4
-        self.unit_WattPerKelvinPerMtrSqd_l_4.text = 'Watt Per Kelvin Per Square Meter'
-        self.unit_WattPerKelvinPerMtrSqd_l_4.attrib = {'L': 'EN'}
-        self.unit_WattPerKelvinPerMtrSqd_display_name = ET.SubElement(self.unit_WattPerKelvinPerMtrSqd, 'DISPLAY-NAME')
-        self.variables['unit_WattPerKelvinPerMtrSqd_display_name'] = self.unit_WattPerKelvinPerMtrSqd_display_name
-        self.unit_WattPerKelvinPerMtrSqd_display_name.text = 'W/(K*m^2)'
-        self.unit_WattPerKelvinPerMtrSqd_factor_si_to_unit = ET.SubElement(self.unit_WattPerKelvinPerMtrSqd, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_WattPerKelvinPerMtrSqd_factor_si_to_unit'] = self.unit_WattPerKelvinPerMtrSqd_factor_si_to_unit
-        self.unit_WattPerKelvinPerMtrSqd_factor_si_to_unit.text = '1'
-        self.unit_WattPerKelvinPerMtrSqd_offset_si_to_unit = ET.SubElement(self.unit_WattPerKelvinPerMtrSqd, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_WattPerKelvinPerMtrSqd_offset_si_to_unit'] = self.unit_WattPerKelvinPerMtrSqd_offset_si_to_unit
-        self.unit_WattPerKelvinPerMtrSqd_offset_si_to_unit.text = '0'
-        self.unit_WattPerKelvinPerMtrSqd_physical_dimension_ref = ET.SubElement(self.unit_WattPerKelvinPerMtrSqd, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_WattPerKelvinPerMtrSqd_physical_dimension_ref'] = self.unit_WattPerKelvinPerMtrSqd_physical_dimension_ref
-        self.unit_WattPerKelvinPerMtrSqd_physical_dimension_ref.text = 'M1TiNeg3TNeg1'
-        self.unit_WattPerKelvinPerMtrSqd_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_WattPerMtrPerKelvin = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_WattPerMtrPerKelvin'] = self.unit_WattPerMtrPerKelvin
-        self.unit_WattPerMtrPerKelvin_short_name = ET.SubElement(self.unit_WattPerMtrPerKelvin, 'SHORT-NAME')
-        self.variables['unit_WattPerMtrPerKelvin_short_name'] = self.unit_WattPerMtrPerKelvin_short_name
-        self.unit_WattPerMtrPerKelvin_short_name.text = 'WattPerMtrPerKelvin'
-        self.unit_WattPerMtrPerKelvin_long_name = ET.SubElement(self.unit_WattPerMtrPerKelvin, 'LONG-NAME')
-        self.variables['unit_WattPerMtrPerKelvin_long_name'] = self.unit_WattPerMtrPerKelvin_long_name
-        self.unit_WattPerMtrPerKelvin_l_4 = ET.SubElement(self.unit_WattPerMtrPerKelvin_long_name, 'L-4')
-        self.variables['unit_WattPerMtrPerKelvin_l_4'] = self.unit_WattPerMtrPerKelvin_l_4
-        self.unit_WattPerMtrPerKelvin_l_4.text = 'Watt Per Meter Per Kelvin'
-        self.unit_WattPerMtrPerKelvin_l_4.attrib = {'L': 'EN'}
-        self.unit_WattPerMtrPerKelvin_display_name = ET.SubElement(self.unit_WattPerMtrPerKelvin, 'DISPLAY-NAME')
-        self.variables['unit_WattPerMtrPerKelvin_display_name'] = self.unit_WattPerMtrPerKelvin_display_name
-        self.unit_WattPerMtrPerKelvin_display_name.text = 'W/(m*K)'
-        self.unit_WattPerMtrPerKelvin_factor_si_to_unit = ET.SubElement(self.unit_WattPerMtrPerKelvin, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_WattPerMtrPerKelvin_factor_si_to_unit'] = self.unit_WattPerMtrPerKelvin_factor_si_to_unit
-        self.unit_WattPerMtrPerKelvin_factor_si_to_unit.text = '1'
-        self.unit_WattPerMtrPerKelvin_offset_si_to_unit = ET.SubElement(self.unit_WattPerMtrPerKelvin, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_WattPerMtrPerKelvin_offset_si_to_unit'] = self.unit_WattPerMtrPerKelvin_offset_si_to_unit
-        self.unit_WattPerMtrPerKelvin_offset_si_to_unit.text = '0'
-        self.unit_WattPerMtrPerKelvin_physical_dimension_ref = ET.SubElement(self.unit_WattPerMtrPerKelvin, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_WattPerMtrPerKelvin_physical_dimension_ref'] = self.unit_WattPerMtrPerKelvin_physical_dimension_ref
-        self.unit_WattPerMtrPerKelvin_physical_dimension_ref.text = 'Len1M1TiNeg3TNeg1'
-        self.unit_WattPerMtrPerKelvin_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_WattPerSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_WattPerSec'] = self.unit_WattPerSec
-        self.unit_WattPerSec_short_name = ET.SubElement(self.unit_WattPerSec, 'SHORT-NAME')
-        self.variables['unit_WattPerSec_short_name'] = self.unit_WattPerSec_short_name
-        self.unit_WattPerSec_short_name.text = 'WattPerSec'
-        self.unit_WattPerSec_long_name = ET.SubElement(self.unit_WattPerSec, 'LONG-NAME')
-        self.variables['unit_WattPerSec_long_name'] = self.unit_WattPerSec_long_name
-        self.unit_WattPerSec_l_4 = ET.SubElement(self.unit_WattPerSec_long_name, 'L-4')
-        self.variables['unit_WattPerSec_l_4'] = self.unit_WattPerSec_l_4
-        self.unit_WattPerSec_l_4.text = 'Watt Per Second'
-        self.unit_WattPerSec_l_4.attrib = {'L': 'EN'}
-        self.unit_WattPerSec_display_name = ET.SubElement(self.unit_WattPerSec, 'DISPLAY-NAME')
-        self.variables['unit_WattPerSec_display_name'] = self.unit_WattPerSec_display_name
-        self.unit_WattPerSec_display_name.text = 'W/s'
-        self.unit_WattPerSec_factor_si_to_unit = ET.SubElement(self.unit_WattPerSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_WattPerSec_factor_si_to_unit'] = self.unit_WattPerSec_factor_si_to_unit
-        self.unit_WattPerSec_factor_si_to_unit.text = '1'
-        self.unit_WattPerSec_offset_si_to_unit = ET.SubElement(self.unit_WattPerSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_WattPerSec_offset_si_to_unit'] = self.unit_WattPerSec_offset_si_to_unit
-        self.unit_WattPerSec_offset_si_to_unit.text = '0'
-        self.unit_WattPerSec_physical_dimension_ref = ET.SubElement(self.unit_WattPerSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_WattPerSec_physical_dimension_ref'] = self.unit_WattPerSec_physical_dimension_ref
-        self.unit_WattPerSec_physical_dimension_ref.text = 'Len2M1TiNeg4'
-        self.unit_WattPerSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_WattSec = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_WattSec'] = self.unit_WattSec
-        self.unit_WattSec_short_name = ET.SubElement(self.unit_WattSec, 'SHORT-NAME')
-        self.variables['unit_WattSec_short_name'] = self.unit_WattSec_short_name
-        self.unit_WattSec_short_name.text = 'WattSec'
-        self.unit_WattSec_long_name = ET.SubElement(self.unit_WattSec, 'LONG-NAME')
-        self.variables['unit_WattSec_long_name'] = self.unit_WattSec_long_name
-        self.unit_WattSec_l_4 = ET.SubElement(self.unit_WattSec_long_name, 'L-4')
-        self.variables['unit_WattSec_l_4'] = self.unit_WattSec_l_4
-        self.unit_WattSec_l_4.text = 'Wattsecond'
-        self.unit_WattSec_l_4.attrib = {'L': 'EN'}
-        self.unit_WattSec_display_name = ET.SubElement(self.unit_WattSec, 'DISPLAY-NAME')
-        self.variables['unit_WattSec_display_name'] = self.unit_WattSec_display_name
-        self.unit_WattSec_display_name.text = 'Ws'
-        self.unit_WattSec_factor_si_to_unit = ET.SubElement(self.unit_WattSec, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_WattSec_factor_si_to_unit'] = self.unit_WattSec_factor_si_to_unit
-        self.unit_WattSec_factor_si_to_unit.text = '1'
-        self.unit_WattSec_offset_si_to_unit = ET.SubElement(self.unit_WattSec, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_WattSec_offset_si_to_unit'] = self.unit_WattSec_offset_si_to_unit
-        self.unit_WattSec_offset_si_to_unit.text = '0'
-        self.unit_WattSec_physical_dimension_ref = ET.SubElement(self.unit_WattSec, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_WattSec_physical_dimension_ref'] = self.unit_WattSec_physical_dimension_ref
-        self.unit_WattSec_physical_dimension_ref.text = 'Len2M1TiNeg2_1'
-        self.unit_WattSec_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Wb = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Wb'] = self.unit_Wb
-        self.unit_Wb_short_name = ET.SubElement(self.unit_Wb, 'SHORT-NAME')
-        self.variables['unit_Wb_short_name'] = self.unit_Wb_short_name
-        self.unit_Wb_short_name.text = 'Wb'
-        self.unit_Wb_long_name = ET.SubElement(self.unit_Wb, 'LONG-NAME')
-        self.variables['unit_Wb_long_name'] = self.unit_Wb_long_name
-        self.unit_Wb_l_4 = ET.SubElement(self.unit_Wb_long_name, 'L-4')
-        self.variables['unit_Wb_l_4'] = self.unit_Wb_l_4
-        self.unit_Wb_l_4.text = 'Weber'
-        self.unit_Wb_l_4.attrib = {'L': 'EN'}
-        self.unit_Wb_display_name = ET.SubElement(self.unit_Wb, 'DISPLAY-NAME')
-        self.variables['unit_Wb_display_name'] = self.unit_Wb_display_name
-        self.unit_Wb_display_name.text = 'Wb'
-        self.unit_Wb_factor_si_to_unit = ET.SubElement(self.unit_Wb, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Wb_factor_si_to_unit'] = self.unit_Wb_factor_si_to_unit
-        self.unit_Wb_factor_si_to_unit.text = '1'
-        self.unit_Wb_offset_si_to_unit = ET.SubElement(self.unit_Wb, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Wb_offset_si_to_unit'] = self.unit_Wb_offset_si_to_unit
-        self.unit_Wb_offset_si_to_unit.text = '0'
-        self.unit_Wb_physical_dimension_ref = ET.SubElement(self.unit_Wb, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Wb_physical_dimension_ref'] = self.unit_Wb_physical_dimension_ref
-        self.unit_Wb_physical_dimension_ref.text = 'Len2M1TiNeg2INeg1'
-        self.unit_Wb_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.unit_Yr = ET.SubElement(self.Units_folder_elements, 'UNIT')
-        self.variables['unit_Yr'] = self.unit_Yr
-        self.unit_Yr_short_name = ET.SubElement(self.unit_Yr, 'SHORT-NAME')
-        self.variables['unit_Yr_short_name'] = self.unit_Yr_short_name
-        self.unit_Yr_short_name.text = 'Yr'
-        self.unit_Yr_long_name = ET.SubElement(self.unit_Yr, 'LONG-NAME')
-        self.variables['unit_Yr_long_name'] = self.unit_Yr_long_name
-        self.unit_Yr_l_4 = ET.SubElement(self.unit_Yr_long_name, 'L-4')
-        self.variables['unit_Yr_l_4'] = self.unit_Yr_l_4
-        self.unit_Yr_l_4.text = 'Year'
-        self.unit_Yr_l_4.attrib = {'L': 'EN'}
-        self.unit_Yr_display_name = ET.SubElement(self.unit_Yr, 'DISPLAY-NAME')
-        self.variables['unit_Yr_display_name'] = self.unit_Yr_display_name
-        self.unit_Yr_display_name.text = 'a'
-        self.unit_Yr_factor_si_to_unit = ET.SubElement(self.unit_Yr, 'FACTOR-SI-TO-UNIT')
-        self.variables['unit_Yr_factor_si_to_unit'] = self.unit_Yr_factor_si_to_unit
-        self.unit_Yr_factor_si_to_unit.text = '3.16880878140289E-08'
-        self.unit_Yr_offset_si_to_unit = ET.SubElement(self.unit_Yr, 'OFFSET-SI-TO-UNIT')
-        self.variables['unit_Yr_offset_si_to_unit'] = self.unit_Yr_offset_si_to_unit
-        self.unit_Yr_offset_si_to_unit.text = '0'
-        self.unit_Yr_physical_dimension_ref = ET.SubElement(self.unit_Yr, 'PHYSICAL-DIMENSION-REF')
-        self.variables['unit_Yr_physical_dimension_ref'] = self.unit_Yr_physical_dimension_ref
-        self.unit_Yr_physical_dimension_ref.text = 'Ti1'
-        self.unit_Yr_physical_dimension_ref.attrib = {'DEST': 'PHYSICAL-DIMENSION', 'BASE': 'PhysicalDimensions'}
-        
-        self.AUTOSAR_Platform_folder = ET.SubElement(self.autosar_subfolders, 'AR-PACKAGE')
-        self.variables['AUTOSAR_Platform_folder'] = self.AUTOSAR_Platform_folder
-        self.AUTOSAR_Platform_folder_short_name = ET.SubElement(self.AUTOSAR_Platform_folder, 'SHORT-NAME')
-        self.variables['AUTOSAR_Platform_folder_short_name'] = self.AUTOSAR_Platform_folder_short_name
-        self.AUTOSAR_Platform_folder_short_name.text = 'AUTOSAR_Platform'
-        self.AUTOSAR_Platform_subfolder = ET.SubElement(self.AUTOSAR_Platform_folder, 'AR-PACKAGES')
-        self.variables['AUTOSAR_Platform_subfolder'] = self.AUTOSAR_Platform_subfolder
-
-        self.BaseTypes_pltform_folder = ET.SubElement(self.AUTOSAR_Platform_subfolder, 'AR-PACKAGE')
-        self.variables['BaseTypes_pltform_folder'] = self.BaseTypes_pltform_folder
-        self.BaseTypes_pltform_folder_short_name = ET.SubElement(self.BaseTypes_pltform_folder, 'SHORT-NAME')
-        self.variables['BaseTypes_pltform_folder_short_name'] = self.BaseTypes_pltform_folder_short_name
-        self.BaseTypes_pltform_folder_short_name.text = 'BaseTypes'
-        self.BaseTypes_pltform_folder_short_name_category = ET.SubElement(self.BaseTypes_pltform_folder, 'CATEGORY')
-        self.variables['BaseTypes_pltform_folder_short_name_category'] = self.BaseTypes_pltform_folder_short_name_category
-        self.BaseTypes_pltform_folder_short_name_category.text = 'STANDARD'
-        self.BaseTypes_pltform_folder_elements = ET.SubElement(self.BaseTypes_pltform_folder, 'ELEMENTS')
-
-
-        self.sw_base_type_boolean = ET.SubElement(self.BaseTypes_pltform_folder_elements, 'SW-BASE-TYPE')
-        self.variables['sw_base_type_boolean'] = self.sw_base_type_boolean
-        self.sw_base_type_boolean_short_name = ET.SubElement(self.sw_base_type_boolean, 'SHORT-NAME')
-        self.variables['sw_base_type_boolean_short_name'] = self.sw_base_type_boolean_short_name
-        self.sw_base_type_boolean_short_name.text = 'boolean'
-        self.sw_base_type_boolean_long_name = ET.SubElement(self.sw_base_type_boolean, 'LONG-NAME')
-        self.variables['sw_base_type_boolean_long_name'] = self.sw_base_type_boolean_long_name
-        self.sw_base_type_boolean_l_4 = ET.SubElement(self.sw_base_type_boolean_long_name, 'L-4')
-        self.variables['sw_base_type_boolean_l_4'] = self.sw_base_type_boolean_l_4
-        self.sw_base_type_boolean_l_4.text = 'boolean'
-        self.sw_base_type_boolean_l_4.attrib = {'L': 'EN'}
-        self.sw_base_type_boolean_category = ET.SubElement(self.sw_base_type_boolean, 'CATEGORY')
-        self.variables['sw_base_type_boolean_category'] = self.sw_base_type_boolean_category
-        self.sw_base_type_boolean_category.text = 'FIXED_LENGTH'
-        self.sw_base_type_boolean_base_type_size = ET.SubElement(self.sw_base_type_boolean, 'BASE-TYPE-SIZE')
-        self.variables['sw_base_type_boolean_base_type_size'] = self.sw_base_type_boolean_base_type_size
-        self.sw_base_type_boolean_base_type_size.text = '8'
-        self.sw_base_type_boolean_base_type_encoding = ET.SubElement(self.sw_base_type_boolean, 'BASE-TYPE-ENCODING')
-        self.variables['sw_base_type_boolean_base_type_encoding'] = self.sw_base_type_boolean_base_type_encoding
-        self.sw_base_type_boolean_base_type_encoding.text = 'BOOLEAN'
-
-        self.sw_base_type_float32 = ET.SubElement(self.BaseTypes_pltform_folder_elements, 'SW-BASE-TYPE')
-        self.variables['sw_base_type_float32'] = self.sw_base_type_float32
-        self.sw_base_type_float32_short_name = ET.SubElement(self.sw_base_type_float32, 'SHORT-NAME')
-        self.variables['sw_base_type_float32_short_name'] = self.sw_base_type_float32_short_name
-        self.sw_base_type_float32_short_name.text = 'float32'
-        self.sw_base_type_float32_long_name = ET.SubElement(self.sw_base_type_float32, 'LONG-NAME')
-        self.variables['sw_base_type_float32_long_name'] = self.sw_base_type_float32_long_name
-        self.sw_base_type_float32_l_4 = ET.SubElement(self.sw_base_type_float32_long_name, 'L-4')
-        self.variables['sw_base_type_float32_l_4'] = self.sw_base_type_float32_l_4
-        self.sw_base_type_float32_l_4.text = 'float32'
-        self.sw_base_type_float32_l_4.attrib = {'L': 'EN'}
-        self.sw_base_type_float32_category = ET.SubElement(self.sw_base_type_float32, 'CATEGORY')
-        self.variables['sw_base_type_float32_category'] = self.sw_base_type_float32_category
-        self.sw_base_type_float32_category.text = 'FIXED_LENGTH'
-        self.sw_base_type_float32_base_type_size = ET.SubElement(self.sw_base_type_float32, 'BASE-TYPE-SIZE')
-        self.variables['sw_base_type_float32_base_type_size'] = self.sw_base_type_float32_base_type_size
-        self.sw_base_type_float32_base_type_size.text = '32'
-        self.sw_base_type_float32_base_type_encoding = ET.SubElement(self.sw_base_type_float32, 'BASE-TYPE-ENCODING')
-        self.variables['sw_base_type_float32_base_type_encoding'] = self.sw_base_type_float32_base_type_encoding
-        self.sw_base_type_float32_base_type_encoding.text = 'IEEE754'
-
-        self.sw_base_type_float64 = ET.SubElement(self.BaseTypes_pltform_folder_elements, 'SW-BASE-TYPE')
-        self.variables['sw_base_type_float64'] = self.sw_base_type_float64
-        self.sw_base_type_float64_short_name = ET.SubElement(self.sw_base_type_float64, 'SHORT-NAME')
-        self.variables['sw_base_type_float64_short_name'] = self.sw_base_type_float64_short_name
-        self.sw_base_type_float64_short_name.text = 'float64'
-        self.sw_base_type_float64_long_name = ET.SubElement(self.sw_base_type_float64, 'LONG-NAME')
-        self.variables['sw_base_type_float64_long_name'] = self.sw_base_type_float64_long_name
-        self.sw_base_type_float64_l_4 = ET.SubElement(self.sw_base_type_float64_long_name, 'L-4')
-        self.variables['sw_base_type_float64_l_4'] = self.sw_base_type_float64_l_4
-        self.sw_base_type_float64_l_4.text = 'float64'
-        self.sw_base_type_float64_l_4.attrib = {'L': 'EN'}
-        self.sw_base_type_float64_category = ET.SubElement(self.sw_base_type_float64, 'CATEGORY')
-        self.variables['sw_base_type_float64_category'] = self.sw_base_type_float64_category
-        self.sw_base_type_float64_category.text = 'FIXED_LENGTH'
-        self.sw_base_type_float64_base_type_size = ET.SubElement(self.sw_base_type_float64, 'BASE-TYPE-SIZE')
-        self.variables['sw_base_type_float64_base_type_size'] = self.sw_base_type_float64_base_type_size
-        self.sw_base_type_float64_base_type_size.text = '64'
-        self.sw_base_type_float64_base_type_encoding = ET.SubElement(self.sw_base_type_float64, 'BASE-TYPE-ENCODING')
-        self.variables['sw_base_type_float64_base_type_encoding'] = self.sw_base_type_float64_base_type_encoding
-        self.sw_base_type_float64_base_type_encoding.text = 'IEEE754'
-
-        self.sw_base_type_sint16 = ET.SubElement(self.BaseTypes_pltform_folder_elements, 'SW-BASE-TYPE')
-        self.variables['sw_base_type_sint16'] = self.sw_base_type_sint16
-        self.sw_base_type_sint16_short_name = ET.SubElement(self.sw_base_type_sint16, 'SHORT-NAME')
-        self.variables['sw_base_type_sint16_short_name'] = self.sw_base_type_sint16_short_name
-        self.sw_base_type_sint16_short_name.text = 'sint16'
-        self.sw_base_type_sint16_long_name = ET.SubElement(self.sw_base_type_sint16, 'LONG-NAME')
-        self.variables['sw_base_type_sint16_long_name'] = self.sw_base_type_sint16_long_name
-        self.sw_base_type_sint16_l_4 = ET.SubElement(self.sw_base_type_sint16_long_name, 'L-4')
-        self.variables['sw_base_type_sint16_l_4'] = self.sw_base_type_sint16_l_4
-        self.sw_base_type_sint16_l_4.text = 'sint16'
-        self.sw_base_type_sint16_l_4.attrib = {'L': 'EN'}
-        self.sw_base_type_sint16_category = ET.SubElement(self.sw_base_type_sint16, 'CATEGORY')
-        self.variables['sw_base_type_sint16_category'] = self.sw_base_type_sint16_category
-        self.sw_base_type_sint16_category.text = 'FIXED_LENGTH'
-        self.sw_base_type_sint16_base_type_size = ET.SubElement(self.sw_base_type_sint16, 'BASE-TYPE-SIZE')
-        self.variables['sw_base_type_sint16_base_type_size'] = self.sw_base_type_sint16_base_type_size
-        self.sw_base_type_sint16_base_type_size.text = '16'
-        self.sw_base_type_sint16_base_type_encoding = ET.SubElement(self.sw_base_type_sint16, 'BASE-TYPE-ENCODING')
-        self.variables['sw_base_type_sint16_base_type_encoding'] = self.sw_base_type_sint16_base_type_encoding
-        self.sw_base_type_sint16_base_type_encoding.text = '2C'
-
-        self.sw_base_type_sint32 = ET.SubElement(self.BaseTypes_pltform_folder_elements, 'SW-BASE-TYPE')
-        self.variables['sw_base_type_sint32'] = self.sw_base_type_sint32
-        self.sw_base_type_sint32_short_name = ET.SubElement(self.sw_base_type_sint32, 'SHORT-NAME')
-        self.variables['sw_base_type_sint32_short_name'] = self.sw_base_type_sint32_short_name
-        self.sw_base_type_sint32_short_name.text = 'sint32'
-        self.sw_base_type_sint32_long_name = ET.SubElement(self.sw_base_type_sint32, 'LONG-NAME')
-        self.variables['sw_base_type_sint32_long_name'] = self.sw_base_type_sint32_long_name
-        self.sw_base_type_sint32_l_4 = ET.SubElement(self.sw_base_type_sint32_long_name, 'L-4')
-        self.variables['sw_base_type_sint32_l_4'] = self.sw_base_type_sint32_l_4
-        self.sw_base_type_sint32_l_4.text = 'sint32'
-        self.sw_base_type_sint32_l_4.attrib = {'L': 'EN'}
-        self.sw_base_type_sint32_category = ET.SubElement(self.sw_base_type_sint32, 'CATEGORY')
-        self.variables['sw_base_type_sint32_category'] = self.sw_base_type_sint32_category
-        self.sw_base_type_sint32_category.text = 'FIXED_LENGTH'
-        self.sw_base_type_sint32_base_type_size = ET.SubElement(self.sw_base_type_sint32, 'BASE-TYPE-SIZE')
-        self.variables['sw_base_type_sint32_base_type_size'] = self.sw_base_type_sint32_base_type_size
-        self.sw_base_type_sint32_base_type_size.text = '32'
-        self.sw_base_type_sint32_base_type_encoding = ET.SubElement(self.sw_base_type_sint32, 'BASE-TYPE-ENCODING')
-        self.variables['sw_base_type_sint32_base_type_encoding'] = self.sw_base_type_sint32_base_type_encoding
-        self.sw_base_type_sint32_base_type_encoding.text = '2C'
-
-        self.sw_base_type_sint64 = ET.SubElement(self.BaseTypes_pltform_folder_elements, 'SW-BASE-TYPE')
-        self.variables['sw_base_type_sint64'] = self.sw_base_type_sint64
-        self.sw_base_type_sint64_short_name = ET.SubElement(self.sw_base_type_sint64, 'SHORT-NAME')
-        self.variables['sw_base_type_sint64_short_name'] = self.sw_base_type_sint64_short_name
-        self.sw_base_type_sint64_short_name.text = 'sint64'
-        self.sw_base_type_sint64_long_name = ET.SubElement(self.sw_base_type_sint64, 'LONG-NAME')
-        self.variables['sw_base_type_sint64_long_name'] = self.sw_base_type_sint64_long_name
-        self.sw_base_type_sint64_l_4 = ET.SubElement(self.sw_base_type_sint64_long_name, 'L-4')
-        self.variables['sw_base_type_sint64_l_4'] = self.sw_base_type_sint64_l_4
-        self.sw_base_type_sint64_l_4.text = 'sint64'
-        self.sw_base_type_sint64_l_4.attrib = {'L': 'EN'}
-        self.sw_base_type_sint64_category = ET.SubElement(self.sw_base_type_sint64, 'CATEGORY')
-        self.variables['sw_base_type_sint64_category'] = self.sw_base_type_sint64_category
-        self.sw_base_type_sint64_category.text = 'FIXED_LENGTH'
-        self.sw_base_type_sint64_base_type_size = ET.SubElement(self.sw_base_type_sint64, 'BASE-TYPE-SIZE')
-        self.variables['sw_base_type_sint64_base_type_size'] = self.sw_base_type_sint64_base_type_size
-        self.sw_base_type_sint64_base_type_size.text = '64'
-        self.sw_base_type_sint64_base_type_encoding = ET.SubElement(self.sw_base_type_sint64, 'BASE-TYPE-ENCODING')
-        self.variables['sw_base_type_sint64_base_type_encoding'] = self.sw_base_type_sint64_base_type_encoding
-        self.sw_base_type_sint64_base_type_encoding.text = '2C'
-
-        self.sw_base_type_sint8 = ET.SubElement(self.BaseTypes_pltform_folder_elements, 'SW-BASE-TYPE')
-        self.variables['sw_base_type_sint8'] = self.sw_base_type_sint8
-        self.sw_base_type_sint8_short_name = ET.SubElement(self.sw_base_type_sint8, 'SHORT-NAME')
-        self.variables['sw_base_type_sint8_short_name'] = self.sw_base_type_sint8_short_name
-        self.sw_base_type_sint8_short_name.text = 'sint8'
-        self.sw_base_type_sint8_long_name = ET.SubElement(self.sw_base_type_sint8, 'LONG-NAME')
-        self.variables['sw_base_type_sint8_long_name'] = self.sw_base_type_sint8_long_name
-        self.sw_base_type_sint8_l_4 = ET.SubElement(self.sw_base_type_sint8_long_name, 'L-4')
-        self.variables['sw_base_type_sint8_l_4'] = self.sw_base_type_sint8_l_4
-        self.sw_base_type_sint8_l_4.text = 'sint8'
-        self.sw_base_type_sint8_l_4.attrib = {'L': 'EN'}
-        self.sw_base_type_sint8_category = ET.SubElement(self.sw_base_type_sint8, 'CATEGORY')
-        self.variables['sw_base_type_sint8_category'] = self.sw_base_type_sint8_category
-        self.sw_base_type_sint8_category.text = 'FIXED_LENGTH'
-        self.sw_base_type_sint8_base_type_size = ET.SubElement(self.sw_base_type_sint8, 'BASE-TYPE-SIZE')
-        self.variables['sw_base_type_sint8_base_type_size'] = self.sw_base_type_sint8_base_type_size
-        self.sw_base_type_sint8_base_type_size.text = '8'
-        self.sw_base_type_sint8_base_type_encoding = ET.SubElement(self.sw_base_type_sint8, 'BASE-TYPE-ENCODING')
-        self.variables['sw_base_type_sint8_base_type_encoding'] = self.sw_base_type_sint8_base_type_encoding
-        self.sw_base_type_sint8_base_type_encoding.text = '2C'
-
-        self.sw_base_type_uint16 = ET.SubElement(self.BaseTypes_pltform_folder_elements, 'SW-BASE-TYPE')
-        self.variables['sw_base_type_uint16'] = self.sw_base_type_uint16
-        self.sw_base_type_uint16_short_name = ET.SubElement(self.sw_base_type_uint16, 'SHORT-NAME')
-        self.variables['sw_base_type_uint16_short_name'] = self.sw_base_type_uint16_short_name
-        self.sw_base_type_uint16_short_name.text = 'uint16'
-        self.sw_base_type_uint16_long_name = ET.SubElement(self.sw_base_type_uint16, 'LONG-NAME')
-        self.variables['sw_base_type_uint16_long_name'] = self.sw_base_type_uint16_long_name
-        self.sw_base_type_uint16_l_4 = ET.SubElement(self.sw_base_type_uint16_long_name, 'L-4')
-        self.variables['sw_base_type_uint16_l_4'] = self.sw_base_type_uint16_l_4
-        self.sw_base_type_uint16_l_4.text = 'uint16'
-        self.sw_base_type_uint16_l_4.attrib = {'L': 'EN'}
-        self.sw_base_type_uint16_category = ET.SubElement(self.sw_base_type_uint16, 'CATEGORY')
-        self.variables['sw_base_type_uint16_category'] = self.sw_base_type_uint16_category
-        self.sw_base_type_uint16_category.text = 'FIXED_LENGTH'
-        self.sw_base_type_uint16_base_type_size = ET.SubElement(self.sw_base_type_uint16, 'BASE-TYPE-SIZE')
-        self.variables['sw_base_type_uint16_base_type_size'] = self.sw_base_type_uint16_base_type_size
-        self.sw_base_type_uint16_base_type_size.text = '16'
-        self.sw_base_type_uint16_base_type_encoding = ET.SubElement(self.sw_base_type_uint16, 'BASE-TYPE-ENCODING')
-        self.variables['sw_base_type_uint16_base_type_encoding'] = self.sw_base_type_uint16_base_type_encoding
-        self.sw_base_type_uint16_base_type_encoding.text = 'NONE'
-
-        self.sw_base_type_uint32 = ET.SubElement(self.BaseTypes_pltform_folder_elements, 'SW-BASE-TYPE')
-        self.variables['sw_base_type_uint32'] = self.sw_base_type_uint32
-        self.sw_base_type_uint32_short_name = ET.SubElement(self.sw_base_type_uint32, 'SHORT-NAME')
-        self.variables['sw_base_type_uint32_short_name'] = self.sw_base_type_uint32_short_name
-        self.sw_base_type_uint32_short_name.text = 'uint32'
-        self.sw_base_type_uint32_long_name = ET.SubElement(self.sw_base_type_uint32, 'LONG-NAME')
-        self.variables['sw_base_type_uint32_long_name'] = self.sw_base_type_uint32_long_name
-        self.sw_base_type_uint32_l_4 = ET.SubElement(self.sw_base_type_uint32_long_name, 'L-4')
-        self.variables['sw_base_type_uint32_l_4'] = self.sw_base_type_uint32_l_4
-        self.sw_base_type_uint32_l_4.text = 'uint32'
-        self.sw_base_type_uint32_l_4.attrib = {'L': 'EN'}
-        self.sw_base_type_uint32_category = ET.SubElement(self.sw_base_type_uint32, 'CATEGORY')
-        self.variables['sw_base_type_uint32_category'] = self.sw_base_type_uint32_category
-        self.sw_base_type_uint32_category.text = 'FIXED_LENGTH'
-        self.sw_base_type_uint32_base_type_size = ET.SubElement(self.sw_base_type_uint32, 'BASE-TYPE-SIZE')
-        self.variables['sw_base_type_uint32_base_type_size'] = self.sw_base_type_uint32_base_type_size
-        self.sw_base_type_uint32_base_type_size.text = '32'
-        self.sw_base_type_uint32_base_type_encoding = ET.SubElement(self.sw_base_type_uint32, 'BASE-TYPE-ENCODING')
-        self.variables['sw_base_type_uint32_base_type_encoding'] = self.sw_base_type_uint32_base_type_encoding
-        self.sw_base_type_uint32_base_type_encoding.text = 'NONE'
-
-        self.sw_base_type_uint64 = ET.SubElement(self.BaseTypes_pltform_folder_elements, 'SW-BASE-TYPE')
-        self.variables['sw_base_type_uint64'] = self.sw_base_type_uint64
-        self.sw_base_type_uint64_short_name = ET.SubElement(self.sw_base_type_uint64, 'SHORT-NAME')
-        self.variables['sw_base_type_uint64_short_name'] = self.sw_base_type_uint64_short_name
-        self.sw_base_type_uint64_short_name.text = 'uint64'
-        self.sw_base_type_uint64_long_name = ET.SubElement(self.sw_base_type_uint64, 'LONG-NAME')
-        self.variables['sw_base_type_uint64_long_name'] = self.sw_base_type_uint64_long_name
-        self.sw_base_type_uint64_l_4 = ET.SubElement(self.sw_base_type_uint64_long_name, 'L-4')
-        self.variables['sw_base_type_uint64_l_4'] = self.sw_base_type_uint64_l_4
-        self.sw_base_type_uint64_l_4.text = 'uint64'
-        self.sw_base_type_uint64_l_4.attrib = {'L': 'EN'}
-        self.sw_base_type_uint64_category = ET.SubElement(self.sw_base_type_uint64, 'CATEGORY')
-        self.variables['sw_base_type_uint64_category'] = self.sw_base_type_uint64_category
-        self.sw_base_type_uint64_category.text = 'FIXED_LENGTH'
-        self.sw_base_type_uint64_base_type_size = ET.SubElement(self.sw_base_type_uint64, 'BASE-TYPE-SIZE')
-        self.variables['sw_base_type_uint64_base_type_size'] = self.sw_base_type_uint64_base_type_size
-        self.sw_base_type_uint64_base_type_size.text = '64'
-        self.sw_base_type_uint64_base_type_encoding = ET.SubElement(self.sw_base_type_uint64, 'BASE-TYPE-ENCODING')
-        self.variables['sw_base_type_uint64_base_type_encoding'] = self.sw_base_type_uint64_base_type_encoding
-        self.sw_base_type_uint64_base_type_encoding.text = 'NONE'
-
-        self.sw_base_type_uint8 = ET.SubElement(self.BaseTypes_pltform_folder_elements, 'SW-BASE-TYPE')
-        self.variables['sw_base_type_uint8'] = self.sw_base_type_uint8
-        self.sw_base_type_uint8_short_name = ET.SubElement(self.sw_base_type_uint8, 'SHORT-NAME')
-        self.variables['sw_base_type_uint8_short_name'] = self.sw_base_type_uint8_short_name
-        self.sw_base_type_uint8_short_name.text = 'uint8'
-        self.sw_base_type_uint8_long_name = ET.SubElement(self.sw_base_type_uint8, 'LONG-NAME')
-        self.variables['sw_base_type_uint8_long_name'] = self.sw_base_type_uint8_long_name
-        self.sw_base_type_uint8_l_4 = ET.SubElement(self.sw_base_type_uint8_long_name, 'L-4')
-        self.variables['sw_base_type_uint8_l_4'] = self.sw_base_type_uint8_l_4
-        self.sw_base_type_uint8_l_4.text = 'uint8'
-        self.sw_base_type_uint8_l_4.attrib = {'L': 'EN'}
-        self.sw_base_type_uint8_category = ET.SubElement(self.sw_base_type_uint8, 'CATEGORY')
-        self.variables['sw_base_type_uint8_category'] = self.sw_base_type_uint8_category
-        self.sw_base_type_uint8_category.text = 'FIXED_LENGTH'
-        self.sw_base_type_uint8_base_type_size = ET.SubElement(self.sw_base_type_uint8, 'BASE-TYPE-SIZE')
-        self.variables['sw_base_type_uint8_base_type_size'] = self.sw_base_type_uint8_base_type_size
-        self.sw_base_type_uint8_base_type_size.text = '8'
-        self.sw_base_type_uint8_base_type_encoding = ET.SubElement(self.sw_base_type_uint8, 'BASE-TYPE-ENCODING')
-        self.variables['sw_base_type_uint8_base_type_encoding'] = self.sw_base_type_uint8_base_type_encoding
-        self.sw_base_type_uint8_base_type_encoding.text = 'NONE'
-
-        self.CompuMethods_folder = ET.SubElement(self.AUTOSAR_Platform_subfolder, 'AR-PACKAGE')
-        self.variables['CompuMethods_folder'] = self.CompuMethods_folder
-        self.CompuMethods_folder_short_name = ET.SubElement(self.CompuMethods_folder, 'SHORT-NAME')
-        self.variables['CompuMethods_folder_short_name'] = self.CompuMethods_folder_short_name
-        self.CompuMethods_folder_short_name.text = 'CompuMethods'
-        self.CompuMethods_folder_category = ET.SubElement(self.CompuMethods_folder, 'CATEGORY')
-        self.variables['CompuMethods_folder_category'] = self.CompuMethods_folder_category
-        self.CompuMethods_folder_category.text = 'STANDARD'
-        
-        self.CompuMethods_folder_elements = ET.SubElement(self.CompuMethods_folder, 'ELEMENTS')
-        self.variables['CompuMethods_folder_elements'] = self.CompuMethods_folder_elements
-
-        self.compu_method_boolean = ET.SubElement(self.CompuMethods_folder_elements, 'COMPU-METHOD')
-        self.variables['compu_method_boolean'] = self.compu_method_boolean
-        self.compu_method_boolean_short_name = ET.SubElement(self.compu_method_boolean, 'SHORT-NAME')
-        self.variables['compu_method_boolean_short_name'] = self.compu_method_boolean_short_name
-        self.compu_method_boolean_short_name.text = 'boolean'
-        self.compu_method_boolean_category = ET.SubElement(self.compu_method_boolean, 'CATEGORY')
-        self.variables['compu_method_boolean_category'] = self.compu_method_boolean_category
-        self.compu_method_boolean_category.text = 'TEXTTABLE'
-        self.compu_method_boolean_compu_internal_to_phys = ET.SubElement(self.compu_method_boolean, 'COMPU-INTERNAL-TO-PHYS')
-        self.variables['compu_method_boolean_compu_internal_to_phys'] = self.compu_method_boolean_compu_internal_to_phys
-        self.compu_method_boolean_compu_scales = ET.SubElement(self.compu_method_boolean_compu_internal_to_phys, 'COMPU-SCALES')
-        self.variables['compu_method_boolean_compu_scales'] = self.compu_method_boolean_compu_scales
-        
-        self.compu_method_boolean_compu_scale1 = ET.SubElement(self.compu_method_boolean_compu_scales, 'COMPU-SCALE')
-        self.variables['compu_method_boolean_compu_scale1'] = self.compu_method_boolean_compu_scale1
-        self.compu_method_boolean_compu_scale1_lower_limit = ET.SubElement(self.compu_method_boolean_compu_scale1, 'LOWER-LIMIT')
-        self.variables['compu_method_boolean_compu_scale1_lower_limit'] = self.compu_method_boolean_compu_scale1_lower_limit
-        self.compu_method_boolean_compu_scale1_lower_limit.text = '0'
-        self.compu_method_boolean_compu_scale1_lower_limit.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.compu_method_boolean_compu_scale1_upper_limit = ET.SubElement(self.compu_method_boolean_compu_scale1, 'UPPER-LIMIT')
-        self.variables['compu_method_boolean_compu_scale1_upper_limit'] = self.compu_method_boolean_compu_scale1_upper_limit
-        self.compu_method_boolean_compu_scale1_upper_limit.text = '0'
-        self.compu_method_boolean_compu_scale1_upper_limit.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.compu_method_boolean_compu_scale1_compu_const = ET.SubElement(self.compu_method_boolean_compu_scale1, 'COMPU-CONST')
-        self.variables['compu_method_boolean_compu_scale1_compu_const'] = self.compu_method_boolean_compu_scale1_compu_const
-        self.compu_method_boolean_compu_scale1_vt = ET.SubElement(self.compu_method_boolean_compu_scale1_compu_const, 'VT')
-        self.variables['compu_method_boolean_compu_scale1_vt'] = self.compu_method_boolean_compu_scale1_vt
-        self.compu_method_boolean_compu_scale1_vt.text = 'FALSE'
-        
-        self.compu_method_boolean_compu_scale2 = ET.SubElement(self.compu_method_boolean_compu_scales, 'COMPU-SCALE')
-        self.variables['compu_method_boolean_compu_scale2'] = self.compu_method_boolean_compu_scale2
-        self.compu_method_boolean_compu_scale2_lower_limit = ET.SubElement(self.compu_method_boolean_compu_scale2, 'LOWER-LIMIT')
-        self.variables['compu_method_boolean_compu_scale2_lower_limit'] = self.compu_method_boolean_compu_scale2_lower_limit
-        self.compu_method_boolean_compu_scale2_lower_limit.text = '1'
-        self.compu_method_boolean_compu_scale2_lower_limit.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.compu_method_boolean_compu_scale2_upper_limit = ET.SubElement(self.compu_method_boolean_compu_scale2, 'UPPER-LIMIT')
-        self.variables['compu_method_boolean_compu_scale2_upper_limit'] = self.compu_method_boolean_compu_scale2_upper_limit
-        self.compu_method_boolean_compu_scale2_upper_limit.text = '1'
-        self.compu_method_boolean_compu_scale2_upper_limit.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.compu_method_boolean_compu_scale2_compu_const = ET.SubElement(self.compu_method_boolean_compu_scale2, 'COMPU-CONST')
-        self.variables['compu_method_boolean_compu_scale2_compu_const'] = self.compu_method_boolean_compu_scale2_compu_const
-        self.compu_method_boolean_compu_scale2_vt = ET.SubElement(self.compu_method_boolean_compu_scale2_compu_const, 'VT')
-        self.variables['compu_method_boolean_compu_scale2_vt'] = self.compu_method_boolean_compu_scale2_vt
-        self.compu_method_boolean_compu_scale2_vt.text = 'TRUE'
-
-        self.DataConstrs_folder = ET.SubElement(self.AUTOSAR_Platform_subfolder, 'AR-PACKAGE')
-        self.variables['DataConstrs_folder'] = self.DataConstrs_folder
-        self.DataConstrs_folder_short_name = ET.SubElement(self.DataConstrs_folder, 'SHORT-NAME')
-        self.variables['DataConstrs_folder_short_name'] = self.DataConstrs_folder_short_name
-        self.DataConstrs_folder_short_name.text = 'DataConstrs'
-        self.DataConstrs_folder_category = ET.SubElement(self.DataConstrs_folder, 'CATEGORY')
-        self.variables['DataConstrs_folder_category'] = self.DataConstrs_folder_category
-        self.DataConstrs_folder_category.text = 'STANDARD'
-        
-        self.DataConstrs_folder_elements = ET.SubElement(self.DataConstrs_folder, 'ELEMENTS')
-        self.variables['DataConstrs_folder_elements'] = self.DataConstrs_folder_elements
-
-        self.data_constr_boolean = ET.SubElement(self.DataConstrs_folder_elements, 'DATA-CONSTR')
-        self.variables['data_constr_boolean'] = self.data_constr_boolean
-        self.data_constr_boolean_short_name = ET.SubElement(self.data_constr_boolean, 'SHORT-NAME')
-        self.variables['data_constr_boolean_short_name'] = self.data_constr_boolean_short_name
-        self.data_constr_boolean_short_name.text = 'boolean'
-        self.data_constr_boolean_data_constr_rules = ET.SubElement(self.data_constr_boolean, 'DATA-CONSTR-RULES')
-        self.variables['data_constr_boolean_data_constr_rules'] = self.data_constr_boolean_data_constr_rules
-        self.data_constr_boolean_data_constr_rule = ET.SubElement(self.data_constr_boolean_data_constr_rules, 'DATA-CONSTR-RULE')
-        self.variables['data_constr_boolean_data_constr_rule'] = self.data_constr_boolean_data_constr_rule
-        self.data_constr_boolean_internal_constrs = ET.SubElement(self.data_constr_boolean_data_constr_rule, 'INTERNAL-CONSTRS')
-        self.variables['data_constr_boolean_internal_constrs'] = self.data_constr_boolean_internal_constrs
-        self.data_constr_boolean_lower_limit = ET.SubElement(self.data_constr_boolean_internal_constrs, 'LOWER-LIMIT')
-        self.variables['data_constr_boolean_lower_limit'] = self.data_constr_boolean_lower_limit
-        self.data_constr_boolean_lower_limit.text = '0'
-        self.data_constr_boolean_upper_limit = ET.SubElement(self.data_constr_boolean_internal_constrs, 'UPPER-LIMIT')
-        self.variables['data_constr_boolean_upper_limit'] = self.data_constr_boolean_upper_limit
-        self.data_constr_boolean_upper_limit.text = '1'
-
-        self.data_constr_float32 = ET.SubElement(self.DataConstrs_folder_elements, 'DATA-CONSTR')
-        self.variables['data_constr_float32'] = self.data_constr_float32
-        self.data_constr_float32_short_name = ET.SubElement(self.data_constr_float32, 'SHORT-NAME')
-        self.variables['data_constr_float32_short_name'] = self.data_constr_float32_short_name
-        self.data_constr_float32_short_name.text = 'float32'
-        self.data_constr_float32_data_constr_rules = ET.SubElement(self.data_constr_float32, 'DATA-CONSTR-RULES')
-        self.variables['data_constr_float32_data_constr_rules'] = self.data_constr_float32_data_constr_rules
-        self.data_constr_float32_data_constr_rule = ET.SubElement(self.data_constr_float32_data_constr_rules, 'DATA-CONSTR-RULE')
-        self.variables['data_constr_float32_data_constr_rule'] = self.data_constr_float32_data_constr_rule
-        self.data_constr_float32_internal_constrs = ET.SubElement(self.data_constr_float32_data_constr_rule, 'INTERNAL-CONSTRS')
-        self.variables['data_constr_float32_internal_constrs'] = self.data_constr_float32_internal_constrs
-        self.data_constr_float32_lower_limit = ET.SubElement(self.data_constr_float32_internal_constrs, 'LOWER-LIMIT')
-        self.variables['data_constr_float32_lower_limit'] = self.data_constr_float32_lower_limit
-        self.data_constr_float32_lower_limit.text = '-3.40282347e+38'
-        self.data_constr_float32_upper_limit = ET.SubElement(self.data_constr_float32_internal_constrs, 'UPPER-LIMIT')
-        self.variables['data_constr_float32_upper_limit'] = self.data_constr_float32_upper_limit
-        self.data_constr_float32_upper_limit.text = '3.40282347e+38'
-
-        self.data_constr_float64 = ET.SubElement(self.DataConstrs_folder_elements, 'DATA-CONSTR')
-        self.variables['data_constr_float64'] = self.data_constr_float64
-        self.data_constr_float64_short_name = ET.SubElement(self.data_constr_float64, 'SHORT-NAME')
-        self.variables['data_constr_float64_short_name'] = self.data_constr_float64_short_name
-        self.data_constr_float64_short_name.text = 'float64'
-        self.data_constr_float64_data_constr_rules = ET.SubElement(self.data_constr_float64, 'DATA-CONSTR-RULES')
-        self.variables['data_constr_float64_data_constr_rules'] = self.data_constr_float64_data_constr_rules
-        self.data_constr_float64_data_constr_rule = ET.SubElement(self.data_constr_float64_data_constr_rules, 'DATA-CONSTR-RULE')
-        self.variables['data_constr_float64_data_constr_rule'] = self.data_constr_float64_data_constr_rule
-        self.data_constr_float64_internal_constrs = ET.SubElement(self.data_constr_float64_data_constr_rule, 'INTERNAL-CONSTRS')
-        self.variables['data_constr_float64_internal_constrs'] = self.data_constr_float64_internal_constrs
-        self.data_constr_float64_lower_limit = ET.SubElement(self.data_constr_float64_internal_constrs, 'LOWER-LIMIT')
-        self.variables['data_constr_float64_lower_limit'] = self.data_constr_float64_lower_limit
-        self.data_constr_float64_lower_limit.text = '-1.7976931348623157e+308'
-        self.data_constr_float64_upper_limit = ET.SubElement(self.data_constr_float64_internal_constrs, 'UPPER-LIMIT')
-        self.variables['data_constr_float64_upper_limit'] = self.data_constr_float64_upper_limit
-        self.data_constr_float64_upper_limit.text = '1.7976931348623157e+308'
-
-        self.data_constr_sint16 = ET.SubElement(self.DataConstrs_folder_elements, 'DATA-CONSTR')
-        self.variables['data_constr_sint16'] = self.data_constr_sint16
-        self.data_constr_sint16_short_name = ET.SubElement(self.data_constr_sint16, 'SHORT-NAME')
-        self.variables['data_constr_sint16_short_name'] = self.data_constr_sint16_short_name
-        self.data_constr_sint16_short_name.text = 'sint16'
-        self.data_constr_sint16_data_constr_rules = ET.SubElement(self.data_constr_sint16, 'DATA-CONSTR-RULES')
-        self.variables['data_constr_sint16_data_constr_rules'] = self.data_constr_sint16_data_constr_rules
-        self.data_constr_sint16_data_constr_rule = ET.SubElement(self.data_constr_sint16_data_constr_rules, 'DATA-CONSTR-RULE')
-        self.variables['data_constr_sint16_data_constr_rule'] = self.data_constr_sint16_data_constr_rule
-        self.data_constr_sint16_internal_constrs = ET.SubElement(self.data_constr_sint16_data_constr_rule, 'INTERNAL-CONSTRS')
-        self.variables['data_constr_sint16_internal_constrs'] = self.data_constr_sint16_internal_constrs
-        self.data_constr_sint16_lower_limit = ET.SubElement(self.data_constr_sint16_internal_constrs, 'LOWER-LIMIT')
-        self.variables['data_constr_sint16_lower_limit'] = self.data_constr_sint16_lower_limit
-        self.data_constr_sint16_lower_limit.text = '-32768'
-        self.data_constr_sint16_upper_limit = ET.SubElement(self.data_constr_sint16_internal_constrs, 'UPPER-LIMIT')
-        self.variables['data_constr_sint16_upper_limit'] = self.data_constr_sint16_upper_limit
-        self.data_constr_sint16_upper_limit.text = '+32767'
-
-        self.data_constr_sint16_least = ET.SubElement(self.DataConstrs_folder_elements, 'DATA-CONSTR')
-        self.variables['data_constr_sint16_least'] = self.data_constr_sint16_least
-        self.data_constr_sint16_least_short_name = ET.SubElement(self.data_constr_sint16_least, 'SHORT-NAME')
-        self.variables['data_constr_sint16_least_short_name'] = self.data_constr_sint16_least_short_name
-        self.data_constr_sint16_least_short_name.text = 'sint16_least'
-        self.data_constr_sint16_least_data_constr_rules = ET.SubElement(self.data_constr_sint16_least, 'DATA-CONSTR-RULES')
-        self.variables['data_constr_sint16_least_data_constr_rules'] = self.data_constr_sint16_least_data_constr_rules
-        self.data_constr_sint16_least_data_constr_rule = ET.SubElement(self.data_constr_sint16_least_data_constr_rules, 'DATA-CONSTR-RULE')
-        self.variables['data_constr_sint16_least_data_constr_rule'] = self.data_constr_sint16_least_data_constr_rule
-        self.data_constr_sint16_least_internal_constrs = ET.SubElement(self.data_constr_sint16_least_data_constr_rule, 'INTERNAL-CONSTRS')
-        self.variables['data_constr_sint16_least_internal_constrs'] = self.data_constr_sint16_least_internal_constrs
-        self.data_constr_sint16_least_lower_limit = ET.SubElement(self.data_constr_sint16_least_internal_constrs, 'LOWER-LIMIT')
-        self.variables['data_constr_sint16_least_lower_limit'] = self.data_constr_sint16_least_lower_limit
-        self.data_constr_sint16_least_lower_limit.text = '-32768'
-        self.data_constr_sint16_least_upper_limit = ET.SubElement(self.data_constr_sint16_least_internal_constrs, 'UPPER-LIMIT')
-        self.variables['data_constr_sint16_least_upper_limit'] = self.data_constr_sint16_least_upper_limit
-        self.data_constr_sint16_least_upper_limit.text = '+32767'
-
-        self.data_constr_sint32 = ET.SubElement(self.DataConstrs_folder_elements, 'DATA-CONSTR')
-        self.variables['data_constr_sint32'] = self.data_constr_sint32
-        self.data_constr_sint32_short_name = ET.SubElement(self.data_constr_sint32, 'SHORT-NAME')
-        self.variables['data_constr_sint32_short_name'] = self.data_constr_sint32_short_name
-        self.data_constr_sint32_short_name.text = 'sint32'
-        self.data_constr_sint32_data_constr_rules = ET.SubElement(self.data_constr_sint32, 'DATA-CONSTR-RULES')
-        self.variables['data_constr_sint32_data_constr_rules'] = self.data_constr_sint32_data_constr_rules
-        self.data_constr_sint32_data_constr_rule = ET.SubElement(self.data_constr_sint32_data_constr_rules, 'DATA-CONSTR-RULE')
-        self.variables['data_constr_sint32_data_constr_rule'] = self.data_constr_sint32_data_constr_rule
-        self.data_constr_sint32_internal_constrs = ET.SubElement(self.data_constr_sint32_data_constr_rule, 'INTERNAL-CONSTRS')
-        self.variables['data_constr_sint32_internal_constrs'] = self.data_constr_sint32_internal_constrs
-        self.data_constr_sint32_lower_limit = ET.SubElement(self.data_constr_sint32_internal_constrs, 'LOWER-LIMIT')
-        self.variables['data_constr_sint32_lower_limit'] = self.data_constr_sint32_lower_limit
-        self.data_constr_sint32_lower_limit.text = '-2147483648'
-        self.data_constr_sint32_upper_limit = ET.SubElement(self.data_constr_sint32_internal_constrs, 'UPPER-LIMIT')
-        self.variables['data_constr_sint32_upper_limit'] = self.data_constr_sint32_upper_limit
-        self.data_constr_sint32_upper_limit.text = '+2147483647'
-
-        self.data_constr_sint32_least = ET.SubElement(self.DataConstrs_folder_elements, 'DATA-CONSTR')
-        self.variables['data_constr_sint32_least'] = self.data_constr_sint32_least
-        self.data_constr_sint32_least_short_name = ET.SubElement(self.data_constr_sint32_least, 'SHORT-NAME')
-        self.variables['data_constr_sint32_least_short_name'] = self.data_constr_sint32_least_short_name
-        self.data_constr_sint32_least_short_name.text = 'sint32_least'
-        self.data_constr_sint32_least_data_constr_rules = ET.SubElement(self.data_constr_sint32_least, 'DATA-CONSTR-RULES')
-        self.variables['data_constr_sint32_least_data_constr_rules'] = self.data_constr_sint32_least_data_constr_rules
-        self.data_constr_sint32_least_data_constr_rule = ET.SubElement(self.data_constr_sint32_least_data_constr_rules, 'DATA-CONSTR-RULE')
-        self.variables['data_constr_sint32_least_data_constr_rule'] = self.data_constr_sint32_least_data_constr_rule
-        self.data_constr_sint32_least_internal_constrs = ET.SubElement(self.data_constr_sint32_least_data_constr_rule, 'INTERNAL-CONSTRS')
-        self.variables['data_constr_sint32_least_internal_constrs'] = self.data_constr_sint32_least_internal_constrs
-        self.data_constr_sint32_least_lower_limit = ET.SubElement(self.data_constr_sint32_least_internal_constrs, 'LOWER-LIMIT')
-        self.variables['data_constr_sint32_least_lower_limit'] = self.data_constr_sint32_least_lower_limit
-        self.data_constr_sint32_least_lower_limit.text = '-2147483648'
-        self.data_constr_sint32_least_upper_limit = ET.SubElement(self.data_constr_sint32_least_internal_constrs, 'UPPER-LIMIT')
-        self.variables['data_constr_sint32_least_upper_limit'] = self.data_constr_sint32_least_upper_limit
-        self.data_constr_sint32_least_upper_limit.text = '+2147483647'
-
-        self.data_constr_sint64 = ET.SubElement(self.DataConstrs_folder_elements, 'DATA-CONSTR')
-        self.variables['data_constr_sint64'] = self.data_constr_sint64
-        self.data_constr_sint64_short_name = ET.SubElement(self.data_constr_sint64, 'SHORT-NAME')
-        self.variables['data_constr_sint64_short_name'] = self.data_constr_sint64_short_name
-        self.data_constr_sint64_short_name.text = 'sint64'
-        self.data_constr_sint64_data_constr_rules = ET.SubElement(self.data_constr_sint64, 'DATA-CONSTR-RULES')
-        self.variables['data_constr_sint64_data_constr_rules'] = self.data_constr_sint64_data_constr_rules
-        self.data_constr_sint64_data_constr_rule = ET.SubElement(self.data_constr_sint64_data_constr_rules, 'DATA-CONSTR-RULE')
-        self.variables['data_constr_sint64_data_constr_rule'] = self.data_constr_sint64_data_constr_rule
-        self.data_constr_sint64_internal_constrs = ET.SubElement(self.data_constr_sint64_data_constr_rule, 'INTERNAL-CONSTRS')
-        self.variables['data_constr_sint64_internal_constrs'] = self.data_constr_sint64_internal_constrs
-        self.data_constr_sint64_lower_limit = ET.SubElement(self.data_constr_sint64_internal_constrs, 'LOWER-LIMIT')
-        self.variables['data_constr_sint64_lower_limit'] = self.data_constr_sint64_lower_limit
-        self.data_constr_sint64_lower_limit.text = '-9223372036854775808'
-        self.data_constr_sint64_upper_limit = ET.SubElement(self.data_constr_sint64_internal_constrs, 'UPPER-LIMIT')
-        self.variables['data_constr_sint64_upper_limit'] = self.data_constr_sint64_upper_limit
-        self.data_constr_sint64_upper_limit.text = '9223372036854775807'
-
-        self.data_constr_sint8 = ET.SubElement(self.DataConstrs_folder_elements, 'DATA-CONSTR')
-        self.variables['data_constr_sint8'] = self.data_constr_sint8
-        self.data_constr_sint8_short_name = ET.SubElement(self.data_constr_sint8, 'SHORT-NAME')
-        self.variables['data_constr_sint8_short_name'] = self.data_constr_sint8_short_name
-        self.data_constr_sint8_short_name.text = 'sint8'
-        self.data_constr_sint8_data_constr_rules = ET.SubElement(self.data_constr_sint8, 'DATA-CONSTR-RULES')
-        self.variables['data_constr_sint8_data_constr_rules'] = self.data_constr_sint8_data_constr_rules
-        self.data_constr_sint8_data_constr_rule = ET.SubElement(self.data_constr_sint8_data_constr_rules, 'DATA-CONSTR-RULE')
-        self.variables['data_constr_sint8_data_constr_rule'] = self.data_constr_sint8_data_constr_rule
-        self.data_constr_sint8_internal_constrs = ET.SubElement(self.data_constr_sint8_data_constr_rule, 'INTERNAL-CONSTRS')
-        self.variables['data_constr_sint8_internal_constrs'] = self.data_constr_sint8_internal_constrs
-        self.data_constr_sint8_lower_limit = ET.SubElement(self.data_constr_sint8_internal_constrs, 'LOWER-LIMIT')
-        self.variables['data_constr_sint8_lower_limit'] = self.data_constr_sint8_lower_limit
-        self.data_constr_sint8_lower_limit.text = '-128'
-        self.data_constr_sint8_upper_limit = ET.SubElement(self.data_constr_sint8_internal_constrs, 'UPPER-LIMIT')
-        self.variables['data_constr_sint8_upper_limit'] = self.data_constr_sint8_upper_limit
-        self.data_constr_sint8_upper_limit.text = '+127'
-
-        self.data_constr_sint8_least = ET.SubElement(self.DataConstrs_folder_elements, 'DATA-CONSTR')
-        self.variables['data_constr_sint8_least'] = self.data_constr_sint8_least
-        self.data_constr_sint8_least_short_name = ET.SubElement(self.data_constr_sint8_least, 'SHORT-NAME')
-        self.variables['data_constr_sint8_least_short_name'] = self.data_constr_sint8_least_short_name
-        self.data_constr_sint8_least_short_name.text = 'sint8_least'
-        self.data_constr_sint8_least_data_constr_rules = ET.SubElement(self.data_constr_sint8_least, 'DATA-CONSTR-RULES')
-        self.variables['data_constr_sint8_least_data_constr_rules'] = self.data_constr_sint8_least_data_constr_rules
-        self.data_constr_sint8_least_data_constr_rule = ET.SubElement(self.data_constr_sint8_least_data_constr_rules, 'DATA-CONSTR-RULE')
-        self.variables['data_constr_sint8_least_data_constr_rule'] = self.data_constr_sint8_least_data_constr_rule
-        self.data_constr_sint8_least_internal_constrs = ET.SubElement(self.data_constr_sint8_least_data_constr_rule, 'INTERNAL-CONSTRS')
-        self.variables['data_constr_sint8_least_internal_constrs'] = self.data_constr_sint8_least_internal_constrs
-        self.data_constr_sint8_least_lower_limit = ET.SubElement(self.data_constr_sint8_least_internal_constrs, 'LOWER-LIMIT')
-        self.variables['data_constr_sint8_least_lower_limit'] = self.data_constr_sint8_least_lower_limit
-        self.data_constr_sint8_least_lower_limit.text = '-128'
-        self.data_constr_sint8_least_upper_limit = ET.SubElement(self.data_constr_sint8_least_internal_constrs, 'UPPER-LIMIT')
-        self.variables['data_constr_sint8_least_upper_limit'] = self.data_constr_sint8_least_upper_limit
-        self.data_constr_sint8_least_upper_limit.text = '+127'
-
-        self.data_constr_uint16 = ET.SubElement(self.DataConstrs_folder_elements, 'DATA-CONSTR')
-        self.variables['data_constr_uint16'] = self.data_constr_uint16
-        self.data_constr_uint16_short_name = ET.SubElement(self.data_constr_uint16, 'SHORT-NAME')
-        self.variables['data_constr_uint16_short_name'] = self.data_constr_uint16_short_name
-        self.data_constr_uint16_short_name.text = 'uint16'
-        self.data_constr_uint16_data_constr_rules = ET.SubElement(self.data_constr_uint16, 'DATA-CONSTR-RULES')
-        self.variables['data_constr_uint16_data_constr_rules'] = self.data_constr_uint16_data_constr_rules
-        self.data_constr_uint16_data_constr_rule = ET.SubElement(self.data_constr_uint16_data_constr_rules, 'DATA-CONSTR-RULE')
-        self.variables['data_constr_uint16_data_constr_rule'] = self.data_constr_uint16_data_constr_rule
-        self.data_constr_uint16_internal_constrs = ET.SubElement(self.data_constr_uint16_data_constr_rule, 'INTERNAL-CONSTRS')
-        self.variables['data_constr_uint16_internal_constrs'] = self.data_constr_uint16_internal_constrs
-        self.data_constr_uint16_lower_limit = ET.SubElement(self.data_constr_uint16_internal_constrs, 'LOWER-LIMIT')
-        self.variables['data_constr_uint16_lower_limit'] = self.data_constr_uint16_lower_limit
-        self.data_constr_uint16_lower_limit.text = '0'
-        self.data_constr_uint16_upper_limit = ET.SubElement(self.data_constr_uint16_internal_constrs, 'UPPER-LIMIT')
-        self.variables['data_constr_uint16_upper_limit'] = self.data_constr_uint16_upper_limit
-        self.data_constr_uint16_upper_limit.text = '65535'
-
-        self.data_constr_uint16_least = ET.SubElement(self.DataConstrs_folder_elements, 'DATA-CONSTR')
-        self.variables['data_constr_uint16_least'] = self.data_constr_uint16_least
-        self.data_constr_uint16_least_short_name = ET.SubElement(self.data_constr_uint16_least, 'SHORT-NAME')
-        self.variables['data_constr_uint16_least_short_name'] = self.data_constr_uint16_least_short_name
-        self.data_constr_uint16_least_short_name.text = 'uint16_least'
-        self.data_constr_uint16_least_data_constr_rules = ET.SubElement(self.data_constr_uint16_least, 'DATA-CONSTR-RULES')
-        self.variables['data_constr_uint16_least_data_constr_rules'] = self.data_constr_uint16_least_data_constr_rules
-        self.data_constr_uint16_least_data_constr_rule = ET.SubElement(self.data_constr_uint16_least_data_constr_rules, 'DATA-CONSTR-RULE')
-        self.variables['data_constr_uint16_least_data_constr_rule'] = self.data_constr_uint16_least_data_constr_rule
-        self.data_constr_uint16_least_internal_constrs = ET.SubElement(self.data_constr_uint16_least_data_constr_rule, 'INTERNAL-CONSTRS')
-        self.variables['data_constr_uint16_least_internal_constrs'] = self.data_constr_uint16_least_internal_constrs
-        self.data_constr_uint16_least_lower_limit = ET.SubElement(self.data_constr_uint16_least_internal_constrs, 'LOWER-LIMIT')
-        self.variables['data_constr_uint16_least_lower_limit'] = self.data_constr_uint16_least_lower_limit
-        self.data_constr_uint16_least_lower_limit.text = '0'
-        self.data_constr_uint16_least_upper_limit = ET.SubElement(self.data_constr_uint16_least_internal_constrs, 'UPPER-LIMIT')
-        self.variables['data_constr_uint16_least_upper_limit'] = self.data_constr_uint16_least_upper_limit
-        self.data_constr_uint16_least_upper_limit.text = '65535'
-
-        self.data_constr_uint32 = ET.SubElement(self.DataConstrs_folder_elements, 'DATA-CONSTR')
-        self.variables['data_constr_uint32'] = self.data_constr_uint32
-        self.data_constr_uint32_short_name = ET.SubElement(self.data_constr_uint32, 'SHORT-NAME')
-        self.variables['data_constr_uint32_short_name'] = self.data_constr_uint32_short_name
-        self.data_constr_uint32_short_name.text = 'uint32'
-        self.data_constr_uint32_data_constr_rules = ET.SubElement(self.data_constr_uint32, 'DATA-CONSTR-RULES')
-        self.variables['data_constr_uint32_data_constr_rules'] = self.data_constr_uint32_data_constr_rules
-        self.data_constr_uint32_data_constr_rule = ET.SubElement(self.data_constr_uint32_data_constr_rules, 'DATA-CONSTR-RULE')
-        self.variables['data_constr_uint32_data_constr_rule'] = self.data_constr_uint32_data_constr_rule
-        self.data_constr_uint32_internal_constrs = ET.SubElement(self.data_constr_uint32_data_constr_rule, 'INTERNAL-CONSTRS')
-        self.variables['data_constr_uint32_internal_constrs'] = self.data_constr_uint32_internal_constrs
-        self.data_constr_uint32_lower_limit = ET.SubElement(self.data_constr_uint32_internal_constrs, 'LOWER-LIMIT')
-        self.variables['data_constr_uint32_lower_limit'] = self.data_constr_uint32_lower_limit
-        self.data_constr_uint32_lower_limit.text = '0'
-        self.data_constr_uint32_upper_limit = ET.SubElement(self.data_constr_uint32_internal_constrs, 'UPPER-LIMIT')
-        self.variables['data_constr_uint32_upper_limit'] = self.data_constr_uint32_upper_limit
-        self.data_constr_uint32_upper_limit.text = '4294967295'
-
-        self.data_constr_uint32_least = ET.SubElement(self.DataConstrs_folder_elements, 'DATA-CONSTR')
-        self.variables['data_constr_uint32_least'] = self.data_constr_uint32_least
-        self.data_constr_uint32_least_short_name = ET.SubElement(self.data_constr_uint32_least, 'SHORT-NAME')
-        self.variables['data_constr_uint32_least_short_name'] = self.data_constr_uint32_least_short_name
-        self.data_constr_uint32_least_short_name.text = 'uint32_least'
-        self.data_constr_uint32_least_data_constr_rules = ET.SubElement(self.data_constr_uint32_least, 'DATA-CONSTR-RULES')
-        self.variables['data_constr_uint32_least_data_constr_rules'] = self.data_constr_uint32_least_data_constr_rules
-        self.data_constr_uint32_least_data_constr_rule = ET.SubElement(self.data_constr_uint32_least_data_constr_rules, 'DATA-CONSTR-RULE')
-        self.variables['data_constr_uint32_least_data_constr_rule'] = self.data_constr_uint32_least_data_constr_rule
-        self.data_constr_uint32_least_internal_constrs = ET.SubElement(self.data_constr_uint32_least_data_constr_rule, 'INTERNAL-CONSTRS')
-        self.variables['data_constr_uint32_least_internal_constrs'] = self.data_constr_uint32_least_internal_constrs
-        self.data_constr_uint32_least_lower_limit = ET.SubElement(self.data_constr_uint32_least_internal_constrs, 'LOWER-LIMIT')
-        self.variables['data_constr_uint32_least_lower_limit'] = self.data_constr_uint32_least_lower_limit
-        self.data_constr_uint32_least_lower_limit.text = '0'
-        self.data_constr_uint32_least_upper_limit = ET.SubElement(self.data_constr_uint32_least_internal_constrs, 'UPPER-LIMIT')
-        self.variables['data_constr_uint32_least_upper_limit'] = self.data_constr_uint32_least_upper_limit
-        self.data_constr_uint32_least_upper_limit.text = '4294967295'
-
-        self.data_constr_uint64 = ET.SubElement(self.DataConstrs_folder_elements, 'DATA-CONSTR')
-        self.variables['data_constr_uint64'] = self.data_constr_uint64
-        self.data_constr_uint64_short_name = ET.SubElement(self.data_constr_uint64, 'SHORT-NAME')
-        self.variables['data_constr_uint64_short_name'] = self.data_constr_uint64_short_name
-        self.data_constr_uint64_short_name.text = 'uint64'
-        self.data_constr_uint64_data_constr_rules = ET.SubElement(self.data_constr_uint64, 'DATA-CONSTR-RULES')
-        self.variables['data_constr_uint64_data_constr_rules'] = self.data_constr_uint64_data_constr_rules
-        self.data_constr_uint64_data_constr_rule = ET.SubElement(self.data_constr_uint64_data_constr_rules, 'DATA-CONSTR-RULE')
-        self.variables['data_constr_uint64_data_constr_rule'] = self.data_constr_uint64_data_constr_rule
-        self.data_constr_uint64_internal_constrs = ET.SubElement(self.data_constr_uint64_data_constr_rule, 'INTERNAL-CONSTRS')
-        self.variables['data_constr_uint64_internal_constrs'] = self.data_constr_uint64_internal_constrs
-        self.data_constr_uint64_lower_limit = ET.SubElement(self.data_constr_uint64_internal_constrs, 'LOWER-LIMIT')
-        self.variables['data_constr_uint64_lower_limit'] = self.data_constr_uint64_lower_limit
-        self.data_constr_uint64_lower_limit.text = '0'
-        self.data_constr_uint64_upper_limit = ET.SubElement(self.data_constr_uint64_internal_constrs, 'UPPER-LIMIT')
-        self.variables['data_constr_uint64_upper_limit'] = self.data_constr_uint64_upper_limit
-        self.data_constr_uint64_upper_limit.text = '18446744073709551615'
-
-        self.data_constr_uint8 = ET.SubElement(self.DataConstrs_folder_elements, 'DATA-CONSTR')
-        self.variables['data_constr_uint8'] = self.data_constr_uint8
-        self.data_constr_uint8_short_name = ET.SubElement(self.data_constr_uint8, 'SHORT-NAME')
-        self.variables['data_constr_uint8_short_name'] = self.data_constr_uint8_short_name
-        self.data_constr_uint8_short_name.text = 'uint8'
-        self.data_constr_uint8_data_constr_rules = ET.SubElement(self.data_constr_uint8, 'DATA-CONSTR-RULES')
-        self.variables['data_constr_uint8_data_constr_rules'] = self.data_constr_uint8_data_constr_rules
-        self.data_constr_uint8_data_constr_rule = ET.SubElement(self.data_constr_uint8_data_constr_rules, 'DATA-CONSTR-RULE')
-        self.variables['data_constr_uint8_data_constr_rule'] = self.data_constr_uint8_data_constr_rule
-        self.data_constr_uint8_internal_constrs = ET.SubElement(self.data_constr_uint8_data_constr_rule, 'INTERNAL-CONSTRS')
-        self.variables['data_constr_uint8_internal_constrs'] = self.data_constr_uint8_internal_constrs
-        self.data_constr_uint8_lower_limit = ET.SubElement(self.data_constr_uint8_internal_constrs, 'LOWER-LIMIT')
-        self.variables['data_constr_uint8_lower_limit'] = self.data_constr_uint8_lower_limit
-        self.data_constr_uint8_lower_limit.text = '0'
-        self.data_constr_uint8_upper_limit = ET.SubElement(self.data_constr_uint8_internal_constrs, 'UPPER-LIMIT')
-        self.variables['data_constr_uint8_upper_limit'] = self.data_constr_uint8_upper_limit
-        self.data_constr_uint8_upper_limit.text = '255'
-
-        self.data_constr_uint8_least = ET.SubElement(self.DataConstrs_folder_elements, 'DATA-CONSTR')
-        self.variables['data_constr_uint8_least'] = self.data_constr_uint8_least
-        self.data_constr_uint8_least_short_name = ET.SubElement(self.data_constr_uint8_least, 'SHORT-NAME')
-        self.variables['data_constr_uint8_least_short_name'] = self.data_constr_uint8_least_short_name
-        self.data_constr_uint8_least_short_name.text = 'uint8_least'
-        self.data_constr_uint8_least_data_constr_rules = ET.SubElement(self.data_constr_uint8_least, 'DATA-CONSTR-RULES')
-        self.variables['data_constr_uint8_least_data_constr_rules'] = self.data_constr_uint8_least_data_constr_rules
-        self.data_constr_uint8_least_data_constr_rule = ET.SubElement(self.data_constr_uint8_least_data_constr_rules, 'DATA-CONSTR-RULE')
-        self.variables['data_constr_uint8_least_data_constr_rule'] = self.data_constr_uint8_least_data_constr_rule
-        self.data_constr_uint8_least_internal_constrs = ET.SubElement(self.data_constr_uint8_least_data_constr_rule, 'INTERNAL-CONSTRS')
-        self.variables['data_constr_uint8_least_internal_constrs'] = self.data_constr_uint8_least_internal_constrs
-        self.data_constr_uint8_least_lower_limit = ET.SubElement(self.data_constr_uint8_least_internal_constrs, 'LOWER-LIMIT')
-        self.variables['data_constr_uint8_least_lower_limit'] = self.data_constr_uint8_least_lower_limit
-        self.data_constr_uint8_least_lower_limit.text = '0'
-        self.data_constr_uint8_least_upper_limit = ET.SubElement(self.data_constr_uint8_least_internal_constrs, 'UPPER-LIMIT')
-        self.variables['data_constr_uint8_least_upper_limit'] = self.data_constr_uint8_least_upper_limit
-        self.data_constr_uint8_least_upper_limit.text = '255'
-
-        self.ImplementationDataTypes_platform_folder = ET.SubElement(self.AUTOSAR_Platform_subfolder, 'AR-PACKAGE')
-        self.variables['ImplementationDataTypes_platform_folder'] = self.ImplementationDataTypes_platform_folder
-        self.ImplementationDataTypes_platform_folder_short_name = ET.SubElement(self.ImplementationDataTypes_platform_folder, 'SHORT-NAME')
-        self.variables['ImplementationDataTypes_platform_folder_short_name'] = self.ImplementationDataTypes_platform_folder_short_name
-        self.ImplementationDataTypes_platform_folder_short_name.text = 'ImplementationDataTypes'
-        self.ImplementationDataTypes_platform_folder_category = ET.SubElement(self.ImplementationDataTypes_platform_folder, 'CATEGORY')
-        self.variables['ImplementationDataTypes_platform_folder_category'] = self.ImplementationDataTypes_platform_folder_category
-        self.ImplementationDataTypes_platform_folder_category.text = 'STANDARD'
-
-        self.ImplementationDataTypes_platform_folder_elements = ET.SubElement(self.ImplementationDataTypes_platform_folder, 'ELEMENTS')
-        self.variables['ImplementationDataTypes_platform_folder_elements'] = self.ImplementationDataTypes_platform_folder_elements
-        
-        self.implementation_data_type_ConstVoidPtr = ET.SubElement(self.ImplementationDataTypes_platform_folder_elements, 'IMPLEMENTATION-DATA-TYPE')
-        self.variables['implementation_data_type_ConstVoidPtr'] = self.implementation_data_type_ConstVoidPtr
-        self.implementation_data_type_ConstVoidPtr_short_name = ET.SubElement(self.implementation_data_type_ConstVoidPtr, 'SHORT-NAME')
-        self.variables['implementation_data_type_ConstVoidPtr_short_name'] = self.implementation_data_type_ConstVoidPtr_short_name
-        self.implementation_data_type_ConstVoidPtr_short_name.text = 'ConstVoidPtr'
-        self.implementation_data_type_ConstVoidPtr_long_name = ET.SubElement(self.implementation_data_type_ConstVoidPtr, 'LONG-NAME')
-        self.variables['implementation_data_type_ConstVoidPtr_long_name'] = self.implementation_data_type_ConstVoidPtr_long_name
-        self.implementation_data_type_ConstVoidPtr_l_4 = ET.SubElement(self.implementation_data_type_ConstVoidPtr_long_name, 'L-4')
-        self.variables['implementation_data_type_ConstVoidPtr_l_4'] = self.implementation_data_type_ConstVoidPtr_l_4
-        self.implementation_data_type_ConstVoidPtr_l_4.text = 'ConstVoidPtr'
-        self.implementation_data_type_ConstVoidPtr_l_4.attrib = {'L': 'EN'}
-        self.implementation_data_type_ConstVoidPtr_category = ET.SubElement(self.implementation_data_type_ConstVoidPtr, 'CATEGORY')
-        self.variables['implementation_data_type_ConstVoidPtr_category'] = self.implementation_data_type_ConstVoidPtr_category
-        self.implementation_data_type_ConstVoidPtr_category.text = 'DATA_REFERENCE'
-        self.implementation_data_type_ConstVoidPtr_sw_data_def_props1 = ET.SubElement(self.implementation_data_type_ConstVoidPtr, 'SW-DATA-DEF-PROPS')
-        self.variables['implementation_data_type_ConstVoidPtr_sw_data_def_props1'] = self.implementation_data_type_ConstVoidPtr_sw_data_def_props1
-        self.implementation_data_type_ConstVoidPtr_sw_data_def_props_variants1 = ET.SubElement(self.implementation_data_type_ConstVoidPtr_sw_data_def_props1, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['implementation_data_type_ConstVoidPtr_sw_data_def_props_variants1'] = self.implementation_data_type_ConstVoidPtr_sw_data_def_props_variants1
-        self.implementation_data_type_ConstVoidPtr_sw_data_def_props_conditional1 = ET.SubElement(self.implementation_data_type_ConstVoidPtr_sw_data_def_props_variants1, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['implementation_data_type_ConstVoidPtr_sw_data_def_props_conditional1'] = self.implementation_data_type_ConstVoidPtr_sw_data_def_props_conditional1
-        self.implementation_data_type_ConstVoidPtr_sw_pointer_target_props1 = ET.SubElement(self.implementation_data_type_ConstVoidPtr_sw_data_def_props_conditional1, 'SW-POINTER-TARGET-PROPS')
-        self.variables['implementation_data_type_ConstVoidPtr_sw_pointer_target_props1'] = self.implementation_data_type_ConstVoidPtr_sw_pointer_target_props1
-        self.implementation_data_type_ConstVoidPtr_target_category = ET.SubElement(self.implementation_data_type_ConstVoidPtr_sw_pointer_target_props1, 'TARGET-CATEGORY')
-        self.variables['implementation_data_type_ConstVoidPtr_target_category'] = self.implementation_data_type_ConstVoidPtr_target_category
-        self.implementation_data_type_ConstVoidPtr_target_category.text = 'VALUE'
-        self.implementation_data_type_ConstVoidPtr_sw_data_def_props2 = ET.SubElement(self.implementation_data_type_ConstVoidPtr_sw_pointer_target_props1, 'SW-DATA-DEF-PROPS')
-        self.variables['implementation_data_type_ConstVoidPtr_sw_data_def_props2'] = self.implementation_data_type_ConstVoidPtr_sw_data_def_props2
-        self.implementation_data_type_ConstVoidPtr_sw_data_def_props_variants2 = ET.SubElement(self.implementation_data_type_ConstVoidPtr_sw_data_def_props2, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['implementation_data_type_ConstVoidPtr_sw_data_def_props_variants2'] = self.implementation_data_type_ConstVoidPtr_sw_data_def_props_variants2
-        self.implementation_data_type_ConstVoidPtr_sw_data_def_props_conditional2 = ET.SubElement(self.implementation_data_type_ConstVoidPtr_sw_data_def_props_variants2, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['implementation_data_type_ConstVoidPtr_sw_data_def_props_conditional2'] = self.implementation_data_type_ConstVoidPtr_sw_data_def_props_conditional2
-        self.implementation_data_type_ConstVoidPtr_base_type_ref = ET.SubElement(self.implementation_data_type_ConstVoidPtr_sw_data_def_props_conditional2, 'BASE-TYPE-REF')
-        self.variables['implementation_data_type_ConstVoidPtr_base_type_ref'] = self.implementation_data_type_ConstVoidPtr_base_type_ref
-        self.implementation_data_type_ConstVoidPtr_base_type_ref.text = '/AUTOSAR/AUTOSAR_GenDef/BaseTypes/void'
-        self.implementation_data_type_ConstVoidPtr_base_type_ref.attrib = {'DEST': 'SW-BASE-TYPE'}
-        self.implementation_data_type_ConstVoidPtr_sw_impl_policy = ET.SubElement(self.implementation_data_type_ConstVoidPtr_sw_data_def_props_conditional2, 'SW-IMPL-POLICY')
-        self.variables['implementation_data_type_ConstVoidPtr_sw_impl_policy'] = self.implementation_data_type_ConstVoidPtr_sw_impl_policy
-        self.implementation_data_type_ConstVoidPtr_sw_impl_policy.text = 'CONST'
-        self.implementation_data_type_ConstVoidPtr_type_emitter = ET.SubElement(self.implementation_data_type_ConstVoidPtr, 'TYPE-EMITTER')
-        self.variables['implementation_data_type_ConstVoidPtr_type_emitter'] = self.implementation_data_type_ConstVoidPtr_type_emitter
-        self.implementation_data_type_ConstVoidPtr_type_emitter.text = 'Platform_Types.h'
-
-        self.implementation_data_type_VoidPtr = ET.SubElement(self.ImplementationDataTypes_platform_folder_elements, 'IMPLEMENTATION-DATA-TYPE')
-        self.variables['implementation_data_type_VoidPtr'] = self.implementation_data_type_VoidPtr
-        self.implementation_data_type_VoidPtr_short_name = ET.SubElement(self.implementation_data_type_VoidPtr, 'SHORT-NAME')
-        self.variables['implementation_data_type_VoidPtr_short_name'] = self.implementation_data_type_VoidPtr_short_name
-        self.implementation_data_type_VoidPtr_short_name.text = 'VoidPtr'
-        self.implementation_data_type_VoidPtr_long_name = ET.SubElement(self.implementation_data_type_VoidPtr, 'LONG-NAME')
-        self.variables['implementation_data_type_VoidPtr_long_name'] = self.implementation_data_type_VoidPtr_long_name
-        self.implementation_data_type_VoidPtr_l_4 = ET.SubElement(self.implementation_data_type_VoidPtr_long_name, 'L-4')
-        self.variables['implementation_data_type_VoidPtr_l_4'] = self.implementation_data_type_VoidPtr_l_4
-        self.implementation_data_type_VoidPtr_l_4.text = 'VoidPtr'
-        self.implementation_data_type_VoidPtr_l_4.attrib = {'L': 'EN'}
-        self.implementation_data_type_VoidPtr_category = ET.SubElement(self.implementation_data_type_VoidPtr, 'CATEGORY')
-        self.variables['implementation_data_type_VoidPtr_category'] = self.implementation_data_type_VoidPtr_category
-        self.implementation_data_type_VoidPtr_category.text = 'DATA_REFERENCE'
-        self.implementation_data_type_VoidPtr_sw_data_def_props = ET.SubElement(self.implementation_data_type_VoidPtr, 'SW-DATA-DEF-PROPS')
-        self.variables['implementation_data_type_VoidPtr_sw_data_def_props'] = self.implementation_data_type_VoidPtr_sw_data_def_props
-        self.implementation_data_type_VoidPtr_sw_data_def_props_variants = ET.SubElement(self.implementation_data_type_VoidPtr_sw_data_def_props, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['implementation_data_type_VoidPtr_sw_data_def_props_variants'] = self.implementation_data_type_VoidPtr_sw_data_def_props_variants
-        self.implementation_data_type_VoidPtr_sw_data_def_props_conditional = ET.SubElement(self.implementation_data_type_VoidPtr_sw_data_def_props_variants, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['implementation_data_type_VoidPtr_sw_data_def_props_conditional'] = self.implementation_data_type_VoidPtr_sw_data_def_props_conditional
-        self.implementation_data_type_VoidPtr_sw_pointer_target_props = ET.SubElement(self.implementation_data_type_VoidPtr_sw_data_def_props_conditional, 'SW-POINTER-TARGET-PROPS')
-        self.variables['implementation_data_type_VoidPtr_sw_pointer_target_props'] = self.implementation_data_type_VoidPtr_sw_pointer_target_props
-        self.target_implementation_data_type_VoidPtr_category = ET.SubElement(self.implementation_data_type_VoidPtr_sw_pointer_target_props, 'TARGET-CATEGORY')
-        self.variables['target_implementation_data_type_VoidPtr_category'] = self.target_implementation_data_type_VoidPtr_category
-        self.target_implementation_data_type_VoidPtr_category.text = 'VALUE'    
-        self.implementation_data_type_VoidPtr_sw_data_def_props1 = ET.SubElement(self.implementation_data_type_VoidPtr_sw_pointer_target_props, 'SW-DATA-DEF-PROPS')
-        self.variables['implementation_data_type_VoidPtr_sw_data_def_props1'] = self.implementation_data_type_VoidPtr_sw_data_def_props1
-        self.implementation_data_type_VoidPtr_sw_data_def_props_variants1 = ET.SubElement(self.implementation_data_type_VoidPtr_sw_data_def_props1, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['implementation_data_type_VoidPtr_sw_data_def_props_variants1'] = self.implementation_data_type_VoidPtr_sw_data_def_props_variants1
-        self.implementation_data_type_VoidPtr_sw_data_def_props_conditional1 = ET.SubElement(self.implementation_data_type_VoidPtr_sw_data_def_props_variants1, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['implementation_data_type_VoidPtr_sw_data_def_props_conditional1'] = self.implementation_data_type_VoidPtr_sw_data_def_props_conditional1    
-        self.implementation_data_type_VoidPtr_base_type_ref = ET.SubElement(self.implementation_data_type_VoidPtr_sw_data_def_props_conditional1, 'BASE-TYPE-REF')
-        self.variables['implementation_data_type_VoidPtr_base_type_ref'] = self.implementation_data_type_VoidPtr_base_type_ref
-        self.implementation_data_type_VoidPtr_base_type_ref.text = '/AUTOSAR/AUTOSAR_GenDef/BaseTypes/void'
-        self.implementation_data_type_VoidPtr_base_type_ref.attrib = {'DEST': 'SW-BASE-TYPE'}
-        self.implementation_data_type_VoidPtr_type_emitter = ET.SubElement(self.implementation_data_type_VoidPtr, 'TYPE-EMITTER')
-        self.variables['implementation_data_type_VoidPtr_type_emitter'] = self.implementation_data_type_VoidPtr_type_emitter
-        self.implementation_data_type_VoidPtr_type_emitter.text = 'Platform_Types.h'
-        
-        self.implementation_data_type_boolean = ET.SubElement(self.ImplementationDataTypes_platform_folder_elements, 'IMPLEMENTATION-DATA-TYPE')
-        self.variables['implementation_data_type_boolean'] = self.implementation_data_type_boolean
-        self.implementation_data_type_boolean_short_name = ET.SubElement(self.implementation_data_type_boolean, 'SHORT-NAME')
-        self.variables['implementation_data_type_boolean_short_name'] = self.implementation_data_type_boolean_short_name
-        self.implementation_data_type_boolean_short_name.text = 'boolean'
-        self.implementation_data_type_boolean_long_name = ET.SubElement(self.implementation_data_type_boolean, 'LONG-NAME')
-        self.variables['implementation_data_type_boolean_long_name'] = self.implementation_data_type_boolean_long_name
-        self.implementation_data_type_boolean_l_4 = ET.SubElement(self.implementation_data_type_boolean_long_name, 'L-4')
-        self.variables['implementation_data_type_boolean_l_4'] = self.implementation_data_type_boolean_l_4
-        self.implementation_data_type_boolean_l_4.text = 'boolean'
-        self.implementation_data_type_boolean_l_4.attrib = {'L': 'EN'}
-        self.implementation_data_type_boolean_category = ET.SubElement(self.implementation_data_type_boolean, 'CATEGORY')
-        self.variables['implementation_data_type_boolean_category'] = self.implementation_data_type_boolean_category
-        self.implementation_data_type_boolean_category.text = 'VALUE'
-        self.implementation_data_type_boolean_sw_data_def_props = ET.SubElement(self.implementation_data_type_boolean, 'SW-DATA-DEF-PROPS')
-        self.variables['implementation_data_type_boolean_sw_data_def_props'] = self.implementation_data_type_boolean_sw_data_def_props
-        self.implementation_data_type_boolean_sw_data_def_props_variants = ET.SubElement(self.implementation_data_type_boolean_sw_data_def_props, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['implementation_data_type_boolean_sw_data_def_props_variants'] = self.implementation_data_type_boolean_sw_data_def_props_variants
-        self.implementation_data_type_boolean_sw_data_def_props_conditional = ET.SubElement(self.implementation_data_type_boolean_sw_data_def_props_variants, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['implementation_data_type_boolean_sw_data_def_props_conditional'] = self.implementation_data_type_boolean_sw_data_def_props_conditional
-        self.implementation_data_type_boolean_base_type_ref = ET.SubElement(self.implementation_data_type_boolean_sw_data_def_props_conditional, 'BASE-TYPE-REF')
-        self.variables['implementation_data_type_boolean_base_type_ref'] = self.implementation_data_type_boolean_base_type_ref
-        self.implementation_data_type_boolean_base_type_ref.text = '/AUTOSAR/AUTOSAR_Platform/BaseTypes/boolean'
-        self.implementation_data_type_boolean_base_type_ref.attrib = {'DEST': 'SW-BASE-TYPE'}
-        self.compu_method_ref1 = ET.SubElement(self.implementation_data_type_boolean_sw_data_def_props_conditional, 'COMPU-METHOD-REF')
-        self.variables['compu_method_ref1'] = self.compu_method_ref1
-        self.compu_method_ref1.text = '/AUTOSAR/AUTOSAR_Platform/CompuMethods/boolean'
-        self.compu_method_ref1.attrib = {'DEST': 'COMPU-METHOD'}
-        self.data_constr_ref1 = ET.SubElement(self.implementation_data_type_boolean_sw_data_def_props_conditional, 'DATA-CONSTR-REF')
-        self.variables['data_constr_ref1'] = self.data_constr_ref1
-        self.data_constr_ref1.text = '/AUTOSAR/AUTOSAR_Platform/DataConstrs/boolean'
-        self.data_constr_ref1.attrib = {'DEST': 'DATA-CONSTR'}
-        self.implementation_data_type_boolean_type_emitter = ET.SubElement(self.implementation_data_type_boolean, 'TYPE-EMITTER')
-        self.variables['implementation_data_type_boolean_type_emitter'] = self.implementation_data_type_boolean_type_emitter
-        self.implementation_data_type_boolean_type_emitter.text = 'Platform_Types.h'
-
-        self.implementation_data_type_float32 = ET.SubElement(self.ImplementationDataTypes_platform_folder_elements, 'IMPLEMENTATION-DATA-TYPE')
-        self.variables['implementation_data_type_float32'] = self.implementation_data_type_float32
-        self.implementation_data_type_float32_short_name = ET.SubElement(self.implementation_data_type_float32, 'SHORT-NAME')
-        self.variables['implementation_data_type_float32_short_name'] = self.implementation_data_type_float32_short_name
-        self.implementation_data_type_float32_short_name.text = 'float32'
-        self.implementation_data_type_float32_long_name = ET.SubElement(self.implementation_data_type_float32, 'LONG-NAME')
-        self.variables['implementation_data_type_float32_long_name'] = self.implementation_data_type_float32_long_name
-        self.implementation_data_type_float32_l_4 = ET.SubElement(self.implementation_data_type_float32_long_name, 'L-4')
-        self.variables['implementation_data_type_float32_l_4'] = self.implementation_data_type_float32_l_4
-        self.implementation_data_type_float32_l_4.text = 'float32'
-        self.implementation_data_type_float32_l_4.attrib = {'L': 'EN'}
-        self.implementation_data_type_float32_category = ET.SubElement(self.implementation_data_type_float32, 'CATEGORY')
-        self.variables['implementation_data_type_float32_category'] = self.implementation_data_type_float32_category
-        self.implementation_data_type_float32_category.text = 'VALUE'
-        self.implementation_data_type_float32_sw_data_def_props = ET.SubElement(self.implementation_data_type_float32, 'SW-DATA-DEF-PROPS')
-        self.variables['implementation_data_type_float32_sw_data_def_props'] = self.implementation_data_type_float32_sw_data_def_props
-        self.implementation_data_type_float32_sw_data_def_props_variants = ET.SubElement(self.implementation_data_type_float32_sw_data_def_props, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['implementation_data_type_float32_sw_data_def_props_variants'] = self.implementation_data_type_float32_sw_data_def_props_variants
-        self.implementation_data_type_float32_sw_data_def_props_conditional = ET.SubElement(self.implementation_data_type_float32_sw_data_def_props_variants, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['implementation_data_type_float32_sw_data_def_props_conditional'] = self.implementation_data_type_float32_sw_data_def_props_conditional
-        self.implementation_data_type_float32_base_type_ref = ET.SubElement(self.implementation_data_type_float32_sw_data_def_props_conditional, 'BASE-TYPE-REF')
-        self.variables['implementation_data_type_float32_base_type_ref'] = self.implementation_data_type_float32_base_type_ref
-        self.implementation_data_type_float32_base_type_ref.text = '/AUTOSAR/AUTOSAR_Platform/BaseTypes/float32'
-        self.implementation_data_type_float32_base_type_ref.attrib = {'DEST': 'SW-BASE-TYPE'}
-        self.data_constr_ref2 = ET.SubElement(self.implementation_data_type_float32_sw_data_def_props_conditional, 'DATA-CONSTR-REF')
-        self.variables['data_constr_ref2'] = self.data_constr_ref2
-        self.data_constr_ref2.text = '/AUTOSAR/AUTOSAR_Platform/DataConstrs/float32'
-        self.data_constr_ref2.attrib = {'DEST': 'DATA-CONSTR'}
-        self.implementation_data_type_float32_type_emitter = ET.SubElement(self.implementation_data_type_float32, 'TYPE-EMITTER')
-        self.variables['implementation_data_type_float32_type_emitter'] = self.implementation_data_type_float32_type_emitter
-        self.implementation_data_type_float32_type_emitter.text = 'Platform_Types.h'
-
-        self.implementation_data_type_float64 = ET.SubElement(self.ImplementationDataTypes_platform_folder_elements, 'IMPLEMENTATION-DATA-TYPE')
-        self.variables['implementation_data_type_float64'] = self.implementation_data_type_float64
-        self.implementation_data_type_float64_short_name = ET.SubElement(self.implementation_data_type_float64, 'SHORT-NAME')
-        self.variables['implementation_data_type_float64_short_name'] = self.implementation_data_type_float64_short_name
-        self.implementation_data_type_float64_short_name.text = 'float64'
-        self.implementation_data_type_float64_long_name = ET.SubElement(self.implementation_data_type_float64, 'LONG-NAME')
-        self.variables['implementation_data_type_float64_long_name'] = self.implementation_data_type_float64_long_name
-        self.implementation_data_type_float64_l_4 = ET.SubElement(self.implementation_data_type_float64_long_name, 'L-4')
-        self.variables['implementation_data_type_float64_l_4'] = self.implementation_data_type_float64_l_4
-        self.implementation_data_type_float64_l_4.text = 'float64'
-        self.implementation_data_type_float64_l_4.attrib = {'L': 'EN'}
-        self.implementation_data_type_float64_category = ET.SubElement(self.implementation_data_type_float64, 'CATEGORY')
-        self.variables['implementation_data_type_float64_category'] = self.implementation_data_type_float64_category
-        self.implementation_data_type_float64_category.text = 'VALUE'
-        self.implementation_data_type_float64_sw_data_def_props = ET.SubElement(self.implementation_data_type_float64, 'SW-DATA-DEF-PROPS')
-        self.variables['implementation_data_type_float64_sw_data_def_props'] = self.implementation_data_type_float64_sw_data_def_props
-        self.implementation_data_type_float64_sw_data_def_props_variants = ET.SubElement(self.implementation_data_type_float64_sw_data_def_props, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['implementation_data_type_float64_sw_data_def_props_variants'] = self.implementation_data_type_float64_sw_data_def_props_variants
-        self.implementation_data_type_float64_sw_data_def_props_conditional = ET.SubElement(self.implementation_data_type_float64_sw_data_def_props_variants, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['implementation_data_type_float64_sw_data_def_props_conditional'] = self.implementation_data_type_float64_sw_data_def_props_conditional
-        self.implementation_data_type_float64_base_type_ref = ET.SubElement(self.implementation_data_type_float64_sw_data_def_props_conditional, 'BASE-TYPE-REF')
-        self.variables['implementation_data_type_float64_base_type_ref'] = self.implementation_data_type_float64_base_type_ref
-        self.implementation_data_type_float64_base_type_ref.text = '/AUTOSAR/AUTOSAR_Platform/BaseTypes/float64'
-        self.implementation_data_type_float64_base_type_ref.attrib = {'DEST': 'SW-BASE-TYPE'}
-        self.data_constr_ref3 = ET.SubElement(self.implementation_data_type_float64_sw_data_def_props_conditional, 'DATA-CONSTR-REF')
-        self.variables['data_constr_ref3'] = self.data_constr_ref3
-        self.data_constr_ref3.text = '/AUTOSAR/AUTOSAR_Platform/DataConstrs/float64'
-        self.data_constr_ref3.attrib = {'DEST': 'DATA-CONSTR'}
-        self.implementation_data_type_float64_type_emitter = ET.SubElement(self.implementation_data_type_float64, 'TYPE-EMITTER')
-        self.variables['implementation_data_type_float64_type_emitter'] = self.implementation_data_type_float64_type_emitter
-        self.implementation_data_type_float64_type_emitter.text = 'Platform_Types.h'
-
-        self.implementation_data_type_sint16 = ET.SubElement(self.ImplementationDataTypes_platform_folder_elements, 'IMPLEMENTATION-DATA-TYPE')
-        self.variables['implementation_data_type_sint16'] = self.implementation_data_type_sint16
-        self.implementation_data_type_sint16_short_name = ET.SubElement(self.implementation_data_type_sint16, 'SHORT-NAME')
-        self.variables['implementation_data_type_sint16_short_name'] = self.implementation_data_type_sint16_short_name
-        self.implementation_data_type_sint16_short_name.text = 'sint16'
-        self.implementation_data_type_sint16_long_name = ET.SubElement(self.implementation_data_type_sint16, 'LONG-NAME')
-        self.variables['implementation_data_type_sint16_long_name'] = self.implementation_data_type_sint16_long_name
-        self.implementation_data_type_sint16_l_4 = ET.SubElement(self.implementation_data_type_sint16_long_name, 'L-4')
-        self.variables['implementation_data_type_sint16_l_4'] = self.implementation_data_type_sint16_l_4
-        self.implementation_data_type_sint16_l_4.text = 'sint16'
-        self.implementation_data_type_sint16_l_4.attrib = {'L': 'EN'}
-        self.implementation_data_type_sint16_category = ET.SubElement(self.implementation_data_type_sint16, 'CATEGORY')
-        self.variables['implementation_data_type_sint16_category'] = self.implementation_data_type_sint16_category
-        self.implementation_data_type_sint16_category.text = 'VALUE'
-        self.implementation_data_type_sint16_sw_data_def_props = ET.SubElement(self.implementation_data_type_sint16, 'SW-DATA-DEF-PROPS')
-        self.variables['implementation_data_type_sint16_sw_data_def_props'] = self.implementation_data_type_sint16_sw_data_def_props
-        self.implementation_data_type_sint16_sw_data_def_props_variants = ET.SubElement(self.implementation_data_type_sint16_sw_data_def_props, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['implementation_data_type_sint16_sw_data_def_props_variants'] = self.implementation_data_type_sint16_sw_data_def_props_variants
-        self.implementation_data_type_sint16_sw_data_def_props_conditional = ET.SubElement(self.implementation_data_type_sint16_sw_data_def_props_variants, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['implementation_data_type_sint16_sw_data_def_props_conditional'] = self.implementation_data_type_sint16_sw_data_def_props_conditional
-        self.implementation_data_type_sint16_base_type_ref = ET.SubElement(self.implementation_data_type_sint16_sw_data_def_props_conditional, 'BASE-TYPE-REF')
-        self.variables['implementation_data_type_sint16_base_type_ref'] = self.implementation_data_type_sint16_base_type_ref
-        self.implementation_data_type_sint16_base_type_ref.text = '/AUTOSAR/AUTOSAR_Platform/BaseTypes/sint16'
-        self.implementation_data_type_sint16_base_type_ref.attrib = {'DEST': 'SW-BASE-TYPE'}
-        self.data_constr_ref4 = ET.SubElement(self.implementation_data_type_sint16_sw_data_def_props_conditional, 'DATA-CONSTR-REF')
-        self.variables['data_constr_ref4'] = self.data_constr_ref4
-        self.data_constr_ref4.text = '/AUTOSAR/AUTOSAR_Platform/DataConstrs/sint16'
-        self.data_constr_ref4.attrib = {'DEST': 'DATA-CONSTR'}
-        self.implementation_data_type_sint16_type_emitter = ET.SubElement(self.implementation_data_type_sint16, 'TYPE-EMITTER')
-        self.variables['implementation_data_type_sint16_type_emitter'] = self.implementation_data_type_sint16_type_emitter
-        self.implementation_data_type_sint16_type_emitter.text = 'Platform_Types.h'
-
-        self.implementation_data_type_sint16_least = ET.SubElement(self.ImplementationDataTypes_platform_folder_elements, 'IMPLEMENTATION-DATA-TYPE')
-        self.variables['implementation_data_type_sint16_least'] = self.implementation_data_type_sint16_least
-        self.implementation_data_type_sint16_least_short_name = ET.SubElement(self.implementation_data_type_sint16_least, 'SHORT-NAME')
-        self.variables['implementation_data_type_sint16_least_short_name'] = self.implementation_data_type_sint16_least_short_name
-        self.implementation_data_type_sint16_least_short_name.text = 'sint16_least'
-        self.implementation_data_type_sint16_least_long_name = ET.SubElement(self.implementation_data_type_sint16_least, 'LONG-NAME')
-        self.variables['implementation_data_type_sint16_least_long_name'] = self.implementation_data_type_sint16_least_long_name
-        self.implementation_data_type_sint16_least_l_4 = ET.SubElement(self.implementation_data_type_sint16_least_long_name, 'L-4')
-        self.variables['implementation_data_type_sint16_least_l_4'] = self.implementation_data_type_sint16_least_l_4
-        self.implementation_data_type_sint16_least_l_4.text = 'sint16_least'
-        self.implementation_data_type_sint16_least_l_4.attrib = {'L': 'EN'}
-        self.implementation_data_type_sint16_least_category = ET.SubElement(self.implementation_data_type_sint16_least, 'CATEGORY')
-        self.variables['implementation_data_type_sint16_least_category'] = self.implementation_data_type_sint16_least_category
-        self.implementation_data_type_sint16_least_category.text = 'VALUE'
-        self.implementation_data_type_sint16_least_sw_data_def_props = ET.SubElement(self.implementation_data_type_sint16_least, 'SW-DATA-DEF-PROPS')
-        self.variables['implementation_data_type_sint16_least_sw_data_def_props'] = self.implementation_data_type_sint16_least_sw_data_def_props
-        self.implementation_data_type_sint16_least_sw_data_def_props_variants = ET.SubElement(self.implementation_data_type_sint16_least_sw_data_def_props, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['implementation_data_type_sint16_least_sw_data_def_props_variants'] = self.implementation_data_type_sint16_least_sw_data_def_props_variants
-        self.implementation_data_type_sint16_least_sw_data_def_props_conditional = ET.SubElement(self.implementation_data_type_sint16_least_sw_data_def_props_variants, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['implementation_data_type_sint16_least_sw_data_def_props_conditional'] = self.implementation_data_type_sint16_least_sw_data_def_props_conditional
-        self.data_constr_ref5 = ET.SubElement(self.implementation_data_type_sint16_least_sw_data_def_props_conditional, 'DATA-CONSTR-REF')
-        self.variables['data_constr_ref5'] = self.data_constr_ref5
-        self.data_constr_ref5.text = '/AUTOSAR/AUTOSAR_Platform/DataConstrs/sint16_least'
-        self.data_constr_ref5.attrib = {'DEST': 'DATA-CONSTR'}
-        self.implementation_data_type_sint16_least_type_emitter = ET.SubElement(self.implementation_data_type_sint16_least, 'TYPE-EMITTER')
-        self.variables['implementation_data_type_sint16_least_type_emitter'] = self.implementation_data_type_sint16_least_type_emitter
-        self.implementation_data_type_sint16_least_type_emitter.text = 'Platform_Types.h'
-
-        self.implementation_data_type_sint32 = ET.SubElement(self.ImplementationDataTypes_platform_folder_elements, 'IMPLEMENTATION-DATA-TYPE')
-        self.variables['implementation_data_type_sint32'] = self.implementation_data_type_sint32
-        self.implementation_data_type_sint32_short_name = ET.SubElement(self.implementation_data_type_sint32, 'SHORT-NAME')
-        self.variables['implementation_data_type_sint32_short_name'] = self.implementation_data_type_sint32_short_name
-        self.implementation_data_type_sint32_short_name.text = 'sint32'
-        self.implementation_data_type_sint32_long_name = ET.SubElement(self.implementation_data_type_sint32, 'LONG-NAME')
-        self.variables['implementation_data_type_sint32_long_name'] = self.implementation_data_type_sint32_long_name
-        self.implementation_data_type_sint32_l_4 = ET.SubElement(self.implementation_data_type_sint32_long_name, 'L-4')
-        self.variables['implementation_data_type_sint32_l_4'] = self.implementation_data_type_sint32_l_4
-        self.implementation_data_type_sint32_l_4.text = 'sint32'
-        self.implementation_data_type_sint32_l_4.attrib = {'L': 'EN'}
-        self.implementation_data_type_sint32_category = ET.SubElement(self.implementation_data_type_sint32, 'CATEGORY')
-        self.variables['implementation_data_type_sint32_category'] = self.implementation_data_type_sint32_category
-        self.implementation_data_type_sint32_category.text = 'VALUE'
-        self.implementation_data_type_sint32_sw_data_def_props = ET.SubElement(self.implementation_data_type_sint32, 'SW-DATA-DEF-PROPS')
-        self.variables['implementation_data_type_sint32_sw_data_def_props'] = self.implementation_data_type_sint32_sw_data_def_props
-        self.implementation_data_type_sint32_sw_data_def_props_variants = ET.SubElement(self.implementation_data_type_sint32_sw_data_def_props, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['implementation_data_type_sint32_sw_data_def_props_variants'] = self.implementation_data_type_sint32_sw_data_def_props_variants
-        self.implementation_data_type_sint32_sw_data_def_props_conditional = ET.SubElement(self.implementation_data_type_sint32_sw_data_def_props_variants, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['implementation_data_type_sint32_sw_data_def_props_conditional'] = self.implementation_data_type_sint32_sw_data_def_props_conditional
-        self.implementation_data_type_sint32_base_type_ref = ET.SubElement(self.implementation_data_type_sint32_sw_data_def_props_conditional, 'BASE-TYPE-REF')
-        self.variables['implementation_data_type_sint32_base_type_ref'] = self.implementation_data_type_sint32_base_type_ref
-        self.implementation_data_type_sint32_base_type_ref.text = '/AUTOSAR/AUTOSAR_Platform/BaseTypes/sint32'
-        self.implementation_data_type_sint32_base_type_ref.attrib = {'DEST': 'SW-BASE-TYPE'}
-        self.data_constr_ref6 = ET.SubElement(self.implementation_data_type_sint32_sw_data_def_props_conditional, 'DATA-CONSTR-REF')
-        self.variables['data_constr_ref6'] = self.data_constr_ref6
-        self.data_constr_ref6.text = '/AUTOSAR/AUTOSAR_Platform/DataConstrs/sint32'
-        self.data_constr_ref6.attrib = {'DEST': 'DATA-CONSTR'}
-        self.implementation_data_type_sint32_type_emitter = ET.SubElement(self.implementation_data_type_sint32, 'TYPE-EMITTER')
-        self.variables['implementation_data_type_sint32_type_emitter'] = self.implementation_data_type_sint32_type_emitter
-        self.implementation_data_type_sint32_type_emitter.text = 'Platform_Types.h'
-
-        self.implementation_data_type_sint32_least = ET.SubElement(self.ImplementationDataTypes_platform_folder_elements, 'IMPLEMENTATION-DATA-TYPE')
-        self.variables['implementation_data_type_sint32_least'] = self.implementation_data_type_sint32_least
-        self.implementation_data_type_sint32_least_short_name = ET.SubElement(self.implementation_data_type_sint32_least, 'SHORT-NAME')
-        self.variables['implementation_data_type_sint32_least_short_name'] = self.implementation_data_type_sint32_least_short_name
-        self.implementation_data_type_sint32_least_short_name.text = 'sint32_least'
-        self.implementation_data_type_sint32_least_long_name = ET.SubElement(self.implementation_data_type_sint32_least, 'LONG-NAME')
-        self.variables['implementation_data_type_sint32_least_long_name'] = self.implementation_data_type_sint32_least_long_name
-        self.implementation_data_type_sint32_least_l_4 = ET.SubElement(self.implementation_data_type_sint32_least_long_name, 'L-4')
-        self.variables['implementation_data_type_sint32_least_l_4'] = self.implementation_data_type_sint32_least_l_4
-        self.implementation_data_type_sint32_least_l_4.text = 'sint32_least'
-        self.implementation_data_type_sint32_least_l_4.attrib = {'L': 'EN'}
-        self.implementation_data_type_sint32_least_category = ET.SubElement(self.implementation_data_type_sint32_least, 'CATEGORY')
-        self.variables['implementation_data_type_sint32_least_category'] = self.implementation_data_type_sint32_least_category
-        self.implementation_data_type_sint32_least_category.text = 'VALUE'
-        self.implementation_data_type_sint32_least_sw_data_def_props = ET.SubElement(self.implementation_data_type_sint32_least, 'SW-DATA-DEF-PROPS')
-        self.variables['implementation_data_type_sint32_least_sw_data_def_props'] = self.implementation_data_type_sint32_least_sw_data_def_props
-        self.implementation_data_type_sint32_least_sw_data_def_props_variants = ET.SubElement(self.implementation_data_type_sint32_least_sw_data_def_props, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['implementation_data_type_sint32_least_sw_data_def_props_variants'] = self.implementation_data_type_sint32_least_sw_data_def_props_variants
-        self.implementation_data_type_sint32_least_sw_data_def_props_conditional = ET.SubElement(self.implementation_data_type_sint32_least_sw_data_def_props_variants, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['implementation_data_type_sint32_least_sw_data_def_props_conditional'] = self.implementation_data_type_sint32_least_sw_data_def_props_conditional
-        self.data_constr_ref7 = ET.SubElement(self.implementation_data_type_sint32_least_sw_data_def_props_conditional, 'DATA-CONSTR-REF')
-        self.variables['data_constr_ref7'] = self.data_constr_ref7
-        self.data_constr_ref7.text = '/AUTOSAR/AUTOSAR_Platform/DataConstrs/sint32_least'
-        self.data_constr_ref7.attrib = {'DEST': 'DATA-CONSTR'}
-        self.implementation_data_type_sint32_least_type_emitter = ET.SubElement(self.implementation_data_type_sint32_least, 'TYPE-EMITTER')
-        self.variables['implementation_data_type_sint32_least_type_emitter'] = self.implementation_data_type_sint32_least_type_emitter
-        self.implementation_data_type_sint32_least_type_emitter.text = 'Platform_Types.h'
-
-        self.implementation_data_type_sint64 = ET.SubElement(self.ImplementationDataTypes_platform_folder_elements, 'IMPLEMENTATION-DATA-TYPE')
-        self.variables['implementation_data_type_sint64'] = self.implementation_data_type_sint64
-        self.implementation_data_type_sint64_short_name = ET.SubElement(self.implementation_data_type_sint64, 'SHORT-NAME')
-        self.variables['implementation_data_type_sint64_short_name'] = self.implementation_data_type_sint64_short_name
-        self.implementation_data_type_sint64_short_name.text = 'sint64'
-        self.implementation_data_type_sint64_long_name = ET.SubElement(self.implementation_data_type_sint64, 'LONG-NAME')
-        self.variables['implementation_data_type_sint64_long_name'] = self.implementation_data_type_sint64_long_name
-        self.implementation_data_type_sint64_l_4 = ET.SubElement(self.implementation_data_type_sint64_long_name, 'L-4')
-        self.variables['implementation_data_type_sint64_l_4'] = self.implementation_data_type_sint64_l_4
-        self.implementation_data_type_sint64_l_4.text = 'sint64'
-        self.implementation_data_type_sint64_l_4.attrib = {'L': 'EN'}
-        self.implementation_data_type_sint64_category = ET.SubElement(self.implementation_data_type_sint64, 'CATEGORY')
-        self.variables['implementation_data_type_sint64_category'] = self.implementation_data_type_sint64_category
-        self.implementation_data_type_sint64_category.text = 'VALUE'
-        self.implementation_data_type_sint64_sw_data_def_props = ET.SubElement(self.implementation_data_type_sint64, 'SW-DATA-DEF-PROPS')
-        self.variables['implementation_data_type_sint64_sw_data_def_props'] = self.implementation_data_type_sint64_sw_data_def_props
-        self.implementation_data_type_sint64_sw_data_def_props_variants = ET.SubElement(self.implementation_data_type_sint64_sw_data_def_props, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['implementation_data_type_sint64_sw_data_def_props_variants'] = self.implementation_data_type_sint64_sw_data_def_props_variants
-        self.implementation_data_type_sint64_sw_data_def_props_conditional = ET.SubElement(self.implementation_data_type_sint64_sw_data_def_props_variants, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['implementation_data_type_sint64_sw_data_def_props_conditional'] = self.implementation_data_type_sint64_sw_data_def_props_conditional
-        self.implementation_data_type_sint64_base_type_ref = ET.SubElement(self.implementation_data_type_sint64_sw_data_def_props_conditional, 'BASE-TYPE-REF')
-        self.variables['implementation_data_type_sint64_base_type_ref'] = self.implementation_data_type_sint64_base_type_ref
-        self.implementation_data_type_sint64_base_type_ref.text = '/AUTOSAR/AUTOSAR_Platform/BaseTypes/sint64'
-        self.implementation_data_type_sint64_base_type_ref.attrib = {'DEST': 'SW-BASE-TYPE'}
-        self.data_constr_ref8 = ET.SubElement(self.implementation_data_type_sint64_sw_data_def_props_conditional, 'DATA-CONSTR-REF')
-        self.variables['data_constr_ref8'] = self.data_constr_ref8
-        self.data_constr_ref8.text = '/AUTOSAR/AUTOSAR_Platform/DataConstrs/sint64'
-        self.data_constr_ref8.attrib = {'DEST': 'DATA-CONSTR'}
-        self.implementation_data_type_sint64_type_emitter = ET.SubElement(self.implementation_data_type_sint64, 'TYPE-EMITTER')
-        self.variables['implementation_data_type_sint64_type_emitter'] = self.implementation_data_type_sint64_type_emitter
-        self.implementation_data_type_sint64_type_emitter.text = 'Platform_Types.h'
-
-        self.implementation_data_type_sint8 = ET.SubElement(self.ImplementationDataTypes_platform_folder_elements, 'IMPLEMENTATION-DATA-TYPE')
-        self.variables['implementation_data_type_sint8'] = self.implementation_data_type_sint8
-        self.implementation_data_type_sint8_short_name = ET.SubElement(self.implementation_data_type_sint8, 'SHORT-NAME')
-        self.variables['implementation_data_type_sint8_short_name'] = self.implementation_data_type_sint8_short_name
-        self.implementation_data_type_sint8_short_name.text = 'sint8'
-        self.implementation_data_type_sint8_long_name = ET.SubElement(self.implementation_data_type_sint8, 'LONG-NAME')
-        self.variables['implementation_data_type_sint8_long_name'] = self.implementation_data_type_sint8_long_name
-        self.implementation_data_type_sint8_l_4 = ET.SubElement(self.implementation_data_type_sint8_long_name, 'L-4')
-        self.variables['implementation_data_type_sint8_l_4'] = self.implementation_data_type_sint8_l_4
-        self.implementation_data_type_sint8_l_4.text = 'sint8'
-        self.implementation_data_type_sint8_l_4.attrib = {'L': 'EN'}
-        self.implementation_data_type_sint8_category = ET.SubElement(self.implementation_data_type_sint8, 'CATEGORY')
-        self.variables['implementation_data_type_sint8_category'] = self.implementation_data_type_sint8_category
-        self.implementation_data_type_sint8_category.text = 'VALUE'
-        self.implementation_data_type_sint8_sw_data_def_props = ET.SubElement(self.implementation_data_type_sint8, 'SW-DATA-DEF-PROPS')
-        self.variables['implementation_data_type_sint8_sw_data_def_props'] = self.implementation_data_type_sint8_sw_data_def_props
-        self.implementation_data_type_sint8_sw_data_def_props_variants = ET.SubElement(self.implementation_data_type_sint8_sw_data_def_props, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['implementation_data_type_sint8_sw_data_def_props_variants'] = self.implementation_data_type_sint8_sw_data_def_props_variants
-        self.implementation_data_type_sint8_sw_data_def_props_conditional = ET.SubElement(self.implementation_data_type_sint8_sw_data_def_props_variants, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['implementation_data_type_sint8_sw_data_def_props_conditional'] = self.implementation_data_type_sint8_sw_data_def_props_conditional
-        self.implementation_data_type_sint8_base_type_ref = ET.SubElement(self.implementation_data_type_sint8_sw_data_def_props_conditional, 'BASE-TYPE-REF')
-        self.variables['implementation_data_type_sint8_base_type_ref'] = self.implementation_data_type_sint8_base_type_ref
-        self.implementation_data_type_sint8_base_type_ref.text = '/AUTOSAR/AUTOSAR_Platform/BaseTypes/sint8'
-        self.implementation_data_type_sint8_base_type_ref.attrib = {'DEST': 'SW-BASE-TYPE'}
-        self.data_constr_ref9 = ET.SubElement(self.implementation_data_type_sint8_sw_data_def_props_conditional, 'DATA-CONSTR-REF')
-        self.variables['data_constr_ref9'] = self.data_constr_ref9
-        self.data_constr_ref9.text = '/AUTOSAR/AUTOSAR_Platform/DataConstrs/sint8'
-        self.data_constr_ref9.attrib = {'DEST': 'DATA-CONSTR'}
-        self.implementation_data_type_sint8_type_emitter = ET.SubElement(self.implementation_data_type_sint8, 'TYPE-EMITTER')
-        self.variables['implementation_data_type_sint8_type_emitter'] = self.implementation_data_type_sint8_type_emitter
-        self.implementation_data_type_sint8_type_emitter.text = 'Platform_Types.h'
-
-        self.implementation_data_type_sint8_least = ET.SubElement(self.ImplementationDataTypes_platform_folder_elements, 'IMPLEMENTATION-DATA-TYPE')
-        self.variables['implementation_data_type_sint8_least'] = self.implementation_data_type_sint8_least
-        self.implementation_data_type_sint8_least_short_name = ET.SubElement(self.implementation_data_type_sint8_least, 'SHORT-NAME')
-        self.variables['implementation_data_type_sint8_least_short_name'] = self.implementation_data_type_sint8_least_short_name
-        self.implementation_data_type_sint8_least_short_name.text = 'sint8_least'
-        self.implementation_data_type_sint8_least_long_name = ET.SubElement(self.implementation_data_type_sint8_least, 'LONG-NAME')
-        self.variables['implementation_data_type_sint8_least_long_name'] = self.implementation_data_type_sint8_least_long_name
-        self.implementation_data_type_sint8_least_l_4 = ET.SubElement(self.implementation_data_type_sint8_least_long_name, 'L-4')
-        self.variables['implementation_data_type_sint8_least_l_4'] = self.implementation_data_type_sint8_least_l_4
-        self.implementation_data_type_sint8_least_l_4.text = 'sint8_least'
-        self.implementation_data_type_sint8_least_l_4.attrib = {'L': 'EN'}
-        self.implementation_data_type_sint8_least_category = ET.SubElement(self.implementation_data_type_sint8_least, 'CATEGORY')
-        self.variables['implementation_data_type_sint8_least_category'] = self.implementation_data_type_sint8_least_category
-        self.implementation_data_type_sint8_least_category.text = 'VALUE'
-        self.implementation_data_type_sint8_least_sw_data_def_props = ET.SubElement(self.implementation_data_type_sint8_least, 'SW-DATA-DEF-PROPS')
-        self.variables['implementation_data_type_sint8_least_sw_data_def_props'] = self.implementation_data_type_sint8_least_sw_data_def_props
-        self.implementation_data_type_sint8_least_sw_data_def_props_variants = ET.SubElement(self.implementation_data_type_sint8_least_sw_data_def_props, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['implementation_data_type_sint8_least_sw_data_def_props_variants'] = self.implementation_data_type_sint8_least_sw_data_def_props_variants
-        self.implementation_data_type_sint8_least_sw_data_def_props_conditional = ET.SubElement(self.implementation_data_type_sint8_least_sw_data_def_props_variants, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['implementation_data_type_sint8_least_sw_data_def_props_conditional'] = self.implementation_data_type_sint8_least_sw_data_def_props_conditional
-        self.data_constr_ref10 = ET.SubElement(self.implementation_data_type_sint8_least_sw_data_def_props_conditional, 'DATA-CONSTR-REF')
-        self.variables['data_constr_ref10'] = self.data_constr_ref10
-        self.data_constr_ref10.text = '/AUTOSAR/AUTOSAR_Platform/DataConstrs/sint8_least'
-        self.data_constr_ref10.attrib = {'DEST': 'DATA-CONSTR'}
-        self.implementation_data_type_sint8_least_type_emitter = ET.SubElement(self.implementation_data_type_sint8_least, 'TYPE-EMITTER')
-        self.variables['implementation_data_type_sint8_least_type_emitter'] = self.implementation_data_type_sint8_least_type_emitter
-        self.implementation_data_type_sint8_least_type_emitter.text = 'Platform_Types.h'
-
-        self.implementation_data_type_uint16 = ET.SubElement(self.ImplementationDataTypes_platform_folder_elements, 'IMPLEMENTATION-DATA-TYPE')
-        self.variables['implementation_data_type_uint16'] = self.implementation_data_type_uint16
-        self.implementation_data_type_uint16_short_name = ET.SubElement(self.implementation_data_type_uint16, 'SHORT-NAME')
-        self.variables['implementation_data_type_uint16_short_name'] = self.implementation_data_type_uint16_short_name
-        self.implementation_data_type_uint16_short_name.text = 'uint16'
-        self.implementation_data_type_uint16_long_name = ET.SubElement(self.implementation_data_type_uint16, 'LONG-NAME')
-        self.variables['implementation_data_type_uint16_long_name'] = self.implementation_data_type_uint16_long_name
-        self.implementation_data_type_uint16_l_4 = ET.SubElement(self.implementation_data_type_uint16_long_name, 'L-4')
-        self.variables['implementation_data_type_uint16_l_4'] = self.implementation_data_type_uint16_l_4
-        self.implementation_data_type_uint16_l_4.text = 'uint16'
-        self.implementation_data_type_uint16_l_4.attrib = {'L': 'EN'}
-        self.implementation_data_type_uint16_category = ET.SubElement(self.implementation_data_type_uint16, 'CATEGORY')
-        self.variables['implementation_data_type_uint16_category'] = self.implementation_data_type_uint16_category
-        self.implementation_data_type_uint16_category.text = 'VALUE'
-        self.implementation_data_type_uint16_sw_data_def_props = ET.SubElement(self.implementation_data_type_uint16, 'SW-DATA-DEF-PROPS')
-        self.variables['implementation_data_type_uint16_sw_data_def_props'] = self.implementation_data_type_uint16_sw_data_def_props
-        self.implementation_data_type_uint16_sw_data_def_props_variants = ET.SubElement(self.implementation_data_type_uint16_sw_data_def_props, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['implementation_data_type_uint16_sw_data_def_props_variants'] = self.implementation_data_type_uint16_sw_data_def_props_variants
-        self.implementation_data_type_uint16_sw_data_def_props_conditional = ET.SubElement(self.implementation_data_type_uint16_sw_data_def_props_variants, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['implementation_data_type_uint16_sw_data_def_props_conditional'] = self.implementation_data_type_uint16_sw_data_def_props_conditional
-        self.implementation_data_type_uint16_base_type_ref = ET.SubElement(self.implementation_data_type_uint16_sw_data_def_props_conditional, 'BASE-TYPE-REF')
-        self.variables['implementation_data_type_uint16_base_type_ref'] = self.implementation_data_type_uint16_base_type_ref
-        self.implementation_data_type_uint16_base_type_ref.text = '/AUTOSAR/AUTOSAR_Platform/BaseTypes/uint16'
-        self.implementation_data_type_uint16_base_type_ref.attrib = {'DEST': 'SW-BASE-TYPE'}
-        self.data_constr_ref11 = ET.SubElement(self.implementation_data_type_uint16_sw_data_def_props_conditional, 'DATA-CONSTR-REF')
-        self.variables['data_constr_ref11'] = self.data_constr_ref11
-        self.data_constr_ref11.text = '/AUTOSAR/AUTOSAR_Platform/DataConstrs/uint16'
-        self.data_constr_ref11.attrib = {'DEST': 'DATA-CONSTR'}
-        self.implementation_data_type_uint16_type_emitter = ET.SubElement(self.implementation_data_type_uint16, 'TYPE-EMITTER')
-        self.variables['implementation_data_type_uint16_type_emitter'] = self.implementation_data_type_uint16_type_emitter
-        self.implementation_data_type_uint16_type_emitter.text = 'Platform_Types.h'
-
-        self.implementation_data_type_uint16_least = ET.SubElement(self.ImplementationDataTypes_platform_folder_elements, 'IMPLEMENTATION-DATA-TYPE')
-        self.variables['implementation_data_type_uint16_least'] = self.implementation_data_type_uint16_least
-        self.implementation_data_type_uint16_least_short_name = ET.SubElement(self.implementation_data_type_uint16_least, 'SHORT-NAME')
-        self.variables['implementation_data_type_uint16_least_short_name'] = self.implementation_data_type_uint16_least_short_name
-        self.implementation_data_type_uint16_least_short_name.text = 'uint16_least'
-        self.implementation_data_type_uint16_least_long_name = ET.SubElement(self.implementation_data_type_uint16_least, 'LONG-NAME')
-        self.variables['implementation_data_type_uint16_least_long_name'] = self.implementation_data_type_uint16_least_long_name
-        self.implementation_data_type_uint16_least_l_4 = ET.SubElement(self.implementation_data_type_uint16_least_long_name, 'L-4')
-        self.variables['implementation_data_type_uint16_least_l_4'] = self.implementation_data_type_uint16_least_l_4
-        self.implementation_data_type_uint16_least_l_4.text = 'uint16_least'
-        self.implementation_data_type_uint16_least_l_4.attrib = {'L': 'EN'}
-        self.implementation_data_type_uint16_least_category = ET.SubElement(self.implementation_data_type_uint16_least, 'CATEGORY')
-        self.variables['implementation_data_type_uint16_least_category'] = self.implementation_data_type_uint16_least_category
-        self.implementation_data_type_uint16_least_category.text = 'VALUE'
-        self.implementation_data_type_uint16_least_sw_data_def_props = ET.SubElement(self.implementation_data_type_uint16_least, 'SW-DATA-DEF-PROPS')
-        self.variables['implementation_data_type_uint16_least_sw_data_def_props'] = self.implementation_data_type_uint16_least_sw_data_def_props
-        self.implementation_data_type_uint16_least_sw_data_def_props_variants = ET.SubElement(self.implementation_data_type_uint16_least_sw_data_def_props, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['implementation_data_type_uint16_least_sw_data_def_props_variants'] = self.implementation_data_type_uint16_least_sw_data_def_props_variants
-        self.implementation_data_type_uint16_least_sw_data_def_props_conditional = ET.SubElement(self.implementation_data_type_uint16_least_sw_data_def_props_variants, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['implementation_data_type_uint16_least_sw_data_def_props_conditional'] = self.implementation_data_type_uint16_least_sw_data_def_props_conditional
-        self.data_constr_ref12 = ET.SubElement(self.implementation_data_type_uint16_least_sw_data_def_props_conditional, 'DATA-CONSTR-REF')
-        self.variables['data_constr_ref12'] = self.data_constr_ref12
-        self.data_constr_ref12.text = '/AUTOSAR/AUTOSAR_Platform/DataConstrs/uint16_least'
-        self.data_constr_ref12.attrib = {'DEST': 'DATA-CONSTR'}
-        self.implementation_data_type_uint16_least_type_emitter = ET.SubElement(self.implementation_data_type_uint16_least, 'TYPE-EMITTER')
-        self.variables['implementation_data_type_uint16_least_type_emitter'] = self.implementation_data_type_uint16_least_type_emitter
-        self.implementation_data_type_uint16_least_type_emitter.text = 'Platform_Types.h'
-
-        self.implementation_data_type_uint32 = ET.SubElement(self.ImplementationDataTypes_platform_folder_elements, 'IMPLEMENTATION-DATA-TYPE')
-        self.variables['implementation_data_type_uint32'] = self.implementation_data_type_uint32
-        self.implementation_data_type_uint32_short_name = ET.SubElement(self.implementation_data_type_uint32, 'SHORT-NAME')
-        self.variables['implementation_data_type_uint32_short_name'] = self.implementation_data_type_uint32_short_name
-        self.implementation_data_type_uint32_short_name.text = 'uint32'
-        self.implementation_data_type_uint32_long_name = ET.SubElement(self.implementation_data_type_uint32, 'LONG-NAME')
-        self.variables['implementation_data_type_uint32_long_name'] = self.implementation_data_type_uint32_long_name
-        self.implementation_data_type_uint32_l_4 = ET.SubElement(self.implementation_data_type_uint32_long_name, 'L-4')
-        self.variables['implementation_data_type_uint32_l_4'] = self.implementation_data_type_uint32_l_4
-        self.implementation_data_type_uint32_l_4.text = 'uint32'
-        self.implementation_data_type_uint32_l_4.attrib = {'L': 'EN'}
-        self.implementation_data_type_uint32_category = ET.SubElement(self.implementation_data_type_uint32, 'CATEGORY')
-        self.variables['implementation_data_type_uint32_category'] = self.implementation_data_type_uint32_category
-        self.implementation_data_type_uint32_category.text = 'VALUE'
-        self.implementation_data_type_uint32_sw_data_def_props = ET.SubElement(self.implementation_data_type_uint32, 'SW-DATA-DEF-PROPS')
-        self.variables['implementation_data_type_uint32_sw_data_def_props'] = self.implementation_data_type_uint32_sw_data_def_props
-        self.implementation_data_type_uint32_sw_data_def_props_variants = ET.SubElement(self.implementation_data_type_uint32_sw_data_def_props, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['implementation_data_type_uint32_sw_data_def_props_variants'] = self.implementation_data_type_uint32_sw_data_def_props_variants
-        self.implementation_data_type_uint32_sw_data_def_props_conditional = ET.SubElement(self.implementation_data_type_uint32_sw_data_def_props_variants, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['implementation_data_type_uint32_sw_data_def_props_conditional'] = self.implementation_data_type_uint32_sw_data_def_props_conditional
-        self.implementation_data_type_uint32_base_type_ref = ET.SubElement(self.implementation_data_type_uint32_sw_data_def_props_conditional, 'BASE-TYPE-REF')
-        self.variables['implementation_data_type_uint32_base_type_ref'] = self.implementation_data_type_uint32_base_type_ref
-        self.implementation_data_type_uint32_base_type_ref.text = '/AUTOSAR/AUTOSAR_Platform/BaseTypes/uint32'
-        self.implementation_data_type_uint32_base_type_ref.attrib = {'DEST': 'SW-BASE-TYPE'}
-        self.data_constr_ref13 = ET.SubElement(self.implementation_data_type_uint32_sw_data_def_props_conditional, 'DATA-CONSTR-REF')
-        self.variables['data_constr_ref13'] = self.data_constr_ref13
-        self.data_constr_ref13.text = '/AUTOSAR/AUTOSAR_Platform/DataConstrs/uint32'
-        self.data_constr_ref13.attrib = {'DEST': 'DATA-CONSTR'}
-        self.implementation_data_type_uint32_type_emitter = ET.SubElement(self.implementation_data_type_uint32, 'TYPE-EMITTER')
-        self.variables['implementation_data_type_uint32_type_emitter'] = self.implementation_data_type_uint32_type_emitter
-        self.implementation_data_type_uint32_type_emitter.text = 'Platform_Types.h'
-
-        self.implementation_data_type_uint32_least = ET.SubElement(self.ImplementationDataTypes_platform_folder_elements, 'IMPLEMENTATION-DATA-TYPE')
-        self.variables['implementation_data_type_uint32_least'] = self.implementation_data_type_uint32_least
-        self.implementation_data_type_uint32_least_short_name = ET.SubElement(self.implementation_data_type_uint32_least, 'SHORT-NAME')
-        self.variables['implementation_data_type_uint32_least_short_name'] = self.implementation_data_type_uint32_least_short_name
-        self.implementation_data_type_uint32_least_short_name.text = 'uint32_least'
-        self.implementation_data_type_uint32_least_long_name = ET.SubElement(self.implementation_data_type_uint32_least, 'LONG-NAME')
-        self.variables['implementation_data_type_uint32_least_long_name'] = self.implementation_data_type_uint32_least_long_name
-        self.implementation_data_type_uint32_least_l_4 = ET.SubElement(self.implementation_data_type_uint32_least_long_name, 'L-4')
-        self.variables['implementation_data_type_uint32_least_l_4'] = self.implementation_data_type_uint32_least_l_4
-        self.implementation_data_type_uint32_least_l_4.text = 'uint32_least'
-        self.implementation_data_type_uint32_least_l_4.attrib = {'L': 'EN'}
-        self.implementation_data_type_uint32_least_category = ET.SubElement(self.implementation_data_type_uint32_least, 'CATEGORY')
-        self.variables['implementation_data_type_uint32_least_category'] = self.implementation_data_type_uint32_least_category
-        self.implementation_data_type_uint32_least_category.text = 'VALUE'
-        self.implementation_data_type_uint32_least_sw_data_def_props = ET.SubElement(self.implementation_data_type_uint32_least, 'SW-DATA-DEF-PROPS')
-        self.variables['implementation_data_type_uint32_least_sw_data_def_props'] = self.implementation_data_type_uint32_least_sw_data_def_props
-        self.implementation_data_type_uint32_least_sw_data_def_props_variants = ET.SubElement(self.implementation_data_type_uint32_least_sw_data_def_props, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['implementation_data_type_uint32_least_sw_data_def_props_variants'] = self.implementation_data_type_uint32_least_sw_data_def_props_variants
-        self.implementation_data_type_uint32_least_sw_data_def_props_conditional = ET.SubElement(self.implementation_data_type_uint32_least_sw_data_def_props_variants, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['implementation_data_type_uint32_least_sw_data_def_props_conditional'] = self.implementation_data_type_uint32_least_sw_data_def_props_conditional
-        self.data_constr_ref14 = ET.SubElement(self.implementation_data_type_uint32_least_sw_data_def_props_conditional, 'DATA-CONSTR-REF')
-        self.variables['data_constr_ref14'] = self.data_constr_ref14
-        self.data_constr_ref14.text = '/AUTOSAR/AUTOSAR_Platform/DataConstrs/uint32_least'
-        self.data_constr_ref14.attrib = {'DEST': 'DATA-CONSTR'}
-        self.implementation_data_type_uint32_least_type_emitter = ET.SubElement(self.implementation_data_type_uint32_least, 'TYPE-EMITTER')
-        self.variables['implementation_data_type_uint32_least_type_emitter'] = self.implementation_data_type_uint32_least_type_emitter
-        self.implementation_data_type_uint32_least_type_emitter.text = 'Platform_Types.h'
-
-        self.implementation_data_type_uint64 = ET.SubElement(self.ImplementationDataTypes_platform_folder_elements, 'IMPLEMENTATION-DATA-TYPE')
-        self.variables['implementation_data_type_uint64'] = self.implementation_data_type_uint64
-        self.implementation_data_type_uint64_short_name = ET.SubElement(self.implementation_data_type_uint64, 'SHORT-NAME')
-        self.variables['implementation_data_type_uint64_short_name'] = self.implementation_data_type_uint64_short_name
-        self.implementation_data_type_uint64_short_name.text = 'uint64'
-        self.implementation_data_type_uint64_long_name = ET.SubElement(self.implementation_data_type_uint64, 'LONG-NAME')
-        self.variables['implementation_data_type_uint64_long_name'] = self.implementation_data_type_uint64_long_name
-        self.implementation_data_type_uint64_l_4 = ET.SubElement(self.implementation_data_type_uint64_long_name, 'L-4')
-        self.variables['implementation_data_type_uint64_l_4'] = self.implementation_data_type_uint64_l_4
-        self.implementation_data_type_uint64_l_4.text = 'uint64'
-        self.implementation_data_type_uint64_l_4.attrib = {'L': 'EN'}
-        self.implementation_data_type_uint64_category = ET.SubElement(self.implementation_data_type_uint64, 'CATEGORY')
-        self.variables['implementation_data_type_uint64_category'] = self.implementation_data_type_uint64_category
-        self.implementation_data_type_uint64_category.text = 'VALUE'
-        self.implementation_data_type_uint64_sw_data_def_props = ET.SubElement(self.implementation_data_type_uint64, 'SW-DATA-DEF-PROPS')
-        self.variables['implementation_data_type_uint64_sw_data_def_props'] = self.implementation_data_type_uint64_sw_data_def_props
-        self.implementation_data_type_uint64_sw_data_def_props_variants = ET.SubElement(self.implementation_data_type_uint64_sw_data_def_props, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['implementation_data_type_uint64_sw_data_def_props_variants'] = self.implementation_data_type_uint64_sw_data_def_props_variants
-        self.implementation_data_type_uint64_sw_data_def_props_conditional = ET.SubElement(self.implementation_data_type_uint64_sw_data_def_props_variants, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['implementation_data_type_uint64_sw_data_def_props_conditional'] = self.implementation_data_type_uint64_sw_data_def_props_conditional
-        self.implementation_data_type_uint64_base_type_ref = ET.SubElement(self.implementation_data_type_uint64_sw_data_def_props_conditional, 'BASE-TYPE-REF')
-        self.variables['implementation_data_type_uint64_base_type_ref'] = self.implementation_data_type_uint64_base_type_ref
-        self.implementation_data_type_uint64_base_type_ref.text = '/AUTOSAR/AUTOSAR_Platform/BaseTypes/uint64'
-        self.implementation_data_type_uint64_base_type_ref.attrib = {'DEST': 'SW-BASE-TYPE'}
-        self.data_constr_ref15 = ET.SubElement(self.implementation_data_type_uint64_sw_data_def_props_conditional, 'DATA-CONSTR-REF')
-        self.variables['data_constr_ref15'] = self.data_constr_ref15
-        self.data_constr_ref15.text = '/AUTOSAR/AUTOSAR_Platform/DataConstrs/uint64'
-        self.data_constr_ref15.attrib = {'DEST': 'DATA-CONSTR'}
-        self.implementation_data_type_uint64_type_emitter = ET.SubElement(self.implementation_data_type_uint64, 'TYPE-EMITTER')
-        self.variables['implementation_data_type_uint64_type_emitter'] = self.implementation_data_type_uint64_type_emitter
-        self.implementation_data_type_uint64_type_emitter.text = 'Platform_Types.h'
-
-        self.implementation_data_type_uint8 = ET.SubElement(self.ImplementationDataTypes_platform_folder_elements, 'IMPLEMENTATION-DATA-TYPE')
-        self.variables['implementation_data_type_uint8'] = self.implementation_data_type_uint8
-        self.implementation_data_type_uint8_short_name = ET.SubElement(self.implementation_data_type_uint8, 'SHORT-NAME')
-        self.variables['implementation_data_type_uint8_short_name'] = self.implementation_data_type_uint8_short_name
-        self.implementation_data_type_uint8_short_name.text = 'uint8'
-        self.implementation_data_type_uint8_long_name = ET.SubElement(self.implementation_data_type_uint8, 'LONG-NAME')
-        self.variables['implementation_data_type_uint8_long_name'] = self.implementation_data_type_uint8_long_name
-        self.implementation_data_type_uint8_l_4 = ET.SubElement(self.implementation_data_type_uint8_long_name, 'L-4')
-        self.variables['implementation_data_type_uint8_l_4'] = self.implementation_data_type_uint8_l_4
-        self.implementation_data_type_uint8_l_4.text = 'uint8'
-        self.implementation_data_type_uint8_l_4.attrib = {'L': 'EN'}
-        self.implementation_data_type_uint8_category = ET.SubElement(self.implementation_data_type_uint8, 'CATEGORY')
-        self.variables['implementation_data_type_uint8_category'] = self.implementation_data_type_uint8_category
-        self.implementation_data_type_uint8_category.text = 'VALUE'
-        self.implementation_data_type_uint8_sw_data_def_props = ET.SubElement(self.implementation_data_type_uint8, 'SW-DATA-DEF-PROPS')
-        self.variables['implementation_data_type_uint8_sw_data_def_props'] = self.implementation_data_type_uint8_sw_data_def_props
-        self.implementation_data_type_uint8_sw_data_def_props_variants = ET.SubElement(self.implementation_data_type_uint8_sw_data_def_props, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['implementation_data_type_uint8_sw_data_def_props_variants'] = self.implementation_data_type_uint8_sw_data_def_props_variants
-        self.implementation_data_type_uint8_sw_data_def_props_conditional = ET.SubElement(self.implementation_data_type_uint8_sw_data_def_props_variants, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['implementation_data_type_uint8_sw_data_def_props_conditional'] = self.implementation_data_type_uint8_sw_data_def_props_conditional
-        self.implementation_data_type_uint8_base_type_ref = ET.SubElement(self.implementation_data_type_uint8_sw_data_def_props_conditional, 'BASE-TYPE-REF')
-        self.variables['implementation_data_type_uint8_base_type_ref'] = self.implementation_data_type_uint8_base_type_ref
-        self.implementation_data_type_uint8_base_type_ref.text = '/AUTOSAR/AUTOSAR_Platform/BaseTypes/uint8'
-        self.implementation_data_type_uint8_base_type_ref.attrib = {'DEST': 'SW-BASE-TYPE'}
-        self.data_constr_ref16 = ET.SubElement(self.implementation_data_type_uint8_sw_data_def_props_conditional, 'DATA-CONSTR-REF')
-        self.variables['data_constr_ref16'] = self.data_constr_ref16
-        self.data_constr_ref16.text = '/AUTOSAR/AUTOSAR_Platform/DataConstrs/uint8'
-        self.data_constr_ref16.attrib = {'DEST': 'DATA-CONSTR'}
-        self.implementation_data_type_uint8_type_emitter = ET.SubElement(self.implementation_data_type_uint8, 'TYPE-EMITTER')
-        self.variables['implementation_data_type_uint8_type_emitter'] = self.implementation_data_type_uint8_type_emitter
-        self.implementation_data_type_uint8_type_emitter.text = 'Platform_Types.h'
-
-        self.implementation_data_type_uint8_least = ET.SubElement(self.ImplementationDataTypes_platform_folder_elements, 'IMPLEMENTATION-DATA-TYPE')
-        self.variables['implementation_data_type_uint8_least'] = self.implementation_data_type_uint8_least
-        self.implementation_data_type_uint8_least_short_name = ET.SubElement(self.implementation_data_type_uint8_least, 'SHORT-NAME')
-        self.variables['implementation_data_type_uint8_least_short_name'] = self.implementation_data_type_uint8_least_short_name
-        self.implementation_data_type_uint8_least_short_name.text = 'uint8_least'
-        self.implementation_data_type_uint8_least_long_name = ET.SubElement(self.implementation_data_type_uint8_least, 'LONG-NAME')
-        self.variables['implementation_data_type_uint8_least_long_name'] = self.implementation_data_type_uint8_least_long_name
-        self.implementation_data_type_uint8_least_l_4 = ET.SubElement(self.implementation_data_type_uint8_least_long_name, 'L-4')
-        self.variables['implementation_data_type_uint8_least_l_4'] = self.implementation_data_type_uint8_least_l_4
-        self.implementation_data_type_uint8_least_l_4.text = 'uint8_least'
-        self.implementation_data_type_uint8_least_l_4.attrib = {'L': 'EN'}
-        self.implementation_data_type_uint8_least_category = ET.SubElement(self.implementation_data_type_uint8_least, 'CATEGORY')
-        self.variables['implementation_data_type_uint8_least_category'] = self.implementation_data_type_uint8_least_category
-        self.implementation_data_type_uint8_least_category.text = 'VALUE'
-        self.implementation_data_type_uint8_least_sw_data_def_props = ET.SubElement(self.implementation_data_type_uint8_least, 'SW-DATA-DEF-PROPS')
-        self.variables['implementation_data_type_uint8_least_sw_data_def_props'] = self.implementation_data_type_uint8_least_sw_data_def_props
-        self.implementation_data_type_uint8_least_sw_data_def_props_variants = ET.SubElement(self.implementation_data_type_uint8_least_sw_data_def_props, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['implementation_data_type_uint8_least_sw_data_def_props_variants'] = self.implementation_data_type_uint8_least_sw_data_def_props_variants
-        self.implementation_data_type_uint8_least_sw_data_def_props_conditional = ET.SubElement(self.implementation_data_type_uint8_least_sw_data_def_props_variants, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['implementation_data_type_uint8_least_sw_data_def_props_conditional'] = self.implementation_data_type_uint8_least_sw_data_def_props_conditional
-        self.data_constr_ref17 = ET.SubElement(self.implementation_data_type_uint8_least_sw_data_def_props_conditional, 'DATA-CONSTR-REF')
-        self.variables['data_constr_ref17'] = self.data_constr_ref17
-        self.data_constr_ref17.text = '/AUTOSAR/AUTOSAR_Platform/DataConstrs/uint8_least'
-        self.data_constr_ref17.attrib = {'DEST': 'DATA-CONSTR'}
-        self.implementation_data_type_uint8_least_type_emitter = ET.SubElement(self.implementation_data_type_uint8_least, 'TYPE-EMITTER')
-        self.variables['implementation_data_type_uint8_least_type_emitter'] = self.implementation_data_type_uint8_least_type_emitter
-        self.implementation_data_type_uint8_least_type_emitter.text = 'Platform_Types.h'
-
-        self.AUTOSAR_Std_folder = ET.SubElement(self.autosar_subfolders, 'AR-PACKAGE')
-        self.variables['AUTOSAR_Std_folder'] = self.AUTOSAR_Std_folder
-        self.AUTOSAR_Std_folder_short_name = ET.SubElement(self.AUTOSAR_Std_folder, 'SHORT-NAME')
-        self.variables['AUTOSAR_Std_folder_short_name'] = self.AUTOSAR_Std_folder_short_name
-        self.AUTOSAR_Std_folder_short_name.text = 'AUTOSAR_Std'
-
-        self.AUTOSAR_Std_subfolders = ET.SubElement(self.AUTOSAR_Std_folder, 'AR-PACKAGES')
-        self.variables['AUTOSAR_Std_subfolders'] = self.AUTOSAR_Std_subfolders
-
-        self.BswModuleEntrys_folder = ET.SubElement(self.AUTOSAR_Std_subfolders, 'AR-PACKAGE')
-        self.variables['BswModuleEntrys_folder'] = self.BswModuleEntrys_folder
-        self.BswModuleEntrys_folder_short_name = ET.SubElement(self.BswModuleEntrys_folder, 'SHORT-NAME')
-        self.variables['BswModuleEntrys_folder_short_name'] = self.BswModuleEntrys_folder_short_name
-        self.BswModuleEntrys_folder_short_name.text = 'BswModuleEntrys'
-        self.BswModuleEntrys_folder_elements = ET.SubElement(self.BswModuleEntrys_folder, 'ELEMENTS')
-        self.variables['BswModuleEntrys_folder_elements'] = self.BswModuleEntrys_folder_elements
-
-        self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType = ET.SubElement(self.BswModuleEntrys_folder_elements, 'BSW-MODULE-ENTRY')
-        self.variables['bsw_module_entry_Std_ExtractProtocolHeaderFieldsType'] = self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType
-        self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_short_name = ET.SubElement(self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType, 'SHORT-NAME')
-        self.variables['bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_short_name'] = self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_short_name
-        self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_short_name.text = 'Std_ExtractProtocolHeaderFieldsType'
-        self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_sw_service_impl_policy = ET.SubElement(self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType, 'SW-SERVICE-IMPL-POLICY')
-        self.variables['bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_sw_service_impl_policy'] = self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_sw_service_impl_policy
-        self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_sw_service_impl_policy.text = 'STANDARD'
-        self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_bsw_entry_kind = ET.SubElement(self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType, 'BSW-ENTRY-KIND')
-        self.variables['bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_bsw_entry_kind'] = self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_bsw_entry_kind
-        self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_bsw_entry_kind.text = 'ABSTRACT'
-
-        self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type = ET.SubElement(self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType, 'RETURN-TYPE')
-        self.variables['bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type'] = self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type
-        self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type_short_name = ET.SubElement(self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type, 'SHORT-NAME')
-        self.variables['bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type_short_name'] = self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type_short_name
-        self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type_short_name.text = 'Std_ReturnType'
-        self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type_category = ET.SubElement(self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type, 'CATEGORY')
-        self.variables['bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type_category'] = self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type_category
-        self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type_category.text = 'TYPE_REFERENCE'
-        self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type_sw_data_def_props = ET.SubElement(self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type, 'SW-DATA-DEF-PROPS')
-        self.variables['bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type_sw_data_def_props'] = self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type_sw_data_def_props
-        self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type_sw_data_def_props_variants = ET.SubElement(self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type_sw_data_def_props, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type_sw_data_def_props_variants'] = self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type_sw_data_def_props_variants
-        self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type_sw_data_def_props_conditional = ET.SubElement(self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type_sw_data_def_props_variants, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type_sw_data_def_props_conditional'] = self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type_sw_data_def_props_conditional
-        self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type_sw_data_def_props_conditional_IDT_ref = ET.SubElement(self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type_sw_data_def_props_conditional, 'IMPLEMENTATION-DATA-TYPE-REF')
-        self.variables['bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type_sw_data_def_props_conditional_IDT_ref'] = self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type_sw_data_def_props_conditional_IDT_ref
-        self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type_sw_data_def_props_conditional_IDT_ref.text = '/AUTOSAR/AUTOSAR_Std/ImplementationDataTypes/Std_ReturnType'
-        self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_return_type_sw_data_def_props_conditional_IDT_ref.attrib = {'DEST': 'IMPLEMENTATION-DATA-TYPE'}
-
-        self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_arguments = ET.SubElement(self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType, 'ARGUMENTS')
-        self.variables['bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_arguments'] = self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_arguments
-        self.sw_service_arg1 = ET.SubElement(self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_arguments, 'SW-SERVICE-ARG')
-        self.variables['sw_service_arg1'] = self.sw_service_arg1
-        self.short_name305 = ET.SubElement(self.sw_service_arg1, 'SHORT-NAME')
-        self.variables['short_name305'] = self.short_name305
-        self.short_name305.text = 'buffer'
-        self.category41 = ET.SubElement(self.sw_service_arg1, 'CATEGORY')
-        self.variables['category41'] = self.category41
-        self.category41.text = 'DATA_REFERENCE'
-        self.direction1 = ET.SubElement(self.sw_service_arg1, 'DIRECTION')
-        self.variables['direction1'] = self.direction1
-        self.direction1.text = 'IN'
-        self.sw_data_def_props23 = ET.SubElement(self.sw_service_arg1, 'SW-DATA-DEF-PROPS')
-        self.variables['sw_data_def_props23'] = self.sw_data_def_props23
-        self.sw_data_def_props_variants23 = ET.SubElement(self.sw_data_def_props23, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['sw_data_def_props_variants23'] = self.sw_data_def_props_variants23
-        self.sw_data_def_props_conditional23 = ET.SubElement(self.sw_data_def_props_variants23, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['sw_data_def_props_conditional23'] = self.sw_data_def_props_conditional23
-        self.sw_pointer_target_props3 = ET.SubElement(self.sw_data_def_props_conditional23, 'SW-POINTER-TARGET-PROPS')
-        self.variables['sw_pointer_target_props3'] = self.sw_pointer_target_props3
-        self.target_category3 = ET.SubElement(self.sw_pointer_target_props3, 'TARGET-CATEGORY')
-        self.variables['target_category3'] = self.target_category3
-        self.target_category3.text = 'TYPE_REFERENCE'
-        self.sw_data_def_props24 = ET.SubElement(self.sw_pointer_target_props3, 'SW-DATA-DEF-PROPS')
-        self.variables['sw_data_def_props24'] = self.sw_data_def_props24
-        self.sw_data_def_props_variants24 = ET.SubElement(self.sw_data_def_props24, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['sw_data_def_props_variants24'] = self.sw_data_def_props_variants24
-        self.sw_data_def_props_conditional24 = ET.SubElement(self.sw_data_def_props_variants24, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['sw_data_def_props_conditional24'] = self.sw_data_def_props_conditional24
-        self.implementation_data_type_ref2 = ET.SubElement(self.sw_data_def_props_conditional24, 'IMPLEMENTATION-DATA-TYPE-REF')
-        self.variables['implementation_data_type_ref2'] = self.implementation_data_type_ref2
-        self.implementation_data_type_ref2.text = '/AUTOSAR/AUTOSAR_Platform/ImplementationDataTypes/uint8'
-        self.implementation_data_type_ref2.attrib = {'DEST': 'IMPLEMENTATION-DATA-TYPE'}
-        self.sw_impl_policy2 = ET.SubElement(self.sw_data_def_props_conditional24, 'SW-IMPL-POLICY')
-        self.variables['sw_impl_policy2'] = self.sw_impl_policy2
-        self.sw_impl_policy2.text = 'CONST'
-
-        self.sw_service_arg2 = ET.SubElement(self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_arguments, 'SW-SERVICE-ARG')
-        self.variables['sw_service_arg2'] = self.sw_service_arg2
-        self.short_name306 = ET.SubElement(self.sw_service_arg2, 'SHORT-NAME')
-        self.variables['short_name306'] = self.short_name306
-        self.short_name306.text = 'bufferLength'
-        self.category42 = ET.SubElement(self.sw_service_arg2, 'CATEGORY')
-        self.variables['category42'] = self.category42
-        self.category42.text = 'TYPE_REFERENCE'
-        self.direction2 = ET.SubElement(self.sw_service_arg2, 'DIRECTION')
-        self.variables['direction2'] = self.direction2
-        self.direction2.text = 'IN'
-        self.sw_data_def_props25 = ET.SubElement(self.sw_service_arg2, 'SW-DATA-DEF-PROPS')
-        self.variables['sw_data_def_props25'] = self.sw_data_def_props25
-        self.sw_data_def_props_variants25 = ET.SubElement(self.sw_data_def_props25, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['sw_data_def_props_variants25'] = self.sw_data_def_props_variants25
-        self.sw_data_def_props_conditional25 = ET.SubElement(self.sw_data_def_props_variants25, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['sw_data_def_props_conditional25'] = self.sw_data_def_props_conditional25
-        self.implementation_data_type_ref3 = ET.SubElement(self.sw_data_def_props_conditional25, 'IMPLEMENTATION-DATA-TYPE-REF')
-        self.variables['implementation_data_type_ref3'] = self.implementation_data_type_ref3
-        self.implementation_data_type_ref3.text = '/AUTOSAR/AUTOSAR_Platform/ImplementationDataTypes/uint32'
-        self.implementation_data_type_ref3.attrib = {'DEST': 'IMPLEMENTATION-DATA-TYPE'}
-
-        self.sw_service_arg3 = ET.SubElement(self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_arguments, 'SW-SERVICE-ARG')
-        self.variables['sw_service_arg3'] = self.sw_service_arg3
-        self.short_name307 = ET.SubElement(self.sw_service_arg3, 'SHORT-NAME')
-        self.variables['short_name307'] = self.short_name307
-        self.short_name307.text = 'messageType'
-        self.category43 = ET.SubElement(self.sw_service_arg3, 'CATEGORY')
-        self.variables['category43'] = self.category43
-        self.category43.text = 'DATA_REFERENCE'
-        self.direction3 = ET.SubElement(self.sw_service_arg3, 'DIRECTION')
-        self.variables['direction3'] = self.direction3
-        self.direction3.text = 'OUT'
-        self.sw_data_def_props26 = ET.SubElement(self.sw_service_arg3, 'SW-DATA-DEF-PROPS')
-        self.variables['sw_data_def_props26'] = self.sw_data_def_props26
-        self.sw_data_def_props_variants26 = ET.SubElement(self.sw_data_def_props26, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['sw_data_def_props_variants26'] = self.sw_data_def_props_variants26
-        self.sw_data_def_props_conditional26 = ET.SubElement(self.sw_data_def_props_variants26, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['sw_data_def_props_conditional26'] = self.sw_data_def_props_conditional26
-        self.sw_pointer_target_props4 = ET.SubElement(self.sw_data_def_props_conditional26, 'SW-POINTER-TARGET-PROPS')
-        self.variables['sw_pointer_target_props4'] = self.sw_pointer_target_props4
-        self.target_category4 = ET.SubElement(self.sw_pointer_target_props4, 'TARGET-CATEGORY')
-        self.variables['target_category4'] = self.target_category4
-        self.target_category4.text = 'TYPE_REFERENCE'
-        self.sw_data_def_props27 = ET.SubElement(self.sw_pointer_target_props4, 'SW-DATA-DEF-PROPS')
-        self.variables['sw_data_def_props27'] = self.sw_data_def_props27
-        self.sw_data_def_props_variants27 = ET.SubElement(self.sw_data_def_props27, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['sw_data_def_props_variants27'] = self.sw_data_def_props_variants27
-        self.sw_data_def_props_conditional27 = ET.SubElement(self.sw_data_def_props_variants27, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['sw_data_def_props_conditional27'] = self.sw_data_def_props_conditional27
-        self.implementation_data_type_ref4 = ET.SubElement(self.sw_data_def_props_conditional27, 'IMPLEMENTATION-DATA-TYPE-REF')
-        self.variables['implementation_data_type_ref4'] = self.implementation_data_type_ref4
-        self.implementation_data_type_ref4.text = '/AUTOSAR/AUTOSAR_Std/ImplementationDataTypes/Std_MessageTypeType'
-        self.implementation_data_type_ref4.attrib = {'DEST': 'IMPLEMENTATION-DATA-TYPE'}
-
-        self.sw_service_arg4 = ET.SubElement(self.bsw_module_entry_Std_ExtractProtocolHeaderFieldsType_arguments, 'SW-SERVICE-ARG')
-        self.variables['sw_service_arg4'] = self.sw_service_arg4
-        self.short_name308 = ET.SubElement(self.sw_service_arg4, 'SHORT-NAME')
-        self.variables['short_name308'] = self.short_name308
-        self.short_name308.text = 'messageResult'
-        self.category44 = ET.SubElement(self.sw_service_arg4, 'CATEGORY')
-        self.variables['category44'] = self.category44
-        self.category44.text = 'DATA_REFERENCE'
-        self.direction4 = ET.SubElement(self.sw_service_arg4, 'DIRECTION')
-        self.variables['direction4'] = self.direction4
-        self.direction4.text = 'OUT'
-        self.sw_data_def_props28 = ET.SubElement(self.sw_service_arg4, 'SW-DATA-DEF-PROPS')
-        self.variables['sw_data_def_props28'] = self.sw_data_def_props28
-        self.sw_data_def_props_variants28 = ET.SubElement(self.sw_data_def_props28, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['sw_data_def_props_variants28'] = self.sw_data_def_props_variants28
-        self.sw_data_def_props_conditional28 = ET.SubElement(self.sw_data_def_props_variants28, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['sw_data_def_props_conditional28'] = self.sw_data_def_props_conditional28
-        self.sw_pointer_target_props5 = ET.SubElement(self.sw_data_def_props_conditional28, 'SW-POINTER-TARGET-PROPS')
-        self.variables['sw_pointer_target_props5'] = self.sw_pointer_target_props5
-        self.target_category5 = ET.SubElement(self.sw_pointer_target_props5, 'TARGET-CATEGORY')
-        self.variables['target_category5'] = self.target_category5
-        self.target_category5.text = 'TYPE_REFERENCE'
-        self.sw_data_def_props29 = ET.SubElement(self.sw_pointer_target_props5, 'SW-DATA-DEF-PROPS')
-        self.variables['sw_data_def_props29'] = self.sw_data_def_props29
-        self.sw_data_def_props_variants29 = ET.SubElement(self.sw_data_def_props29, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['sw_data_def_props_variants29'] = self.sw_data_def_props_variants29
-        self.sw_data_def_props_conditional29 = ET.SubElement(self.sw_data_def_props_variants29, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['sw_data_def_props_conditional29'] = self.sw_data_def_props_conditional29
-        self.implementation_data_type_ref5 = ET.SubElement(self.sw_data_def_props_conditional29, 'IMPLEMENTATION-DATA-TYPE-REF')
-        self.variables['implementation_data_type_ref5'] = self.implementation_data_type_ref5
-        self.implementation_data_type_ref5.text = '/AUTOSAR/AUTOSAR_Std/ImplementationDataTypes/Std_MessageResultType'
-        self.implementation_data_type_ref5.attrib = {'DEST': 'IMPLEMENTATION-DATA-TYPE'}
-
-
-        self.CompuMethods_std_folder = ET.SubElement(self.AUTOSAR_Std_subfolders, 'AR-PACKAGE')
-        self.variables['CompuMethods_std_folder'] = self.CompuMethods_std_folder
-        self.CompuMethods_std_folder_short_name = ET.SubElement(self.CompuMethods_std_folder, 'SHORT-NAME')
-        self.variables['CompuMethods_std_folder_short_name'] = self.CompuMethods_std_folder_short_name
-        self.CompuMethods_std_folder_short_name.text = 'CompuMethods'
-        self.CompuMethods_std_foldercategory = ET.SubElement(self.CompuMethods_std_folder, 'CATEGORY')
-        self.variables['CompuMethods_std_foldercategory'] = self.CompuMethods_std_foldercategory
-        self.CompuMethods_std_foldercategory.text = 'STANDARD'
-        self.CompuMethods_std_folder_elements = ET.SubElement(self.CompuMethods_std_folder, 'ELEMENTS')
-        self.variables['CompuMethods_std_folder_elements'] = self.CompuMethods_std_folder_elements
-
-
-        self.compu_method2 = ET.SubElement(self.CompuMethods_std_folder_elements, 'COMPU-METHOD')
-        self.variables['compu_method2'] = self.compu_method2
-        self.short_name310 = ET.SubElement(self.compu_method2, 'SHORT-NAME')
-        self.variables['short_name310'] = self.short_name310
-        self.short_name310.text = 'Std_MessageResultType'
-        self.category46 = ET.SubElement(self.compu_method2, 'CATEGORY')
-        self.variables['category46'] = self.category46
-        self.category46.text = 'TEXTTABLE'
-        self.compu_internal_to_phys2 = ET.SubElement(self.compu_method2, 'COMPU-INTERNAL-TO-PHYS')
-        self.variables['compu_internal_to_phys2'] = self.compu_internal_to_phys2
-        self.compu_scales2 = ET.SubElement(self.compu_internal_to_phys2, 'COMPU-SCALES')
-        self.variables['compu_scales2'] = self.compu_scales2
-
-        self.compu_scale3 = ET.SubElement(self.compu_scales2, 'COMPU-SCALE')
-        self.variables['compu_scale3'] = self.compu_scale3
-        self.lower_limit20 = ET.SubElement(self.compu_scale3, 'LOWER-LIMIT')
-        self.variables['lower_limit20'] = self.lower_limit20
-        self.lower_limit20.text = '0x00'
-        self.lower_limit20.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.upper_limit20 = ET.SubElement(self.compu_scale3, 'UPPER-LIMIT')
-        self.variables['upper_limit20'] = self.upper_limit20
-        self.upper_limit20.text = '0x00'
-        self.upper_limit20.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.compu_const3 = ET.SubElement(self.compu_scale3, 'COMPU-CONST')
-        self.variables['compu_const3'] = self.compu_const3
-        self.vt3 = ET.SubElement(self.compu_const3, 'VT')
-        self.variables['vt3'] = self.vt3
-        self.vt3.text = 'STD_MESSAGERESULT_OK'
-
-        self.compu_scale4 = ET.SubElement(self.compu_scales2, 'COMPU-SCALE')
-        self.variables['compu_scale4'] = self.compu_scale4
-        self.lower_limit21 = ET.SubElement(self.compu_scale4, 'LOWER-LIMIT')
-        self.variables['lower_limit21'] = self.lower_limit21
-        self.lower_limit21.text = '0x01'
-        self.lower_limit21.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.upper_limit21 = ET.SubElement(self.compu_scale4, 'UPPER-LIMIT')
-        self.variables['upper_limit21'] = self.upper_limit21
-        self.upper_limit21.text = '0x01'
-        self.upper_limit21.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.compu_const4 = ET.SubElement(self.compu_scale4, 'COMPU-CONST')
-        self.variables['compu_const4'] = self.compu_const4
-        self.vt4 = ET.SubElement(self.compu_const4, 'VT')
-        self.variables['vt4'] = self.vt4
-        self.vt4.text = 'STD_MESSAGERESULT_ERROR'
-
-
-        self.compu_method3 = ET.SubElement(self.CompuMethods_std_folder_elements, 'COMPU-METHOD')
-        self.variables['compu_method3'] = self.compu_method3
-        self.short_name311 = ET.SubElement(self.compu_method3, 'SHORT-NAME')
-        self.variables['short_name311'] = self.short_name311
-        self.short_name311.text = 'Std_MessageTypeType'
-        self.category47 = ET.SubElement(self.compu_method3, 'CATEGORY')
-        self.variables['category47'] = self.category47
-        self.category47.text = 'TEXTTABLE'
-        self.compu_internal_to_phys3 = ET.SubElement(self.compu_method3, 'COMPU-INTERNAL-TO-PHYS')
-        self.variables['compu_internal_to_phys3'] = self.compu_internal_to_phys3
-        self.compu_scales3 = ET.SubElement(self.compu_internal_to_phys3, 'COMPU-SCALES')
-        self.variables['compu_scales3'] = self.compu_scales3
-
-        self.compu_scale5 = ET.SubElement(self.compu_scales3, 'COMPU-SCALE')
-        self.variables['compu_scale5'] = self.compu_scale5
-        self.lower_limit22 = ET.SubElement(self.compu_scale5, 'LOWER-LIMIT')
-        self.variables['lower_limit22'] = self.lower_limit22
-        self.lower_limit22.text = '0x00'
-        self.lower_limit22.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.upper_limit22 = ET.SubElement(self.compu_scale5, 'UPPER-LIMIT')
-        self.variables['upper_limit22'] = self.upper_limit22
-        self.upper_limit22.text = '0x00'
-        self.upper_limit22.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.compu_const5 = ET.SubElement(self.compu_scale5, 'COMPU-CONST')
-        self.variables['compu_const5'] = self.compu_const5
-        self.vt5 = ET.SubElement(self.compu_const5, 'VT')
-        self.variables['vt5'] = self.vt5
-        self.vt5.text = 'STD_MESSAGETYPE_REQUEST'
-
-        self.compu_scale6 = ET.SubElement(self.compu_scales3, 'COMPU-SCALE')
-        self.variables['compu_scale6'] = self.compu_scale6
-        self.lower_limit23 = ET.SubElement(self.compu_scale6, 'LOWER-LIMIT')
-        self.variables['lower_limit23'] = self.lower_limit23
-        self.lower_limit23.text = '0x01'
-        self.lower_limit23.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.upper_limit23 = ET.SubElement(self.compu_scale6, 'UPPER-LIMIT')
-        self.variables['upper_limit23'] = self.upper_limit23
-        self.upper_limit23.text = '0x01'
-        self.upper_limit23.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.compu_const6 = ET.SubElement(self.compu_scale6, 'COMPU-CONST')
-        self.variables['compu_const6'] = self.compu_const6
-        self.vt6 = ET.SubElement(self.compu_const6, 'VT')
-        self.variables['vt6'] = self.vt6
-        self.vt6.text = 'STD_MESSAGETYPE_RESPONSE'
-
-
-        self.compu_method4 = ET.SubElement(self.CompuMethods_std_folder_elements, 'COMPU-METHOD')
-        self.variables['compu_method4'] = self.compu_method4
-        self.short_name312 = ET.SubElement(self.compu_method4, 'SHORT-NAME')
-        self.variables['short_name312'] = self.short_name312
-        self.short_name312.text = 'Std_ReturnType'
-        self.category48 = ET.SubElement(self.compu_method4, 'CATEGORY')
-        self.variables['category48'] = self.category48
-        self.category48.text = 'TEXTTABLE'
-        self.compu_internal_to_phys4 = ET.SubElement(self.compu_method4, 'COMPU-INTERNAL-TO-PHYS')
-        self.variables['compu_internal_to_phys4'] = self.compu_internal_to_phys4
-        self.compu_scales4 = ET.SubElement(self.compu_internal_to_phys4, 'COMPU-SCALES')
-        self.variables['compu_scales4'] = self.compu_scales4
-
-        self.compu_scale7 = ET.SubElement(self.compu_scales4, 'COMPU-SCALE')
-        self.variables['compu_scale7'] = self.compu_scale7
-        self.lower_limit24 = ET.SubElement(self.compu_scale7, 'LOWER-LIMIT')
-        self.variables['lower_limit24'] = self.lower_limit24
-        self.lower_limit24.text = '0'
-        self.lower_limit24.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.upper_limit24 = ET.SubElement(self.compu_scale7, 'UPPER-LIMIT')
-        self.variables['upper_limit24'] = self.upper_limit24
-        self.upper_limit24.text = '0'
-        self.upper_limit24.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.compu_const7 = ET.SubElement(self.compu_scale7, 'COMPU-CONST')
-        self.variables['compu_const7'] = self.compu_const7
-        self.vt7 = ET.SubElement(self.compu_const7, 'VT')
-        self.variables['vt7'] = self.vt7
-        self.vt7.text = 'E_OK'
-
-        self.compu_scale8 = ET.SubElement(self.compu_scales4, 'COMPU-SCALE')
-        self.variables['compu_scale8'] = self.compu_scale8
-        self.lower_limit25 = ET.SubElement(self.compu_scale8, 'LOWER-LIMIT')
-        self.variables['lower_limit25'] = self.lower_limit25
-        self.lower_limit25.text = '1'
-        self.lower_limit25.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.upper_limit25 = ET.SubElement(self.compu_scale8, 'UPPER-LIMIT')
-        self.variables['upper_limit25'] = self.upper_limit25
-        self.upper_limit25.text = '1'
-        self.upper_limit25.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.compu_const8 = ET.SubElement(self.compu_scale8, 'COMPU-CONST')
-        self.variables['compu_const8'] = self.compu_const8
-        self.vt8 = ET.SubElement(self.compu_const8, 'VT')
-        self.variables['vt8'] = self.vt8
-        self.vt8.text = 'E_NOT_OK'
-
-
-        self.compu_method5 = ET.SubElement(self.CompuMethods_std_folder_elements, 'COMPU-METHOD')
-        self.variables['compu_method5'] = self.compu_method5
-        self.short_name313 = ET.SubElement(self.compu_method5, 'SHORT-NAME')
-        self.variables['short_name313'] = self.short_name313
-        self.short_name313.text = 'Std_TransformerClass'
-        self.category49 = ET.SubElement(self.compu_method5, 'CATEGORY')
-        self.variables['category49'] = self.category49
-        self.category49.text = 'TEXTTABLE'
-        self.compu_internal_to_phys5 = ET.SubElement(self.compu_method5, 'COMPU-INTERNAL-TO-PHYS')
-        self.variables['compu_internal_to_phys5'] = self.compu_internal_to_phys5
-        self.compu_scales5 = ET.SubElement(self.compu_internal_to_phys5, 'COMPU-SCALES')
-        self.variables['compu_scales5'] = self.compu_scales5
-
-        self.compu_scale9 = ET.SubElement(self.compu_scales5, 'COMPU-SCALE')
-        self.variables['compu_scale9'] = self.compu_scale9
-        self.lower_limit26 = ET.SubElement(self.compu_scale9, 'LOWER-LIMIT')
-        self.variables['lower_limit26'] = self.lower_limit26
-        self.lower_limit26.text = '0x00'
-        self.lower_limit26.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.upper_limit26 = ET.SubElement(self.compu_scale9, 'UPPER-LIMIT')
-        self.variables['upper_limit26'] = self.upper_limit26
-        self.upper_limit26.text = '0x00'
-        self.upper_limit26.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.compu_const9 = ET.SubElement(self.compu_scale9, 'COMPU-CONST')
-        self.variables['compu_const9'] = self.compu_const9
-        self.vt9 = ET.SubElement(self.compu_const9, 'VT')
-        self.variables['vt9'] = self.vt9
-        self.vt9.text = 'STD_TRANSFORMER_UNSPECIFIED'
-
-        self.compu_scale10 = ET.SubElement(self.compu_scales5, 'COMPU-SCALE')
-        self.variables['compu_scale10'] = self.compu_scale10
-        self.lower_limit27 = ET.SubElement(self.compu_scale10, 'LOWER-LIMIT')
-        self.variables['lower_limit27'] = self.lower_limit27
-        self.lower_limit27.text = '0x01'
-        self.lower_limit27.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.upper_limit27 = ET.SubElement(self.compu_scale10, 'UPPER-LIMIT')
-        self.variables['upper_limit27'] = self.upper_limit27
-        self.upper_limit27.text = '0x01'
-        self.upper_limit27.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.compu_const10 = ET.SubElement(self.compu_scale10, 'COMPU-CONST')
-        self.variables['compu_const10'] = self.compu_const10
-        self.vt10 = ET.SubElement(self.compu_const10, 'VT')
-        self.variables['vt10'] = self.vt10
-        self.vt10.text = 'STD_TRANSFORMER_SERIALIZER'
-
-        self.compu_scale11 = ET.SubElement(self.compu_scales5, 'COMPU-SCALE')
-        self.variables['compu_scale11'] = self.compu_scale11
-        self.lower_limit28 = ET.SubElement(self.compu_scale11, 'LOWER-LIMIT')
-        self.variables['lower_limit28'] = self.lower_limit28
-        self.lower_limit28.text = '0x02'
-        self.lower_limit28.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.upper_limit28 = ET.SubElement(self.compu_scale11, 'UPPER-LIMIT')
-        self.variables['upper_limit28'] = self.upper_limit28
-        self.upper_limit28.text = '0x02'
-        self.upper_limit28.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.compu_const11 = ET.SubElement(self.compu_scale11, 'COMPU-CONST')
-        self.variables['compu_const11'] = self.compu_const11
-        self.vt11 = ET.SubElement(self.compu_const11, 'VT')
-        self.variables['vt11'] = self.vt11
-        self.vt11.text = 'STD_TRANSFORMER_SAFETY'
-
-        self.compu_scale12 = ET.SubElement(self.compu_scales5, 'COMPU-SCALE')
-        self.variables['compu_scale12'] = self.compu_scale12
-        self.lower_limit29 = ET.SubElement(self.compu_scale12, 'LOWER-LIMIT')
-        self.variables['lower_limit29'] = self.lower_limit29
-        self.lower_limit29.text = '0x03'
-        self.lower_limit29.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.upper_limit29 = ET.SubElement(self.compu_scale12, 'UPPER-LIMIT')
-        self.variables['upper_limit29'] = self.upper_limit29
-        self.upper_limit29.text = '0x03'
-        self.upper_limit29.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.compu_const12 = ET.SubElement(self.compu_scale12, 'COMPU-CONST')
-        self.variables['compu_const12'] = self.compu_const12
-        self.vt12 = ET.SubElement(self.compu_const12, 'VT')
-        self.variables['vt12'] = self.vt12
-        self.vt12.text = 'STD_TRANSFORMER_SECURITY'
-
-        self.compu_scale13 = ET.SubElement(self.compu_scales5, 'COMPU-SCALE')
-        self.variables['compu_scale13'] = self.compu_scale13
-        self.lower_limit30 = ET.SubElement(self.compu_scale13, 'LOWER-LIMIT')
-        self.variables['lower_limit30'] = self.lower_limit30
-        self.lower_limit30.text = '0xFF'
-        self.lower_limit30.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.upper_limit30 = ET.SubElement(self.compu_scale13, 'UPPER-LIMIT')
-        self.variables['upper_limit30'] = self.upper_limit30
-        self.upper_limit30.text = '0xFF'
-        self.upper_limit30.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.compu_const13 = ET.SubElement(self.compu_scale13, 'COMPU-CONST')
-        self.variables['compu_const13'] = self.compu_const13
-        self.vt13 = ET.SubElement(self.compu_const13, 'VT')
-        self.variables['vt13'] = self.vt13
-        self.vt13.text = 'STD_TRANSFORMER_CUSTOM'
-
-
-        self.compu_method6 = ET.SubElement(self.CompuMethods_std_folder_elements, 'COMPU-METHOD')
-        self.variables['compu_method6'] = self.compu_method6
-        self.short_name314 = ET.SubElement(self.compu_method6, 'SHORT-NAME')
-        self.variables['short_name314'] = self.short_name314
-        self.short_name314.text = 'Std_TransformerForwardCode'
-        self.category50 = ET.SubElement(self.compu_method6, 'CATEGORY')
-        self.variables['category50'] = self.category50
-        self.category50.text = 'TEXTTABLE'
-        self.compu_internal_to_phys6 = ET.SubElement(self.compu_method6, 'COMPU-INTERNAL-TO-PHYS')
-        self.variables['compu_internal_to_phys6'] = self.compu_internal_to_phys6
-        self.compu_scales6 = ET.SubElement(self.compu_internal_to_phys6, 'COMPU-SCALES')
-        self.variables['compu_scales6'] = self.compu_scales6
-
-        self.compu_scale14 = ET.SubElement(self.compu_scales6, 'COMPU-SCALE')
-        self.variables['compu_scale14'] = self.compu_scale14
-        self.lower_limit31 = ET.SubElement(self.compu_scale14, 'LOWER-LIMIT')
-        self.variables['lower_limit31'] = self.lower_limit31
-        self.lower_limit31.text = '0x00'
-        self.lower_limit31.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.upper_limit31 = ET.SubElement(self.compu_scale14, 'UPPER-LIMIT')
-        self.variables['upper_limit31'] = self.upper_limit31
-        self.upper_limit31.text = '0x00'
-        self.upper_limit31.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.compu_const14 = ET.SubElement(self.compu_scale14, 'COMPU-CONST')
-        self.variables['compu_const14'] = self.compu_const14
-        self.vt14 = ET.SubElement(self.compu_const14, 'VT')
-        self.variables['vt14'] = self.vt14
-        self.vt14.text = 'E_OK'
-
-        self.compu_scale15 = ET.SubElement(self.compu_scales6, 'COMPU-SCALE')
-        self.variables['compu_scale15'] = self.compu_scale15
-        self.lower_limit32 = ET.SubElement(self.compu_scale15, 'LOWER-LIMIT')
-        self.variables['lower_limit32'] = self.lower_limit32
-        self.lower_limit32.text = '0x01'
-        self.lower_limit32.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.upper_limit32 = ET.SubElement(self.compu_scale15, 'UPPER-LIMIT')
-        self.variables['upper_limit32'] = self.upper_limit32
-        self.upper_limit32.text = '0x01'
-        self.upper_limit32.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.compu_const15 = ET.SubElement(self.compu_scale15, 'COMPU-CONST')
-        self.variables['compu_const15'] = self.compu_const15
-        self.vt15 = ET.SubElement(self.compu_const15, 'VT')
-        self.variables['vt15'] = self.vt15
-        self.vt15.text = 'E_SAFETY_INVALID_REP'
-
-        self.compu_scale16 = ET.SubElement(self.compu_scales6, 'COMPU-SCALE')
-        self.variables['compu_scale16'] = self.compu_scale16
-        self.lower_limit33 = ET.SubElement(self.compu_scale16, 'LOWER-LIMIT')
-        self.variables['lower_limit33'] = self.lower_limit33
-        self.lower_limit33.text = '0x02'
-        self.lower_limit33.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.upper_limit33 = ET.SubElement(self.compu_scale16, 'UPPER-LIMIT')
-        self.variables['upper_limit33'] = self.upper_limit33
-        self.upper_limit33.text = '0x02'
-        self.upper_limit33.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.compu_const16 = ET.SubElement(self.compu_scale16, 'COMPU-CONST')
-        self.variables['compu_const16'] = self.compu_const16
-        self.vt16 = ET.SubElement(self.compu_const16, 'VT')
-        self.variables['vt16'] = self.vt16
-        self.vt16.text = 'E_SAFETY_INVALID_SEQ'
-
-        self.compu_scale17 = ET.SubElement(self.compu_scales6, 'COMPU-SCALE')
-        self.variables['compu_scale17'] = self.compu_scale17
-        self.lower_limit34 = ET.SubElement(self.compu_scale17, 'LOWER-LIMIT')
-        self.variables['lower_limit34'] = self.lower_limit34
-        self.lower_limit34.text = '0x03'
-        self.lower_limit34.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.upper_limit34 = ET.SubElement(self.compu_scale17, 'UPPER-LIMIT')
-        self.variables['upper_limit34'] = self.upper_limit34
-        self.upper_limit34.text = '0x03'
-        self.upper_limit34.attrib = {'INTERVAL-TYPE': 'CLOSED'}
-        self.compu_const17 = ET.SubElement(self.compu_scale17, 'COMPU-CONST')
-        self.variables['compu_const17'] = self.compu_const17
-        self.vt17 = ET.SubElement(self.compu_const17, 'VT')
-        self.variables['vt17'] = self.vt17
-        self.vt17.text = 'E_SAFETY_INVALID_CRC'
-
-        self.DataConstrs_std_folder = ET.SubElement(self.AUTOSAR_Std_subfolders, 'AR-PACKAGE')
-        self.variables['DataConstrs_std_folder'] = self.DataConstrs_std_folder
-        self.DataConstrs_std_folder_short_name = ET.SubElement(self.DataConstrs_std_folder, 'SHORT-NAME')
-        self.variables['DataConstrs_std_folder_short_name'] = self.DataConstrs_std_folder_short_name
-        self.DataConstrs_std_folder_short_name.text = 'DataConstrs'
-        self.DataConstrs_std_folder_category = ET.SubElement(self.DataConstrs_std_folder, 'CATEGORY')
-        self.variables['DataConstrs_std_folder_category'] = self.DataConstrs_std_folder_category
-        self.DataConstrs_std_folder_category.text = 'STANDARD'
-        self.DataConstrs_std_folder_elements = ET.SubElement(self.DataConstrs_std_folder, 'ELEMENTS')
-        self.variables['DataConstrs_std_folder_elements'] = self.DataConstrs_std_folder_elements
-
-        self.data_constr18 = ET.SubElement(self.DataConstrs_std_folder_elements, 'DATA-CONSTR')
-        self.variables['data_constr18'] = self.data_constr18
-        self.short_name316 = ET.SubElement(self.data_constr18, 'SHORT-NAME')
-        self.variables['short_name316'] = self.short_name316
-        self.short_name316.text = 'Std_MessageResultType'
-        self.data_constr_rules18 = ET.SubElement(self.data_constr18, 'DATA-CONSTR-RULES')
-        self.variables['data_constr_rules18'] = self.data_constr_rules18
-        self.data_constr_rule18 = ET.SubElement(self.data_constr_rules18, 'DATA-CONSTR-RULE')
-        self.variables['data_constr_rule18'] = self.data_constr_rule18
-        self.internal_constrs18 = ET.SubElement(self.data_constr_rule18, 'INTERNAL-CONSTRS')
-        self.variables['internal_constrs18'] = self.internal_constrs18
-        self.lower_limit35 = ET.SubElement(self.internal_constrs18, 'LOWER-LIMIT')
-        self.variables['lower_limit35'] = self.lower_limit35
-        self.lower_limit35.text = '0x00'
-        self.upper_limit35 = ET.SubElement(self.internal_constrs18, 'UPPER-LIMIT')
-        self.variables['upper_limit35'] = self.upper_limit35
-        self.upper_limit35.text = '0x02'
-
-        self.data_constr19 = ET.SubElement(self.DataConstrs_std_folder_elements, 'DATA-CONSTR')
-        self.variables['data_constr19'] = self.data_constr19
-        self.short_name317 = ET.SubElement(self.data_constr19, 'SHORT-NAME')
-        self.variables['short_name317'] = self.short_name317
-        self.short_name317.text = 'Std_MessageTypeType'
-        self.data_constr_rules19 = ET.SubElement(self.data_constr19, 'DATA-CONSTR-RULES')
-        self.variables['data_constr_rules19'] = self.data_constr_rules19
-        self.data_constr_rule19 = ET.SubElement(self.data_constr_rules19, 'DATA-CONSTR-RULE')
-        self.variables['data_constr_rule19'] = self.data_constr_rule19
-        self.internal_constrs19 = ET.SubElement(self.data_constr_rule19, 'INTERNAL-CONSTRS')
-        self.variables['internal_constrs19'] = self.internal_constrs19
-        self.lower_limit36 = ET.SubElement(self.internal_constrs19, 'LOWER-LIMIT')
-        self.variables['lower_limit36'] = self.lower_limit36
-        self.lower_limit36.text = '0x00'
-        self.upper_limit36 = ET.SubElement(self.internal_constrs19, 'UPPER-LIMIT')
-        self.variables['upper_limit36'] = self.upper_limit36
-        self.upper_limit36.text = '0x02'
-
-        self.data_constr20 = ET.SubElement(self.DataConstrs_std_folder_elements, 'DATA-CONSTR')
-        self.variables['data_constr20'] = self.data_constr20
-        self.short_name318 = ET.SubElement(self.data_constr20, 'SHORT-NAME')
-        self.variables['short_name318'] = self.short_name318
-        self.short_name318.text = 'Std_ReturnType'
-        self.data_constr_rules20 = ET.SubElement(self.data_constr20, 'DATA-CONSTR-RULES')
-        self.variables['data_constr_rules20'] = self.data_constr_rules20
-        self.data_constr_rule20 = ET.SubElement(self.data_constr_rules20, 'DATA-CONSTR-RULE')
-        self.variables['data_constr_rule20'] = self.data_constr_rule20
-        self.internal_constrs20 = ET.SubElement(self.data_constr_rule20, 'INTERNAL-CONSTRS')
-        self.variables['internal_constrs20'] = self.internal_constrs20
-        self.lower_limit37 = ET.SubElement(self.internal_constrs20, 'LOWER-LIMIT')
-        self.variables['lower_limit37'] = self.lower_limit37
-        self.lower_limit37.text = '0'
-        self.upper_limit37 = ET.SubElement(self.internal_constrs20, 'UPPER-LIMIT')
-        self.variables['upper_limit37'] = self.upper_limit37
-        self.upper_limit37.text = '1'
-
-        self.data_constr21 = ET.SubElement(self.DataConstrs_std_folder_elements, 'DATA-CONSTR')
-        self.variables['data_constr21'] = self.data_constr21
-        self.short_name319 = ET.SubElement(self.data_constr21, 'SHORT-NAME')
-        self.variables['short_name319'] = self.short_name319
-        self.short_name319.text = 'Std_TransformerClass'
-        self.data_constr_rules21 = ET.SubElement(self.data_constr21, 'DATA-CONSTR-RULES')
-        self.variables['data_constr_rules21'] = self.data_constr_rules21
-        self.data_constr_rule21 = ET.SubElement(self.data_constr_rules21, 'DATA-CONSTR-RULE')
-        self.variables['data_constr_rule21'] = self.data_constr_rule21
-        self.internal_constrs21 = ET.SubElement(self.data_constr_rule21, 'INTERNAL-CONSTRS')
-        self.variables['internal_constrs21'] = self.internal_constrs21
-        self.lower_limit38 = ET.SubElement(self.internal_constrs21, 'LOWER-LIMIT')
-        self.variables['lower_limit38'] = self.lower_limit38
-        self.lower_limit38.text = '0x00'
-        self.upper_limit38 = ET.SubElement(self.internal_constrs21, 'UPPER-LIMIT')
-        self.variables['upper_limit38'] = self.upper_limit38
-        self.upper_limit38.text = '0xFF'
-
-        self.data_constr22 = ET.SubElement(self.DataConstrs_std_folder_elements, 'DATA-CONSTR')
-        self.variables['data_constr22'] = self.data_constr22
-        self.short_name320 = ET.SubElement(self.data_constr22, 'SHORT-NAME')
-        self.variables['short_name320'] = self.short_name320
-        self.short_name320.text = 'Std_TransformerErrorCode'
-        self.data_constr_rules22 = ET.SubElement(self.data_constr22, 'DATA-CONSTR-RULES')
-        self.variables['data_constr_rules22'] = self.data_constr_rules22
-        self.data_constr_rule22 = ET.SubElement(self.data_constr_rules22, 'DATA-CONSTR-RULE')
-        self.variables['data_constr_rule22'] = self.data_constr_rule22
-        self.internal_constrs22 = ET.SubElement(self.data_constr_rule22, 'INTERNAL-CONSTRS')
-        self.variables['internal_constrs22'] = self.internal_constrs22
-        self.lower_limit39 = ET.SubElement(self.internal_constrs22, 'LOWER-LIMIT')
-        self.variables['lower_limit39'] = self.lower_limit39
-        self.lower_limit39.text = '0x00'
-        self.upper_limit39 = ET.SubElement(self.internal_constrs22, 'UPPER-LIMIT')
-        self.variables['upper_limit39'] = self.upper_limit39
-        self.upper_limit39.text = '0xFF'
-
-        self.data_constr23 = ET.SubElement(self.DataConstrs_std_folder_elements, 'DATA-CONSTR')
-        self.variables['data_constr23'] = self.data_constr23
-        self.short_name321 = ET.SubElement(self.data_constr23, 'SHORT-NAME')
-        self.variables['short_name321'] = self.short_name321
-        self.short_name321.text = 'Std_TransformerForwardCode'
-        self.data_constr_rules23 = ET.SubElement(self.data_constr23, 'DATA-CONSTR-RULES')
-        self.variables['data_constr_rules23'] = self.data_constr_rules23
-        self.data_constr_rule23 = ET.SubElement(self.data_constr_rules23, 'DATA-CONSTR-RULE')
-        self.variables['data_constr_rule23'] = self.data_constr_rule23
-        self.internal_constrs23 = ET.SubElement(self.data_constr_rule23, 'INTERNAL-CONSTRS')
-        self.variables['internal_constrs23'] = self.internal_constrs23
-        self.lower_limit40 = ET.SubElement(self.internal_constrs23, 'LOWER-LIMIT')
-        self.variables['lower_limit40'] = self.lower_limit40
-        self.lower_limit40.text = '0x00'
-        self.upper_limit40 = ET.SubElement(self.internal_constrs23, 'UPPER-LIMIT')
-        self.variables['upper_limit40'] = self.upper_limit40
-        self.upper_limit40.text = '0x03'
-
-        self.ImplementationDataTypes_std_folder = ET.SubElement(self.AUTOSAR_Std_subfolders, 'AR-PACKAGE')
-        self.variables['ImplementationDataTypes_std_folder'] = self.ImplementationDataTypes_std_folder
-        self.ImplementationDataTypes_std_folder_short_name = ET.SubElement(self.ImplementationDataTypes_std_folder, 'SHORT-NAME')
-        self.variables['ImplementationDataTypes_std_folder_short_name'] = self.ImplementationDataTypes_std_folder_short_name
-        self.ImplementationDataTypes_std_folder_short_name.text = 'ImplementationDataTypes'
-        self.ImplementationDataTypes_std_folder_category = ET.SubElement(self.ImplementationDataTypes_std_folder, 'CATEGORY')
-        self.variables['ImplementationDataTypes_std_folder_category'] = self.ImplementationDataTypes_std_folder_category
-        self.ImplementationDataTypes_std_folder_category.text = 'STANDARD'
-
-        self.ImplementationDataTypes_std_folder_elements = ET.SubElement(self.ImplementationDataTypes_std_folder, 'ELEMENTS')
-        self.variables['ImplementationDataTypes_std_folder_elements'] = self.ImplementationDataTypes_std_folder_elements
-
-        self.implementation_data_type20 = ET.SubElement(self.ImplementationDataTypes_std_folder_elements, 'IMPLEMENTATION-DATA-TYPE')
-        self.variables['implementation_data_type20'] = self.implementation_data_type20
-        self.short_name323 = ET.SubElement(self.implementation_data_type20, 'SHORT-NAME')
-        self.variables['short_name323'] = self.short_name323
-        self.short_name323.text = 'Std_ExtractProtocolHeaderFieldsType'
-        self.desc1 = ET.SubElement(self.implementation_data_type20, 'DESC')
-        self.variables['desc1'] = self.desc1
-        self.l_21 = ET.SubElement(self.desc1, 'L-2')
-        self.variables['l_21'] = self.l_21
-        self.l_21.text = 'Type for the function pointer to extract the relevant protocol header fields of the message and the type of the message result of a transformer. - At the time being, this is limited to the types used for C/S communication (i.e., REQUEST and RESPONSE and OK and ERROR).'
-        self.l_21.attrib = {'L': 'EN'}
-        self.category53 = ET.SubElement(self.implementation_data_type20, 'CATEGORY')
-        self.variables['category53'] = self.category53
-        self.category53.text = 'FUNCTION_REFERENCE'
-        self.sw_data_def_props30 = ET.SubElement(self.implementation_data_type20, 'SW-DATA-DEF-PROPS')
-        self.variables['sw_data_def_props30'] = self.sw_data_def_props30
-        self.sw_data_def_props_variants30 = ET.SubElement(self.sw_data_def_props30, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['sw_data_def_props_variants30'] = self.sw_data_def_props_variants30
-        self.sw_data_def_props_conditional30 = ET.SubElement(self.sw_data_def_props_variants30, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['sw_data_def_props_conditional30'] = self.sw_data_def_props_conditional30
-        self.sw_pointer_target_props6 = ET.SubElement(self.sw_data_def_props_conditional30, 'SW-POINTER-TARGET-PROPS')
-        self.variables['sw_pointer_target_props6'] = self.sw_pointer_target_props6
-        self.target_category6 = ET.SubElement(self.sw_pointer_target_props6, 'TARGET-CATEGORY')
-        self.variables['target_category6'] = self.target_category6
-        self.target_category6.text = 'FUNCTION_REFERENCE'
-        self.function_pointer_signature_ref1 = ET.SubElement(self.sw_pointer_target_props6, 'FUNCTION-POINTER-SIGNATURE-REF')
-        self.variables['function_pointer_signature_ref1'] = self.function_pointer_signature_ref1
-        self.function_pointer_signature_ref1.text = '/AUTOSAR/AUTOSAR_Std/BswModuleEntrys/Std_ExtractProtocolHeaderFieldsType'
-        self.function_pointer_signature_ref1.attrib = {'DEST': 'BSW-MODULE-ENTRY'}
-        self.type_emitter20 = ET.SubElement(self.implementation_data_type20, 'TYPE-EMITTER')
-        self.variables['type_emitter20'] = self.type_emitter20
-        self.type_emitter20.text = 'Std_Types.h'
-
-        self.implementation_data_type21 = ET.SubElement(self.ImplementationDataTypes_std_folder_elements, 'IMPLEMENTATION-DATA-TYPE')
-        self.variables['implementation_data_type21'] = self.implementation_data_type21
-        self.short_name324 = ET.SubElement(self.implementation_data_type21, 'SHORT-NAME')
-        self.variables['short_name324'] = self.short_name324
-        self.short_name324.text = 'Std_MessageResultType'
-        self.desc2 = ET.SubElement(self.implementation_data_type21, 'DESC')
-        self.variables['desc2'] = self.desc2
-        self.l_22 = ET.SubElement(self.desc2, 'L-2')
-        self.variables['l_22'] = self.l_22
-        self.l_22.text = 'This type is used to encode different types of results for response messages. - Currently this encoding is limited to the distinction between OK and ERROR responses.'
-        self.l_22.attrib = {'L': 'EN'}
-        self.category54 = ET.SubElement(self.implementation_data_type21, 'CATEGORY')
-        self.variables['category54'] = self.category54
-        self.category54.text = 'TYPE_REFERENCE'
-        self.sw_data_def_props31 = ET.SubElement(self.implementation_data_type21, 'SW-DATA-DEF-PROPS')
-        self.variables['sw_data_def_props31'] = self.sw_data_def_props31
-        self.sw_data_def_props_variants31 = ET.SubElement(self.sw_data_def_props31, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['sw_data_def_props_variants31'] = self.sw_data_def_props_variants31
-        self.sw_data_def_props_conditional31 = ET.SubElement(self.sw_data_def_props_variants31, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['sw_data_def_props_conditional31'] = self.sw_data_def_props_conditional31
-        self.compu_method_ref2 = ET.SubElement(self.sw_data_def_props_conditional31, 'COMPU-METHOD-REF')
-        self.variables['compu_method_ref2'] = self.compu_method_ref2
-        self.compu_method_ref2.text = '/AUTOSAR/AUTOSAR_Std/CompuMethods/Std_MessageResultType'
-        self.compu_method_ref2.attrib = {'DEST': 'COMPU-METHOD'}
-        self.data_constr_ref18 = ET.SubElement(self.sw_data_def_props_conditional31, 'DATA-CONSTR-REF')
-        self.variables['data_constr_ref18'] = self.data_constr_ref18
-        self.data_constr_ref18.text = '/AUTOSAR/AUTOSAR_Std/DataConstrs/Std_MessageResultType'
-        self.data_constr_ref18.attrib = {'DEST': 'DATA-CONSTR'}
-        self.implementation_data_type_ref6 = ET.SubElement(self.sw_data_def_props_conditional31, 'IMPLEMENTATION-DATA-TYPE-REF')
-        self.variables['implementation_data_type_ref6'] = self.implementation_data_type_ref6
-        self.implementation_data_type_ref6.text = '/AUTOSAR/AUTOSAR_Platform/ImplementationDataTypes/uint8'
-        self.implementation_data_type_ref6.attrib = {'DEST': 'IMPLEMENTATION-DATA-TYPE'}
-        self.type_emitter21 = ET.SubElement(self.implementation_data_type21, 'TYPE-EMITTER')
-        self.variables['type_emitter21'] = self.type_emitter21
-        self.type_emitter21.text = 'Std_Types.h'
-
-        self.implementation_data_type22 = ET.SubElement(self.ImplementationDataTypes_std_folder_elements, 'IMPLEMENTATION-DATA-TYPE')
-        self.variables['implementation_data_type22'] = self.implementation_data_type22
-        self.short_name325 = ET.SubElement(self.implementation_data_type22, 'SHORT-NAME')
-        self.variables['short_name325'] = self.short_name325
-        self.short_name325.text = 'Std_MessageTypeType'
-        self.desc3 = ET.SubElement(self.implementation_data_type22, 'DESC')
-        self.variables['desc3'] = self.desc3
-        self.l_23 = ET.SubElement(self.desc3, 'L-2')
-        self.variables['l_23'] = self.l_23
-        self.l_23.text = 'This type is used to encode the different type of messages. - Currently this encoding is limited to the distinction between requests and responses in C/S communication.'
-        self.l_23.attrib = {'L': 'EN'}
-        self.category55 = ET.SubElement(self.implementation_data_type22, 'CATEGORY')
-        self.variables['category55'] = self.category55
-        self.category55.text = 'TYPE_REFERENCE'
-        self.sw_data_def_props32 = ET.SubElement(self.implementation_data_type22, 'SW-DATA-DEF-PROPS')
-        self.variables['sw_data_def_props32'] = self.sw_data_def_props32
-        self.sw_data_def_props_variants32 = ET.SubElement(self.sw_data_def_props32, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['sw_data_def_props_variants32'] = self.sw_data_def_props_variants32
-        self.sw_data_def_props_conditional32 = ET.SubElement(self.sw_data_def_props_variants32, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['sw_data_def_props_conditional32'] = self.sw_data_def_props_conditional32
-        self.compu_method_ref3 = ET.SubElement(self.sw_data_def_props_conditional32, 'COMPU-METHOD-REF')
-        self.variables['compu_method_ref3'] = self.compu_method_ref3
-        self.compu_method_ref3.text = '/AUTOSAR/AUTOSAR_Std/CompuMethods/Std_MessageTypeType'
-        self.compu_method_ref3.attrib = {'DEST': 'COMPU-METHOD'}
-        self.data_constr_ref19 = ET.SubElement(self.sw_data_def_props_conditional32, 'DATA-CONSTR-REF')
-        self.variables['data_constr_ref19'] = self.data_constr_ref19
-        self.data_constr_ref19.text = '/AUTOSAR/AUTOSAR_Std/DataConstrs/Std_MessageTypeType'
-        self.data_constr_ref19.attrib = {'DEST': 'DATA-CONSTR'}
-        self.implementation_data_type_ref7 = ET.SubElement(self.sw_data_def_props_conditional32, 'IMPLEMENTATION-DATA-TYPE-REF')
-        self.variables['implementation_data_type_ref7'] = self.implementation_data_type_ref7
-        self.implementation_data_type_ref7.text = '/AUTOSAR/AUTOSAR_Platform/ImplementationDataTypes/uint8'
-        self.implementation_data_type_ref7.attrib = {'DEST': 'IMPLEMENTATION-DATA-TYPE'}
-        self.type_emitter22 = ET.SubElement(self.implementation_data_type22, 'TYPE-EMITTER')
-        self.variables['type_emitter22'] = self.type_emitter22
-        self.type_emitter22.text = 'Std_Types.h'
-
-        self.implementation_data_type23 = ET.SubElement(self.ImplementationDataTypes_std_folder_elements, 'IMPLEMENTATION-DATA-TYPE')
-        self.variables['implementation_data_type23'] = self.implementation_data_type23
-        self.short_name326 = ET.SubElement(self.implementation_data_type23, 'SHORT-NAME')
-        self.variables['short_name326'] = self.short_name326
-        self.short_name326.text = 'Std_ReturnType'
-        self.desc4 = ET.SubElement(self.implementation_data_type23, 'DESC')
-        self.variables['desc4'] = self.desc4
-        self.l_24 = ET.SubElement(self.desc4, 'L-2')
-        self.variables['l_24'] = self.l_24
-        self.l_24.text = 'This type can be used as standard API return type which is shared between the RTE and the BSW modules. It shall be defined as follows: typedef uint8 Std_ReturnType;'
-        self.l_24.attrib = {'L': 'EN'}
-        self.category56 = ET.SubElement(self.implementation_data_type23, 'CATEGORY')
-        self.variables['category56'] = self.category56
-        self.category56.text = 'TYPE_REFERENCE'
-        self.sw_data_def_props33 = ET.SubElement(self.implementation_data_type23, 'SW-DATA-DEF-PROPS')
-        self.variables['sw_data_def_props33'] = self.sw_data_def_props33
-        self.sw_data_def_props_variants33 = ET.SubElement(self.sw_data_def_props33, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['sw_data_def_props_variants33'] = self.sw_data_def_props_variants33
-        self.sw_data_def_props_conditional33 = ET.SubElement(self.sw_data_def_props_variants33, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['sw_data_def_props_conditional33'] = self.sw_data_def_props_conditional33
-        self.compu_method_ref4 = ET.SubElement(self.sw_data_def_props_conditional33, 'COMPU-METHOD-REF')
-        self.variables['compu_method_ref4'] = self.compu_method_ref4
-        self.compu_method_ref4.text = '/AUTOSAR/AUTOSAR_Std/CompuMethods/Std_ReturnType'
-        self.compu_method_ref4.attrib = {'DEST': 'COMPU-METHOD'}
-        self.data_constr_ref20 = ET.SubElement(self.sw_data_def_props_conditional33, 'DATA-CONSTR-REF')
-        self.variables['data_constr_ref20'] = self.data_constr_ref20
-        self.data_constr_ref20.text = '/AUTOSAR/AUTOSAR_Std/DataConstrs/Std_ReturnType'
-        self.data_constr_ref20.attrib = {'DEST': 'DATA-CONSTR'}
-        self.implementation_data_type_ref8 = ET.SubElement(self.sw_data_def_props_conditional33, 'IMPLEMENTATION-DATA-TYPE-REF')
-        self.variables['implementation_data_type_ref8'] = self.implementation_data_type_ref8
-        self.implementation_data_type_ref8.text = '/AUTOSAR/AUTOSAR_Platform/ImplementationDataTypes/uint8'
-        self.implementation_data_type_ref8.attrib = {'DEST': 'IMPLEMENTATION-DATA-TYPE'}
-        self.type_emitter23 = ET.SubElement(self.implementation_data_type23, 'TYPE-EMITTER')
-        self.variables['type_emitter23'] = self.type_emitter23
-        self.type_emitter23.text = 'Std_Types.h'
-
-        self.implementation_data_type24 = ET.SubElement(self.ImplementationDataTypes_std_folder_elements, 'IMPLEMENTATION-DATA-TYPE')
-        self.variables['implementation_data_type24'] = self.implementation_data_type24
-        self.short_name327 = ET.SubElement(self.implementation_data_type24, 'SHORT-NAME')
-        self.variables['short_name327'] = self.short_name327
-        self.short_name327.text = 'Std_TransformerClass'
-        self.desc5 = ET.SubElement(self.implementation_data_type24, 'DESC')
-        self.variables['desc5'] = self.desc5
-        self.l_25 = ET.SubElement(self.desc5, 'L-2')
-        self.variables['l_25'] = self.l_25
-        self.l_25.text = 'Std_TransformerClass is an enumeration where each element represents a transformer class.'
-        self.l_25.attrib = {'L': 'EN'}
-        self.category57 = ET.SubElement(self.implementation_data_type24, 'CATEGORY')
-        self.variables['category57'] = self.category57
-        self.category57.text = 'TYPE_REFERENCE'
-        self.sw_data_def_props34 = ET.SubElement(self.implementation_data_type24, 'SW-DATA-DEF-PROPS')
-        self.variables['sw_data_def_props34'] = self.sw_data_def_props34
-        self.sw_data_def_props_variants34 = ET.SubElement(self.sw_data_def_props34, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['sw_data_def_props_variants34'] = self.sw_data_def_props_variants34
-        self.sw_data_def_props_conditional34 = ET.SubElement(self.sw_data_def_props_variants34, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['sw_data_def_props_conditional34'] = self.sw_data_def_props_conditional34
-        self.compu_method_ref5 = ET.SubElement(self.sw_data_def_props_conditional34, 'COMPU-METHOD-REF')
-        self.variables['compu_method_ref5'] = self.compu_method_ref5
-        self.compu_method_ref5.text = '/AUTOSAR/AUTOSAR_Std/CompuMethods/Std_TransformerClass'
-        self.compu_method_ref5.attrib = {'DEST': 'COMPU-METHOD'}
-        self.data_constr_ref21 = ET.SubElement(self.sw_data_def_props_conditional34, 'DATA-CONSTR-REF')
-        self.variables['data_constr_ref21'] = self.data_constr_ref21
-        self.data_constr_ref21.text = '/AUTOSAR/AUTOSAR_Std/DataConstrs/Std_TransformerClass'
-        self.data_constr_ref21.attrib = {'DEST': 'DATA-CONSTR'}
-        self.implementation_data_type_ref9 = ET.SubElement(self.sw_data_def_props_conditional34, 'IMPLEMENTATION-DATA-TYPE-REF')
-        self.variables['implementation_data_type_ref9'] = self.implementation_data_type_ref9
-        self.implementation_data_type_ref9.text = '/AUTOSAR/AUTOSAR_Platform/ImplementationDataTypes/uint8'
-        self.implementation_data_type_ref9.attrib = {'DEST': 'IMPLEMENTATION-DATA-TYPE'}
-        self.type_emitter24 = ET.SubElement(self.implementation_data_type24, 'TYPE-EMITTER')
-        self.variables['type_emitter24'] = self.type_emitter24
-        self.type_emitter24.text = 'Std_Types.h'
-
-        self.implementation_data_type25 = ET.SubElement(self.ImplementationDataTypes_std_folder_elements, 'IMPLEMENTATION-DATA-TYPE')
-        self.variables['implementation_data_type25'] = self.implementation_data_type25
-        self.short_name328 = ET.SubElement(self.implementation_data_type25, 'SHORT-NAME')
-        self.variables['short_name328'] = self.short_name328
-        self.short_name328.text = 'Std_TransformerError'
-        self.category58 = ET.SubElement(self.implementation_data_type25, 'CATEGORY')
-        self.variables['category58'] = self.category58
-        self.category58.text = 'STRUCTURE'
-        self.sub_elements1 = ET.SubElement(self.implementation_data_type25, 'SUB-ELEMENTS')
-        self.variables['sub_elements1'] = self.sub_elements1
-        self.implementation_data_type_element1 = ET.SubElement(self.sub_elements1, 'IMPLEMENTATION-DATA-TYPE-ELEMENT')
-        self.variables['implementation_data_type_element1'] = self.implementation_data_type_element1
-        self.short_name329 = ET.SubElement(self.implementation_data_type_element1, 'SHORT-NAME')
-        self.variables['short_name329'] = self.short_name329
-        self.short_name329.text = 'errorCode'
-        self.category59 = ET.SubElement(self.implementation_data_type_element1, 'CATEGORY')
-        self.variables['category59'] = self.category59
-        self.category59.text = 'TYPE_REFERENCE'
-        self.sw_data_def_props35 = ET.SubElement(self.implementation_data_type_element1, 'SW-DATA-DEF-PROPS')
-        self.variables['sw_data_def_props35'] = self.sw_data_def_props35
-        self.sw_data_def_props_variants35 = ET.SubElement(self.sw_data_def_props35, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['sw_data_def_props_variants35'] = self.sw_data_def_props_variants35
-        self.sw_data_def_props_conditional35 = ET.SubElement(self.sw_data_def_props_variants35, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['sw_data_def_props_conditional35'] = self.sw_data_def_props_conditional35
-        self.implementation_data_type_ref10 = ET.SubElement(self.sw_data_def_props_conditional35, 'IMPLEMENTATION-DATA-TYPE-REF')
-        self.variables['implementation_data_type_ref10'] = self.implementation_data_type_ref10
-        self.implementation_data_type_ref10.text = '/AUTOSAR/AUTOSAR_Std/ImplementationDataTypes/Std_TransformerErrorCode'
-        self.implementation_data_type_ref10.attrib = {'DEST': 'IMPLEMENTATION-DATA-TYPE'}
-        self.implementation_data_type_element2 = ET.SubElement(self.sub_elements1, 'IMPLEMENTATION-DATA-TYPE-ELEMENT')
-        self.variables['implementation_data_type_element2'] = self.implementation_data_type_element2
-        self.short_name330 = ET.SubElement(self.implementation_data_type_element2, 'SHORT-NAME')
-        self.variables['short_name330'] = self.short_name330
-        self.short_name330.text = 'transformerClass'
-        self.category60 = ET.SubElement(self.implementation_data_type_element2, 'CATEGORY')
-        self.variables['category60'] = self.category60
-        self.category60.text = 'TYPE_REFERENCE'
-        self.sw_data_def_props36 = ET.SubElement(self.implementation_data_type_element2, 'SW-DATA-DEF-PROPS')
-        self.variables['sw_data_def_props36'] = self.sw_data_def_props36
-        self.sw_data_def_props_variants36 = ET.SubElement(self.sw_data_def_props36, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['sw_data_def_props_variants36'] = self.sw_data_def_props_variants36
-        self.sw_data_def_props_conditional36 = ET.SubElement(self.sw_data_def_props_variants36, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['sw_data_def_props_conditional36'] = self.sw_data_def_props_conditional36
-        self.implementation_data_type_ref11 = ET.SubElement(self.sw_data_def_props_conditional36, 'IMPLEMENTATION-DATA-TYPE-REF')
-        self.variables['implementation_data_type_ref11'] = self.implementation_data_type_ref11
-        self.implementation_data_type_ref11.text = '/AUTOSAR/AUTOSAR_Std/ImplementationDataTypes/Std_TransformerClass'
-        self.implementation_data_type_ref11.attrib = {'DEST': 'IMPLEMENTATION-DATA-TYPE'}
-        self.type_emitter25 = ET.SubElement(self.implementation_data_type25, 'TYPE-EMITTER')
-        self.variables['type_emitter25'] = self.type_emitter25
-        self.type_emitter25.text = 'Std_Types.h'
-
-        self.implementation_data_type26 = ET.SubElement(self.ImplementationDataTypes_std_folder_elements, 'IMPLEMENTATION-DATA-TYPE')
-        self.variables['implementation_data_type26'] = self.implementation_data_type26
-        self.short_name331 = ET.SubElement(self.implementation_data_type26, 'SHORT-NAME')
-        self.variables['short_name331'] = self.short_name331
-        self.short_name331.text = 'Std_TransformerErrorCode'
-        self.desc6 = ET.SubElement(self.implementation_data_type26, 'DESC')
-        self.variables['desc6'] = self.desc6
-        self.l_26 = ET.SubElement(self.desc6, 'L-2')
-        self.variables['l_26'] = self.l_26
-        self.l_26.text = 'The type of the Std_TransformerError.'
-        self.l_26.attrib = {'L': 'EN'}
-        self.category61 = ET.SubElement(self.implementation_data_type26, 'CATEGORY')
-        self.variables['category61'] = self.category61
-        self.category61.text = 'TYPE_REFERENCE'
-        self.sw_data_def_props37 = ET.SubElement(self.implementation_data_type26, 'SW-DATA-DEF-PROPS')
-        self.variables['sw_data_def_props37'] = self.sw_data_def_props37
-        self.sw_data_def_props_variants37 = ET.SubElement(self.sw_data_def_props37, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['sw_data_def_props_variants37'] = self.sw_data_def_props_variants37
-        self.sw_data_def_props_conditional37 = ET.SubElement(self.sw_data_def_props_variants37, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['sw_data_def_props_conditional37'] = self.sw_data_def_props_conditional37
-        self.data_constr_ref22 = ET.SubElement(self.sw_data_def_props_conditional37, 'DATA-CONSTR-REF')
-        self.variables['data_constr_ref22'] = self.data_constr_ref22
-        self.data_constr_ref22.text = '/AUTOSAR/AUTOSAR_Std/DataConstrs/Std_TransformerErrorCode'
-        self.data_constr_ref22.attrib = {'DEST': 'DATA-CONSTR'}
-        self.implementation_data_type_ref12 = ET.SubElement(self.sw_data_def_props_conditional37, 'IMPLEMENTATION-DATA-TYPE-REF')
-        self.variables['implementation_data_type_ref12'] = self.implementation_data_type_ref12
-        self.implementation_data_type_ref12.text = '/AUTOSAR/AUTOSAR_Platform/ImplementationDataTypes/uint8'
-        self.implementation_data_type_ref12.attrib = {'DEST': 'IMPLEMENTATION-DATA-TYPE'}
-        self.type_emitter26 = ET.SubElement(self.implementation_data_type26, 'TYPE-EMITTER')
-        self.variables['type_emitter26'] = self.type_emitter26
-        self.type_emitter26.text = 'Std_Types.h'
-
-        self.implementation_data_type27 = ET.SubElement(self.ImplementationDataTypes_std_folder_elements, 'IMPLEMENTATION-DATA-TYPE')
-        self.variables['implementation_data_type27'] = self.implementation_data_type27
-        self.short_name332 = ET.SubElement(self.implementation_data_type27, 'SHORT-NAME')
-        self.variables['short_name332'] = self.short_name332
-        self.short_name332.text = 'Std_TransformerForwardCode'
-        self.category62 = ET.SubElement(self.implementation_data_type27, 'CATEGORY')
-        self.variables['category62'] = self.category62
-        self.category62.text = 'TYPE_REFERENCE'
-        self.sw_data_def_props38 = ET.SubElement(self.implementation_data_type27, 'SW-DATA-DEF-PROPS')
-        self.variables['sw_data_def_props38'] = self.sw_data_def_props38
-        self.sw_data_def_props_variants38 = ET.SubElement(self.sw_data_def_props38, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['sw_data_def_props_variants38'] = self.sw_data_def_props_variants38
-        self.sw_data_def_props_conditional38 = ET.SubElement(self.sw_data_def_props_variants38, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['sw_data_def_props_conditional38'] = self.sw_data_def_props_conditional38
-        self.compu_method_ref6 = ET.SubElement(self.sw_data_def_props_conditional38, 'COMPU-METHOD-REF')
-        self.variables['compu_method_ref6'] = self.compu_method_ref6
-        self.compu_method_ref6.text = '/AUTOSAR/AUTOSAR_Std/CompuMethods/Std_TransformerForwardCode'
-        self.compu_method_ref6.attrib = {'DEST': 'COMPU-METHOD'}
-        self.data_constr_ref23 = ET.SubElement(self.sw_data_def_props_conditional38, 'DATA-CONSTR-REF')
-        self.variables['data_constr_ref23'] = self.data_constr_ref23
-        self.data_constr_ref23.text = '/AUTOSAR/AUTOSAR_Std/DataConstrs/Std_TransformerForwardCode'
-        self.data_constr_ref23.attrib = {'DEST': 'DATA-CONSTR'}
-        self.implementation_data_type_ref13 = ET.SubElement(self.sw_data_def_props_conditional38, 'IMPLEMENTATION-DATA-TYPE-REF')
-        self.variables['implementation_data_type_ref13'] = self.implementation_data_type_ref13
-        self.implementation_data_type_ref13.text = '/AUTOSAR/AUTOSAR_Platform/ImplementationDataTypes/uint8'
-        self.implementation_data_type_ref13.attrib = {'DEST': 'IMPLEMENTATION-DATA-TYPE'}
-        self.type_emitter27 = ET.SubElement(self.implementation_data_type27, 'TYPE-EMITTER')
-        self.variables['type_emitter27'] = self.type_emitter27
-        self.type_emitter27.text = 'Std_Types.h'
-
-
-        self.implementation_data_type28 = ET.SubElement(self.ImplementationDataTypes_std_folder_elements, 'IMPLEMENTATION-DATA-TYPE')
-        self.variables['implementation_data_type28'] = self.implementation_data_type28
-        self.short_name333 = ET.SubElement(self.implementation_data_type28, 'SHORT-NAME')
-        self.variables['short_name333'] = self.short_name333
-        self.short_name333.text = 'Std_VersionInfoType'
-        self.desc7 = ET.SubElement(self.implementation_data_type28, 'DESC')
-        self.variables['desc7'] = self.desc7
-        self.l_27 = ET.SubElement(self.desc7, 'L-2')
-        self.variables['l_27'] = self.l_27
-        self.l_27.text = 'This type shall be used to request the version of a BSW module using the <Module name>_GetVersionInfo() function.'
-        self.l_27.attrib = {'L': 'EN'}
-        self.category63 = ET.SubElement(self.implementation_data_type28, 'CATEGORY')
-        self.variables['category63'] = self.category63
-        self.category63.text = 'STRUCTURE'
-        self.sub_elements2 = ET.SubElement(self.implementation_data_type28, 'SUB-ELEMENTS')
-        self.variables['sub_elements2'] = self.sub_elements2
-        self.implementation_data_type_element3 = ET.SubElement(self.sub_elements2, 'IMPLEMENTATION-DATA-TYPE-ELEMENT')
-        self.variables['implementation_data_type_element3'] = self.implementation_data_type_element3
-        self.short_name334 = ET.SubElement(self.implementation_data_type_element3, 'SHORT-NAME')
-        self.variables['short_name334'] = self.short_name334
-        self.short_name334.text = 'vendorID'
-        self.category64 = ET.SubElement(self.implementation_data_type_element3, 'CATEGORY')
-        self.variables['category64'] = self.category64
-        self.category64.text = 'TYPE_REFERENCE'
-        self.sw_data_def_props39 = ET.SubElement(self.implementation_data_type_element3, 'SW-DATA-DEF-PROPS')
-        self.variables['sw_data_def_props39'] = self.sw_data_def_props39
-        self.sw_data_def_props_variants39 = ET.SubElement(self.sw_data_def_props39, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['sw_data_def_props_variants39'] = self.sw_data_def_props_variants39
-        self.sw_data_def_props_conditional39 = ET.SubElement(self.sw_data_def_props_variants39, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['sw_data_def_props_conditional39'] = self.sw_data_def_props_conditional39
-        self.implementation_data_type_ref14 = ET.SubElement(self.sw_data_def_props_conditional39, 'IMPLEMENTATION-DATA-TYPE-REF')
-        self.variables['implementation_data_type_ref14'] = self.implementation_data_type_ref14
-        self.implementation_data_type_ref14.text = '/AUTOSAR/AUTOSAR_Platform/ImplementationDataTypes/uint16'
-        self.implementation_data_type_ref14.attrib = {'DEST': 'IMPLEMENTATION-DATA-TYPE'}
-        self.implementation_data_type_element4 = ET.SubElement(self.sub_elements2, 'IMPLEMENTATION-DATA-TYPE-ELEMENT')
-        self.variables['implementation_data_type_element4'] = self.implementation_data_type_element4
-        self.short_name335 = ET.SubElement(self.implementation_data_type_element4, 'SHORT-NAME')
-        self.variables['short_name335'] = self.short_name335
-        self.short_name335.text = 'moduleID'
-        self.category65 = ET.SubElement(self.implementation_data_type_element4, 'CATEGORY')
-        self.variables['category65'] = self.category65
-        self.category65.text = 'TYPE_REFERENCE'
-        self.sw_data_def_props40 = ET.SubElement(self.implementation_data_type_element4, 'SW-DATA-DEF-PROPS')
-        self.variables['sw_data_def_props40'] = self.sw_data_def_props40
-        self.sw_data_def_props_variants40 = ET.SubElement(self.sw_data_def_props40, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['sw_data_def_props_variants40'] = self.sw_data_def_props_variants40
-        self.sw_data_def_props_conditional40 = ET.SubElement(self.sw_data_def_props_variants40, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['sw_data_def_props_conditional40'] = self.sw_data_def_props_conditional40
-        self.implementation_data_type_ref15 = ET.SubElement(self.sw_data_def_props_conditional40, 'IMPLEMENTATION-DATA-TYPE-REF')
-        self.variables['implementation_data_type_ref15'] = self.implementation_data_type_ref15
-        self.implementation_data_type_ref15.text = '/AUTOSAR/AUTOSAR_Platform/ImplementationDataTypes/uint16'
-        self.implementation_data_type_ref15.attrib = {'DEST': 'IMPLEMENTATION-DATA-TYPE'}
-        self.implementation_data_type_element5 = ET.SubElement(self.sub_elements2, 'IMPLEMENTATION-DATA-TYPE-ELEMENT')
-        self.variables['implementation_data_type_element5'] = self.implementation_data_type_element5
-        self.short_name336 = ET.SubElement(self.implementation_data_type_element5, 'SHORT-NAME')
-        self.variables['short_name336'] = self.short_name336
-        self.short_name336.text = 'sw_major_version'
-        self.category66 = ET.SubElement(self.implementation_data_type_element5, 'CATEGORY')
-        self.variables['category66'] = self.category66
-        self.category66.text = 'TYPE_REFERENCE'
-        self.sw_data_def_props41 = ET.SubElement(self.implementation_data_type_element5, 'SW-DATA-DEF-PROPS')
-        self.variables['sw_data_def_props41'] = self.sw_data_def_props41
-        self.sw_data_def_props_variants41 = ET.SubElement(self.sw_data_def_props41, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['sw_data_def_props_variants41'] = self.sw_data_def_props_variants41
-        self.sw_data_def_props_conditional41 = ET.SubElement(self.sw_data_def_props_variants41, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['sw_data_def_props_conditional41'] = self.sw_data_def_props_conditional41
-        self.implementation_data_type_ref16 = ET.SubElement(self.sw_data_def_props_conditional41, 'IMPLEMENTATION-DATA-TYPE-REF')
-        self.variables['implementation_data_type_ref16'] = self.implementation_data_type_ref16
-        self.implementation_data_type_ref16.text = '/AUTOSAR/AUTOSAR_Platform/ImplementationDataTypes/uint8'
-        self.implementation_data_type_ref16.attrib = {'DEST': 'IMPLEMENTATION-DATA-TYPE'}
-        self.implementation_data_type_element6 = ET.SubElement(self.sub_elements2, 'IMPLEMENTATION-DATA-TYPE-ELEMENT')
-        self.variables['implementation_data_type_element6'] = self.implementation_data_type_element6
-        self.short_name337 = ET.SubElement(self.implementation_data_type_element6, 'SHORT-NAME')
-        self.variables['short_name337'] = self.short_name337
-        self.short_name337.text = 'sw_minor_version'
-        self.category67 = ET.SubElement(self.implementation_data_type_element6, 'CATEGORY')
-        self.variables['category67'] = self.category67
-        self.category67.text = 'TYPE_REFERENCE'
-        self.sw_data_def_props42 = ET.SubElement(self.implementation_data_type_element6, 'SW-DATA-DEF-PROPS')
-        self.variables['sw_data_def_props42'] = self.sw_data_def_props42
-        self.sw_data_def_props_variants42 = ET.SubElement(self.sw_data_def_props42, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['sw_data_def_props_variants42'] = self.sw_data_def_props_variants42
-        self.sw_data_def_props_conditional42 = ET.SubElement(self.sw_data_def_props_variants42, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['sw_data_def_props_conditional42'] = self.sw_data_def_props_conditional42
-        self.implementation_data_type_ref17 = ET.SubElement(self.sw_data_def_props_conditional42, 'IMPLEMENTATION-DATA-TYPE-REF')
-        self.variables['implementation_data_type_ref17'] = self.implementation_data_type_ref17
-        self.implementation_data_type_ref17.text = '/AUTOSAR/AUTOSAR_Platform/ImplementationDataTypes/uint8'
-        self.implementation_data_type_ref17.attrib = {'DEST': 'IMPLEMENTATION-DATA-TYPE'}
-        self.implementation_data_type_element7 = ET.SubElement(self.sub_elements2, 'IMPLEMENTATION-DATA-TYPE-ELEMENT')
-        self.variables['implementation_data_type_element7'] = self.implementation_data_type_element7
-        self.short_name338 = ET.SubElement(self.implementation_data_type_element7, 'SHORT-NAME')
-        self.variables['short_name338'] = self.short_name338
-        self.short_name338.text = 'sw_patch_version'
-        self.category68 = ET.SubElement(self.implementation_data_type_element7, 'CATEGORY')
-        self.variables['category68'] = self.category68
-        self.category68.text = 'TYPE_REFERENCE'
-        self.sw_data_def_props43 = ET.SubElement(self.implementation_data_type_element7, 'SW-DATA-DEF-PROPS')
-        self.variables['sw_data_def_props43'] = self.sw_data_def_props43
-        self.sw_data_def_props_variants43 = ET.SubElement(self.sw_data_def_props43, 'SW-DATA-DEF-PROPS-VARIANTS')
-        self.variables['sw_data_def_props_variants43'] = self.sw_data_def_props_variants43
-        self.sw_data_def_props_conditional43 = ET.SubElement(self.sw_data_def_props_variants43, 'SW-DATA-DEF-PROPS-CONDITIONAL')
-        self.variables['sw_data_def_props_conditional43'] = self.sw_data_def_props_conditional43
-        self.implementation_data_type_ref18 = ET.SubElement(self.sw_data_def_props_conditional43, 'IMPLEMENTATION-DATA-TYPE-REF')
-        self.variables['implementation_data_type_ref18'] = self.implementation_data_type_ref18
-        self.implementation_data_type_ref18.text = '/AUTOSAR/AUTOSAR_Platform/ImplementationDataTypes/uint8'
-        self.implementation_data_type_ref18.attrib = {'DEST': 'IMPLEMENTATION-DATA-TYPE'}
-        self.type_emitter28 = ET.SubElement(self.implementation_data_type28, 'TYPE-EMITTER')
-        self.variables['type_emitter28'] = self.type_emitter28
-        self.type_emitter28.text = 'Std_Types.h'
-
-
-        self.Communication_folder = ET.SubElement(self.root_folders, 'AR-PACKAGE')
-        self.variables['Communication_folder'] = self.Communication_folder
-        self.Communication_folder_short_name = ET.SubElement(self.Communication_folder, 'SHORT-NAME')
-        self.variables['Communication_folder_short_name'] = self.Communication_folder_short_name
-        self.Communication_folder_short_name.text = 'Communication'
-
-        self.Communication_subfolders = ET.SubElement(self.Communication_folder, 'AR-PACKAGES')
-        self.variables['Communication_subfolders'] = self.Communication_subfolders
-
-        self.CommunicationClusters_folder = ET.SubElement(self.Communication_subfolders, 'AR-PACKAGE')
-        self.variables['CommunicationClusters_folder'] = self.CommunicationClusters_folder
-        self.CommunicationClusters_folder_short_name = ET.SubElement(self.CommunicationClusters_folder, 'SHORT-NAME')
-        self.variables['CommunicationClusters_folder_short_name'] = self.CommunicationClusters_folder_short_name
-        self.CommunicationClusters_folder_short_name.text = 'CommunicationClusters'
-
-        self.Frames_folder = ET.SubElement(self.Communication_subfolders, 'AR-PACKAGE')
-        self.variables['Frames_folder'] = self.Frames_folder
-        self.Frames_folder_short_name = ET.SubElement(self.Frames_folder, 'SHORT-NAME')
-        self.variables['Frames_folder_short_name'] = self.Frames_folder_short_name
-        self.Frames_folder_short_name.text = 'Frames'
-
-        self.ISignals_folder = ET.SubElement(self.Communication_subfolders, 'AR-PACKAGE')
-        self.variables['ISignals_folder'] = self.ISignals_folder
-        self.ISignals_folder_short_name = ET.SubElement(self.ISignals_folder, 'SHORT-NAME')
-        self.variables['ISignals_folder_short_name'] = self.ISignals_folder_short_name
-        self.ISignals_folder_short_name.text = 'ISignals'
-
-        self.Pdus_folder = ET.SubElement(self.Communication_subfolders, 'AR-PACKAGE')
-        self.variables['Pdus_folder'] = self.Pdus_folder
-        self.Pdus_folder_short_name = ET.SubElement(self.Pdus_folder, 'SHORT-NAME')
-        self.variables['Pdus_folder_short_name'] = self.Pdus_folder_short_name
-        self.Pdus_folder_short_name.text = 'Pdus'
-
-        self.SystemSignals_folder = ET.SubElement(self.Communication_subfolders, 'AR-PACKAGE')
-        self.variables['SystemSignals_folder'] = self.SystemSignals_folder
-        self.SystemSignals_folder_short_name = ET.SubElement(self.SystemSignals_folder, 'SHORT-NAME')
-        self.variables['SystemSignals_folder_short_name'] = self.SystemSignals_folder_short_name
-        self.SystemSignals_folder_short_name.text = 'SystemSignals'
-
-        self.EcuInstances_folder = ET.SubElement(self.root_folders, 'AR-PACKAGE')
-        self.variables['EcuInstances_folder'] = self.EcuInstances_folder
-        self.EcuInstances_folder_short_name = ET.SubElement(self.EcuInstances_folder, 'SHORT-NAME')
-        self.variables['EcuInstances_folder_short_name'] = self.EcuInstances_folder_short_name
-        self.EcuInstances_folder_short_name.text = 'EcuInstances'
-
-        self.RootSWComposition_folder = ET.SubElement(self.root_folders, 'AR-PACKAGE')
-        self.variables['RootSWComposition_folder'] = self.RootSWComposition_folder
-        self.RootSWComposition_folder.attrib ={'UUID':rng.generate_uuid()} 
-        self.RootSWComposition_folder_short_name = ET.SubElement(self.RootSWComposition_folder, 'SHORT-NAME')
-        self.variables['RootSWComposition_folder_short_name'] = self.RootSWComposition_folder_short_name
-        self.RootSWComposition_folder_short_name.text = 'RootSWComposition'
-
-
-        self.SharedElements_folder = ET.SubElement(self.root_folders, 'AR-PACKAGE')
-        self.variables['SharedElements_folder'] = self.SharedElements_folder
-        self.SharedElements_folder_short_name = ET.SubElement(self.SharedElements_folder, 'SHORT-NAME')
-        self.variables['SharedElements_folder_short_name'] = self.SharedElements_folder_short_name
-        self.SharedElements_folder_short_name.text = 'SharedElements'
-
-        self.SharedElements_subfolders = ET.SubElement(self.SharedElements_folder, 'AR-PACKAGES')
-        self.variables['SharedElements_subfolders'] = self.SharedElements_subfolders
-
-        self.ApplicationDataTypes_folder = ET.SubElement(self.SharedElements_subfolders, 'AR-PACKAGE')
-        self.variables['ApplicationDataTypes_folder'] = self.ApplicationDataTypes_folder
-        self.ApplicationDataTypes_folder_short_name = ET.SubElement(self.ApplicationDataTypes_folder, 'SHORT-NAME')
-        self.variables['ApplicationDataTypes_folder_short_name'] = self.ApplicationDataTypes_folder_short_name
-        self.ApplicationDataTypes_folder_short_name.text = 'ApplicationDataTypes'
-        
-        self.ApplicationDataTypes_subfolders = ET.SubElement(self.ApplicationDataTypes_folder, 'AR-PACKAGES')
-        self.variables['ApplicationDataTypes_subfolders'] = self.ApplicationDataTypes_subfolders
-        
-        self.Array_folder = ET.SubElement(self.ApplicationDataTypes_subfolders, 'AR-PACKAGE')
-        self.variables['Array_folder'] = self.Array_folder
-        self.Array_folder.attrib ={'UUID':rng.generate_uuid()}
-        self.Array_folder_short_name = ET.SubElement(self.Array_folder, 'SHORT-NAME')
-        self.variables['Array_folder_short_name'] = self.Array_folder_short_name
-        self.Array_folder_short_name.text = 'Array'
-        self.Array_folder_elements = ET.SubElement(self.Array_folder, 'ELEMENTS')
-        self.variables['Array_folder_elements'] = self.Array_folder_elements
-
-        
-        self.Primitive_folder = ET.SubElement(self.ApplicationDataTypes_subfolders, 'AR-PACKAGE')
-        self.variables['Primitive_folder'] = self.Primitive_folder
-        self.Primitive_folder.attrib ={'UUID':rng.generate_uuid()}
-        self.Primitive_folder_short_name = ET.SubElement(self.Primitive_folder, 'SHORT-NAME')
-        self.variables['Primitive_folder_short_name'] = self.Primitive_folder_short_name
-        self.Primitive_folder_short_name.text = 'Primitive'
-        self.Primitive_folder_elements = ET.SubElement(self.Primitive_folder, 'ELEMENTS')
-        self.variables['Primitive_folder_elements'] = self.Primitive_folder_elements
-
-        
-        self.Record_folder = ET.SubElement(self.ApplicationDataTypes_subfolders, 'AR-PACKAGE')
-        self.variables['Record_folder'] = self.Record_folder
-        self.Record_folder.attrib ={'UUID':rng.generate_uuid()} #65217d8d-3662-4a20-a643-ec9ee94de7a0'}
-        self.Record_folder_short_name = ET.SubElement(self.Record_folder, 'SHORT-NAME')
-        self.variables['Record_folder_short_name'] = self.Record_folder_short_name
-        self.Record_folder_short_name.text = 'Record'
-        self.Record_folder_elements = ET.SubElement(self.Record_folder, 'ELEMENTS')
-        self.variables['Record_folder_elements'] = self.Record_folder_elements
-        
-        self.CompuMethods_shared_folder = ET.SubElement(self.SharedElements_subfolders, 'AR-PACKAGE')
-        self.variables['CompuMethods_shared_folder'] = self.CompuMethods_shared_folder
-        self.CompuMethods_shared_folder_short_name = ET.SubElement(self.CompuMethods_shared_folder, 'SHORT-NAME')
-        self.variables['CompuMethods_shared_folder_short_name'] = self.CompuMethods_shared_folder_short_name
-        self.CompuMethods_shared_folder_short_name.text = 'CompuMethods'
-        self.CompuMethods_shared_folder_elements = ET.SubElement(self.CompuMethods_shared_folder, 'ELEMENTS')
-        self.variables['CompuMethods_shared_folder_elements'] = self.CompuMethods_shared_folder_elements        
-        
-        self.ConstantSpecifications_folder = ET.SubElement(self.SharedElements_subfolders, 'AR-PACKAGE')
-        self.variables['ConstantSpecifications_folder'] = self.ConstantSpecifications_folder
-        self.ConstantSpecifications_folder_short_name = ET.SubElement(self.ConstantSpecifications_folder, 'SHORT-NAME')
-        self.variables['ConstantSpecifications_folder_short_name'] = self.ConstantSpecifications_folder_short_name
-        self.ConstantSpecifications_folder_short_name.text = 'ConstantSpecifications'
-        self.ConstantSpecifications_folder_elements = ET.SubElement(self.ConstantSpecifications_folder, 'ELEMENTS')
-        self.variables['ConstantSpecifications_folder_elements'] = self.ConstantSpecifications_folder_elements 
-
-        self.ConstantTypeMappingSets_folder = ET.SubElement(self.SharedElements_subfolders, 'AR-PACKAGE')
-        self.variables['ConstantTypeMappingSets_folder'] = self.ConstantTypeMappingSets_folder
-        self.ConstantTypeMappingSets_folder.attrib ={'UUID':rng.generate_uuid()} #6fcb326d-7f82-4cd3-9429-fa90f212d1e8'}
-        self.ConstantTypeMappingSets_folder_short_name = ET.SubElement(self.ConstantTypeMappingSets_folder, 'SHORT-NAME')
-        self.variables['ConstantTypeMappingSets_folder_short_name'] = self.ConstantTypeMappingSets_folder_short_name
-        self.ConstantTypeMappingSets_folder_short_name.text = 'ConstantTypeMappingSets'
-        self.ConstantTypeMappingSets_folder_elements = ET.SubElement(self.ConstantTypeMappingSets_folder, 'ELEMENTS')
-        self.variables['ConstantTypeMappingSets_folder_elements'] = self.ConstantTypeMappingSets_folder_elements
-
-
-        self.DataConstr_folder = ET.SubElement(self.SharedElements_subfolders, 'AR-PACKAGE')
-        self.variables['DataConstr_folder'] = self.DataConstr_folder
-        self.DataConstr_folder.attrib ={'UUID':rng.generate_uuid()} #5b7c99d1-d4ef-481b-95e4-0d6975de4f3b'}
-        self.DataConstr_folder_short_name = ET.SubElement(self.DataConstr_folder, 'SHORT-NAME')
-        self.variables['DataConstr_folder_short_name'] = self.DataConstr_folder_short_name
-        self.DataConstr_folder_short_name.text = 'DataConstr'
-        self.DataConstr_folder_elements = ET.SubElement(self.DataConstr_folder, 'ELEMENTS')
-        self.variables['DataConstr_folder_elements'] = self.DataConstr_folder_elements
-
-        self.DataTypemappingSets_folder = ET.SubElement(self.SharedElements_subfolders, 'AR-PACKAGE')
-        self.variables['DataTypemappingSets_folder'] = self.DataTypemappingSets_folder
-        self.DataTypemappingSets_folder.attrib ={'UUID':rng.generate_uuid()} #463cbb86-4f8e-463e-8bb3-dafc528ccbdf'}
-        self.DataTypemappingSets_folder_short_name = ET.SubElement(self.DataTypemappingSets_folder, 'SHORT-NAME')
-        self.variables['DataTypemappingSets_folder_short_name'] = self.DataTypemappingSets_folder_short_name
-        self.DataTypemappingSets_folder_short_name.text = 'DataTypemappingSets'
-        self.DataTypemappingSets_folder_elements = ET.SubElement(self.DataTypemappingSets_folder, 'ELEMENTS')
-        self.variables['DataTypemappingSets_folder_elements'] = self.DataTypemappingSets_folder_elements
-
-
-
-        self.ImplementationDataTypes_folder = ET.SubElement(self.SharedElements_subfolders, 'AR-PACKAGE')
-        self.variables['ImplementationDataTypes_folder'] = self.ImplementationDataTypes_folder
-        self.ImplementationDataTypes_folder_short_name = ET.SubElement(self.ImplementationDataTypes_folder, 'SHORT-NAME')
-        self.variables['ImplementationDataTypes_folder_short_name'] = self.ImplementationDataTypes_folder_short_name
-        self.ImplementationDataTypes_folder_short_name.text = 'ImplementationDataTypes'
-        self.ImplementationDataTypes_folder_elements = ET.SubElement(self.ImplementationDataTypes_folder, 'ELEMENTS')
-        self.variables['ImplementationDataTypes_folder_elements'] = self.ImplementationDataTypes_folder_elements
-
-########### Interfaces ###########
-
-        self.PortInterfaces_folder = ET.SubElement(self.SharedElements_subfolders, 'AR-PACKAGE')
-        self.variables['PortInterfaces_folder'] = self.PortInterfaces_folder
-        self.PortInterfaces_folder_short_name = ET.SubElement(self.PortInterfaces_folder, 'SHORT-NAME')
-        self.variables['PortInterfaces_folder_short_name'] = self.PortInterfaces_folder_short_name
-        self.PortInterfaces_folder_short_name.text = 'PortInterfaces'
-        self.PortInterfaces_subfolders = ET.SubElement(self.PortInterfaces_folder, 'AR-PACKAGES')
-        self.variables['PortInterfaces_subfolders'] = self.PortInterfaces_subfolders
-        
-        self.ClientServer_folder = ET.SubElement(self.PortInterfaces_subfolders, 'AR-PACKAGE')
-        self.variables['ClientServer_folder'] = self.ClientServer_folder
-        self.ClientServer_folder.attrib = {'UUID':rng.generate_uuid()}
-        self.ClientServer_folder_short_name = ET.SubElement(self.ClientServer_folder, 'SHORT-NAME')
-        self.variables['ClientServer_folder_short_name'] = self.ClientServer_folder_short_name
-        self.ClientServer_folder_short_name.text = 'ClientServer'
-        self.ClientServer_folder_elements = ET.SubElement(self.ClientServer_folder, 'ELEMENTS')
-        self.variables['ClientServer_folder_elements'] = self.ClientServer_folder_elements
-        
-        self.ModeSwitch_folder = ET.SubElement(self.PortInterfaces_subfolders, 'AR-PACKAGE')
-        self.variables['ModeSwitch_folder'] = self.ModeSwitch_folder
-        self.ModeSwitch_folder.attrib = {'UUID': rng.generate_uuid()}
-        self.ModeSwitch_folder_short_name = ET.SubElement(self.ModeSwitch_folder, 'SHORT-NAME')
-        self.variables['ModeSwitch_folder_short_name'] = self.ModeSwitch_folder_short_name
-        self.ModeSwitch_folder_short_name.text = 'ModeSwitch'
-        self.ModeSwitch_folder_elements = ET.SubElement(self.ModeSwitch_folder, 'ELEMENTS')
-        self.variables['ModeSwitch_folder_elements'] = self.ModeSwitch_folder_elements
-        
-        self.NvData_folder = ET.SubElement(self.PortInterfaces_subfolders, 'AR-PACKAGE')
-        self.variables['NvData_folder'] = self.NvData_folder
-        self.NvData_folder.attrib = {'UUID': rng.generate_uuid()}
-        self.NvData_folder_short_name = ET.SubElement(self.NvData_folder, 'SHORT-NAME')
-        self.variables['NvData_folder_short_name'] = self.NvData_folder_short_name
-        self.NvData_folder_short_name.text = 'NvData'
-        self.NvData_folder_elements = ET.SubElement(self.NvData_folder, 'ELEMENTS')
-        self.variables['NvData_folder_elements'] = self.NvData_folder_elements
-        
-        self.Parameter_folder = ET.SubElement(self.PortInterfaces_subfolders, 'AR-PACKAGE')
-        self.variables['Parameter_folder'] = self.Parameter_folder
-        self.Parameter_folder.attrib = {'UUID': rng.generate_uuid()}
-        self.Parameter_folder_short_name = ET.SubElement(self.Parameter_folder, 'SHORT-NAME')
-        self.variables['Parameter_folder_short_name'] = self.Parameter_folder_short_name
-        self.Parameter_folder_short_name.text = 'Parameter'
-        self.Parameter_folder_elements = ET.SubElement(self.Parameter_folder, 'ELEMENTS')
-        self.variables['Parameter_folder_elements'] = self.Parameter_folder_elements
-        
-        self.SenderReceiver_folder = ET.SubElement(self.PortInterfaces_subfolders, 'AR-PACKAGE')
-        self.variables['SenderReceiver_folder'] = self.SenderReceiver_folder
-        self.SenderReceiver_folder.attrib = {'UUID': rng.generate_uuid()}
-        self.SenderReceiver_folder_short_name = ET.SubElement(self.SenderReceiver_folder, 'SHORT-NAME')
-        self.variables['SenderReceiver_folder_short_name'] = self.SenderReceiver_folder_short_name
-        self.SenderReceiver_folder_short_name.text = 'SenderReceiver'
-        self.SenderReceiver_folder_elements = ET.SubElement(self.SenderReceiver_folder, 'ELEMENTS')
-        self.variables['SenderReceiver_folder_elements'] = self.SenderReceiver_folder_elements
-        
-        self.Trigger_folder = ET.SubElement(self.PortInterfaces_subfolders, 'AR-PACKAGE')
-        self.variables['Trigger_folder'] = self.Trigger_folder
-        self.Trigger_folder.attrib = {'UUID': rng.generate_uuid()}
-        self.Trigger_folder_short_name = ET.SubElement(self.Trigger_folder, 'SHORT-NAME')
-        self.variables['Trigger_folder_short_name'] = self.Trigger_folder_short_name
-        self.Trigger_folder_short_name.text = 'Trigger'
-        self.Trigger_folder_elements = ET.SubElement(self.Trigger_folder, 'ELEMENTS')
-        self.variables['Trigger_folder_elements'] = self.Trigger_folder_elements
-
-
-
-
-
-        self.SWCImpl_folder = ET.SubElement(self.SharedElements_subfolders, 'AR-PACKAGE')
-        self.variables['SWCImpl_folder'] = self.SWCImpl_folder
-        self.SWCImpl_folder.attrib ={'UUID':rng.generate_uuid()} #a21c4095-c5dd-41b4-8a15-aa23a460a3e9'}
-        self.SWCImpl_folder_short_name = ET.SubElement(self.SWCImpl_folder, 'SHORT-NAME')
-        self.variables['SWCImpl_folder_short_name'] = self.SWCImpl_folder_short_name
-        self.SWCImpl_folder_short_name.text = 'SWCImpl'
-    
-        
-        self.SwAddrMethods_folder = ET.SubElement(self.SharedElements_subfolders, 'AR-PACKAGE')
-        self.variables['SwAddrMethods_folder'] = self.SwAddrMethods_folder
-        self.SwAddrMethods_folder.attrib ={'UUID':rng.generate_uuid()} #fc8b946c-31d4-49d6-8e0c-ff6847ede7f5'}
-        self.SwAddrMethods_folder_short_name = ET.SubElement(self.SwAddrMethods_folder, 'SHORT-NAME')
-        self.variables['SwAddrMethods_folder_short_name'] = self.SwAddrMethods_folder_short_name
-        self.SwAddrMethods_folder_short_name.text = 'SwAddrMethods'
-
-        self.SwComponentTypes_folder = ET.SubElement(self.root_folders, 'AR-PACKAGE')
-        self.variables['SwComponentTypes_folder'] = self.SwComponentTypes_folder
-        self.SwComponentTypes_folder_short_name = ET.SubElement(self.SwComponentTypes_folder, 'SHORT-NAME')
-        self.variables['SwComponentTypes_folder_short_name'] = self.SwComponentTypes_folder_short_name
-        self.SwComponentTypes_folder_short_name.text = 'SwComponentTypes'
-
-        self.SwComponentTypes_subfolders = ET.SubElement(self.SwComponentTypes_folder, 'AR-PACKAGES')
-        self.variables['SwComponentTypes_subfolders'] = self.SwComponentTypes_subfolders
+        self.shaken = False
+        if self.keep_empty_packages:
+            self.root_folders = copy.deepcopy(load_template())
+            assign_uuids(self.root_folders)
+        else:
+            self.root_folders = ET.Element('AR-PACKAGES')
+            for path in CONSTANT_PATHS:
+                self.resolve_path(path, create=True, deep=True)
+        root.append(self.root_folders)
+
+    def resolve_path(self, path, create=False, deep=False):
+        """
+        Resolves an AUTOSAR package path such as '/SharedElements/CompuMethods/ELEMENTS'.
 
-        self.ApplSWC_folder = ET.SubElement(self.SwComponentTypes_subfolders, 'AR-PACKAGE')
-        self.variables['ApplSWC_folder'] = self.ApplSWC_folder
-        self.ApplSWC_folder.attrib ={'UUID':rng.generate_uuid()} #7e1cfec7-fc85-4615-9df0-46ddc1fdaa09'}
-        self.ApplSWC_folder_short_name = ET.SubElement(self.ApplSWC_folder, 'SHORT-NAME')
-        self.variables['ApplSWC_folder_short_name'] = self.ApplSWC_folder_short_name
-        self.ApplSWC_folder_short_name.text = 'ApplSWC'
-        self.ApplSWC_folder_elements = ET.SubElement(self.ApplSWC_folder, 'ELEMENTS')
-        self.variables['ApplSWC_folder_elements'] = self.ApplSWC_folder_elements
+        Args:
+            path: The package path, optionally ending with ELEMENTS or AR-PACKAGES.
+            create: Create missing packages and containers from the skeleton template.
+            deep: Copy the last package of the path with all of its content.
 
-        self.CddSWC_folder = ET.SubElement(self.SwComponentTypes_subfolders, 'AR-PACKAGE')
-        self.variables['CddSWC_folder'] = self.CddSWC_folder
-        self.CddSWC_folder.attrib ={'UUID':rng.generate_uuid()} #7f0b665f-81ab-462f-aeab-1777b0f9dfd8'}
-        self.CddSWC_folder_short_name = ET.SubElement(self.CddSWC_folder, 'SHORT-NAME')
-        self.variables['CddSWC_folder_short_name'] = self.CddSWC_folder_short_name
-        self.CddSWC_folder_short_name.text = 'CddSWC'
-        self.CddSWC_folder_elements = ET.SubElement(self.CddSWC_folder, 'ELEMENTS')
-        self.variables['CddSWC_folder_elements'] = self.CddSWC_folder_elements
+        Returns:
+            The AR-PACKAGE element, or its ELEMENTS/AR-PACKAGES container if the path
+            ends with one of those tags. None if the path does not exist.
+        """
+        steps = path_steps(path)
+        elem = self.root_folders
+        template = load_template()
+        for index, (tag, short_name) in enumerate(steps):
+            template_child = find_step(template, tag, short_name)
+            child = find_step(elem, tag, short_name)
+            if child is None:
+                if not create or template_child is None:
+                    return None
+                child = copy_from_template(template_child, deep and index == len(steps) - 1)
+                self.insert_in_template_order(elem, template, template_child, child)
+            elem, template = child, template_child
+        return elem
+
+    def insert_in_template_order(self, parent, template_parent, template_child, child):
+        """
+        Inserts child below parent at the position its template node has in the skeleton.
+        """
+        template_children = list(template_parent)
+        position = template_children.index(template_child)
+        index = 0
+        for sibling in parent:
+            template_sibling = find_step(template_parent, sibling.tag, sibling.findtext('SHORT-NAME'))
+            if template_sibling is not None and template_children.index(template_sibling) < position:
+                index += 1
+        parent.insert(index, child)
+
+    def remove_empty_packages(self, keep_packages=()):
+        """
+        Removes packages without any elements unless keep_empty_packages is set.
+        The constant platform packages are kept as they are unless they were tree shaken.
+        The packages at the paths in keep_packages are created if missing and kept, even
+        if they are empty.
+        """
+        for path in keep_packages:
+            self.resolve_path(path, create=True)
+        if self.keep_empty_packages:
+            return
+        remove_empty(self.root_folders, keep_paths=() if self.shaken else CONSTANT_PATHS, keep_packages=keep_packages)
 
-        self.CompSWC_folder = ET.SubElement(self.SwComponentTypes_subfolders, 'AR-PACKAGE')
-        self.variables['CompSWC_folder'] = self.CompSWC_folder
-        self.CompSWC_folder.attrib = {'UUID': rng.generate_uuid()}
-        self.CompSWC_folder_short_name = ET.SubElement(self.CompSWC_folder, 'SHORT-NAME')
-        self.variables['CompSWC_folder_short_name'] = self.CompSWC_folder_short_name
-        self.CompSWC_folder_short_name.text = 'CompSWC'
-        self.CompSWC_folder_elements = ET.SubElement(self.CompSWC_folder, 'ELEMENTS')
-        self.variables['CompSWC_folder_elements'] = self.CompSWC_folder_elements
-        
-        self.EcuAbSWC_folder = ET.SubElement(self.SwComponentTypes_subfolders, 'AR-PACKAGE')
-        self.variables['EcuAbSWC_folder'] = self.EcuAbSWC_folder
-        self.EcuAbSWC_folder.attrib ={'UUID': rng.generate_uuid()}
-        self.EcuAbSWC_folder_short_name = ET.SubElement(self.EcuAbSWC_folder, 'SHORT-NAME')
-        self.variables['EcuAbSWC_folder_short_name'] = self.EcuAbSWC_folder_short_name
-        self.EcuAbSWC_folder_short_name.text = 'EcuAbSWC'
-        self.EcuAbSWC_folder_elements = ET.SubElement(self.EcuAbSWC_folder, 'ELEMENTS')
-        self.variables['EcuAbSWC_folder_elements'] = self.EcuAbSWC_folder_elements
-        
-        self.NvDataSWC_folder = ET.SubElement(self.SwComponentTypes_subfolders, 'AR-PACKAGE')
-        self.variables['NvDataSWC_folder'] = self.NvDataSWC_folder
-        self.NvDataSWC_folder.attrib ={'UUID': rng.generate_uuid()}
-        self.NvDataSWC_folder_short_name = ET.SubElement(self.NvDataSWC_folder, 'SHORT-NAME')
-        self.variables['NvDataSWC_folder_short_name'] = self.NvDataSWC_folder_short_name
-        self.NvDataSWC_folder_short_name.text = 'NvDataSWC'
-        self.NvDataSWC_folder_elements = ET.SubElement(self.NvDataSWC_folder, 'ELEMENTS')
-        self.variables['NvDataSWC_folder_elements'] = self.NvDataSWC_folder_elements
-        
-        self.PrmSWC_folder = ET.SubElement(self.SwComponentTypes_subfolders, 'AR-PACKAGE')
-        self.variables['PrmSWC_folder'] = self.PrmSWC_folder
-        self.PrmSWC_folder.attrib ={'UUID': rng.generate_uuid()}
-        self.PrmSWC_folder_short_name = ET.SubElement(self.PrmSWC_folder, 'SHORT-NAME')
-        self.variables['PrmSWC_folder_short_name'] = self.PrmSWC_folder_short_name
-        self.PrmSWC_folder_short_name.text = 'PrmSWC'
-        self.PrmSWC_folder_elements = ET.SubElement(self.PrmSWC_folder, 'ELEMENTS')
-        self.variables['PrmSWC_folder_elements'] = self.PrmSWC_folder_elements
-        
-        self.SnsrActSWC_folder = ET.SubElement(self.SwComponentTypes_subfolders, 'AR-PACKAGE')
-        self.variables['SnsrActSWC_folder'] = self.SnsrActSWC_folder
-        self.SnsrActSWC_folder.attrib = {'UUID': rng.generate_uuid()}
-        self.SnsrActSWC_folder_short_name = ET.SubElement(self.SnsrActSWC_folder, 'SHORT-NAME')
-        self.variables['SnsrActSWC_folder_short_name'] = self.SnsrActSWC_folder_short_name
-        self.SnsrActSWC_folder_short_name.text = 'SnsrActSWC'
-        self.SnsrActSWC_folder_elements = ET.SubElement(self.SnsrActSWC_folder, 'ELEMENTS')
-        self.variables['SnsrActSWC_folder_elements'] = self.SnsrActSWC_folder_elements
-        
-        self.SrvcPrxySWC_folder = ET.SubElement(self.SwComponentTypes_subfolders, 'AR-PACKAGE')
-        self.variables['SrvcPrxySWC_folder'] = self.SrvcPrxySWC_folder
-        self.SrvcPrxySWC_folder.attrib = {'UUID': rng.generate_uuid()}
-        self.SrvcPrxySWC_folder_short_name = ET.SubElement(self.SrvcPrxySWC_folder, 'SHORT-NAME')
-        self.variables['SrvcPrxySWC_folder_short_name'] = self.SrvcPrxySWC_folder_short_name
-        self.SrvcPrxySWC_folder_short_name.text = 'SrvcPrxySWC'
-        self.SrvcPrxySWC_folder_elements = ET.SubElement(self.SrvcPrxySWC_folder, 'ELEMENTS')
-        self.variables['SrvcPrxySWC_folder_elements'] = self.SrvcPrxySWC_folder_elements
+    def remove_unreferenced_platform_elements(self, extra_targets=()):
+        """
+        Tree shaking: keeps only the platform elements reachable from the generated content.
 
-        self.SrvcSWC_folder = ET.SubElement(self.SwComponentTypes_subfolders, 'AR-PACKAGE')
-        self.variables['SrvcSWC_folder'] = self.SrvcSWC_folder
-        self.SrvcSWC_folder.attrib = {'UUID': rng.generate_uuid()}
-        self.SrvcSWC_folder_short_name = ET.SubElement(self.SrvcSWC_folder, 'SHORT-NAME')
-        self.variables['SrvcSWC_folder_short_name'] = self.SrvcSWC_folder_short_name
-        self.SrvcSWC_folder_short_name.text = 'SrvcSWC'
-        self.SrvcSWC_folder_elements = ET.SubElement(self.SrvcSWC_folder, 'ELEMENTS')
-        self.variables['SrvcPrxySWC_folder_elements'] = self.SrvcSWC_folder_elements
-        
-        self.Systems_folder = ET.SubElement(self.root_folders, 'AR-PACKAGE')
-        self.variables['Systems_folder'] = self.Systems_folder
-        self.Systems_folder.attrib = {'UUID': rng.generate_uuid()}
-        self.Systems_folder_short_name = ET.SubElement(self.Systems_folder, 'SHORT-NAME')
-        self.variables['Systems_folder_short_name'] = self.Systems_folder_short_name
-        self.Systems_folder_short_name.text = 'Systems'
-        self.Systems_folder_elements = ET.SubElement(self.Systems_folder, 'ELEMENTS')
-        self.variables['Systems_folder_elements'] = self.Systems_folder_elements
+        The references of the generated packages are collected in one pass, then followed
+        transitively through the platform elements (units to physical dimensions, types to
+        base types, compu methods and data constraints). extra_targets adds the references of
+        content that is no longer in the tree, e.g. elements already streamed to the output.
+        Called by main.build_document() when tree shaking is requested.
+        """
+        index = {}
+        constant_packages = []
+        for path in CONSTANT_PATHS:
+            package = self.resolve_path(path)
+            if package is not None:
+                constant_packages.append(package)
+                index_elements(package, path, {}, index)
+        pending = [target for package in self.root_folders if package not in constant_packages
+                   for target in reference_targets(package)]
+        pending.extend(extra_targets)
+        reachable = set()
+        while pending:
+            target = pending.pop()
+            # References into an element (e.g. a unit's dimension) keep the whole element
+            while target and target not in index:
+                target = target.rsplit('/', 1)[0]
+            if not target or target in reachable:
+                continue
+            reachable.add(target)
+            element, elements, bases = index[target]
+            pending.extend(reference_targets(element, bases))
+        for path, (element, elements, bases) in index.items():
+            if path not in reachable:
+                elements.remove(element)
+        self.shaken = True
+
+    def constant_regions(self):
+        """
+        Returns {element: AUTOSAR path} for the packages listed in CONSTANT_PATHS.
+        """
+        regions = {}
+        if self.shaken:
+            return regions
+        for path in CONSTANT_PATHS:
+            package = self.resolve_path(path)
+            if package is not None:
+                regions[package] = path
+        return regions
 
     def get_variable(self, name):
-        return self.variables.get(name)
+        if name == 'root':
+            return self.root
+        if name == 'root_folders':
+            return self.root_folders
+        path = FOLDER_PATHS.get(name)
+        if path is None:
+            return None
+        return self.resolve_path(path, create=True)
@@ -0,0 +1,198 @@
+"""
+Compact element type for the generated ARXML tree.
+
+Node implements the part of the ElementTree element API the builders, Pkg_struct and
+arxml_writer use. It keeps its fields in __slots__, interns the tag names, stores the
+UUID in its own slot instead of an attribute dict, and leaves the other attributes and
+child list unallocated until they are needed. Most generated elements are leaves such
+as SHORT-NAME or a reference, which then cost a single small object.
+
+The node model is selected with xml_backend.use_backend('nodes').
+"""
+import sys
+
+class Node:
+    """
+    An ARXML element.
+
+    The UUID is always the first attribute of items(), as in the elements the builders
+    create. Other attributes keep their insertion order.
+    """
+    # attrs holds the other attributes as a flat (key, value, key, value, ...) tuple, a
+    # one-entry dict would be larger than the node itself
+    __slots__ = ('tag', 'uuid', 'attrs', 'text', 'tail', 'children')
+
+    def __init__(self, tag, attrib=None, **extra):
+        self.tag = sys.intern(tag)
+        self.uuid = None
+        self.attrs = None
+        self.text = None
+        self.tail = None
+        self.children = None
+        if attrib:
+            for key, value in attrib.items():
+                self.set(key, value)
+        for key, value in extra.items():
+            self.set(key, value)
+
+    def __repr__(self):
+        return f"<Node {self.tag} at {id(self):#x}>"
+
+    # attributes
+
+    def get(self, key, default=None):
+        if key == 'UUID':
+            return default if self.uuid is None else self.uuid
+        attrs = self.attrs
+        if attrs:
+            for index in range(0, len(attrs), 2):
+                if attrs[index] == key:
+                    return attrs[index + 1]
+        return default
+
+    def set(self, key, value):
+        if key == 'UUID':
+            self.uuid = value
+            return
+        attrs = self.attrs
+        if attrs:
+            for index in range(0, len(attrs), 2):
+                if attrs[index] == key:
+                    self.attrs = attrs[:index + 1] + (value,) + attrs[index + 2:]
+                    return
+            self.attrs = attrs + (sys.intern(key), value)
+        else:
+            self.attrs = (sys.intern(key), value)
+
+    def items(self):
+        items = [] if self.uuid is None else [('UUID', self.uuid)]
+        attrs = self.attrs
+        if attrs:
+            items.extend(zip(attrs[::2], attrs[1::2]))
+        return items
+
+    def keys(self):
+        return [key for key, value in self.items()]
+
+    @property
+    def attrib(self):
+        """
+        A copy of the attributes, changes must go through set().
+        """
+        return dict(self.items())
+
+    @attrib.setter
+    def attrib(self, attrib):
+        self.uuid = None
+        self.attrs = None
+        for key, value in attrib.items():
+            self.set(key, value)
+
+    # children
+
+    def __len__(self):
+        return len(self.children) if self.children else 0
+
+    def __iter__(self):
+        return iter(self.children or ())
+
+    def __getitem__(self, index):
+        if self.children is None:
+            raise IndexError("child index out of range")
+        return self.children[index]
+
+    def append(self, child):
+        if self.children is None:
+            self.children = [child]
+        else:
+            self.children.append(child)
+
+    def extend(self, children):
+        if self.children is None:
+            self.children = list(children)
+        else:
+            self.children.extend(children)
+
+    def insert(self, index, child):
+        if self.children is None:
+            self.children = [child]
+        else:
+            self.children.insert(index, child)
+
+    def remove(self, child):
+        if self.children is None:
+            raise ValueError("Node.remove(x): x not in list")
+        self.children.remove(child)
+
+    def clear(self):
+        self.uuid = None
+        self.attrs = None
+        self.text = None
+        self.tail = None
+        self.children = None
+
+    # search, paths are child tags separated by '/'
+
+    def iterfind(self, path):
+        nodes = [self]
+        for tag in path.split('/'):
+            nodes = [child for node in nodes for child in node if child.tag == tag]
+        return iter(nodes)
+
+    def find(self, path):
+        return next(self.iterfind(path), None)
+
+    def findall(self, path):
+        return list(self.iterfind(path))
+
+    def findtext(self, path, default=None):
+        node = self.find(path)
+        if node is None:
+            return default
+        return node.text or ''
+
+    def iter(self, tag=None):
+        """
+        Yields this node and all nodes below it in document order.
+        """
+        pending = [self]
+        while pending:
+            node = pending.pop()
+            if tag is None or node.tag == tag:
+                yield node
+            if node.children:
+                pending.extend(reversed(node.children))
+
+    # copies
+
+    def __copy__(self):
+        node = Node.__new__(Node)
+        node.tag = self.tag
+        node.uuid = self.uuid
+        node.attrs = self.attrs
+        node.text = self.text
+        node.tail = self.tail
+        node.children = list(self.children) if self.children else None
+        return node
+
+    def __deepcopy__(self, memo):
+        node = self.__copy__()
+        if node.children:
+            node.children = [child.__deepcopy__(memo) for child in node.children]
+        return node
+
+def SubElement(parent, tag, attrib=None, **extra):
+    node = Node(tag, attrib, **extra)
+    parent.append(node)
+    return node
+
+def from_element(elem):
+    """
+    Converts an ElementTree element and everything below it into Nodes.
+    """
+    node = Node(elem.tag, elem.attrib)
+    node.text = elem.text
+    node.tail = elem.tail
+    if len(elem):
+        node.children = [from_element(child) for child in elem]
+    return node
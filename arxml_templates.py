@@ -0,0 +1,186 @@
+"""
+Precompiled text templates for the fixed ARXML shapes of the bulk builders.
+
+In the 'templates' emitter mode the bulk builders of arelements_def render their rows
+straight into ARXML text instead of building Element objects. The rows of one container
+are kept as a single fragment element whose text is written out by arxml_writer, indented
+to the fragment's level. Names and reference paths are inserted without escaping, the
+validator restricts short names to [A-Za-z][A-Za-z0-9_]*; only the fields that can hold
+arbitrary workbook text (enum and init values) are escaped.
+
+The emitter is picked with use_emitter() or the SAARCONN_EMITTER environment variable.
+"""
+import os
+import re
+
+ELEMENTS = 'elements'
+TEMPLATES = 'templates'
+EMITTERS = (ELEMENTS, TEMPLATES)
+
+# Tag of the element holding the rendered rows of one container
+FRAGMENT_TAG = 'ARXML-FRAGMENT'
+
+INDENT = "  "
+
+FIELD = re.compile(r'\{(\w+)\}')
+TEXT_FIELD = re.compile(r'<([\w-]+)>\{(\w+)\}</\1>')
+ROW_START = re.compile(r'^<(?!/)', re.MULTILINE)
+SHORT_NAME = re.compile(r'<SHORT-NAME>([^<]*)</SHORT-NAME>')
+REFERENCE = re.compile(r'<([\w-]+-T?REF) DEST="([^"]*)">([^<]*)</\1>')
+# UUID placeholder of the deterministic mode followed by the row's SHORT-NAME
+PATH_UUID = re.compile(r' UUID=""(>\s*<SHORT-NAME>([^<]*)</SHORT-NAME>)')
+
+def escape_text(text):
+    text = str(text)
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+class Shape:
+    """
+    An ARXML shape compiled to a %-format string.
+
+    The template is written at indentation level 0. {name} fields are inserted as they
+    are, a field that is the whole text of an element (<TAG>{name}</TAG>) is a text field:
+    it is escaped, and an empty or None value gives <TAG /> like the element writer does.
+    """
+    def __init__(self, template, text_fields=()):
+        self.text_fields = {}
+        def compile_text_field(match):
+            tag, name = match.groups()
+            if name not in text_fields:
+                return match.group(0)
+            self.text_fields[name] = tag
+            return f'%({name})s'
+        template = TEXT_FIELD.sub(compile_text_field, template.replace('%', '%%'))
+        self.format = FIELD.sub(r'%(\1)s', template)
+
+    def render(self, rows):
+        """
+        Returns the rows, dicts of field values, rendered and joined at level 0.
+        The text fields of the row dicts are replaced with their rendered elements.
+        """
+        text_fields = self.text_fields.items()
+        rendered = []
+        for row in rows:
+            for name, tag in text_fields:
+                value = row[name]
+                row[name] = f'<{tag}>{escape_text(value)}</{tag}>' if value else f'<{tag} />'
+            rendered.append(self.format % row)
+        return "\n".join(rendered)
+
+VARIABLE_ACCESS = Shape('''\
+<VARIABLE-ACCESS UUID="{uuid}">
+  <SHORT-NAME>{short_name}</SHORT-NAME>
+  <ACCESSED-VARIABLE>
+    <AUTOSAR-VARIABLE-IREF>
+      <PORT-PROTOTYPE-REF DEST="{port_dest}">{port_ref}</PORT-PROTOTYPE-REF>
+      <TARGET-DATA-PROTOTYPE-REF DEST="VARIABLE-DATA-PROTOTYPE">{target_ref}</TARGET-DATA-PROTOTYPE-REF>
+    </AUTOSAR-VARIABLE-IREF>
+  </ACCESSED-VARIABLE>
+</VARIABLE-ACCESS>''')
+
+DATA_PROTOTYPE = Shape('''\
+<{tag} UUID="{uuid}">
+  <SHORT-NAME>{short_name}</SHORT-NAME>
+  <SW-DATA-DEF-PROPS>
+    <SW-DATA-DEF-PROPS-VARIANTS>
+      <SW-DATA-DEF-PROPS-CONDITIONAL>
+        <SW-CALIBRATION-ACCESS>{calibration_access}</SW-CALIBRATION-ACCESS>
+        <SW-IMPL-POLICY>{impl_policy}</SW-IMPL-POLICY>
+      </SW-DATA-DEF-PROPS-CONDITIONAL>
+    </SW-DATA-DEF-PROPS-VARIANTS>
+  </SW-DATA-DEF-PROPS>
+  <TYPE-TREF DEST="{type_dest}">{type_ref}</TYPE-TREF>
+</{tag}>''', text_fields=('calibration_access', 'impl_policy'))
+
+DATA_PROTOTYPE_WITH_INIT_VALUE = Shape('''\
+<{tag} UUID="{uuid}">
+  <SHORT-NAME>{short_name}</SHORT-NAME>
+  <SW-DATA-DEF-PROPS>
+    <SW-DATA-DEF-PROPS-VARIANTS>
+      <SW-DATA-DEF-PROPS-CONDITIONAL>
+        <SW-CALIBRATION-ACCESS>{calibration_access}</SW-CALIBRATION-ACCESS>
+        <SW-IMPL-POLICY>{impl_policy}</SW-IMPL-POLICY>
+      </SW-DATA-DEF-PROPS-CONDITIONAL>
+    </SW-DATA-DEF-PROPS-VARIANTS>
+  </SW-DATA-DEF-PROPS>
+  <TYPE-TREF DEST="{type_dest}">{type_ref}</TYPE-TREF>
+  <INIT-VALUE>
+    <NUMERICAL-VALUE-SPECIFICATION>
+      <SHORT-LABEL>Value</SHORT-LABEL>
+      <VALUE>{value}</VALUE>
+    </NUMERICAL-VALUE-SPECIFICATION>
+  </INIT-VALUE>
+</{tag}>''', text_fields=('calibration_access', 'impl_policy', 'value'))
+
+def add_rows(container, shape, rows, element_factory):
+    """
+    Renders rows with shape and appends them to the fragment at the end of container,
+    a new fragment is created with element_factory(FRAGMENT_TAG) if there is none.
+    """
+    if not rows:
+        return
+    text = shape.render(rows)
+    if len(container) and container[-1].tag == FRAGMENT_TAG:
+        fragment = container[-1]
+        fragment.text = f"{fragment.text}\n{text}"
+    else:
+        fragment = element_factory(FRAGMENT_TAG)
+        fragment.text = text
+        container.append(fragment)
+
+def iter_rows(fragment):
+    """
+    Yields the rendered rows of a fragment, a row starts at its unindented opening tag.
+    """
+    text = fragment.text
+    starts = [match.start() for match in ROW_START.finditer(text)]
+    for start, end in zip(starts, starts[1:] + [len(text)]):
+        yield text[start:end].rstrip("\n")
+
+def short_name(row):
+    match = SHORT_NAME.search(row)
+    return match.group(1) if match else None
+
+def references(text):
+    """
+    Yields (target path, DEST) of every reference in rendered text.
+    """
+    for match in REFERENCE.finditer(text):
+        yield match.group(3).strip(), match.group(2)
+
+def fill_path_uuids(text, parent_path, uuid_for_path):
+    """
+    Replaces the deterministic UUID placeholders with the UUIDs of the rows' AUTOSAR paths.
+    """
+    def path_uuid(match):
+        return ' UUID="%s"%s' % (uuid_for_path(f"{parent_path}/{match.group(2)}"), match.group(1))
+    return PATH_UUID.sub(path_uuid, text)
+
+def indent(text, level):
+    """
+    Returns text rendered at level 0 indented to level.
+    """
+    return text.replace("\n", "\n" + INDENT * level) if level else text
+
+emitter = None
+
+def use_emitter(name=ELEMENTS):
+    """
+    Selects how the bulk builders emit their rows: 'elements' builds Element objects,
+    'templates' renders them with the precompiled shapes.
+
+    Raises:
+        ValueError: If the emitter name is unknown.
+    """
+    global emitter
+    if name not in EMITTERS:
+        raise ValueError(f"Unknown emitter '{name}', expected one of {EMITTERS}")
+    emitter = name
+
+use_emitter(os.environ.get('SAARCONN_EMITTER', ELEMENTS))
@@ -0,0 +1,638 @@
+import gzip
+import hashlib
+import io
+import json
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+import arxml_node
+import arxml_templates
+import rng
+import xml_backend
+
+XML_DECLARATION = b'<?xml version="1.0" encoding="utf-8"?>\n'
+
+INDENT = "  "
+
+# Serialized constant regions, keyed by (AUTOSAR path, indentation level, path-derived UUIDs)
+_constant_cache = {}
+
+# Placeholder left in an ELEMENTS container for the elements already streamed to its spool
+SPOOL_TAG = 'ARXML-WRITER-SPOOL'
+
+# Compressions of the bundle output, see write_compressed()
+GZIP = 'gzip'
+ZIP = 'zip'
+COMPRESSIONS = (GZIP, ZIP)
+
+# Timestamp of the bundle members, fixed so equal content gives an equal bundle
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+class HashingFile:
+    """
+    Binary file wrapper that hashes and counts everything written through it.
+    """
+    def __init__(self, file):
+        self.file = file
+        self.hash = hashlib.blake2b(digest_size=16)
+        self.size = 0
+
+    def write(self, data):
+        self.hash.update(data)
+        self.size += len(data)
+        return self.file.write(data)
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+    def hexdigest(self):
+        return self.hash.hexdigest()
+
+class BackgroundWriter:
+    """
+    Binary file object that writes to target in a background thread.
+
+    write() queues the data and returns, so serialization goes on while the thread
+    compresses and writes the earlier blocks. close() waits for the queued blocks, closes
+    target and raises the first error of the thread.
+    """
+    def __init__(self, target, max_blocks=64):
+        self.target = target
+        self.blocks = queue.Queue(max_blocks)
+        self.error = None
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def run(self):
+        while True:
+            block = self.blocks.get()
+            if block is None:
+                return
+            if self.error is None:
+                try:
+                    self.target.write(block)
+                except BaseException as e:
+                    self.error = e
+
+    def write(self, data):
+        if self.error is not None:
+            raise self.error
+        self.blocks.put(bytes(data))
+        return len(data)
+
+    def close(self):
+        self.blocks.put(None)
+        self.thread.join()
+        if self.error is not None:
+            raise self.error
+        self.target.close()
+
+def write_compressed(file, documents, compression):
+    """
+    Writes documents compressed to a binary file, every document is compressed in a
+    background thread while it is serialized.
+
+    Args:
+        file: The binary file object of the bundle.
+        documents: [(member name, write)], write(file) writes the uncompressed document.
+        compression: 'gzip' for a single document or 'zip'.
+
+    Returns:
+        The index of the bundle, a {"name", "size", "hash"} dict per document with its
+        uncompressed size and content hash.
+
+    Raises:
+        ValueError: If the compression is unknown or gzip gets more than one document.
+    """
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown compression '{compression}', expected one of {COMPRESSIONS}")
+    if compression == GZIP and len(documents) != 1:
+        raise ValueError(f"A gzip bundle holds one document, got {len(documents)}")
+    archive = zipfile.ZipFile(file, "w") if compression == ZIP else None
+    index = []
+    try:
+        for name, write in documents:
+            if archive is None:
+                target = gzip.GzipFile(filename=name, mode="wb", fileobj=file, mtime=0)
+            else:
+                info = zipfile.ZipInfo(name, date_time=ZIP_DATE_TIME)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                target = archive.open(info, "w")
+            hashing_file = HashingFile(target)
+            background = BackgroundWriter(hashing_file)
+            try:
+                write(background)
+            finally:
+                background.close()
+            index.append({"name": name, "size": hashing_file.size, "hash": hashing_file.hexdigest()})
+    finally:
+        if archive is not None:
+            archive.close()
+    return index
+
+def file_hash(path):
+    """
+    Returns the hash HashingFile gives for the content of a file, None if it does not exist.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+class OutputManifest:
+    """
+    Content hashes of the files written by earlier runs, kept in a JSON file.
+
+    An entry is trusted while the file still has the size and mtime recorded with it,
+    otherwise the file is hashed again. Paths are stored relative to the manifest.
+
+    Args:
+        path: The manifest file, it does not have to exist yet.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.folder = os.path.dirname(os.path.abspath(path))
+        try:
+            with open(path, encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def key(self, path):
+        return os.path.relpath(os.path.abspath(path), self.folder)
+
+    def file_hash(self, path):
+        """
+        Returns the content hash of path, None if it does not exist.
+        """
+        entry = self.entries.get(self.key(path))
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry["hash"]
+        return file_hash(path)
+
+    def update(self, path, digest):
+        stat = os.stat(path)
+        self.entries[self.key(path)] = {"hash": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def save(self):
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=1, sort_keys=True)
+        os.replace(temp_path, self.path)
+
+def write_if_changed(path, write, manifest=None):
+    """
+    Calls write(file) with a binary file and replaces path with what was written, unless
+    path already has the same content. The content is hashed while it is written, the
+    hash of the existing file comes from manifest (an OutputManifest) if given. The file
+    is written next to path and moved in place, so readers never see a partial file.
+
+    Returns:
+        True if path was written.
+    """
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "wb") as f:
+            hashing_file = HashingFile(f)
+            write(hashing_file)
+        digest = hashing_file.hexdigest()
+        old_digest = manifest.file_hash(path) if manifest is not None else file_hash(path)
+        changed = old_digest != digest
+        if changed:
+            os.replace(temp_path, path)
+        else:
+            os.remove(temp_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    if manifest is not None:
+        manifest.update(path, digest)
+    return changed
+
+def escape_cdata(text):
+    """
+    Escapes character data the same way ElementTree does.
+    """
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+def escape_attrib(text):
+    """
+    Escapes an attribute value the same way ElementTree does.
+    """
+    text = escape_cdata(text)
+    if "\"" in text:
+        text = text.replace("\"", "&quot;")
+    if "\r" in text:
+        text = text.replace("\r", "&#13;")
+    if "\n" in text:
+        text = text.replace("\n", "&#10;")
+    if "\t" in text:
+        text = text.replace("\t", "&#09;")
+    return text
+
+def local_name(tag):
+    """
+    Returns the tag without its namespace prefix.
+    """
+    if '}' in tag:
+        return tag.split('}', 1)[1]
+    return tag
+
+def is_blank(text):
+    return not text or not text.strip()
+
+class ARXMLWriter:
+    """
+    Serializes an element tree as indented ARXML.
+
+    Namespace prefixes are removed and indentation is added while writing, so the
+    tree itself is left untouched. Elements listed in constant_regions are written
+    from cached bytes that are serialized only once per process, elements in exclude
+    are left out of the output. In the deterministic UUID mode (see rng) the UUID
+    placeholders are replaced with the UUID of the element's AUTOSAR path.
+    """
+    def __init__(self, file, constant_regions=None, exclude=None):
+        self.file = file
+        self.constant_regions = constant_regions or {}
+        self.exclude = exclude or ()
+        self.parts = []
+        self.path_uuids = rng.provider.deterministic
+        # SHORT-NAMEs of the elements being written, None for elements without one
+        self.names = []
+
+    def flush(self):
+        if self.parts:
+            self.file.write("".join(self.parts).encode("utf-8"))
+            self.parts.clear()
+
+    def write_constant(self, elem, path, level):
+        key = (path, level, self.path_uuids)
+        if key not in _constant_cache:
+            writer = ARXMLWriter(None)
+            writer.names = list(self.names)
+            writer.write_element(elem, level)
+            _constant_cache[key] = "".join(writer.parts).encode("utf-8")
+        self.flush()
+        self.file.write(_constant_cache[key])
+
+    def element_path(self, elem):
+        """
+        Returns the AUTOSAR path of elem from the SHORT-NAMEs of the elements being written.
+        """
+        names = [name for name in self.names if name]
+        names.append(elem.findtext('SHORT-NAME') or local_name(elem.tag))
+        return "/" + "/".join(names)
+
+    def write_fragment(self, fragment, level):
+        """
+        Writes the rows rendered by arxml_templates, indented to level.
+        """
+        text = fragment.text
+        if self.path_uuids:
+            parent_path = "/" + "/".join(name for name in self.names if name)
+            text = arxml_templates.fill_path_uuids(text, parent_path, rng.uuid_for_path)
+        self.parts.append(arxml_templates.indent(text, level))
+
+    def write_element(self, elem, level=0):
+        if elem in self.constant_regions:
+            self.write_constant(elem, self.constant_regions[elem], level)
+            return
+        if elem.tag == arxml_templates.FRAGMENT_TAG:
+            self.write_fragment(elem, level)
+            return
+        if type(elem) is arxml_node.Node:
+            self.write_node(elem, level)
+            return
+        write = self.parts.append
+        tag = local_name(elem.tag)
+        write("<" + tag)
+        for key, value in (xml_backend.attributes(elem) if level == 0 else elem.items()):
+            if key == 'UUID' and value == rng.PATH_UUID and self.path_uuids:
+                value = rng.uuid_for_path(self.element_path(elem))
+            write(' %s="%s"' % (key, escape_attrib(value)))
+        text = elem.text
+        children = [child for child in elem if child not in self.exclude] if self.exclude else elem
+        if len(children):
+            if is_blank(text):
+                text = "\n" + INDENT * (level + 1)
+            write(">" + escape_cdata(text))
+            if self.path_uuids:
+                self.names.append(elem.findtext('SHORT-NAME'))
+            last = len(children) - 1
+            for index, child in enumerate(children):
+                self.write_element(child, level + 1)
+                tail = child.tail
+                if is_blank(tail):
+                    tail = "\n" + INDENT * (level if index == last else level + 1)
+                write(escape_cdata(tail))
+            if self.path_uuids:
+                self.names.pop()
+            write("</" + tag + ">")
+        elif text:
+            write(">" + escape_cdata(text) + "</" + tag + ">")
+        else:
+            write(" />")
+
+    def write_node(self, node, level):
+        """
+        write_element() for arxml_node.Node, reads the slots instead of going through
+        the element API.
+        """
+        write = self.parts.append
+        tag = local_name(node.tag)
+        write("<" + tag)
+        if node.uuid is not None:
+            value = node.uuid
+            if value == rng.PATH_UUID and self.path_uuids:
+                value = rng.uuid_for_path(self.element_path(node))
+            write(' UUID="%s"' % escape_attrib(value))
+        attrs = node.attrs
+        if attrs:
+            for index in range(0, len(attrs), 2):
+                write(' %s="%s"' % (attrs[index], escape_attrib(attrs[index + 1])))
+        text = node.text
+        children = node.children
+        if children and self.exclude:
+            children = [child for child in children if child not in self.exclude]
+        if children:
+            if is_blank(text):
+                text = "\n" + INDENT * (level + 1)
+            write(">" + escape_cdata(text))
+            if self.path_uuids:
+                self.names.append(node.findtext('SHORT-NAME'))
+            last = children[-1]
+            inner = "\n" + INDENT * (level + 1)
+            for child in children:
+                self.write_element(child, level + 1)
+                tail = child.tail
+                if is_blank(tail):
+                    tail = "\n" + INDENT * level if child is last else inner
+                write(escape_cdata(tail))
+            if self.path_uuids:
+                self.names.pop()
+            write("</" + tag + ">")
+        elif text:
+            write(">" + escape_cdata(text) + "</" + tag + ">")
+        else:
+            write(" />")
+
+    def write(self, root):
+        """
+        Writes the XML declaration followed by the whole tree below root.
+        """
+        self.file.write(XML_DECLARATION)
+        self.write_element(root)
+        tail = root.tail
+        if len(root) and is_blank(tail):
+            tail = "\n"
+        if tail:
+            self.parts.append(escape_cdata(tail))
+        self.flush()
+
+class StreamingARXMLWriter(ARXMLWriter):
+    """
+    Writes an ARXML document with bounded memory.
+
+    release() serializes the elements generated so far into a buffered spool file per
+    ELEMENTS container and removes them from the tree, leaving a single placeholder.
+    finish() writes the document in package order, copying each spool in place of its
+    placeholder, so only the elements of the current generation step are kept in memory.
+
+    While chunks is a dict, release() also records the text it streams as
+    {package path: text}; spool_text() appends such text to a container again.
+    """
+    def __init__(self, spool_dir=None, reference_index=None, memory_spools=False):
+        super().__init__(None)
+        self.spool_dir = spool_dir
+        # Spools in memory instead of temporary files in spool_dir
+        self.memory_spools = memory_spools
+        self.spools = {}
+        # Reference targets of the released elements, for tree shaking after they are gone
+        self.references = set()
+        # Optional reference_index.ReferenceIndex the released elements are added to
+        self.reference_index = reference_index
+        # Optional {package path: released text}, see incremental
+        self.chunks = None
+
+    def release(self, root, skip=()):
+        """
+        Streams the completed elements of every ELEMENTS container below root to the spools.
+
+        Args:
+            root: The AUTOSAR root element.
+            skip: Packages to leave in memory, e.g. the constant platform packages.
+        """
+        pending = [(root, 0, [])]
+        while pending:
+            elem, level, names = pending.pop()
+            for child in elem:
+                if child in skip:
+                    continue
+                if child.tag == 'ELEMENTS':
+                    self.release_container(child, level + 1, names)
+                elif child.tag == 'AR-PACKAGES':
+                    pending.append((child, level + 1, names))
+                elif child.tag == 'AR-PACKAGE':
+                    pending.append((child, level + 1, names + [child.findtext('SHORT-NAME')]))
+
+    def release_container(self, container, level, names=()):
+        placeholder = container[0] if len(container) and container[0].tag == SPOOL_TAG else None
+        completed = [child for child in container if child is not placeholder]
+        if not completed:
+            return
+        separator = "\n" + INDENT * (level + 1)
+        self.names = list(names)
+        for index, child in enumerate(completed):
+            if index:
+                self.parts.append(separator)
+            self.write_element(child, level + 1)
+            for ref in child.iter():
+                if ref.text and ref.tag.endswith(('-REF', '-TREF')):
+                    self.references.add(ref.text.strip())
+                elif ref.tag == arxml_templates.FRAGMENT_TAG:
+                    self.references.update(target for target, dest in arxml_templates.references(ref.text))
+            if self.reference_index is not None:
+                self.reference_index.add(child, "/" + "/".join(names))
+        text = "".join(self.parts)
+        self.parts.clear()
+        self.names = []
+        self.spool_text(container, level, text)
+        if self.chunks is not None:
+            path = "/" + "/".join(names)
+            if path in self.chunks:
+                text = self.chunks[path] + separator + text
+            self.chunks[path] = text
+
+    def spool_text(self, container, level, text):
+        """
+        Appends serialized elements to the spool of an ELEMENTS container at level and
+        leaves only the spool placeholder in the container.
+        """
+        placeholder = container[0] if len(container) and container[0].tag == SPOOL_TAG else None
+        if placeholder is None:
+            placeholder = xml_backend.Element(SPOOL_TAG)
+            self.spools[placeholder] = io.BytesIO() if self.memory_spools else tempfile.TemporaryFile(dir=self.spool_dir)
+        spool = self.spools[placeholder]
+        if spool.tell():
+            text = "\n" + INDENT * (level + 1) + text
+        spool.write(text.encode("utf-8"))
+        container.clear()
+        container.append(placeholder)
+
+    def write_element(self, elem, level=0):
+        if elem.tag == SPOOL_TAG:
+            self.flush()
+            spool = self.spools[elem]
+            spool.seek(0)
+            shutil.copyfileobj(spool, self.file)
+            return
+        super().write_element(elem, level)
+
+    def finish(self, root, file, constant_regions=None, exclude=None):
+        """
+        Writes the complete document to a binary file object and closes the spools.
+        constant_regions and exclude are used as in write_arxml().
+        """
+        self.file = file
+        self.constant_regions = constant_regions or {}
+        self.exclude = exclude or ()
+        try:
+            self.write(root)
+        finally:
+            self.close_spools()
+
+    def finish_packages(self, root, paths, constant_regions=None, exclude=None, manifest=None):
+        """
+        Writes every top-level package to its own ARXML document and closes the spools.
+
+        The documents are serialized concurrently, one thread per package. A package's
+        spools belong to no other package, so every thread copies its own spools. A file
+        whose content did not change is left untouched.
+
+        Args:
+            root: The AUTOSAR root element.
+            paths: {top-level AR-PACKAGE: path of its ARXML file}.
+            constant_regions, exclude: As in write_arxml().
+            manifest: Optional OutputManifest with the hashes of the existing files.
+
+        Returns:
+            The paths of the files that were written.
+        """
+        def write_package(package):
+            others = {other for other in paths if other is not package}
+            write = self.document_writer(root, constant_regions, set(exclude or ()) | others)
+            return write_if_changed(paths[package], write, manifest)
+
+        try:
+            with ThreadPoolExecutor(max_workers=len(paths) or 1) as executor:
+                written = list(executor.map(write_package, paths))
+        finally:
+            self.close_spools()
+        return [path for path, changed in zip(paths.values(), written) if changed]
+
+    def finish_bundle(self, root, path, members, compression, constant_regions=None, exclude=None, manifest=None):
+        """
+        Writes the document into a compressed bundle with an index next to it, named
+        <path>.index.json, and closes the spools.
+
+        Args:
+            root: The AUTOSAR root element.
+            path: Path of the bundle.
+            members: {member name: top-level AR-PACKAGE}, a member with None holds the
+                whole document, one with a package only that package.
+            compression: 'gzip' or 'zip', see write_compressed().
+            constant_regions, exclude: As in write_arxml().
+            manifest: Optional OutputManifest with the hashes of the existing files.
+
+        Returns:
+            True if the bundle was written, an unchanged bundle is left untouched.
+        """
+        packages = [package for package in members.values() if package is not None]
+        documents = []
+        for name, package in members.items():
+            others = {other for other in packages if other is not package}
+            documents.append((name, self.document_writer(root, constant_regions, set(exclude or ()) | others)))
+        index = []
+        try:
+            changed = write_if_changed(path, lambda file: index.extend(write_compressed(file, documents, compression)), manifest)
+        finally:
+            self.close_spools()
+        content = {"bundle": os.path.basename(path), "compression": compression, "files": index}
+        write_if_changed(f"{path}.index.json", lambda file: file.write(json.dumps(content, indent=1).encode("utf-8")), manifest)
+        return changed
+
+    def document_writer(self, root, constant_regions=None, exclude=None):
+        """
+        Returns write(file) writing the document below root from the spools of this writer,
+        several documents can be written before close_spools().
+        """
+        part = StreamingARXMLWriter(self.spool_dir)
+        part.spools = self.spools
+        part.constant_regions = constant_regions or {}
+        part.exclude = exclude or ()
+        def write(file):
+            part.file = file
+            part.write(root)
+        return write
+
+    def close_spools(self):
+        for spool in self.spools.values():
+            spool.close()
+        self.spools = {}
+
+def write_arxml(root, file, constant_regions=None, exclude=None):
+    """
+    Writes root as an ARXML document to a binary file object.
+
+    Args:
+        root: The AUTOSAR root element.
+        file: A file object opened in binary mode.
+        constant_regions: Optional {element: AUTOSAR path} of subtrees that never
+            change and can be emitted from cached bytes.
+        exclude: Optional elements to leave out, e.g. packages written to a library file.
+    """
+    ARXMLWriter(file, constant_regions, exclude).write(root)
+
+def write_platform_library(root, library_path, constant_regions, overwrite=False):
+    """
+    Writes the constant platform packages to a shared library ARXML.
+
+    The library is written once per project: an existing file is kept unless overwrite
+    is set. SWC outputs written with exclude=constant_regions then only contain their
+    own packages and resolve their /AUTOSAR references against this file.
+
+    Returns:
+        True if the library file was written.
+    """
+    if os.path.exists(library_path) and not overwrite:
+        return False
+    # Everything but the platform packages is excluded, so no elements are moved between trees
+    exclude = {package for packages in root for package in packages if package not in constant_regions}
+    # Written next to the target and moved in place, so parallel runs never see a partial library
+    temp_path = f"{library_path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        write_arxml(root, f, constant_regions, exclude)
+    os.replace(temp_path, library_path)
+    return True
@@ -0,0 +1,55 @@
+"""
+Checks the SWC types of generated ARXML against arelements_def.SW_COMPONENT_TYPES.
+
+Converts each workbook in memory and checks that every component has an INTERNAL-BEHAVIORS
+element exactly if its type has an internal behavior, so a ParameterSwComponentType only
+has its ports. Exits with 1 if a component does not match, so the check can run in CI.
+
+Usage:
+    python automate_test/check_swc_types.py WORKBOOK [WORKBOOK ...]
+"""
+import argparse
+import os
+import sys
+import xml.etree.ElementTree as ET
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import arelements_def
+import main as generator
+
+def local_name(tag):
+    return tag.rsplit('}', 1)[-1]
+
+def check_components(arxml):
+    """
+    Returns (short name, element tag, ok) for every SW component type of the ARXML bytes.
+    """
+    has_internal_behavior = {tag: flag for _, tag, flag in arelements_def.SW_COMPONENT_TYPES.values()}
+    results = []
+    for element in ET.fromstring(arxml).iter():
+        tag = local_name(element.tag)
+        if tag not in has_internal_behavior:
+            continue
+        children = {local_name(child.tag): child for child in element}
+        short_name = children['SHORT-NAME'].text if 'SHORT-NAME' in children else '?'
+        results.append((short_name, tag, ('INTERNAL-BEHAVIORS' in children) == has_internal_behavior[tag]))
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the internal behaviors of the generated SW component types.")
+    parser.add_argument("workbooks", nargs="+", help="Excel workbooks to convert")
+    args = parser.parse_args()
+
+    failed = False
+    for workbook in args.workbooks:
+        with open(workbook, "rb") as f:
+            arxml = generator.convert(f, validate=False)["arxml"]
+        for short_name, tag, ok in check_components(arxml):
+            failed |= not ok
+            print(f"{'✅' if ok else '❌'} {workbook}: {short_name} ({tag})")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,59 @@
+"""
+Import-time budget of the generator.
+
+Imports a generator module in fresh interpreters with -X importtime and reports its
+cumulative import time and its slowest dependencies. Exits with 1 if the import takes
+longer than the budget, so the check can run in CI.
+
+Usage:
+    python automate_test/import_budget.py [--module main] [--budget SECONDS] [--runs N] [--top N]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+# Budget of `import main` in seconds, most of it is openpyxl, which loads numpy if installed
+IMPORT_TIME_BUDGET = 0.5
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def import_times(module, cwd=REPO_DIR):
+    """
+    Imports module in a new interpreter and returns {imported module: cumulative seconds}.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=cwd, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue  # header line
+        times[fields[2].strip()] = int(fields[1]) / 1e6
+    return times
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the import time of a generator module against a budget.")
+    parser.add_argument("--module", default="main", help="module to import (default: main)")
+    parser.add_argument("--budget", type=float, default=IMPORT_TIME_BUDGET, help="budget in seconds")
+    parser.add_argument("--runs", type=int, default=3, help="imports to measure, the fastest one counts")
+    parser.add_argument("--top", type=int, default=10, help="number of slowest dependencies to list")
+    args = parser.parse_args()
+
+    # The first import may compile the sources, it is not measured
+    import_times(args.module)
+    runs = [import_times(args.module) for _ in range(max(args.runs, 1))]
+    times = min(runs, key=lambda run: run[args.module])
+    total = times[args.module]
+
+    dependencies = sorted((name for name in times if name != args.module), key=times.get, reverse=True)
+    for name in dependencies[:args.top]:
+        print(f"{times[name] * 1000:8.1f} ms  {name}")
+    within = total <= args.budget
+    print(f"import {args.module}: {total * 1000:.1f} ms, budget {args.budget * 1000:.0f} ms {'✅' if within else '❌'}")
+    return 0 if within else 1
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,52 @@
+"""
+Interned AUTOSAR paths shared by the builders and the reference check.
+
+The builders write the same reference prefixes (the SWC, its internal behavior, the
+current runnable) for every port, access and event. PathBuilder formats each prefix and
+each path once per generation run and hands out the same interned string afterwards, so
+equal references share one string object and set lookups in reference_index compare
+identical keys.
+"""
+import sys
+
+COMPONENT_TYPES = '/SwComponentTypes'
+
+class PathBuilder:
+    def __init__(self):
+        # (parent path, name, ...) -> interned path
+        self.paths = {}
+
+    def child(self, parent, *names):
+        """
+        Returns the interned path parent/name/...; parent is an absolute path such as
+        '/SharedElements/PortInterfaces/SenderReceiver' or a path from this builder.
+        """
+        key = (parent,) + names
+        path = self.paths.get(key)
+        if path is None:
+            path = parent
+            for name in names:
+                path = f"{path}/{name}"
+            path = self.paths[key] = sys.intern(path)
+        return path
+
+    def component(self, folder, swc):
+        """
+        Returns /SwComponentTypes/<folder>/<swc>.
+        """
+        return self.child(COMPONENT_TYPES, folder, swc)
+
+    def behavior(self, folder, swc, internal_behavior):
+        """
+        Returns the path of the SWC's internal behavior.
+        """
+        return self.child(self.component(folder, swc), internal_behavior)
+
+    def runnable(self, folder, swc, internal_behavior, runnable):
+        """
+        Returns the path of a runnable of the SWC's internal behavior.
+        """
+        return self.child(self.behavior(folder, swc, internal_behavior), runnable)
+
+    def clear(self):
+        self.paths.clear()
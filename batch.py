@@ -0,0 +1,194 @@
+"""
+Batch generation of many workbooks in a pool of worker processes.
+
+Every workbook runs through the same validate -> generate -> write pipeline as main.py,
+without the interactive prompts. Each worker loads the package skeleton template and
+the validation rules once and reuses one build context for all of its workbooks.
+
+Usage:
+    python batch.py [-o OUTPUT_DIR] [-j PROCESSES] [--manifest FILE] [--incremental] [--tree-shake] [WORKBOOK ...]
+"""
+import argparse
+import contextlib
+import io
+import multiprocessing
+import os
+import time
+from collections import Counter
+
+# Build context of the worker process, reused across its workbooks
+_context = None
+
+def read_manifest(manifest_path):
+    """
+    Reads a manifest file with one workbook path per line.
+
+    Empty lines and lines starting with '#' are skipped, relative paths are relative
+    to the manifest's folder.
+    """
+    base = os.path.dirname(os.path.abspath(manifest_path))
+    workbooks = []
+    with open(manifest_path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                workbooks.append(os.path.join(base, line))
+    return workbooks
+
+def output_paths(workbooks, output_dir):
+    """
+    Returns the output path of every workbook, <output_dir>/<workbook name>.arxml.
+
+    Workbooks with the same name in different folders would write the same output and
+    incremental files, they are named after their path relative to the common folder of
+    those workbooks instead, e.g. ecu1/Appl.xlsx -> ecu1_Appl.arxml.
+
+    Raises:
+        ValueError: If two workbooks still get the same output path.
+    """
+    stems = [os.path.splitext(os.path.basename(path))[0] for path in workbooks]
+    counts = Counter(os.path.normcase(stem) for stem in stems)
+    clashing = [os.path.dirname(os.path.abspath(path)) for path, stem in zip(workbooks, stems) if counts[os.path.normcase(stem)] > 1]
+    base = os.path.commonpath(clashing) if clashing else None
+    paths = []
+    for path, stem in zip(workbooks, stems):
+        if counts[os.path.normcase(stem)] > 1:
+            relative = os.path.relpath(os.path.splitext(os.path.abspath(path))[0], base)
+            stem = relative.replace(os.sep, '_').replace('/', '_')
+        paths.append(os.path.join(output_dir, stem + ".arxml"))
+    duplicates = [path for path, count in Counter(os.path.normcase(path) for path in paths).items() if count > 1]
+    if duplicates:
+        raise ValueError(f"Several workbooks would write {', '.join(duplicates)}")
+    return paths
+
+def init_worker(platform_library_path=None, incremental=False, tree_shaking=False):
+    """
+    Warms up a worker process: imports the generator, parses the skeleton template and
+    creates the build context that is reused for every workbook of this worker.
+    """
+    global _context
+    import logging
+    import warnings
+    import config
+    import main
+    import arelements_def
+    import Pkg_struct
+    config.setup_logging(logging.INFO)
+    warnings.filterwarnings("ignore", category=UserWarning, module="openpyxl")
+    main.platform_library_path = platform_library_path
+    main.incremental_regeneration = incremental
+    main.tree_shaking = tree_shaking
+    Pkg_struct.load_template()
+    _context = arelements_def.BuildContext(Pkg_struct.ARXMLStructure())
+
+def process_workbook(job):
+    """
+    Validates one workbook and, if it has no Critical errors, writes its ARXML.
+
+    The progress output of the builders is kept out of the console like with main.py -q,
+    the parent process reports the status of every workbook.
+
+    Args:
+        job: (workbook path, output path)
+
+    Returns:
+        A dict with the workbook, the output (None if nothing was written), ok, the
+        Critical errors or exception message, the unresolved references and the time
+        taken in seconds.
+    """
+    import main
+    import validator
+    file_path, output_path = job
+    start = time.perf_counter()
+    result = {"workbook": file_path, "output": None, "ok": False, "errors": [], "unresolved": []}
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            errors = validator.validate_excel(file_path)
+            if errors["Critical"]:
+                result["errors"] = list(errors["Critical"])
+            else:
+                result["unresolved"] = main.generate(file_path, output_path, _context)
+                result["output"] = output_path
+                result["ok"] = True
+    except Exception as e:
+        result["errors"] = [f"{type(e).__name__}: {e}"]
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+def print_result(result):
+    """
+    Prints the status of one workbook.
+    """
+    if result["ok"]:
+        print(f"✅ {result['workbook']} -> {result['output']} ({result['seconds']:.1f} s)")
+        if result["unresolved"]:
+            print(f"   ⚠️ {len(result['unresolved'])} unresolved references")
+    else:
+        print(f"❌ {result['workbook']} ({result['seconds']:.1f} s)")
+        for error in result["errors"]:
+            print(f"   {error}")
+
+def run_batch(workbooks, output_dir, processes=None, platform_library_path=None, incremental=False, tree_shaking=False,
+              on_result=None):
+    """
+    Generates the ARXML of every workbook into output_dir as <workbook name>.arxml,
+    see output_paths() for workbooks with the same name. A workbook listed twice is
+    generated once.
+
+    Args:
+        workbooks: Paths of the input Excel files.
+        output_dir: Folder for the generated ARXML files, created if missing.
+        processes: Number of worker processes, defaults to the number of CPUs.
+        platform_library_path: Optional shared platform library ARXML (split mode).
+        incremental: Rebuild only the parts of each output whose workbook rows changed.
+        tree_shaking: Write only the platform elements each output references.
+        on_result: Called in this process with the result dict of every workbook as soon
+            as it is finished, e.g. print_result.
+
+    Returns:
+        The result dicts of process_workbook() in the order the workbooks finished.
+
+    Raises:
+        ValueError: If two workbooks would write the same output, see output_paths().
+    """
+    unique = {}
+    for path in workbooks:
+        unique.setdefault(os.path.normcase(os.path.abspath(path)), path)
+    workbooks = list(unique.values())
+    jobs = list(zip(workbooks, output_paths(workbooks, output_dir)))
+    os.makedirs(output_dir, exist_ok=True)
+    processes = min(processes or os.cpu_count() or 1, len(jobs)) or 1
+    with multiprocessing.Pool(processes, initializer=init_worker, initargs=(platform_library_path, incremental, tree_shaking)) as pool:
+        results = []
+        for result in pool.imap_unordered(process_workbook, jobs):
+            if on_result is not None:
+                on_result(result)
+            results.append(result)
+        return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate the ARXML of many workbooks in parallel.")
+    parser.add_argument("workbooks", nargs="*", help="input Excel files")
+    parser.add_argument("--manifest", help="file listing one input Excel file per line")
+    parser.add_argument("-o", "--output-dir", default="output_arxml", help="folder for the generated ARXML files")
+    parser.add_argument("-j", "--processes", type=int, default=None, help="number of worker processes (default: CPU count)")
+    parser.add_argument("--platform-library", default=None, help="write the /AUTOSAR platform packages to this shared ARXML")
+    parser.add_argument("--incremental", action="store_true", help="rebuild only the units whose workbook rows changed since the last run")
+    parser.add_argument("--tree-shake", action="store_true", help="write only the platform elements each output references")
+    args = parser.parse_args()
+
+    workbooks = list(args.workbooks)
+    if args.manifest:
+        workbooks.extend(read_manifest(args.manifest))
+    if not workbooks:
+        parser.error("no workbooks given")
+
+    start = time.perf_counter()
+    try:
+        results = run_batch(workbooks, args.output_dir, args.processes, args.platform_library, args.incremental, args.tree_shake,
+                            on_result=print_result)
+    except ValueError as e:
+        parser.error(str(e))
+    failed = sum(not result["ok"] for result in results)
+    print(f"{len(results) - failed} of {len(results)} workbooks generated in {time.perf_counter() - start:.1f} s")
+    raise SystemExit(1 if failed else 0)
@@ -1,11 +1,31 @@
 import logging
+import sys
 
-# Configure logging
-logging.basicConfig(
-    filename='SAARCONN.log',
-    level=logging.DEBUG,  # Changed to INFO to capture informational messages
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+# Log file of the generator, configured by the entry point with setup_logging()
+LOG_FILE = 'SAARCONN.log'
 
-# Example log message when main.py runs successfully
-logging.info('main.py has been run successfully at this time and it successfully created arxml.')
\ No newline at end of file
+def setup_logging(level=logging.DEBUG, filename=LOG_FILE, console_level=None):
+    """
+    Configures logging to the log file and, if console_level is given, to stderr.
+    Importing the generator modules leaves logging untouched, only the command line
+    entry points call this.
+
+    Args:
+        level: Lowest level written to the log file.
+        filename: The log file.
+        console_level: Lowest level shown on stderr, None for no console output.
+    """
+    file_handler = logging.FileHandler(filename)
+    file_handler.setLevel(level)
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    handlers = [file_handler]
+    if console_level is not None:
+        console_handler = logging.StreamHandler(sys.stderr)
+        console_handler.setLevel(console_level)
+        console_handler.setFormatter(logging.Formatter('%(message)s'))
+        handlers.append(console_handler)
+    logging.basicConfig(
+        level=min(level, console_level if console_level is not None else level),
+        handlers=handlers,
+        force=True
+    )
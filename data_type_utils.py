@@ -2,10 +2,6 @@ import sys
 import logging
 
 class DataProcessor:
-    def __init__(self):
-        # Configure logging
-        logging.basicConfig(level=logging.ERROR)
-
     def is_boolean(self, obj, depth=0):
         """
         Check if the object is of boolean type or contains a boolean in nested lists/tuples.
@@ -1,8 +1,28 @@
 import openpyxl # type: ignore
-import pandas as pd # type: ignore
 import logging
 import os
 
+class SheetView:
+    """
+    Read-only view of a subset of the rows of a worksheet.
+
+    Row 1 of the view is the header row of the sheet and the selected rows follow from
+    row 2 on, so cell(), max_row and 'B2'-style lookups behave like on a worksheet that
+    only holds those rows. ExcelReader.read_columns() accepts a view in place of a sheet.
+    """
+    def __init__(self, sheet, rows):
+        self.sheet = sheet
+        self.title = sheet.title
+        self.rows = [1] + list(rows)
+        self.max_row = len(self.rows)
+
+    def cell(self, row, column):
+        return self.sheet.cell(row=self.rows[row - 1], column=column)
+
+    def __getitem__(self, coordinate):
+        column_letter, row = openpyxl.utils.cell.coordinate_from_string(coordinate)
+        return self.cell(row=row, column=openpyxl.utils.cell.column_index_from_string(column_letter))
+
 class ExcelReader:
     def __init__(self):
         """
@@ -11,7 +31,7 @@ class ExcelReader:
         """
         self.file_path = None
         self.workbook = None
-        self.xls = None
+        self._xls = None
         self.project_info = None
         self.swc_info = None
         self.ib_data = None
@@ -32,18 +52,31 @@ class ExcelReader:
             else:
                 print("Error: Invalid file path. Please try again.")
 
+    @property
+    def xls(self):
+        """
+        pandas ExcelFile of the workbook, created on first access so that pandas is only
+        imported by code that uses it.
+        """
+        if self._xls is None and self.file_path:
+            import pandas as pd # type: ignore
+            if hasattr(self.file_path, 'seek'):
+                self.file_path.seek(0)
+            self._xls = pd.ExcelFile(self.file_path)
+        return self._xls
+
     def read_user_defined_excel(self):
         """
         Loads the workbook and assigns each worksheet to a corresponding variable for easy access.
-        Returns the workbook and ExcelFile object.
+        Returns the workbook.
         """
         if not self.file_path:
             raise ValueError("File path is not set. Call `get_file_path_from_user()` first.")
 
         try:
-            # Load the workbook and ExcelFile object
+            # Load the workbook, the pandas ExcelFile is only created if xls is used
             self.workbook = openpyxl.load_workbook(self.file_path, data_only=True)
-            self.xls = pd.ExcelFile(self.file_path)
+            self._xls = None
         except (FileNotFoundError, PermissionError, openpyxl.utils.exceptions.InvalidFileException) as e:
             logging.error(f"Error: Unable to load workbook due to {e}")
             raise Exception(f"Unable to load workbook: {e}")
@@ -66,7 +99,7 @@ class ExcelReader:
             logging.error(f"Error: Unable to access worksheets due to {e}")
             raise Exception(f"Unable to access worksheets: {e}")
 
-        return self.workbook, self.xls
+        return self.workbook
 
     def column_letter_to_index(self, column_letter):
         """
@@ -81,6 +114,37 @@ class ExcelReader:
             column_index = column_index * 26 + (ord(char.upper()) - ord('A') + 1)
         return column_index
     
+    def group_rows(self, current_sheet, key_col, start_row=2, end_row=None):
+        """
+        Groups the rows of a sheet into blocks, a new block starts at every non-empty cell
+        in key_col and the following empty ones belong to it, as for merged cells.
+        Parameters:
+            current_sheet: The sheet to read from.
+            key_col: The column letter that starts a new block.
+            start_row: The row to start reading from (default is 2).
+            end_row: The row to stop reading at (default is None, which means the last row).
+        Returns:
+            A list of (key, [row numbers]) in sheet order. Rows before the first key are
+            added to the first block.
+        """
+        if end_row is None:
+            end_row = current_sheet.max_row
+        key_index = self.column_letter_to_index(key_col)
+        blocks = []
+        leading_rows = []
+        for row in range(start_row, end_row + 1):
+            key = current_sheet.cell(row=row, column=key_index).value
+            if key is not None:
+                blocks.append((key, [row]))
+            elif blocks:
+                blocks[-1][1].append(row)
+            else:
+                leading_rows.append(row)
+        if not blocks:
+            return [(None, leading_rows)] if leading_rows else []
+        blocks[0] = (blocks[0][0], leading_rows + blocks[0][1])
+        return blocks
+
     def read_columns(self, current_sheet, first_col, last_col, start_row=2, end_row=None):
         """
         Reads specified columns from the given sheet and returns a list of filtered column data.
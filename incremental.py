@@ -0,0 +1,190 @@
+"""
+Incremental regeneration of an ARXML output from row-level workbook changes.
+
+The generation is split into units: every component built by CreateSwcs and every shared
+step (compu methods, data constraints, data types, interfaces). The input of a unit is the
+list of workbook rows it reads, stored as one content hash per row of the columns the unit
+uses. When a unit is built, the text the streaming writer releases into each ELEMENTS
+container is recorded with the unit's reference targets and index entries, and the record
+is kept in a cache file next to the output.
+
+In a later run a unit whose row hashes are all unchanged is not built again: its recorded
+text is put back into the spools at its place and its index entries are merged, so the
+output is the same as after a full rebuild. Only units with changed, added or removed rows
+go through the builders. The cache is dropped when the generator sources or the UUID mode
+change.
+"""
+import hashlib
+import json
+import os
+import openpyxl # type: ignore
+import reference_index
+import rng
+
+CACHE_VERSION = 1
+
+# Sources the generated text depends on, relative to this folder
+GENERATOR_FILES = (
+    'main.py', 'arelements_def.py', 'arxml_templates.py', 'arxml_writer.py', 'autosar_paths.py',
+    'data_type_utils.py', 'excel_utils.py', 'Pkg_struct.py', 'Pkg_struct_template.arxml', 'rng.py',
+)
+
+_generator_fingerprint = None
+
+def generator_fingerprint():
+    """
+    Returns a hash of the generator sources, computed once per process.
+    """
+    global _generator_fingerprint
+    if _generator_fingerprint is None:
+        digest = hashlib.blake2b(digest_size=16)
+        folder = os.path.dirname(os.path.abspath(__file__))
+        for name in GENERATOR_FILES:
+            with open(os.path.join(folder, name), "rb") as f:
+                digest.update(f.read())
+        _generator_fingerprint = digest.hexdigest()
+    return _generator_fingerprint
+
+def cache_path(output_path):
+    """
+    Returns the path of the cache file of an ARXML output.
+    """
+    return f"{output_path}.rows.json"
+
+class RowHashes:
+    """
+    Content hashes of workbook rows.
+
+    The cell values of every worksheet are read once, a row hash covers the values of
+    the selected columns in that row.
+    """
+    def __init__(self):
+        # worksheet title -> row values, index 0 is row 1
+        self.values = {}
+
+    def __call__(self, sheet, first_col=None, last_col=None):
+        """
+        Returns the hashes of the data rows of a worksheet or SheetView, in row order.
+
+        Args:
+            sheet: The worksheet or excel_utils.SheetView.
+            first_col: First column letter, None for all columns.
+            last_col: Last column letter, None for all columns from first_col on.
+        """
+        worksheet = getattr(sheet, 'sheet', sheet)
+        if worksheet.title not in self.values:
+            self.values[worksheet.title] = list(worksheet.iter_rows(values_only=True))
+        values = self.values[worksheet.title]
+        rows = sheet.rows[1:] if worksheet is not sheet else range(2, worksheet.max_row + 1)
+        first = openpyxl.utils.cell.column_index_from_string(first_col) - 1 if first_col else 0
+        last = openpyxl.utils.cell.column_index_from_string(last_col) if last_col else None
+        return [hashlib.blake2b(repr(values[row - 1][first:last]).encode("utf-8"), digest_size=8).hexdigest()
+                for row in rows]
+
+def unit_key(name, row_hashes):
+    """
+    Returns the cache key of a unit, it changes with any of its input rows.
+    """
+    digest = hashlib.blake2b(name.encode("utf-8"), digest_size=16)
+    for row_hash in row_hashes:
+        digest.update(row_hash.encode("ascii"))
+    return digest.hexdigest()
+
+class UnitCache:
+    """
+    The recorded units of one ARXML output.
+
+    Args:
+        path: The cache file, see cache_path().
+    """
+    def __init__(self, path):
+        self.path = path
+        self.previous = {}
+        self.units = {}
+        self.row_hashes = RowHashes()
+        self.count = 0
+        self.rebuilt = 0
+        try:
+            with open(path, encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return
+        if (cache.get("version") == CACHE_VERSION and cache.get("generator") == generator_fingerprint()
+                and cache.get("uuid_mode") == rng.provider.mode):
+            self.previous = cache["units"]
+
+    def run(self, ctx, writer, name, inputs, build):
+        """
+        Builds one unit and releases it to writer, or replays its record if its rows are unchanged.
+
+        Args:
+            ctx: The arelements_def.BuildContext.
+            writer: The arxml_writer.StreamingARXMLWriter of the run.
+            name: Name of the unit, e.g. 'createprimitive' or 'component'.
+            inputs: (sheet, first column, last column) of every range the unit reads,
+                see RowHashes.
+            build: Called with ctx to build the unit.
+        """
+        row_hashes = [row_hash for sheet, first_col, last_col in inputs
+                      for row_hash in self.row_hashes(sheet, first_col, last_col)]
+        key = unit_key(name, row_hashes)
+        self.count += 1
+        record = self.previous.get(key) or self.units.get(key)
+        if record is None:
+            record = self.record(ctx, writer, build)
+            record["unit"] = name
+            record["rows"] = row_hashes
+            self.rebuilt += 1
+        else:
+            self.replay(ctx, writer, record)
+        self.units[key] = record
+
+    def record(self, ctx, writer, build):
+        """
+        Builds a unit and returns the text, reference targets and index entries it released.
+        """
+        references, index = writer.references, writer.reference_index
+        unit_references, unit_index = set(), reference_index.ReferenceIndex(ctx.paths)
+        writer.references, writer.reference_index, writer.chunks = unit_references, unit_index, {}
+        try:
+            build(ctx)
+            writer.release(ctx.root, ctx.structure.constant_regions())
+            chunks = writer.chunks
+        finally:
+            writer.references, writer.reference_index, writer.chunks = references, index, None
+        references.update(unit_references)
+        if index is not None:
+            index.paths.update(unit_index.paths)
+            index.references.extend(unit_index.references)
+        return {
+            "chunks": list(chunks.items()),
+            "targets": sorted(unit_references),
+            "paths": sorted(unit_index.paths),
+            "references": unit_index.references,
+        }
+
+    def replay(self, ctx, writer, record):
+        """
+        Puts the released text of a recorded unit back into the spools of its packages.
+        """
+        for path, text in record["chunks"]:
+            container = ctx.structure.resolve_path(f"{path}/ELEMENTS", create=True)
+            writer.spool_text(container, 2 * path.count("/") + 1, text)
+        writer.references.update(record["targets"])
+        index = writer.reference_index
+        if index is not None:
+            index.paths.update(record["paths"])
+            index.references.extend(tuple(reference) for reference in record["references"])
+
+    def save(self):
+        """
+        Writes the units of this run to the cache file, units of the previous run that
+        were not used again are dropped.
+        """
+        cache = {"version": CACHE_VERSION, "generator": generator_fingerprint(),
+                 "uuid_mode": rng.provider.mode, "units": self.units}
+        # Written next to the target and moved in place, so an interrupted run keeps the old cache
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(temp_path, self.path)
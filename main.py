@@ -2,4105 +2,434 @@
 #               # ####################### ++++++++++++ ---------- __________ SECTION :  import required Initial Modules and definitions __________ ----------  ++++++++++++  ####################### #               #
 #----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 
-import importlib # Import the importlib module for dynamic module loading
+import argparse # Import the argparse module for the command line interface
+import io
+import logging
+import os
 import warnings # Import the warnings module for managing warning messages
-import pandas as pd # type: ignore # Import the pandas library for data manipulation and analysis
-import openpyxl # type: ignore
-import Pkg_struct # Import the Pkg_struct module for package structure definitions
 import arelements_def as arelements_def # Import the arelements_def module for AUTOSAR element definitions
 import config
+import arxml_writer # Import the arxml_writer module for serializing the ARXML tree
+import reference_index # Import the reference_index module for the dangling reference check
+import incremental # Import the incremental module for the row-level regeneration
 
+# Importing this module has no side effects: no prompts, no workbook access and no logging
+# setup. The command line entry point main() configures logging and warnings.
 
-warnings.filterwarnings("ignore", category=UserWarning, module="openpyxl") # Suppress specific warnings from the openpyxl module
-
-# Reload the arelements_def and Pkg_struct module for dynamic updates
-importlib.reload(arelements_def)
-importlib.reload(Pkg_struct)
-
-from arelements_def import root # Import the root variable from the arelements_def module
-
-# here, root is dynamic as per the arelements_def module version and it will get selected by user as per AUTOSAR schema version
-# for example root for AUTOSAR 4_0_2 schema version, 
-# root = ET.Element("AUTOSAR", 
-#                      attrib={
-#                          "xmlns:xsi": "http://www.w3.org/2001/XMLSchema-instance",
-#                          "xmlns": "http://autosar.org/schema/r4.0",
-#                          "xsi:schemaLocation": "http://autosar.org/schema/r4.0 AUTOSAR_4-0-2.xsd"
-#                      })
-
-from collections import defaultdict
-
-from Pkg_struct import ARXMLStructure # Import the ARXMLStructure class from the Pkg_struct module
-
-import rng # Import the rng module for random number generation
-
-import xml.etree.ElementTree as ET # Import the ElementTree class from the xml.etree module
-
-arxml_structure = ARXMLStructure() # Create an instance of the ARXMLStructure class
-
-arxml_structure.create_default_pkg_struct(root) # Create the default package structure using the root element
-
-#----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
-#               # ####################### ++++++++++++ ---------- __________ SECTION :  Excel Related Functions __________ ----------  ++++++++++++ ####################### #               #
-#----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
-
-from excel_utils import ExcelReader
-from data_type_utils import DataProcessor  # Import the DataProcessor class
-
-from itertools import groupby
-
-# Initialize the ExcelReader
-excel_reader = ExcelReader()
-
-# Get the file path from the user
-excel_reader.get_file_path_from_user()
-
-
-import validator  # Import validation module
-
-# Validate the Excel file before proceeding
-
-attempts = 0
-
-initial_errors = []
-
-final_errors = []
-
-while True:
-
-    attempts += 1
-
-    errors = validator.validate_excel(excel_reader.file_path)  # Validate the Excel file
-
-    if attempts == 1:
-
-        initial_errors = errors.copy()  # Store first validation errors
-
-    # Always log all errors (Info, Warning, Critical)
-
-    # Generate HTML report for every validation attempt
-    validator.generate_html_report(errors, attempts)
-
-    validator.print_colored_errors(errors)
-
-    validator.log_errors(errors, attempts)
-
-    if errors["Critical"]:  # Stop only if Critical errors exist
-
-        print("\n❌ Excel validation failed! Please check 'validation_log.txt' and fix the issues.")
-
-        retry = input("🔁 Do you want to retry with a new file? (yes/no): ").strip().lower()
-
-        if retry == "yes":
-
-            excel_reader.get_file_path_from_user()  # Ask for a new file path
-
-            continue  # Retry validation with a new file
-
-        else:
-
-            print("❌ Exiting program. Fix validation issues before retrying.")
-
-            exit(1)  # Stop execution if user does not want to retry
-
-    # If only Info/Warnings exist, proceed
-
-    final_errors = errors.copy()  # Store final error-free state
-
-    print("\n✅ Excel validation passed with warnings/info. Proceeding with ARXML generation...\n")
-
-    break  # Exit validation loop and proceed
-
-# Generate validation summary
-
-validator.generate_summary(initial_errors, final_errors, attempts) 
-
-
-# Read the Excel file
-workbook, excel_file = excel_reader.read_user_defined_excel()
-
-worksheets = {sheet.title: sheet for sheet in workbook.worksheets}
-project_info = worksheets['project_info']
-swc_info = worksheets['swc_info']
-ib_data = worksheets['ib_data']
-ports = worksheets['ports']
-adt_primitive = worksheets['adt_primitive']
-adt_composite = worksheets['adt_composite']
-idt = worksheets['idt']
-
-# Process the data
-data = excel_reader.read_columns(workbook.active, 'A', 'B')  # Use the active sheet or specify the sheet
-
-# Create an instance of the DataProcessor class
-processor = DataProcessor()
-
-# Convert the data types
-converted_data = [processor.value_to_str(value) for value in data if isinstance(value, (int, float, bool))]
-
-
-#----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
-#               # ####################### =============== %%%%%%%%% ++++++++++++ ---------- __________ SECTION :  beautify xml __________ ----------  ++++++++++++ %%%%%%%%% =============== ####################### #               #
-#----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
-def remove_namespaces(element):
-    """
-    Removes namespace prefixes from element tags.
-
-    Args:
-        element: The root element of the XML tree.
-
-    Returns:
-        The modified element with namespaces removed.
-    """
-    for elem in element.iter():
-        if '}' in elem.tag:
-            elem.tag = elem.tag.split('}', 1)[1]  # Remove namespace prefix
-    return element
-
-def indent(elem, level=0):
-    """
-    Adds indentation to the XML tree.
-    """
-    i = "\n" + level*"  "
-    if len(elem):
-        if not elem.text or not elem.text.strip():
-            elem.text = i + "  "
-        if not elem.tail or not elem.tail.strip():
-            elem.tail = i
-        for elem in elem:
-            indent(elem, level+1)
-        if not elem.tail or not elem.tail.strip():
-            elem.tail = i
-    else:
-        if level and (not elem.tail or not elem.tail.strip()):
-            elem.tail = i
-
-#----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
-#               # ####################### =============== %%%%%%%%% ++++++++++++ ---------- __________ SECTION :  Software Components __________ ----------  ++++++++++++ %%%%%%%%% =============== ####################### #               #
-#----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
-
-def CreateSwcs():
-    global swc_type
-    # Retrieve the value from the swc_info dictionary at key 'B2'
-    swc_type = swc_info['B2'].value
-    
-    # Define a switcher dictionary mapping component types to their corresponding functions
-    switcher = {
-        'ApplicationSwComponentType': my_application_function,  # Change the function name here
-        'ComplexDeviceDriverSwComponentType': my_complex_device_driver_function,  # Change the function name here
-        'EcuAbstractionSwComponentType': my_ecu_abstraction_function,  # Change the function name here
-        'NvBlockSwComponentType': my_nv_block_function,  # Change the function name here
-        'ParameterSwComponentType': my_parameter_function,  # Change the function name here
-        'SensorActuatorSwComponentType': my_sensor_actuator_function,  # Change the function name here
-        'ServiceProxySwComponentType': my_service_proxy_function,  # Change the function name here
-        'ServiceSwComponentType': my_service_function  # Change the function name here
-    }
-    
-    # Get the function from the switcher dictionary, defaulting to my_application_function
-    func = switcher.get(swc_type, my_application_function)  # Change the function name here
-    
-    # Call the function
-    func()
-
-def my_application_function():
-
-# ARXML structure
-#   Appl SWC
-#       Short Name
-#       Ports
-#           R port
-#               short name
-#               required interface
-#           P port
-#               short name
-#               provided interface
-#       IB
-#           uuid
-#           short name
-#           constant memo
-#           DTMS
-#           Statis memo
-#           AR type PIM
-#           Events
-#           Ex IRV
-#           handleTerminationAndRestart
-#           Imp IRV
-#           per instance param
-#           runnables
-#           shared param
-#           SupportsMultipleInstantiation
-    
-
-    # Declare global variables to be used within this function
-    global currentfolder, CurrentSWC_shortname, CurrentInternalBehaviors
-    
-    currentfolder = 'ApplSWC' #other folders are CddSWC, CompSWC, EcuAbSWC, NvDataSWC, PrmSWC, SnsrActSWC, SrvcPrxySWC, SrvcSWC
-    # Create a new application software component using the value from swc_info at key 'C2'
-    CurrentSWC_shortname = (swc_info['C2'].value) 
-
-    ApplSWC_folder_elements = arxml_structure.get_variable('ApplSWC_folder_elements')
-
-    arelements_def.ApplicationSwComponentType(ApplSWC_folder_elements,CurrentSWC_shortname)
-
-    Createports()
-
-    # Add a new internal behavior to the current software component using the value from swc_info at key 'E2'
-    CurrentInternalBehaviors = swc_info['E2'].value
-
-    arelements_def.internal_behaviors(CurrentInternalBehaviors, swc_type)
-
-    # Read columns B to H from ib_data to get runnable details
-
-    IBVariableType, IBVariableName, ApplicationDataTypeName, Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy = excel_reader.read_columns(ib_data, 'B', 'H')
-
-    if 'ConstantMemory' in IBVariableType:
-
-        arelements_def.ConstantMemory()
-      
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'ConstantMemory':
-                arelements_def.ConstantMemory_PDP(b, c, d, f, g)   
-        
-    else:
-        print("ConstantMemorys are not present for this component")
-
-    def createDTMS():
-        # Read columns B & M from adt_primitive,  and columns B & H from adt_composite to get DTMS details
-        adtp, cp, dp, ep, fp, gp, hp, ip, jp, kp, lp, idtp = excel_reader.read_columns(adt_primitive, 'B', 'M')
-
-        adtc, cc, dc, ec, fc, gc, hc, idtc = excel_reader.read_columns(adt_composite, 'B', 'I')
-        
-        DataTypemappingSets_folder_elements = arxml_structure.get_variable('DataTypemappingSets_folder_elements')
-        
-        arelements_def.DataTypeMappingSet(DataTypemappingSets_folder_elements,CurrentSWC_shortname)
-
-        for a,b in zip(adtp,idtp):
-            arelements_def.data_type_map(a,b)
-
-        for a,b in zip(adtc,idtc):
-            arelements_def.data_type_map(a,b)
-
-    createDTMS()
-
-    arelements_def.DataTYPEMAPPINGREFS()
-    arelements_def.DataTYPEMAPPINGREF(CurrentSWC_shortname)
-
-    if 'StaticMemory' in IBVariableType:
-
-        arelements_def.StaticMemory()
-      
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'StaticMemory':
-                arelements_def.StaticMemory_VDP(b, c, d, f, g)   
-        
-    else:
-        print("StaticMemorys are not present for this component")
-
-    if 'ArTypedPerInstanceMemory' in IBVariableType:
-
-        arelements_def.ArTypedPerInstanceMemory()
-    
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'ArTypedPerInstanceMemory':
-                arelements_def.ArTypedPerInstanceMemory_VDP(b, c, d, f, g)   
-        
-    else:
-        print("ArTypedPerInstanceMemorys are not present for this component")
-
-    #createRTEEvents()
-
-    rnblname, rs, cic, rteeventname, rteeventtype, rteeventinfo = excel_reader.read_columns(swc_info, 'H', 'M')
-
-
-    arelements_def.RTE_Event()
-
-    processed_types = set()
-
-    for a,b,c,d,e,f in zip(rnblname, rs, cic, rteeventname, rteeventtype, rteeventinfo):
-
-        if a in processed_types:
-            continue
-        processed_types.add(a) 
-
-        # Check the type of RTE event and call the corresponding function
-        if e == 'AsynchronousServerCallReturnsEvent':
-            # Handle asynchronous server call return event
-            arelements_def.AsynchronousServerCallReturnsEvent(d, a, currentfolder, CurrentSWC_shortname)
-        elif e == 'InitEvent':
-            # Handle initialization event
-            arelements_def.InitEvent(d, a, currentfolder, CurrentSWC_shortname)
-        elif e == 'BackgroundEvent':
-            # Handle background event
-            arelements_def.BackgroundEvent(d, a, currentfolder, CurrentSWC_shortname)
-        elif e == 'TimingEvent':
-            # Handle timing event with additional information
-            arelements_def.TimingEvent(d, a, currentfolder, CurrentSWC_shortname, f) #g is periodictime
-        elif e == 'DataReceiveErrorEvent':
-            # Handle data receive error event with additional information
-            arelements_def.DataReceiveErrorEvent(d, a, currentfolder, CurrentSWC_shortname, f) #rport, If_name, DE
-        elif e == 'DataSendCompletedEvent':
-            # Handle data send completed event with additional information
-            arelements_def.DataSendCompletedEvent(d, a, currentfolder, CurrentSWC_shortname, f) #pport, DE
-        elif e == 'DataWriteCompletedEvent':
-            # Handle data write completed event with additional information
-            arelements_def.DataWriteCompletedEvent(d, a, currentfolder, CurrentSWC_shortname, f) #pport, DE
-        elif e == 'ExternalTriggerOccurredEvent':
-            # Handle external trigger occurred event with additional information
-            arelements_def.ExternalTriggerOccurredEvent(d, a, currentfolder, CurrentSWC_shortname, f) #rport, If_name, trigger
-        elif e == 'InternalTriggerOccurredEvent':
-            # Handle internal trigger occurred event with additional information
-            arelements_def.InternalTriggerOccurredEvent(d, a, currentfolder, CurrentSWC_shortname, f)
-        elif e == 'ModeSwitchedAckEvent':
-            # Handle mode switched acknowledgment event with additional information
-            arelements_def.ModeSwitchedAckEvent(d, a, currentfolder, CurrentSWC_shortname, f) #pport, modegroup
-        elif e == 'OperationInvokedEvent':
-            # Handle operation invoked event with additional information
-            arelements_def.OperationInvokedEvent(d, a, currentfolder, CurrentSWC_shortname, f) #pport, If_name, operation
-        elif e == 'SwcModeManagerErrorEvent':
-            # Handle software component mode manager error event with additional information
-            arelements_def.SwcModeManagerErrorEvent(d, a, currentfolder, CurrentSWC_shortname, f)
-        elif e == 'DataReceivedEvent':
-            # Handle data received event with additional information
-            arelements_def.DataReceivedEvent(d, a, currentfolder, CurrentSWC_shortname, f) #rport, If_name, DE
-        elif e == 'SwcModeSwitchEvent':
-            # Handle software component mode switch event with additional information
-            arelements_def.SwcModeSwitchEvent(d, a, currentfolder, CurrentSWC_shortname, f) #rport, If_name, modegroup, mode
-        elif e == 'TransformerHardErrorEvent':
-            # Handle transformer hard error event with additional information
-            arelements_def.TransformerHardErrorEvent(d, a, currentfolder, CurrentSWC_shortname, f)
-        else:
-            # Print a message for unrecognized event types
-            print(f"Unrecognized event type: {e}")
-
-
-    if 'ExplicitInterRunnableVariable' in IBVariableType:
-
-        arelements_def.ExplicitInterRunnableVariable()
-    
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'ExplicitInterRunnableVariable':
-                arelements_def.ExplicitInterRunnableVariable_VDP(b, c, d, f, g)   
-        
-    else:
-        print("ExplicitInterRunnableVariable are not present for this component")
-
-    # Set the handle Termination And Restart based on the value from swc_info at key 'F2'
-    # CurrentInternalBehaviors.handleTerminationAndRestart = swc_info['F2'].value
-
-    handleTerminationAndRestart= swc_info['F2'].value
-    arelements_def.handle_termination_and_restart(handleTerminationAndRestart)
-
-    if 'ImplicitInterRunnableVariables' in IBVariableType:
-
-        arelements_def.ImplicitInterRunnableVariable()
-    
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'ImplicitInterRunnableVariables':
-                arelements_def.ImplicitInterRunnableVariable_VDP(b, c, d, f, g)   
-        
-    else:
-        print("ImplicitInterRunnableVariables are not present for this component")
-
-    if 'PerInstanceParameter' in IBVariableType:
-
-        arelements_def.PerInstanceParameter()
-    
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'PerInstanceParameter':
-                arelements_def.PerInstanceParameter_PDP(b, c, d, f, g)   
-        
-    else:
-        print("PerInstanceParameter are not present for this component")
-
-    #create runnable here
-
-    arelements_def.create_Runnable()
-
-    processed_types = set()
-
-    for a,b,c,d,e in zip(rnblname, rs, cic, rteeventname, rteeventtype):
-
-        if b is None or (isinstance(b, str) and not b.strip()):
-            b = a
-        else :
-            pass
-
-        if a in processed_types:
-            continue
-        processed_types.add(a) 
-
-        # Check the type of RTE event and call the corresponding function
-
-        if e == 'AsynchronousServerCallReturnsEvent':
-            # Handle asynchronous server call return event
-
-            arelements_def.Runnable_ASCRE(a,currentfolder, CurrentSWC_shortname) #rport, If_name, operation
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'InitEvent':
-            # Handle initialization event
-
-            arelements_def.Runnable_Init(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'BackgroundEvent':
-            # Handle background event
-
-            arelements_def.Runnable_BE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'TimingEvent':
-            # Handle timing event with additional information
-            arelements_def.Runnable_TE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'DataReceiveErrorEvent':
-            # Handle data receive error event with additional information
-
-            arelements_def.Runnable_DREE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'DataSendCompletedEvent':
-            # Handle data send completed event with additional information
-
-            arelements_def.Runnable_DSCE(a,currentfolder, CurrentSWC_shortname)#pport, If_name, DE,
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'DataWriteCompletedEvent':
-            # Handle data write completed event with additional information
-
-            arelements_def.Runnable_DWCE(a,currentfolder, CurrentSWC_shortname)#pport, If_name, DE,
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'ExternalTriggerOccurredEvent':
-            # Handle external trigger occurred event with additional information
-
-            arelements_def.Runnable_ETOE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'InternalTriggerOccurredEvent':
-            # Handle internal trigger occurred event with additional information
-
-            arelements_def.Runnable_ITOE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'ModeSwitchedAckEvent':
-            # Handle mode switched acknowledgment event with additional information
-
-            arelements_def.Runnable_MSAE(a,currentfolder, CurrentSWC_shortname)#pport, If_name, modegroup,
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'OperationInvokedEvent':
-            # Handle operation invoked event with additional information
-
-            arelements_def.Runnable_OIE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'SwcModeManagerErrorEvent':
-            # Handle software component mode manager error event with additional information
-
-            arelements_def.Runnable_SMMEE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'DataReceivedEvent':
-            # Handle data received event with additional information
-
-            arelements_def.Runnable_DRE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'SwcModeSwitchEvent':
-            # Handle software component mode switch event with additional information
-
-            arelements_def.Runnable_SMSE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'TransformerHardErrorEvent':
-            # Handle transformer hard error event with additional information
-
-            arelements_def.Runnable_THEE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-        
-        else:
-            # Print a message for unrecognized event types
-            print(f"Unrecognized event type: {e}")
-
-    if 'SharedParameter' in IBVariableType:
-
-        arelements_def.SharedParameter()
-    
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'SharedParameter':
-                arelements_def.SharedParameter_PDP(b, c, d, f, g)   
-        
-    else:
-        print("SharedParameter are not present for this component")
-
-    # Set the support for multiple instantiation based on the value from swc_info at key 'G2'
-
-    SupportsMultipleInstantiation = swc_info['G2'].value
-
-    arelements_def.supports_multiple_instantiation(SupportsMultipleInstantiation)
-
-def my_complex_device_driver_function():
-
-    # Declare global variables to be used within this function
-    global currentfolder, CurrentSWC_shortname, CurrentInternalBehaviors
-    
-    currentfolder = 'CddSWC' #other folders are CddSWC, CompSWC, EcuAbSWC, NvDataSWC, PrmSWC, SnsrActSWC, SrvcPrxySWC, SrvcSWC
-    # Create a new application software component using the value from swc_info at key 'C2'
-    CurrentSWC_shortname = (swc_info['C2'].value) 
-
-    CddSWC_folder_elements = arxml_structure.get_variable('CddSWC_folder_elements')
-
-    arelements_def.ComplexDeviceDriverSwComponentType(CddSWC_folder_elements,CurrentSWC_shortname)
-
-    Createports()
-
-    # Add a new internal behavior to the current software component using the value from swc_info at key 'E2'
-    CurrentInternalBehaviors = swc_info['E2'].value
-
-    arelements_def.internal_behaviors(CurrentInternalBehaviors, swc_type)
-
-    # Read columns B to H from ib_data to get runnable details
-
-    IBVariableType, IBVariableName, ApplicationDataTypeName, Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy = excel_reader.read_columns(ib_data, 'B', 'H')
-
-    if 'ConstantMemory' in IBVariableType:
-
-        arelements_def.ConstantMemory()
-      
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'ConstantMemory':
-                arelements_def.ConstantMemory_PDP(b, c, d, f, g)   
-        
-    else:
-        print("ConstantMemorys are not present for this component")
-
-    def createDTMS():
-        # Read columns B & M from adt_primitive,  and columns B & H from adt_composite to get DTMS details
-        adtp, cp, dp, ep, fp, gp, hp, ip, jp, kp, lp, idtp = excel_reader.read_columns(adt_primitive, 'B', 'M')
-
-        adtc, cc, dc, ec, fc, gc, hc, idtc = excel_reader.read_columns(adt_composite, 'B', 'I')
-        
-        DataTypemappingSets_folder_elements = arxml_structure.get_variable('DataTypemappingSets_folder_elements')
-        
-        arelements_def.DataTypeMappingSet(DataTypemappingSets_folder_elements,CurrentSWC_shortname)
-
-        for a,b in zip(adtp,idtp):
-            arelements_def.data_type_map(a,b)
-
-        for a,b in zip(adtc,idtc):
-            arelements_def.data_type_map(a,b)
-
-    createDTMS()
-
-    arelements_def.DataTYPEMAPPINGREFS()
-    arelements_def.DataTYPEMAPPINGREF(CurrentSWC_shortname)
-
-    if 'StaticMemory' in IBVariableType:
-
-        arelements_def.StaticMemory()
-      
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'StaticMemory':
-                arelements_def.StaticMemory_VDP(b, c, d, f, g)   
-        
-    else:
-        print("StaticMemorys are not present for this component")
-
-    if 'ArTypedPerInstanceMemory' in IBVariableType:
-
-        arelements_def.ArTypedPerInstanceMemory()
-    
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'ArTypedPerInstanceMemory':
-                arelements_def.ArTypedPerInstanceMemory_VDP(b, c, d, f, g)   
-        
-    else:
-        print("ArTypedPerInstanceMemorys are not present for this component")
-
-    #createRTEEvents()
-
-    rnblname, rs, cic, rteeventname, rteeventtype, rteeventinfo = excel_reader.read_columns(swc_info, 'H', 'M')
-
-
-
-    arelements_def.RTE_Event()
-
-    processed_types = set()
-
-    for a,b,c,d,e,f in zip(rnblname, rs, cic, rteeventname, rteeventtype, rteeventinfo):
-
-        if a in processed_types:
-            continue
-        processed_types.add(a)  
- 
-        # print(f"Processing: {a}, Category: {a}")
-
-        # Check the type of RTE event and call the corresponding function
-        if e == 'AsynchronousServerCallReturnsEvent':
-            # Handle asynchronous server call return event
-            arelements_def.AsynchronousServerCallReturnsEvent(d, a, currentfolder, CurrentSWC_shortname)
-        elif e == 'InitEvent':
-            # Handle initialization event
-            arelements_def.InitEvent(d, a, currentfolder, CurrentSWC_shortname)
-        elif e == 'BackgroundEvent':
-            # Handle background event
-            arelements_def.BackgroundEvent(d, a, currentfolder, CurrentSWC_shortname)
-        elif e == 'TimingEvent':
-            # Handle timing event with additional information
-            arelements_def.TimingEvent(d, a, currentfolder, CurrentSWC_shortname, f) #g is periodictime
-        elif e == 'DataReceiveErrorEvent':
-            # Handle data receive error event with additional information
-            arelements_def.DataReceiveErrorEvent(d, a, currentfolder, CurrentSWC_shortname, f) #rport, If_name, DE
-        elif e == 'DataSendCompletedEvent':
-            # Handle data send completed event with additional information
-            arelements_def.DataSendCompletedEvent(d, a, currentfolder, CurrentSWC_shortname, f) #pport, DE
-        elif e == 'DataWriteCompletedEvent':
-            # Handle data write completed event with additional information
-            arelements_def.DataWriteCompletedEvent(d, a, currentfolder, CurrentSWC_shortname, f) #pport, DE
-        elif e == 'ExternalTriggerOccurredEvent':
-            # Handle external trigger occurred event with additional information
-            arelements_def.ExternalTriggerOccurredEvent(d, a, currentfolder, CurrentSWC_shortname, f) #rport, If_name, trigger
-        elif e == 'InternalTriggerOccurredEvent':
-            # Handle internal trigger occurred event with additional information
-            arelements_def.InternalTriggerOccurredEvent(d, a, currentfolder, CurrentSWC_shortname, f)
-        elif e == 'ModeSwitchedAckEvent':
-            # Handle mode switched acknowledgment event with additional information
-            arelements_def.ModeSwitchedAckEvent(d, a, currentfolder, CurrentSWC_shortname, f) #pport, modegroup
-        elif e == 'OperationInvokedEvent':
-            # Handle operation invoked event with additional information
-            arelements_def.OperationInvokedEvent(d, a, currentfolder, CurrentSWC_shortname, f) #pport, If_name, operation
-        elif e == 'SwcModeManagerErrorEvent':
-            # Handle software component mode manager error event with additional information
-            arelements_def.SwcModeManagerErrorEvent(d, a, currentfolder, CurrentSWC_shortname, f)
-        elif e == 'DataReceivedEvent':
-            # Handle data received event with additional information
-            arelements_def.DataReceivedEvent(d, a, currentfolder, CurrentSWC_shortname, f) #rport, If_name, DE
-        elif e == 'SwcModeSwitchEvent':
-            # Handle software component mode switch event with additional information
-            arelements_def.SwcModeSwitchEvent(d, a, currentfolder, CurrentSWC_shortname, f) #rport, If_name, modegroup, mode
-        elif e == 'TransformerHardErrorEvent':
-            # Handle transformer hard error event with additional information
-            arelements_def.TransformerHardErrorEvent(d, a, currentfolder, CurrentSWC_shortname, f)
-        else:
-            # Print a message for unrecognized event types
-            print(f"Unrecognized event type: {e}")
-
-
-    if 'ExplicitInterRunnableVariable' in IBVariableType:
-
-        arelements_def.ExplicitInterRunnableVariable()
-    
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'ExplicitInterRunnableVariable':
-                arelements_def.ExplicitInterRunnableVariable_VDP(b, c, d, f, g)   
-        
-    else:
-        print("ExplicitInterRunnableVariable are not present for this component")
-
-    # Set the handle Termination And Restart based on the value from swc_info at key 'F2'
-    # CurrentInternalBehaviors.handleTerminationAndRestart = swc_info['F2'].value
-
-    handleTerminationAndRestart= swc_info['F2'].value
-    arelements_def.handle_termination_and_restart(handleTerminationAndRestart)
-
-    if 'ImplicitInterRunnableVariables' in IBVariableType:
-
-        arelements_def.ImplicitInterRunnableVariable()
-    
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'ImplicitInterRunnableVariables':
-                arelements_def.ImplicitInterRunnableVariable_VDP(b, c, d, f, g)   
-        
-    else:
-        print("ImplicitInterRunnableVariables are not present for this component")
-
-    if 'PerInstanceParameter' in IBVariableType:
-
-        arelements_def.PerInstanceParameter()
-    
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'PerInstanceParameter':
-                arelements_def.PerInstanceParameter_PDP(b, c, d, f, g)   
-        
-    else:
-        print("PerInstanceParameter are not present for this component")
-
-    #create runnable here
-
-    arelements_def.create_Runnable()
-
-    processed_types = set()
-
-    for a,b,c,d,e in zip(rnblname, rs, cic, rteeventname, rteeventtype):
-
-        if b is None or (isinstance(b, str) and not b.strip()):
-            b = a
-        else :
-            pass
-
-        if a in processed_types:
-            continue
-        processed_types.add(a) 
-
-        # Check the type of RTE event and call the corresponding function
-
-        if e == 'AsynchronousServerCallReturnsEvent':
-            # Handle asynchronous server call return event
-
-            arelements_def.Runnable_ASCRE(a,currentfolder, CurrentSWC_shortname) #rport, If_name, operation
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'InitEvent':
-            # Handle initialization event
-
-            arelements_def.Runnable_Init(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'BackgroundEvent':
-            # Handle background event
-
-            arelements_def.Runnable_BE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'TimingEvent':
-            # Handle timing event with additional information
-            arelements_def.Runnable_TE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'DataReceiveErrorEvent':
-            # Handle data receive error event with additional information
-
-            arelements_def.Runnable_DREE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'DataSendCompletedEvent':
-            # Handle data send completed event with additional information
-
-            arelements_def.Runnable_DSCE(a,currentfolder, CurrentSWC_shortname)#pport, If_name, DE,
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'DataWriteCompletedEvent':
-            # Handle data write completed event with additional information
-
-            arelements_def.Runnable_DWCE(a,currentfolder, CurrentSWC_shortname)#pport, If_name, DE,
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'ExternalTriggerOccurredEvent':
-            # Handle external trigger occurred event with additional information
-
-            arelements_def.Runnable_ETOE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'InternalTriggerOccurredEvent':
-            # Handle internal trigger occurred event with additional information
-
-            arelements_def.Runnable_ITOE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'ModeSwitchedAckEvent':
-            # Handle mode switched acknowledgment event with additional information
-
-            arelements_def.Runnable_MSAE(a,currentfolder, CurrentSWC_shortname)#pport, If_name, modegroup,
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'OperationInvokedEvent':
-            # Handle operation invoked event with additional information
-
-            arelements_def.Runnable_OIE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'SwcModeManagerErrorEvent':
-            # Handle software component mode manager error event with additional information
-
-            arelements_def.Runnable_SMMEE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'DataReceivedEvent':
-            # Handle data received event with additional information
-
-            arelements_def.Runnable_DRE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'SwcModeSwitchEvent':
-            # Handle software component mode switch event with additional information
-
-            arelements_def.Runnable_SMSE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'TransformerHardErrorEvent':
-            # Handle transformer hard error event with additional information
-
-            arelements_def.Runnable_THEE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-        
-        else:
-            # Print a message for unrecognized event types
-            print(f"Unrecognized event type: {e}")
-
-    if 'SharedParameter' in IBVariableType:
-
-        arelements_def.SharedParameter()
-    
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'SharedParameter':
-                arelements_def.SharedParameter_PDP(b, c, d, f, g)   
-        
-    else:
-        print("SharedParameter are not present for this component")
-
-    # Set the support for multiple instantiation based on the value from swc_info at key 'G2'
-
-    SupportsMultipleInstantiation = swc_info['G2'].value
-
-    arelements_def.supports_multiple_instantiation(SupportsMultipleInstantiation)
-
-def my_ecu_abstraction_function():
-
-    # Declare global variables to be used within this function
-    global currentfolder, CurrentSWC_shortname, CurrentInternalBehaviors
-    
-    currentfolder = 'EcuAbSWC' #other folders are CddSWC, CompSWC, EcuAbSWC, NvDataSWC, PrmSWC, SnsrActSWC, SrvcPrxySWC, SrvcSWC
-    # Create a new application software component using the value from swc_info at key 'C2'
-    CurrentSWC_shortname = (swc_info['C2'].value) 
-
-    EcuAbSWC_folder_elements = arxml_structure.get_variable('EcuAbSWC_folder_elements')
-
-    arelements_def.EcuAbstractionSwComponentType(EcuAbSWC_folder_elements,CurrentSWC_shortname)
-
-    Createports()
-
-    # Add a new internal behavior to the current software component using the value from swc_info at key 'E2'
-    CurrentInternalBehaviors = swc_info['E2'].value
-
-    arelements_def.internal_behaviors(CurrentInternalBehaviors, swc_type)
-
-    # Read columns B to H from ib_data to get runnable details
-
-    IBVariableType, IBVariableName, ApplicationDataTypeName, Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy = excel_reader.read_columns(ib_data, 'B', 'H')
-
-    if 'ConstantMemory' in IBVariableType:
-
-        arelements_def.ConstantMemory()
-      
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'ConstantMemory':
-                arelements_def.ConstantMemory_PDP(b, c, d, f, g)   
-        
-    else:
-        print("ConstantMemorys are not present for this component")
-
-    def createDTMS():
-        # Read columns B & M from adt_primitive,  and columns B & H from adt_composite to get DTMS details
-        adtp, cp, dp, ep, fp, gp, hp, ip, jp, kp, lp, idtp = excel_reader.read_columns(adt_primitive, 'B', 'M')
-
-        adtc, cc, dc, ec, fc, gc, hc, idtc = excel_reader.read_columns(adt_composite, 'B', 'I')
-        
-        DataTypemappingSets_folder_elements = arxml_structure.get_variable('DataTypemappingSets_folder_elements')
-        
-        arelements_def.DataTypeMappingSet(DataTypemappingSets_folder_elements,CurrentSWC_shortname)
-
-        for a,b in zip(adtp,idtp):
-            arelements_def.data_type_map(a,b)
-
-        for a,b in zip(adtc,idtc):
-            arelements_def.data_type_map(a,b)
-
-    createDTMS()
-
-    arelements_def.DataTYPEMAPPINGREFS()
-    arelements_def.DataTYPEMAPPINGREF(CurrentSWC_shortname)
-
-    if 'StaticMemory' in IBVariableType:
-
-        arelements_def.StaticMemory()
-      
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'StaticMemory':
-                arelements_def.StaticMemory_VDP(b, c, d, f, g)   
-        
-    else:
-        print("StaticMemorys are not present for this component")
-
-    if 'ArTypedPerInstanceMemory' in IBVariableType:
-
-        arelements_def.ArTypedPerInstanceMemory()
-    
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'ArTypedPerInstanceMemory':
-                arelements_def.ArTypedPerInstanceMemory_VDP(b, c, d, f, g)   
-        
-    else:
-        print("ArTypedPerInstanceMemorys are not present for this component")
-
-    #createRTEEvents()
-
-    rnblname, rs, cic, rteeventname, rteeventtype, rteeventinfo = excel_reader.read_columns(swc_info, 'H', 'M')
-
-
-
-    arelements_def.RTE_Event()
-
-    processed_types = set()
-
-    for a,b,c,d,e,f in zip(rnblname, rs, cic, rteeventname, rteeventtype, rteeventinfo):
-
-        if a in processed_types:
-            continue
-        processed_types.add(a)  
- 
-        # print(f"Processing: {a}, Category: {a}")
-
-        # Check the type of RTE event and call the corresponding function
-        if e == 'AsynchronousServerCallReturnsEvent':
-            # Handle asynchronous server call return event
-            arelements_def.AsynchronousServerCallReturnsEvent(d, a, currentfolder, CurrentSWC_shortname)
-        elif e == 'InitEvent':
-            # Handle initialization event
-            arelements_def.InitEvent(d, a, currentfolder, CurrentSWC_shortname)
-        elif e == 'BackgroundEvent':
-            # Handle background event
-            arelements_def.BackgroundEvent(d, a, currentfolder, CurrentSWC_shortname)
-        elif e == 'TimingEvent':
-            # Handle timing event with additional information
-            arelements_def.TimingEvent(d, a, currentfolder, CurrentSWC_shortname, f) #g is periodictime
-        elif e == 'DataReceiveErrorEvent':
-            # Handle data receive error event with additional information
-            arelements_def.DataReceiveErrorEvent(d, a, currentfolder, CurrentSWC_shortname, f) #rport, If_name, DE
-        elif e == 'DataSendCompletedEvent':
-            # Handle data send completed event with additional information
-            arelements_def.DataSendCompletedEvent(d, a, currentfolder, CurrentSWC_shortname, f) #pport, DE
-        elif e == 'DataWriteCompletedEvent':
-            # Handle data write completed event with additional information
-            arelements_def.DataWriteCompletedEvent(d, a, currentfolder, CurrentSWC_shortname, f) #pport, DE
-        elif e == 'ExternalTriggerOccurredEvent':
-            # Handle external trigger occurred event with additional information
-            arelements_def.ExternalTriggerOccurredEvent(d, a, currentfolder, CurrentSWC_shortname, f) #rport, If_name, trigger
-        elif e == 'InternalTriggerOccurredEvent':
-            # Handle internal trigger occurred event with additional information
-            arelements_def.InternalTriggerOccurredEvent(d, a, currentfolder, CurrentSWC_shortname, f)
-        elif e == 'ModeSwitchedAckEvent':
-            # Handle mode switched acknowledgment event with additional information
-            arelements_def.ModeSwitchedAckEvent(d, a, currentfolder, CurrentSWC_shortname, f) #pport, modegroup
-        elif e == 'OperationInvokedEvent':
-            # Handle operation invoked event with additional information
-            arelements_def.OperationInvokedEvent(d, a, currentfolder, CurrentSWC_shortname, f) #pport, If_name, operation
-        elif e == 'SwcModeManagerErrorEvent':
-            # Handle software component mode manager error event with additional information
-            arelements_def.SwcModeManagerErrorEvent(d, a, currentfolder, CurrentSWC_shortname, f)
-        elif e == 'DataReceivedEvent':
-            # Handle data received event with additional information
-            arelements_def.DataReceivedEvent(d, a, currentfolder, CurrentSWC_shortname, f) #rport, If_name, DE
-        elif e == 'SwcModeSwitchEvent':
-            # Handle software component mode switch event with additional information
-            arelements_def.SwcModeSwitchEvent(d, a, currentfolder, CurrentSWC_shortname, f) #rport, If_name, modegroup, mode
-        elif e == 'TransformerHardErrorEvent':
-            # Handle transformer hard error event with additional information
-            arelements_def.TransformerHardErrorEvent(d, a, currentfolder, CurrentSWC_shortname, f)
-        else:
-            # Print a message for unrecognized event types
-            print(f"Unrecognized event type: {e}")
-
-
-    if 'ExplicitInterRunnableVariable' in IBVariableType:
-
-        arelements_def.ExplicitInterRunnableVariable()
-    
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'ExplicitInterRunnableVariable':
-                arelements_def.ExplicitInterRunnableVariable_VDP(b, c, d, f, g)   
-        
-    else:
-        print("ExplicitInterRunnableVariable are not present for this component")
-
-    # Set the handle Termination And Restart based on the value from swc_info at key 'F2'
-    # CurrentInternalBehaviors.handleTerminationAndRestart = swc_info['F2'].value
-
-    handleTerminationAndRestart= swc_info['F2'].value
-    arelements_def.handle_termination_and_restart(handleTerminationAndRestart)
-
-    if 'ImplicitInterRunnableVariables' in IBVariableType:
-
-        arelements_def.ImplicitInterRunnableVariable()
-    
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'ImplicitInterRunnableVariables':
-                arelements_def.ImplicitInterRunnableVariable_VDP(b, c, d, f, g)   
-        
-    else:
-        print("ImplicitInterRunnableVariables are not present for this component")
-
-    if 'PerInstanceParameter' in IBVariableType:
-
-        arelements_def.PerInstanceParameter()
-    
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'PerInstanceParameter':
-                arelements_def.PerInstanceParameter_PDP(b, c, d, f, g)   
-        
-    else:
-        print("PerInstanceParameter are not present for this component")
-
-    #create runnable here
-
-    arelements_def.create_Runnable()
-
-    processed_types = set()
-
-    for a,b,c,d,e in zip(rnblname, rs, cic, rteeventname, rteeventtype):
-
-        if b is None or (isinstance(b, str) and not b.strip()):
-            b = a
-        else :
-            pass
-
-        if a in processed_types:
-            continue
-        processed_types.add(a) 
-
-        # Check the type of RTE event and call the corresponding function
-
-        if e == 'AsynchronousServerCallReturnsEvent':
-            # Handle asynchronous server call return event
-
-            arelements_def.Runnable_ASCRE(a,currentfolder, CurrentSWC_shortname) #rport, If_name, operation
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'InitEvent':
-            # Handle initialization event
-
-            arelements_def.Runnable_Init(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'BackgroundEvent':
-            # Handle background event
-
-            arelements_def.Runnable_BE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'TimingEvent':
-            # Handle timing event with additional information
-            arelements_def.Runnable_TE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'DataReceiveErrorEvent':
-            # Handle data receive error event with additional information
-
-            arelements_def.Runnable_DREE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'DataSendCompletedEvent':
-            # Handle data send completed event with additional information
-
-            arelements_def.Runnable_DSCE(a,currentfolder, CurrentSWC_shortname)#pport, If_name, DE,
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'DataWriteCompletedEvent':
-            # Handle data write completed event with additional information
-
-            arelements_def.Runnable_DWCE(a,currentfolder, CurrentSWC_shortname)#pport, If_name, DE,
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'ExternalTriggerOccurredEvent':
-            # Handle external trigger occurred event with additional information
-
-            arelements_def.Runnable_ETOE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'InternalTriggerOccurredEvent':
-            # Handle internal trigger occurred event with additional information
-
-            arelements_def.Runnable_ITOE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'ModeSwitchedAckEvent':
-            # Handle mode switched acknowledgment event with additional information
-
-            arelements_def.Runnable_MSAE(a,currentfolder, CurrentSWC_shortname)#pport, If_name, modegroup,
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'OperationInvokedEvent':
-            # Handle operation invoked event with additional information
-
-            arelements_def.Runnable_OIE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'SwcModeManagerErrorEvent':
-            # Handle software component mode manager error event with additional information
-
-            arelements_def.Runnable_SMMEE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'DataReceivedEvent':
-            # Handle data received event with additional information
-
-            arelements_def.Runnable_DRE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'SwcModeSwitchEvent':
-            # Handle software component mode switch event with additional information
-
-            arelements_def.Runnable_SMSE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'TransformerHardErrorEvent':
-            # Handle transformer hard error event with additional information
-
-            arelements_def.Runnable_THEE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-        
-        else:
-            # Print a message for unrecognized event types
-            print(f"Unrecognized event type: {e}")
-
-    if 'SharedParameter' in IBVariableType:
-
-        arelements_def.SharedParameter()
-    
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'SharedParameter':
-                arelements_def.SharedParameter_PDP(b, c, d, f, g)   
-        
-    else:
-        print("SharedParameter are not present for this component")
-
-    # Set the support for multiple instantiation based on the value from swc_info at key 'G2'
-
-    SupportsMultipleInstantiation = swc_info['G2'].value
-
-    arelements_def.supports_multiple_instantiation(SupportsMultipleInstantiation)
-
-def my_nv_block_function():
-    print('my_nv_block_function : will create later')
-
-def my_parameter_function():
-    print('my_parameter_function : will create later')
-
-def my_sensor_actuator_function():
-
-    # Declare global variables to be used within this function
-    global currentfolder, CurrentSWC_shortname, CurrentInternalBehaviors
-    
-    currentfolder = 'SnsrActSWC' #other folders are CddSWC, CompSWC, EcuAbSWC, NvDataSWC, PrmSWC, SnsrActSWC, SrvcPrxySWC, SrvcSWC
-    # Create a new application software component using the value from swc_info at key 'C2'
-    CurrentSWC_shortname = (swc_info['C2'].value) 
-
-    SnsrActSWC_folder_elements = arxml_structure.get_variable('SnsrActSWC_folder_elements')
-
-    arelements_def.SensorActuatorSwComponentType(SnsrActSWC_folder_elements,CurrentSWC_shortname)
-
-    Createports()
-
-    # Add a new internal behavior to the current software component using the value from swc_info at key 'E2'
-    CurrentInternalBehaviors = swc_info['E2'].value
-
-    arelements_def.internal_behaviors(CurrentInternalBehaviors, swc_type)
-
-    # Read columns B to H from ib_data to get runnable details
-
-    IBVariableType, IBVariableName, ApplicationDataTypeName, Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy = excel_reader.read_columns(ib_data, 'B', 'H')
-
-    if 'ConstantMemory' in IBVariableType:
-
-        arelements_def.ConstantMemory()
-      
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'ConstantMemory':
-                arelements_def.ConstantMemory_PDP(b, c, d, f, g)   
-        
-    else:
-        print("ConstantMemorys are not present for this component")
-
-    def createDTMS():
-        # Read columns B & M from adt_primitive,  and columns B & H from adt_composite to get DTMS details
-        adtp, cp, dp, ep, fp, gp, hp, ip, jp, kp, lp, idtp = excel_reader.read_columns(adt_primitive, 'B', 'M')
-
-        adtc, cc, dc, ec, fc, gc, hc, idtc = excel_reader.read_columns(adt_composite, 'B', 'I')
-        
-        DataTypemappingSets_folder_elements = arxml_structure.get_variable('DataTypemappingSets_folder_elements')
-        
-        arelements_def.DataTypeMappingSet(DataTypemappingSets_folder_elements,CurrentSWC_shortname)
-
-        for a,b in zip(adtp,idtp):
-            arelements_def.data_type_map(a,b)
-
-        for a,b in zip(adtc,idtc):
-            arelements_def.data_type_map(a,b)
-
-    createDTMS()
-
-    arelements_def.DataTYPEMAPPINGREFS()
-    arelements_def.DataTYPEMAPPINGREF(CurrentSWC_shortname)
-
-    if 'StaticMemory' in IBVariableType:
-
-        arelements_def.StaticMemory()
-      
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'StaticMemory':
-                arelements_def.StaticMemory_VDP(b, c, d, f, g)   
-        
-    else:
-        print("StaticMemorys are not present for this component")
-
-    if 'ArTypedPerInstanceMemory' in IBVariableType:
-
-        arelements_def.ArTypedPerInstanceMemory()
-    
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'ArTypedPerInstanceMemory':
-                arelements_def.ArTypedPerInstanceMemory_VDP(b, c, d, f, g)   
-        
-    else:
-        print("ArTypedPerInstanceMemorys are not present for this component")
-
-    #createRTEEvents()
-
-    rnblname, rs, cic, rteeventname, rteeventtype, rteeventinfo = excel_reader.read_columns(swc_info, 'H', 'M')
-
-
-
-    arelements_def.RTE_Event()
-
-    processed_types = set()
-
-    for a,b,c,d,e,f in zip(rnblname, rs, cic, rteeventname, rteeventtype, rteeventinfo):
-
-        if a in processed_types:
-            continue
-        processed_types.add(a)  
- 
-        # print(f"Processing: {a}, Category: {a}")
-
-        # Check the type of RTE event and call the corresponding function
-        if e == 'AsynchronousServerCallReturnsEvent':
-            # Handle asynchronous server call return event
-            arelements_def.AsynchronousServerCallReturnsEvent(d, a, currentfolder, CurrentSWC_shortname)
-        elif e == 'InitEvent':
-            # Handle initialization event
-            arelements_def.InitEvent(d, a, currentfolder, CurrentSWC_shortname)
-        elif e == 'BackgroundEvent':
-            # Handle background event
-            arelements_def.BackgroundEvent(d, a, currentfolder, CurrentSWC_shortname)
-        elif e == 'TimingEvent':
-            # Handle timing event with additional information
-            arelements_def.TimingEvent(d, a, currentfolder, CurrentSWC_shortname, f) #g is periodictime
-        elif e == 'DataReceiveErrorEvent':
-            # Handle data receive error event with additional information
-            arelements_def.DataReceiveErrorEvent(d, a, currentfolder, CurrentSWC_shortname, f) #rport, If_name, DE
-        elif e == 'DataSendCompletedEvent':
-            # Handle data send completed event with additional information
-            arelements_def.DataSendCompletedEvent(d, a, currentfolder, CurrentSWC_shortname, f) #pport, DE
-        elif e == 'DataWriteCompletedEvent':
-            # Handle data write completed event with additional information
-            arelements_def.DataWriteCompletedEvent(d, a, currentfolder, CurrentSWC_shortname, f) #pport, DE
-        elif e == 'ExternalTriggerOccurredEvent':
-            # Handle external trigger occurred event with additional information
-            arelements_def.ExternalTriggerOccurredEvent(d, a, currentfolder, CurrentSWC_shortname, f) #rport, If_name, trigger
-        elif e == 'InternalTriggerOccurredEvent':
-            # Handle internal trigger occurred event with additional information
-            arelements_def.InternalTriggerOccurredEvent(d, a, currentfolder, CurrentSWC_shortname, f)
-        elif e == 'ModeSwitchedAckEvent':
-            # Handle mode switched acknowledgment event with additional information
-            arelements_def.ModeSwitchedAckEvent(d, a, currentfolder, CurrentSWC_shortname, f) #pport, modegroup
-        elif e == 'OperationInvokedEvent':
-            # Handle operation invoked event with additional information
-            arelements_def.OperationInvokedEvent(d, a, currentfolder, CurrentSWC_shortname, f) #pport, If_name, operation
-        elif e == 'SwcModeManagerErrorEvent':
-            # Handle software component mode manager error event with additional information
-            arelements_def.SwcModeManagerErrorEvent(d, a, currentfolder, CurrentSWC_shortname, f)
-        elif e == 'DataReceivedEvent':
-            # Handle data received event with additional information
-            arelements_def.DataReceivedEvent(d, a, currentfolder, CurrentSWC_shortname, f) #rport, If_name, DE
-        elif e == 'SwcModeSwitchEvent':
-            # Handle software component mode switch event with additional information
-            arelements_def.SwcModeSwitchEvent(d, a, currentfolder, CurrentSWC_shortname, f) #rport, If_name, modegroup, mode
-        elif e == 'TransformerHardErrorEvent':
-            # Handle transformer hard error event with additional information
-            arelements_def.TransformerHardErrorEvent(d, a, currentfolder, CurrentSWC_shortname, f)
-        else:
-            # Print a message for unrecognized event types
-            print(f"Unrecognized event type: {e}")
-
-
-    if 'ExplicitInterRunnableVariable' in IBVariableType:
-
-        arelements_def.ExplicitInterRunnableVariable()
-    
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'ExplicitInterRunnableVariable':
-                arelements_def.ExplicitInterRunnableVariable_VDP(b, c, d, f, g)   
-        
-    else:
-        print("ExplicitInterRunnableVariable are not present for this component")
-
-    # Set the handle Termination And Restart based on the value from swc_info at key 'F2'
-    # CurrentInternalBehaviors.handleTerminationAndRestart = swc_info['F2'].value
-
-    handleTerminationAndRestart= swc_info['F2'].value
-    arelements_def.handle_termination_and_restart(handleTerminationAndRestart)
-
-    if 'ImplicitInterRunnableVariables' in IBVariableType:
-
-        arelements_def.ImplicitInterRunnableVariable()
-    
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'ImplicitInterRunnableVariables':
-                arelements_def.ImplicitInterRunnableVariable_VDP(b, c, d, f, g)   
-        
-    else:
-        print("ImplicitInterRunnableVariables are not present for this component")
-
-    if 'PerInstanceParameter' in IBVariableType:
-
-        arelements_def.PerInstanceParameter()
-    
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'PerInstanceParameter':
-                arelements_def.PerInstanceParameter_PDP(b, c, d, f, g)   
-        
-    else:
-        print("PerInstanceParameter are not present for this component")
-
-    #create runnable here
-
-    arelements_def.create_Runnable()
-
-    processed_types = set()
-
-    for a,b,c,d,e in zip(rnblname, rs, cic, rteeventname, rteeventtype):
-
-        if b is None or (isinstance(b, str) and not b.strip()):
-            b = a
-        else :
-            pass
-
-        if a in processed_types:
-            continue
-        processed_types.add(a) 
-
-        # Check the type of RTE event and call the corresponding function
-
-        if e == 'AsynchronousServerCallReturnsEvent':
-            # Handle asynchronous server call return event
-
-            arelements_def.Runnable_ASCRE(a,currentfolder, CurrentSWC_shortname) #rport, If_name, operation
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'InitEvent':
-            # Handle initialization event
-
-            arelements_def.Runnable_Init(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'BackgroundEvent':
-            # Handle background event
-
-            arelements_def.Runnable_BE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'TimingEvent':
-            # Handle timing event with additional information
-            arelements_def.Runnable_TE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'DataReceiveErrorEvent':
-            # Handle data receive error event with additional information
-
-            arelements_def.Runnable_DREE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'DataSendCompletedEvent':
-            # Handle data send completed event with additional information
-
-            arelements_def.Runnable_DSCE(a,currentfolder, CurrentSWC_shortname)#pport, If_name, DE,
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'DataWriteCompletedEvent':
-            # Handle data write completed event with additional information
-
-            arelements_def.Runnable_DWCE(a,currentfolder, CurrentSWC_shortname)#pport, If_name, DE,
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'ExternalTriggerOccurredEvent':
-            # Handle external trigger occurred event with additional information
-
-            arelements_def.Runnable_ETOE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'InternalTriggerOccurredEvent':
-            # Handle internal trigger occurred event with additional information
-
-            arelements_def.Runnable_ITOE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'ModeSwitchedAckEvent':
-            # Handle mode switched acknowledgment event with additional information
-
-            arelements_def.Runnable_MSAE(a,currentfolder, CurrentSWC_shortname)#pport, If_name, modegroup,
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'OperationInvokedEvent':
-            # Handle operation invoked event with additional information
-
-            arelements_def.Runnable_OIE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'SwcModeManagerErrorEvent':
-            # Handle software component mode manager error event with additional information
-
-            arelements_def.Runnable_SMMEE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'DataReceivedEvent':
-            # Handle data received event with additional information
-
-            arelements_def.Runnable_DRE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'SwcModeSwitchEvent':
-            # Handle software component mode switch event with additional information
-
-            arelements_def.Runnable_SMSE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'TransformerHardErrorEvent':
-            # Handle transformer hard error event with additional information
-
-            arelements_def.Runnable_THEE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-        
-        else:
-            # Print a message for unrecognized event types
-            print(f"Unrecognized event type: {e}")
-
-    if 'SharedParameter' in IBVariableType:
-
-        arelements_def.SharedParameter()
-    
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'SharedParameter':
-                arelements_def.SharedParameter_PDP(b, c, d, f, g)   
-        
-    else:
-        print("SharedParameter are not present for this component")
-
-    # Set the support for multiple instantiation based on the value from swc_info at key 'G2'
-
-    SupportsMultipleInstantiation = swc_info['G2'].value
-
-    arelements_def.supports_multiple_instantiation(SupportsMultipleInstantiation)
-
-def my_service_proxy_function():
-
-    # Declare global variables to be used within this function
-    global currentfolder, CurrentSWC_shortname, CurrentInternalBehaviors
-    
-    currentfolder = 'SrvcPrxySWC' #other folders are CddSWC, CompSWC, EcuAbSWC, NvDataSWC, PrmSWC, SnsrActSWC, SrvcPrxySWC, SrvcSWC
-    # Create a new application software component using the value from swc_info at key 'C2'
-    CurrentSWC_shortname = (swc_info['C2'].value) 
-
-    SrvcPrxySWC_folder_elements = arxml_structure.get_variable('SrvcPrxySWC_folder_elements')
-
-    arelements_def.ServiceProxySwComponentType(SrvcPrxySWC_folder_elements,CurrentSWC_shortname)
-
-    Createports()
-
-    # Add a new internal behavior to the current software component using the value from swc_info at key 'E2'
-    CurrentInternalBehaviors = swc_info['E2'].value
-
-    arelements_def.internal_behaviors(CurrentInternalBehaviors, swc_type)
-
-    # Read columns B to H from ib_data to get runnable details
-
-    IBVariableType, IBVariableName, ApplicationDataTypeName, Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy = excel_reader.read_columns(ib_data, 'B', 'H')
-
-    if 'ConstantMemory' in IBVariableType:
-
-        arelements_def.ConstantMemory()
-      
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'ConstantMemory':
-                arelements_def.ConstantMemory_PDP(b, c, d, f, g)   
-        
-    else:
-        print("ConstantMemorys are not present for this component")
-
-    def createDTMS():
-        # Read columns B & M from adt_primitive,  and columns B & H from adt_composite to get DTMS details
-        adtp, cp, dp, ep, fp, gp, hp, ip, jp, kp, lp, idtp = excel_reader.read_columns(adt_primitive, 'B', 'M')
-
-        adtc, cc, dc, ec, fc, gc, hc, idtc = excel_reader.read_columns(adt_composite, 'B', 'I')
-        
-        DataTypemappingSets_folder_elements = arxml_structure.get_variable('DataTypemappingSets_folder_elements')
-        
-        arelements_def.DataTypeMappingSet(DataTypemappingSets_folder_elements,CurrentSWC_shortname)
-
-        for a,b in zip(adtp,idtp):
-            arelements_def.data_type_map(a,b)
-
-        for a,b in zip(adtc,idtc):
-            arelements_def.data_type_map(a,b)
-
-    createDTMS()
-
-    arelements_def.DataTYPEMAPPINGREFS()
-    arelements_def.DataTYPEMAPPINGREF(CurrentSWC_shortname)
-
-    if 'StaticMemory' in IBVariableType:
-
-        arelements_def.StaticMemory()
-      
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'StaticMemory':
-                arelements_def.StaticMemory_VDP(b, c, d, f, g)   
-        
-    else:
-        print("StaticMemorys are not present for this component")
-
-    if 'ArTypedPerInstanceMemory' in IBVariableType:
-
-        arelements_def.ArTypedPerInstanceMemory()
-    
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'ArTypedPerInstanceMemory':
-                arelements_def.ArTypedPerInstanceMemory_VDP(b, c, d, f, g)   
-        
-    else:
-        print("ArTypedPerInstanceMemorys are not present for this component")
-
-    #createRTEEvents()
-
-    rnblname, rs, cic, rteeventname, rteeventtype, rteeventinfo = excel_reader.read_columns(swc_info, 'H', 'M')
-
-
-
-    arelements_def.RTE_Event()
-
-    processed_types = set()
-
-    for a,b,c,d,e,f in zip(rnblname, rs, cic, rteeventname, rteeventtype, rteeventinfo):
-
-        if a in processed_types:
-            continue
-        processed_types.add(a)  
- 
-        # print(f"Processing: {a}, Category: {a}")
-
-        # Check the type of RTE event and call the corresponding function
-        if e == 'AsynchronousServerCallReturnsEvent':
-            # Handle asynchronous server call return event
-            arelements_def.AsynchronousServerCallReturnsEvent(d, a, currentfolder, CurrentSWC_shortname)
-        elif e == 'InitEvent':
-            # Handle initialization event
-            arelements_def.InitEvent(d, a, currentfolder, CurrentSWC_shortname)
-        elif e == 'BackgroundEvent':
-            # Handle background event
-            arelements_def.BackgroundEvent(d, a, currentfolder, CurrentSWC_shortname)
-        elif e == 'TimingEvent':
-            # Handle timing event with additional information
-            arelements_def.TimingEvent(d, a, currentfolder, CurrentSWC_shortname, f) #g is periodictime
-        elif e == 'DataReceiveErrorEvent':
-            # Handle data receive error event with additional information
-            arelements_def.DataReceiveErrorEvent(d, a, currentfolder, CurrentSWC_shortname, f) #rport, If_name, DE
-        elif e == 'DataSendCompletedEvent':
-            # Handle data send completed event with additional information
-            arelements_def.DataSendCompletedEvent(d, a, currentfolder, CurrentSWC_shortname, f) #pport, DE
-        elif e == 'DataWriteCompletedEvent':
-            # Handle data write completed event with additional information
-            arelements_def.DataWriteCompletedEvent(d, a, currentfolder, CurrentSWC_shortname, f) #pport, DE
-        elif e == 'ExternalTriggerOccurredEvent':
-            # Handle external trigger occurred event with additional information
-            arelements_def.ExternalTriggerOccurredEvent(d, a, currentfolder, CurrentSWC_shortname, f) #rport, If_name, trigger
-        elif e == 'InternalTriggerOccurredEvent':
-            # Handle internal trigger occurred event with additional information
-            arelements_def.InternalTriggerOccurredEvent(d, a, currentfolder, CurrentSWC_shortname, f)
-        elif e == 'ModeSwitchedAckEvent':
-            # Handle mode switched acknowledgment event with additional information
-            arelements_def.ModeSwitchedAckEvent(d, a, currentfolder, CurrentSWC_shortname, f) #pport, modegroup
-        elif e == 'OperationInvokedEvent':
-            # Handle operation invoked event with additional information
-            arelements_def.OperationInvokedEvent(d, a, currentfolder, CurrentSWC_shortname, f) #pport, If_name, operation
-        elif e == 'SwcModeManagerErrorEvent':
-            # Handle software component mode manager error event with additional information
-            arelements_def.SwcModeManagerErrorEvent(d, a, currentfolder, CurrentSWC_shortname, f)
-        elif e == 'DataReceivedEvent':
-            # Handle data received event with additional information
-            arelements_def.DataReceivedEvent(d, a, currentfolder, CurrentSWC_shortname, f) #rport, If_name, DE
-        elif e == 'SwcModeSwitchEvent':
-            # Handle software component mode switch event with additional information
-            arelements_def.SwcModeSwitchEvent(d, a, currentfolder, CurrentSWC_shortname, f) #rport, If_name, modegroup, mode
-        elif e == 'TransformerHardErrorEvent':
-            # Handle transformer hard error event with additional information
-            arelements_def.TransformerHardErrorEvent(d, a, currentfolder, CurrentSWC_shortname, f)
-        else:
-            # Print a message for unrecognized event types
-            print(f"Unrecognized event type: {e}")
-
-
-    if 'ExplicitInterRunnableVariable' in IBVariableType:
-
-        arelements_def.ExplicitInterRunnableVariable()
-    
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'ExplicitInterRunnableVariable':
-                arelements_def.ExplicitInterRunnableVariable_VDP(b, c, d, f, g)   
-        
-    else:
-        print("ExplicitInterRunnableVariable are not present for this component")
-
-    # Set the handle Termination And Restart based on the value from swc_info at key 'F2'
-    # CurrentInternalBehaviors.handleTerminationAndRestart = swc_info['F2'].value
-
-    handleTerminationAndRestart= swc_info['F2'].value
-    arelements_def.handle_termination_and_restart(handleTerminationAndRestart)
-
-    if 'ImplicitInterRunnableVariables' in IBVariableType:
-
-        arelements_def.ImplicitInterRunnableVariable()
-    
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'ImplicitInterRunnableVariables':
-                arelements_def.ImplicitInterRunnableVariable_VDP(b, c, d, f, g)   
-        
-    else:
-        print("ImplicitInterRunnableVariables are not present for this component")
-
-    if 'PerInstanceParameter' in IBVariableType:
-
-        arelements_def.PerInstanceParameter()
-    
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'PerInstanceParameter':
-                arelements_def.PerInstanceParameter_PDP(b, c, d, f, g)   
-        
-    else:
-        print("PerInstanceParameter are not present for this component")
-
-    #create runnable here
-
-    arelements_def.create_Runnable()
-
-    processed_types = set()
-
-    for a,b,c,d,e in zip(rnblname, rs, cic, rteeventname, rteeventtype):
-
-        if b is None or (isinstance(b, str) and not b.strip()):
-            b = a
-        else :
-            pass
-
-        if a in processed_types:
-            continue
-        processed_types.add(a) 
-
-        # Check the type of RTE event and call the corresponding function
-
-        if e == 'AsynchronousServerCallReturnsEvent':
-            # Handle asynchronous server call return event
-
-            arelements_def.Runnable_ASCRE(a,currentfolder, CurrentSWC_shortname) #rport, If_name, operation
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'InitEvent':
-            # Handle initialization event
-
-            arelements_def.Runnable_Init(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'BackgroundEvent':
-            # Handle background event
-
-            arelements_def.Runnable_BE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'TimingEvent':
-            # Handle timing event with additional information
-            arelements_def.Runnable_TE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'DataReceiveErrorEvent':
-            # Handle data receive error event with additional information
-
-            arelements_def.Runnable_DREE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'DataSendCompletedEvent':
-            # Handle data send completed event with additional information
-
-            arelements_def.Runnable_DSCE(a,currentfolder, CurrentSWC_shortname)#pport, If_name, DE,
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'DataWriteCompletedEvent':
-            # Handle data write completed event with additional information
-
-            arelements_def.Runnable_DWCE(a,currentfolder, CurrentSWC_shortname)#pport, If_name, DE,
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'ExternalTriggerOccurredEvent':
-            # Handle external trigger occurred event with additional information
-
-            arelements_def.Runnable_ETOE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'InternalTriggerOccurredEvent':
-            # Handle internal trigger occurred event with additional information
-
-            arelements_def.Runnable_ITOE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'ModeSwitchedAckEvent':
-            # Handle mode switched acknowledgment event with additional information
-
-            arelements_def.Runnable_MSAE(a,currentfolder, CurrentSWC_shortname)#pport, If_name, modegroup,
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'OperationInvokedEvent':
-            # Handle operation invoked event with additional information
-
-            arelements_def.Runnable_OIE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'SwcModeManagerErrorEvent':
-            # Handle software component mode manager error event with additional information
-
-            arelements_def.Runnable_SMMEE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'DataReceivedEvent':
-            # Handle data received event with additional information
-
-            arelements_def.Runnable_DRE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'SwcModeSwitchEvent':
-            # Handle software component mode switch event with additional information
-
-            arelements_def.Runnable_SMSE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'TransformerHardErrorEvent':
-            # Handle transformer hard error event with additional information
-
-            arelements_def.Runnable_THEE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-        
-        else:
-            # Print a message for unrecognized event types
-            print(f"Unrecognized event type: {e}")
-
-    if 'SharedParameter' in IBVariableType:
-
-        arelements_def.SharedParameter()
-    
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'SharedParameter':
-                arelements_def.SharedParameter_PDP(b, c, d, f, g)   
-        
-    else:
-        print("SharedParameter are not present for this component")
-
-    # Set the support for multiple instantiation based on the value from swc_info at key 'G2'
-
-    SupportsMultipleInstantiation = swc_info['G2'].value
-
-    arelements_def.supports_multiple_instantiation(SupportsMultipleInstantiation)
-
-def my_service_function():
-
-    # Declare global variables to be used within this function
-    global currentfolder, CurrentSWC_shortname, CurrentInternalBehaviors
-    
-    currentfolder = 'SrvcSWC' #other folders are CddSWC, CompSWC, EcuAbSWC, NvDataSWC, PrmSWC, SnsrActSWC, SrvcPrxySWC, SrvcSWC
-    # Create a new application software component using the value from swc_info at key 'C2'
-    CurrentSWC_shortname = (swc_info['C2'].value) 
-
-    SrvcSWC_folder_elements = arxml_structure.get_variable('SrvcSWC_folder_elements')
-
-    arelements_def.ServiceSwComponentType(SrvcSWC_folder_elements,CurrentSWC_shortname)
-
-    Createports()
-
-    # Add a new internal behavior to the current software component using the value from swc_info at key 'E2'
-    CurrentInternalBehaviors = swc_info['E2'].value
-
-    arelements_def.internal_behaviors(CurrentInternalBehaviors, swc_type)
-
-    # Read columns B to H from ib_data to get runnable details
-
-    IBVariableType, IBVariableName, ApplicationDataTypeName, Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy = excel_reader.read_columns(ib_data, 'B', 'H')
-
-    if 'ConstantMemory' in IBVariableType:
-
-        arelements_def.ConstantMemory()
-      
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'ConstantMemory':
-                arelements_def.ConstantMemory_PDP(b, c, d, f, g)   
-        
-    else:
-        print("ConstantMemorys are not present for this component")
-
-    def createDTMS():
-        # Read columns B & M from adt_primitive,  and columns B & H from adt_composite to get DTMS details
-        adtp, cp, dp, ep, fp, gp, hp, ip, jp, kp, lp, idtp = excel_reader.read_columns(adt_primitive, 'B', 'M')
-
-        adtc, cc, dc, ec, fc, gc, hc, idtc = excel_reader.read_columns(adt_composite, 'B', 'I')
-        
-        DataTypemappingSets_folder_elements = arxml_structure.get_variable('DataTypemappingSets_folder_elements')
-        
-        arelements_def.DataTypeMappingSet(DataTypemappingSets_folder_elements,CurrentSWC_shortname)
-
-        for a,b in zip(adtp,idtp):
-            arelements_def.data_type_map(a,b)
-
-        for a,b in zip(adtc,idtc):
-            arelements_def.data_type_map(a,b)
-
-    createDTMS()
-
-    arelements_def.DataTYPEMAPPINGREFS()
-    arelements_def.DataTYPEMAPPINGREF(CurrentSWC_shortname)
-
-    if 'StaticMemory' in IBVariableType:
-
-        arelements_def.StaticMemory()
-      
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'StaticMemory':
-                arelements_def.StaticMemory_VDP(b, c, d, f, g)   
-        
-    else:
-        print("StaticMemorys are not present for this component")
-
-    if 'ArTypedPerInstanceMemory' in IBVariableType:
-
-        arelements_def.ArTypedPerInstanceMemory()
-    
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'ArTypedPerInstanceMemory':
-                arelements_def.ArTypedPerInstanceMemory_VDP(b, c, d, f, g)   
-        
-    else:
-        print("ArTypedPerInstanceMemorys are not present for this component")
-
-    #createRTEEvents()
-
-    rnblname, rs, cic, rteeventname, rteeventtype, rteeventinfo = excel_reader.read_columns(swc_info, 'H', 'M')
-
-
-
-    arelements_def.RTE_Event()
-
-    processed_types = set()
-
-    for a,b,c,d,e,f in zip(rnblname, rs, cic, rteeventname, rteeventtype, rteeventinfo):
-
-        if a in processed_types:
-            continue
-        processed_types.add(a)  
- 
-        # print(f"Processing: {a}, Category: {a}")
-
-        # Check the type of RTE event and call the corresponding function
-        if e == 'AsynchronousServerCallReturnsEvent':
-            # Handle asynchronous server call return event
-            arelements_def.AsynchronousServerCallReturnsEvent(d, a, currentfolder, CurrentSWC_shortname)
-        elif e == 'InitEvent':
-            # Handle initialization event
-            arelements_def.InitEvent(d, a, currentfolder, CurrentSWC_shortname)
-        elif e == 'BackgroundEvent':
-            # Handle background event
-            arelements_def.BackgroundEvent(d, a, currentfolder, CurrentSWC_shortname)
-        elif e == 'TimingEvent':
-            # Handle timing event with additional information
-            arelements_def.TimingEvent(d, a, currentfolder, CurrentSWC_shortname, f) #g is periodictime
-        elif e == 'DataReceiveErrorEvent':
-            # Handle data receive error event with additional information
-            arelements_def.DataReceiveErrorEvent(d, a, currentfolder, CurrentSWC_shortname, f) #rport, If_name, DE
-        elif e == 'DataSendCompletedEvent':
-            # Handle data send completed event with additional information
-            arelements_def.DataSendCompletedEvent(d, a, currentfolder, CurrentSWC_shortname, f) #pport, DE
-        elif e == 'DataWriteCompletedEvent':
-            # Handle data write completed event with additional information
-            arelements_def.DataWriteCompletedEvent(d, a, currentfolder, CurrentSWC_shortname, f) #pport, DE
-        elif e == 'ExternalTriggerOccurredEvent':
-            # Handle external trigger occurred event with additional information
-            arelements_def.ExternalTriggerOccurredEvent(d, a, currentfolder, CurrentSWC_shortname, f) #rport, If_name, trigger
-        elif e == 'InternalTriggerOccurredEvent':
-            # Handle internal trigger occurred event with additional information
-            arelements_def.InternalTriggerOccurredEvent(d, a, currentfolder, CurrentSWC_shortname, f)
-        elif e == 'ModeSwitchedAckEvent':
-            # Handle mode switched acknowledgment event with additional information
-            arelements_def.ModeSwitchedAckEvent(d, a, currentfolder, CurrentSWC_shortname, f) #pport, modegroup
-        elif e == 'OperationInvokedEvent':
-            # Handle operation invoked event with additional information
-            arelements_def.OperationInvokedEvent(d, a, currentfolder, CurrentSWC_shortname, f) #pport, If_name, operation
-        elif e == 'SwcModeManagerErrorEvent':
-            # Handle software component mode manager error event with additional information
-            arelements_def.SwcModeManagerErrorEvent(d, a, currentfolder, CurrentSWC_shortname, f)
-        elif e == 'DataReceivedEvent':
-            # Handle data received event with additional information
-            arelements_def.DataReceivedEvent(d, a, currentfolder, CurrentSWC_shortname, f) #rport, If_name, DE
-        elif e == 'SwcModeSwitchEvent':
-            # Handle software component mode switch event with additional information
-            arelements_def.SwcModeSwitchEvent(d, a, currentfolder, CurrentSWC_shortname, f) #rport, If_name, modegroup, mode
-        elif e == 'TransformerHardErrorEvent':
-            # Handle transformer hard error event with additional information
-            arelements_def.TransformerHardErrorEvent(d, a, currentfolder, CurrentSWC_shortname, f)
-        else:
-            # Print a message for unrecognized event types
-            print(f"Unrecognized event type: {e}")
-
-
-    if 'ExplicitInterRunnableVariable' in IBVariableType:
-
-        arelements_def.ExplicitInterRunnableVariable()
-    
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'ExplicitInterRunnableVariable':
-                arelements_def.ExplicitInterRunnableVariable_VDP(b, c, d, f, g)   
-        
-    else:
-        print("ExplicitInterRunnableVariable are not present for this component")
-
-    # Set the handle Termination And Restart based on the value from swc_info at key 'F2'
-    # CurrentInternalBehaviors.handleTerminationAndRestart = swc_info['F2'].value
-
-    handleTerminationAndRestart= swc_info['F2'].value
-    arelements_def.handle_termination_and_restart(handleTerminationAndRestart)
-
-    if 'ImplicitInterRunnableVariables' in IBVariableType:
-
-        arelements_def.ImplicitInterRunnableVariable()
-    
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'ImplicitInterRunnableVariables':
-                arelements_def.ImplicitInterRunnableVariable_VDP(b, c, d, f, g)   
-        
-    else:
-        print("ImplicitInterRunnableVariables are not present for this component")
-
-    if 'PerInstanceParameter' in IBVariableType:
-
-        arelements_def.PerInstanceParameter()
-    
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'PerInstanceParameter':
-                arelements_def.PerInstanceParameter_PDP(b, c, d, f, g)   
-        
-    else:
-        print("PerInstanceParameter are not present for this component")
-
-    #create runnable here
-
-    arelements_def.create_Runnable()
-
-    processed_types = set()
-
-    for a,b,c,d,e in zip(rnblname, rs, cic, rteeventname, rteeventtype):
-
-        if b is None or (isinstance(b, str) and not b.strip()):
-            b = a
-        else :
-            pass
-
-        if a in processed_types:
-            continue
-        processed_types.add(a) 
-
-        # Check the type of RTE event and call the corresponding function
-
-        if e == 'AsynchronousServerCallReturnsEvent':
-            # Handle asynchronous server call return event
-
-            arelements_def.Runnable_ASCRE(a,currentfolder, CurrentSWC_shortname) #rport, If_name, operation
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'InitEvent':
-            # Handle initialization event
-
-            arelements_def.Runnable_Init(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
-
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-
-        elif e == 'BackgroundEvent':
-            # Handle background event
-
-            arelements_def.Runnable_BE(a)
-
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
-
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
-
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
-
-            if a in m or a in n :
-                rnblaccess(a)            
-
-            arelements_def.Rnblsymbol(b)
+# The root element is created per generation run by arelements_def.BuildContext.
+# here, root is dynamic as per the arelements_def module version and it will get selected by user as per AUTOSAR schema version
+# for example root for AUTOSAR 4_0_2 schema version, 
+# root = ET.Element("AUTOSAR", 
+#                      attrib={
+#                          "xmlns:xsi": "http://www.w3.org/2001/XMLSchema-instance",
+#                          "xmlns": "http://autosar.org/schema/r4.0",
+#                          "xsi:schemaLocation": "http://autosar.org/schema/r4.0 AUTOSAR_4-0-2.xsd"
+#                      })
 
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
+from collections import defaultdict
+import functools
 
-        elif e == 'TimingEvent':
-            # Handle timing event with additional information
-            arelements_def.Runnable_TE(a)
+from Pkg_struct import ARXMLStructure # Import the ARXMLStructure class from the Pkg_struct module
 
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
+import rng # Import the rng module for random number generation
 
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
+#----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#               # ####################### ++++++++++++ ---------- __________ SECTION :  Excel Related Functions __________ ----------  ++++++++++++ ####################### #               #
+#----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
+from excel_utils import ExcelReader, SheetView
 
-            if a in m or a in n :
-                rnblaccess(a)            
+from itertools import groupby
 
-            arelements_def.Rnblsymbol(b)
+# Initialize the ExcelReader, it is only used to read columns and holds no workbook state
+excel_reader = ExcelReader()
 
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
 
-        elif e == 'DataReceiveErrorEvent':
-            # Handle data receive error event with additional information
+import validator  # Import validation module
 
-            arelements_def.Runnable_DREE(a)
+# Worksheets of the input workbook, available as ctx.sheets[title] during generation
+SHEET_NAMES = ('project_info', 'swc_info', 'ib_data', 'ports', 'adt_primitive', 'adt_composite', 'idt')
 
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
+def validate_interactively(excel_reader):
+    """
+    Validates the workbook at excel_reader.file_path, asking for a new file while
+    Critical errors are found. Exits the program if the user does not want to retry.
+    """
 
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
+    # Validate the Excel file before proceeding
 
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
+    attempts = 0
 
-            if a in m or a in n :
-                rnblaccess(a)            
+    initial_errors = []
 
-            arelements_def.Rnblsymbol(b)
+    final_errors = []
 
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
+    while True:
 
-        elif e == 'DataSendCompletedEvent':
-            # Handle data send completed event with additional information
+        attempts += 1
 
-            arelements_def.Runnable_DSCE(a,currentfolder, CurrentSWC_shortname)#pport, If_name, DE,
+        errors = validator.validate_excel(excel_reader.file_path)  # Validate the Excel file
 
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
+        if attempts == 1:
 
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
+            initial_errors = errors.copy()  # Store first validation errors
 
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
+        # Always log all errors (Info, Warning, Critical)
 
-            if a in m or a in n :
-                rnblaccess(a)            
+        # Generate HTML report for every validation attempt
+        validator.generate_html_report(errors, attempts)
 
-            arelements_def.Rnblsymbol(b)
+        validator.print_colored_errors(errors)
 
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
+        validator.log_errors(errors, attempts)
 
-        elif e == 'DataWriteCompletedEvent':
-            # Handle data write completed event with additional information
+        if errors["Critical"]:  # Stop only if Critical errors exist
 
-            arelements_def.Runnable_DWCE(a,currentfolder, CurrentSWC_shortname)#pport, If_name, DE,
+            print("\n❌ Excel validation failed! Please check 'validation_log.txt' and fix the issues.")
 
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
+            retry = input("🔁 Do you want to retry with a new file? (yes/no): ").strip().lower()
 
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
+            if retry == "yes":
 
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
+                excel_reader.get_file_path_from_user()  # Ask for a new file path
 
-            if a in m or a in n :
-                rnblaccess(a)            
+                continue  # Retry validation with a new file
 
-            arelements_def.Rnblsymbol(b)
+            else:
 
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
+                print("❌ Exiting program. Fix validation issues before retrying.")
 
-        elif e == 'ExternalTriggerOccurredEvent':
-            # Handle external trigger occurred event with additional information
+                exit(1)  # Stop execution if user does not want to retry
 
-            arelements_def.Runnable_ETOE(a)
+        # If only Info/Warnings exist, proceed
 
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
+        final_errors = errors.copy()  # Store final error-free state
 
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
+        print("\n✅ Excel validation passed with warnings/info. Proceeding with ARXML generation...\n")
 
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
+        break  # Exit validation loop and proceed
 
-            if a in m or a in n :
-                rnblaccess(a)            
+    # Generate validation summary
 
-            arelements_def.Rnblsymbol(b)
+    validator.generate_summary(initial_errors, final_errors, attempts) 
 
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
+def load_sheets(ctx, file_path):
+    """
+    Reads the Excel file and makes its worksheets available as ctx.sheets[title].
+    """
+    reader = ExcelReader()
+    reader.file_path = file_path
+    workbook = reader.read_user_defined_excel()
+    worksheets = {sheet.title: sheet for sheet in workbook.worksheets}
+    ctx.sheets = {name: worksheets[name] for name in SHEET_NAMES}
 
-        elif e == 'InternalTriggerOccurredEvent':
-            # Handle internal trigger occurred event with additional information
 
-            arelements_def.Runnable_ITOE(a)
+#----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
+#               # ####################### =============== %%%%%%%%% ++++++++++++ ---------- __________ SECTION :  Software Components __________ ----------  ++++++++++++ %%%%%%%%% =============== ####################### #               #
+#----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
+# Columns used to assign the ports and ib_data rows to the component owning their runnable
+SWC_RUNNABLE_COL = 'H'
+PORTS_RUNNABLE_COL = 'I'
+IB_DATA_RUNNABLE_COL = 'F'
 
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
+def partition_components(ctx):
+    """
+    Splits the swc_info, ports and ib_data sheets into one set of sheet views per component.
 
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
+    Every row of swc_info with a SWC Type starts a new component, the rows below it hold
+    its further runnables. A port (rows from one Port Name to the next) and an IB variable
+    belong to the component that owns one of their accessing runnables, rows without a
+    known runnable belong to the first component. A workbook with a single component
+    gives views over all rows, identical to reading the sheets themselves.
 
-            if a in m or a in n :
-                rnblaccess(a)            
+    Returns:
+        A list of (swc_info, ports, ib_data) SheetView tuples, one per component.
+    """
+    swc_info, ports, ib_data = ctx.sheets['swc_info'], ctx.sheets['ports'], ctx.sheets['ib_data']
+    components = excel_reader.group_rows(swc_info, 'B')
+    if not components:
+        return []
+
+    # Index of the owning component per runnable name
+    owner = {}
+    runnable_col = excel_reader.column_letter_to_index(SWC_RUNNABLE_COL)
+    for index, (_, rows) in enumerate(components):
+        for row in rows:
+            owner.setdefault(swc_info.cell(row=row, column=runnable_col).value, index)
+    owner.pop(None, None)
+
+    def partition(sheet, key_col, runnable_letter):
+        column = excel_reader.column_letter_to_index(runnable_letter)
+        rows_per_component = [[] for _ in components]
+        for _, rows in excel_reader.group_rows(sheet, key_col):
+            runnables = (sheet.cell(row=row, column=column).value for row in rows)
+            index = next((owner[runnable] for runnable in runnables if runnable in owner), 0)
+            rows_per_component[index].extend(rows)
+        return [SheetView(sheet, rows) for rows in rows_per_component]
+
+    port_views = partition(ports, 'C', PORTS_RUNNABLE_COL)
+    ib_data_views = partition(ib_data, 'C', IB_DATA_RUNNABLE_COL)
+    return [(SheetView(swc_info, rows), port_view, ib_data_view)
+            for (_, rows), port_view, ib_data_view in zip(components, port_views, ib_data_views)]
+
+def CreateSwcs(ctx):
+    # Every component of the workbook is built into the same package structure
+    for views in partition_components(ctx):
+        build_component(ctx, views)
+
+# Element builders of the RTE events, by RTE event type of swc_info. The flag tells if the
+# builder takes the RTE event info of the row (e.g. the period of a TimingEvent).
+RTE_EVENT_BUILDERS = {
+    'AsynchronousServerCallReturnsEvent': (arelements_def.AsynchronousServerCallReturnsEvent, False),
+    'BackgroundEvent': (arelements_def.BackgroundEvent, False),
+    'TimingEvent': (arelements_def.TimingEvent, True), #info is the periodictime
+    'DataReceiveErrorEvent': (arelements_def.DataReceiveErrorEvent, True), #rport, If_name, DE
+    'DataSendCompletedEvent': (arelements_def.DataSendCompletedEvent, True), #pport, DE
+    'DataWriteCompletedEvent': (arelements_def.DataWriteCompletedEvent, True), #pport, DE
+    'ExternalTriggerOccurredEvent': (arelements_def.ExternalTriggerOccurredEvent, True), #rport, If_name, trigger
+    'ModeSwitchedAckEvent': (arelements_def.ModeSwitchedAckEvent, True), #pport, modegroup
+    'OperationInvokedEvent': (arelements_def.OperationInvokedEvent, True), #pport, If_name, operation
+    'DataReceivedEvent': (arelements_def.DataReceivedEvent, True), #rport, If_name, DE
+    'SwcModeSwitchEvent': (arelements_def.SwcModeSwitchEvent, True), #rport, If_name, modegroup, mode
+    # InitEvent, InternalTriggerOccurredEvent, SwcModeManagerErrorEvent and
+    # TransformerHardErrorEvent have no element builders yet
+}
+
+# Element builders of the runnables, by RTE event type of swc_info. The flag tells if the
+# builder takes the component's folder and short name.
+RUNNABLE_BUILDERS = {
+    'AsynchronousServerCallReturnsEvent': (arelements_def.Runnable_ASCRE, True), #rport, If_name, operation
+    'BackgroundEvent': (arelements_def.Runnable_BE, False),
+    'TimingEvent': (arelements_def.Runnable_TE, False),
+    'DataReceiveErrorEvent': (arelements_def.Runnable_DREE, False),
+    'DataSendCompletedEvent': (arelements_def.Runnable_DSCE, True), #pport, If_name, DE
+    'DataWriteCompletedEvent': (arelements_def.Runnable_DWCE, True), #pport, If_name, DE
+    'ExternalTriggerOccurredEvent': (arelements_def.Runnable_ETOE, False),
+    'ModeSwitchedAckEvent': (arelements_def.Runnable_MSAE, True), #pport, If_name, modegroup
+    'OperationInvokedEvent': (arelements_def.Runnable_OIE, False),
+    'DataReceivedEvent': (arelements_def.Runnable_DRE, False),
+    'SwcModeSwitchEvent': (arelements_def.Runnable_SMSE, False),
+}
+
+# Container builders of the IB variables, by IB Variable Type of ib_data, with the name
+# used when a component has none of them
+IB_VARIABLE_CONTAINERS = {
+    'ConstantMemory': (arelements_def.ConstantMemory, 'ConstantMemorys'),
+    'StaticMemory': (arelements_def.StaticMemory, 'StaticMemorys'),
+    'ArTypedPerInstanceMemory': (arelements_def.ArTypedPerInstanceMemory, 'ArTypedPerInstanceMemorys'),
+    'ExplicitInterRunnableVariable': (arelements_def.ExplicitInterRunnableVariable, 'ExplicitInterRunnableVariable'),
+    'ImplicitInterRunnableVariables': (arelements_def.ImplicitInterRunnableVariable, 'ImplicitInterRunnableVariables'),
+    'PerInstanceParameter': (arelements_def.PerInstanceParameter, 'PerInstanceParameter'),
+    'SharedParameter': (arelements_def.SharedParameter, 'SharedParameter'),
+}
+
+def flatten(columns):
+    """
+    Returns the values of a single column read with excel_reader.read_columns().
+    """
+    columns = columns or []
+    return [item for sublist in columns for item in sublist] if any(isinstance(i, list) for i in columns) else columns
 
-            arelements_def.Rnblsymbol(b)
+def build_component(ctx, views):
+    """
+    Builds one component from its (swc_info, ports, ib_data) sheet views.
 
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
+    All SWC types go through the same steps, the type selects the package folder, the
+    element tag and whether the component has an internal behavior (see
+    arelements_def.SW_COMPONENT_TYPES); types without one, i.e. ParameterSwComponentType,
+    stop after the ports. Unknown types are built as ApplicationSwComponentType.
+    """
+# ARXML structure
+#   SWC
+#       Short Name
+#       Ports
+#           R port
+#               short name
+#               required interface
+#           P port
+#               short name
+#               provided interface
+#       IB
+#           uuid
+#           short name
+#           constant memo
+#           DTMS
+#           Statis memo
+#           AR type PIM
+#           Events
+#           Ex IRV
+#           handleTerminationAndRestart
+#           Imp IRV
+#           per instance param
+#           runnables
+#           shared param
+#           SupportsMultipleInstantiation
 
-        elif e == 'ModeSwitchedAckEvent':
-            # Handle mode switched acknowledgment event with additional information
+    ctx.swc_info_sheet, ctx.ports_sheet, ctx.ib_data_sheet = views
+    # Retrieve the value from the component's swc_info rows at key 'B2'
+    ctx.swc_type = ctx.swc_info_sheet['B2'].value
+    folder, swc_tag, has_internal_behavior = arelements_def.SW_COMPONENT_TYPES.get(
+        ctx.swc_type, arelements_def.SW_COMPONENT_TYPES['ApplicationSwComponentType'])
 
-            arelements_def.Runnable_MSAE(a,currentfolder, CurrentSWC_shortname)#pport, If_name, modegroup,
+    ctx.currentfolder = folder #ApplSWC, CddSWC, EcuAbSWC, NvDataSWC, PrmSWC, SnsrActSWC, SrvcPrxySWC or SrvcSWC
+    # Create a new software component using the value from swc_info at key 'C2'
+    ctx.CurrentSWC_shortname = (ctx.swc_info_sheet['C2'].value)
 
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
+    SWC_folder_elements = ctx.structure.get_variable(f'{folder}_folder_elements')
 
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
+    arelements_def.SwComponentType(ctx, SWC_folder_elements, swc_tag, ctx.CurrentSWC_shortname)
 
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
+    Createports(ctx)
 
-            if a in m or a in n :
-                rnblaccess(a)            
+    if not has_internal_behavior:
+        return
 
-            arelements_def.Rnblsymbol(b)
+    # Add a new internal behavior to the current software component using the value from swc_info at key 'E2'
+    ctx.CurrentInternalBehaviors = ctx.swc_info_sheet['E2'].value
 
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
+    arelements_def.internal_behaviors(ctx, ctx.CurrentInternalBehaviors)
 
-        elif e == 'OperationInvokedEvent':
-            # Handle operation invoked event with additional information
+    # Read columns B to H from ib_data to get the IB variables
+    ib_data = excel_reader.read_columns(ctx.ib_data_sheet, 'B', 'H')
 
-            arelements_def.Runnable_OIE(a)
+    create_ib_variables(ctx, ib_data, 'ConstantMemory')
 
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
+    createDTMS(ctx)
 
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
+    arelements_def.DataTYPEMAPPINGREFS(ctx)
+    arelements_def.DataTYPEMAPPINGREF(ctx, ctx.CurrentSWC_shortname)
 
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
+    create_ib_variables(ctx, ib_data, 'StaticMemory')
+    create_ib_variables(ctx, ib_data, 'ArTypedPerInstanceMemory')
 
-            if a in m or a in n :
-                rnblaccess(a)            
+    # Read columns H to M from swc_info to get the runnables and their RTE events
+    runnable_rows = excel_reader.read_columns(ctx.swc_info_sheet, 'H', 'M')
 
-            arelements_def.Rnblsymbol(b)
+    createRTEEvents(ctx, runnable_rows)
 
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
+    create_ib_variables(ctx, ib_data, 'ExplicitInterRunnableVariable')
 
-        elif e == 'SwcModeManagerErrorEvent':
-            # Handle software component mode manager error event with additional information
+    # Set the handle Termination And Restart based on the value from swc_info at key 'F2'
+    handleTerminationAndRestart= ctx.swc_info_sheet['F2'].value
+    arelements_def.handle_termination_and_restart(ctx, handleTerminationAndRestart)
 
-            arelements_def.Runnable_SMMEE(a)
+    create_ib_variables(ctx, ib_data, 'ImplicitInterRunnableVariables')
+    create_ib_variables(ctx, ib_data, 'PerInstanceParameter')
 
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
+    createRunnables(ctx, runnable_rows)
 
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
+    create_ib_variables(ctx, ib_data, 'SharedParameter')
 
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
+    # Set the support for multiple instantiation based on the value from swc_info at key 'G2'
+    SupportsMultipleInstantiation = ctx.swc_info_sheet['G2'].value
 
-            if a in m or a in n :
-                rnblaccess(a)            
+    arelements_def.supports_multiple_instantiation(ctx, SupportsMultipleInstantiation)
 
-            arelements_def.Rnblsymbol(b)
+def create_ib_variables(ctx, ib_data, variable_type):
+    """
+    Adds the container of one IB variable type and its rows of ib_data (columns B to H).
+    """
+    create_container, name = IB_VARIABLE_CONTAINERS[variable_type]
+    IBVariableType = ib_data[0]
 
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
+    if variable_type in IBVariableType:
 
-        elif e == 'DataReceivedEvent':
-            # Handle data received event with additional information
+        create_container(ctx)
 
-            arelements_def.Runnable_DRE(a)
+        arelements_def.ib_data_prototypes(ctx, variable_type, [(b, c, d, f, g) for a,b,c,d,e,f,g in zip(*ib_data) if a == variable_type])
 
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
+    else:
+        logging.info(f"{name} are not present for this component")
 
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
+def createDTMS(ctx):
+    # Read columns B & M from adt_primitive,  and columns B & I from adt_composite to get DTMS details
+    adtp, cp, dp, ep, fp, gp, hp, ip, jp, kp, lp, idtp = excel_reader.read_columns(ctx.sheets['adt_primitive'], 'B', 'M')
 
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
+    adtc, cc, dc, ec, fc, gc, hc, idtc = excel_reader.read_columns(ctx.sheets['adt_composite'], 'B', 'I')
 
-            if a in m or a in n :
-                rnblaccess(a)            
+    DataTypemappingSets_folder_elements = ctx.structure.get_variable('DataTypemappingSets_folder_elements')
 
-            arelements_def.Rnblsymbol(b)
+    arelements_def.DataTypeMappingSet(ctx, DataTypemappingSets_folder_elements,ctx.CurrentSWC_shortname)
 
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
+    for a,b in zip(adtp,idtp):
+        arelements_def.data_type_map(ctx, a,b)
 
-        elif e == 'SwcModeSwitchEvent':
-            # Handle software component mode switch event with additional information
+    for a,b in zip(adtc,idtc):
+        arelements_def.data_type_map(ctx, a,b)
 
-            arelements_def.Runnable_SMSE(a)
+def createRTEEvents(ctx, runnable_rows):
+    """
+    Adds one RTE event per runnable of swc_info (columns H to M).
+    """
+    rnblname, rs, cic, rteeventname, rteeventtype, rteeventinfo = runnable_rows
 
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
+    arelements_def.RTE_Event(ctx)
 
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
+    processed_types = set()
 
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
+    for a,b,c,d,e,f in zip(rnblname, rs, cic, rteeventname, rteeventtype, rteeventinfo):
 
-            if a in m or a in n :
-                rnblaccess(a)            
+        if a in processed_types:
+            continue
+        processed_types.add(a)
 
-            arelements_def.Rnblsymbol(b)
+        # Get the builder of the RTE event type
+        builder = RTE_EVENT_BUILDERS.get(e)
+        if builder is None:
+            # Print a message for unrecognized event types
+            logging.warning(f"Unrecognized event type: {e}")
+            continue
 
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
+        create_event, takes_info = builder
+        if takes_info:
+            create_event(ctx, d, a, ctx.currentfolder, ctx.CurrentSWC_shortname, f)
+        else:
+            create_event(ctx, d, a, ctx.currentfolder, ctx.CurrentSWC_shortname)
 
-        elif e == 'TransformerHardErrorEvent':
-            # Handle transformer hard error event with additional information
+def createRunnables(ctx, runnable_rows):
+    """
+    Adds the runnables of swc_info (columns H to M) with their accesses and symbols.
+    """
+    rnblname, rs, cic, rteeventname, rteeventtype, rteeventinfo = runnable_rows
 
-            arelements_def.Runnable_THEE(a)
+    arelements_def.create_Runnable(ctx)
 
-            m = excel_reader.read_columns(ib_data, 'F', 'F') or []  # Ensure m is at least an empty list
-            n = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure n is at least an empty list
+    # Accessing runnables of the ib_data variables (column F) and of the ports (column I)
+    ib_data_rnbls = set(flatten(excel_reader.read_columns(ctx.ib_data_sheet, 'F', 'F')))
+    ports_rnbls = set(flatten(excel_reader.read_columns(ctx.ports_sheet, 'I', 'I')))
 
-            # Ensure m and n are lists (in case the function returns None or something unexpected)
-            if not isinstance(m, list):
-                m = list(m)  
-            if not isinstance(n, list):
-                n = list(n)
+    processed_types = set()
 
-            # Flatten m and n if they contain nested lists
-            m = [item for sublist in m for item in sublist] if any(isinstance(i, list) for i in m) else m
-            n = [item for sublist in n for item in sublist] if any(isinstance(i, list) for i in n) else n
+    for a,b,c,d,e in zip(rnblname, rs, cic, rteeventname, rteeventtype):
 
-            if a in m or a in n :
-                rnblaccess(a)            
+        if b is None or (isinstance(b, str) and not b.strip()):
+            b = a
 
-            arelements_def.Rnblsymbol(b)
+        if a in processed_types:
+            continue
+        processed_types.add(a)
 
-            if a in m :
-                rnblaccess_WrittenIRV(a)
-            else :
-                pass
-        
-        else:
+        # Get the builder of the runnable's RTE event type
+        builder = RUNNABLE_BUILDERS.get(e)
+        if builder is None:
             # Print a message for unrecognized event types
-            print(f"Unrecognized event type: {e}")
-
-    if 'SharedParameter' in IBVariableType:
-
-        arelements_def.SharedParameter()
-    
-        for a,b,c,d,e,f,g in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable, SwCalibrationAccess, SwImplementationPolicy):
-            if a == 'SharedParameter':
-                arelements_def.SharedParameter_PDP(b, c, d, f, g)   
-        
-    else:
-        print("SharedParameter are not present for this component")
+            logging.warning(f"Unrecognized event type: {e}")
+            continue
 
-    # Set the support for multiple instantiation based on the value from swc_info at key 'G2'
+        create_runnable, takes_component = builder
+        if takes_component:
+            create_runnable(ctx, a, ctx.currentfolder, ctx.CurrentSWC_shortname)
+        else:
+            create_runnable(ctx, a)
 
-    SupportsMultipleInstantiation = swc_info['G2'].value
+        if a in ib_data_rnbls or a in ports_rnbls :
+            rnblaccess(ctx, a)
 
-    arelements_def.supports_multiple_instantiation(SupportsMultipleInstantiation)
+        arelements_def.Rnblsymbol(ctx, b)
 
+        if a in ib_data_rnbls :
+            rnblaccess_WrittenIRV(ctx, a)
 
 
 #----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
@@ -4129,20 +458,14 @@ def my_service_function():
 
 # ib_data f column , ports i columns
 
-def rnblaccess(Currentrnbl):
+def rnblaccess(ctx, Currentrnbl):
     
     # Read argument_col (Column G) from Excel
-    argument_col = excel_reader.read_columns(ports, 'G', 'G') or []
-    
-    # Flatten the list to remove any nested lists
-    def flatten(lst):
-        return [item for sublist in lst for item in sublist] if any(isinstance(i, list) for i in lst) else lst
-    
-    argument_col = flatten(argument_col)
+    argument_col = flatten(excel_reader.read_columns(ctx.ports_sheet, 'G', 'G'))
 
     #interface check
 
-    inf_col = excel_reader.read_columns(ports, 'D', 'D') or []  # Ensure argument_col is at least an empty list    
+    inf_col = excel_reader.read_columns(ctx.ports_sheet, 'D', 'D') or []  # Ensure argument_col is at least an empty list    
 
 
     inf_col = flatten(inf_col)
@@ -4150,7 +473,7 @@ def rnblaccess(Currentrnbl):
 
     #accessing runnable check : ports
 
-    ports_Acc_Rnbl = excel_reader.read_columns(ports, 'I', 'I') or []  # Ensure argument_col is at least an empty list    
+    ports_Acc_Rnbl = excel_reader.read_columns(ctx.ports_sheet, 'I', 'I') or []  # Ensure argument_col is at least an empty list    
 
 
     ports_Acc_Rnbl = flatten(ports_Acc_Rnbl)
@@ -4162,23 +485,22 @@ def rnblaccess(Currentrnbl):
 
         if 'dra' in a and b == Currentrnbl :
 
-            arelements_def.dra()
+            arelements_def.dra(ctx)
         elif 'drpa' in a and b == Currentrnbl:
 
-            arelements_def.drpa()
+            arelements_def.drpa(ctx)
         elif 'drpv' in a and b == Currentrnbl:
             
-            arelements_def.drpv()
+            arelements_def.drpv(ctx)
         elif 'dsp' in a and b == Currentrnbl:
             
-            arelements_def.dsp()
+            arelements_def.dsp(ctx)
         elif 'dwa' in a and b == Currentrnbl:
             
-            arelements_def.dwa()
+            arelements_def.dwa(ctx)
         else :
             pass
 
-    global pa_already_triggered
 
     pa_already_triggered = None
 
@@ -4186,167 +508,137 @@ def rnblaccess(Currentrnbl):
 
         if 'ModeSwitchInterface' in a and b == Currentrnbl:
             
-            arelements_def.msp()        
+            arelements_def.msp(ctx)        
              
         elif 'ParameterInterface' in a and b == Currentrnbl :
            
-            arelements_def.pa()
+            arelements_def.pa(ctx)
             pa_already_triggered = 1
 
         elif 'ClientServerInterface' in a and b == Currentrnbl:
            
-            arelements_def.sscp()
+            arelements_def.sscp(ctx)
 
-    IBVariableType, IBVariableName, ApplicationDataTypeName, Initvalue, AccessingRunnable = excel_reader.read_columns(ib_data, 'B', 'F')
+    IBVariableType, IBVariableName, ApplicationDataTypeName, Initvalue, AccessingRunnable = excel_reader.read_columns(ctx.ib_data_sheet, 'B', 'F')
 
     for ait,br in zip(IBVariableType, AccessingRunnable):
         if pa_already_triggered != 1 :
 
             if ait in ['ConstantMemory', 'PerInstanceParameter', 'SharedParameter'] and br == Currentrnbl :
-                arelements_def.pa()
+                arelements_def.pa(ctx)
                 pa_already_triggered = 0
                 break
 
     for irvt,br in zip(IBVariableType, AccessingRunnable):
         if irvt in ['ImplicitInterRunnableVariables', 'ExplicitInterRunnableVariable'] and br == Currentrnbl :#still read or write bifurcation is pending
             
-            arelements_def.IRVRA()
+            arelements_def.IRVRA(ctx)
             break
 
     for a,b,c,d,e in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable):
         
         if a == 'ConstantMemory' and e == Currentrnbl:
             
-            arelements_def.CMCPA_ConstantMemory(currentfolder, CurrentSWC_shortname,b)
+            arelements_def.CMCPA_ConstantMemory(ctx, ctx.currentfolder, ctx.CurrentSWC_shortname,b)
             
         elif a == 'PerInstanceParameter'and e == Currentrnbl:
             
-            arelements_def.PICPVA_PerInstanceParameter(currentfolder, CurrentSWC_shortname,b)
+            arelements_def.PICPVA_PerInstanceParameter(ctx, ctx.currentfolder, ctx.CurrentSWC_shortname,b)
 
         elif a == 'SharedParameter'and e == Currentrnbl:
             
-            arelements_def.SCPVA_SharedParameter(currentfolder, CurrentSWC_shortname,b) #ideally we need port parameter here and then shared parameter
+            arelements_def.SCPVA_SharedParameter(ctx, ctx.currentfolder, ctx.CurrentSWC_shortname,b) #ideally we need port parameter here and then shared parameter
             
         elif a == 'ExplicitInterRunnableVariable' and e == Currentrnbl:
             
-            arelements_def.IRVRA_ExplicitInterRunnableVariable(b, currentfolder, CurrentSWC_shortname )
+            arelements_def.IRVRA_ExplicitInterRunnableVariable(ctx, b, ctx.currentfolder, ctx.CurrentSWC_shortname )
             
         elif a == 'ImplicitInterRunnableVariables'and e == Currentrnbl:
             
-            arelements_def.IRVRA_ImplicitInterRunnableVariable(b, currentfolder, CurrentSWC_shortname)
+            arelements_def.IRVRA_ImplicitInterRunnableVariable(ctx, b, ctx.currentfolder, ctx.CurrentSWC_shortname)
 
         else :
-            print(f"Invalid {a} for IRV access")
+            logging.warning(f"Invalid {a} for IRV access")
     
     # Fetch filtered data from read_write_access() for ReceiverPort and SenderPort
-    receiver_port_data = read_write_access("ReceiverPort", Currentrnbl)
+    receiver_port_data = read_write_access(ctx, "ReceiverPort", Currentrnbl)
     
-    sender_port_data = read_write_access("SenderPort", Currentrnbl)
+    sender_port_data = read_write_access(ctx, "SenderPort", Currentrnbl)
     
     
+    # VARIABLE-ACCESS rows per access argument, each argument is emitted in one call to its container
+    variable_accesses = defaultdict(list)
+
     # Iterate over filtered data for ReceiverPort
     for _, port_name, interface_type, interface_name, data_element, argument in receiver_port_data:
        
-        if interface_type == "SenderReceiverInterface" :
-           
-            if argument == "dra":
-                
-                arelements_def.DRA_RPort_SR_DataElement(currentfolder, CurrentSWC_shortname, port_name, interface_name, data_element)
-            elif argument == "drpa":
-                
-                arelements_def.DRPA_RPort_SR_DataElement(currentfolder, CurrentSWC_shortname, port_name, interface_name, data_element)
-            elif argument == "drpv":
-                
-                arelements_def.DRPV_RPort_SR_DataElement(currentfolder, CurrentSWC_shortname, port_name, interface_name, data_element)
-            else :
-                print(f" Invalid {interface_type} for data access dra, drpa and drpv")
-        
-        elif interface_type == "NvDataInterface":
+        if interface_type in ("SenderReceiverInterface", "NvDataInterface"):
            
-            if argument == "dra":
+            if argument in ("dra", "drpa", "drpv"):
                 
-                arelements_def.DRA_RPort_nvd_NvData(currentfolder, CurrentSWC_shortname, port_name, interface_name, data_element)
-            elif argument == "drpa":
-                
-                arelements_def.DRPA_RPort_nvd_NvData(currentfolder, CurrentSWC_shortname, port_name, interface_name, data_element)
-            elif argument == "drpv":
-                
-                arelements_def.DRPV_RPort_nvd_NvData(currentfolder, CurrentSWC_shortname, port_name, interface_name, data_element)
+                folder = "SenderReceiver" if interface_type == "SenderReceiverInterface" else "NvData"
+                variable_accesses[argument].append((port_name, folder, interface_name, data_element))
             else :
-                print(f" Invalid {interface_type} for data access dra, drpa and drpv")
+                logging.warning(f"Invalid {interface_type} for data access dra, drpa and drpv")
 
         elif interface_type == "ParameterInterface":
             
-            arelements_def.CPA_RPort_prm_Parameter(currentfolder, CurrentSWC_shortname, port_name, interface_name, data_element)
+            arelements_def.CPA_RPort_prm_Parameter(ctx, ctx.currentfolder, ctx.CurrentSWC_shortname, port_name, interface_name, data_element)
         
         elif interface_type == "ClientServerInterface":
             
-            arelements_def.SSCP_RPort_CS_Operation(currentfolder, CurrentSWC_shortname, port_name, interface_name, data_element)
+            arelements_def.SSCP_RPort_CS_Operation(ctx, ctx.currentfolder, ctx.CurrentSWC_shortname, port_name, interface_name, data_element)
         
         else :
-            print(f" Invalid {interface_type} and port type for data access")
+            logging.warning(f"Invalid {interface_type} and port type for data access")
 
     # Iterate over filtered data for SenderPort
     for _, port_name, interface_type, interface_name, data_element, argument in sender_port_data:
         
-        if interface_type == "SenderReceiverInterface" :
-
-            if argument == "dsp":
-                
-                arelements_def.DSP_PPort_SR_DataElement(currentfolder, CurrentSWC_shortname, port_name, interface_name, data_element)
-            elif argument == "dwa":
-                
-                arelements_def.DWA_PPort_SR_DataElement(currentfolder, CurrentSWC_shortname, port_name, interface_name, data_element)
-            else :
-                print(f" Invalid {interface_type} for data access dsp,dwa")       
-        
-        elif interface_type == "NvDataInterface":
+        if interface_type in ("SenderReceiverInterface", "NvDataInterface"):
 
-            if argument == "dsp":
-                
-                arelements_def.DSP_PPort_SR_DataElement(currentfolder, CurrentSWC_shortname, port_name, interface_name, data_element)
-            elif argument == "dwa":
+            if argument in ("dsp", "dwa"):
                 
-                arelements_def.DWA_PPort_SR_DataElement(currentfolder, CurrentSWC_shortname, port_name, interface_name, data_element)
+                variable_accesses[argument].append((port_name, "SenderReceiver", interface_name, data_element))
             else :
-                print(f" Invalid {interface_type} for data access dsp,dwa")       
+                logging.warning(f"Invalid {interface_type} for data access dsp,dwa")
         
         elif interface_type == "ModeSwitchInterface":
             
-            arelements_def.MSP_PPort_msi_ModeGroup(currentfolder, CurrentSWC_shortname, port_name, interface_name, data_element)
+            arelements_def.MSP_PPort_msi_ModeGroup(ctx, ctx.currentfolder, ctx.CurrentSWC_shortname, port_name, interface_name, data_element)
         
         else :
-            print(f" Invalid {interface_type} and port type for data access")
+            logging.warning(f"Invalid {interface_type} and port type for data access")
 
-def rnblaccess_WrittenIRV (Currentrnbl):
+    for argument, rows in variable_accesses.items():
+        arelements_def.variable_accesses(ctx, argument, ctx.currentfolder, ctx.CurrentSWC_shortname, rows)
 
-    IBVariableType, IBVariableName, ApplicationDataTypeName, Initvalue, AccessingRunnable = excel_reader.read_columns(ib_data, 'B', 'F')
+def rnblaccess_WrittenIRV (ctx, Currentrnbl):
+
+    IBVariableType, IBVariableName, ApplicationDataTypeName, Initvalue, AccessingRunnable = excel_reader.read_columns(ctx.ib_data_sheet, 'B', 'F')
 
     if any(x in ["ImplicitInterRunnableVariables", "ExplicitInterRunnableVariable"] for x in IBVariableType): #still read or write bifurcation is pending
     
-        arelements_def.IRVWA()
+        arelements_def.IRVWA(ctx)
 
         for a,b,c,d,e in zip(IBVariableType, IBVariableName, ApplicationDataTypeName,Initvalue, AccessingRunnable):
             if a == 'ExplicitInterRunnableVariable' and e == Currentrnbl:
                 
-                arelements_def.IRVWA_ExplicitInterRunnableVariable(b, currentfolder, CurrentSWC_shortname )
+                arelements_def.IRVWA_ExplicitInterRunnableVariable(ctx, b, ctx.currentfolder, ctx.CurrentSWC_shortname )
                 
             elif a == 'ImplicitInterRunnableVariables'and e == Currentrnbl:
                 
-                arelements_def.IRVWA_ImplicitInterRunnableVariable(b, currentfolder, CurrentSWC_shortname)
+                arelements_def.IRVWA_ImplicitInterRunnableVariable(ctx, b, ctx.currentfolder, ctx.CurrentSWC_shortname)
 
             else :
-                print(f" Invalid {a} for IRV access")
+                logging.warning(f"Invalid {a} for IRV access")
 
-def read_write_access(port_type_filter, Currentrnbl):
+def read_write_access(ctx, port_type_filter, Currentrnbl):
 
    # Read required columns from Excel
-   port_type_col, port_name_col, interface_type_col, interface_name_col, data_element_col, argument_col, _, accessing_rnbl_col = excel_reader.read_columns(ports, 'B', 'I')
+   port_type_col, port_name_col, interface_type_col, interface_name_col, data_element_col, argument_col, _, accessing_rnbl_col = excel_reader.read_columns(ctx.ports_sheet, 'B', 'I')
 
 
-   # Ensure all columns are lists and flatten them if necessary
-   def flatten(lst):
-       return [item for sublist in lst for item in sublist] if any(isinstance(i, list) for i in lst) else lst
    def fill_merged_cells(lst):
        """Fills down values in case of merged cells (None or empty values)."""
        filled_list = []
@@ -4389,14 +681,14 @@ def read_write_access(port_type_filter, Currentrnbl):
 #               # ####################### =============== %%%%%%%%% ++++++++++++ ---------- __________ SECTION :  ports __________ ----------  ++++++++++++ %%%%%%%%% =============== ####################### #               #
 #----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 
-def Createports():
+def Createports(ctx):
 
     
-    arelements_def.create_ports(swc_type)
+    arelements_def.create_ports(ctx)
 
 
     # Read the port types and names from the specified columns in the ports data
-    PortType, PortName, IfType, IfName = excel_reader.read_columns(ports, 'B', 'E')
+    PortType, PortName, IfType, IfName = excel_reader.read_columns(ctx.ports_sheet, 'B', 'E')
     
     # Iterate over the port names and their corresponding types
     for port_name, port_type, if_type, if_name in zip(PortName, PortType, IfType, IfName):
@@ -4405,66 +697,63 @@ def Createports():
             # Add a new Receiver Port Prototype to the current SWC with the given port name
 
             if if_type == 'SenderReceiverInterface':
-                arelements_def.RPort_SR(port_name,if_name)
+                arelements_def.RPort_SR(ctx, port_name,if_name)
 
             elif if_type == 'ClientServerInterface':
-                arelements_def.RPort_CS(port_name,if_name)
+                arelements_def.RPort_CS(ctx, port_name,if_name)
 
             elif if_type == 'ModeSwitchInterface':
-                arelements_def.RPort_msi(port_name,if_name)
+                arelements_def.RPort_msi(ctx, port_name,if_name)
 
             elif if_type == 'NvDataInterface':
-                arelements_def.RPort_nvd(port_name,if_name)
+                arelements_def.RPort_nvd(ctx, port_name,if_name)
 
             elif if_type == 'ParameterInterface':
-                arelements_def.RPort_prm(port_name,if_name)
+                arelements_def.RPort_prm(ctx, port_name,if_name)
             
             elif if_type == 'TriggerInterface':
-                arelements_def.RPort_trigger(port_name,if_name)
+                arelements_def.RPort_trigger(ctx, port_name,if_name)
 
             else:
                 # Print a message if the port type is unknown
-                print(f"Unknown interface type: {if_type} for interface {if_name}")
+                logging.warning(f"Unknown interface type: {if_type} for interface {if_name}")
 
 
         # Check if the port type is 'SenderPort'
         elif port_type == 'SenderPort':
             # Add a new Sender Port Prototype to the current SWC with the given port name
             if if_type == 'SenderReceiverInterface':
-                arelements_def.PPort_SR(port_name,if_name)
+                arelements_def.PPort_SR(ctx, port_name,if_name)
 
             elif if_type == 'ClientServerInterface':
-                arelements_def.PPort_CS(port_name,if_name)
+                arelements_def.PPort_CS(ctx, port_name,if_name)
 
             elif if_type == 'ModeSwitchInterface':
-                arelements_def.PPort_msi(port_name,if_name)
+                arelements_def.PPort_msi(ctx, port_name,if_name)
 
             elif if_type == 'NvDataInterface':
-                arelements_def.PPort_nvd(port_name,if_name)
+                arelements_def.PPort_nvd(ctx, port_name,if_name)
 
             else:
                 # Print a message if the port type is unknown
-                print(f"Unknown interface type: {if_type} for interface {if_name}")
+                logging.warning(f"Unknown interface type: {if_type} for interface {if_name}")
 
         else:
             # Print a message if the port type is unknown
-            print(f"Unknown port type: {port_type} for port {port_name}")
+            logging.warning(f"Unknown port type: {port_type} for port {port_name}")
 
 #----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #               # ####################### =============== %%%%%%%%% ++++++++++++ ---------- __________ SECTION :  interfaces __________ ----------  ++++++++++++ %%%%%%%%% =============== ####################### #               #
 #----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 
-ApplicationDataTypeName, ApplicationDataTypeCategory, CompuMethodName, CompuMethodCategory, CompuScaleOROffset, EnumStatesORLSB, Unit, DataConstraintName = excel_reader.read_columns(adt_primitive, 'B', 'I')
-
-
-def createSharedInterfaces():
+def createSharedInterfaces(ctx):
    """
    Creates shared interfaces based on data from an Excel sheet.
    This function reads from an Excel sheet, groups interfaces by type,
    and creates instances of corresponding interface classes.
    """
    # Read the columns from Excel
-   if_type_col, IF_name_col, DE_col, Argument_col, ADt = excel_reader.read_columns(ports, 'D', 'H')
+   if_type_col, IF_name_col, DE_col, Argument_col, ADt = excel_reader.read_columns(ctx.sheets['ports'], 'D', 'H')
 
    # Initialize a defaultdict to store interfaces by type
    interface_collections = defaultdict(list)
@@ -4533,11 +822,11 @@ def createSharedInterfaces():
            for interface in interfaces:
                try:
                    # Pass all required arguments
-                   creation_func(interface["name"], interface["data_elements"], interface["arguments"], interface["adts"])
+                   creation_func(ctx, interface["name"], interface["data_elements"], interface["arguments"], interface["adts"])
                except (TypeError, ValueError, KeyError) as e:
-                   print(f"Error creating {interface_type} {interface['name']}: {e}")
+                   logging.error(f"Error creating {interface_type} {interface['name']}: {e}")
 
-def SenderReceiverInterface(currentIF_name, DataElements, Arguments, current_Adt):
+def SenderReceiverInterface(ctx, currentIF_name, DataElements, Arguments, current_Adt):
     """
     Creates a SenderReceiverInterface object.
 
@@ -4551,22 +840,24 @@ def SenderReceiverInterface(currentIF_name, DataElements, Arguments, current_Adt
     """
     try:
         # Fetch folder elements for the interface
-        SenderReceiver_folder_elements = arxml_structure.get_variable('SenderReceiver_folder_elements')
+        SenderReceiver_folder_elements = ctx.structure.get_variable('SenderReceiver_folder_elements')
 
         # Define the interface using the fetched folder elements
-        arelements_def.SenderReceiverInterface(SenderReceiver_folder_elements, currentIF_name)
+        arelements_def.SenderReceiverInterface(ctx, SenderReceiver_folder_elements, currentIF_name)
 
         # Define the data elements for the interface
-        arelements_def.SenderReceiverInterface_DE()
+        arelements_def.SenderReceiverInterface_DE(ctx)
 
-        # Loop through data elements and their corresponding ADTs, and create VDPs
-        for itsDE, itsAdt in zip(DataElements, current_Adt):
-            arelements_def.SenderReceiverInterface_VDP(itsDE, itsAdt)
+        # Create the VDPs of all data elements with their corresponding ADTs in one call
+        arelements_def.emit_data_prototypes(
+            ctx, ctx.data_elements, 'VARIABLE-DATA-PROTOTYPE', arelements_def.APPLICATION_PRIMITIVE_TYPES_PATH, 'APPLICATION-PRIMITIVE-DATA-TYPE',
+            [(itsDE, itsAdt, None, 'READ-WRITE', 'STANDARD') for itsDE, itsAdt in zip(DataElements, current_Adt)],
+            init_value=False)
     
     except Exception as e:
-        print(f"Error creating SenderReceiverInterface for {currentIF_name}: {e}")
+        logging.error(f"Error creating SenderReceiverInterface for {currentIF_name}: {e}")
 
-def NvDataInterface(currentIF_name, DataElements, Arguments, current_Adt):
+def NvDataInterface(ctx, currentIF_name, DataElements, Arguments, current_Adt):
     """
     Creates a NvDataInterface object.
 
@@ -4580,22 +871,24 @@ def NvDataInterface(currentIF_name, DataElements, Arguments, current_Adt):
     """
     try:
         # Fetch folder elements for the interface
-        NvData_folder_elements = arxml_structure.get_variable('NvData_folder_elements')
+        NvData_folder_elements = ctx.structure.get_variable('NvData_folder_elements')
 
         # Define the interface using the fetched folder elements
-        arelements_def.NvDataInterface(NvData_folder_elements, currentIF_name)
+        arelements_def.NvDataInterface(ctx, NvData_folder_elements, currentIF_name)
 
         # Define the data elements for the interface
-        arelements_def.NvDataInterface_DE()
+        arelements_def.NvDataInterface_DE(ctx)
 
-        # Loop through data elements and their corresponding ADTs, and create VDPs
-        for itsDE, itsAdt in zip(DataElements, current_Adt):
-            arelements_def.NvDataInterface_VDP(itsDE, itsAdt)
+        # Create the VDPs of all data elements with their corresponding ADTs in one call
+        arelements_def.emit_data_prototypes(
+            ctx, ctx.nv_datas, 'VARIABLE-DATA-PROTOTYPE', arelements_def.APPLICATION_PRIMITIVE_TYPES_PATH, 'APPLICATION-PRIMITIVE-DATA-TYPE',
+            [(itsDE, itsAdt, None, 'READ-WRITE', 'STANDARD') for itsDE, itsAdt in zip(DataElements, current_Adt)],
+            init_value=False)
     
     except Exception as e:
-        print(f"Error creating NvDataInterface for {currentIF_name}: {e}")
+        logging.error(f"Error creating NvDataInterface for {currentIF_name}: {e}")
 
-def ParameterInterface(currentIF_name, DataElements, Arguments, current_Adt):
+def ParameterInterface(ctx, currentIF_name, DataElements, Arguments, current_Adt):
     """
     Creates a ParameterInterface object.
 
@@ -4609,22 +902,24 @@ def ParameterInterface(currentIF_name, DataElements, Arguments, current_Adt):
     """
     try:
         # Fetch folder elements for the interface
-        Parameter_folder_elements = arxml_structure.get_variable('Parameter_folder_elements')
+        Parameter_folder_elements = ctx.structure.get_variable('Parameter_folder_elements')
 
         # Define the interface using the fetched folder elements
-        arelements_def.ParameterInterface(Parameter_folder_elements, currentIF_name)
+        arelements_def.ParameterInterface(ctx, Parameter_folder_elements, currentIF_name)
 
         # Define the data elements for the interface
-        arelements_def.ParameterInterface_DE()
+        arelements_def.ParameterInterface_DE(ctx)
 
-        # Loop through data elements and their corresponding ADTs, and create VDPs
-        for itsDE, itsAdt in zip(DataElements, current_Adt):
-            arelements_def.ParameterInterface_VDP(itsDE, itsAdt)
+        # Create the VDPs of all data elements with their corresponding ADTs in one call
+        arelements_def.emit_data_prototypes(
+            ctx, ctx.parameters, 'PARAMETER-DATA-PROTOTYPE', arelements_def.APPLICATION_PRIMITIVE_TYPES_PATH, 'APPLICATION-PRIMITIVE-DATA-TYPE',
+            [(itsDE, itsAdt, None, 'READ-WRITE', 'STANDARD') for itsDE, itsAdt in zip(DataElements, current_Adt)],
+            init_value=False)
     
     except Exception as e:
-        print(f"Error creating ParameterInterface for {currentIF_name}: {e}")
+        logging.error(f"Error creating ParameterInterface for {currentIF_name}: {e}")
 
-def ModeSwitchInterface(currentIF_name, DataElements, Arguments, current_Adt):
+def ModeSwitchInterface(ctx, currentIF_name, DataElements, Arguments, current_Adt):
     """
     Creates a ModeSwitchInterface object.
 
@@ -4645,22 +940,22 @@ def ModeSwitchInterface(currentIF_name, DataElements, Arguments, current_Adt):
 
     try:
         # Fetch folder elements for the interface
-        ModeSwitch_folder_elements = arxml_structure.get_variable('ModeSwitch_folder_elements')
+        ModeSwitch_folder_elements = ctx.structure.get_variable('ModeSwitch_folder_elements')
 
         # Define the interface using the fetched folder elements
-        arelements_def.ModeDeclarationGroup(ModeSwitch_folder_elements, ModeDeclarationGroup_shortname, mode_Category,Init_Mode)
+        arelements_def.ModeDeclarationGroup(ctx, ModeSwitch_folder_elements, ModeDeclarationGroup_shortname, mode_Category,Init_Mode)
 
         # Loop through data elements and their corresponding ADTs, and create VDPs
         for ModeDeclaration_shortname in Arguments :
-            arelements_def.ModeDeclarationGroup_Exp(ModeDeclaration_shortname)
+            arelements_def.ModeDeclarationGroup_Exp(ctx, ModeDeclaration_shortname)
 
         # Define the data elements for the interface
-        arelements_def.ModeSwitchInterface(ModeSwitch_folder_elements, currentIF_name, ModeDeclarationGroup_shortname)
+        arelements_def.ModeSwitchInterface(ctx, ModeSwitch_folder_elements, currentIF_name, ModeDeclarationGroup_shortname)
     
     except Exception as e:
-        print(f"Error creating ModeSwitchInterface for {currentIF_name}: {e}")
+        logging.error(f"Error creating ModeSwitchInterface for {currentIF_name}: {e}")
 
-def ClientServerInterface(currentIF_name, DataElements, Arguments, current_Adt):
+def ClientServerInterface(ctx, currentIF_name, DataElements, Arguments, current_Adt):
     """
     Creates a ClientServerInterface object.
 
@@ -4675,23 +970,23 @@ def ClientServerInterface(currentIF_name, DataElements, Arguments, current_Adt):
 
     try:
         # Fetch folder elements for the interface
-        ClientServer_folder_elements = arxml_structure.get_variable('ClientServer_folder_elements')
+        ClientServer_folder_elements = ctx.structure.get_variable('ClientServer_folder_elements')
         # Define the interface
-        arelements_def.ClientServerInterface(ClientServer_folder_elements, currentIF_name)
-        arelements_def.ClientServerInterface_Opr()
+        arelements_def.ClientServerInterface(ctx, ClientServer_folder_elements, currentIF_name)
+        arelements_def.ClientServerInterface_Opr(ctx)
         # Sort the data based on Operation_shortname to ensure correct grouping
         sorted_data = sorted(zip(DataElements, Arguments, current_Adt), key=lambda x: x[0])
         # Group by `Operation_shortname`
         for Operation_shortname, group in groupby(sorted_data, key=lambda x: x[0]):
-            arelements_def.ClientServerInterface_CSOpr(Operation_shortname)  # Called once per operation
-            arelements_def.ClientServerInterface_Args()  # Called once per operation
+            arelements_def.ClientServerInterface_CSOpr(ctx, Operation_shortname)  # Called once per operation
+            arelements_def.ClientServerInterface_Args(ctx)  # Called once per operation
             # Iterate over all `itsArg` and `itsAdt` associated with the same `Operation_shortname`
             for _, itsArg, itsAdt in group:
-                arelements_def.ClientServerInterface_Arg(itsArg, itsAdt)  # Called for each argument
+                arelements_def.ClientServerInterface_Arg(ctx, itsArg, itsAdt)  # Called for each argument
     except Exception as e:
-        print(f"Error creating ClientServerInterface for {currentIF_name}: {e}")
+        logging.error(f"Error creating ClientServerInterface for {currentIF_name}: {e}")
 
-def TriggerInterface(currentIF_name, DataElements, Arguments, current_Adt):
+def TriggerInterface(ctx, currentIF_name, DataElements, Arguments, current_Adt):
     """
     Creates a TriggerInterface object.
 
@@ -4705,102 +1000,102 @@ def TriggerInterface(currentIF_name, DataElements, Arguments, current_Adt):
     """
     try:
         # Fetch folder elements for the interface
-        Trigger_folder_elements = arxml_structure.get_variable('Trigger_folder_elements')
+        Trigger_folder_elements = ctx.structure.get_variable('Trigger_folder_elements')
 
         # Define the interface using the fetched folder elements
-        arelements_def.TriggerInterface(Trigger_folder_elements, currentIF_name)
+        arelements_def.TriggerInterface(ctx, Trigger_folder_elements, currentIF_name)
 
-        arelements_def.TriggerInterface_trigs()
+        arelements_def.TriggerInterface_trigs(ctx)
 
         arg_iter = iter(Arguments)  # Create an iterator for Arguments
         for trigger_shortname in DataElements[::2]:  # Pick every alternate trigger_shortname
             cse_code = next(arg_iter, None)  # Get the first argument value
             cse_code_factor = next(arg_iter, None)  # Get the second argument value
             if cse_code is not None and cse_code_factor is not None:
-                arelements_def.TriggerInterface_trig(trigger_shortname, cse_code, cse_code_factor)
+                arelements_def.TriggerInterface_trig(ctx, trigger_shortname, cse_code, cse_code_factor)
     
     except Exception as e:
-        print(f"Error creating TriggerInterface for {currentIF_name}: {e}")
+        logging.error(f"Error creating TriggerInterface for {currentIF_name}: {e}")
 
 
 #----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #               # ####################### =============== %%%%%%%%% ++++++++++++ ---------- __________ SECTION :  compu method __________ ----------  ++++++++++++ %%%%%%%%% =============== ####################### #               #
 #----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 
-def handle_identical(currentcompumethod, NA, NA1, Current_Unit):
+def handle_identical(ctx, currentcompumethod, NA, NA1, Current_Unit):
    if NA is None or NA == "":
-       print("CompuMethodInfo is not applicable for IDENTICAL category.")
+       logging.info("CompuMethodInfo is not applicable for IDENTICAL category.")
    if NA1 is None or NA1 == "":
-       print("CompuMethodInfo is not applicable for IDENTICAL category.")
+       logging.info("CompuMethodInfo is not applicable for IDENTICAL category.")
    if Current_Unit is None or Current_Unit == "":
-       print("Unit is not applicable for IDENTICAL category.")
-   arelements_def.CompuMethod_IDENTICAL(CompuMethods_shared_folder_elements, currentcompumethod, Current_Unit)
+       logging.info("Unit is not applicable for IDENTICAL category.")
+   arelements_def.CompuMethod_IDENTICAL(ctx, ctx.CompuMethods_shared_folder_elements, currentcompumethod, Current_Unit)
 
-def handle_texttable(currentcompumethod, Compu_Scale, Enum_States, Current_Unit):
+def handle_texttable(ctx, currentcompumethod, Compu_Scale, Enum_States, Current_Unit):
 
     # Check if Compu_Scale is None or an empty string
     if Compu_Scale is None or Compu_Scale == "":
-        print("CompuMethodInfo is not applicable for TEXTTABLE category.")
+        logging.info("CompuMethodInfo is not applicable for TEXTTABLE category.")
     # Check if Enum_States is None or an empty string
     if Enum_States is None or Enum_States == "":
-        print("CompuMethodInfo is not applicable for TEXTTABLE category.")
+        logging.info("CompuMethodInfo is not applicable for TEXTTABLE category.")
     # Check if Current_Unit is None or an empty string
     if Current_Unit is None or Current_Unit == "":
-        print("Unit is not applicable for TEXTTABLE category.")
+        logging.info("Unit is not applicable for TEXTTABLE category.")
 
  
-    arelements_def.CompuMethod_text(CompuMethods_shared_folder_elements, currentcompumethod, Current_Unit)
+    arelements_def.CompuMethod_text(ctx, ctx.CompuMethods_shared_folder_elements, currentcompumethod, Current_Unit)
 
 
     # Iterate over Compu_Scale and Enum_States to call the function for each pair
     for scale, state in zip(Compu_Scale, Enum_States):
-        arelements_def.text_compu_Scale(scale, state)
+        arelements_def.text_compu_Scale(ctx, scale, state)
 
     # Set default value if it's not already set
     defaultValue = '0' 
     if defaultValue is not None :
-        arelements_def.text_compu_DefaultValue(defaultValue)
+        arelements_def.text_compu_DefaultValue(ctx, defaultValue)
 
-def handle_linear(currentcompumethod, CompuScaleOROffset, EnumStatesORLSB, Current_Unit):
+def handle_linear(ctx, currentcompumethod, CompuScaleOROffset, EnumStatesORLSB, Current_Unit):
 
     if CompuScaleOROffset is None or CompuScaleOROffset == "":
-        print("CompuMethodInfo is not applicable for LINEAR category.")
+        logging.info("CompuMethodInfo is not applicable for LINEAR category.")
     if EnumStatesORLSB is None or EnumStatesORLSB == "":
-        print("CompuMethodInfo is not applicable for LINEAR category.")        
+        logging.info("CompuMethodInfo is not applicable for LINEAR category.")
     if Current_Unit is None or Current_Unit == "":
-        print("Unit is not applicable for LINEAR category.")
+        logging.info("Unit is not applicable for LINEAR category.")
 
-    arelements_def.CompuMethod_linear(CompuMethods_shared_folder_elements, currentcompumethod, Current_Unit)
+    arelements_def.CompuMethod_linear(ctx, ctx.CompuMethods_shared_folder_elements, currentcompumethod, Current_Unit)
 
     num_a = CompuScaleOROffset[0]
     num_b = CompuScaleOROffset[1]
     den_a = EnumStatesORLSB[0]
 
-    arelements_def.linear_compu_scale(num_a,num_b,den_a)
+    arelements_def.linear_compu_scale(ctx, num_a,num_b,den_a)
 
-def handle_scale_linear(compu_method_info, unit):
+def handle_scale_linear(ctx, compu_method_info, unit):
    # function def not available in arelement def
    if compu_method_info is None or compu_method_info == "":
-       print("CompuMethodInfo is not applicable for SCALE_LINEAR category.")
+       logging.info("CompuMethodInfo is not applicable for SCALE_LINEAR category.")
    if unit is None or unit == "":
-       print("Unit is not applicable for SCALE_LINEAR category.")
+       logging.info("Unit is not applicable for SCALE_LINEAR category.")
 
-def handle_scale_linear_and_texttable(compu_method_info, unit):
+def handle_scale_linear_and_texttable(ctx, compu_method_info, unit):
    if compu_method_info is None or compu_method_info == "":
-       print("CompuMethodInfo is not applicable for SCALE_LINEAR_AND_TEXTTABLE category.")
+       logging.info("CompuMethodInfo is not applicable for SCALE_LINEAR_AND_TEXTTABLE category.")
    if unit is None or unit == "":
-       print("Unit is not applicable for SCALE_LINEAR_AND_TEXTTABLE category.")
+       logging.info("Unit is not applicable for SCALE_LINEAR_AND_TEXTTABLE category.")
 
-def handle_rat_func(currentcompumethod, CompuScaleOROffset, EnumStatesORLSB, Current_Unit):
+def handle_rat_func(ctx, currentcompumethod, CompuScaleOROffset, EnumStatesORLSB, Current_Unit):
 
     if CompuScaleOROffset is None or CompuScaleOROffset == "":
-        print("CompuMethodInfo is not applicable for LINEAR category.")
+        logging.info("CompuMethodInfo is not applicable for LINEAR category.")
     if EnumStatesORLSB is None or EnumStatesORLSB == "":
-        print("CompuMethodInfo is not applicable for LINEAR category.")        
+        logging.info("CompuMethodInfo is not applicable for LINEAR category.")
     if Current_Unit is None or Current_Unit == "":
-        print("Unit is not applicable for LINEAR category.")
+        logging.info("Unit is not applicable for LINEAR category.")
 
-    arelements_def.CompuMethod_rat_func(CompuMethods_shared_folder_elements, currentcompumethod, Current_Unit)
+    arelements_def.CompuMethod_rat_func(ctx, ctx.CompuMethods_shared_folder_elements, currentcompumethod, Current_Unit)
 
     num_a = CompuScaleOROffset[0]
     num_b = CompuScaleOROffset[1]
@@ -4809,18 +1104,18 @@ def handle_rat_func(currentcompumethod, CompuScaleOROffset, EnumStatesORLSB, Cur
     den_b = EnumStatesORLSB[1]
     den_c = EnumStatesORLSB[2]
 
-    arelements_def.rat_func_compu_scale(num_a,num_b,num_c,den_a,den_b,den_c)
+    arelements_def.rat_func_compu_scale(ctx, num_a,num_b,num_c,den_a,den_b,den_c)
 
-def handle_scale_rat_func(currentcompumethod, CompuScaleOROffset, EnumStatesORLSB, Current_Unit):
+def handle_scale_rat_func(ctx, currentcompumethod, CompuScaleOROffset, EnumStatesORLSB, Current_Unit):
 
     if CompuScaleOROffset is None or CompuScaleOROffset == "":
-        print("CompuMethodInfo is not applicable for LINEAR category.")
+        logging.info("CompuMethodInfo is not applicable for LINEAR category.")
     if EnumStatesORLSB is None or EnumStatesORLSB == "":
-        print("CompuMethodInfo is not applicable for LINEAR category.")        
+        logging.info("CompuMethodInfo is not applicable for LINEAR category.")
     if Current_Unit is None or Current_Unit == "":
-        print("Unit is not applicable for LINEAR category.")
+        logging.info("Unit is not applicable for LINEAR category.")
 
-    arelements_def.CompuMethod_Scale_rat_text(CompuMethods_shared_folder_elements, currentcompumethod, Current_Unit)
+    arelements_def.CompuMethod_Scale_rat_text(ctx, ctx.CompuMethods_shared_folder_elements, currentcompumethod, Current_Unit)
 
     ll = CompuScaleOROffset[0]
     num_a = CompuScaleOROffset[1]
@@ -4831,60 +1126,59 @@ def handle_scale_rat_func(currentcompumethod, CompuScaleOROffset, EnumStatesORLS
     den_b = EnumStatesORLSB[2]
     den_c = EnumStatesORLSB[3]
 
-    arelements_def.Scale_rat_text_compu_scale(ll,ul,num_a,num_b,num_c,den_a,den_b,den_c)
+    arelements_def.Scale_rat_text_compu_scale(ctx, ll,ul,num_a,num_b,num_c,den_a,den_b,den_c)
 
     # Set default value if it's not already set
     defaultValue = '0' 
     if defaultValue is not None :
-        arelements_def.Scale_rat_text_compu_default_value(defaultValue)
+        arelements_def.Scale_rat_text_compu_default_value(ctx, defaultValue)
 
-def handle_scale_rational_and_texttable(compu_method_info, unit):
+def handle_scale_rational_and_texttable(ctx, compu_method_info, unit):
    if compu_method_info is None or compu_method_info == "":
-       print("CompuMethodInfo is not applicable for SCALE_RATIONAL_AND_TEXTTABLE category.")
+       logging.info("CompuMethodInfo is not applicable for SCALE_RATIONAL_AND_TEXTTABLE category.")
    if unit is None or unit == "":
-       print("Unit is not applicable for SCALE_RATIONAL_AND_TEXTTABLE category.")
+       logging.info("Unit is not applicable for SCALE_RATIONAL_AND_TEXTTABLE category.")
 
-def handle_tab_nointp(currentcompumethod, Compu_Scale, Enum_States, Current_Unit):
+def handle_tab_nointp(ctx, currentcompumethod, Compu_Scale, Enum_States, Current_Unit):
 
 
     # Check if Compu_Scale is None or an empty string
     if Compu_Scale is None or Compu_Scale == "":
-        print("CompuMethodInfo is not applicable for TEXTTABLE category.")
+        logging.info("CompuMethodInfo is not applicable for TEXTTABLE category.")
     # Check if Enum_States is None or an empty string
     if Enum_States is None or Enum_States == "":
-        print("CompuMethodInfo is not applicable for TEXTTABLE category.")
+        logging.info("CompuMethodInfo is not applicable for TEXTTABLE category.")
     # Check if Current_Unit is None or an empty string
     if Current_Unit is None or Current_Unit == "":
-        print("Unit is not applicable for TEXTTABLE category.")
+        logging.info("Unit is not applicable for TEXTTABLE category.")
 
  
-    arelements_def.CompuMethod_tab_nointp(CompuMethods_shared_folder_elements, currentcompumethod, Current_Unit)
+    arelements_def.CompuMethod_tab_nointp(ctx, ctx.CompuMethods_shared_folder_elements, currentcompumethod, Current_Unit)
 
     # CompuMethod_tab_nointp(CompuMethods_shared_folder_elements, compu_method_shortname, unit)
 
 
     # Iterate over Compu_Scale and Enum_States to call the function for each pair
     for scale, state in zip(Compu_Scale, Enum_States):
-        arelements_def.tab_nointp_compu_Scale(scale, state)
+        arelements_def.tab_nointp_compu_Scale(ctx, scale, state)
         # tab_nointp_compu_Scale(value, enum)
 
     # Set default value if it's not already set
     defaultValue = '0' 
     if defaultValue is not None :
-        arelements_def.tab_nointp_compu_Scale_DefaultValue(defaultValue)
+        arelements_def.tab_nointp_compu_Scale_DefaultValue(ctx, defaultValue)
 
-def handle_bitfield_texttable(compu_method_info, unit):
+def handle_bitfield_texttable(ctx, compu_method_info, unit):
    if compu_method_info is None or compu_method_info == "":
-       print("CompuMethodInfo is not applicable for BITFIELD_TEXTTABLE category.")
+       logging.info("CompuMethodInfo is not applicable for BITFIELD_TEXTTABLE category.")
    if unit is None or unit == "":
-       print("Unit is not applicable for BITFIELD_TEXTTABLE category.")
+       logging.info("Unit is not applicable for BITFIELD_TEXTTABLE category.")
 
-def createcompumethod():
-   global CompuMethods_shared_folder_elements
-   CompuMethods_shared_folder_elements = arxml_structure.get_variable('CompuMethods_shared_folder_elements')
+def createcompumethod(ctx):
+   ctx.CompuMethods_shared_folder_elements = ctx.structure.get_variable('CompuMethods_shared_folder_elements')
    # Read columns separately before zipping
    CompuMethodName, CompuMethodCategory, CompuScaleOROffset, EnumStatesORLSB, Unit = excel_reader.read_columns(
-       adt_primitive, 'D', 'H'
+       ctx.sheets['adt_primitive'], 'D', 'H'
    )
 
    # Dictionary to store collected data
@@ -4933,27 +1227,27 @@ def createcompumethod():
        unit = details["unit"]
        
        if category == "IDENTICAL":
-           handle_identical(method_name, compu_scale, enum_states, unit)
+           handle_identical(ctx, method_name, compu_scale, enum_states, unit)
        elif category == "TEXTTABLE":
-           handle_texttable(method_name, compu_scale, enum_states, unit)
+           handle_texttable(ctx, method_name, compu_scale, enum_states, unit)
        elif category == "LINEAR":
-           handle_linear(method_name, compu_scale, enum_states, unit)
+           handle_linear(ctx, method_name, compu_scale, enum_states, unit)
        elif category == "SCALE_LINEAR":
-           handle_scale_linear(method_name, compu_scale, enum_states, unit)
+           handle_scale_linear(ctx, method_name, compu_scale, enum_states, unit)
        elif category == "SCALE_LINEAR_AND_TEXTTABLE":
-           handle_scale_linear_and_texttable(method_name, compu_scale, enum_states, unit)
+           handle_scale_linear_and_texttable(ctx, method_name, compu_scale, enum_states, unit)
        elif category == "RAT_FUNC":
-           handle_rat_func(method_name, compu_scale, enum_states, unit)
+           handle_rat_func(ctx, method_name, compu_scale, enum_states, unit)
        elif category == "SCALE_RAT_FUNC":
-           handle_scale_rat_func(method_name, compu_scale, enum_states, unit)
+           handle_scale_rat_func(ctx, method_name, compu_scale, enum_states, unit)
        elif category == "SCALE_RATIONAL_AND_TEXTTABLE":
-           handle_scale_rational_and_texttable(method_name, compu_scale, enum_states, unit)
+           handle_scale_rational_and_texttable(ctx, method_name, compu_scale, enum_states, unit)
        elif category == "TAB_NOINTP":
-           handle_tab_nointp(method_name, compu_scale, enum_states, unit)
+           handle_tab_nointp(ctx, method_name, compu_scale, enum_states, unit)
        elif category == "BITFIELD_TEXTTABLE":
-           handle_bitfield_texttable(method_name, compu_scale, enum_states, unit)
+           handle_bitfield_texttable(ctx, method_name, compu_scale, enum_states, unit)
        else:
-           print(f"Warning: Invalid CompuMethod category '{category}' for method '{method_name}'")
+           logging.warning(f"Invalid CompuMethod category '{category}' for method '{method_name}'")
 
 
 
@@ -4961,12 +1255,12 @@ def createcompumethod():
 #               # ####################### =============== %%%%%%%%% ++++++++++++ ---------- __________ SECTION :  data constraint __________ ----------  ++++++++++++ %%%%%%%%% =============== ####################### #               #
 #----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 
-def createDC():
+def createDC(ctx):
     # Read columns from the adt_primitive data source
-    DataConstraintName, DataConstraintType, Min, Max = excel_reader.read_columns(adt_primitive, 'I', 'L')
+    DataConstraintName, DataConstraintType, Min, Max = excel_reader.read_columns(ctx.sheets['adt_primitive'], 'I', 'L')
     
     # Get the Data Constraints package from the shared elements
-    DataConstr_folder_elements = arxml_structure.get_variable('DataConstr_folder_elements')
+    DataConstr_folder_elements = ctx.structure.get_variable('DataConstr_folder_elements')
     
     # Iterate through the data constraints
     for a, b, c, d in zip(DataConstraintName, DataConstraintType, Min, Max):
@@ -4976,27 +1270,27 @@ def createDC():
         
         # Check if the constraint type is 'internalConstrs'
         if b == 'internalConstrs':
-            arelements_def.DataConstr_Int(DataConstr_folder_elements,a,lowerLimit,upperLimit)
+            arelements_def.DataConstr_Int(ctx, DataConstr_folder_elements,a,lowerLimit,upperLimit)
         
         # Check if the constraint type is 'physConstrs'
         elif b == 'physConstrs':
             # Create a new physical data constraint
-            arelements_def.DataConstr_phy(DataConstr_folder_elements,a,lowerLimit,upperLimit)
+            arelements_def.DataConstr_phy(ctx, DataConstr_folder_elements,a,lowerLimit,upperLimit)
         
         # If the constraint type is neither 'internalConstrs' nor 'physConstrs'
         else:
             if b is not None:
-                print(f"Value of b: {b}")  # Print the value of b for debugging purposes
+                logging.debug(f"Value of b: {b}")  # Log the value of b for debugging purposes
 
 #----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 #               # ####################### =============== %%%%%%%%% ++++++++++++ ---------- __________ SECTION :  ADT __________ ----------  ++++++++++++ %%%%%%%%% =============== ####################### #               #
 #----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 
-def createprimitive():
+def createprimitive(ctx):
    # Read columns from the adt_primitive data source
-   APDT_name, APDT_category, APDT_CMname, _, _, _, APDT_unit, APDT_DCname = excel_reader.read_columns(adt_primitive, 'B', 'I')
+   APDT_name, APDT_category, APDT_CMname, _, _, _, APDT_unit, APDT_DCname = excel_reader.read_columns(ctx.sheets['adt_primitive'], 'B', 'I')
    # Get the Data Constraints package from shared elements
-   Primitive_folder_elements = arxml_structure.get_variable('Primitive_folder_elements')
+   Primitive_folder_elements = ctx.structure.get_variable('Primitive_folder_elements')
    # Define category-function mapping for scalability
    category_mapping = {
        'Value': arelements_def.ApplicationPrimitiveDataType_Val,
@@ -5018,14 +1312,14 @@ def createprimitive():
        # Process based on category
        func = category_mapping.get(category)
        if func:
-           func(Primitive_folder_elements, name, cm_name, dc_name, unit)
+           func(ctx, Primitive_folder_elements, name, cm_name, dc_name, unit)
        else:
            config.logging.warning(f"Category '{category}' is not supported")
 
-def createcomposite():
+def createcomposite(ctx):
    """Creates composite data types (Record & Array) from Excel data."""
  
-   Composite_category, ARDT_ShortName, ARDT_element_shortname, ARDT_element_type, data_type = excel_reader.read_columns( adt_composite, 'B', 'F' )
+   Composite_category, ARDT_ShortName, ARDT_element_shortname, ARDT_element_type, data_type = excel_reader.read_columns( ctx.sheets['adt_composite'], 'B', 'F' )
 
    previous_category = None
    previous_shortname = None
@@ -5037,16 +1331,16 @@ def createcomposite():
 
            if previous_category == 'RECORD' and previous_shortname and previous_shortname != b:
 
-               Record_folder_elements = arxml_structure.get_variable('Record_folder_elements')
-               arelements_def.ApplicationRecordDataType(Record_folder_elements, previous_shortname)
+               Record_folder_elements = ctx.structure.get_variable('Record_folder_elements')
+               arelements_def.ApplicationRecordDataType(ctx, Record_folder_elements, previous_shortname)
 
                for elem in record_elements:
                    if len(elem) == 3:
                        elem_c, elem_d, elem_e = elem
                        
-                       arelements_def.ApplicationRecordDataType_elements(elem_c, elem_d, elem_e)
+                       arelements_def.ApplicationRecordDataType_elements(ctx, elem_c, elem_d, elem_e)
                    else:
-                       print(f"Skipping malformed record element: {elem}")  # If something is incorrect
+                       logging.warning(f"Skipping malformed record element: {elem}")  # If something is incorrect
                record_elements = []  
                
            previous_category = a
@@ -5056,33 +1350,33 @@ def createcomposite():
        # Handling ARRAY
        elif a == 'ARRAY':  
            
-           Array_folder_elements = arxml_structure.get_variable('Array_folder_elements')
+           Array_folder_elements = ctx.structure.get_variable('Array_folder_elements')
            if (b, c, d, e) not in record_elements:
                if d == 'VARIABLE':
   
-                   arelements_def.ApplicationArrayDataType_Variable(Array_folder_elements, b, e, c)
+                   arelements_def.ApplicationArrayDataType_Variable(ctx, Array_folder_elements, b, e, c)
                elif d == 'FIXED':
                  
-                   arelements_def.ApplicationArrayDataType_Fixed(Array_folder_elements, b, e, c)
+                   arelements_def.ApplicationArrayDataType_Fixed(ctx, Array_folder_elements, b, e, c)
                else:
-                   print(f"Invalid array category '{d}' for '{b}'. Expected 'VARIABLE' or 'FIXED'.")
+                   logging.warning(f"Invalid array category '{d}' for '{b}'. Expected 'VARIABLE' or 'FIXED'.")
                record_elements.append((b, c, d, e))
                
            else:
-               print("Skipping duplicate ARRAY row.")
+               logging.warning("Skipping duplicate ARRAY row.")
    # Finalizing the last RECORD
    if previous_category == 'RECORD' and previous_shortname:
 
-       Record_folder_elements = arxml_structure.get_variable('Record_folder_elements')
-       arelements_def.ApplicationRecordDataType(Record_folder_elements, previous_shortname)
+       Record_folder_elements = ctx.structure.get_variable('Record_folder_elements')
+       arelements_def.ApplicationRecordDataType(ctx, Record_folder_elements, previous_shortname)
 
        for elem in record_elements:
            if len(elem) == 3:
                elem_c, elem_d, elem_e = elem
                
-               arelements_def.ApplicationRecordDataType_elements(elem_c, elem_d, elem_e)
+               arelements_def.ApplicationRecordDataType_elements(ctx, elem_c, elem_d, elem_e)
            else:
-               print(f"Skipping malformed record element: {elem}")
+               logging.warning(f"Skipping malformed record element: {elem}")
 
 
 
@@ -5090,12 +1384,12 @@ def createcomposite():
 #               # ####################### =============== %%%%%%%%% ++++++++++++ ---------- __________ SECTION :  IDT __________ ----------  ++++++++++++ %%%%%%%%% =============== ####################### #               #
 #----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 
-def createcustomIDT():
+def createcustomIDT(ctx):
    # Get the Data Constraints package from shared elements
-   ImplementationDataTypes_folder_elements = arxml_structure.get_variable('ImplementationDataTypes_folder_elements')
+   ImplementationDataTypes_folder_elements = ctx.structure.get_variable('ImplementationDataTypes_folder_elements')
 
    # Read columns: type, shortname, arraysize/idtelementshortname, IDT
-   IDT_type, IDT_shortname, IRDT_element_shortname, data_type = excel_reader.read_columns(idt, 'B', 'E')
+   IDT_type, IDT_shortname, IRDT_element_shortname, data_type = excel_reader.read_columns(ctx.sheets['idt'], 'B', 'E')
 
    record_shortname = None
    record_elements = []
@@ -5109,63 +1403,63 @@ def createcustomIDT():
            # Process any pending RECORD before handling ARRAY_FIXED
            if record_shortname:
                
-               arelements_def.ImplementationDataType_Structure(ImplementationDataTypes_folder_elements, record_shortname)
+               arelements_def.ImplementationDataType_Structure(ctx, ImplementationDataTypes_folder_elements, record_shortname)
                for element_shortname, element_data_type in record_elements:
                    
-                   arelements_def.ImplementationDataType_Record_elements(element_shortname, element_data_type)
+                   arelements_def.ImplementationDataType_Record_elements(ctx, element_shortname, element_data_type)
                record_shortname = None
                record_elements.clear()
            
-           arelements_def.ImplementationDataType_ArrayFixed(ImplementationDataTypes_folder_elements,
+           arelements_def.ImplementationDataType_ArrayFixed(ctx, ImplementationDataTypes_folder_elements,
                                                              idt_shortname, idt_element_shortname, idt_data_type)
        elif idt_type == 'ARRAY_VARIABLE':
            # Process any pending RECORD before handling ARRAY_VARIABLE
            if record_shortname:
                
-               arelements_def.ImplementationDataType_Structure(ImplementationDataTypes_folder_elements, record_shortname)
+               arelements_def.ImplementationDataType_Structure(ctx, ImplementationDataTypes_folder_elements, record_shortname)
                for element_shortname, element_data_type in record_elements:
                    
-                   arelements_def.ImplementationDataType_Record_elements(element_shortname, element_data_type)
+                   arelements_def.ImplementationDataType_Record_elements(ctx, element_shortname, element_data_type)
                record_shortname = None
                record_elements.clear()
            
-           arelements_def.ImplementationDataType_ArrayVariable(ImplementationDataTypes_folder_elements,
+           arelements_def.ImplementationDataType_ArrayVariable(ctx, ImplementationDataTypes_folder_elements,
                                                                 idt_shortname, idt_element_shortname, idt_data_type)
        elif idt_type == 'PRIMITIVE':
            # Process any pending RECORD before handling PRIMITIVE
            if record_shortname:
                
-               arelements_def.ImplementationDataType_Structure(ImplementationDataTypes_folder_elements, record_shortname)
+               arelements_def.ImplementationDataType_Structure(ctx, ImplementationDataTypes_folder_elements, record_shortname)
                for element_shortname, element_data_type in record_elements:
                    
-                   arelements_def.ImplementationDataType_Record_elements(element_shortname, element_data_type)
+                   arelements_def.ImplementationDataType_Record_elements(ctx, element_shortname, element_data_type)
                record_shortname = None
                record_elements.clear()
            
-           arelements_def.ImplementationDataType(ImplementationDataTypes_folder_elements,
+           arelements_def.ImplementationDataType(ctx, ImplementationDataTypes_folder_elements,
                                                  idt_shortname, idt_data_type)
        elif idt_type == 'RECORD':
            if record_shortname and idt_shortname != record_shortname:
                # If a new RECORD structure starts, process the previous one
                
-               arelements_def.ImplementationDataType_Structure(ImplementationDataTypes_folder_elements, record_shortname)
+               arelements_def.ImplementationDataType_Structure(ctx, ImplementationDataTypes_folder_elements, record_shortname)
                for element_shortname, element_data_type in record_elements:
                    
-                   arelements_def.ImplementationDataType_Record_elements(element_shortname, element_data_type)
+                   arelements_def.ImplementationDataType_Record_elements(ctx, element_shortname, element_data_type)
                record_elements.clear()
            record_shortname = idt_shortname
            record_elements.append((idt_element_shortname, idt_data_type))
            
        else:
-           print(f"[ERROR] Unknown IDT_type: {idt_type}")
+           logging.error(f"Unknown IDT_type: {idt_type}")
            raise ValueError(f"Unknown IDT_type: {idt_type}")
    # Process any remaining RECORD at the end of the loop
    if record_shortname and record_elements:
      
-       arelements_def.ImplementationDataType_Structure(ImplementationDataTypes_folder_elements, record_shortname)
+       arelements_def.ImplementationDataType_Structure(ctx, ImplementationDataTypes_folder_elements, record_shortname)
        for element_shortname, element_data_type in record_elements:
            
-           arelements_def.ImplementationDataType_Record_elements(element_shortname, element_data_type)
+           arelements_def.ImplementationDataType_Record_elements(ctx, element_shortname, element_data_type)
 
 
 
@@ -5178,39 +1472,336 @@ def createcustomIDT():
 #               # ####################### =============== %%%%%%%%% ++++++++++++ ---------- __________ SECTION :  main __________ ----------  ++++++++++++ %%%%%%%%% =============== ####################### #               #
 #----------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------#
 
-def Main():
+# Split mode: path of the shared library ARXML that receives the /AUTOSAR platform packages once per project.
+# The SWC output then only contains its own packages. None writes a single self-contained ARXML.
+platform_library_path = None
+
+# Check every generated reference against the generated element paths and report the unresolved ones
+check_references = True
+
+# Write every top-level package (AUTOSAR, SharedElements, SwComponentTypes, ...) to its own ARXML
+# next to the output, named <output>_<package>.arxml. A file is only rewritten if its content changed.
+split_packages = False
+
+# Top-level packages that get their own file in the split_packages mode even if they are empty
+SPLIT_PACKAGES = ('/AUTOSAR', '/SharedElements', '/SwComponentTypes', '/Systems')
+
+def package_output_paths(ctx, output_path):
+    """
+    Returns {top-level AR-PACKAGE: ARXML path} of the split_packages mode.
+    """
+    base, extension = os.path.splitext(output_path)
+    return {package: f"{base}_{package.findtext('SHORT-NAME')}{extension}"
+            for package in ctx.structure.root_folders}
+
+# Compressed output: None writes plain ARXML, 'gzip' writes <output>.gz and 'zip' writes <output name>.zip
+# holding the output, or with split_packages every package file. The index of the bundle is written
+# next to it as <bundle>.index.json.
+output_compression = None
+
+# Keep the content hashes of the written files in <output>.manifest.json, so an unchanged output
+# is recognized without reading it back. Outputs are only replaced if their content changed.
+output_manifest = True
+
+# Write only the platform elements (units, physical dimensions, platform types, ...) that are reachable
+# through *-REF/*-TREF from the generated content. Not applied with a platform library, which is shared.
+tree_shaking = False
+
+# Rebuild only the units whose workbook rows changed since the last run into the same output,
+# the other units are taken from the cache file next to the output (see incremental)
+incremental_regeneration = False
+
+# Workbook ranges (sheet, first column, last column) read by the shared generation steps
+SHARED_STEPS = (
+    (createcompumethod, (('adt_primitive', 'D', 'H'),)),     # Create computation methods
+    (createDC, (('adt_primitive', 'I', 'L'),)),              # Create data constraints
+    (createprimitive, (('adt_primitive', 'B', 'I'),)),
+    (createcomposite, (('adt_composite', 'B', 'F'),)),
+    (createcustomIDT, (('idt', 'B', 'E'),)),
+    (createSharedInterfaces, (('ports', 'D', 'H'),)),
+)
+
+# Ranges a component reads besides its own rows: the ADT and IDT names of its data type mapping set
+COMPONENT_SHARED_INPUTS = (
+    ('adt_primitive', 'B', 'B'), ('adt_primitive', 'M', 'M'),
+    ('adt_composite', 'B', 'B'), ('adt_composite', 'I', 'I'),
+)
+
+def generation_units(ctx):
+    """
+    Yields (name, inputs, build) for every unit of a generation run in output order: the
+    components, then the shared steps. inputs are the (sheet, first column, last column)
+    ranges the unit reads, None columns select whole rows; build(ctx) creates its elements.
+    """
+    shared_inputs = [(ctx.sheets[sheet], first, last) for sheet, first, last in COMPONENT_SHARED_INPUTS]
+    for views in partition_components(ctx):
+        inputs = [(view, None, None) for view in views] + shared_inputs
+        yield 'component', inputs, functools.partial(build_component, views=views)
+    for create_step, ranges in SHARED_STEPS:
+        yield create_step.__name__, [(ctx.sheets[sheet], first, last) for sheet, first, last in ranges], create_step
+
+def report_dangling_references(ctx, dangling):
+    """
+    Logs every unresolved reference with the workbook cells it comes from.
+    """
+    if not dangling:
+        return
+    cells = reference_index.cell_index(ctx.sheets)
+    logging.warning(f"⚠️ {len(dangling)} unresolved references:")
+    for reference in dangling:
+        target, dest, source = reference
+        rows = reference_index.source_rows(reference, cells)
+        where = ", ".join(rows[:5]) if rows else "no source row found"
+        if len(rows) > 5:
+            where += f" and {len(rows) - 5} more"
+        message = f"{source}: {dest} {target} ({where})"
+        logging.warning(f"   Unresolved reference {message}")
+
+# Output of the interactive run
+OUTPUT_PATH = r"D:\\One_Drive\\OneDrive - Tata Technologies\\SAARCONN\\Eliminating_SystemDesk\tests\\Sushant_validation_21_02\\output_arxml\\default_24_02.arxml"
+
+def build_document(ctx, workbook, units=None, tree_shake=False, memory_spools=False, keep_packages=()):
+    """
+    Builds the ARXML of a workbook into ctx and streams its elements to a new writer.
+
+    Args:
+        ctx: The arelements_def.BuildContext, it is reset before the run.
+        workbook: Path or binary file object of the input Excel file.
+        units: Optional incremental.UnitCache replaying the unchanged units.
+        tree_shake: Leave out the platform elements the document does not reference.
+        memory_spools: Keep the streamed elements in memory instead of temporary files.
+        keep_packages: Paths of packages written even if they are empty, see SPLIT_PACKAGES.
+
+    Returns:
+        (arxml_writer.StreamingARXMLWriter to finish the document with, unresolved
+        references as (target, DEST, source path), empty if check_references is off)
+    """
+    ctx.reset()
+    load_sheets(ctx, workbook)
+
     # Execute the main sequence of functions for project setup
+    # After every step its elements are streamed to spool files, so memory stays bounded by the largest step
+    # Streamed elements are added to the reference index when they are released
+    references = reference_index.ReferenceIndex(ctx.paths) if check_references else None
+    stream_writer = arxml_writer.StreamingARXMLWriter(reference_index=references, memory_spools=memory_spools)
+
+    for name, inputs, build in generation_units(ctx):
+        if units is None:
+            build(ctx)
+            stream_writer.release(ctx.root, ctx.structure.constant_regions())
+        else:
+            units.run(ctx, stream_writer, name, inputs, build)
+
+    if tree_shake:
+        # Tree shaking of the platform packages
+        ctx.structure.remove_unreferenced_platform_elements(stream_writer.references)
+    ctx.structure.remove_empty_packages(keep_packages) # Leave out folders that did not receive any element
+
+    dangling = []
+    if references is not None:
+        # The packages and platform elements still in the tree complete the index
+        references.add(ctx.root)
+        dangling = references.unresolved()
+        report_dangling_references(ctx, dangling)
+    return stream_writer, dangling
+
+def generate(file_path, output_path, ctx=None):
+    """
+    Generates the ARXML of a validated workbook and writes it to output_path.
 
-    CreateSwcs()           # Create software components
-    createcompumethod()    # Create computation methods
-    createDC()             # Create data constraints
-    createprimitive()
-    createcomposite()
-    createcustomIDT()
-    createSharedInterfaces()
+    Args:
+        file_path: Path of the input Excel file.
+        output_path: Path of the ARXML file to write.
+        ctx: Optional arelements_def.BuildContext to reuse, it is reset before the run.
 
-    tree = ET.ElementTree(root)
+    Returns:
+        The unresolved references as (target, DEST, source path), empty if
+        check_references is off.
 
-    try:
-        root1 = tree.getroot()
+    Raises:
+        ValueError: If split_packages is combined with a gzip bundle, which holds one document.
+    """
+    if split_packages and output_compression == arxml_writer.GZIP:
+        raise ValueError("A gzip bundle holds one document, split packages need --compression zip")
+
+    # The build context holds the root, the package structure and the builders' cursors
+    if ctx is None:
+        ctx = arelements_def.BuildContext(ARXMLStructure())
+
+    # Units with unchanged workbook rows are replayed from the cache in incremental mode
+    units = incremental.UnitCache(incremental.cache_path(output_path)) if incremental_regeneration else None
+    stream_writer, dangling = build_document(ctx, file_path, units, tree_shake=tree_shaking and platform_library_path is None,
+                                             keep_packages=SPLIT_PACKAGES if split_packages else ())
+
+    constant_regions = ctx.structure.constant_regions()
+    excluded_packages = None
+    if platform_library_path is not None:
+        # The library is only written if it does not exist yet, the SWC output leaves the platform packages out
+        arxml_writer.write_platform_library(ctx.root, platform_library_path, constant_regions)
+        excluded_packages = constant_regions
+
+    # Namespaces and indentation are handled by the writer, the platform packages come from its cache
+    manifest = arxml_writer.OutputManifest(f"{output_path}.manifest.json") if output_manifest else None
+    if output_compression is not None:
+        if output_compression == arxml_writer.GZIP:
+            bundle_path = f"{output_path}.gz"
+        else:
+            bundle_path = f"{os.path.splitext(output_path)[0]}.zip"
+        if split_packages:
+            members = {os.path.basename(path): package for package, path in package_output_paths(ctx, output_path).items()}
+        else:
+            members = {os.path.basename(output_path): None}
+        if not stream_writer.finish_bundle(ctx.root, bundle_path, members, output_compression,
+                                           constant_regions, excluded_packages, manifest):
+            logging.info(f"Bundle unchanged, kept {bundle_path}")
+    elif split_packages:
+        paths = package_output_paths(ctx, output_path)
+        written = stream_writer.finish_packages(ctx.root, paths, constant_regions, excluded_packages, manifest)
+        logging.info(f"{len(written)} of {len(paths)} package files changed")
+    else:
+        # Hashed while it is streamed out, an unchanged output keeps its file and mtime
+        def write_output(file):
+            stream_writer.finish(ctx.root, file, constant_regions, excluded_packages)
+        if not arxml_writer.write_if_changed(output_path, write_output, manifest):
+            logging.info(f"Output unchanged, kept {output_path}")
+    if manifest is not None:
+        manifest.save()
+    if units is not None:
+        units.save()
+        logging.info(f"♻️ {units.rebuilt} of {units.count} units rebuilt")
+    return dangling
+
+def convert(workbook, ctx=None, validate=True, baseline=None, tree_shake=False):
+    """
+    Converts a workbook to ARXML in memory, without prompts and without writing files.
+
+    The output is always a single self-contained document, the split, bundle, platform
+    library and incremental modes only apply to generate().
 
-        # Remove namespaces
-        root2 = remove_namespaces(root1)
+    Args:
+        workbook: The content of the Excel file as bytes, or a binary file object.
+        ctx: Optional arelements_def.BuildContext to keep warm across calls, it is reset
+            before every run. Threads converting in parallel need a context each.
+        validate: Validate the workbook first, no ARXML is generated if it has Critical errors.
+        baseline: Optional validation baseline, see validator.validate_excel().
+        tree_shake: Leave out the platform elements the document does not reference.
 
-        # Add indentation
-        indent(root2)
+    Returns:
+        A dict with the ARXML bytes ("arxml", None if it was not generated), the validation
+        errors by severity ("errors", empty without validate) and the unresolved references
+        ("unresolved").
+    """
+    data = workbook if isinstance(workbook, (bytes, bytearray)) else workbook.read()
+    result = {"arxml": None, "errors": {"Critical": [], "Warning": [], "Info": []}, "unresolved": []}
+    if validate:
+        errors = validator.validate_excel(io.BytesIO(data), baseline)
+        result["errors"] = {severity: list(messages) for severity, messages in errors.items()}
+        if errors["Critical"]:
+            return result
+
+    if ctx is None:
+        ctx = arelements_def.BuildContext(ARXMLStructure())
+    stream_writer, result["unresolved"] = build_document(ctx, io.BytesIO(data), tree_shake=tree_shake, memory_spools=True)
+    output = io.BytesIO()
+    stream_writer.finish(ctx.root, output, ctx.structure.constant_regions())
+    result["arxml"] = output.getvalue()
+    return result
+
+def Main(output_path=OUTPUT_PATH):
+    # Get the file path from the user and validate the Excel file before proceeding
+    excel_reader.get_file_path_from_user()
+    validate_interactively(excel_reader)
 
-        # Write the XML declaration with double quotes
-        with open(r"D:\\One_Drive\\OneDrive - Tata Technologies\\SAARCONN\\Eliminating_SystemDesk\tests\\Sushant_validation_21_02\\output_arxml\\default_24_02.arxml", "wb") as f:
-            f.write(b'<?xml version="1.0" encoding="utf-8"?>\n')
-            tree.write(f, encoding="utf-8", xml_declaration=False)
+    try:
+        generate(excel_reader.file_path, output_path)
 
         print(f"Successfully created with proper indentation and XML declaration.")
 
     except FileNotFoundError as e:
         print(f"Error: {e}. Please enter a valid ARXML file path.")
 
+# Validation profiles of the command line: strict stops on Critical errors, report generates
+# anyway and off skips the validation
+VALIDATION_PROFILES = ('strict', 'report', 'off')
+
+def main(argv=None):
+    """
+    Command line entry point, see --help. Without a workbook argument the file path is
+    asked for interactively and the workbook is validated until it passes.
+
+    Returns:
+        The exit status: 0 on success, 1 if the workbook failed the strict validation.
+    """
+    parser = argparse.ArgumentParser(description="Generate the AUTOSAR ARXML of an input workbook.")
+    parser.add_argument("workbook", nargs="?", help="input Excel file, asked for interactively if missing")
+    parser.add_argument("-o", "--output", help="ARXML file to write (default: the workbook path with .arxml)")
+    parser.add_argument("--schema-version", choices=sorted(arelements_def.SCHEMA_VERSIONS),
+                        default=arelements_def.DEFAULT_SCHEMA_VERSION, help="AUTOSAR schema version of the output")
+    parser.add_argument("--validation", choices=VALIDATION_PROFILES, default='strict',
+                        help="strict: stop on Critical errors, report: generate anyway, off: skip the validation")
+    parser.add_argument("--baseline", help="baseline workbook or baseline file, only findings that are not in it are reported")
+    parser.add_argument("--save-baseline", metavar="BASELINE",
+                        help="validate the workbook and write its findings as baseline file for later --baseline runs")
+    parser.add_argument("--validate-only", action="store_true", help="only validate the workbook, exit with 1 on Critical errors")
+    parser.add_argument("--uuid-mode", choices=rng.UUID_MODES, help="random or path-derived deterministic UUIDs")
+    parser.add_argument("--split-packages", action="store_true", help="write every top-level package to its own file")
+    parser.add_argument("--compression", choices=arxml_writer.COMPRESSIONS, help="write a gzip or zip bundle, --split-packages needs zip")
+    parser.add_argument("--platform-library", help="write the /AUTOSAR platform packages to this shared ARXML")
+    parser.add_argument("--incremental", action="store_true", help="rebuild only the units whose workbook rows changed")
+    parser.add_argument("--tree-shake", action="store_true", help="write only the platform elements the output references")
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument("-v", "--verbose", action="store_true", help="log debug messages to the log file")
+    verbosity.add_argument("-q", "--quiet", action="store_true", help="show and log only warnings and errors")
+    args = parser.parse_args(argv)
+    if args.workbook is None and (args.save_baseline or args.validate_only):
+        parser.error("--save-baseline and --validate-only need a workbook")
+    if args.split_packages and args.compression == arxml_writer.GZIP:
+        parser.error("--split-packages writes several documents, use --compression zip, a gzip bundle holds one")
+
+    global platform_library_path, split_packages, output_compression, incremental_regeneration, tree_shaking
+    # Progress goes to the console at INFO, quiet leaves only the warnings and errors
+    config.setup_logging(logging.DEBUG if args.verbose else logging.WARNING if args.quiet else logging.INFO,
+                         console_level=logging.WARNING if args.quiet else logging.INFO)
+    warnings.filterwarnings("ignore", category=UserWarning, module="openpyxl") # Suppress specific warnings from the openpyxl module
+    arelements_def.use_schema_version(args.schema_version)
+    if args.uuid_mode:
+        rng.use_uuid_mode(args.uuid_mode)
+    platform_library_path = args.platform_library
+    split_packages = args.split_packages
+    output_compression = args.compression
+    incremental_regeneration = args.incremental
+    tree_shaking = args.tree_shake
+
+    if args.workbook is None:
+        Main(args.output or OUTPUT_PATH)
+        print("Ready")  # Indicate that the process is complete
+        return 0
+
+    if args.save_baseline:
+        validator.save_baseline(args.workbook, args.save_baseline)
+        print(f"Baseline written to {args.save_baseline}")
+        return 0
+
+    if args.validate_only:
+        errors = validator.validate_excel(args.workbook, args.baseline)
+        validator.print_colored_errors(errors)
+        return 1 if errors["Critical"] else 0
+
+    output_path = args.output or os.path.splitext(args.workbook)[0] + ".arxml"
+    if args.validation != 'off':
+        errors = validator.validate_excel(args.workbook, args.baseline)
+        # Quiet still shows the Critical errors
+        validator.print_colored_errors({"Critical": errors["Critical"]} if args.quiet else errors)
+        if errors["Critical"] and args.validation == 'strict':
+            print(f"❌ {len(errors['Critical'])} Critical validation errors, no ARXML generated")
+            return 1
+
+    dangling = generate(args.workbook, output_path)
+    if not args.quiet:
+        print(f"✅ {output_path} generated, {len(dangling)} unresolved references")
+    logging.info(f"Generated {output_path} from {args.workbook}")
+    return 0
+
 # Entry point of the script
 if __name__ == "__main__":
-    Main()  # Run the main function
-    print("Ready")  # Indicate that the process is complete
\ No newline at end of file
+    raise SystemExit(main())
@@ -0,0 +1,81 @@
+"""
+Index of the AUTOSAR paths of all generated elements and check of the references against it.
+
+The builders write reference texts such as /SharedElements/PortInterfaces/SenderReceiver/IF/DE
+without knowing whether the target is generated. ReferenceIndex collects every element path
+and every *-REF/*-TREF in one walk per subtree, streamed elements are added when they are
+released, and unresolved() checks all references with one set lookup each. Given the
+PathBuilder of the build context, the element paths are taken from it, so they are the
+same interned strings the builders wrote into the references.
+"""
+import arxml_templates
+import autosar_paths
+from Pkg_struct import local_tag, reference_bases
+
+class ReferenceIndex:
+    def __init__(self, path_builder=None):
+        self.path_builder = path_builder or autosar_paths.PathBuilder()
+        self.paths = set()
+        # (target path, DEST, path of the element holding the reference)
+        self.references = []
+
+    def add(self, elem, parent_path='', bases=None):
+        """
+        Adds elem and everything below it, parent_path is the AUTOSAR path elem is in.
+        """
+        child_path = self.path_builder.child
+        pending = [(elem, parent_path, bases or {})]
+        while pending:
+            elem, path, bases = pending.pop()
+            tag = local_tag(elem)
+            if tag == arxml_templates.FRAGMENT_TAG:
+                for row in arxml_templates.iter_rows(elem):
+                    row_path = child_path(path, arxml_templates.short_name(row))
+                    self.paths.add(row_path)
+                    for target, dest in arxml_templates.references(row):
+                        self.references.append((target, dest, row_path))
+                continue
+            if tag.endswith(('-REF', '-TREF')):
+                if elem.text and elem.text.strip():
+                    target = elem.text.strip()
+                    base = elem.get('BASE')
+                    if base in bases and not target.startswith('/'):
+                        target = f"{bases[base]}/{target}"
+                    self.references.append((target, elem.get('DEST'), path))
+                continue
+            name = elem.findtext('SHORT-NAME')
+            if name:
+                path = child_path(path, name)
+                self.paths.add(path)
+            if tag == 'AR-PACKAGE':
+                bases = reference_bases(elem, bases)
+            for child in elem:
+                pending.append((child, path, bases))
+
+    def unresolved(self):
+        """
+        Returns the (target, DEST, source path) of every reference without a generated target.
+        """
+        return [reference for reference in self.references if reference[0] not in self.paths]
+
+def cell_index(sheets):
+    """
+    Returns {cell text: ['sheet!A1', ...]} for the text cells of the workbook sheets.
+    """
+    index = {}
+    for sheet in sheets.values():
+        for row in sheet.iter_rows(min_row=2):
+            for cell in row:
+                if isinstance(cell.value, str) and cell.value.strip():
+                    index.setdefault(cell.value.strip(), []).append(f"{sheet.title}!{cell.coordinate}")
+    return index
+
+def source_rows(reference, cells):
+    """
+    Returns the workbook cells naming the missing target, or else the referencing element.
+    """
+    target, dest, source = reference
+    for name in (target.rsplit('/', 1)[-1], source.rsplit('/', 1)[-1]):
+        if name in cells:
+            return cells[name]
+    return []
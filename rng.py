@@ -1,13 +1,92 @@
+"""
+UUID provider for the generated ARXML elements.
+
+In the default 'random' mode UUIDs are version 4 UUIDs taken from a batch that is
+filled with a single os.urandom() call. In the 'deterministic' mode generate_uuid()
+returns the PATH_UUID placeholder and arxml_writer replaces it with a version 5 UUID
+of the element's AUTOSAR path, so identical input gives byte-identical output.
+
+The mode is picked with use_uuid_mode() or the SAARCONN_UUID_MODE environment
+variable. generate_uuid is rebound by use_uuid_mode(), callers should access it
+through the module (rng.generate_uuid()).
+"""
+import os
 import uuid
 
-def generate_uuid():
-    # Generate a random UUID
-    random_uuid = uuid.uuid4()
-    # Convert the UUID to a string in the specified format
-    uuid_str = str(random_uuid)
-    return uuid_str
+RANDOM = 'random'
+DETERMINISTIC = 'deterministic'
+UUID_MODES = (RANDOM, DETERMINISTIC)
+
+# Namespace of the path-derived UUIDs
+NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, 'saarconn:arxml')
+
+# UUID value the writer replaces with the UUID of the element's AUTOSAR path
+PATH_UUID = ''
+
+BATCH_SIZE = 1024
+
+def random_uuids(count):
+    """
+    Returns count version 4 UUID strings made from one os.urandom() call.
+    """
+    data = bytearray(os.urandom(16 * count))
+    uuids = []
+    for offset in range(0, len(data), 16):
+        data[offset + 6] = (data[offset + 6] & 0x0F) | 0x40  # version 4
+        data[offset + 8] = (data[offset + 8] & 0x3F) | 0x80  # RFC 4122 variant
+        h = data[offset:offset + 16].hex()
+        uuids.append(f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}")
+    return uuids
+
+def uuid_for_path(path):
+    """
+    Returns the version 5 UUID string of an AUTOSAR path such as /AUTOSAR/Platform.
+    """
+    return str(uuid.uuid5(NAMESPACE, path))
+
+class UUIDProvider:
+    """
+    Hands out the UUIDs of one generation run.
+
+    Args:
+        mode: 'random' or 'deterministic'.
+        batch_size: Number of random UUIDs generated at once.
+
+    Raises:
+        ValueError: If the mode is unknown.
+    """
+    def __init__(self, mode=RANDOM, batch_size=BATCH_SIZE):
+        if mode not in UUID_MODES:
+            raise ValueError(f"Unknown UUID mode '{mode}', expected one of {UUID_MODES}")
+        self.mode = mode
+        self.batch_size = batch_size
+        self.batch = []
+
+    @property
+    def deterministic(self):
+        return self.mode == DETERMINISTIC
+
+    def generate_uuid(self):
+        if self.mode == DETERMINISTIC:
+            return PATH_UUID
+        if not self.batch:
+            self.batch = random_uuids(self.batch_size)
+        return self.batch.pop()
+
+provider = None
+generate_uuid = None
+
+def use_uuid_mode(mode=RANDOM, batch_size=BATCH_SIZE):
+    """
+    Selects the UUID mode used for all elements created afterwards.
+    """
+    global provider, generate_uuid
+    provider = UUIDProvider(mode, batch_size)
+    generate_uuid = provider.generate_uuid
+
+use_uuid_mode(os.environ.get('SAARCONN_UUID_MODE', RANDOM))
 
 # Example usage
 if __name__ == "__main__":
     unique_id = generate_uuid()
-    print(unique_id)
\ No newline at end of file
+    print(unique_id)
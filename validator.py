@@ -4,6 +4,10 @@ import re
 
 import os
 
+import json
+
+import hashlib
+
 from datetime import datetime
 
 import openpyxl.utils
@@ -22,23 +26,59 @@ GREEN = "\033[92m"  # Success (Green)
 
 RESET = "\033[0m"  # Reset color to default
 
-# Dictionary to store validation errors
-
-errors = {
+# Naming convention of excel_rule_2, compiled once per process
+SHORT_NAME_PATTERN = re.compile(r"^[A-Za-z][A-Za-z0-9_]*$")
 
-   "Critical": [],
+def validate_excel(file_path, baseline=None):
+    """ Validates the Excel file based on provided rules.
 
-   "Warning": [],
+    If a baseline is given (the workbook of the last accepted release, a baseline file
+    written by save_baseline for it, or a set of fingerprints) only findings whose
+    (rule, sheet, key) is not already in the baseline are reported. This is a full pass
+    over the workbook plus a filter, the rules still run on the unchanged rows since
+    their findings can depend on rows that changed elsewhere. A baseline workbook is
+    validated as well on every run, a baseline file avoids that second pass.
 
-   "Info": []
+    Every call returns a new {"Critical": [...], "Warning": [...], "Info": [...]} dict,
+    so validations can run in parallel threads.
+    """
+    errors = {"Critical": [], "Warning": [], "Info": []}
+    findings = collect_findings(file_path)
+    if baseline is not None:
+        known = load_baseline(baseline)
+        findings = [finding for finding in findings if finding[:3] not in known]
+    for rule, sheet_name, key, severity, message in findings:
+        errors[severity].append(message)
+    return errors
 
-}
+def collect_findings(file_path):
+    """ Runs all rules and returns the findings as (rule, sheet, key, severity, message) tuples.
 
-def validate_excel(file_path):
-    """ Validates the Excel file based on provided rules. """
+    The key is the column letter plus a fingerprint of the row contents and the
+    occurrence of that content in the sheet (0 for the first row with it, 1 for the
+    next copy, ...). It stays the same when other rows are inserted or removed above
+    it, and a copied row gets a key of its own.
+    """
+    findings = []
+    row_fingerprints = {}
     try:
         wb = openpyxl.load_workbook(file_path)
 
+        # Row fingerprints are computed once per sheet, and only for sheets with findings
+        def fingerprint_row(sheet_name, row_idx):
+            if sheet_name not in row_fingerprints:
+                fingerprints = row_fingerprints[sheet_name] = {}
+                occurrences = {}
+                for idx, row in enumerate(wb[sheet_name].iter_rows(min_row=2, values_only=True), start=2):
+                    row_hash = hashlib.blake2b(repr(row).encode("utf-8"), digest_size=8).hexdigest()
+                    occurrence = occurrences[row_hash] = occurrences.get(row_hash, -1) + 1
+                    fingerprints[idx] = f"{row_hash}:{occurrence}"
+            return row_fingerprints[sheet_name].get(row_idx, "")
+
+        def report(severity, rule, sheet_name, row_idx, column, message):
+            key = f"{column}:{fingerprint_row(sheet_name, row_idx)}"
+            findings.append((rule, sheet_name, key, severity, message))
+
         ### 🔵 Empty Cell Validation (`excel_rule_1`) ###
 
         """"
@@ -135,14 +175,14 @@ def validate_excel(file_path):
                         cell_ref = f"{column_letter}{row_idx}"
                         # Skip merged cells (except first cell)
                         if any(cell_ref in merged_cells for merged_cells in merged_ranges.values()):
-                            errors["Info"].append(f"[{sheet_name}] Merged cell {cell_ref} is expected to be empty")
+                            report("Info", "excel_rule_1", sheet_name, row_idx, column_letter, f"[{sheet_name}] Merged cell {cell_ref} is expected to be empty")
                             continue  
                         # Skip exception columns
                         if column_letter in exception_columns:
                             continue  
                         # Check for missing value
                         if cell.value in [None, ""]:
-                            errors["Critical"].append(f"[{sheet_name}] Missing value at {cell_ref}")
+                            report("Critical", "excel_rule_1", sheet_name, row_idx, column_letter, f"[{sheet_name}] Missing value at {cell_ref}")
         # 🔹 2️⃣ Get ports mapping
         def get_ports_mapping():
             if not ports:
@@ -182,7 +222,7 @@ def validate_excel(file_path):
                     m_value = row[12]  # Column M
                     cell_ref = f"M{row_idx}"
                     if event_type in m_validation_rules and not m_validation_rules[event_type](m_value):
-                        errors["Critical"].append(f"[swc_info] Invalid value at {cell_ref} for event type '{event_type}'")
+                        report("Critical", "excel_rule_1", "swc_info", row_idx, "M", f"[swc_info] Invalid value at {cell_ref} for event type '{event_type}'")
             # 🔹 4️⃣ Validate column M in ib_data
         if ib_data:
             for row_idx, row in enumerate(ib_data.iter_rows(min_row=2, values_only=True), start=2):
@@ -191,7 +231,7 @@ def validate_excel(file_path):
                     col_m_value = row[12]  # Column M
                     cell_ref = f"M{row_idx}"
                     if col_b_value in ["PerInstanceMemory", "ArTypedPerInstanceMemory"] and col_m_value is not None:
-                        errors["Critical"].append(f"[ib_data] Column M must be empty at {cell_ref} when Column B is '{col_b_value}'")
+                        report("Critical", "excel_rule_1", "ib_data", row_idx, "M", f"[ib_data] Column M must be empty at {cell_ref} when Column B is '{col_b_value}'")
 
         # 🔹 5️⃣ Validate column E, F & G in adt_primitive
         if adt_primitive:
@@ -203,13 +243,13 @@ def validate_excel(file_path):
                     cell = row[col_idx]
                     # Skip merged cells (except first cell)
                     if any(cell_ref in merged_cells for merged_cells in merged_ranges.values()):
-                        errors["Info"].append(f"[adt_primitive] Merged cell {cell_ref} is expected to be empty")
+                        report("Info", "excel_rule_1", "adt_primitive", row_idx, column_letter, f"[adt_primitive] Merged cell {cell_ref} is expected to be empty")
                         continue  
                     # Validate based on rules
                     if column_letter == "E" and cell.value in [None, ""]:
-                        errors["Critical"].append(f"[adt_primitive] Column E must not be empty at {cell_ref}")
+                        report("Critical", "excel_rule_1", "adt_primitive", row_idx, column_letter, f"[adt_primitive] Column E must not be empty at {cell_ref}")
                     elif column_letter in ["F", "G"] and row[4].value == "IDENTICAL" and cell.value not in [None, ""]:
-                        errors["Critical"].append(f"[adt_primitive] Column {column_letter} must be empty at {cell_ref} when Column E is 'IDENTICAL'")
+                        report("Critical", "excel_rule_1", "adt_primitive", row_idx, column_letter, f"[adt_primitive] Column {column_letter} must be empty at {cell_ref} when Column E is 'IDENTICAL'")
                                 
         # 🔹 6️⃣Validate column B & D in idt
         if idt:
@@ -221,13 +261,13 @@ def validate_excel(file_path):
                     cell = row[col_idx]
                     # Skip merged cells (except first cell)
                     if any(cell_ref in merged_cells for merged_cells in merged_ranges.values()):
-                        errors["Info"].append(f"[idt] Merged cell {cell_ref} is expected to be empty")
+                        report("Info", "excel_rule_1", "idt", row_idx, column_letter, f"[idt] Merged cell {cell_ref} is expected to be empty")
                         continue  
                     # Validate based on rules
                     if column_letter == "B" and cell.value in [None, ""]:
-                        errors["Critical"].append(f"[idt] Column B must not be empty at {cell_ref}")
+                        report("Critical", "excel_rule_1", "idt", row_idx, column_letter, f"[idt] Column B must not be empty at {cell_ref}")
                     elif column_letter == "D" and row[1].value == "PRIMITIVE" and cell.value not in [None, ""]:
-                        errors["Critical"].append(f"[idt] Column D must be empty at {cell_ref} when Column B is 'PRIMITIVE'")
+                        report("Critical", "excel_rule_1", "idt", row_idx, column_letter, f"[idt] Column D must be empty at {cell_ref} when Column B is 'PRIMITIVE'")
 
         ### 🟢 Naming Convention Rule ('excel_rule_2') ###
 
@@ -266,11 +306,11 @@ def validate_excel(file_path):
                     if col == "D" and sheet_name in ["adt_composite", "idt"]:
                         if str(name).isdigit():  
                             # Log as info if it's purely numeric
-                            errors["Info"].append(f"[{sheet_name}] Numeric value in naming column at {cell_ref}: {name}")
+                            report("Info", "excel_rule_2", sheet_name, row_idx, col, f"[{sheet_name}] Numeric value in naming column at {cell_ref}: {name}")
                             continue  # Skip further validation
                     # Apply normal naming convention check
-                    if not re.match(r"^[A-Za-z][A-Za-z0-9_]*$", str(name)):
-                        errors["Critical"].append(f"[{sheet_name}] Invalid name format at {cell_ref}: {name}")
+                    if not SHORT_NAME_PATTERN.match(str(name)):
+                        report("Critical", "excel_rule_2", sheet_name, row_idx, col, f"[{sheet_name}] Invalid name format at {cell_ref}: {name}")
 
         ### 🟡 Duplicate & Definition Consistency Rules ('excel_rule_3') ###
         duplicate_sheets = {
@@ -295,20 +335,20 @@ def validate_excel(file_path):
                         continue  # Do not check empty values for duplication
                     # Handle merged cells (if part of a merged range, log as info and skip)
                     if any(cell_ref in merged_cells for merged_cells in merged_ranges.values()):
-                        errors["Info"].append(f"[{sheet_name}] Merged cell {cell_ref} is expected to have the same value")
+                        report("Info", "excel_rule_3", sheet_name, row_idx, col, f"[{sheet_name}] Merged cell {cell_ref} is expected to have the same value")
                         continue  # Skip checking duplicates for merged empty cells
                     # Special Handling for Column D in `adt_composite` & `idt`
                     if col == "D" and sheet_name in ["adt_composite", "idt"]:
                         if isinstance(value, (int, float)):  # If numerical, duplication is OK (log as Info)
                             if value in seen:
-                                errors["Info"].append(f"[{sheet_name}] Duplicate numerical value at {cell_ref}: {value}")
+                                report("Info", "excel_rule_3", sheet_name, row_idx, col, f"[{sheet_name}] Duplicate numerical value at {cell_ref}: {value}")
                         else:  # If alphanumeric, duplication is NOT OK (log as Critical Error)
                             if value in seen:
-                                errors["Critical"].append(f"[{sheet_name}] Duplicate non-numeric value at {cell_ref}: {value}")
+                                report("Critical", "excel_rule_3", sheet_name, row_idx, col, f"[{sheet_name}] Duplicate non-numeric value at {cell_ref}: {value}")
                     else:
                         # General duplicate check for all other columns (log as Critical Error)
                         if value in seen:
-                            errors["Critical"].append(f"[{sheet_name}] Duplicate value at {cell_ref}: {value}")
+                            report("Critical", "excel_rule_3", sheet_name, row_idx, col, f"[{sheet_name}] Duplicate value at {cell_ref}: {value}")
                     seen.add(value)  # Add value to seen set
 
 
@@ -330,10 +370,10 @@ def validate_excel(file_path):
                 value = row[0]
                 cell_ref = f"{col}{row_idx}"
                 if value not in ref_values:
-                    errors["Critical"].append(f"[{sheet_name}] Invalid reference at {cell_ref}: {value} (not in {ref_sheet}.{ref_col})")
+                    report("Critical", "excel_rule_4", sheet_name, row_idx, col, f"[{sheet_name}] Invalid reference at {cell_ref}: {value} (not in {ref_sheet}.{ref_col})")
     except Exception as e:
-        errors["Critical"].append(f"Error reading Excel file: {str(e)}")
-    return errors
+        findings.append(("read_error", "", str(e), "Critical", f"Error reading Excel file: {str(e)}"))
+    return findings
 
     """
         Pre-defined rules for enum_list
@@ -344,6 +384,29 @@ def validate_excel(file_path):
     }
 
 
+def load_baseline(baseline):
+    """ Returns the set of (rule, sheet, key) fingerprints of a baseline.
+
+    The baseline may be a workbook, which is validated to get its findings, a JSON file
+    written by save_baseline or an iterable of fingerprints.
+    """
+    if isinstance(baseline, (str, os.PathLike)):
+        if not os.path.isfile(baseline):
+            raise FileNotFoundError(f"Baseline {baseline} does not exist")
+        if not str(baseline).lower().endswith(".json"):
+            return {finding[:3] for finding in collect_findings(baseline)}
+        with open(baseline, "r", encoding="utf-8") as baseline_file:
+            return {tuple(entry) for entry in json.load(baseline_file)}
+    return {tuple(entry) for entry in baseline}
+
+def save_baseline(file_path, baseline_path="validation_baseline.json"):
+    """ Validates the workbook and stores its finding fingerprints for later runs. """
+    fingerprints = sorted({finding[:3] for finding in collect_findings(file_path)})
+    with open(baseline_path, "w", encoding="utf-8") as baseline_file:
+        json.dump([list(entry) for entry in fingerprints], baseline_file, indent=1)
+    return baseline_path
+
+
 def print_colored_errors(errors):
 
    """ Prints errors in color-coded format. """
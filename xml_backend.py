@@ -0,0 +1,89 @@
+"""
+ElementTree-compatible element factory with a selectable backend.
+
+The stdlib xml.etree.ElementTree backend is the default. The lxml backend builds the
+tree in C, the nodes backend builds it from the compact arxml_node.Node objects to
+keep large projects small in memory. A backend is picked with use_backend() or the
+SAARCONN_XML_BACKEND environment variable. Serialization is done by arxml_writer for
+all backends, so the output is byte-identical whichever backend built the tree.
+
+Element, SubElement and parse are rebound by use_backend(), callers should access
+them through the module (xml_backend.SubElement) rather than importing the names.
+"""
+import json
+import os
+import xml.etree.ElementTree as etree
+
+BACKENDS = ('etree', 'lxml', 'nodes')
+
+backend_name = None
+Element = None
+SubElement = None
+
+# Attributes lxml cannot store under their names (namespace declarations and prefixed
+# names such as xsi:schemaLocation) are kept as JSON in this attribute of the element
+# itself, so they are released with the tree
+DECLARED_ATTRIBUTES = 'saarconn-declared-attributes'
+
+def _lxml_element(lxml_etree):
+    def element(tag, attrib=None, **extra):
+        attrib = dict(attrib or {}, **extra)
+        declared = {key: value for key, value in attrib.items() if ':' in key or key == 'xmlns'}
+        elem = lxml_etree.Element(tag, {key: value for key, value in attrib.items() if key not in declared})
+        if declared:
+            elem.set(DECLARED_ATTRIBUTES, json.dumps(list(attrib.items())))
+        return elem
+    return element
+
+def use_backend(name='etree'):
+    """
+    Selects the backend used for all elements created afterwards.
+
+    Args:
+        name: 'etree' for the stdlib ElementTree, 'lxml' or 'nodes'.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+        ImportError: If lxml is requested but not installed.
+    """
+    global backend_name, Element, SubElement
+    if name == 'etree':
+        Element = etree.Element
+        SubElement = etree.SubElement
+    elif name == 'lxml':
+        try:
+            from lxml import etree as lxml_etree
+        except ImportError as e:
+            raise ImportError("The lxml XML backend needs the lxml package: pip install lxml") from e
+        Element = _lxml_element(lxml_etree)
+        SubElement = lxml_etree.SubElement
+    elif name == 'nodes':
+        import arxml_node
+        Element = arxml_node.Node
+        SubElement = arxml_node.SubElement
+    else:
+        raise ValueError(f"Unknown XML backend '{name}', expected one of {BACKENDS}")
+    backend_name = name
+
+def parse(path):
+    """
+    Parses an XML file with the active backend and returns its root element.
+    """
+    if backend_name == 'lxml':
+        from lxml import etree as lxml_etree
+        return lxml_etree.parse(path).getroot()
+    if backend_name == 'nodes':
+        import arxml_node
+        return arxml_node.from_element(etree.parse(path).getroot())
+    return etree.parse(path).getroot()
+
+def attributes(elem):
+    """
+    Returns the (name, value) attribute pairs of elem in their original order.
+    """
+    declared = elem.get(DECLARED_ATTRIBUTES)
+    if declared is not None:
+        return [tuple(item) for item in json.loads(declared)]
+    return elem.items()
+
+use_backend(os.environ.get('SAARCONN_XML_BACKEND', 'etree'))